@@ -0,0 +1,78 @@
+'''
+Time building and serializing CDP commands the way the asyncio client sends them.
+
+``generator`` is the request dict of the command's generator protocol dumped with
+``json.dumps``, ``serialize`` is ``Command.serialize`` and ``template`` calls a template
+of the command made ahead of time and serializes the result. Results are in microseconds
+per command.
+
+Usage::
+
+    python benchmarks/commands.py [--number N]
+'''
+import sys
+import json
+import timeit
+import argparse
+import typing as t
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from pycdp import cdp
+
+# name -> (function building the command from the hole values, template keys, values)
+COMMANDS: t.Dict[str, t.Tuple[t.Callable[..., t.Any], t.Tuple[str, ...], t.Tuple[t.Any, ...]]] = {
+    'Input.dispatchMouseEvent': (
+        lambda x, y: cdp.input_.dispatch_mouse_event('mouseMoved', x, y, modifiers=0, buttons=0),
+        ('x', 'y'), (10.5, 20.25)
+    ),
+    'Input.dispatchKeyEvent': (
+        lambda text: cdp.input_.dispatch_key_event('char', text=text, unmodified_text=text),
+        ('text', 'unmodifiedText'), ('a',)
+    ),
+    'Runtime.evaluate': (
+        lambda expression: cdp.runtime.evaluate(expression, return_by_value=True, await_promise=True),
+        ('expression',), ('document.title',)
+    ),
+    'DOM.getBoxModel': (
+        lambda node_id: cdp.dom.get_box_model(node_id=cdp.dom.NodeId(node_id)),
+        ('nodeId',), (1,)
+    ),
+}
+
+
+def best_of(func: t.Callable[[], t.Any], number: int, repeat: int=5) -> float:
+    ''' Return the best time of ``repeat`` runs in microseconds per call. '''
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def generator(make: t.Callable[..., t.Any], values: t.Tuple[t.Any, ...]) -> str:
+    request = next(make(*values))
+    request['id'] = 1
+    request['sessionId'] = 'session'
+    return json.dumps(request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=10000,
+        help='calls per command (default: %(default)s)')
+    args = parser.parse_args()
+
+    print(f"{'command':<28}{'generator µs':>14}{'serialize µs':>14}{'template µs':>14}")
+    for name, (make, keys, values) in COMMANDS.items():
+        # the key event sends its text twice, the template takes both
+        template_values = values * (len(keys) // len(values))
+        template = make(*values).template(*keys)
+        assert json.loads(template(*template_values).serialize(1, 'session')) == json.loads(generator(make, values))
+        times = (
+            best_of(lambda: generator(make, values), args.number),
+            best_of(lambda: make(*values).serialize(1, 'session'), args.number),
+            best_of(lambda: template(*template_values).serialize(1, 'session'), args.number),
+        )
+        print(f'{name:<28}' + ''.join(f'{time:>14.2f}' for time in times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+'''
+Compare waiting for events of specific requests with :meth:`CDPBase.expect` and with
+listeners that filter the events themselves.
+
+``N`` waiters each wait for the ``Network.loadingFinished`` event of their own request,
+then the events of all requests arrive in random order. Events are handed to the
+session directly, without a websocket. Results are the time to deliver all events and
+wake all waiters.
+
+Usage::
+
+    python benchmarks/expect.py [--waiters N ...]
+'''
+import sys
+import time
+import random
+import asyncio
+import argparse
+import typing as t
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pycdp import cdp
+from pycdp.asyncio import CDPSession
+
+
+def events(count: int) -> t.List[dict]:
+    messages = [
+        {'method': 'Network.loadingFinished', 'params': {
+            'requestId': str(i), 'timestamp': 1.0, 'encodedDataLength': 100
+        }}
+        for i in range(count)
+    ]
+    random.Random(0).shuffle(messages)
+    return messages
+
+
+async def filtered(count: int) -> float:
+    session = CDPSession(None, 'session', 'target')
+
+    async def wait(request_id: str):
+        async for event in session.listen(cdp.network.LoadingFinished, buffer_size=count):
+            if event.request_id == request_id:
+                return event
+
+    waiters = [asyncio.ensure_future(wait(str(i))) for i in range(count)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for message in events(count):
+        session._handle_event(message)
+    await asyncio.gather(*waiters)
+    return time.perf_counter() - start
+
+
+async def expected(count: int) -> float:
+    session = CDPSession(None, 'session', 'target')
+    waiters = [session.expect(cdp.network.LoadingFinished, str(i)) for i in range(count)]
+    start = time.perf_counter()
+    for message in events(count):
+        session._handle_event(message)
+    await asyncio.gather(*waiters)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--waiters', type=int, nargs='+', default=[10, 100, 500, 1000])
+    args = parser.parse_args()
+
+    print(f"{'waiters':>8}{'listen ms':>12}{'expect ms':>12}")
+    for count in args.waiters:
+        print(f'{count:>8}{asyncio.run(filtered(count)) * 1000:>12.1f}{asyncio.run(expected(count)) * 1000:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+'''
+Measure what interning saves when parsed events are kept in memory.
+
+A stream of network and page events is synthesized with a limited number of distinct
+ids, URLs and header names, like the events of a crawl. Each message is decoded from
+its JSON text and parsed, as the clients do, with and without a
+:class:`pycdp.cdp.util.Interner`. The events are kept, and the memory they hold and the
+time to parse each one are reported.
+
+Usage::
+
+    python benchmarks/interning.py [--count N] [--distinct N] [--repeat N]
+'''
+import gc
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pycdp.cdp import util
+from pycdp.gen.synth import Synthesizer
+
+EVENTS = [
+    'Network.requestWillBeSent',
+    'Network.responseReceived',
+    'Network.loadingFinished',
+    'Page.frameNavigated',
+    'Page.lifecycleEvent',
+]
+
+
+def messages(count: int, distinct: int) -> t.List[str]:
+    synth = Synthesizer.from_files(distinct=distinct, string_size=32)
+    return [
+        json.dumps({'method': method, 'params': synth.event_payload(method)})
+        for _ in range(count // len(EVENTS))
+        for method in EVENTS
+    ]
+
+
+def parse(messages: t.List[str], interner: t.Optional[util.Interner]) -> t.List[t.Any]:
+    if interner is None:
+        return [util.parse_json_event(json.loads(message)) for message in messages]
+    return [interner.intern(util.parse_json_event(json.loads(message))) for message in messages]
+
+
+def measure(
+    messages: t.List[str],
+    interner_factory: t.Callable[[], t.Optional[util.Interner]],
+    repeat: int
+) -> t.Tuple[float, int]:
+    ''' Return the best time per message of ``repeat`` runs in microseconds and the memory
+    held by the events. '''
+    elapsed = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        parse(messages, interner_factory())
+        elapsed = min(elapsed, time.perf_counter() - start)
+    # tracing slows allocations down, the memory is measured in a separate run
+    gc.collect()
+    tracemalloc.start()
+    events = parse(messages, interner_factory())
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return elapsed / len(messages) * 1e6, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--count', type=int, default=20000, help='events to parse (default: %(default)s)')
+    parser.add_argument('--distinct', type=int, default=50,
+        help='distinct values of each id, URL and other string (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs (default: %(default)s)')
+    args = parser.parse_args()
+
+    stream = messages(args.count, args.distinct)
+    # import the domain modules and warm up before measuring
+    parse(stream[:len(EVENTS)], util.Interner())
+    print(f"{'':<12}{'µs/event':>10}{'memory KB':>12}")
+    for name, interner_factory in (('plain', lambda: None), ('interned', util.Interner)):
+        per_event, memory = measure(stream, interner_factory, args.repeat)
+        print(f'{name:<12}{per_event:>10.1f}{memory / 1024:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+'''
+Compare the memory used by instances of the generated CDP classes with and without
+``__slots__``.
+
+Each class is measured against an equivalent plain dataclass built from the same
+fields. Every field is set to ``None``, so the numbers only account for the instance
+itself and not for the values it refers to.
+
+Usage::
+
+    python benchmarks/memory.py [--count N] [--top N]
+'''
+import gc
+import sys
+import argparse
+import importlib
+import tracemalloc
+import dataclasses
+import typing as t
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pycdp import cdp
+
+
+NAMED_TYPES = [
+    ('network', 'Request'),
+    ('network', 'Response'),
+    ('dom', 'Node'),
+    ('runtime', 'RemoteObject'),
+]
+
+
+def iter_domain_classes() -> t.Iterator[type]:
+    for path in sorted(Path(cdp.__file__).parent.glob('*.py')):
+        if path.stem in ('__init__', 'util'):
+            continue
+        module = importlib.import_module(f'pycdp.cdp.{path.stem}')
+        for value in vars(module).values():
+            if isinstance(value, type) and value.__module__ == module.__name__ and dataclasses.is_dataclass(value):
+                yield value
+
+
+def plain_dataclass(cls: type) -> type:
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(cls)]
+    )
+
+
+def bytes_per_instance(cls: type, count: int) -> float:
+    args = [None] * len(dataclasses.fields(cls))
+    instances: t.List[t.Any] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        instances[i] = cls(*args)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10000, help='instances created per class')
+    parser.add_argument('--top', type=int, default=10, help='how many of the largest classes to measure')
+    args = parser.parse_args()
+
+    classes = sorted(iter_domain_classes(), key=lambda cls: len(dataclasses.fields(cls)), reverse=True)
+    selected = classes[:args.top]
+    for module, name in NAMED_TYPES:
+        cls = getattr(importlib.import_module(f'pycdp.cdp.{module}'), name)
+        if cls not in selected:
+            selected.append(cls)
+
+    print(f'{"class":<40} {"fields":>6} {"plain":>10} {"slots":>10} {"saved":>7}')
+    for cls in selected:
+        plain = bytes_per_instance(plain_dataclass(cls), args.count)
+        slotted = bytes_per_instance(cls, args.count)
+        name = f'{cls.__module__.rsplit(".", 1)[-1]}.{cls.__name__}'
+        print(
+            f'{name:<40} {len(dataclasses.fields(cls)):>6} {plain:>9.0f}B {slotted:>9.0f}B '
+            f'{(plain - slotted) / plain:>7.0%}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+'''
+Time the ``from_json`` and ``to_json`` methods of every generated CDP type and event.
+
+Payloads are synthesized from the protocol schema by ``pycdp.gen.synth``, by default
+with every optional field present so that all of the decoding paths are exercised.
+``--array-size`` and ``--string-size`` scale them up. Results are reported per domain
+in microseconds per call, summed over the domain's classes, or per class with
+``--by-type``.
+
+To compare two versions of the generated code, save the results of one and compare
+the other against them. ``--package`` imports the generated package from another
+directory, e.g. one generated by an older version of ``cdpgen``. Classes that got
+slower than ``--threshold`` percent are listed and the exit status is 1. Compared times
+are rescaled by a reference workload timed alongside each class, so that a machine
+running slower or faster than when the baseline was saved does not show up as a change::
+
+    python benchmarks/parsing.py --package /tmp/old/cdp --save old.json
+    python benchmarks/parsing.py --compare old.json
+
+Usage::
+
+    python benchmarks/parsing.py [--number N] [--package DIR] [--save FILE] [--compare FILE]
+        [--threshold PERCENT] [--by-type] [--array-size N] [--string-size N]
+'''
+import sys
+import json
+import timeit
+import argparse
+import importlib
+import typing as t
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pycdp.gen.generate import snake_case
+from pycdp.gen.synth import Synthesizer
+
+METHODS = ('from_json', 'to_json')
+Results = t.Dict[str, t.Dict[str, float]]
+
+
+def iter_classes(package: str, synth: Synthesizer) -> t.Iterator[t.Tuple[str, type, dict]]:
+    ''' Yield ``(name, class, payload)`` for every generated type and event. '''
+    for kind, name, payload in synth.iter_payloads():
+        domain, item = name.split('.')
+        module = importlib.import_module(f'{package}.{snake_case(domain)}')
+        if kind == 'event':
+            item = item[0].upper() + item[1:]
+        yield name, getattr(module, item), payload
+
+
+class _Reference:
+    __slots__ = ('a', 'b', 'c', 'd')
+
+    def __init__(self, a, b, c, d):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+
+
+_REFERENCE_JSON = {'a': 1, 'b': 'b', 'c': [1, 2], 'd': None}
+
+
+def reference() -> _Reference:
+    ''' A fixed workload shaped like ``from_json``, see :func:`measure`. '''
+    json = _REFERENCE_JSON
+    return _Reference(json['a'], json['b'], [i for i in json['c']], json.get('d'))
+
+
+def measure(funcs: t.Dict[str, t.Callable[[], t.Any]], number: int, repeat: int) -> t.Dict[str, float]:
+    '''
+    Return the best time of ``repeat`` runs of each function in microseconds per call,
+    and of :func:`reference` under the ``reference`` key.
+
+    The runs of the functions and of the reference are interleaved, so that comparing
+    times relative to the reference cancels out most of the changes in the speed of the
+    machine between two benchmark runs.
+    '''
+    funcs = dict(funcs, reference=reference)
+    times: t.Dict[str, t.List[float]] = {name: [] for name in funcs}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            times[name].append(timeit.timeit(func, number=number))
+    return {name: min(runs) / number * 1e6 for name, runs in times.items()}
+
+
+def run(
+    package: str,
+    synth: Synthesizer,
+    number: int,
+    repeat: int=5,
+    names: t.Optional[t.Container[str]] = None
+) -> Results:
+    ''' Return the times of each class, or of the classes in ``names``, keyed by ``Domain.name``. '''
+    results: Results = {}
+    for name, cls, payload in iter_classes(package, synth):
+        if names is not None and name not in names:
+            continue
+        try:
+            obj = cls.from_json(payload)
+        except Exception as e:
+            print(f'skipping {name}: {e!r}', file=sys.stderr)
+            continue
+        funcs = {'from_json': lambda: cls.from_json(payload)}
+        if hasattr(obj, 'to_json'):
+            funcs['to_json'] = obj.to_json
+        results[name] = measure(funcs, number, repeat)
+    return results
+
+
+def rescale(results: Results, baseline: Results) -> Results:
+    ''' Scale the times of each class by how much slower the reference ran than in the baseline. '''
+    scaled: Results = {}
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None or 'reference' not in base:
+            scaled[name] = stats
+            continue
+        factor = base['reference'] / stats['reference']
+        scaled[name] = {method: time * factor for method, time in stats.items()}
+    return scaled
+
+
+def by_domain(results: Results) -> Results:
+    domains: Results = {}
+    for name, stats in results.items():
+        totals = domains.setdefault(name.split('.')[0], dict.fromkeys(METHODS, 0.0))
+        for method in METHODS:
+            totals[method] += stats.get(method, 0.0)
+    return domains
+
+
+def regressions(results: Results, baseline: Results, threshold: float) -> t.List[t.Tuple[str, str, float]]:
+    ''' Return ``(name, method, change)`` for the times that grew more than ``threshold`` percent. '''
+    slower = []
+    for name, stats in sorted(results.items()):
+        for method in METHODS:
+            time = stats.get(method)
+            base = baseline.get(name, {}).get(method)
+            if time is not None and base:
+                change = (time / base - 1) * 100
+                if change > threshold:
+                    slower.append((name, method, change))
+    return slower
+
+
+def report(results: Results, baseline: t.Optional[Results]):
+    width = max(len(name) for name in results) + 2
+    header = f"{'':<{width}}{'from_json µs':>14}{'to_json µs':>14}"
+    if baseline is not None:
+        header += f"{'from_json Δ':>14}{'to_json Δ':>14}"
+    print(header)
+    # the totals only count the classes measured on both sides
+    common = [name for name in results if baseline is None or name in baseline]
+    total = lambda res: {method: sum(res[name].get(method, 0.0) for name in common) for method in METHODS}
+    rows = [(name, results[name], baseline and baseline.get(name)) for name in sorted(results)]
+    rows.append(('TOTAL', total(results), baseline and total(baseline)))
+    for name, stats, base in rows:
+        line = f'{name:<{width}}' + ''.join(
+            f'{stats[method]:>14.2f}' if method in stats else f"{'-':>14}" for method in METHODS
+        )
+        if baseline is not None:
+            for method in METHODS:
+                if base and base.get(method) and method in stats:
+                    line += f'{(stats[method] / base[method] - 1) * 100:>+13.1f}%'
+                else:
+                    line += f"{'-':>14}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=100,
+        help='calls per class (default: %(default)s)')
+    parser.add_argument('--package', type=Path,
+        help='directory of the generated package to benchmark (default: pycdp/cdp)')
+    parser.add_argument('--save', type=Path, help='write the results to this JSON file')
+    parser.add_argument('--compare', type=Path, help='compare with results saved by --save')
+    parser.add_argument('--threshold', type=float, default=25.0,
+        help='percent a class may get slower before it is reported as a regression (default: %(default)s)')
+    parser.add_argument('--by-type', action='store_true', help='report every class instead of every domain')
+    parser.add_argument('--array-size', type=int, default=2, help='items of the arrays of the payloads')
+    parser.add_argument('--string-size', type=int, default=16, help='length of the strings of the payloads')
+    args = parser.parse_args()
+
+    if args.package:
+        sys.path.insert(0, str(args.package.resolve().parent))
+        package = args.package.name
+    else:
+        package = 'pycdp.cdp'
+    synth = Synthesizer.from_files(array_size=args.array_size, string_size=args.string_size)
+    results = run(package, synth, args.number)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if baseline is not None:
+        # measure the classes that look slower again before reporting them
+        suspects = {name for name, _, _ in regressions(rescale(results, baseline), baseline, args.threshold)}
+        if suspects:
+            # payloads are only reproducible from a fresh synthesizer with the same seed
+            synth = Synthesizer.from_files(array_size=args.array_size, string_size=args.string_size)
+            results.update(run(package, synth, args.number, 20, suspects))
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    if baseline is not None:
+        results = rescale(results, baseline)
+    if args.by_type:
+        report(results, baseline)
+    else:
+        report(by_domain(results), by_domain(baseline) if baseline is not None else None)
+    if baseline is not None:
+        slower = regressions(results, baseline, args.threshold)
+        if slower:
+            print(f'\n{len(slower)} regressions over {args.threshold:g}%:')
+            for name, method, change in slower:
+                print(f'  {name}.{method}: {change:+.1f}%')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
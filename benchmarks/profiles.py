@@ -0,0 +1,87 @@
+'''
+Compare the size, import time and memory of packages generated by ``cdpgen`` with
+different build profiles.
+
+Each profile is generated into a temporary directory. Import time and memory are
+measured in fresh interpreters that import every module of the package, the first
+import of each profile is not measured so the bytecode is already cached.
+
+Usage::
+
+    python benchmarks/profiles.py [--repeat N] [--profile NAME ...]
+'''
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+import typing as t
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LEAN = ['--no-docstrings', '--no-typeddicts']
+STABLE = ['--drop-deprecated', '--drop-experimental']
+PROFILES: t.Dict[str, t.List[str]] = {
+    'full': [],
+    'lean': LEAN,
+    'stable': STABLE,
+    'stable-lean': STABLE + LEAN,
+    'worker': ['--domains', 'Target', 'Page', 'Runtime'] + STABLE + LEAN,
+}
+GENERATE = 'from pycdp.gen.generate import cdpgen; cdpgen()'
+# imports every module of the package and prints the time or memory it took
+MEASURE = '''if True:
+    import sys, time, json, importlib, tracemalloc
+    trace = sys.argv[1] == 'memory'
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    package = importlib.import_module('cdp')
+    for module in sorted(set(package.util._domain_modules.values())):
+        importlib.import_module(f'cdp.{module}')
+    elapsed = time.perf_counter() - start
+    print(json.dumps(tracemalloc.get_traced_memory()[0] if trace else elapsed))
+'''
+
+
+def generate(output: Path, args: t.List[str]):
+    subprocess.run(
+        [sys.executable, '-c', GENERATE,
+            '--browser-protocol', str(ROOT / 'pycdp' / 'gen' / 'browser_protocol.json'),
+            '--js-protocol', str(ROOT / 'pycdp' / 'gen' / 'js_protocol.json'),
+            '--output', str(output)] + args,
+        cwd=ROOT, check=True, stderr=subprocess.DEVNULL
+    )
+
+
+def measure(package_dir: Path, what: str) -> float:
+    result = subprocess.run(
+        [sys.executable, '-c', MEASURE, what],
+        cwd=package_dir.parent, check=True, capture_output=True, text=True
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5,
+        help='import time is the best of this many runs (default: %(default)s)')
+    parser.add_argument('--profile', nargs='+', choices=list(PROFILES), default=list(PROFILES),
+        help='profiles to measure (default: all)')
+    args = parser.parse_args()
+
+    print(f"{'profile':<14}{'modules':>9}{'size KB':>10}{'import ms':>11}{'memory KB':>11}")
+    for name in args.profile:
+        with tempfile.TemporaryDirectory() as tmp:
+            package_dir = Path(tmp) / 'cdp'
+            generate(package_dir, PROFILES[name])
+            modules = [p for p in package_dir.glob('*.py') if p.stem not in ('__init__', 'util')]
+            size = sum(p.stat().st_size for p in package_dir.glob('*.py'))
+            measure(package_dir, 'time')
+            import_time = min(measure(package_dir, 'time') for _ in range(args.repeat))
+            memory = measure(package_dir, 'memory')
+        print(f'{name:<14}{len(modules):>9}{size / 1024:>10.0f}{import_time * 1000:>11.0f}{memory / 1024:>11.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,29 @@
 from __future__ import annotations
 import json
+import time
+import heapq
 import asyncio
 import itertools
+import weakref
 import typing as t
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from contextlib import asynccontextmanager, contextmanager
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from aiohttp.client import ClientWebSocketResponse
-from aiohttp.http_websocket import WSMsgType, WSCloseCode
+from aiohttp.http_websocket import WSMsgType, WSCloseCode, WebSocketError
 from aiohttp.client_exceptions import (
-    ClientResponseError, ClientConnectorError, ClientConnectionError, ServerDisconnectedError
+    ClientError, ClientResponseError, ClientConnectorError, ClientConnectionError, ServerDisconnectedError,
+    WSServerHandshakeError
 )
 from pycdp.exceptions import *
 from pycdp.base import IEventLoop
-from pycdp.utils import ContextLoggerMixin, LoggerMixin, SingleTaskWorker, retry_on
+from pycdp.utils import Closable, ContextLoggerMixin, LoggerMixin, SingleTaskWorker, retry_on
+from pycdp.tracing import ProtocolHooks
 from pycdp import cdp
 
 
 T = t.TypeVar('T')
+T_RAW = t.TypeVar('T_RAW')
 
 
 class AsyncIOEventLoop(IEventLoop):
@@ -28,40 +34,752 @@ class AsyncIOEventLoop(IEventLoop):
 loop = AsyncIOEventLoop()
 
 
-_CLOSE_SENTINEL = object
+# commands whose effect lasts for the whole session, besides the enable, Emulation.set*,
+# addScriptToEvaluateOnNewDocument and addBinding commands
+_SETUP_COMMANDS = frozenset((
+    'Network.setExtraHTTPHeaders',
+    'Network.setUserAgentOverride',
+    'Network.setCacheDisabled',
+    'Network.setBlockedURLs',
+    'Network.setBypassServiceWorker',
+    'Page.setBypassCSP',
+    'Page.setLifecycleEventsEnabled',
+    'Page.setInterceptFileChooserDialog',
+    'Runtime.setAsyncCallStackDepth',
+    'Security.setIgnoreCertificateErrors',
+    'Target.setAutoAttach',
+))
+
+
+#: read-only commands cached by :meth:`CDPBase.cache_commands` by default, and the events
+#: that invalidate their results
+CACHED_COMMANDS: t.Dict[str, t.Tuple[str, ...]] = {
+    'Browser.getVersion': (),
+    'DOM.getDocument': ('DOM.documentUpdated', 'Page.frameNavigated'),
+    'Page.getFrameTree': (
+        'Page.frameAttached', 'Page.frameDetached', 'Page.frameNavigated', 'Page.navigatedWithinDocument'
+    ),
+    'Runtime.getIsolateId': (),
+    'Target.getTargetInfo': ('Target.targetInfoChanged',),
+}
+
+
+#: priority classes of :class:`SendScheduler`, lower classes are sent first
+PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_BULK = range(3)
+_PRIORITY_NAMES = ('high', 'normal', 'bulk')
+
+#: commands that :class:`SendScheduler` sends ahead of the others by default: user input,
+#: and the answers to paused requests and dialogs, which block the page until sent
+HIGH_PRIORITY_COMMANDS = frozenset((
+    'Input.dispatchKeyEvent',
+    'Input.dispatchMouseEvent',
+    'Input.dispatchTouchEvent',
+    'Input.insertText',
+    'Fetch.continueRequest',
+    'Fetch.continueResponse',
+    'Fetch.continueWithAuth',
+    'Fetch.failRequest',
+    'Fetch.fulfillRequest',
+    'Page.handleJavaScriptDialog',
+))
+
+
 class CDPEventListener:
+    '''
+    The async iterator returned by :meth:`CDPBase.listen`. Events are buffered in a deque
+    of at most ``buffer_size`` items, a single future wakes the consumer.
+
+    The session only keeps a weak reference to the listener: it's unregistered when it's
+    closed or when the consumer drops it, e.g. by breaking out of an ``async for``.
+    '''
+    __slots__ = ('_buffer', '_maxsize', '_waiter', '_closed', '_on_close', '__weakref__')
 
-    def __init__(self, queue: asyncio.Queue):
-        self._queue = queue
+    def __init__(self, buffer_size: int):
+        self._buffer: t.Deque[t.Any] = deque()
+        self._maxsize = buffer_size
+        self._waiter: t.Optional[asyncio.Future] = None
         self._closed = False
+        self._on_close: t.List[t.Callable[[], None]] = []
 
     @property
     def closed(self):
         return self._closed
 
-    def put(self, elem: dict):
-        if self._closed: raise CDPEventListenerClosed
-        self._queue.put_nowait(elem)
+    def put(self, elem: t.Any) -> bool:
+        ''' Buffer an event, return ``False`` if the buffer is full. '''
+        if len(self._buffer) >= self._maxsize:
+            return False
+        self._buffer.append(elem)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+        return True
 
     def close(self):
+        if self._closed:
+            return
         self._closed = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        for unregister in self._on_close:
+            unregister()
+        self._on_close.clear()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer or self._closed:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._buffer.popleft()
+
+    async def aclose(self):
+        self.close()
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}(buffer={len(self._buffer)}/{self._maxsize}, closed={self._closed})'
+
+
+_K = t.TypeVar('_K')
+#: listeners of an event type or method, replaced instead of modified so that dispatching
+#: events can iterate them while listeners are added and removed
+_Listeners = t.Tuple['weakref.ReferenceType[CDPEventListener]', ...]
+
+
+def _add_listener(registry: t.Dict[_K, _Listeners], key: _K, listener: CDPEventListener):
+    def remove(ref):
+        refs = registry.get(key, ())
+        if ref in refs:
+            refs = tuple(r for r in refs if r is not ref)
+            if refs:
+                registry[key] = refs
+            else:
+                del registry[key]
+    ref = weakref.ref(listener, remove)
+    registry[key] = registry.get(key, ()) + (ref,)
+    listener._on_close.append(lambda: remove(ref))
+
+
+#: the event fields that :meth:`CDPBase.expect` looks up keys in, in order of preference
+EXPECT_FIELDS = ('request_id', 'frame_id', 'loader_id', 'execution_context_id')
+
+
+class _Expectation:
+    __slots__ = ('future', 'field', 'key', 'predicate')
+
+    def __init__(self, future: asyncio.Future, field: t.Optional[str], key: t.Any, predicate: t.Optional[t.Callable[[t.Any], bool]]):
+        self.future = future
+        self.field = field
+        self.key = key
+        self.predicate = predicate
+
+    def matches(self, event: t.Any) -> bool:
+        if self.field is not None and getattr(event, self.field, None) != self.key:
+            return False
+        return self.predicate is None or self.predicate(event)
+
+
+class ExpectRegistry:
+    '''
+    The futures expecting events of one type, see :meth:`CDPBase.expect`. Expectations
+    with a key are indexed by the event field and the key, so an event only wakes the
+    futures expecting its field values, however many are waiting.
+    '''
+    __slots__ = ('_keyed', '_unkeyed', '_count')
+
+    def __init__(self):
+        # field -> key -> expectations
+        self._keyed: t.Dict[str, t.Dict[t.Any, t.List[_Expectation]]] = {}
+        self._unkeyed: t.List[_Expectation] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, expectation: _Expectation):
+        if expectation.field is None:
+            self._unkeyed.append(expectation)
+        else:
+            index = self._keyed.setdefault(expectation.field, {})
+            index.setdefault(expectation.key, []).append(expectation)
+        self._count += 1
+
+    def discard(self, expectation: _Expectation):
+        if expectation.field is None:
+            expectations = self._unkeyed
+        else:
+            index = self._keyed.get(expectation.field, {})
+            expectations = index.get(expectation.key, [])
+        if expectation in expectations:
+            expectations.remove(expectation)
+            self._count -= 1
+            if not expectations and expectation.field is not None:
+                del index[expectation.key]
+                if not index:
+                    del self._keyed[expectation.field]
+
+    def dispatch(self, event: t.Any):
+        for field, index in self._keyed.items():
+            expectations = index.get(getattr(event, field, None))
+            if expectations:
+                self._resolve(expectations, event)
+        if self._unkeyed:
+            self._resolve(self._unkeyed, event)
+
+    def fail(self, exc: Exception):
+        for expectation in itertools.chain(
+            self._unkeyed,
+            *(expectations for index in self._keyed.values() for expectations in index.values())
+        ):
+            if not expectation.future.done():
+                expectation.future.set_exception(exc)
+
+    def _resolve(self, expectations: t.List[_Expectation], event: t.Any):
+        # resolved futures are discarded by their done callbacks
+        for expectation in expectations:
+            future = expectation.future
+            if future.done():
+                continue
+            if expectation.predicate is not None:
+                try:
+                    if not expectation.predicate(event):
+                        continue
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+            future.set_result(event)
+
+
+class CommandCache:
+    '''
+    The results of read-only commands of a session, see :meth:`CDPBase.cache_commands`.
+    ``rules`` maps the method of each cached command to the methods of the events that
+    invalidate its results.
+
+    Identical commands share one request while it's in flight and its result until an
+    invalidating event is received. Errors are not cached. Results are kept as received
+    and parsed for each caller, raw results are shared and should not be modified.
+    '''
+    def __init__(self, rules: t.Mapping[str, t.Iterable[str]] = CACHED_COMMANDS):
+        # command method -> serialized params -> future of the raw result
+        self._entries: t.Dict[str, t.Dict[str, asyncio.Future]] = {}
+        self._rules: t.Dict[str, t.FrozenSet[str]] = {}
+        # event method -> command methods it invalidates
+        self._invalidated_by: t.Dict[str, t.Set[str]] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        for method, events in rules.items():
+            self.rule(method, *events)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def rule(self, method: str, *events: str):
+        ''' Cache the results of a command until one of the given events is received. '''
+        self._rules[method] = self._rules.get(method, frozenset()) | frozenset(events)
+        for event in events:
+            self._invalidated_by[event].add(method)
+
+    def cacheable(self, method: str) -> bool:
+        return method in self._rules
+
+    def invalidate(self, method: t.Optional[str] = None):
+        ''' Drop the results of a command, or of every command. Requests in flight still
+        resolve their callers but their results are not cached. '''
+        if method is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(method, None)
+
+    def event(self, method: str):
+        ''' Drop the results invalidated by an event. '''
+        commands = self._invalidated_by.get(method)
+        if commands:
+            for command in commands:
+                self._entries.pop(command, None)
+
+    async def execute(self, target: CDPBase, cmd: cdp.util.Command) -> t.Any:
+        ''' Return the raw result of a command, from the cache or a request shared by
+        the concurrent callers. '''
+        # a command made from a template only has its params serialized
+        params = cmd.params if cmd._body is None else cmd.to_json().get('params')
+        key = json.dumps(params, sort_keys=True) if params else ''
+        entries = self._entries.setdefault(cmd.method, {})
+        future = entries.get(key)
+        if future is None:
+            self.misses += 1
+            # a miss takes the slots of the target's limiters like any other command
+            if target._limiters:
+                request = target._execute_limited(cmd, True)
+            else:
+                request = target._execute(cmd, raw=True)
+            future = asyncio.ensure_future(request)
+            entries[key] = future
+            def discard_error(future: asyncio.Future):
+                if future.cancelled() or future.exception() is not None:
+                    entries = self._entries.get(cmd.method, {})
+                    if entries.get(key) is future:
+                        del entries[key]
+            future.add_done_callback(discard_error)
+        else:
+            self.hits += 1
+        # a caller that is cancelled does not cancel the request of the others
+        return await asyncio.shield(future)
+
+
+class EventHistory:
+    '''
+    The recent events of some types, see :meth:`CDPBase.record_history`. Each type has a
+    ring buffer of at most ``max_events`` events and, if ``max_bytes`` is set, at most
+    that many bytes of JSON messages, the oldest events are dropped first.
+    '''
+    __slots__ = ('max_events', 'max_bytes', '_events', '_sizes')
+
+    def __init__(self, max_events: int = 100, max_bytes: t.Optional[int] = None):
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        # event type -> (time received, event, message size)
+        self._events: t.Dict[type, t.Deque[t.Tuple[float, t.Any, int]]] = {}
+        self._sizes: t.Dict[type, int] = {}
+
+    def __contains__(self, event_type: type) -> bool:
+        return event_type in self._events
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self._events.values())
+
+    def track(self, event_type: type):
+        if event_type not in self._events:
+            self._events[event_type] = deque()
+            self._sizes[event_type] = 0
+
+    def record(self, event_type: type, event: t.Any, time: float, size: int):
+        events = self._events[event_type]
+        events.append((time, event, size))
+        self._sizes[event_type] += size
+        while len(events) > self.max_events or (
+            self.max_bytes is not None and self._sizes[event_type] > self.max_bytes and len(events) > 1
+        ):
+            self._sizes[event_type] -= events.popleft()[2]
+
+    def since(self, event_types: t.Iterable[type], time: float) -> t.List[t.Tuple[float, t.Any]]:
+        ''' Return ``(time, event)`` for the events of the given types received at or after
+        ``time``, oldest first. '''
+        return list(heapq.merge(*(
+            [(received, event) for received, event, _ in self._events.get(event_type, ()) if received >= time]
+            for event_type in event_types
+        ), key=lambda item: item[0]))
+
+    def clear(self):
+        for event_type in self._events:
+            self._events[event_type].clear()
+            self._sizes[event_type] = 0
+
+
+def _merge_enable_params(method: str, params_list: t.Iterable[dict]) -> dict:
+    '''
+    Merge the params that several callers passed to an ``enable`` command: the largest of
+    numbers, e.g. buffer sizes, either of booleans, the union of arrays, e.g. ``Fetch``
+    patterns. Other params must be equal.
+    '''
+    merged: dict = {}
+    for params in params_list:
+        for name, value in params.items():
+            current = merged.get(name)
+            if name not in merged or current == value:
+                merged[name] = value
+            elif isinstance(value, bool) and isinstance(current, bool):
+                merged[name] = True
+            elif isinstance(value, (int, float)) and isinstance(current, (int, float)):
+                merged[name] = max(current, value)
+            elif isinstance(value, list) and isinstance(current, list):
+                merged[name] = current + [item for item in value if item not in current]
+            else:
+                raise ValueError(f'conflicting {method} params {name}: {current!r} and {value!r}')
+    return merged
+
+
+class EnableManager:
+    '''
+    Counts the holders of the ``enable`` command of each domain of a session, see
+    :meth:`CDPBase.enable`. A domain is enabled with the params of all of its holders
+    merged, enabled again when they change and disabled when its last holder releases
+    it, so the browser only sends the events somebody waits for.
+    '''
+    def __init__(self, target: CDPBase):
+        self._target = target
+        # domain -> params of each holder
+        self._holders: t.Dict[str, t.List[dict]] = {}
+        # domain -> params of the enable command in effect
+        self._enabled: t.Dict[str, dict] = {}
+        self._locks: t.Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # tasks releasing the domains of collected listeners
+        self._releasing: t.Set[asyncio.Task] = set()
+
+    def count(self, domain: str) -> int:
+        ''' Return the number of holders of a domain, e.g. ``'Network'``. '''
+        return len(self._holders.get(domain, ()))
+
+    def enabled(self, domain: str) -> t.Optional[dict]:
+        ''' Return the params the domain is enabled with, ``None`` if it's disabled. '''
+        return self._enabled.get(domain)
+
+    async def acquire(self, command: cdp.util.Command):
+        ''' Hold a domain enabled by an ``enable`` command, e.g. ``cdp.network.enable()``. '''
+        domain, _, name = command.method.partition('.')
+        if name != 'enable':
+            raise ValueError(f'{command.method} is not an enable command')
+        params = command.params or {}
+        async with self._locks[domain]:
+            holders = self._holders.get(domain, [])
+            merged = _merge_enable_params(command.method, holders + [params])
+            if self._enabled.get(domain) != merged:
+                await self._target.execute(cdp.util.Command(command.method, merged), raw=True)
+                self._enabled[domain] = merged
+            self._holders[domain] = holders + [params]
+
+    async def release(self, command: cdp.util.Command):
+        ''' Release a domain held by :meth:`acquire` with the same command. '''
+        domain = command.method.partition('.')[0]
+        params = command.params or {}
+        async with self._locks[domain]:
+            holders = self._holders.get(domain, [])
+            if params not in holders:
+                raise ValueError(f'{command.method} with {params} is not held')
+            holders.remove(params)
+            if self._target._close_reason is not None:
+                # the domains of a closed session went away with it
+                if not holders:
+                    del self._holders[domain]
+                self._enabled.pop(domain, None)
+                return
+            try:
+                if not holders:
+                    del self._holders[domain]
+                    if self._enabled.pop(domain, None) is not None:
+                        await self._target.execute(cdp.util.Command(f'{domain}.disable'), raw=True)
+                else:
+                    merged = _merge_enable_params(command.method, holders)
+                    if self._enabled.get(domain) != merged:
+                        # forget the params in effect until the browser confirms the new ones
+                        self._enabled.pop(domain, None)
+                        await self._target.execute(cdp.util.Command(command.method, merged), raw=True)
+                        self._enabled[domain] = merged
+            except CDPError as e:
+                # e.g. the connection was lost, there is nothing left to disable
+                self._target._logger.debug('could not release %s: %r', command.method, e)
+
+    @asynccontextmanager
+    async def hold(self, command: cdp.util.Command) -> t.AsyncGenerator[None, None]:
+        await self.acquire(command)
         try:
-            self._queue.put_nowait(_CLOSE_SENTINEL)
-        except asyncio.QueueFull:
-            pass
+            yield
+        finally:
+            await self.release(command)
+
+    def hold_for(self, listener: CDPEventListener, domains: t.Iterable[str]) -> asyncio.Task:
+        '''
+        Hold the given domains enabled until the listener is closed or garbage collected.
+        They are enabled by the returned task, domains that fail to enable are logged
+        and skipped.
+        '''
+        loop = asyncio.get_running_loop()
+        commands: t.List[cdp.util.Command] = [cdp.util.Command(f'{domain}.enable') for domain in sorted(set(domains))]
+        acquiring = loop.create_task(self._acquire_all(commands))
+        def release():
+            if not loop.is_closed():
+                task = loop.create_task(self._release_all(acquiring))
+                self._releasing.add(task)
+                task.add_done_callback(self._released)
+        # unlike a close callback, a finalizer also runs when the listener is collected
+        listener._on_close.append(weakref.finalize(listener, release))
+        return acquiring
+
+    async def _acquire_all(self, commands: t.List[cdp.util.Command]) -> t.List[cdp.util.Command]:
+        acquired = []
+        for command in commands:
+            try:
+                await self.acquire(command)
+            except CDPError as e:
+                self._target._logger.warning('could not enable %s for a listener: %r', command.method, e)
+            else:
+                acquired.append(command)
+        return acquired
+
+    def _released(self, task: asyncio.Task):
+        self._releasing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._target._logger.error('could not release the domains of a listener: %r', task.exception())
+
+    async def _release_all(self, acquiring: asyncio.Task):
+        for command in await acquiring:
+            await self.release(command)
+
 
-    async def __aiter__(self):
+class _SendQueue:
+    ''' The messages of one priority class, queued per session and sent by deficit
+    round-robin. '''
+    __slots__ = ('active', 'deficits')
+
+    def __init__(self):
+        # session -> (future, ws, message, time queued)
+        self.active: t.OrderedDict[t.Any, t.Deque[t.Tuple[asyncio.Future, t.Any, str, float]]] = OrderedDict()
+        self.deficits: t.Dict[t.Any, int] = {}
+
+    def pop(self, quantum: int) -> t.Tuple[t.Any, t.Tuple[asyncio.Future, t.Any, str, float]]:
+        ''' Return the next message and its session. '''
+        while True:
+            session, messages = next(iter(self.active.items()))
+            if len(messages[0][2]) <= self.deficits[session]:
+                break
+            # the session spent its turn, it's credited for the next one
+            self.deficits[session] += quantum
+            self.active.move_to_end(session)
+        item = messages.popleft()
+        self.deficits[session] -= len(item[2])
+        if not messages:
+            del self.active[session]
+            del self.deficits[session]
+        return session, item
+
+
+class SendScheduler:
+    '''
+    Sends the messages of a connection and its sessions in order of priority instead of
+    arrival. Commands in ``priorities`` have that priority class, defaulting to
+    :data:`HIGH_PRIORITY_COMMANDS`, other commands have the class of their session's
+    :attr:`CDPBase.priority`. Within a class sessions take turns by deficit round-robin,
+    sending about ``quantum`` bytes per turn, so a session queueing thousands of commands
+    does not delay the few commands of the others.
+
+    The messages of a session are always sent in order: a command of a higher class
+    promotes the messages its session already queued to that class.
+
+    A message is written right away when nothing is queued, and queued while a previous
+    one is being written, i.e. while the websocket applies backpressure. The queueing
+    delay of each class is reported by :meth:`stats`.
+    '''
+    def __init__(self, quantum: int = 4096, priorities: t.Optional[t.Mapping[str, int]] = None):
+        self.quantum = quantum
+        self.priorities: t.Dict[str, int] = (
+            dict.fromkeys(HIGH_PRIORITY_COMMANDS, PRIORITY_HIGH) if priorities is None else dict(priorities)
+        )
+        self._queues = [_SendQueue() for _ in _PRIORITY_NAMES]
+        # session -> the class its queued messages are in
+        self._classes: t.Dict[t.Any, int] = {}
+        self._writer: t.Optional[asyncio.Task] = None
+        self._writing = False
+        self._queued = 0
+        self._stats = {name: self._new_stats() for name in _PRIORITY_NAMES}
+
+    @staticmethod
+    def _new_stats() -> t.Dict[str, float]:
+        return {'sent': 0, 'total_delay': 0.0, 'max_delay': 0.0}
+
+    def __len__(self) -> int:
+        return self._queued
+
+    def stats(self) -> t.Dict[str, t.Dict[str, float]]:
+        ''' Return the messages queued and sent, and their mean and max queueing delay in
+        seconds, of each priority class. '''
+        stats = {}
+        for name, queue in zip(_PRIORITY_NAMES, self._queues):
+            sent = self._stats[name]['sent']
+            stats[name] = {
+                'queued': sum(len(messages) for messages in queue.active.values()),
+                'sent': sent,
+                'mean_delay': self._stats[name]['total_delay'] / sent if sent else 0.0,
+                'max_delay': self._stats[name]['max_delay'],
+            }
+        return stats
+
+    def reset_stats(self):
+        self._stats = {name: self._new_stats() for name in _PRIORITY_NAMES}
+
+    async def send(self, ws: ClientWebSocketResponse, message: str, session: CDPBase, method: str):
+        ''' Write a message, after the messages queued before it of its class and of the
+        higher classes. '''
+        priority = self.priorities.get(method, session.priority)
+        if not self._writing and self._writer is None:
+            # nothing is queued, skip the queue
+            self._count(priority, 0.0)
+            self._writing = True
+            try:
+                await ws.send_str(message)
+            finally:
+                self._writing = False
+                if self._queued:
+                    self._writer = asyncio.get_running_loop().create_task(self._write())
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        current = self._classes.get(session)
+        if current is None:
+            self._classes[session] = priority
+        elif priority < current:
+            # promote the queued messages of the session, they are sent first
+            queue = self._queues[current]
+            self._queues[priority].active[session] = queue.active.pop(session)
+            self._queues[priority].deficits[session] = queue.deficits.pop(session)
+            self._classes[session] = priority
+        else:
+            priority = current
+        queue = self._queues[priority]
+        messages = queue.active.get(session)
+        if messages is None:
+            messages = queue.active[session] = deque()
+            queue.deficits[session] = 0
+        messages.append((future, ws, message, loop.time()))
+        self._queued += 1
+        if self._writer is None and not self._writing:
+            self._writer = loop.create_task(self._write())
+        await future
+
+    def _count(self, priority: int, delay: float):
+        stats = self._stats[_PRIORITY_NAMES[priority]]
+        stats['sent'] += 1
+        stats['total_delay'] += delay
+        stats['max_delay'] = max(stats['max_delay'], delay)
+
+    def fail(self, exc: Exception):
+        ''' Fail the queued messages, e.g. when the connection is lost. '''
+        for queue in self._queues:
+            for messages in queue.active.values():
+                for future, _, _, _ in messages:
+                    if not future.done():
+                        future.set_exception(exc)
+            queue.active.clear()
+            queue.deficits.clear()
+        self._classes.clear()
+        self._queued = 0
+
+    async def _write(self):
+        loop = asyncio.get_running_loop()
         try:
-            while not self._closed:
-                elem = await self._queue.get()
-                if elem is _CLOSE_SENTINEL:
-                    return
-                yield elem
+            while self._queued:
+                # the highest class is picked again after each message
+                priority = next(i for i, queue in enumerate(self._queues) if queue.active)
+                queue = self._queues[priority]
+                session, (future, ws, message, queued) = queue.pop(self.quantum)
+                self._queued -= 1
+                if session not in queue.active:
+                    del self._classes[session]
+                if future.done():
+                    # the caller was cancelled
+                    continue
+                self._count(priority, loop.time() - queued)
+                try:
+                    await ws.send_str(message)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(None)
         finally:
-            self._closed = True
+            self._writer = None
+
+
+class AdaptiveLimiter:
+    '''
+    Limits the commands in flight with an AIMD limit that follows their latency, see
+    :meth:`CDPConnection.limit_concurrency`.
+
+    The latency of each command is compared with a baseline per method, the lowest
+    latency seen, drifting up slowly so that it follows a slower page. When a command
+    takes longer than ``tolerance`` times its baseline plus ``slack`` seconds the limit is
+    multiplied by ``backoff``, at most once per round trip, otherwise it grows by one per
+    limit's worth of commands while the limit is in use. Commands over the limit wait in
+    a FIFO queue.
+    '''
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        backoff: float = 0.9,
+        tolerance: float = 2.0,
+        slack: float = 0.002,
+        drift: float = 0.01
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.slack = slack
+        self.drift = drift
+        self._limit = float(initial_limit)
+        self._inflight = 0
+        self._waiters: t.Deque[asyncio.Future] = deque()
+        self._baselines: t.Dict[t.Optional[str], float] = {}
+        self._last_backoff = float('-inf')
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self):
+        if self._inflight < self.limit and not self._waiters:
+            self._inflight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # unless a release already dropped it
+                if future in self._waiters:
+                    self._waiters.remove(future)
+            else:
+                # the slot was granted as the caller was cancelled
+                self.release(None, None)
+            raise
+
+    def release(self, method: t.Optional[str], latency: t.Optional[float]):
+        ''' Release a slot, with the latency of its command if it was answered. '''
+        self._inflight -= 1
+        if latency is not None:
+            self._update(method, latency)
+        while self._waiters and self._inflight < self.limit:
+            waiter = self._waiters.popleft()
+            # cancelled waiters are dropped
+            if not waiter.done():
+                self._inflight += 1
+                waiter.set_result(None)
+
+    def _update(self, method: t.Optional[str], latency: float):
+        baseline = self._baselines.get(method)
+        if baseline is None or latency < baseline:
+            self._baselines[method] = baseline = latency
+        else:
+            self._baselines[method] = baseline + (latency - baseline) * self.drift
+        if latency > baseline * self.tolerance + self.slack:
+            now = asyncio.get_running_loop().time()
+            # the commands answered in the same round trip saw the same congestion
+            if now - self._last_backoff > latency:
+                self._last_backoff = now
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+        elif self._inflight + 1 >= self._limit / 2:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
 
     def __str__(self) -> str:
-        return f'{self.__class__.__name__}(buffer={self._queue.qsize()}/{self._queue.maxsize}, closed={self._closed})'
+        return f'{self.__class__.__name__}(limit={self.limit}, inflight={self._inflight}, queued={self.queued})'
 
 
 class CDPBase(LoggerMixin):
@@ -70,52 +788,375 @@ class CDPBase(LoggerMixin):
     '''
     def __init__(self, ws: t.Optional[ClientWebSocketResponse]=None, session_id=None, target_id=None):
         super().__init__()
-        self._listeners: t.Dict[type, t.Set[CDPEventListener]] = defaultdict(set)
+        self._listeners: t.Dict[type, _Listeners] = {}
+        self._raw_listeners: t.Dict[str, _Listeners] = {}
+        self._expectations: t.Dict[type, ExpectRegistry] = {}
+        self._history: t.Optional[EventHistory] = None
+        self._enables = EnableManager(self)
+        self._cache: t.Optional[CommandCache] = None
+        # shared by a connection and its sessions, see SendScheduler
+        self._scheduler: t.Optional[SendScheduler] = None
+        # why the session was closed, see CDPSession.close
+        self._close_reason: t.Optional[Exception] = None
+        # shared by a connection and its sessions, see CDPConnection.hooks
+        self._hooks: t.Optional[ProtocolHooks] = None
+        # command id -> method, of the commands in flight while there are hooks
+        self._hook_methods: t.Dict[int, str] = {}
+        #: the priority class of the commands of this session, see :class:`SendScheduler`
+        self.priority = PRIORITY_NORMAL
+        # the limiter of this session and the ones its commands take a slot of, with the
+        # browser's, see CDPConnection.limit_concurrency
+        self._limiter: t.Optional[AdaptiveLimiter] = None
+        self._limiters: t.Tuple[AdaptiveLimiter, ...] = ()
         self._id_iter = itertools.count()
-        self._inflight_cmd: t.Dict[int, t.Tuple[t.Generator[dict, dict , t.Any], asyncio.Future]] = {}
+        self._inflight_cmd: t.Dict[int, t.Tuple[t.Optional[t.Generator[dict, t.Any, t.Any]], asyncio.Future]] = {}
         self._session_id = session_id
         self._target_id = target_id
         self._ws = ws
+        # set by reconnecting connections, see ResilientCDPConnection
+        self._online: t.Optional[asyncio.Event] = None
+        self._setup: t.Optional[t.Dict[str, dict]] = None
+        self._script_ids: t.Dict[str, str] = {}
+        # shared by a connection and its sessions, see CDPConnection
+        self._interner: t.Optional[cdp.util.Interner] = None
 
     @property
     def session_id(self) -> cdp.target.SessionID:
         return self._session_id
 
-    async def execute(self, cmd: t.Generator[dict, dict , T]) -> T:
+    @property
+    def target_id(self) -> cdp.target.TargetID:
+        return self._target_id
+
+    @t.overload
+    async def execute(self, cmd: t.Generator[dict, t.Any, T], raw: t.Literal[False] = False) -> T: ...
+    @t.overload
+    async def execute(self, cmd: t.Generator[dict, T_RAW, t.Any], raw: t.Literal[True]) -> T_RAW: ...
+
+    async def execute(self, cmd, raw=False):
         '''
         Execute a command on the server and wait for the result.
 
         :param cmd: any CDP command
+        :param raw: return the JSON result as it was received, typed as the command's
+            ``TypedDict``, instead of parsing it into CDP objects
         :returns: a CDP result
         '''
+        if self._online is not None and not self._online.is_set():
+            await self._online.wait()
+        if self._cache is not None and isinstance(cmd, cdp.util.Command) and self._cache.cacheable(cmd.method):
+            result = await self._cache.execute(self, cmd)
+            return result if raw else cmd.parse_result(result)
+        if self._limiters:
+            return await self._execute_limited(cmd, raw)
+        return await self._execute(cmd, raw)
+
+    async def _execute_limited(self, cmd: t.Generator[dict, t.Any, T], raw: bool) -> T:
+        acquired: t.List[AdaptiveLimiter] = []
+        try:
+            for limiter in self._limiters:
+                await limiter.acquire()
+                acquired.append(limiter)
+        except asyncio.CancelledError:
+            for limiter in acquired:
+                limiter.release(None, None)
+            raise
+        method = cmd.method if isinstance(cmd, cdp.util.Command) else None
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        latency = None
+        try:
+            result = await self._execute(cmd, raw)
+            latency = loop.time() - start
+            return result
+        except CDPBrowserError:
+            # the browser answered, an error takes as long as a result
+            latency = loop.time() - start
+            raise
+        finally:
+            for limiter in acquired:
+                limiter.release(method, latency)
+
+    @property
+    def limiter(self) -> t.Optional[AdaptiveLimiter]:
+        ''' The limiter of this session, or of the browser for a connection, see
+        :meth:`CDPConnection.limit_concurrency`. '''
+        return self._limiter
+
+    def cache_commands(self, rules: t.Mapping[str, t.Iterable[str]] = CACHED_COMMANDS) -> CommandCache:
+        '''
+        Cache the results of read-only commands executed by this session, by default the
+        ones in :data:`CACHED_COMMANDS`. ``rules`` maps the method of each command to the
+        methods of the events that invalidate its results, more can be added with
+        :meth:`CommandCache.rule`. Concurrent identical commands share one request.
+
+        Invalidating events are only sent by the browser while their domain is enabled,
+        e.g. ``DOM.documentUpdated`` after ``cdp.dom.enable()``, see :meth:`enable`.
+        '''
+        if self._cache is None:
+            self._cache = CommandCache(rules)
+        else:
+            for method, events in rules.items():
+                self._cache.rule(method, *events)
+        return self._cache
+
+    @property
+    def cache(self) -> t.Optional[CommandCache]:
+        return self._cache
+
+    async def _execute(self, cmd: t.Generator[dict, t.Any, T], raw: bool=False) -> T:
+        if self._close_reason is not None:
+            # the browser would never answer a command of a detached session
+            raise CDPSessionClosed(f'session {self._session_id} is closed') from self._close_reason
         cmd_id = next(self._id_iter)
         cmd_response = asyncio.get_running_loop().create_future()
-        self._inflight_cmd[cmd_id] = cmd, cmd_response
-        request = next(cmd)
-        request['id'] = cmd_id
-        if self._session_id:
-            request['sessionId'] = self._session_id
-        self._logger.debug('sending command %r', request)
-        request_str = json.dumps(request)
+        # raw results skip the command's parser, see _handle_cmd_response
+        self._inflight_cmd[cmd_id] = (None if raw else cmd), cmd_response
+        if self._setup is None and isinstance(cmd, cdp.util.Command):
+            request = None
+            request_str = cmd.serialize(cmd_id, self._session_id)
+            method = cmd.method
+            self._logger.debug('sending command %s', request_str)
+        else:
+            request = next(cmd)
+            if self._setup is not None:
+                self._translate_setup(self._setup, request)
+            request['id'] = cmd_id
+            if self._session_id:
+                request['sessionId'] = self._session_id
+            self._logger.debug('sending command %r', request)
+            request_str = json.dumps(request)
+            method = request['method']
+        hooks = self._hooks
+        if hooks is not None:
+            self._hook_methods[cmd_id] = method
+            hooks.on_send(method, self._session_id, cmd_id, len(request_str), time.monotonic())
         try:
             try:
-                await self._ws.send_str(request_str)
+                ws = self._ws
+                if ws is None:
+                    raise ConnectionResetError('not connected')
+                scheduler = self._scheduler
+                if scheduler is None:
+                    await ws.send_str(request_str)
+                else:
+                    await scheduler.send(ws, request_str, self, method)
             except ConnectionResetError as e:
                 del self._inflight_cmd[cmd_id]
+                if self._hook_methods:
+                    self._hook_failed(cmd_id)
                 raise CDPConnectionClosed(e.args[0]) from e
-            return await cmd_response
+            result = await cmd_response
         except asyncio.CancelledError:
             if cmd_id in self._inflight_cmd:
                 del self._inflight_cmd[cmd_id]
+                if self._hook_methods:
+                    self._hook_failed(cmd_id)
             raise
+        setup = self._setup
+        if setup is not None and request is not None:
+            self._record_setup(setup, request, result)
+        return result
+
+    def _fail_inflight(self, exc: Exception):
+        for (_, event) in self._inflight_cmd.values():
+            if not event.done():
+                event.set_exception(exc)
+        self._inflight_cmd.clear()
+        if self._hook_methods:
+            for cmd_id in list(self._hook_methods):
+                self._hook_failed(cmd_id)
+
+    def _hook_failed(self, cmd_id: int):
+        method = self._hook_methods.pop(cmd_id, None)
+        # the hooks may have been removed since the command was sent
+        if method is not None and self._hooks is not None:
+            self._hooks.on_fail(method, self._session_id, cmd_id, time.monotonic())
+
+    def _translate_setup(self, setup: t.Dict[str, dict], request: dict):
+        # scripts added before a reconnection were given new identifiers on replay
+        if request['method'] == 'Page.removeScriptToEvaluateOnNewDocument':
+            identifier = request['params']['identifier']
+            setup.pop(f'Page.addScriptToEvaluateOnNewDocument:{identifier}', None)
+            request['params']['identifier'] = self._script_ids.pop(identifier, identifier)
+
+    def _record_setup(self, setup: t.Dict[str, dict], request: dict, result: t.Any):
+        '''Record the commands that set up session state so they can be replayed.'''
+        method = request['method']
+        params = request.get('params', {})
+        domain, _, command = method.partition('.')
+        if command == 'enable' or method in _SETUP_COMMANDS or (domain == 'Emulation' and command.startswith('set')):
+            setup[method] = params
+        elif command == 'disable':
+            setup.pop(f'{domain}.enable', None)
+        elif domain == 'Emulation' and command.startswith('clear'):
+            setup.pop(f'Emulation.set{command[5:]}', None)
+        elif method == 'Page.addScriptToEvaluateOnNewDocument':
+            identifier = result['identifier'] if isinstance(result, dict) else result
+            setup[f'{method}:{identifier}'] = params
+        elif method == 'Runtime.addBinding':
+            setup[f'{method}:{params["name"]}'] = params
+        elif method == 'Runtime.removeBinding':
+            setup.pop(f'Runtime.addBinding:{params["name"]}', None)
+
+    async def _replay_setup(self):
+        '''Send the recorded setup commands again, in the order they were first sent.'''
+        setup, self._setup = self._setup, None
+        try:
+            for key, params in setup.items():
+                method = key.partition(':')[0]
+                result = await self._execute(cdp.util.Command(method, params), raw=True)
+                if method == 'Page.addScriptToEvaluateOnNewDocument':
+                    self._script_ids[key.partition(':')[2]] = result['identifier']
+        finally:
+            self._setup = setup
+
+    @t.overload
+    def listen(self, *event_types: t.Type[T], buffer_size: int=100, raw: t.Literal[False]=False, since: t.Optional[float]=None, enable: bool=False) -> t.AsyncIterator[T]: ...
+    @t.overload
+    def listen(self, *event_types: type, buffer_size: int=100, raw: t.Literal[True], enable: bool=False) -> t.AsyncIterator[cdp.util.T_JSON_DICT]: ...
 
-    def listen(self, *event_types: t.Type[T], buffer_size=100) -> t.AsyncIterator[T]:
+    def listen(self, *event_types, buffer_size=100, raw=False, since=None, enable=False):
         '''Return an async iterator that iterates over events matching the
-        indicated types.'''
-        receiver = CDPEventListener(asyncio.Queue(buffer_size))
+        indicated types. With ``raw`` it yields the JSON params of the events, the
+        ``TypedDict`` of an event type is named after it, e.g. ``ResponseReceivedJSON``.
+
+        With ``since``, a time of the event loop's clock, the iterator first yields the
+        events received since then that are in the history, see :meth:`record_history`.
+
+        With ``enable`` the domains of the event types are held enabled, see
+        :meth:`enable`, from right after this call until the iterator is closed or
+        dropped.'''
+        receiver = CDPEventListener(buffer_size)
+        if since is not None:
+            if raw:
+                raise ValueError('the history only has parsed events')
+            if self._history is not None:
+                # the most recent events if they don't all fit in the buffer
+                for _, event in self._history.since(event_types, since)[-buffer_size:]:
+                    receiver.put(event)
+        for event_type in event_types:
+            if raw:
+                _add_listener(self._raw_listeners, cdp.util.event_method(event_type), receiver)
+            else:
+                _add_listener(self._listeners, event_type, receiver)
+        if enable:
+            self._enables.hold_for(receiver, (cdp.util.event_method(event_type).partition('.')[0] for event_type in event_types))
+        return receiver
+
+    def enable(self, command: cdp.util.Command) -> t.AsyncContextManager[None]:
+        '''
+        A context manager that holds a domain enabled by its ``enable`` command while it's
+        entered. The domain is disabled when the last holder exits, and the params of
+        concurrent holders are merged, e.g. the largest buffer sizes of
+        ``cdp.network.enable()``::
+
+            async with session.enable(cdp.network.enable(max_post_data_size=65536)):
+                ...
+        '''
+        return self._enables.hold(command)
+
+    @property
+    def enables(self) -> EnableManager:
+        return self._enables
+
+    def record_history(self, *event_types: type, max_events: int = 100, max_bytes: t.Optional[int] = None) -> EventHistory:
+        '''
+        Keep the recent events of the given types, so that :meth:`listen` and
+        :meth:`expect` called with ``since`` also get the events that arrived before
+        they were called. Each type keeps at most ``max_events`` events and, if
+        ``max_bytes`` is set, that many bytes of messages. Recorded events are parsed
+        even if nobody listens to them.
+
+        Take the time before the action whose events may be missed, e.g. a navigation,
+        and pass it as ``since``::
+
+            session.record_history(cdp.page.FrameNavigated)
+            since = asyncio.get_running_loop().time()
+            await session.execute(cdp.page.navigate(url))
+            ...
+            navigated = await session.expect(cdp.page.FrameNavigated, frame_id, since=since)
+        '''
+        if self._history is None:
+            self._history = EventHistory(max_events, max_bytes)
+        else:
+            self._history.max_events = max_events
+            self._history.max_bytes = max_bytes
         for event_type in event_types:
-            self._listeners[event_type].add(receiver)
-        return receiver.__aiter__()
+            self._history.track(event_type)
+        return self._history
+
+    @property
+    def history(self) -> t.Optional[EventHistory]:
+        return self._history
+
+    def expect(
+        self,
+        event_type: t.Type[T],
+        key: t.Any = None,
+        *,
+        field: t.Optional[str] = None,
+        predicate: t.Optional[t.Callable[[T], bool]] = None,
+        timeout: t.Optional[float] = None,
+        since: t.Optional[float] = None
+    ) -> asyncio.Future[T]:
+        '''
+        Return a future resolved with the next event of the given type whose ``field`` is
+        ``key`` and that matches ``predicate``, both are optional. ``field`` defaults to
+        the first of :data:`EXPECT_FIELDS` the event has, e.g. ``request_id``. With a
+        ``timeout`` the future fails with :class:`asyncio.TimeoutError` if no event
+        matched in time.
+
+        The expectation is registered right away, call this before the action that
+        triggers the event and await the future after it::
+
+            finished = session.expect(cdp.network.LoadingFinished, request_id)
+            ...
+            event = await finished
+
+        Expectations are indexed by key, so an event only wakes the futures expecting
+        it however many requests are in flight. Cancel the future to stop expecting.
+
+        With ``since``, a time of the event loop's clock, the future is resolved right
+        away with the first matching event received since then that is in the history,
+        see :meth:`record_history`.
+        '''
+        if key is not None and field is None:
+            names = getattr(event_type, '__dataclass_fields__', {})
+            field = next((name for name in EXPECT_FIELDS if name in names), None)
+            if field is None:
+                raise ValueError(f'{event_type.__name__} has none of the fields {EXPECT_FIELDS}, pass the field')
+        elif key is None:
+            field = None
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        expectation = _Expectation(future, field, key, predicate)
+        if since is not None and self._history is not None:
+            for _, event in self._history.since((event_type,), since):
+                try:
+                    matched = expectation.matches(event)
+                except Exception as e:
+                    future.set_exception(e)
+                    return future
+                if matched:
+                    future.set_result(event)
+                    return future
+        registry = self._expectations.get(event_type)
+        if registry is None:
+            registry = self._expectations[event_type] = ExpectRegistry()
+        registry.add(expectation)
+        timer = None
+        if timeout is not None:
+            def expire():
+                if not future.done():
+                    future.set_exception(asyncio.TimeoutError(f'no {event_type.__name__} event in {timeout}s'))
+            timer = loop.call_later(timeout, expire)
+        def done(_):
+            registry.discard(expectation)
+            if timer is not None:
+                timer.cancel()
+        future.add_done_callback(done)
+        return future
 
     @asynccontextmanager
     async def wait_for(self, event_type: t.Type[T]) -> t.AsyncGenerator[T, None]:
@@ -126,9 +1167,7 @@ class CDPBase(LoggerMixin):
         with block. The block will not exit until the indicated event is
         received.
         '''
-        async for event in self.listen(event_type, buffer_size=2):
-            yield event
-            return
+        yield await self.expect(event_type)
 
     @contextmanager
     def safe_wait_for(self, event_type: t.Type[T]) -> t.Generator[t.Awaitable[T], None]:
@@ -139,39 +1178,51 @@ class CDPBase(LoggerMixin):
         Use this context manager to register an event listener before performing the action which will
         trigger the event like a page navigation, it avoids the race conditions of wait_for().
         """
-        aevent = asyncio.create_task(self._async_wait_for(event_type))
+        aevent = self.expect(event_type)
         try:
             yield aevent
         finally:
             if not aevent.done():
                 aevent.cancel()
 
-    async def _async_wait_for(self, event_type: t.Type[T]) -> T:
-        async for event in self.listen(event_type, buffer_size=2):
-            return event
-
-    def close_listeners(self):
-        for listener in itertools.chain.from_iterable(self._listeners.values()):
-            listener.close()
+    def close_listeners(self, exc: t.Optional[Exception] = None):
+        '''
+        Close the event listeners and fail the futures returned by :meth:`expect` with
+        ``exc``, defaults to :class:`CDPEventListenerClosed`.
+        '''
+        refs = list(itertools.chain(
+            itertools.chain.from_iterable(self._listeners.values()),
+            itertools.chain.from_iterable(self._raw_listeners.values())
+        ))
         self._listeners.clear()
+        self._raw_listeners.clear()
+        for ref in refs:
+            listener = ref()
+            if listener is not None:
+                listener.close()
+        for registry in self._expectations.values():
+            registry.fail(exc if exc is not None else CDPEventListenerClosed())
+        self._expectations.clear()
 
-    def _handle_data(self, data):
+    def _handle_data(self, data, size: int = 0):
         '''
         Handle incoming WebSocket data.
 
         :param dict data: a JSON dictionary
+        :param size: the length of the message
         '''
         if 'id' in data:
-            self._handle_cmd_response(data)
+            self._handle_cmd_response(data, size)
         else:
-            self._handle_event(data)
+            self._handle_event(data, size)
 
-    def _handle_cmd_response(self, data):
+    def _handle_cmd_response(self, data, size: int = 0):
         '''
         Handle a response to a command. This will set an event flag that will
         return control to the task that called the command.
 
         :param dict data: response as a JSON dictionary
+        :param size: the length of the message
         '''
         cmd_id = data['id']
         try:
@@ -183,6 +1234,14 @@ class CDPBase(LoggerMixin):
             # If the server reported an error, convert it to an exception and do
             # not process the response any further.
             event.set_exception(CDPBrowserError(data['error']))
+        elif cmd is None:
+            # the command was executed with raw=True
+            event.set_result(data['result'])
+        elif isinstance(cmd, cdp.util.Command):
+            try:
+                event.set_result(cmd.parse_result(data['result']))
+            except Exception as e:
+                event.set_exception(e)
         else:
             # Otherwise, continue the generator to parse the JSON result
             # into a CDP object.
@@ -191,26 +1250,222 @@ class CDPBase(LoggerMixin):
                 event.set_exception(CDPInternalError("the command's generator function did not exit when expected!"))
             except StopIteration as e:
                 event.set_result(e.value)
+        if self._hook_methods:
+            method = self._hook_methods.pop(cmd_id, None)
+            # the hooks may have been removed since the command was sent
+            if method is not None and self._hooks is not None:
+                self._hooks.on_response(method, self._session_id, cmd_id, size, time.monotonic())
 
-    def _handle_event(self, data):
+    def _handle_event(self, data, size: int = 0):
         '''
         Handle an event.
 
         :param dict data: event as a JSON dictionary
+        :param size: the length of the message
         '''
-        event = cdp.util.parse_json_event(data)
+        method = data['method']
+        if self._cache is not None:
+            self._cache.event(method)
+        raw_listeners = self._raw_listeners.get(method)
+        if raw_listeners:
+            self._dispatch_event(raw_listeners, method, data['params'])
+        # events nobody listens to are not parsed
+        event_type = cdp.util.event_type(method)
+        listeners = self._listeners.get(event_type)
+        expectations = self._expectations.get(event_type)
+        history = self._history
+        if history is not None and event_type not in history:
+            history = None
+        if not listeners and not expectations and history is None:
+            return
+        if event_type is cdp.util.UnknownEvent:
+            event = cdp.util.UnknownEvent.from_json(data)
+        else:
+            event = event_type.from_json(data['params'])
+        if self._interner is not None:
+            event = self._interner.intern(event)
+        if self._hooks is not None:
+            self._hooks.on_event(method, self._session_id, size, time.monotonic())
+        if history is not None:
+            history.record(event_type, event, asyncio.get_running_loop().time(), size)
         self._logger.debug('dispatching event %s', event)
-        to_remove = set()
-        for listener in self._listeners[type(event)]:
-            try:
-                listener.put(event)
-            except asyncio.QueueFull:
-                self._logger.warning('event %s dropped because listener %s queue is full', type(event), listener)
-            except CDPEventListenerClosed:
-                to_remove.add(listener)
-        self._listeners[type(event)] -= to_remove
+        if expectations:
+            expectations.dispatch(event)
+        if listeners:
+            self._dispatch_event(listeners, method, event)
         self._logger.debug('event dispatched')
 
+    def _dispatch_event(self, listeners: _Listeners, method: str, event: t.Any):
+        for ref in listeners:
+            listener = ref()
+            if listener is not None and not listener.put(event):
+                self._logger.warning('event %s dropped because listener %s queue is full', method, listener)
+
+
+class TargetRegistry:
+    '''
+    In-memory view of the browser targets, indexed by target id, type, browser context
+    and opener. It's updated from target discovery events, so lookups don't need a
+    ``Target.getTargets`` round trip. Get one from :meth:`CDPConnection.discover_targets`.
+    '''
+    def __init__(self):
+        self._targets: t.Dict[cdp.target.TargetID, cdp.target.TargetInfo] = {}
+        self._by_type: t.Dict[str, t.Dict[cdp.target.TargetID, cdp.target.TargetInfo]] = defaultdict(dict)
+        self._by_context: t.Dict[cdp.browser.BrowserContextID, t.Dict[cdp.target.TargetID, cdp.target.TargetInfo]] = defaultdict(dict)
+        self._by_opener: t.Dict[cdp.target.TargetID, t.Dict[cdp.target.TargetID, cdp.target.TargetInfo]] = defaultdict(dict)
+        self._waiters: t.List[t.Tuple[t.Callable[[cdp.target.TargetInfo], bool], asyncio.Future]] = []
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __iter__(self) -> t.Iterator[cdp.target.TargetInfo]:
+        return iter(list(self._targets.values()))
+
+    def __contains__(self, target_id: object) -> bool:
+        return target_id in self._targets
+
+    def get(self, target_id: cdp.target.TargetID) -> t.Optional[cdp.target.TargetInfo]:
+        return self._targets.get(target_id)
+
+    def of_type(self, type_: str) -> t.List[cdp.target.TargetInfo]:
+        '''Return the targets of the given type, e.g. ``page`` or ``service_worker``.'''
+        return list(self._by_type.get(type_, {}).values())
+
+    def in_context(self, browser_context_id: cdp.browser.BrowserContextID) -> t.List[cdp.target.TargetInfo]:
+        return list(self._by_context.get(browser_context_id, {}).values())
+
+    def opened_by(self, opener_id: cdp.target.TargetID) -> t.List[cdp.target.TargetInfo]:
+        return list(self._by_opener.get(opener_id, {}).values())
+
+    def wait_for(
+        self,
+        predicate: t.Optional[t.Callable[[cdp.target.TargetInfo], bool]] = None,
+        *,
+        type_: t.Optional[str] = None,
+        opener_id: t.Optional[cdp.target.TargetID] = None,
+        browser_context_id: t.Optional[cdp.browser.BrowserContextID] = None,
+        include_existing: bool = False
+    ) -> 'asyncio.Future[cdp.target.TargetInfo]':
+        '''
+        Return a future for the next target that is created, or changes, to match all the
+        given criteria, e.g. ``wait_for(type_='page', opener_id=tab)`` for the next popup
+        opened by ``tab``.
+
+        The waiter is registered right away, so call this before the action that opens the
+        target and await the future afterwards. Existing targets are only matched when
+        ``include_existing`` is true. Cancel the future to stop waiting.
+        '''
+        def matches(info: cdp.target.TargetInfo) -> bool:
+            return (
+                (type_ is None or info.type_ == type_) and
+                (opener_id is None or info.opener_id == opener_id) and
+                (browser_context_id is None or info.browser_context_id == browser_context_id) and
+                (predicate is None or predicate(info))
+            )
+        waiter = asyncio.get_running_loop().create_future()
+        if include_existing:
+            for info in self._targets.values():
+                if matches(info):
+                    waiter.set_result(info)
+                    return waiter
+        self._waiters.append((matches, waiter))
+        waiter.add_done_callback(self._discard_waiter)
+        return waiter
+
+    def _discard_waiter(self, waiter: asyncio.Future):
+        if waiter.cancelled():
+            self._waiters = [(matches, other) for matches, other in self._waiters if other is not waiter]
+
+    def _update(self, info: cdp.target.TargetInfo):
+        old_info = self._targets.get(info.target_id)
+        if old_info is not None:
+            self._unindex(old_info)
+        self._targets[info.target_id] = info
+        self._by_type[info.type_][info.target_id] = info
+        if info.browser_context_id is not None:
+            self._by_context[info.browser_context_id][info.target_id] = info
+        if info.opener_id is not None:
+            self._by_opener[info.opener_id][info.target_id] = info
+        if self._waiters:
+            self._notify_waiters(info)
+
+    def _remove(self, target_id: cdp.target.TargetID):
+        info = self._targets.pop(target_id, None)
+        if info is not None:
+            self._unindex(info)
+
+    def _unindex(self, info: cdp.target.TargetInfo):
+        indexes: t.Tuple[t.Tuple[t.Dict[t.Any, t.Dict[cdp.target.TargetID, cdp.target.TargetInfo]], t.Any], ...] = (
+            (self._by_type, info.type_),
+            (self._by_context, info.browser_context_id),
+            (self._by_opener, info.opener_id)
+        )
+        for index, key in indexes:
+            if key is None:
+                continue
+            targets = index.get(key)
+            if targets is not None:
+                targets.pop(info.target_id, None)
+                if not targets:
+                    del index[key]
+
+    def _notify_waiters(self, info: cdp.target.TargetInfo):
+        pending = []
+        for matches, waiter in self._waiters:
+            if waiter.done():
+                continue
+            try:
+                matched = matches(info)
+            except Exception as e:
+                waiter.set_exception(e)
+                continue
+            if matched:
+                waiter.set_result(info)
+            else:
+                pending.append((matches, waiter))
+        self._waiters = pending
+
+    def _clear(self):
+        self._targets.clear()
+        self._by_type.clear()
+        self._by_context.clear()
+        self._by_opener.clear()
+
+    def _close(self):
+        for _, waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(CDPConnectionClosed('connection closed'))
+        self._waiters.clear()
+
+
+class DiscoveryCache:
+    '''
+    Remembers the browser websocket URL found at each debugging endpoint for ``ttl``
+    seconds, so new connections to the same browser skip the ``/json/version`` request.
+    '''
+    def __init__(self, ttl: float = 30.0):
+        self._ttl = ttl
+        self._entries: t.Dict[str, t.Tuple[float, str]] = {}
+
+    def get(self, endpoint: str) -> t.Optional[str]:
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return None
+        expires_at, wsurl = entry
+        if asyncio.get_running_loop().time() >= expires_at:
+            del self._entries[endpoint]
+            return None
+        return wsurl
+
+    def put(self, endpoint: str, wsurl: str):
+        self._entries[endpoint] = (asyncio.get_running_loop().time() + self._ttl, wsurl)
+
+    def invalidate(self, endpoint: str):
+        self._entries.pop(endpoint, None)
+
+    def clear(self):
+        self._entries.clear()
+
 
 class CDPConnection(CDPBase, SingleTaskWorker):
     '''
@@ -224,14 +1479,35 @@ class CDPConnection(CDPBase, SingleTaskWorker):
 
     You should generally call the :func:`open_cdp()` instead of
     instantiating this class directly.
+
+    With an ``interner`` the events parsed by the connection and its sessions, and the
+    target infos of its registry, share one instance of each repeated id and string,
+    see :class:`pycdp.cdp.util.Interner`. With a ``scheduler`` the commands of the
+    connection and its sessions are sent by priority, see :class:`SendScheduler`.
     '''
-    def __init__(self, debugging_url: str, http_client: ClientSession):
+    def __init__(
+        self,
+        debugging_url: str,
+        http_client: ClientSession,
+        *,
+        owns_http_client: bool = True,
+        discovery_cache: t.Optional[DiscoveryCache] = None,
+        interner: t.Optional[cdp.util.Interner] = None,
+        scheduler: t.Optional[SendScheduler] = None
+    ):
         super().__init__()
+        self._interner = interner
+        self._scheduler = scheduler
         self._debugging_url = debugging_url.rstrip('/')
         self._http_client = http_client
+        self._owns_http_client = owns_http_client
+        self._discovery_cache = discovery_cache
         self._wsurl: str = None
         self._ws_context = None
         self._sessions: t.Dict[str, CDPSession] = {}
+        self._target_sessions: t.Dict[str, t.Set[str]] = defaultdict(set)
+        self._targets: t.Optional[TargetRegistry] = None
+        self._session_limiter: t.Optional[t.Callable[[], AdaptiveLimiter]] = None
 
     @property
     def closed(self) -> bool:
@@ -247,48 +1523,239 @@ class CDPConnection(CDPBase, SingleTaskWorker):
     )
     async def connect(self):
         if self._ws is not None: raise RuntimeError('already connected')
-        if self._wsurl is None:
-            if self._debugging_url.startswith('http://'):
-                async with self._http_client.get(f'{self._debugging_url}/json/version') as resp:
-                    if resp.status != 200:
-                        raise ClientResponseError(
-                            resp.request_info,
-                            resp.history,
-                            status=resp.status,
-                            message=resp.reason,
-                            headers=resp.headers
-                        )
-                    self._wsurl = (await resp.json())['webSocketDebuggerUrl']
-            elif self._debugging_url.startswith('ws://'):
-                self._wsurl = self._debugging_url
-            else:
-                raise ValueError('bad debugging URL scheme')
-        self._ws = await self._http_client.ws_connect(self._wsurl, compress=15, autoping=True, autoclose=True).__aenter__()
+        await self._connect()
+
+    async def _connect(self):
+        discovered = await self._resolve_wsurl()
+        try:
+            self._ws = await self._ws_connect()
+        except WSServerHandshakeError:
+            if discovered:
+                raise
+            # the cached websocket URL is stale, e.g. the browser was restarted
+            self._logger.debug('cached websocket URL %s was rejected, discovering it again', self._wsurl)
+            self._wsurl = None
+            if self._discovery_cache is not None:
+                self._discovery_cache.invalidate(self._debugging_url)
+            await self._resolve_wsurl()
+            self._ws = await self._ws_connect()
+
+    async def _ws_connect(self) -> ClientWebSocketResponse:
+        return await self._http_client.ws_connect(self._wsurl, compress=15, autoping=True, autoclose=True).__aenter__()
+
+    async def _resolve_wsurl(self) -> bool:
+        '''Find the browser websocket URL, returns whether it was discovered right now.'''
+        if self._wsurl is not None:
+            return False
+        if self._discovery_cache is not None:
+            self._wsurl = self._discovery_cache.get(self._debugging_url)
+            if self._wsurl is not None:
+                return False
+        if self._debugging_url.startswith('http://'):
+            async with self._http_client.get(f'{self._debugging_url}/json/version') as resp:
+                if resp.status != 200:
+                    raise ClientResponseError(
+                        resp.request_info,
+                        resp.history,
+                        status=resp.status,
+                        message=resp.reason,
+                        headers=resp.headers
+                    )
+                self._wsurl = (await resp.json())['webSocketDebuggerUrl']
+            if self._discovery_cache is not None:
+                self._discovery_cache.put(self._debugging_url, self._wsurl)
+        elif self._debugging_url.startswith('ws://'):
+            self._wsurl = self._debugging_url
+        else:
+            raise ValueError('bad debugging URL scheme')
+        return True
 
     def add_session(self, session_id: str, target_id: str) -> CDPSession:
-        if session_id is self._sessions:
+        if session_id in self._sessions:
             return self._sessions[session_id]
-        session = CDPSession(self._ws, session_id, target_id)
+        session = self._create_session(session_id, target_id)
         self._sessions[session_id] = session
+        self._target_sessions[target_id].add(session_id)
+        return session
+
+    def _create_session(self, session_id: str, target_id: str) -> CDPSession:
+        session = CDPSession(self._ws, session_id, target_id)
+        session._interner = self._interner
+        session._scheduler = self._scheduler
+        session._hooks = self._hooks
+        self._limit_session(session)
         return session
 
-    def remove_session(self, session_id: str):
+    @property
+    def hooks(self) -> t.Optional[ProtocolHooks]:
+        '''
+        The hooks called when the connection and its sessions send a command, receive a
+        message, parse an event, handle a response and fail a command, see
+        :class:`pycdp.tracing.ProtocolHooks`. ``None`` by default, which costs nothing.
+        '''
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, hooks: t.Optional[ProtocolHooks]):
+        self._hooks = hooks
+        for session in self._sessions.values():
+            session._hooks = hooks
+
+    def limit_concurrency(
+        self,
+        browser: t.Optional[AdaptiveLimiter] = None,
+        session: t.Optional[t.Callable[[], AdaptiveLimiter]] = None
+    ):
+        '''
+        Limit the commands in flight with limiters that adapt to their latency, see
+        :class:`AdaptiveLimiter`. ``browser`` limits the commands of the connection and
+        of all of its sessions together, ``session`` makes the limiter of each session::
+
+            conn.limit_concurrency(AdaptiveLimiter(100), lambda: AdaptiveLimiter(10))
+
+        The limits and queues are exposed by the :attr:`limiter` of the connection and
+        of each session. Pass nothing to stop limiting.
+        '''
+        self._limiter = browser
+        self._session_limiter = session
+        self._limiters = (browser,) if browser is not None else ()
+        for existing in self._sessions.values():
+            self._limit_session(existing)
+
+    def _limit_session(self, session: CDPSession):
+        session._limiter = self._session_limiter() if self._session_limiter is not None else None
+        session._limiters = tuple(limiter for limiter in (session._limiter, self._limiter) if limiter is not None)
+
+    @property
+    def scheduler(self) -> t.Optional[SendScheduler]:
+        return self._scheduler
+
+    @property
+    def interner(self) -> t.Optional[cdp.util.Interner]:
+        return self._interner
+
+    def remove_session(self, session_id: str, exc: t.Optional[Exception] = None):
         if session_id in self._sessions:
-            self._sessions.pop(session_id).close()
+            session = self._sessions.pop(session_id)
+            target_sessions = self._target_sessions.get(session.target_id)
+            if target_sessions is not None:
+                target_sessions.discard(session_id)
+                if not target_sessions:
+                    del self._target_sessions[session.target_id]
+            session.close(exc)
 
     async def connect_session(self, target_id: cdp.target.TargetID) -> 'CDPSession':
         '''
         Returns a new :class:`CDPSession` connected to the specified target.
         '''
         session_id = await self.execute(cdp.target.attach_to_target(target_id, True))
-        session = CDPSession(self._ws, session_id, target_id)
-        self._sessions[session_id] = session
-        return session
+        return self.add_session(session_id, target_id)
+
+    async def broadcast(
+        self,
+        command: t.Union[cdp.util.Command[t.Any, T], t.Callable[[CDPSession], cdp.util.Command[t.Any, T]]],
+        sessions: t.Optional[t.Iterable[CDPSession]] = None,
+        *,
+        concurrency: int = 100,
+        raw: bool = False
+    ) -> t.Tuple[t.Dict[CDPSession, T], t.Dict[CDPSession, Exception]]:
+        '''
+        Execute a command on many sessions, by default all of the sessions of this
+        connection, and return the results and the errors of the sessions::
+
+            results, errors = await conn.broadcast(cdp.network.set_extra_http_headers(headers))
+
+        ``command`` is either a command shared by every session, whose params are then
+        serialized once, or a function that returns the command of a session. The
+        commands are sent without waiting for the previous responses, at most
+        ``concurrency`` at once, so a fleet of sessions is set up in about one round
+        trip.
+        '''
+        if sessions is None:
+            sessions = list(self._sessions.values())
+        if isinstance(command, cdp.util.Command):
+            # a template without holes holds the serialized request
+            shared = command.template()()
+            factory = lambda session: shared
+        else:
+            factory = command
+        semaphore = asyncio.Semaphore(concurrency)
+        results: t.Dict[CDPSession, T] = {}
+        errors: t.Dict[CDPSession, Exception] = {}
+        async def execute(session: CDPSession):
+            async with semaphore:
+                try:
+                    if raw:
+                        results[session] = await session.execute(factory(session), raw=True)
+                    else:
+                        results[session] = await session.execute(factory(session))
+                except Exception as e:
+                    errors[session] = e
+        await asyncio.gather(*(execute(session) for session in sessions))
+        return results, errors
+
+    @property
+    def targets(self) -> t.Optional[TargetRegistry]:
+        '''The live target registry, ``None`` until :meth:`discover_targets` is called.'''
+        return self._targets
+
+    async def discover_targets(self) -> TargetRegistry:
+        '''
+        Enable target discovery and return a :class:`TargetRegistry` that is kept up to
+        date by the ``Target.targetCreated``, ``Target.targetInfoChanged`` and
+        ``Target.targetDestroyed`` events.
+        '''
+        if self._targets is None:
+            # set first, the existing targets are announced before the response
+            targets = self._targets = TargetRegistry()
+            try:
+                await self.execute(cdp.target.set_discover_targets(True))
+            except BaseException:
+                if self._targets is targets:
+                    self._targets = None
+                    targets._close()
+                raise
+        return self._targets
+
+    def _handle_event(self, data, size: int = 0):
+        method = data['method']
+        if method.startswith('Target.'):
+            self._handle_target_event(method, data['params'])
+            # target events are sent to the browser session but are about every target
+            for session in self._sessions.values():
+                if session._cache is not None:
+                    session._cache.event(method)
+        super()._handle_event(data, size)
+
+    def _handle_target_event(self, method: str, params: dict):
+        # sessions are reaped before the event is parsed and dispatched, so their
+        # pending callers fail right away even if nobody listens to target events
+        if method == 'Target.detachedFromTarget':
+            self.remove_session(params['sessionId'], CDPSessionClosed('detached from target'))
+        elif method == 'Target.targetDestroyed':
+            self._remove_target_sessions(params['targetId'], 'target destroyed')
+            if self._targets is not None:
+                self._targets._remove(params['targetId'])
+        elif method == 'Target.targetCrashed':
+            self._remove_target_sessions(params['targetId'], 'target crashed')
+        elif method == 'Target.targetCreated' or method == 'Target.targetInfoChanged':
+            if self._targets is not None:
+                info = cdp.target.TargetInfo.from_json(params['targetInfo'])
+                if self._interner is not None:
+                    info = self._interner.intern(info)
+                self._targets._update(info)
+
+    def _remove_target_sessions(self, target_id: str, reason: str):
+        for session_id in list(self._target_sessions.get(target_id, ())):
+            self.remove_session(session_id, CDPSessionClosed(reason))
 
     async def _run(self):
         while True:
             message = await self._ws.receive()
             if message.type == WSMsgType.TEXT:
+                hooks = self._hooks
+                if hooks is not None:
+                    received = time.monotonic()
                 try:
                     data = json.loads(message.data)
                 except json.JSONDecodeError:
@@ -297,16 +1764,21 @@ class CDPConnection(CDPBase, SingleTaskWorker):
                         'message': 'Client received invalid JSON',
                         'data': message
                     })
+                if hooks is not None:
+                    hooks.on_receive(data.get('method'), data.get('sessionId'), len(message.data), received)
                 if 'sessionId' in data:
+                    if data.get('method') == 'Target.detachedFromTarget':
+                        # with flattened auto-attach, child sessions are detached on their parent session
+                        self._handle_target_event(data['method'], data['params'])
                     session_id = cdp.target.SessionID(data['sessionId'])
                     try:
                         session = self._sessions[session_id]
                     except KeyError:
                         self._logger.debug(f'received message for unknown session: {data}')
                         continue
-                    session._handle_data(data)
+                    session._handle_data(data, len(message.data))
                 else:
-                    self._handle_data(data)
+                    self._handle_data(data, len(message.data))
             elif message.type == WSMsgType.CLOSE or message.type == WSMsgType.CLOSING or message.type == WSMsgType.CLOSED:
                 return
             elif message.type == WSMsgType.ERROR:
@@ -318,14 +1790,20 @@ class CDPConnection(CDPBase, SingleTaskWorker):
     async def _close(self):
         try:
             await super()._close()
+            if self._scheduler is not None:
+                self._scheduler.fail(CDPConnectionClosed('connection closed'))
             for session in self._sessions.values():
                 session.close()
             self._sessions.clear()
+            self._target_sessions.clear()
+            if self._targets is not None:
+                self._targets._close()
             self.close_listeners()
             if self._ws is not None and not self._ws.closed:
                 await self._ws.close()
         finally:
-            await self._http_client.close()
+            if self._owns_http_client:
+                await self._http_client.close()
 
 
 class CDPSession(CDPBase, ContextLoggerMixin):
@@ -337,12 +1815,12 @@ class CDPSession(CDPBase, ContextLoggerMixin):
     '''
     def __init__(self, ws: ClientWebSocketResponse, session_id: cdp.target.SessionID, target_id: cdp.target.TargetID):
         super().__init__(ws, session_id, target_id)
-        self._dom_enable_count = 0
-        self._dom_enable_lock = asyncio.Lock()
-        self._page_enable_count = 0
-        self._page_enable_lock = asyncio.Lock()
         self.set_logger_context(extra_name=session_id)
 
+    @property
+    def closed(self) -> bool:
+        return self._close_reason is not None
+
     @asynccontextmanager
     async def dom_enable(self):
         '''
@@ -352,17 +1830,8 @@ class CDPSession(CDPBase, ContextLoggerMixin):
         This keeps track of concurrent callers and only disables DOM events when
         all callers have exited.
         '''
-        async with self._dom_enable_lock:
-            self._dom_enable_count += 1
-            if self._dom_enable_count == 1:
-                await self.execute(cdp.dom.enable())
-
-        yield
-
-        async with self._dom_enable_lock:
-            self._dom_enable_count -= 1
-            if self._dom_enable_count == 0:
-                await self.execute(cdp.dom.disable())
+        async with self.enable(cdp.dom.enable()):
+            yield
 
     @asynccontextmanager
     async def page_enable(self):
@@ -373,43 +1842,485 @@ class CDPSession(CDPBase, ContextLoggerMixin):
         This keeps track of concurrent callers and only disables page events
         when all callers have exited.
         '''
-        async with self._page_enable_lock:
-            self._page_enable_count += 1
-            if self._page_enable_count == 1:
-                await self.execute(cdp.page.enable())
+        async with self.enable(cdp.page.enable()):
+            yield
 
-        yield
+    def close(self, exc: t.Optional[Exception] = None):
+        '''
+        Close this session, failing its in-flight commands with ``exc`` (defaults to
+        :class:`CDPSessionClosed`) and closing its event listeners.
+        '''
+        if exc is None:
+            exc = CDPSessionClosed()
+        if self._close_reason is None:
+            self._close_reason = exc
+        if len(self._inflight_cmd) > 0:
+            self._fail_inflight(exc)
+        if self._cache is not None:
+            self._cache.invalidate()
+        self.close_listeners(exc)
 
-        async with self._page_enable_lock:
-            self._page_enable_count -= 1
-            if self._page_enable_count == 0:
-                await self.execute(cdp.page.disable())
 
-    def close(self):
-        if len(self._inflight_cmd) > 0:
-            exc = CDPSessionClosed()
-            for (_, event) in self._inflight_cmd.values():
-                if not event.done():
-                    event.set_exception(exc)
-            self._inflight_cmd.clear()
-        self.close_listeners()
+class ResilientCDPConnection(CDPConnection):
+    '''
+    A connection that survives websocket disconnections.
+
+    When the websocket drops, in-flight commands fail with :class:`CDPConnectionClosed`
+    and the connection reconnects with exponential backoff. Then each session is attached
+    again to its target, if the target is still alive, and the setup commands it executed
+    before are replayed in order: domain enables, ``Emulation`` overrides, scripts added
+    with ``Page.addScriptToEvaluateOnNewDocument``, bindings, extra HTTP headers and so
+    on. Session objects and their listeners are kept, and commands executed while the
+    connection is restoring wait for it to finish. Sessions of targets that are gone,
+    or that fail to be restored, are closed. Once ``max_reconnect_attempts`` are
+    exhausted, commands fail with :class:`CDPConnectionClosed`.
+    '''
+    def __init__(
+        self,
+        debugging_url: str,
+        http_client: ClientSession,
+        *,
+        reconnect_delay: float = 0.5,
+        reconnect_delay_growth: float = 2.0,
+        max_reconnect_delay: float = 30.0,
+        max_reconnect_attempts: t.Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(debugging_url, http_client, **kwargs)
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_delay_growth = reconnect_delay_growth
+        self._max_reconnect_delay = max_reconnect_delay
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._online = asyncio.Event()
+        self._online.set()
+        self._setup = {}
+        self._reconnect_count = 0
+        self._lost: t.Optional[Exception] = None
+
+    @property
+    def reconnect_count(self) -> int:
+        return self._reconnect_count
+
+    def _create_session(self, session_id: str, target_id: str) -> CDPSession:
+        session = super()._create_session(session_id, target_id)
+        session._online = self._online
+        session._setup = {}
+        return session
+
+    async def _run(self):
+        while True:
+            try:
+                await super()._run()
+                self._logger.warning('websocket closed by the browser (code %s)', self._ws.close_code)
+            except (ClientError, WebSocketError, CDPConnectionClosed, ConnectionResetError) as e:
+                self._logger.warning('websocket failed: %r', e)
+            try:
+                await self._reconnect()
+            except (ClientError, asyncio.TimeoutError) as e:
+                self._give_up(e)
+                # release the callers waiting for the connection to be restored
+                self._online.set()
+                raise
+            self._create_subtask(self._restore())
+
+    async def _reconnect(self):
+        self._online.clear()
+        exc = CDPConnectionClosed('connection lost')
+        if self._scheduler is not None:
+            self._scheduler.fail(exc)
+        self._fail_inflight(exc)
+        for session in self._sessions.values():
+            session._fail_inflight(exc)
+            # invalidating events may be lost while the connection is down
+            if session._cache is not None:
+                session._cache.invalidate()
+        if self._cache is not None:
+            self._cache.invalidate()
+        if not self._ws.closed:
+            await self._ws.close()
+        delay = self._reconnect_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await self._connect()
+                break
+            except (ClientError, asyncio.TimeoutError) as e:
+                if self._max_reconnect_attempts is not None and attempt >= self._max_reconnect_attempts:
+                    raise
+                self._logger.warning('reconnection attempt %d failed: %r, retrying in %.1fs', attempt, e, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * self._reconnect_delay_growth, self._max_reconnect_delay)
+        self._reconnect_count += 1
+        self._logger.info('reconnected to %s', self._wsurl)
+
+    def _give_up(self, exc: Exception):
+        '''Fail the connection and its sessions for good, reconnection attempts are exhausted.'''
+        self._logger.error('giving up reconnecting to %s: %r', self._wsurl, exc)
+        self._lost = exc
+        for session_id in list(self._sessions):
+            self.remove_session(session_id, CDPConnectionClosed('connection lost'))
+
+    async def _execute(self, cmd: t.Generator[dict, t.Any, T], raw: bool=False) -> T:
+        if self._lost is not None:
+            raise CDPConnectionClosed('connection lost') from self._lost
+        return await super()._execute(cmd, raw)
+
+    async def _restore(self):
+        '''Attach the sessions again and replay their setup while commands are held.'''
+        try:
+            for session in self._sessions.values():
+                session._ws = self._ws
+            await self._replay_setup()
+            if self._targets is not None:
+                self._targets._clear()
+                await self._execute(cdp.target.set_discover_targets(True))
+            targets = await self._execute(cdp.target.get_targets())
+            alive = {info.target_id for info in targets}
+            for session in list(self._sessions.values()):
+                if session.target_id not in alive:
+                    self.remove_session(session.session_id, CDPSessionClosed('target is gone'))
+                    continue
+                try:
+                    await self._restore_session(session)
+                except (CDPBrowserError, CDPSessionClosed) as e:
+                    # e.g. the target died since it was listed, or a setup command is rejected now
+                    self._logger.warning('failed to restore session %s: %r', session.session_id, e)
+                    self.remove_session(session.session_id, e)
+        except CDPConnectionClosed:
+            # the connection dropped again, the next reconnection restores it
+            return
+        except CDPBrowserError as e:
+            self._logger.error('failed to restore the connection: %r', e)
+        finally:
+            # never leave the callers waiting, unless another reconnection is under way
+            if self._ws is not None and not self._ws.closed:
+                self._online.set()
+
+    async def _restore_session(self, session: CDPSession):
+        session_id = await self._execute(cdp.target.attach_to_target(session.target_id, True))
+        self._rekey_session(session, session_id)
+        await session._replay_setup()
+
+    def _rekey_session(self, session: CDPSession, session_id: cdp.target.SessionID):
+        del self._sessions[session.session_id]
+        target_sessions = self._target_sessions[session.target_id]
+        target_sessions.discard(session.session_id)
+        target_sessions.add(session_id)
+        session._session_id = session_id
+        session.set_logger_context(extra_name=session_id)
+        self._sessions[session_id] = session
+
+    async def _close(self):
+        # release the callers waiting for the connection to be restored
+        self._online.set()
+        await super()._close()
+
+
+class CDPSessionWatchdog(SingleTaskWorker):
+    '''
+    Keeps the target of a session healthy, replacing it when it hangs, crashes or bloats.
+
+    Every ``probe_interval`` seconds the watchdog sends a cheap ``Runtime.evaluate('1')``
+    to the target and, when memory thresholds are set, samples ``Runtime.getHeapUsage``
+    and ``Memory.getDOMCounters``. It also tracks the ``Inspector.targetCrashed``,
+    ``Inspector.detached``, ``Target.targetCrashed`` and ``Target.detachedFromTarget``
+    events. When the target crosses a threshold or goes away, its in-flight commands fail
+    with :class:`CDPTargetRecycled`, the target is closed and a new target is created in
+    the same browser context.
+
+    The current session is available at :attr:`session`, pass ``on_recycle`` to restore
+    the state of the replacement session (e.g. enabling domains) before it's used.
+    '''
+    def __init__(
+        self,
+        conn: CDPConnection,
+        session: CDPSession,
+        *,
+        probe_interval: float = 5.0,
+        probe_timeout: float = 10.0,
+        max_latency: t.Optional[float] = None,
+        max_heap_size: t.Optional[float] = None,
+        max_dom_nodes: t.Optional[int] = None,
+        url: str = 'about:blank',
+        on_recycle: t.Optional[t.Callable[[CDPSession, CDPSession], t.Awaitable[None]]] = None
+    ):
+        super().__init__()
+        self._conn = conn
+        self._session = session
+        self._probe_interval = probe_interval
+        self._probe_timeout = probe_timeout
+        self._max_latency = max_latency
+        self._max_heap_size = max_heap_size
+        self._max_dom_nodes = max_dom_nodes
+        self._url = url
+        self._on_recycle = on_recycle
+        self._browser_context_id: t.Optional[cdp.browser.BrowserContextID] = None
+        self._unhealthy: t.Optional[asyncio.Future] = None
+        self._recycle_count = 0
+        self._latency: t.Optional[float] = None
+        self._heap_size: t.Optional[float] = None
+        self._dom_nodes: t.Optional[int] = None
+
+    @property
+    def session(self) -> CDPSession:
+        '''The session of the current target.'''
+        return self._session
+
+    @property
+    def recycle_count(self) -> int:
+        return self._recycle_count
+
+    @property
+    def latency(self) -> t.Optional[float]:
+        '''Round trip time of the last probe in seconds.'''
+        return self._latency
+
+    @property
+    def heap_size(self) -> t.Optional[float]:
+        '''Used JS heap size in bytes as of the last sample.'''
+        return self._heap_size
+
+    @property
+    def dom_nodes(self) -> t.Optional[int]:
+        '''DOM node count as of the last sample.'''
+        return self._dom_nodes
+
+    async def _run(self):
+        while True:
+            reason = await self._watch(self._session)
+            old_session = self._session
+            while True:
+                try:
+                    await self._recycle(reason)
+                    break
+                except CDPBrowserError as e:
+                    self._logger.error(
+                        'could not recycle target %s, retrying in %.1fs: %s',
+                        self._session.target_id, self._probe_interval, e
+                    )
+                    await asyncio.sleep(self._probe_interval)
+            if self._on_recycle is not None:
+                # a failing callback doesn't make the new target unhealthy
+                try:
+                    await self._on_recycle(old_session, self._session)
+                except Exception:
+                    self._logger.exception('on_recycle failed for target %s', self._session.target_id)
+
+    async def _watch(self, session: CDPSession) -> str:
+        '''Watch the session until its target becomes unhealthy and return the reason.'''
+        self._unhealthy = asyncio.get_running_loop().create_future()
+        watchers = [
+            self._create_subtask(self._watch_session_events(session)),
+            self._create_subtask(self._watch_target_events(session))
+        ]
+        try:
+            if self._browser_context_id is None:
+                info = await self._conn.execute(cdp.target.get_target_info(session.target_id))
+                self._browser_context_id = info.browser_context_id
+            try:
+                await asyncio.wait_for(session.execute(cdp.inspector.enable()), self._probe_timeout)
+            except asyncio.TimeoutError:
+                return f'no response to Inspector.enable after {self._probe_timeout:.1f}s'
+            while True:
+                try:
+                    return await asyncio.wait_for(asyncio.shield(self._unhealthy), self._probe_interval)
+                except asyncio.TimeoutError:
+                    pass
+                reason = await self._probe(session)
+                if reason is not None:
+                    return reason
+        except CDPSessionClosed:
+            if self._unhealthy.done():
+                return self._unhealthy.result()
+            return 'session was closed'
+        except CDPBrowserError as e:
+            # e.g. the target is already gone
+            return f'target is unreachable: {e}'
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+
+    async def _probe(self, session: CDPSession) -> t.Optional[str]:
+        '''Check the target responsiveness and memory usage, returns why it's unhealthy if so.'''
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await asyncio.wait_for(session.execute(cdp.runtime.evaluate('1')), self._probe_timeout)
+        except asyncio.TimeoutError:
+            return f'no response to probe after {self._probe_timeout:.1f}s'
+        self._latency = loop.time() - start
+        if self._max_latency is not None and self._latency > self._max_latency:
+            return f'probe latency of {self._latency:.3f}s exceeds {self._max_latency:.3f}s'
+        try:
+            if self._max_heap_size is not None:
+                heap_size, *_ = await asyncio.wait_for(
+                    session.execute(cdp.runtime.get_heap_usage()),
+                    self._probe_timeout
+                )
+                self._heap_size = heap_size
+                if heap_size > self._max_heap_size:
+                    return f'heap size of {heap_size:.0f} bytes exceeds {self._max_heap_size:.0f} bytes'
+            if self._max_dom_nodes is not None:
+                _, dom_nodes, _ = await asyncio.wait_for(
+                    session.execute(cdp.memory.get_dom_counters()),
+                    self._probe_timeout
+                )
+                self._dom_nodes = dom_nodes
+                if dom_nodes > self._max_dom_nodes:
+                    return f'DOM node count of {dom_nodes} exceeds {self._max_dom_nodes}'
+        except asyncio.TimeoutError:
+            return f'no response to memory sampling after {self._probe_timeout:.1f}s'
+        except CDPBrowserError as e:
+            self._logger.warning('could not sample memory usage of target %s: %s', session.target_id, e)
+        return None
+
+    async def _watch_session_events(self, session: CDPSession):
+        async for event in session.listen(cdp.inspector.TargetCrashed, cdp.inspector.Detached):
+            if isinstance(event, cdp.inspector.TargetCrashed):
+                self._set_unhealthy('target crashed')
+            elif isinstance(event, cdp.inspector.Detached):
+                self._set_unhealthy(f'detached from target: {event.reason}')
+            return
+
+    async def _watch_target_events(self, session: CDPSession):
+        async for event in self._conn.listen(cdp.target.TargetCrashed, cdp.target.DetachedFromTarget):
+            if isinstance(event, cdp.target.TargetCrashed):
+                if event.target_id == session.target_id:
+                    self._set_unhealthy(f'target crashed with status {event.status}')
+                    return
+            elif isinstance(event, cdp.target.DetachedFromTarget) and event.session_id == session.session_id:
+                self._set_unhealthy('detached from target')
+                return
+
+    def _set_unhealthy(self, reason: str):
+        if self._unhealthy is not None and not self._unhealthy.done():
+            self._unhealthy.set_result(reason)
+
+    async def _recycle(self, reason: str):
+        old_session = self._session
+        self._logger.warning('recycling target %s: %s', old_session.target_id, reason)
+        exc = CDPTargetRecycled(reason)
+        self._conn.remove_session(old_session.session_id, exc)
+        try:
+            await self._conn.execute(cdp.target.close_target(old_session.target_id))
+        except CDPBrowserError:
+            # the target is already gone
+            pass
+        target_id = await self._conn.execute(
+            cdp.target.create_target(self._url, browser_context_id=self._browser_context_id)
+        )
+        try:
+            self._session = await self._conn.connect_session(target_id)
+        except CDPBrowserError:
+            # don't leave the new target behind when recycling is retried
+            try:
+                await self._conn.execute(cdp.target.close_target(target_id))
+            except CDPBrowserError:
+                pass
+            raise
+        self._recycle_count += 1
+
+
+class CDPConnectionFactory(Closable):
+    '''
+    Opens connections that share a single HTTP client and a :class:`DiscoveryCache`, so
+    opening many connections doesn't repeat connector setup and browser discovery.
+
+    The HTTP client is owned by the factory: connections don't close it, the factory
+    does when it's closed. By default the client has no limit on simultaneous
+    connections, since every CDP connection holds one of them for its whole lifetime.
+    '''
+    def __init__(
+        self,
+        http_client: t.Optional[ClientSession] = None,
+        *,
+        discovery_ttl: float = 30.0
+    ):
+        super().__init__()
+        self._http_client = http_client
+        self._discovery_cache = DiscoveryCache(discovery_ttl)
+
+    @property
+    def discovery_cache(self) -> DiscoveryCache:
+        return self._discovery_cache
+
+    @retry_on(ClientConnectionError, ServerDisconnectedError, retries=10, delay=3.0, delay_growth=1.3, log_errors=True, loop=loop)
+    async def connect(
+        self,
+        url: str,
+        discover_targets: bool = False,
+        reconnect: bool = False,
+        intern: bool = False,
+        schedule: bool = False
+    ) -> CDPConnection:
+        '''
+        Connect to the browser specified by debugging ``url``, see :func:`connect_cdp`.
+        '''
+        if not self.is_open:
+            raise RuntimeError(f'{type(self).__name__} is closed')
+        if self._http_client is None:
+            self._http_client = ClientSession(connector=TCPConnector(limit=0))
+        cdp_conn = (ResilientCDPConnection if reconnect else CDPConnection)(
+            url,
+            self._http_client,
+            owns_http_client=False,
+            discovery_cache=self._discovery_cache,
+            interner=cdp.util.Interner() if intern else None,
+            scheduler=SendScheduler() if schedule else None
+        )
+        try:
+            await cdp_conn.connect()
+            cdp_conn.start()
+            if discover_targets:
+                await cdp_conn.discover_targets()
+        except:
+            if cdp_conn.is_open:
+                await cdp_conn.close()
+            raise
+        return cdp_conn
+
+    async def _close(self):
+        await super()._close()
+        self._discovery_cache.clear()
+        if self._http_client is not None:
+            await self._http_client.close()
 
 
 @retry_on(ClientConnectionError, ServerDisconnectedError, retries=10, delay=3.0, delay_growth=1.3, log_errors=True, loop=loop)
-async def connect_cdp(url: str) -> CDPConnection:
+async def connect_cdp(
+    url: str,
+    discover_targets: bool = False,
+    reconnect: bool = False,
+    intern: bool = False,
+    schedule: bool = False
+) -> CDPConnection:
     '''
-    Connect to the browser specified by debugging ``url``.
+    Connect to the browser specified by debugging ``url``. If ``discover_targets`` is true
+    the connection keeps a live target registry at :attr:`CDPConnection.targets`. If
+    ``reconnect`` is true a :class:`ResilientCDPConnection` is returned. If ``intern`` is
+    true the events it parses share repeated ids and strings, and if ``schedule`` is true
+    its commands are sent by priority, see :class:`CDPConnection`.
 
     This connection is not automatically closed! You can either use the connection
     object as a context manager (``async with conn:``) or else call ``await
     conn.aclose()`` on it when you are done with it.
     '''
     http = ClientSession()
-    cdp_conn = CDPConnection(url, http)
+    cdp_conn = (ResilientCDPConnection if reconnect else CDPConnection)(
+        url, http,
+        interner=cdp.util.Interner() if intern else None,
+        scheduler=SendScheduler() if schedule else None
+    )
     try:
         await cdp_conn.connect()
         cdp_conn.start()
+        if discover_targets:
+            await cdp_conn.discover_targets()
     except:
-        await http.close()
+        if cdp_conn.is_open:
+            await cdp_conn.close()
+        else:
+            await http.close()
         raise
     return cdp_conn
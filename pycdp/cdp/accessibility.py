@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+    from . import runtime
+else:
+    dom = lazy_import('dom', globals())
+    page = lazy_import('page', globals())
+    runtime = lazy_import('runtime', globals())
 
 
 class AXNodeId(str):
@@ -58,7 +62,10 @@ class AXValueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AXValueSourceType(enum.Enum):
@@ -77,7 +84,10 @@ class AXValueSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AXValueNativeSourceType(enum.Enum):
@@ -100,7 +110,10 @@ class AXValueNativeSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueNativeSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -137,7 +150,7 @@ class AXValueSource:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         if self.value is not None:
             json['value'] = self.value.to_json()
         if self.attribute is not None:
@@ -147,7 +160,7 @@ class AXValueSource:
         if self.superseded is not None:
             json['superseded'] = self.superseded
         if self.native_source is not None:
-            json['nativeSource'] = self.native_source.to_json()
+            json['nativeSource'] = self.native_source.value
         if self.native_source_value is not None:
             json['nativeSourceValue'] = self.native_source_value.to_json()
         if self.invalid is not None:
@@ -157,17 +170,17 @@ class AXValueSource:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AXValueSource:
+    def from_json(cls, json: AXValueSourceJSON) -> AXValueSource:
         return cls(
             type_=AXValueSourceType.from_json(json['type']),
-            value=AXValue.from_json(json['value']) if json.get('value', None) is not None else None,
-            attribute=str(json['attribute']) if json.get('attribute', None) is not None else None,
-            attribute_value=AXValue.from_json(json['attributeValue']) if json.get('attributeValue', None) is not None else None,
-            superseded=bool(json['superseded']) if json.get('superseded', None) is not None else None,
-            native_source=AXValueNativeSourceType.from_json(json['nativeSource']) if json.get('nativeSource', None) is not None else None,
-            native_source_value=AXValue.from_json(json['nativeSourceValue']) if json.get('nativeSourceValue', None) is not None else None,
-            invalid=bool(json['invalid']) if json.get('invalid', None) is not None else None,
-            invalid_reason=str(json['invalidReason']) if json.get('invalidReason', None) is not None else None,
+            value=AXValue.from_json(_value) if (_value := json.get('value')) is not None else None,
+            attribute=json.get('attribute'),
+            attribute_value=AXValue.from_json(_attribute_value) if (_attribute_value := json.get('attributeValue')) is not None else None,
+            superseded=json.get('superseded'),
+            native_source=AXValueNativeSourceType.from_json(_native_source) if (_native_source := json.get('nativeSource')) is not None else None,
+            native_source_value=AXValue.from_json(_native_source_value) if (_native_source_value := json.get('nativeSourceValue')) is not None else None,
+            invalid=json.get('invalid'),
+            invalid_reason=json.get('invalidReason'),
         )
 
 
@@ -184,7 +197,7 @@ class AXRelatedNode:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['backendDOMNodeId'] = self.backend_dom_node_id.to_json()
+        json['backendDOMNodeId'] = self.backend_dom_node_id
         if self.idref is not None:
             json['idref'] = self.idref
         if self.text is not None:
@@ -192,11 +205,11 @@ class AXRelatedNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AXRelatedNode:
+    def from_json(cls, json: AXRelatedNodeJSON) -> AXRelatedNode:
         return cls(
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']),
-            idref=str(json['idref']) if json.get('idref', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
+            backend_dom_node_id=dom.BackendNodeId(json['backendDOMNodeId']),
+            idref=json.get('idref'),
+            text=json.get('text'),
         )
 
 
@@ -210,12 +223,12 @@ class AXProperty:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['name'] = self.name.to_json()
+        json['name'] = self.name.value
         json['value'] = self.value.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AXProperty:
+    def from_json(cls, json: AXPropertyJSON) -> AXProperty:
         return cls(
             name=AXPropertyName.from_json(json['name']),
             value=AXValue.from_json(json['value']),
@@ -241,7 +254,7 @@ class AXValue:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         if self.value is not None:
             json['value'] = self.value
         if self.related_nodes is not None:
@@ -251,12 +264,12 @@ class AXValue:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AXValue:
+    def from_json(cls, json: AXValueJSON) -> AXValue:
         return cls(
             type_=AXValueType.from_json(json['type']),
-            value=json['value'] if json.get('value', None) is not None else None,
-            related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if json.get('relatedNodes', None) is not None else None,
-            sources=[AXValueSource.from_json(i) for i in json['sources']] if json.get('sources', None) is not None else None,
+            value=json.get('value'),
+            related_nodes=[AXRelatedNode.from_json(i) for i in _related_nodes] if (_related_nodes := json.get('relatedNodes')) is not None else None,
+            sources=[AXValueSource.from_json(i) for i in _sources] if (_sources := json.get('sources')) is not None else None,
         )
 
 
@@ -316,7 +329,10 @@ class AXPropertyName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXPropertyName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -365,7 +381,7 @@ class AXNode:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         json['ignored'] = self.ignored
         if self.ignored_reasons is not None:
             json['ignoredReasons'] = [i.to_json() for i in self.ignored_reasons]
@@ -382,53 +398,51 @@ class AXNode:
         if self.properties is not None:
             json['properties'] = [i.to_json() for i in self.properties]
         if self.parent_id is not None:
-            json['parentId'] = self.parent_id.to_json()
+            json['parentId'] = self.parent_id
         if self.child_ids is not None:
-            json['childIds'] = [i.to_json() for i in self.child_ids]
+            json['childIds'] = list(self.child_ids)
         if self.backend_dom_node_id is not None:
-            json['backendDOMNodeId'] = self.backend_dom_node_id.to_json()
+            json['backendDOMNodeId'] = self.backend_dom_node_id
         if self.frame_id is not None:
-            json['frameId'] = self.frame_id.to_json()
+            json['frameId'] = self.frame_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AXNode:
+    def from_json(cls, json: AXNodeJSON) -> AXNode:
         return cls(
-            node_id=AXNodeId.from_json(json['nodeId']),
-            ignored=bool(json['ignored']),
-            ignored_reasons=[AXProperty.from_json(i) for i in json['ignoredReasons']] if json.get('ignoredReasons', None) is not None else None,
-            role=AXValue.from_json(json['role']) if json.get('role', None) is not None else None,
-            chrome_role=AXValue.from_json(json['chromeRole']) if json.get('chromeRole', None) is not None else None,
-            name=AXValue.from_json(json['name']) if json.get('name', None) is not None else None,
-            description=AXValue.from_json(json['description']) if json.get('description', None) is not None else None,
-            value=AXValue.from_json(json['value']) if json.get('value', None) is not None else None,
-            properties=[AXProperty.from_json(i) for i in json['properties']] if json.get('properties', None) is not None else None,
-            parent_id=AXNodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            child_ids=[AXNodeId.from_json(i) for i in json['childIds']] if json.get('childIds', None) is not None else None,
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']) if json.get('backendDOMNodeId', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
+            node_id=AXNodeId(json['nodeId']),
+            ignored=json['ignored'],
+            ignored_reasons=[AXProperty.from_json(i) for i in _ignored_reasons] if (_ignored_reasons := json.get('ignoredReasons')) is not None else None,
+            role=AXValue.from_json(_role) if (_role := json.get('role')) is not None else None,
+            chrome_role=AXValue.from_json(_chrome_role) if (_chrome_role := json.get('chromeRole')) is not None else None,
+            name=AXValue.from_json(_name) if (_name := json.get('name')) is not None else None,
+            description=AXValue.from_json(_description) if (_description := json.get('description')) is not None else None,
+            value=AXValue.from_json(_value) if (_value := json.get('value')) is not None else None,
+            properties=[AXProperty.from_json(i) for i in _properties] if (_properties := json.get('properties')) is not None else None,
+            parent_id=AXNodeId(_parent_id) if (_parent_id := json.get('parentId')) is not None else None,
+            child_ids=[AXNodeId(i) for i in _child_ids] if (_child_ids := json.get('childIds')) is not None else None,
+            backend_dom_node_id=dom.BackendNodeId(_backend_dom_node_id) if (_backend_dom_node_id := json.get('backendDOMNodeId')) is not None else None,
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None,
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables the accessibility domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.disable',
-    }
-    json = yield cmd_dict
+    return Command('Accessibility.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables the accessibility domain which causes ``AXNodeId``'s to remain consistent between method calls.
     This turns on accessibility for the page, which can impact performance until accessibility is disabled.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.enable',
-    }
-    json = yield cmd_dict
+    return Command('Accessibility.enable')
+
+
+def _parse_get_partial_ax_tree(json: GetPartialAXTreeReturnsJSON) -> typing.List[AXNode]:
+    return [AXNode.from_json(i) for i in json['nodes']]
 
 
 def get_partial_ax_tree(
@@ -436,7 +450,7 @@ def get_partial_ax_tree(
         backend_node_id: typing.Optional[dom.BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None,
         fetch_relatives: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+    ) -> Command[GetPartialAXTreeReturnsJSON, typing.List[AXNode]]:
     '''
     Fetches the accessibility node and partial accessibility tree for this DOM node, if it exists.
 
@@ -450,25 +464,24 @@ def get_partial_ax_tree(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if fetch_relatives is not None:
         params['fetchRelatives'] = fetch_relatives
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.getPartialAXTree',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Accessibility.getPartialAXTree', params, _parse_get_partial_ax_tree)
+
+
+def _parse_get_full_ax_tree(json: GetFullAXTreeReturnsJSON) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
 def get_full_ax_tree(
         depth: typing.Optional[int] = None,
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+    ) -> Command[GetFullAXTreeReturnsJSON, typing.List[AXNode]]:
     '''
     Fetches the entire accessibility tree for the root Document
 
@@ -482,18 +495,17 @@ def get_full_ax_tree(
     if depth is not None:
         params['depth'] = depth
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.getFullAXTree',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+        params['frameId'] = frame_id
+    return Command('Accessibility.getFullAXTree', params, _parse_get_full_ax_tree)
+
+
+def _parse_get_root_ax_node(json: GetRootAXNodeReturnsJSON) -> AXNode:
+    return AXNode.from_json(json['node'])
 
 
 def get_root_ax_node(
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,AXNode]:
+    ) -> Command[GetRootAXNodeReturnsJSON, AXNode]:
     '''
     Fetches the root node.
     Requires ``enable()`` to have been called previously.
@@ -505,20 +517,19 @@ def get_root_ax_node(
     '''
     params: T_JSON_DICT = dict()
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.getRootAXNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return AXNode.from_json(json['node'])
+        params['frameId'] = frame_id
+    return Command('Accessibility.getRootAXNode', params, _parse_get_root_ax_node)
+
+
+def _parse_get_ax_node_and_ancestors(json: GetAXNodeAndAncestorsReturnsJSON) -> typing.List[AXNode]:
+    return [AXNode.from_json(i) for i in json['nodes']]
 
 
 def get_ax_node_and_ancestors(
         node_id: typing.Optional[dom.NodeId] = None,
         backend_node_id: typing.Optional[dom.BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+    ) -> Command[GetAXNodeAndAncestorsReturnsJSON, typing.List[AXNode]]:
     '''
     Fetches a node and all ancestors up to and including the root.
     Requires ``enable()`` to have been called previously.
@@ -532,23 +543,22 @@ def get_ax_node_and_ancestors(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.getAXNodeAndAncestors',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['objectId'] = object_id
+    return Command('Accessibility.getAXNodeAndAncestors', params, _parse_get_ax_node_and_ancestors)
+
+
+def _parse_get_child_ax_nodes(json: GetChildAXNodesReturnsJSON) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
 def get_child_ax_nodes(
         id_: AXNodeId,
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+    ) -> Command[GetChildAXNodesReturnsJSON, typing.List[AXNode]]:
     '''
     Fetches a particular accessibility node by AXNodeId.
     Requires ``enable()`` to have been called previously.
@@ -560,14 +570,13 @@ def get_child_ax_nodes(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
+    params['id'] = id_
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.getChildAXNodes',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['frameId'] = frame_id
+    return Command('Accessibility.getChildAXNodes', params, _parse_get_child_ax_nodes)
+
+
+def _parse_query_ax_tree(json: QueryAXTreeReturnsJSON) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
@@ -577,7 +586,7 @@ def query_ax_tree(
         object_id: typing.Optional[runtime.RemoteObjectId] = None,
         accessible_name: typing.Optional[str] = None,
         role: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+    ) -> Command[QueryAXTreeReturnsJSON, typing.List[AXNode]]:
     '''
     Query a DOM node's accessibility subtree for accessible name and role.
     This command computes the name and role for all nodes in the subtree, including those that are
@@ -596,21 +605,16 @@ def query_ax_tree(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if accessible_name is not None:
         params['accessibleName'] = accessible_name
     if role is not None:
         params['role'] = role
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Accessibility.queryAXTree',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return Command('Accessibility.queryAXTree', params, _parse_query_ax_tree)
 
 
 @event_class('Accessibility.loadComplete')
@@ -626,7 +630,7 @@ class LoadComplete:
     root: AXNode
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadComplete:
+    def from_json(cls, json: LoadCompleteJSON) -> LoadComplete:
         return cls(
             root=AXNode.from_json(json['root'])
         )
@@ -644,7 +648,98 @@ class NodesUpdated:
     nodes: typing.List[AXNode]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodesUpdated:
+    def from_json(cls, json: NodesUpdatedJSON) -> NodesUpdated:
         return cls(
             nodes=[AXNode.from_json(i) for i in json['nodes']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class _AXValueSourceJSON(typing.TypedDict):
+        type: str
+
+
+    class AXValueSourceJSON(_AXValueSourceJSON, total=False):
+        value: AXValueJSON
+        attribute: str
+        attributeValue: AXValueJSON
+        superseded: bool
+        nativeSource: str
+        nativeSourceValue: AXValueJSON
+        invalid: bool
+        invalidReason: str
+
+
+    class _AXRelatedNodeJSON(typing.TypedDict):
+        backendDOMNodeId: int
+
+
+    class AXRelatedNodeJSON(_AXRelatedNodeJSON, total=False):
+        idref: str
+        text: str
+
+
+    class AXPropertyJSON(typing.TypedDict):
+        name: str
+        value: AXValueJSON
+
+
+    class _AXValueJSON(typing.TypedDict):
+        type: str
+
+
+    class AXValueJSON(_AXValueJSON, total=False):
+        value: typing.Any
+        relatedNodes: typing.List[AXRelatedNodeJSON]
+        sources: typing.List[AXValueSourceJSON]
+
+
+    class _AXNodeJSON(typing.TypedDict):
+        nodeId: str
+        ignored: bool
+
+
+    class AXNodeJSON(_AXNodeJSON, total=False):
+        ignoredReasons: typing.List[AXPropertyJSON]
+        role: AXValueJSON
+        chromeRole: AXValueJSON
+        name: AXValueJSON
+        description: AXValueJSON
+        value: AXValueJSON
+        properties: typing.List[AXPropertyJSON]
+        parentId: str
+        childIds: typing.List[str]
+        backendDOMNodeId: int
+        frameId: str
+
+
+    class GetPartialAXTreeReturnsJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
+
+
+    class GetFullAXTreeReturnsJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
+
+
+    class GetRootAXNodeReturnsJSON(typing.TypedDict):
+        node: AXNodeJSON
+
+
+    class GetAXNodeAndAncestorsReturnsJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
+
+
+    class GetChildAXNodesReturnsJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
+
+
+    class QueryAXTreeReturnsJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
+
+
+    class LoadCompleteJSON(typing.TypedDict):
+        root: AXNodeJSON
+
+
+    class NodesUpdatedJSON(typing.TypedDict):
+        nodes: typing.List[AXNodeJSON]
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import runtime
+else:
+    dom = lazy_import('dom', globals())
+    runtime = lazy_import('runtime', globals())
 
 
 @dataclass
@@ -76,19 +79,19 @@ class Animation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Animation:
+    def from_json(cls, json: AnimationJSON) -> Animation:
         return cls(
-            id_=str(json['id']),
-            name=str(json['name']),
-            paused_state=bool(json['pausedState']),
-            play_state=str(json['playState']),
+            id_=json['id'],
+            name=json['name'],
+            paused_state=json['pausedState'],
+            play_state=json['playState'],
             playback_rate=float(json['playbackRate']),
             start_time=float(json['startTime']),
             current_time=float(json['currentTime']),
-            type_=str(json['type']),
-            source=AnimationEffect.from_json(json['source']) if json.get('source', None) is not None else None,
-            css_id=str(json['cssId']) if json.get('cssId', None) is not None else None,
-            view_or_scroll_timeline=ViewOrScrollTimeline.from_json(json['viewOrScrollTimeline']) if json.get('viewOrScrollTimeline', None) is not None else None,
+            type_=json['type'],
+            source=AnimationEffect.from_json(_source) if (_source := json.get('source')) is not None else None,
+            css_id=json.get('cssId'),
+            view_or_scroll_timeline=ViewOrScrollTimeline.from_json(_view_or_scroll_timeline) if (_view_or_scroll_timeline := json.get('viewOrScrollTimeline')) is not None else None,
         )
 
 
@@ -118,25 +121,25 @@ class ViewOrScrollTimeline:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['axis'] = self.axis.to_json()
+        json['axis'] = self.axis.value
         if self.source_node_id is not None:
-            json['sourceNodeId'] = self.source_node_id.to_json()
+            json['sourceNodeId'] = self.source_node_id
         if self.start_offset is not None:
             json['startOffset'] = self.start_offset
         if self.end_offset is not None:
             json['endOffset'] = self.end_offset
         if self.subject_node_id is not None:
-            json['subjectNodeId'] = self.subject_node_id.to_json()
+            json['subjectNodeId'] = self.subject_node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ViewOrScrollTimeline:
+    def from_json(cls, json: ViewOrScrollTimelineJSON) -> ViewOrScrollTimeline:
         return cls(
             axis=dom.ScrollOrientation.from_json(json['axis']),
-            source_node_id=dom.BackendNodeId.from_json(json['sourceNodeId']) if json.get('sourceNodeId', None) is not None else None,
-            start_offset=float(json['startOffset']) if json.get('startOffset', None) is not None else None,
-            end_offset=float(json['endOffset']) if json.get('endOffset', None) is not None else None,
-            subject_node_id=dom.BackendNodeId.from_json(json['subjectNodeId']) if json.get('subjectNodeId', None) is not None else None,
+            source_node_id=dom.BackendNodeId(_source_node_id) if (_source_node_id := json.get('sourceNodeId')) is not None else None,
+            start_offset=float(_start_offset) if (_start_offset := json.get('startOffset')) is not None else None,
+            end_offset=float(_end_offset) if (_end_offset := json.get('endOffset')) is not None else None,
+            subject_node_id=dom.BackendNodeId(_subject_node_id) if (_subject_node_id := json.get('subjectNodeId')) is not None else None,
         )
 
 
@@ -189,24 +192,24 @@ class AnimationEffect:
         json['fill'] = self.fill
         json['easing'] = self.easing
         if self.backend_node_id is not None:
-            json['backendNodeId'] = self.backend_node_id.to_json()
+            json['backendNodeId'] = self.backend_node_id
         if self.keyframes_rule is not None:
             json['keyframesRule'] = self.keyframes_rule.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AnimationEffect:
+    def from_json(cls, json: AnimationEffectJSON) -> AnimationEffect:
         return cls(
             delay=float(json['delay']),
             end_delay=float(json['endDelay']),
             iteration_start=float(json['iterationStart']),
             iterations=float(json['iterations']),
             duration=float(json['duration']),
-            direction=str(json['direction']),
-            fill=str(json['fill']),
-            easing=str(json['easing']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            keyframes_rule=KeyframesRule.from_json(json['keyframesRule']) if json.get('keyframesRule', None) is not None else None,
+            direction=json['direction'],
+            fill=json['fill'],
+            easing=json['easing'],
+            backend_node_id=dom.BackendNodeId(_backend_node_id) if (_backend_node_id := json.get('backendNodeId')) is not None else None,
+            keyframes_rule=KeyframesRule.from_json(_keyframes_rule) if (_keyframes_rule := json.get('keyframesRule')) is not None else None,
         )
 
 
@@ -229,10 +232,10 @@ class KeyframesRule:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> KeyframesRule:
+    def from_json(cls, json: KeyframesRuleJSON) -> KeyframesRule:
         return cls(
             keyframes=[KeyframeStyle.from_json(i) for i in json['keyframes']],
-            name=str(json['name']) if json.get('name', None) is not None else None,
+            name=json.get('name'),
         )
 
 
@@ -254,36 +257,34 @@ class KeyframeStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> KeyframeStyle:
+    def from_json(cls, json: KeyframeStyleJSON) -> KeyframeStyle:
         return cls(
-            offset=str(json['offset']),
-            easing=str(json['easing']),
+            offset=json['offset'],
+            easing=json['easing'],
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables animation domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.disable',
-    }
-    json = yield cmd_dict
+    return Command('Animation.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables animation domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.enable',
-    }
-    json = yield cmd_dict
+    return Command('Animation.enable')
+
+
+def _parse_get_current_time(json: GetCurrentTimeReturnsJSON) -> float:
+    return float(json['currentTime'])
 
 
 def get_current_time(
         id_: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+    ) -> Command[GetCurrentTimeReturnsJSON, float]:
     '''
     Returns the current time of the an animation.
 
@@ -292,47 +293,42 @@ def get_current_time(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.getCurrentTime',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return float(json['currentTime'])
+    return Command('Animation.getCurrentTime', params, _parse_get_current_time)
+
+
+def _parse_get_playback_rate(json: GetPlaybackRateReturnsJSON) -> float:
+    return float(json['playbackRate'])
 
 
-def get_playback_rate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+def get_playback_rate() -> Command[GetPlaybackRateReturnsJSON, float]:
     '''
     Gets the playback rate of the document timeline.
 
     :returns: Playback rate for animations on page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.getPlaybackRate',
-    }
-    json = yield cmd_dict
-    return float(json['playbackRate'])
+    return Command('Animation.getPlaybackRate', None, _parse_get_playback_rate)
 
 
 def release_animations(
         animations: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Releases a set of animations to no longer be manipulated.
 
     :param animations: List of animation ids to seek.
     '''
     params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.releaseAnimations',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['animations'] = list(animations)
+    return Command('Animation.releaseAnimations', params)
+
+
+def _parse_resolve_animation(json: ResolveAnimationReturnsJSON) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['remoteObject'])
 
 
 def resolve_animation(
         animation_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
+    ) -> Command[ResolveAnimationReturnsJSON, runtime.RemoteObject]:
     '''
     Gets the remote object of the Animation.
 
@@ -341,18 +337,13 @@ def resolve_animation(
     '''
     params: T_JSON_DICT = dict()
     params['animationId'] = animation_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.resolveAnimation',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['remoteObject'])
+    return Command('Animation.resolveAnimation', params, _parse_resolve_animation)
 
 
 def seek_animations(
         animations: typing.List[str],
         current_time: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Seek a set of animations to a particular time within each animation.
 
@@ -360,19 +351,15 @@ def seek_animations(
     :param current_time: Set the current time of each animation.
     '''
     params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
+    params['animations'] = list(animations)
     params['currentTime'] = current_time
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.seekAnimations',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Animation.seekAnimations', params)
 
 
 def set_paused(
         animations: typing.List[str],
         paused: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets the paused state of a set of animations.
 
@@ -380,18 +367,14 @@ def set_paused(
     :param paused: Paused state to set to.
     '''
     params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
+    params['animations'] = list(animations)
     params['paused'] = paused
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.setPaused',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Animation.setPaused', params)
 
 
 def set_playback_rate(
         playback_rate: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets the playback rate of the document timeline.
 
@@ -399,18 +382,14 @@ def set_playback_rate(
     '''
     params: T_JSON_DICT = dict()
     params['playbackRate'] = playback_rate
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.setPlaybackRate',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Animation.setPlaybackRate', params)
 
 
 def set_timing(
         animation_id: str,
         duration: float,
         delay: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets the timing of an animation node.
 
@@ -422,11 +401,7 @@ def set_timing(
     params['animationId'] = animation_id
     params['duration'] = duration
     params['delay'] = delay
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Animation.setTiming',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Animation.setTiming', params)
 
 
 @event_class('Animation.animationCanceled')
@@ -439,9 +414,9 @@ class AnimationCanceled:
     id_: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AnimationCanceled:
+    def from_json(cls, json: AnimationCanceledJSON) -> AnimationCanceled:
         return cls(
-            id_=str(json['id'])
+            id_=json['id']
         )
 
 
@@ -455,9 +430,9 @@ class AnimationCreated:
     id_: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AnimationCreated:
+    def from_json(cls, json: AnimationCreatedJSON) -> AnimationCreated:
         return cls(
-            id_=str(json['id'])
+            id_=json['id']
         )
 
 
@@ -471,7 +446,7 @@ class AnimationStarted:
     animation: Animation
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AnimationStarted:
+    def from_json(cls, json: AnimationStartedJSON) -> AnimationStarted:
         return cls(
             animation=Animation.from_json(json['animation'])
         )
@@ -487,7 +462,93 @@ class AnimationUpdated:
     animation: Animation
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AnimationUpdated:
+    def from_json(cls, json: AnimationUpdatedJSON) -> AnimationUpdated:
         return cls(
             animation=Animation.from_json(json['animation'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _AnimationJSON(typing.TypedDict):
+        id: str
+        name: str
+        pausedState: bool
+        playState: str
+        playbackRate: float
+        startTime: float
+        currentTime: float
+        type: str
+
+
+    class AnimationJSON(_AnimationJSON, total=False):
+        source: AnimationEffectJSON
+        cssId: str
+        viewOrScrollTimeline: ViewOrScrollTimelineJSON
+
+
+    class _ViewOrScrollTimelineJSON(typing.TypedDict):
+        axis: str
+
+
+    class ViewOrScrollTimelineJSON(_ViewOrScrollTimelineJSON, total=False):
+        sourceNodeId: int
+        startOffset: float
+        endOffset: float
+        subjectNodeId: int
+
+
+    class _AnimationEffectJSON(typing.TypedDict):
+        delay: float
+        endDelay: float
+        iterationStart: float
+        iterations: float
+        duration: float
+        direction: str
+        fill: str
+        easing: str
+
+
+    class AnimationEffectJSON(_AnimationEffectJSON, total=False):
+        backendNodeId: int
+        keyframesRule: KeyframesRuleJSON
+
+
+    class _KeyframesRuleJSON(typing.TypedDict):
+        keyframes: typing.List[KeyframeStyleJSON]
+
+
+    class KeyframesRuleJSON(_KeyframesRuleJSON, total=False):
+        name: str
+
+
+    class KeyframeStyleJSON(typing.TypedDict):
+        offset: str
+        easing: str
+
+
+    class GetCurrentTimeReturnsJSON(typing.TypedDict):
+        currentTime: float
+
+
+    class GetPlaybackRateReturnsJSON(typing.TypedDict):
+        playbackRate: float
+
+
+    class ResolveAnimationReturnsJSON(typing.TypedDict):
+        remoteObject: runtime.RemoteObjectJSON
+
+
+    class AnimationCanceledJSON(typing.TypedDict):
+        id: str
+
+
+    class AnimationCreatedJSON(typing.TypedDict):
+        id: str
+
+
+    class AnimationStartedJSON(typing.TypedDict):
+        animation: AnimationJSON
+
+
+    class AnimationUpdatedJSON(typing.TypedDict):
+        animation: AnimationJSON
@@ -8,13 +8,18 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import network
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+    from . import runtime
+else:
+    dom = lazy_import('dom', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
+    runtime = lazy_import('runtime', globals())
 
 
 @dataclass
@@ -37,11 +42,11 @@ class AffectedCookie:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AffectedCookie:
+    def from_json(cls, json: AffectedCookieJSON) -> AffectedCookie:
         return cls(
-            name=str(json['name']),
-            path=str(json['path']),
-            domain=str(json['domain']),
+            name=json['name'],
+            path=json['path'],
+            domain=json['domain'],
         )
 
 
@@ -59,14 +64,14 @@ class AffectedRequest:
         json: T_JSON_DICT = dict()
         json['url'] = self.url
         if self.request_id is not None:
-            json['requestId'] = self.request_id.to_json()
+            json['requestId'] = self.request_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AffectedRequest:
+    def from_json(cls, json: AffectedRequestJSON) -> AffectedRequest:
         return cls(
-            url=str(json['url']),
-            request_id=network.RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
+            url=json['url'],
+            request_id=network.RequestId(_request_id) if (_request_id := json.get('requestId')) is not None else None,
         )
 
 
@@ -79,13 +84,13 @@ class AffectedFrame:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['frameId'] = self.frame_id.to_json()
+        json['frameId'] = self.frame_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AffectedFrame:
+    def from_json(cls, json: AffectedFrameJSON) -> AffectedFrame:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
         )
 
 
@@ -107,7 +112,10 @@ class CookieExclusionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExclusionReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieWarningReason(enum.Enum):
@@ -131,7 +139,10 @@ class CookieWarningReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieWarningReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieOperation(enum.Enum):
@@ -143,7 +154,10 @@ class CookieOperation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieOperation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class InsightType(enum.Enum):
@@ -159,7 +173,10 @@ class InsightType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InsightType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -174,16 +191,16 @@ class CookieIssueInsight:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         if self.table_entry_url is not None:
             json['tableEntryUrl'] = self.table_entry_url
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CookieIssueInsight:
+    def from_json(cls, json: CookieIssueInsightJSON) -> CookieIssueInsight:
         return cls(
             type_=InsightType.from_json(json['type']),
-            table_entry_url=str(json['tableEntryUrl']) if json.get('tableEntryUrl', None) is not None else None,
+            table_entry_url=json.get('tableEntryUrl'),
         )
 
 
@@ -221,9 +238,9 @@ class CookieIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['cookieWarningReasons'] = [i.to_json() for i in self.cookie_warning_reasons]
-        json['cookieExclusionReasons'] = [i.to_json() for i in self.cookie_exclusion_reasons]
-        json['operation'] = self.operation.to_json()
+        json['cookieWarningReasons'] = [i.value for i in self.cookie_warning_reasons]
+        json['cookieExclusionReasons'] = [i.value for i in self.cookie_exclusion_reasons]
+        json['operation'] = self.operation.value
         if self.cookie is not None:
             json['cookie'] = self.cookie.to_json()
         if self.raw_cookie_line is not None:
@@ -239,17 +256,17 @@ class CookieIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CookieIssueDetails:
+    def from_json(cls, json: CookieIssueDetailsJSON) -> CookieIssueDetails:
         return cls(
             cookie_warning_reasons=[CookieWarningReason.from_json(i) for i in json['cookieWarningReasons']],
             cookie_exclusion_reasons=[CookieExclusionReason.from_json(i) for i in json['cookieExclusionReasons']],
             operation=CookieOperation.from_json(json['operation']),
-            cookie=AffectedCookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
-            raw_cookie_line=str(json['rawCookieLine']) if json.get('rawCookieLine', None) is not None else None,
-            site_for_cookies=str(json['siteForCookies']) if json.get('siteForCookies', None) is not None else None,
-            cookie_url=str(json['cookieUrl']) if json.get('cookieUrl', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
-            insight=CookieIssueInsight.from_json(json['insight']) if json.get('insight', None) is not None else None,
+            cookie=AffectedCookie.from_json(_cookie) if (_cookie := json.get('cookie')) is not None else None,
+            raw_cookie_line=json.get('rawCookieLine'),
+            site_for_cookies=json.get('siteForCookies'),
+            cookie_url=json.get('cookieUrl'),
+            request=AffectedRequest.from_json(_request) if (_request := json.get('request')) is not None else None,
+            insight=CookieIssueInsight.from_json(_insight) if (_insight := json.get('insight')) is not None else None,
         )
 
 
@@ -263,7 +280,10 @@ class MixedContentResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResolutionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class MixedContentResourceType(enum.Enum):
@@ -302,7 +322,10 @@ class MixedContentResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -331,11 +354,11 @@ class MixedContentIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['resolutionStatus'] = self.resolution_status.to_json()
+        json['resolutionStatus'] = self.resolution_status.value
         json['insecureURL'] = self.insecure_url
         json['mainResourceURL'] = self.main_resource_url
         if self.resource_type is not None:
-            json['resourceType'] = self.resource_type.to_json()
+            json['resourceType'] = self.resource_type.value
         if self.request is not None:
             json['request'] = self.request.to_json()
         if self.frame is not None:
@@ -343,14 +366,14 @@ class MixedContentIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> MixedContentIssueDetails:
+    def from_json(cls, json: MixedContentIssueDetailsJSON) -> MixedContentIssueDetails:
         return cls(
             resolution_status=MixedContentResolutionStatus.from_json(json['resolutionStatus']),
-            insecure_url=str(json['insecureURL']),
-            main_resource_url=str(json['mainResourceURL']),
-            resource_type=MixedContentResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
-            frame=AffectedFrame.from_json(json['frame']) if json.get('frame', None) is not None else None,
+            insecure_url=json['insecureURL'],
+            main_resource_url=json['mainResourceURL'],
+            resource_type=MixedContentResourceType.from_json(_resource_type) if (_resource_type := json.get('resourceType')) is not None else None,
+            request=AffectedRequest.from_json(_request) if (_request := json.get('request')) is not None else None,
+            frame=AffectedFrame.from_json(_frame) if (_frame := json.get('frame')) is not None else None,
         )
 
 
@@ -373,7 +396,10 @@ class BlockedByResponseReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedByResponseReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -394,7 +420,7 @@ class BlockedByResponseIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['request'] = self.request.to_json()
-        json['reason'] = self.reason.to_json()
+        json['reason'] = self.reason.value
         if self.parent_frame is not None:
             json['parentFrame'] = self.parent_frame.to_json()
         if self.blocked_frame is not None:
@@ -402,12 +428,12 @@ class BlockedByResponseIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BlockedByResponseIssueDetails:
+    def from_json(cls, json: BlockedByResponseIssueDetailsJSON) -> BlockedByResponseIssueDetails:
         return cls(
             request=AffectedRequest.from_json(json['request']),
             reason=BlockedByResponseReason.from_json(json['reason']),
-            parent_frame=AffectedFrame.from_json(json['parentFrame']) if json.get('parentFrame', None) is not None else None,
-            blocked_frame=AffectedFrame.from_json(json['blockedFrame']) if json.get('blockedFrame', None) is not None else None,
+            parent_frame=AffectedFrame.from_json(_parent_frame) if (_parent_frame := json.get('parentFrame')) is not None else None,
+            blocked_frame=AffectedFrame.from_json(_blocked_frame) if (_blocked_frame := json.get('blockedFrame')) is not None else None,
         )
 
 
@@ -420,7 +446,10 @@ class HeavyAdResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdResolutionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class HeavyAdReason(enum.Enum):
@@ -433,7 +462,10 @@ class HeavyAdReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -449,13 +481,13 @@ class HeavyAdIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['resolution'] = self.resolution.to_json()
-        json['reason'] = self.reason.to_json()
+        json['resolution'] = self.resolution.value
+        json['reason'] = self.reason.value
         json['frame'] = self.frame.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> HeavyAdIssueDetails:
+    def from_json(cls, json: HeavyAdIssueDetailsJSON) -> HeavyAdIssueDetails:
         return cls(
             resolution=HeavyAdResolutionStatus.from_json(json['resolution']),
             reason=HeavyAdReason.from_json(json['reason']),
@@ -477,7 +509,10 @@ class ContentSecurityPolicyViolationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicyViolationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -496,16 +531,16 @@ class SourceCodeLocation:
         json['lineNumber'] = self.line_number
         json['columnNumber'] = self.column_number
         if self.script_id is not None:
-            json['scriptId'] = self.script_id.to_json()
+            json['scriptId'] = self.script_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SourceCodeLocation:
+    def from_json(cls, json: SourceCodeLocationJSON) -> SourceCodeLocation:
         return cls(
-            url=str(json['url']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            script_id=runtime.ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
+            url=json['url'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
+            script_id=runtime.ScriptId(_script_id) if (_script_id := json.get('scriptId')) is not None else None,
         )
 
 
@@ -531,7 +566,7 @@ class ContentSecurityPolicyIssueDetails:
         json: T_JSON_DICT = dict()
         json['violatedDirective'] = self.violated_directive
         json['isReportOnly'] = self.is_report_only
-        json['contentSecurityPolicyViolationType'] = self.content_security_policy_violation_type.to_json()
+        json['contentSecurityPolicyViolationType'] = self.content_security_policy_violation_type.value
         if self.blocked_url is not None:
             json['blockedURL'] = self.blocked_url
         if self.frame_ancestor is not None:
@@ -539,19 +574,19 @@ class ContentSecurityPolicyIssueDetails:
         if self.source_code_location is not None:
             json['sourceCodeLocation'] = self.source_code_location.to_json()
         if self.violating_node_id is not None:
-            json['violatingNodeId'] = self.violating_node_id.to_json()
+            json['violatingNodeId'] = self.violating_node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyIssueDetails:
+    def from_json(cls, json: ContentSecurityPolicyIssueDetailsJSON) -> ContentSecurityPolicyIssueDetails:
         return cls(
-            violated_directive=str(json['violatedDirective']),
-            is_report_only=bool(json['isReportOnly']),
+            violated_directive=json['violatedDirective'],
+            is_report_only=json['isReportOnly'],
             content_security_policy_violation_type=ContentSecurityPolicyViolationType.from_json(json['contentSecurityPolicyViolationType']),
-            blocked_url=str(json['blockedURL']) if json.get('blockedURL', None) is not None else None,
-            frame_ancestor=AffectedFrame.from_json(json['frameAncestor']) if json.get('frameAncestor', None) is not None else None,
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']) if json.get('sourceCodeLocation', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
+            blocked_url=json.get('blockedURL'),
+            frame_ancestor=AffectedFrame.from_json(_frame_ancestor) if (_frame_ancestor := json.get('frameAncestor')) is not None else None,
+            source_code_location=SourceCodeLocation.from_json(_source_code_location) if (_source_code_location := json.get('sourceCodeLocation')) is not None else None,
+            violating_node_id=dom.BackendNodeId(_violating_node_id) if (_violating_node_id := json.get('violatingNodeId')) is not None else None,
         )
 
 
@@ -564,7 +599,10 @@ class SharedArrayBufferIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedArrayBufferIssueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -583,14 +621,14 @@ class SharedArrayBufferIssueDetails:
         json: T_JSON_DICT = dict()
         json['sourceCodeLocation'] = self.source_code_location.to_json()
         json['isWarning'] = self.is_warning
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedArrayBufferIssueDetails:
+    def from_json(cls, json: SharedArrayBufferIssueDetailsJSON) -> SharedArrayBufferIssueDetails:
         return cls(
             source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            is_warning=bool(json['isWarning']),
+            is_warning=json['isWarning'],
             type_=SharedArrayBufferIssueType.from_json(json['type']),
         )
 
@@ -613,7 +651,7 @@ class LowTextContrastIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['violatingNodeId'] = self.violating_node_id.to_json()
+        json['violatingNodeId'] = self.violating_node_id
         json['violatingNodeSelector'] = self.violating_node_selector
         json['contrastRatio'] = self.contrast_ratio
         json['thresholdAA'] = self.threshold_aa
@@ -623,15 +661,15 @@ class LowTextContrastIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LowTextContrastIssueDetails:
+    def from_json(cls, json: LowTextContrastIssueDetailsJSON) -> LowTextContrastIssueDetails:
         return cls(
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']),
-            violating_node_selector=str(json['violatingNodeSelector']),
+            violating_node_id=dom.BackendNodeId(json['violatingNodeId']),
+            violating_node_selector=json['violatingNodeSelector'],
             contrast_ratio=float(json['contrastRatio']),
             threshold_aa=float(json['thresholdAA']),
             threshold_aaa=float(json['thresholdAAA']),
-            font_size=str(json['fontSize']),
-            font_weight=str(json['fontWeight']),
+            font_size=json['fontSize'],
+            font_weight=json['fontWeight'],
         )
 
 
@@ -665,21 +703,21 @@ class CorsIssueDetails:
         if self.initiator_origin is not None:
             json['initiatorOrigin'] = self.initiator_origin
         if self.resource_ip_address_space is not None:
-            json['resourceIPAddressSpace'] = self.resource_ip_address_space.to_json()
+            json['resourceIPAddressSpace'] = self.resource_ip_address_space.value
         if self.client_security_state is not None:
             json['clientSecurityState'] = self.client_security_state.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CorsIssueDetails:
+    def from_json(cls, json: CorsIssueDetailsJSON) -> CorsIssueDetails:
         return cls(
             cors_error_status=network.CorsErrorStatus.from_json(json['corsErrorStatus']),
-            is_warning=bool(json['isWarning']),
+            is_warning=json['isWarning'],
             request=AffectedRequest.from_json(json['request']),
-            location=SourceCodeLocation.from_json(json['location']) if json.get('location', None) is not None else None,
-            initiator_origin=str(json['initiatorOrigin']) if json.get('initiatorOrigin', None) is not None else None,
-            resource_ip_address_space=network.IPAddressSpace.from_json(json['resourceIPAddressSpace']) if json.get('resourceIPAddressSpace', None) is not None else None,
-            client_security_state=network.ClientSecurityState.from_json(json['clientSecurityState']) if json.get('clientSecurityState', None) is not None else None,
+            location=SourceCodeLocation.from_json(_location) if (_location := json.get('location')) is not None else None,
+            initiator_origin=json.get('initiatorOrigin'),
+            resource_ip_address_space=network.IPAddressSpace.from_json(_resource_ip_address_space) if (_resource_ip_address_space := json.get('resourceIPAddressSpace')) is not None else None,
+            client_security_state=network.ClientSecurityState.from_json(_client_security_state) if (_client_security_state := json.get('clientSecurityState')) is not None else None,
         )
 
 
@@ -711,7 +749,10 @@ class AttributionReportingIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingIssueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SharedDictionaryError(enum.Enum):
@@ -744,7 +785,10 @@ class SharedDictionaryError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedDictionaryError:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SRIMessageSignatureError(enum.Enum):
@@ -774,7 +818,10 @@ class SRIMessageSignatureError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SRIMessageSignatureError:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -793,22 +840,22 @@ class AttributionReportingIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['violationType'] = self.violation_type.to_json()
+        json['violationType'] = self.violation_type.value
         if self.request is not None:
             json['request'] = self.request.to_json()
         if self.violating_node_id is not None:
-            json['violatingNodeId'] = self.violating_node_id.to_json()
+            json['violatingNodeId'] = self.violating_node_id
         if self.invalid_parameter is not None:
             json['invalidParameter'] = self.invalid_parameter
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingIssueDetails:
+    def from_json(cls, json: AttributionReportingIssueDetailsJSON) -> AttributionReportingIssueDetails:
         return cls(
             violation_type=AttributionReportingIssueType.from_json(json['violationType']),
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
-            invalid_parameter=str(json['invalidParameter']) if json.get('invalidParameter', None) is not None else None,
+            request=AffectedRequest.from_json(_request) if (_request := json.get('request')) is not None else None,
+            violating_node_id=dom.BackendNodeId(_violating_node_id) if (_violating_node_id := json.get('violatingNodeId')) is not None else None,
+            invalid_parameter=json.get('invalidParameter'),
         )
 
 
@@ -833,20 +880,20 @@ class QuirksModeIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['isLimitedQuirksMode'] = self.is_limited_quirks_mode
-        json['documentNodeId'] = self.document_node_id.to_json()
+        json['documentNodeId'] = self.document_node_id
         json['url'] = self.url
-        json['frameId'] = self.frame_id.to_json()
-        json['loaderId'] = self.loader_id.to_json()
+        json['frameId'] = self.frame_id
+        json['loaderId'] = self.loader_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> QuirksModeIssueDetails:
+    def from_json(cls, json: QuirksModeIssueDetailsJSON) -> QuirksModeIssueDetails:
         return cls(
-            is_limited_quirks_mode=bool(json['isLimitedQuirksMode']),
-            document_node_id=dom.BackendNodeId.from_json(json['documentNodeId']),
-            url=str(json['url']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
+            is_limited_quirks_mode=json['isLimitedQuirksMode'],
+            document_node_id=dom.BackendNodeId(json['documentNodeId']),
+            url=json['url'],
+            frame_id=page.FrameId(json['frameId']),
+            loader_id=network.LoaderId(json['loaderId']),
         )
 
 
@@ -864,10 +911,10 @@ class NavigatorUserAgentIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NavigatorUserAgentIssueDetails:
+    def from_json(cls, json: NavigatorUserAgentIssueDetailsJSON) -> NavigatorUserAgentIssueDetails:
         return cls(
-            url=str(json['url']),
-            location=SourceCodeLocation.from_json(json['location']) if json.get('location', None) is not None else None,
+            url=json['url'],
+            location=SourceCodeLocation.from_json(_location) if (_location := json.get('location')) is not None else None,
         )
 
 
@@ -879,12 +926,12 @@ class SharedDictionaryIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['sharedDictionaryError'] = self.shared_dictionary_error.to_json()
+        json['sharedDictionaryError'] = self.shared_dictionary_error.value
         json['request'] = self.request.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedDictionaryIssueDetails:
+    def from_json(cls, json: SharedDictionaryIssueDetailsJSON) -> SharedDictionaryIssueDetails:
         return cls(
             shared_dictionary_error=SharedDictionaryError.from_json(json['sharedDictionaryError']),
             request=AffectedRequest.from_json(json['request']),
@@ -899,12 +946,12 @@ class SRIMessageSignatureIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['error'] = self.error.to_json()
+        json['error'] = self.error.value
         json['request'] = self.request.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SRIMessageSignatureIssueDetails:
+    def from_json(cls, json: SRIMessageSignatureIssueDetailsJSON) -> SRIMessageSignatureIssueDetails:
         return cls(
             error=SRIMessageSignatureError.from_json(json['error']),
             request=AffectedRequest.from_json(json['request']),
@@ -929,7 +976,10 @@ class GenericIssueErrorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GenericIssueErrorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -950,11 +1000,11 @@ class GenericIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['errorType'] = self.error_type.to_json()
+        json['errorType'] = self.error_type.value
         if self.frame_id is not None:
-            json['frameId'] = self.frame_id.to_json()
+            json['frameId'] = self.frame_id
         if self.violating_node_id is not None:
-            json['violatingNodeId'] = self.violating_node_id.to_json()
+            json['violatingNodeId'] = self.violating_node_id
         if self.violating_node_attribute is not None:
             json['violatingNodeAttribute'] = self.violating_node_attribute
         if self.request is not None:
@@ -962,13 +1012,13 @@ class GenericIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> GenericIssueDetails:
+    def from_json(cls, json: GenericIssueDetailsJSON) -> GenericIssueDetails:
         return cls(
             error_type=GenericIssueErrorType.from_json(json['errorType']),
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
-            violating_node_attribute=str(json['violatingNodeAttribute']) if json.get('violatingNodeAttribute', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None,
+            violating_node_id=dom.BackendNodeId(_violating_node_id) if (_violating_node_id := json.get('violatingNodeId')) is not None else None,
+            violating_node_attribute=json.get('violatingNodeAttribute'),
+            request=AffectedRequest.from_json(_request) if (_request := json.get('request')) is not None else None,
         )
 
 
@@ -994,11 +1044,11 @@ class DeprecationIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DeprecationIssueDetails:
+    def from_json(cls, json: DeprecationIssueDetailsJSON) -> DeprecationIssueDetails:
         return cls(
             source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            type_=str(json['type']),
-            affected_frame=AffectedFrame.from_json(json['affectedFrame']) if json.get('affectedFrame', None) is not None else None,
+            type_=json['type'],
+            affected_frame=AffectedFrame.from_json(_affected_frame) if (_affected_frame := json.get('affectedFrame')) is not None else None,
         )
 
 
@@ -1015,13 +1065,13 @@ class BounceTrackingIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['trackingSites'] = [i for i in self.tracking_sites]
+        json['trackingSites'] = list(self.tracking_sites)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BounceTrackingIssueDetails:
+    def from_json(cls, json: BounceTrackingIssueDetailsJSON) -> BounceTrackingIssueDetails:
         return cls(
-            tracking_sites=[str(i) for i in json['trackingSites']],
+            tracking_sites=json['trackingSites'],
         )
 
 
@@ -1044,18 +1094,18 @@ class CookieDeprecationMetadataIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['allowedSites'] = [i for i in self.allowed_sites]
+        json['allowedSites'] = list(self.allowed_sites)
         json['optOutPercentage'] = self.opt_out_percentage
         json['isOptOutTopLevel'] = self.is_opt_out_top_level
-        json['operation'] = self.operation.to_json()
+        json['operation'] = self.operation.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CookieDeprecationMetadataIssueDetails:
+    def from_json(cls, json: CookieDeprecationMetadataIssueDetailsJSON) -> CookieDeprecationMetadataIssueDetails:
         return cls(
-            allowed_sites=[str(i) for i in json['allowedSites']],
+            allowed_sites=json['allowedSites'],
             opt_out_percentage=float(json['optOutPercentage']),
-            is_opt_out_top_level=bool(json['isOptOutTopLevel']),
+            is_opt_out_top_level=json['isOptOutTopLevel'],
             operation=CookieOperation.from_json(json['operation']),
         )
 
@@ -1069,7 +1119,10 @@ class ClientHintIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientHintIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1078,11 +1131,11 @@ class FederatedAuthRequestIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['federatedAuthRequestIssueReason'] = self.federated_auth_request_issue_reason.to_json()
+        json['federatedAuthRequestIssueReason'] = self.federated_auth_request_issue_reason.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FederatedAuthRequestIssueDetails:
+    def from_json(cls, json: FederatedAuthRequestIssueDetailsJSON) -> FederatedAuthRequestIssueDetails:
         return cls(
             federated_auth_request_issue_reason=FederatedAuthRequestIssueReason.from_json(json['federatedAuthRequestIssueReason']),
         )
@@ -1148,7 +1201,10 @@ class FederatedAuthRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthRequestIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1157,11 +1213,11 @@ class FederatedAuthUserInfoRequestIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['federatedAuthUserInfoRequestIssueReason'] = self.federated_auth_user_info_request_issue_reason.to_json()
+        json['federatedAuthUserInfoRequestIssueReason'] = self.federated_auth_user_info_request_issue_reason.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FederatedAuthUserInfoRequestIssueDetails:
+    def from_json(cls, json: FederatedAuthUserInfoRequestIssueDetailsJSON) -> FederatedAuthUserInfoRequestIssueDetails:
         return cls(
             federated_auth_user_info_request_issue_reason=FederatedAuthUserInfoRequestIssueReason.from_json(json['federatedAuthUserInfoRequestIssueReason']),
         )
@@ -1188,7 +1244,10 @@ class FederatedAuthUserInfoRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthUserInfoRequestIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1204,11 +1263,11 @@ class ClientHintIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['sourceCodeLocation'] = self.source_code_location.to_json()
-        json['clientHintIssueReason'] = self.client_hint_issue_reason.to_json()
+        json['clientHintIssueReason'] = self.client_hint_issue_reason.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ClientHintIssueDetails:
+    def from_json(cls, json: ClientHintIssueDetailsJSON) -> ClientHintIssueDetails:
         return cls(
             source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
             client_hint_issue_reason=ClientHintIssueReason.from_json(json['clientHintIssueReason']),
@@ -1230,15 +1289,15 @@ class FailedRequestInfo:
         json['url'] = self.url
         json['failureMessage'] = self.failure_message
         if self.request_id is not None:
-            json['requestId'] = self.request_id.to_json()
+            json['requestId'] = self.request_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FailedRequestInfo:
+    def from_json(cls, json: FailedRequestInfoJSON) -> FailedRequestInfo:
         return cls(
-            url=str(json['url']),
-            failure_message=str(json['failureMessage']),
-            request_id=network.RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
+            url=json['url'],
+            failure_message=json['failureMessage'],
+            request_id=network.RequestId(_request_id) if (_request_id := json.get('requestId')) is not None else None,
         )
 
 
@@ -1251,7 +1310,10 @@ class PartitioningBlobURLInfo(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PartitioningBlobURLInfo:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1265,13 +1327,13 @@ class PartitioningBlobURLIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['url'] = self.url
-        json['partitioningBlobURLInfo'] = self.partitioning_blob_url_info.to_json()
+        json['partitioningBlobURLInfo'] = self.partitioning_blob_url_info.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PartitioningBlobURLIssueDetails:
+    def from_json(cls, json: PartitioningBlobURLIssueDetailsJSON) -> PartitioningBlobURLIssueDetails:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             partitioning_blob_url_info=PartitioningBlobURLInfo.from_json(json['partitioningBlobURLInfo']),
         )
 
@@ -1288,7 +1350,10 @@ class SelectElementAccessibilityIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SelectElementAccessibilityIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1304,17 +1369,17 @@ class SelectElementAccessibilityIssueDetails:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['nodeId'] = self.node_id.to_json()
-        json['selectElementAccessibilityIssueReason'] = self.select_element_accessibility_issue_reason.to_json()
+        json['nodeId'] = self.node_id
+        json['selectElementAccessibilityIssueReason'] = self.select_element_accessibility_issue_reason.value
         json['hasDisallowedAttributes'] = self.has_disallowed_attributes
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SelectElementAccessibilityIssueDetails:
+    def from_json(cls, json: SelectElementAccessibilityIssueDetailsJSON) -> SelectElementAccessibilityIssueDetails:
         return cls(
-            node_id=dom.BackendNodeId.from_json(json['nodeId']),
+            node_id=dom.BackendNodeId(json['nodeId']),
             select_element_accessibility_issue_reason=SelectElementAccessibilityIssueReason.from_json(json['selectElementAccessibilityIssueReason']),
-            has_disallowed_attributes=bool(json['hasDisallowedAttributes']),
+            has_disallowed_attributes=json['hasDisallowedAttributes'],
         )
 
 
@@ -1327,7 +1392,10 @@ class StyleSheetLoadingIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetLoadingIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1347,17 +1415,17 @@ class StylesheetLoadingIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['sourceCodeLocation'] = self.source_code_location.to_json()
-        json['styleSheetLoadingIssueReason'] = self.style_sheet_loading_issue_reason.to_json()
+        json['styleSheetLoadingIssueReason'] = self.style_sheet_loading_issue_reason.value
         if self.failed_request_info is not None:
             json['failedRequestInfo'] = self.failed_request_info.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StylesheetLoadingIssueDetails:
+    def from_json(cls, json: StylesheetLoadingIssueDetailsJSON) -> StylesheetLoadingIssueDetails:
         return cls(
             source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
             style_sheet_loading_issue_reason=StyleSheetLoadingIssueReason.from_json(json['styleSheetLoadingIssueReason']),
-            failed_request_info=FailedRequestInfo.from_json(json['failedRequestInfo']) if json.get('failedRequestInfo', None) is not None else None,
+            failed_request_info=FailedRequestInfo.from_json(_failed_request_info) if (_failed_request_info := json.get('failedRequestInfo')) is not None else None,
         )
 
 
@@ -1372,7 +1440,10 @@ class PropertyRuleIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PropertyRuleIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1393,17 +1464,17 @@ class PropertyRuleIssueDetails:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['sourceCodeLocation'] = self.source_code_location.to_json()
-        json['propertyRuleIssueReason'] = self.property_rule_issue_reason.to_json()
+        json['propertyRuleIssueReason'] = self.property_rule_issue_reason.value
         if self.property_value is not None:
             json['propertyValue'] = self.property_value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PropertyRuleIssueDetails:
+    def from_json(cls, json: PropertyRuleIssueDetailsJSON) -> PropertyRuleIssueDetails:
         return cls(
             source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
             property_rule_issue_reason=PropertyRuleIssueReason.from_json(json['propertyRuleIssueReason']),
-            property_value=str(json['propertyValue']) if json.get('propertyValue', None) is not None else None,
+            property_value=json.get('propertyValue'),
         )
 
 
@@ -1443,7 +1514,10 @@ class InspectorIssueCode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectorIssueCode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1554,32 +1628,32 @@ class InspectorIssueDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InspectorIssueDetails:
+    def from_json(cls, json: InspectorIssueDetailsJSON) -> InspectorIssueDetails:
         return cls(
-            cookie_issue_details=CookieIssueDetails.from_json(json['cookieIssueDetails']) if json.get('cookieIssueDetails', None) is not None else None,
-            mixed_content_issue_details=MixedContentIssueDetails.from_json(json['mixedContentIssueDetails']) if json.get('mixedContentIssueDetails', None) is not None else None,
-            blocked_by_response_issue_details=BlockedByResponseIssueDetails.from_json(json['blockedByResponseIssueDetails']) if json.get('blockedByResponseIssueDetails', None) is not None else None,
-            heavy_ad_issue_details=HeavyAdIssueDetails.from_json(json['heavyAdIssueDetails']) if json.get('heavyAdIssueDetails', None) is not None else None,
-            content_security_policy_issue_details=ContentSecurityPolicyIssueDetails.from_json(json['contentSecurityPolicyIssueDetails']) if json.get('contentSecurityPolicyIssueDetails', None) is not None else None,
-            shared_array_buffer_issue_details=SharedArrayBufferIssueDetails.from_json(json['sharedArrayBufferIssueDetails']) if json.get('sharedArrayBufferIssueDetails', None) is not None else None,
-            low_text_contrast_issue_details=LowTextContrastIssueDetails.from_json(json['lowTextContrastIssueDetails']) if json.get('lowTextContrastIssueDetails', None) is not None else None,
-            cors_issue_details=CorsIssueDetails.from_json(json['corsIssueDetails']) if json.get('corsIssueDetails', None) is not None else None,
-            attribution_reporting_issue_details=AttributionReportingIssueDetails.from_json(json['attributionReportingIssueDetails']) if json.get('attributionReportingIssueDetails', None) is not None else None,
-            quirks_mode_issue_details=QuirksModeIssueDetails.from_json(json['quirksModeIssueDetails']) if json.get('quirksModeIssueDetails', None) is not None else None,
-            partitioning_blob_url_issue_details=PartitioningBlobURLIssueDetails.from_json(json['partitioningBlobURLIssueDetails']) if json.get('partitioningBlobURLIssueDetails', None) is not None else None,
-            navigator_user_agent_issue_details=NavigatorUserAgentIssueDetails.from_json(json['navigatorUserAgentIssueDetails']) if json.get('navigatorUserAgentIssueDetails', None) is not None else None,
-            generic_issue_details=GenericIssueDetails.from_json(json['genericIssueDetails']) if json.get('genericIssueDetails', None) is not None else None,
-            deprecation_issue_details=DeprecationIssueDetails.from_json(json['deprecationIssueDetails']) if json.get('deprecationIssueDetails', None) is not None else None,
-            client_hint_issue_details=ClientHintIssueDetails.from_json(json['clientHintIssueDetails']) if json.get('clientHintIssueDetails', None) is not None else None,
-            federated_auth_request_issue_details=FederatedAuthRequestIssueDetails.from_json(json['federatedAuthRequestIssueDetails']) if json.get('federatedAuthRequestIssueDetails', None) is not None else None,
-            bounce_tracking_issue_details=BounceTrackingIssueDetails.from_json(json['bounceTrackingIssueDetails']) if json.get('bounceTrackingIssueDetails', None) is not None else None,
-            cookie_deprecation_metadata_issue_details=CookieDeprecationMetadataIssueDetails.from_json(json['cookieDeprecationMetadataIssueDetails']) if json.get('cookieDeprecationMetadataIssueDetails', None) is not None else None,
-            stylesheet_loading_issue_details=StylesheetLoadingIssueDetails.from_json(json['stylesheetLoadingIssueDetails']) if json.get('stylesheetLoadingIssueDetails', None) is not None else None,
-            property_rule_issue_details=PropertyRuleIssueDetails.from_json(json['propertyRuleIssueDetails']) if json.get('propertyRuleIssueDetails', None) is not None else None,
-            federated_auth_user_info_request_issue_details=FederatedAuthUserInfoRequestIssueDetails.from_json(json['federatedAuthUserInfoRequestIssueDetails']) if json.get('federatedAuthUserInfoRequestIssueDetails', None) is not None else None,
-            shared_dictionary_issue_details=SharedDictionaryIssueDetails.from_json(json['sharedDictionaryIssueDetails']) if json.get('sharedDictionaryIssueDetails', None) is not None else None,
-            select_element_accessibility_issue_details=SelectElementAccessibilityIssueDetails.from_json(json['selectElementAccessibilityIssueDetails']) if json.get('selectElementAccessibilityIssueDetails', None) is not None else None,
-            sri_message_signature_issue_details=SRIMessageSignatureIssueDetails.from_json(json['sriMessageSignatureIssueDetails']) if json.get('sriMessageSignatureIssueDetails', None) is not None else None,
+            cookie_issue_details=CookieIssueDetails.from_json(_cookie_issue_details) if (_cookie_issue_details := json.get('cookieIssueDetails')) is not None else None,
+            mixed_content_issue_details=MixedContentIssueDetails.from_json(_mixed_content_issue_details) if (_mixed_content_issue_details := json.get('mixedContentIssueDetails')) is not None else None,
+            blocked_by_response_issue_details=BlockedByResponseIssueDetails.from_json(_blocked_by_response_issue_details) if (_blocked_by_response_issue_details := json.get('blockedByResponseIssueDetails')) is not None else None,
+            heavy_ad_issue_details=HeavyAdIssueDetails.from_json(_heavy_ad_issue_details) if (_heavy_ad_issue_details := json.get('heavyAdIssueDetails')) is not None else None,
+            content_security_policy_issue_details=ContentSecurityPolicyIssueDetails.from_json(_content_security_policy_issue_details) if (_content_security_policy_issue_details := json.get('contentSecurityPolicyIssueDetails')) is not None else None,
+            shared_array_buffer_issue_details=SharedArrayBufferIssueDetails.from_json(_shared_array_buffer_issue_details) if (_shared_array_buffer_issue_details := json.get('sharedArrayBufferIssueDetails')) is not None else None,
+            low_text_contrast_issue_details=LowTextContrastIssueDetails.from_json(_low_text_contrast_issue_details) if (_low_text_contrast_issue_details := json.get('lowTextContrastIssueDetails')) is not None else None,
+            cors_issue_details=CorsIssueDetails.from_json(_cors_issue_details) if (_cors_issue_details := json.get('corsIssueDetails')) is not None else None,
+            attribution_reporting_issue_details=AttributionReportingIssueDetails.from_json(_attribution_reporting_issue_details) if (_attribution_reporting_issue_details := json.get('attributionReportingIssueDetails')) is not None else None,
+            quirks_mode_issue_details=QuirksModeIssueDetails.from_json(_quirks_mode_issue_details) if (_quirks_mode_issue_details := json.get('quirksModeIssueDetails')) is not None else None,
+            partitioning_blob_url_issue_details=PartitioningBlobURLIssueDetails.from_json(_partitioning_blob_url_issue_details) if (_partitioning_blob_url_issue_details := json.get('partitioningBlobURLIssueDetails')) is not None else None,
+            navigator_user_agent_issue_details=NavigatorUserAgentIssueDetails.from_json(_navigator_user_agent_issue_details) if (_navigator_user_agent_issue_details := json.get('navigatorUserAgentIssueDetails')) is not None else None,
+            generic_issue_details=GenericIssueDetails.from_json(_generic_issue_details) if (_generic_issue_details := json.get('genericIssueDetails')) is not None else None,
+            deprecation_issue_details=DeprecationIssueDetails.from_json(_deprecation_issue_details) if (_deprecation_issue_details := json.get('deprecationIssueDetails')) is not None else None,
+            client_hint_issue_details=ClientHintIssueDetails.from_json(_client_hint_issue_details) if (_client_hint_issue_details := json.get('clientHintIssueDetails')) is not None else None,
+            federated_auth_request_issue_details=FederatedAuthRequestIssueDetails.from_json(_federated_auth_request_issue_details) if (_federated_auth_request_issue_details := json.get('federatedAuthRequestIssueDetails')) is not None else None,
+            bounce_tracking_issue_details=BounceTrackingIssueDetails.from_json(_bounce_tracking_issue_details) if (_bounce_tracking_issue_details := json.get('bounceTrackingIssueDetails')) is not None else None,
+            cookie_deprecation_metadata_issue_details=CookieDeprecationMetadataIssueDetails.from_json(_cookie_deprecation_metadata_issue_details) if (_cookie_deprecation_metadata_issue_details := json.get('cookieDeprecationMetadataIssueDetails')) is not None else None,
+            stylesheet_loading_issue_details=StylesheetLoadingIssueDetails.from_json(_stylesheet_loading_issue_details) if (_stylesheet_loading_issue_details := json.get('stylesheetLoadingIssueDetails')) is not None else None,
+            property_rule_issue_details=PropertyRuleIssueDetails.from_json(_property_rule_issue_details) if (_property_rule_issue_details := json.get('propertyRuleIssueDetails')) is not None else None,
+            federated_auth_user_info_request_issue_details=FederatedAuthUserInfoRequestIssueDetails.from_json(_federated_auth_user_info_request_issue_details) if (_federated_auth_user_info_request_issue_details := json.get('federatedAuthUserInfoRequestIssueDetails')) is not None else None,
+            shared_dictionary_issue_details=SharedDictionaryIssueDetails.from_json(_shared_dictionary_issue_details) if (_shared_dictionary_issue_details := json.get('sharedDictionaryIssueDetails')) is not None else None,
+            select_element_accessibility_issue_details=SelectElementAccessibilityIssueDetails.from_json(_select_element_accessibility_issue_details) if (_select_element_accessibility_issue_details := json.get('selectElementAccessibilityIssueDetails')) is not None else None,
+            sri_message_signature_issue_details=SRIMessageSignatureIssueDetails.from_json(_sri_message_signature_issue_details) if (_sri_message_signature_issue_details := json.get('sriMessageSignatureIssueDetails')) is not None else None,
         )
 
 
@@ -1614,27 +1688,35 @@ class InspectorIssue:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['code'] = self.code.to_json()
+        json['code'] = self.code.value
         json['details'] = self.details.to_json()
         if self.issue_id is not None:
-            json['issueId'] = self.issue_id.to_json()
+            json['issueId'] = self.issue_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InspectorIssue:
+    def from_json(cls, json: InspectorIssueJSON) -> InspectorIssue:
         return cls(
             code=InspectorIssueCode.from_json(json['code']),
             details=InspectorIssueDetails.from_json(json['details']),
-            issue_id=IssueId.from_json(json['issueId']) if json.get('issueId', None) is not None else None,
+            issue_id=IssueId(_issue_id) if (_issue_id := json.get('issueId')) is not None else None,
         )
 
 
+def _parse_get_encoded_response(json: GetEncodedResponseReturnsJSON) -> typing.Tuple[typing.Optional[str], int, int]:
+    return (
+        json.get('body'),
+        json['originalSize'],
+        json['encodedSize']
+    )
+
+
 def get_encoded_response(
         request_id: network.RequestId,
         encoding: str,
         quality: typing.Optional[float] = None,
         size_only: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], int, int]]:
+    ) -> Command[GetEncodedResponseReturnsJSON, typing.Tuple[typing.Optional[str], int, int]]:
     '''
     Returns the response body and size if it were re-encoded with the specified settings. Only
     applies to images.
@@ -1650,48 +1732,33 @@ def get_encoded_response(
         2. **encodedSize** - Size after re-encoding.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     params['encoding'] = encoding
     if quality is not None:
         params['quality'] = quality
     if size_only is not None:
         params['sizeOnly'] = size_only
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Audits.getEncodedResponse',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['body']) if json.get('body', None) is not None else None,
-        int(json['originalSize']),
-        int(json['encodedSize'])
-    )
+    return Command('Audits.getEncodedResponse', params, _parse_get_encoded_response)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables issues domain, prevents further issues from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Audits.disable',
-    }
-    json = yield cmd_dict
+    return Command('Audits.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables issues domain, sends the issues collected so far to the client by means of the
     ``issueAdded`` event.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Audits.enable',
-    }
-    json = yield cmd_dict
+    return Command('Audits.enable')
 
 
 def check_contrast(
         report_aaa: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Runs the contrast check for the target page. Found issues are reported
     using Audits.issueAdded event.
@@ -1701,25 +1768,21 @@ def check_contrast(
     params: T_JSON_DICT = dict()
     if report_aaa is not None:
         params['reportAAA'] = report_aaa
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Audits.checkContrast',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Audits.checkContrast', params)
+
+
+def _parse_check_forms_issues(json: CheckFormsIssuesReturnsJSON) -> typing.List[GenericIssueDetails]:
+    return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
 
 
-def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[GenericIssueDetails]]:
+def check_forms_issues() -> Command[CheckFormsIssuesReturnsJSON, typing.List[GenericIssueDetails]]:
     '''
     Runs the form issues check for the target page. Found issues are reported
     using Audits.issueAdded event.
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Audits.checkFormsIssues',
-    }
-    json = yield cmd_dict
-    return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
+    return Command('Audits.checkFormsIssues', None, _parse_check_forms_issues)
 
 
 @event_class('Audits.issueAdded')
@@ -1728,7 +1791,300 @@ class IssueAdded:
     issue: InspectorIssue
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IssueAdded:
+    def from_json(cls, json: IssueAddedJSON) -> IssueAdded:
         return cls(
             issue=InspectorIssue.from_json(json['issue'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class AffectedCookieJSON(typing.TypedDict):
+        name: str
+        path: str
+        domain: str
+
+
+    class _AffectedRequestJSON(typing.TypedDict):
+        url: str
+
+
+    class AffectedRequestJSON(_AffectedRequestJSON, total=False):
+        requestId: str
+
+
+    class AffectedFrameJSON(typing.TypedDict):
+        frameId: str
+
+
+    class _CookieIssueInsightJSON(typing.TypedDict):
+        type: str
+
+
+    class CookieIssueInsightJSON(_CookieIssueInsightJSON, total=False):
+        tableEntryUrl: str
+
+
+    class _CookieIssueDetailsJSON(typing.TypedDict):
+        cookieWarningReasons: typing.List[str]
+        cookieExclusionReasons: typing.List[str]
+        operation: str
+
+
+    class CookieIssueDetailsJSON(_CookieIssueDetailsJSON, total=False):
+        cookie: AffectedCookieJSON
+        rawCookieLine: str
+        siteForCookies: str
+        cookieUrl: str
+        request: AffectedRequestJSON
+        insight: CookieIssueInsightJSON
+
+
+    class _MixedContentIssueDetailsJSON(typing.TypedDict):
+        resolutionStatus: str
+        insecureURL: str
+        mainResourceURL: str
+
+
+    class MixedContentIssueDetailsJSON(_MixedContentIssueDetailsJSON, total=False):
+        resourceType: str
+        request: AffectedRequestJSON
+        frame: AffectedFrameJSON
+
+
+    class _BlockedByResponseIssueDetailsJSON(typing.TypedDict):
+        request: AffectedRequestJSON
+        reason: str
+
+
+    class BlockedByResponseIssueDetailsJSON(_BlockedByResponseIssueDetailsJSON, total=False):
+        parentFrame: AffectedFrameJSON
+        blockedFrame: AffectedFrameJSON
+
+
+    class HeavyAdIssueDetailsJSON(typing.TypedDict):
+        resolution: str
+        reason: str
+        frame: AffectedFrameJSON
+
+
+    class _SourceCodeLocationJSON(typing.TypedDict):
+        url: str
+        lineNumber: int
+        columnNumber: int
+
+
+    class SourceCodeLocationJSON(_SourceCodeLocationJSON, total=False):
+        scriptId: str
+
+
+    class _ContentSecurityPolicyIssueDetailsJSON(typing.TypedDict):
+        violatedDirective: str
+        isReportOnly: bool
+        contentSecurityPolicyViolationType: str
+
+
+    class ContentSecurityPolicyIssueDetailsJSON(_ContentSecurityPolicyIssueDetailsJSON, total=False):
+        blockedURL: str
+        frameAncestor: AffectedFrameJSON
+        sourceCodeLocation: SourceCodeLocationJSON
+        violatingNodeId: int
+
+
+    class SharedArrayBufferIssueDetailsJSON(typing.TypedDict):
+        sourceCodeLocation: SourceCodeLocationJSON
+        isWarning: bool
+        type: str
+
+
+    class LowTextContrastIssueDetailsJSON(typing.TypedDict):
+        violatingNodeId: int
+        violatingNodeSelector: str
+        contrastRatio: float
+        thresholdAA: float
+        thresholdAAA: float
+        fontSize: str
+        fontWeight: str
+
+
+    class _CorsIssueDetailsJSON(typing.TypedDict):
+        corsErrorStatus: network.CorsErrorStatusJSON
+        isWarning: bool
+        request: AffectedRequestJSON
+
+
+    class CorsIssueDetailsJSON(_CorsIssueDetailsJSON, total=False):
+        location: SourceCodeLocationJSON
+        initiatorOrigin: str
+        resourceIPAddressSpace: str
+        clientSecurityState: network.ClientSecurityStateJSON
+
+
+    class _AttributionReportingIssueDetailsJSON(typing.TypedDict):
+        violationType: str
+
+
+    class AttributionReportingIssueDetailsJSON(_AttributionReportingIssueDetailsJSON, total=False):
+        request: AffectedRequestJSON
+        violatingNodeId: int
+        invalidParameter: str
+
+
+    class QuirksModeIssueDetailsJSON(typing.TypedDict):
+        isLimitedQuirksMode: bool
+        documentNodeId: int
+        url: str
+        frameId: str
+        loaderId: str
+
+
+    class _NavigatorUserAgentIssueDetailsJSON(typing.TypedDict):
+        url: str
+
+
+    class NavigatorUserAgentIssueDetailsJSON(_NavigatorUserAgentIssueDetailsJSON, total=False):
+        location: SourceCodeLocationJSON
+
+
+    class SharedDictionaryIssueDetailsJSON(typing.TypedDict):
+        sharedDictionaryError: str
+        request: AffectedRequestJSON
+
+
+    class SRIMessageSignatureIssueDetailsJSON(typing.TypedDict):
+        error: str
+        request: AffectedRequestJSON
+
+
+    class _GenericIssueDetailsJSON(typing.TypedDict):
+        errorType: str
+
+
+    class GenericIssueDetailsJSON(_GenericIssueDetailsJSON, total=False):
+        frameId: str
+        violatingNodeId: int
+        violatingNodeAttribute: str
+        request: AffectedRequestJSON
+
+
+    class _DeprecationIssueDetailsJSON(typing.TypedDict):
+        sourceCodeLocation: SourceCodeLocationJSON
+        type: str
+
+
+    class DeprecationIssueDetailsJSON(_DeprecationIssueDetailsJSON, total=False):
+        affectedFrame: AffectedFrameJSON
+
+
+    class BounceTrackingIssueDetailsJSON(typing.TypedDict):
+        trackingSites: typing.List[str]
+
+
+    class CookieDeprecationMetadataIssueDetailsJSON(typing.TypedDict):
+        allowedSites: typing.List[str]
+        optOutPercentage: float
+        isOptOutTopLevel: bool
+        operation: str
+
+
+    class FederatedAuthRequestIssueDetailsJSON(typing.TypedDict):
+        federatedAuthRequestIssueReason: str
+
+
+    class FederatedAuthUserInfoRequestIssueDetailsJSON(typing.TypedDict):
+        federatedAuthUserInfoRequestIssueReason: str
+
+
+    class ClientHintIssueDetailsJSON(typing.TypedDict):
+        sourceCodeLocation: SourceCodeLocationJSON
+        clientHintIssueReason: str
+
+
+    class _FailedRequestInfoJSON(typing.TypedDict):
+        url: str
+        failureMessage: str
+
+
+    class FailedRequestInfoJSON(_FailedRequestInfoJSON, total=False):
+        requestId: str
+
+
+    class PartitioningBlobURLIssueDetailsJSON(typing.TypedDict):
+        url: str
+        partitioningBlobURLInfo: str
+
+
+    class SelectElementAccessibilityIssueDetailsJSON(typing.TypedDict):
+        nodeId: int
+        selectElementAccessibilityIssueReason: str
+        hasDisallowedAttributes: bool
+
+
+    class _StylesheetLoadingIssueDetailsJSON(typing.TypedDict):
+        sourceCodeLocation: SourceCodeLocationJSON
+        styleSheetLoadingIssueReason: str
+
+
+    class StylesheetLoadingIssueDetailsJSON(_StylesheetLoadingIssueDetailsJSON, total=False):
+        failedRequestInfo: FailedRequestInfoJSON
+
+
+    class _PropertyRuleIssueDetailsJSON(typing.TypedDict):
+        sourceCodeLocation: SourceCodeLocationJSON
+        propertyRuleIssueReason: str
+
+
+    class PropertyRuleIssueDetailsJSON(_PropertyRuleIssueDetailsJSON, total=False):
+        propertyValue: str
+
+
+    class InspectorIssueDetailsJSON(typing.TypedDict, total=False):
+        cookieIssueDetails: CookieIssueDetailsJSON
+        mixedContentIssueDetails: MixedContentIssueDetailsJSON
+        blockedByResponseIssueDetails: BlockedByResponseIssueDetailsJSON
+        heavyAdIssueDetails: HeavyAdIssueDetailsJSON
+        contentSecurityPolicyIssueDetails: ContentSecurityPolicyIssueDetailsJSON
+        sharedArrayBufferIssueDetails: SharedArrayBufferIssueDetailsJSON
+        lowTextContrastIssueDetails: LowTextContrastIssueDetailsJSON
+        corsIssueDetails: CorsIssueDetailsJSON
+        attributionReportingIssueDetails: AttributionReportingIssueDetailsJSON
+        quirksModeIssueDetails: QuirksModeIssueDetailsJSON
+        partitioningBlobURLIssueDetails: PartitioningBlobURLIssueDetailsJSON
+        navigatorUserAgentIssueDetails: NavigatorUserAgentIssueDetailsJSON
+        genericIssueDetails: GenericIssueDetailsJSON
+        deprecationIssueDetails: DeprecationIssueDetailsJSON
+        clientHintIssueDetails: ClientHintIssueDetailsJSON
+        federatedAuthRequestIssueDetails: FederatedAuthRequestIssueDetailsJSON
+        bounceTrackingIssueDetails: BounceTrackingIssueDetailsJSON
+        cookieDeprecationMetadataIssueDetails: CookieDeprecationMetadataIssueDetailsJSON
+        stylesheetLoadingIssueDetails: StylesheetLoadingIssueDetailsJSON
+        propertyRuleIssueDetails: PropertyRuleIssueDetailsJSON
+        federatedAuthUserInfoRequestIssueDetails: FederatedAuthUserInfoRequestIssueDetailsJSON
+        sharedDictionaryIssueDetails: SharedDictionaryIssueDetailsJSON
+        selectElementAccessibilityIssueDetails: SelectElementAccessibilityIssueDetailsJSON
+        sriMessageSignatureIssueDetails: SRIMessageSignatureIssueDetailsJSON
+
+
+    class _InspectorIssueJSON(typing.TypedDict):
+        code: str
+        details: InspectorIssueDetailsJSON
+
+
+    class InspectorIssueJSON(_InspectorIssueJSON, total=False):
+        issueId: str
+
+
+    class _GetEncodedResponseReturnsJSON(typing.TypedDict):
+        originalSize: int
+        encodedSize: int
+
+
+    class GetEncodedResponseReturnsJSON(_GetEncodedResponseReturnsJSON, total=False):
+        body: str
+
+
+    class CheckFormsIssuesReturnsJSON(typing.TypedDict):
+        formIssues: typing.List[GenericIssueDetailsJSON]
+
+
+    class IssueAddedJSON(typing.TypedDict):
+        issue: InspectorIssueJSON
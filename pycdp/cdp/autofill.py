@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    page = lazy_import('page', globals())
 
 
 @dataclass
@@ -42,13 +45,13 @@ class CreditCard:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CreditCard:
+    def from_json(cls, json: CreditCardJSON) -> CreditCard:
         return cls(
-            number=str(json['number']),
-            name=str(json['name']),
-            expiry_month=str(json['expiryMonth']),
-            expiry_year=str(json['expiryYear']),
-            cvc=str(json['cvc']),
+            number=json['number'],
+            name=json['name'],
+            expiry_month=json['expiryMonth'],
+            expiry_year=json['expiryYear'],
+            cvc=json['cvc'],
         )
 
 
@@ -67,10 +70,10 @@ class AddressField:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AddressField:
+    def from_json(cls, json: AddressFieldJSON) -> AddressField:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -87,7 +90,7 @@ class AddressFields:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AddressFields:
+    def from_json(cls, json: AddressFieldsJSON) -> AddressFields:
         return cls(
             fields=[AddressField.from_json(i) for i in json['fields']],
         )
@@ -104,7 +107,7 @@ class Address:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Address:
+    def from_json(cls, json: AddressJSON) -> Address:
         return cls(
             fields=[AddressField.from_json(i) for i in json['fields']],
         )
@@ -130,7 +133,7 @@ class AddressUI:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AddressUI:
+    def from_json(cls, json: AddressUIJSON) -> AddressUI:
         return cls(
             address_fields=[AddressFields.from_json(i) for i in json['addressFields']],
         )
@@ -148,7 +151,10 @@ class FillingStrategy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FillingStrategy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -184,22 +190,22 @@ class FilledField:
         json['name'] = self.name
         json['value'] = self.value
         json['autofillType'] = self.autofill_type
-        json['fillingStrategy'] = self.filling_strategy.to_json()
-        json['frameId'] = self.frame_id.to_json()
-        json['fieldId'] = self.field_id.to_json()
+        json['fillingStrategy'] = self.filling_strategy.value
+        json['frameId'] = self.frame_id
+        json['fieldId'] = self.field_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FilledField:
+    def from_json(cls, json: FilledFieldJSON) -> FilledField:
         return cls(
-            html_type=str(json['htmlType']),
-            id_=str(json['id']),
-            name=str(json['name']),
-            value=str(json['value']),
-            autofill_type=str(json['autofillType']),
+            html_type=json['htmlType'],
+            id_=json['id'],
+            name=json['name'],
+            value=json['value'],
+            autofill_type=json['autofillType'],
             filling_strategy=FillingStrategy.from_json(json['fillingStrategy']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            field_id=dom.BackendNodeId.from_json(json['fieldId']),
+            frame_id=page.FrameId(json['frameId']),
+            field_id=dom.BackendNodeId(json['fieldId']),
         )
 
 
@@ -207,7 +213,7 @@ def trigger(
         field_id: dom.BackendNodeId,
         card: CreditCard,
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Trigger autofill on a form identified by the fieldId.
     If the field and related form cannot be autofilled, returns an error.
@@ -217,20 +223,16 @@ def trigger(
     :param card: Credit card information to fill out the form. Credit card data is not saved.
     '''
     params: T_JSON_DICT = dict()
-    params['fieldId'] = field_id.to_json()
+    params['fieldId'] = field_id
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
+        params['frameId'] = frame_id
     params['card'] = card.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Autofill.trigger',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Autofill.trigger', params)
 
 
 def set_addresses(
         addresses: typing.List[Address]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set addresses so that developers can verify their forms implementation.
 
@@ -238,31 +240,21 @@ def set_addresses(
     '''
     params: T_JSON_DICT = dict()
     params['addresses'] = [i.to_json() for i in addresses]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Autofill.setAddresses',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Autofill.setAddresses', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables autofill domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Autofill.disable',
-    }
-    json = yield cmd_dict
+    return Command('Autofill.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables autofill domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Autofill.enable',
-    }
-    json = yield cmd_dict
+    return Command('Autofill.enable')
 
 
 @event_class('Autofill.addressFormFilled')
@@ -278,8 +270,50 @@ class AddressFormFilled:
     address_ui: AddressUI
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AddressFormFilled:
+    def from_json(cls, json: AddressFormFilledJSON) -> AddressFormFilled:
         return cls(
             filled_fields=[FilledField.from_json(i) for i in json['filledFields']],
             address_ui=AddressUI.from_json(json['addressUi'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class CreditCardJSON(typing.TypedDict):
+        number: str
+        name: str
+        expiryMonth: str
+        expiryYear: str
+        cvc: str
+
+
+    class AddressFieldJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class AddressFieldsJSON(typing.TypedDict):
+        fields: typing.List[AddressFieldJSON]
+
+
+    class AddressJSON(typing.TypedDict):
+        fields: typing.List[AddressFieldJSON]
+
+
+    class AddressUIJSON(typing.TypedDict):
+        addressFields: typing.List[AddressFieldsJSON]
+
+
+    class FilledFieldJSON(typing.TypedDict):
+        htmlType: str
+        id: str
+        name: str
+        value: str
+        autofillType: str
+        fillingStrategy: str
+        frameId: str
+        fieldId: int
+
+
+    class AddressFormFilledJSON(typing.TypedDict):
+        filledFields: typing.List[FilledFieldJSON]
+        addressUi: AddressUIJSON
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import network
-from . import service_worker
+if typing.TYPE_CHECKING:
+    from . import network
+    from . import service_worker
+else:
+    network = lazy_import('network', globals())
+    service_worker = lazy_import('service_worker', globals())
 
 
 class ServiceName(enum.Enum):
@@ -33,7 +36,10 @@ class ServiceName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -52,10 +58,10 @@ class EventMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> EventMetadata:
+    def from_json(cls, json: EventMetadataJSON) -> EventMetadata:
         return cls(
-            key=str(json['key']),
-            value=str(json['value']),
+            key=json['key'],
+            value=json['value'],
         )
 
 
@@ -87,10 +93,10 @@ class BackgroundServiceEvent:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['timestamp'] = self.timestamp.to_json()
+        json['timestamp'] = self.timestamp
         json['origin'] = self.origin
-        json['serviceWorkerRegistrationId'] = self.service_worker_registration_id.to_json()
-        json['service'] = self.service.to_json()
+        json['serviceWorkerRegistrationId'] = self.service_worker_registration_id
+        json['service'] = self.service.value
         json['eventName'] = self.event_name
         json['instanceId'] = self.instance_id
         json['eventMetadata'] = [i.to_json() for i in self.event_metadata]
@@ -98,57 +104,49 @@ class BackgroundServiceEvent:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEvent:
+    def from_json(cls, json: BackgroundServiceEventJSON) -> BackgroundServiceEvent:
         return cls(
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']),
-            origin=str(json['origin']),
-            service_worker_registration_id=service_worker.RegistrationID.from_json(json['serviceWorkerRegistrationId']),
+            timestamp=network.TimeSinceEpoch(json['timestamp']),
+            origin=json['origin'],
+            service_worker_registration_id=service_worker.RegistrationID(json['serviceWorkerRegistrationId']),
             service=ServiceName.from_json(json['service']),
-            event_name=str(json['eventName']),
-            instance_id=str(json['instanceId']),
+            event_name=json['eventName'],
+            instance_id=json['instanceId'],
             event_metadata=[EventMetadata.from_json(i) for i in json['eventMetadata']],
-            storage_key=str(json['storageKey']),
+            storage_key=json['storageKey'],
         )
 
 
 def start_observing(
         service: ServiceName
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables event updates for the service.
 
     :param service:
     '''
     params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BackgroundService.startObserving',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['service'] = service.value
+    return Command('BackgroundService.startObserving', params)
 
 
 def stop_observing(
         service: ServiceName
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Disables event updates for the service.
 
     :param service:
     '''
     params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BackgroundService.stopObserving',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['service'] = service.value
+    return Command('BackgroundService.stopObserving', params)
 
 
 def set_recording(
         should_record: bool,
         service: ServiceName
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set the recording state for the service.
 
@@ -157,29 +155,21 @@ def set_recording(
     '''
     params: T_JSON_DICT = dict()
     params['shouldRecord'] = should_record
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BackgroundService.setRecording',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['service'] = service.value
+    return Command('BackgroundService.setRecording', params)
 
 
 def clear_events(
         service: ServiceName
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears all stored data for the service.
 
     :param service:
     '''
     params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BackgroundService.clearEvents',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['service'] = service.value
+    return Command('BackgroundService.clearEvents', params)
 
 
 @event_class('BackgroundService.recordingStateChanged')
@@ -192,9 +182,9 @@ class RecordingStateChanged:
     service: ServiceName
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
+    def from_json(cls, json: RecordingStateChangedJSON) -> RecordingStateChanged:
         return cls(
-            is_recording=bool(json['isRecording']),
+            is_recording=json['isRecording'],
             service=ServiceName.from_json(json['service'])
         )
 
@@ -209,7 +199,33 @@ class BackgroundServiceEventReceived:
     background_service_event: BackgroundServiceEvent
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEventReceived:
+    def from_json(cls, json: BackgroundServiceEventReceivedJSON) -> BackgroundServiceEventReceived:
         return cls(
             background_service_event=BackgroundServiceEvent.from_json(json['backgroundServiceEvent'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class EventMetadataJSON(typing.TypedDict):
+        key: str
+        value: str
+
+
+    class BackgroundServiceEventJSON(typing.TypedDict):
+        timestamp: float
+        origin: str
+        serviceWorkerRegistrationId: str
+        service: str
+        eventName: str
+        instanceId: str
+        eventMetadata: typing.List[EventMetadataJSON]
+        storageKey: str
+
+
+    class RecordingStateChangedJSON(typing.TypedDict):
+        isRecording: bool
+        service: str
+
+
+    class BackgroundServiceEventReceivedJSON(typing.TypedDict):
+        backgroundServiceEvent: BackgroundServiceEventJSON
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class CentralState(enum.Enum):
@@ -25,7 +24,10 @@ class CentralState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CentralState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -48,10 +50,10 @@ class ManufacturerData:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ManufacturerData:
+    def from_json(cls, json: ManufacturerDataJSON) -> ManufacturerData:
         return cls(
-            key=int(json['key']),
-            data=str(json['data']),
+            key=json['key'],
+            data=json['data'],
         )
 
 
@@ -79,7 +81,7 @@ class ScanRecord:
         if self.name is not None:
             json['name'] = self.name
         if self.uuids is not None:
-            json['uuids'] = [i for i in self.uuids]
+            json['uuids'] = list(self.uuids)
         if self.appearance is not None:
             json['appearance'] = self.appearance
         if self.tx_power is not None:
@@ -89,13 +91,13 @@ class ScanRecord:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScanRecord:
+    def from_json(cls, json: ScanRecordJSON) -> ScanRecord:
         return cls(
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            uuids=[str(i) for i in json['uuids']] if json.get('uuids', None) is not None else None,
-            appearance=int(json['appearance']) if json.get('appearance', None) is not None else None,
-            tx_power=int(json['txPower']) if json.get('txPower', None) is not None else None,
-            manufacturer_data=[ManufacturerData.from_json(i) for i in json['manufacturerData']] if json.get('manufacturerData', None) is not None else None,
+            name=json.get('name'),
+            uuids=json.get('uuids'),
+            appearance=json.get('appearance'),
+            tx_power=json.get('txPower'),
+            manufacturer_data=[ManufacturerData.from_json(i) for i in _manufacturer_data] if (_manufacturer_data := json.get('manufacturerData')) is not None else None,
         )
 
 
@@ -118,10 +120,10 @@ class ScanEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScanEntry:
+    def from_json(cls, json: ScanEntryJSON) -> ScanEntry:
         return cls(
-            device_address=str(json['deviceAddress']),
-            rssi=int(json['rssi']),
+            device_address=json['deviceAddress'],
+            rssi=json['rssi'],
             scan_record=ScanRecord.from_json(json['scanRecord']),
         )
 
@@ -129,7 +131,7 @@ class ScanEntry:
 def enable(
         state: CentralState,
         le_supported: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable the BluetoothEmulation domain.
 
@@ -137,40 +139,29 @@ def enable(
     :param le_supported: If the simulated central supports low-energy.
     '''
     params: T_JSON_DICT = dict()
-    params['state'] = state.to_json()
+    params['state'] = state.value
     params['leSupported'] = le_supported
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BluetoothEmulation.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('BluetoothEmulation.enable', params)
 
 
 def set_simulated_central_state(
         state: CentralState
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set the state of the simulated central.
 
     :param state: State of the simulated central.
     '''
     params: T_JSON_DICT = dict()
-    params['state'] = state.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BluetoothEmulation.setSimulatedCentralState',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['state'] = state.value
+    return Command('BluetoothEmulation.setSimulatedCentralState', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disable the BluetoothEmulation domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BluetoothEmulation.disable',
-    }
-    json = yield cmd_dict
+    return Command('BluetoothEmulation.disable')
 
 
 def simulate_preconnected_peripheral(
@@ -178,7 +169,7 @@ def simulate_preconnected_peripheral(
         name: str,
         manufacturer_data: typing.List[ManufacturerData],
         known_service_uuids: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Simulates a peripheral with ``address``, ``name`` and ``knownServiceUuids``
     that has already been connected to the system.
@@ -192,17 +183,13 @@ def simulate_preconnected_peripheral(
     params['address'] = address
     params['name'] = name
     params['manufacturerData'] = [i.to_json() for i in manufacturer_data]
-    params['knownServiceUuids'] = [i for i in known_service_uuids]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BluetoothEmulation.simulatePreconnectedPeripheral',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['knownServiceUuids'] = list(known_service_uuids)
+    return Command('BluetoothEmulation.simulatePreconnectedPeripheral', params)
 
 
 def simulate_advertisement(
         entry: ScanEntry
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Simulates an advertisement packet described in ``entry`` being received by
     the central.
@@ -211,8 +198,24 @@ def simulate_advertisement(
     '''
     params: T_JSON_DICT = dict()
     params['entry'] = entry.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'BluetoothEmulation.simulateAdvertisement',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('BluetoothEmulation.simulateAdvertisement', params)
+
+
+if typing.TYPE_CHECKING:
+    class ManufacturerDataJSON(typing.TypedDict):
+        key: int
+        data: str
+
+
+    class ScanRecordJSON(typing.TypedDict, total=False):
+        name: str
+        uuids: typing.List[str]
+        appearance: int
+        txPower: int
+        manufacturerData: typing.List[ManufacturerDataJSON]
+
+
+    class ScanEntryJSON(typing.TypedDict):
+        deviceAddress: str
+        rssi: int
+        scanRecord: ScanRecordJSON
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import page
-from . import target
+if typing.TYPE_CHECKING:
+    from . import page
+    from . import target
+else:
+    page = lazy_import('page', globals())
+    target = lazy_import('target', globals())
 
 
 class BrowserContextID(str):
@@ -53,7 +56,10 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -87,17 +93,17 @@ class Bounds:
         if self.height is not None:
             json['height'] = self.height
         if self.window_state is not None:
-            json['windowState'] = self.window_state.to_json()
+            json['windowState'] = self.window_state.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Bounds:
+    def from_json(cls, json: BoundsJSON) -> Bounds:
         return cls(
-            left=int(json['left']) if json.get('left', None) is not None else None,
-            top=int(json['top']) if json.get('top', None) is not None else None,
-            width=int(json['width']) if json.get('width', None) is not None else None,
-            height=int(json['height']) if json.get('height', None) is not None else None,
-            window_state=WindowState.from_json(json['windowState']) if json.get('windowState', None) is not None else None,
+            left=json.get('left'),
+            top=json.get('top'),
+            width=json.get('width'),
+            height=json.get('height'),
+            window_state=WindowState.from_json(_window_state) if (_window_state := json.get('windowState')) is not None else None,
         )
 
 
@@ -144,7 +150,10 @@ class PermissionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PermissionSetting(enum.Enum):
@@ -157,7 +166,10 @@ class PermissionSetting(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionSetting:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -202,14 +214,14 @@ class PermissionDescriptor:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PermissionDescriptor:
+    def from_json(cls, json: PermissionDescriptorJSON) -> PermissionDescriptor:
         return cls(
-            name=str(json['name']),
-            sysex=bool(json['sysex']) if json.get('sysex', None) is not None else None,
-            user_visible_only=bool(json['userVisibleOnly']) if json.get('userVisibleOnly', None) is not None else None,
-            allow_without_sanitization=bool(json['allowWithoutSanitization']) if json.get('allowWithoutSanitization', None) is not None else None,
-            allow_without_gesture=bool(json['allowWithoutGesture']) if json.get('allowWithoutGesture', None) is not None else None,
-            pan_tilt_zoom=bool(json['panTiltZoom']) if json.get('panTiltZoom', None) is not None else None,
+            name=json['name'],
+            sysex=json.get('sysex'),
+            user_visible_only=json.get('userVisibleOnly'),
+            allow_without_sanitization=json.get('allowWithoutSanitization'),
+            allow_without_gesture=json.get('allowWithoutGesture'),
+            pan_tilt_zoom=json.get('panTiltZoom'),
         )
 
 
@@ -225,7 +237,10 @@ class BrowserCommandId(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BrowserCommandId:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -250,11 +265,11 @@ class Bucket:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Bucket:
+    def from_json(cls, json: BucketJSON) -> Bucket:
         return cls(
-            low=int(json['low']),
-            high=int(json['high']),
-            count=int(json['count']),
+            low=json['low'],
+            high=json['high'],
+            count=json['count'],
         )
 
 
@@ -284,11 +299,11 @@ class Histogram:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Histogram:
+    def from_json(cls, json: HistogramJSON) -> Histogram:
         return cls(
-            name=str(json['name']),
-            sum_=int(json['sum']),
-            count=int(json['count']),
+            name=json['name'],
+            sum_=json['sum'],
+            count=json['count'],
             buckets=[Bucket.from_json(i) for i in json['buckets']],
         )
 
@@ -298,7 +313,7 @@ def set_permission(
         setting: PermissionSetting,
         origin: typing.Optional[str] = None,
         browser_context_id: typing.Optional[BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set permission settings for given origin.
 
@@ -311,23 +326,19 @@ def set_permission(
     '''
     params: T_JSON_DICT = dict()
     params['permission'] = permission.to_json()
-    params['setting'] = setting.to_json()
+    params['setting'] = setting.value
     if origin is not None:
         params['origin'] = origin
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.setPermission',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Browser.setPermission', params)
 
 
 def grant_permissions(
         permissions: typing.List[PermissionType],
         origin: typing.Optional[str] = None,
         browser_context_id: typing.Optional[BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Grant specific permissions to the given origin and reject all others.
 
@@ -338,21 +349,17 @@ def grant_permissions(
     :param browser_context_id: *(Optional)* BrowserContext to override permissions. When omitted, default browser context is used.
     '''
     params: T_JSON_DICT = dict()
-    params['permissions'] = [i.to_json() for i in permissions]
+    params['permissions'] = [i.value for i in permissions]
     if origin is not None:
         params['origin'] = origin
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.grantPermissions',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Browser.grantPermissions', params)
 
 
 def reset_permissions(
         browser_context_id: typing.Optional[BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Reset all permission management for all origins.
 
@@ -360,12 +367,8 @@ def reset_permissions(
     '''
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.resetPermissions',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Browser.resetPermissions', params)
 
 
 def set_download_behavior(
@@ -373,7 +376,7 @@ def set_download_behavior(
         browser_context_id: typing.Optional[BrowserContextID] = None,
         download_path: typing.Optional[str] = None,
         events_enabled: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set the behavior when downloading a file.
 
@@ -387,22 +390,18 @@ def set_download_behavior(
     params: T_JSON_DICT = dict()
     params['behavior'] = behavior
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
+        params['browserContextId'] = browser_context_id
     if download_path is not None:
         params['downloadPath'] = download_path
     if events_enabled is not None:
         params['eventsEnabled'] = events_enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.setDownloadBehavior',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Browser.setDownloadBehavior', params)
 
 
 def cancel_download(
         guid: str,
         browser_context_id: typing.Optional[BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Cancel a download if in progress
 
@@ -414,49 +413,46 @@ def cancel_download(
     params: T_JSON_DICT = dict()
     params['guid'] = guid
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.cancelDownload',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Browser.cancelDownload', params)
 
 
-def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def close() -> Command[T_JSON_DICT, None]:
     '''
     Close browser gracefully.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.close',
-    }
-    json = yield cmd_dict
+    return Command('Browser.close')
 
 
-def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def crash() -> Command[T_JSON_DICT, None]:
     '''
     Crashes browser on the main thread.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.crash',
-    }
-    json = yield cmd_dict
+    return Command('Browser.crash')
 
 
-def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def crash_gpu_process() -> Command[T_JSON_DICT, None]:
     '''
     Crashes GPU process.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.crashGpuProcess',
-    }
-    json = yield cmd_dict
+    return Command('Browser.crashGpuProcess')
+
+
+def _parse_get_version(json: GetVersionReturnsJSON) -> typing.Tuple[str, str, str, str, str]:
+    return (
+        json['protocolVersion'],
+        json['product'],
+        json['revision'],
+        json['userAgent'],
+        json['jsVersion']
+    )
 
 
-def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, str, str, str, str]]:
+def get_version() -> Command[GetVersionReturnsJSON, typing.Tuple[str, str, str, str, str]]:
     '''
     Returns version information.
 
@@ -468,20 +464,14 @@ def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str,
         3. **userAgent** - User-Agent.
         4. **jsVersion** - V8 version.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getVersion',
-    }
-    json = yield cmd_dict
-    return (
-        str(json['protocolVersion']),
-        str(json['product']),
-        str(json['revision']),
-        str(json['userAgent']),
-        str(json['jsVersion'])
-    )
+    return Command('Browser.getVersion', None, _parse_get_version)
+
+
+def _parse_get_browser_command_line(json: GetBrowserCommandLineReturnsJSON) -> typing.List[str]:
+    return json['arguments']
 
 
-def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+def get_browser_command_line() -> Command[GetBrowserCommandLineReturnsJSON, typing.List[str]]:
     '''
     Returns the command line switches for the browser process if, and only if
     --enable-automation is on the commandline.
@@ -490,17 +480,17 @@ def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
 
     :returns: Commandline parameters
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getBrowserCommandLine',
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['arguments']]
+    return Command('Browser.getBrowserCommandLine', None, _parse_get_browser_command_line)
+
+
+def _parse_get_histograms(json: GetHistogramsReturnsJSON) -> typing.List[Histogram]:
+    return [Histogram.from_json(i) for i in json['histograms']]
 
 
 def get_histograms(
         query: typing.Optional[str] = None,
         delta: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Histogram]]:
+    ) -> Command[GetHistogramsReturnsJSON, typing.List[Histogram]]:
     '''
     Get Chrome histograms.
 
@@ -515,18 +505,17 @@ def get_histograms(
         params['query'] = query
     if delta is not None:
         params['delta'] = delta
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getHistograms',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Histogram.from_json(i) for i in json['histograms']]
+    return Command('Browser.getHistograms', params, _parse_get_histograms)
+
+
+def _parse_get_histogram(json: GetHistogramReturnsJSON) -> Histogram:
+    return Histogram.from_json(json['histogram'])
 
 
 def get_histogram(
         name: str,
         delta: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Histogram]:
+    ) -> Command[GetHistogramReturnsJSON, Histogram]:
     '''
     Get a Chrome histogram by name.
 
@@ -540,17 +529,16 @@ def get_histogram(
     params['name'] = name
     if delta is not None:
         params['delta'] = delta
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getHistogram',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Histogram.from_json(json['histogram'])
+    return Command('Browser.getHistogram', params, _parse_get_histogram)
+
+
+def _parse_get_window_bounds(json: GetWindowBoundsReturnsJSON) -> Bounds:
+    return Bounds.from_json(json['bounds'])
 
 
 def get_window_bounds(
         window_id: WindowID
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Bounds]:
+    ) -> Command[GetWindowBoundsReturnsJSON, Bounds]:
     '''
     Get position and size of the browser window.
 
@@ -560,18 +548,20 @@ def get_window_bounds(
     :returns: Bounds information of the window. When window state is 'minimized', the restored window position and size are returned.
     '''
     params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getWindowBounds',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Bounds.from_json(json['bounds'])
+    params['windowId'] = window_id
+    return Command('Browser.getWindowBounds', params, _parse_get_window_bounds)
+
+
+def _parse_get_window_for_target(json: GetWindowForTargetReturnsJSON) -> typing.Tuple[WindowID, Bounds]:
+    return (
+        WindowID(json['windowId']),
+        Bounds.from_json(json['bounds'])
+    )
 
 
 def get_window_for_target(
         target_id: typing.Optional[target.TargetID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[WindowID, Bounds]]:
+    ) -> Command[GetWindowForTargetReturnsJSON, typing.Tuple[WindowID, Bounds]]:
     '''
     Get the browser window that contains the devtools target.
 
@@ -585,22 +575,14 @@ def get_window_for_target(
     '''
     params: T_JSON_DICT = dict()
     if target_id is not None:
-        params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.getWindowForTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        WindowID.from_json(json['windowId']),
-        Bounds.from_json(json['bounds'])
-    )
+        params['targetId'] = target_id
+    return Command('Browser.getWindowForTarget', params, _parse_get_window_for_target)
 
 
 def set_window_bounds(
         window_id: WindowID,
         bounds: Bounds
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set position and/or size of the browser window.
 
@@ -610,19 +592,15 @@ def set_window_bounds(
     :param bounds: New window bounds. The 'minimized', 'maximized' and 'fullscreen' states cannot be combined with 'left', 'top', 'width' or 'height'. Leaves unspecified fields unchanged.
     '''
     params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
+    params['windowId'] = window_id
     params['bounds'] = bounds.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.setWindowBounds',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Browser.setWindowBounds', params)
 
 
 def set_dock_tile(
         badge_label: typing.Optional[str] = None,
         image: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set dock tile details, platform-specific.
 
@@ -636,16 +614,12 @@ def set_dock_tile(
         params['badgeLabel'] = badge_label
     if image is not None:
         params['image'] = image
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.setDockTile',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Browser.setDockTile', params)
 
 
 def execute_browser_command(
         command_id: BrowserCommandId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Invoke custom browser commands used by telemetry.
 
@@ -654,17 +628,13 @@ def execute_browser_command(
     :param command_id:
     '''
     params: T_JSON_DICT = dict()
-    params['commandId'] = command_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.executeBrowserCommand',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['commandId'] = command_id.value
+    return Command('Browser.executeBrowserCommand', params)
 
 
 def add_privacy_sandbox_enrollment_override(
         url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Allows a site to use privacy sandbox features that require enrollment
     without the site actually being enrolled. Only supported on page targets.
@@ -673,11 +643,7 @@ def add_privacy_sandbox_enrollment_override(
     '''
     params: T_JSON_DICT = dict()
     params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.addPrivacySandboxEnrollmentOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Browser.addPrivacySandboxEnrollmentOverride', params)
 
 
 @event_class('Browser.downloadWillBegin')
@@ -698,12 +664,12 @@ class DownloadWillBegin:
     suggested_filename: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
+    def from_json(cls, json: DownloadWillBeginJSON) -> DownloadWillBegin:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            guid=str(json['guid']),
-            url=str(json['url']),
-            suggested_filename=str(json['suggestedFilename'])
+            frame_id=page.FrameId(json['frameId']),
+            guid=json['guid'],
+            url=json['url'],
+            suggested_filename=json['suggestedFilename']
         )
 
 
@@ -725,10 +691,87 @@ class DownloadProgress:
     state: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
+    def from_json(cls, json: DownloadProgressJSON) -> DownloadProgress:
         return cls(
-            guid=str(json['guid']),
+            guid=json['guid'],
             total_bytes=float(json['totalBytes']),
             received_bytes=float(json['receivedBytes']),
-            state=str(json['state'])
+            state=json['state']
         )
+
+
+if typing.TYPE_CHECKING:
+    class BoundsJSON(typing.TypedDict, total=False):
+        left: int
+        top: int
+        width: int
+        height: int
+        windowState: str
+
+
+    class _PermissionDescriptorJSON(typing.TypedDict):
+        name: str
+
+
+    class PermissionDescriptorJSON(_PermissionDescriptorJSON, total=False):
+        sysex: bool
+        userVisibleOnly: bool
+        allowWithoutSanitization: bool
+        allowWithoutGesture: bool
+        panTiltZoom: bool
+
+
+    class BucketJSON(typing.TypedDict):
+        low: int
+        high: int
+        count: int
+
+
+    class HistogramJSON(typing.TypedDict):
+        name: str
+        sum: int
+        count: int
+        buckets: typing.List[BucketJSON]
+
+
+    class GetVersionReturnsJSON(typing.TypedDict):
+        protocolVersion: str
+        product: str
+        revision: str
+        userAgent: str
+        jsVersion: str
+
+
+    class GetBrowserCommandLineReturnsJSON(typing.TypedDict):
+        arguments: typing.List[str]
+
+
+    class GetHistogramsReturnsJSON(typing.TypedDict):
+        histograms: typing.List[HistogramJSON]
+
+
+    class GetHistogramReturnsJSON(typing.TypedDict):
+        histogram: HistogramJSON
+
+
+    class GetWindowBoundsReturnsJSON(typing.TypedDict):
+        bounds: BoundsJSON
+
+
+    class GetWindowForTargetReturnsJSON(typing.TypedDict):
+        windowId: int
+        bounds: BoundsJSON
+
+
+    class DownloadWillBeginJSON(typing.TypedDict):
+        frameId: str
+        guid: str
+        url: str
+        suggestedFilename: str
+
+
+    class DownloadProgressJSON(typing.TypedDict):
+        guid: str
+        totalBytes: float
+        receivedBytes: float
+        state: str
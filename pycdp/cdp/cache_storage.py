@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import storage
+if typing.TYPE_CHECKING:
+    from . import storage
+else:
+    storage = lazy_import('storage', globals())
 
 
 class CacheId(str):
@@ -45,7 +47,10 @@ class CachedResponseType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CachedResponseType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -85,19 +90,19 @@ class DataEntry:
         json['responseTime'] = self.response_time
         json['responseStatus'] = self.response_status
         json['responseStatusText'] = self.response_status_text
-        json['responseType'] = self.response_type.to_json()
+        json['responseType'] = self.response_type.value
         json['responseHeaders'] = [i.to_json() for i in self.response_headers]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DataEntry:
+    def from_json(cls, json: DataEntryJSON) -> DataEntry:
         return cls(
-            request_url=str(json['requestURL']),
-            request_method=str(json['requestMethod']),
+            request_url=json['requestURL'],
+            request_method=json['requestMethod'],
             request_headers=[Header.from_json(i) for i in json['requestHeaders']],
             response_time=float(json['responseTime']),
-            response_status=int(json['responseStatus']),
-            response_status_text=str(json['responseStatusText']),
+            response_status=json['responseStatus'],
+            response_status_text=json['responseStatusText'],
             response_type=CachedResponseType.from_json(json['responseType']),
             response_headers=[Header.from_json(i) for i in json['responseHeaders']],
         )
@@ -125,7 +130,7 @@ class Cache:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['cacheId'] = self.cache_id.to_json()
+        json['cacheId'] = self.cache_id
         json['securityOrigin'] = self.security_origin
         json['storageKey'] = self.storage_key
         json['cacheName'] = self.cache_name
@@ -134,13 +139,13 @@ class Cache:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Cache:
+    def from_json(cls, json: CacheJSON) -> Cache:
         return cls(
-            cache_id=CacheId.from_json(json['cacheId']),
-            security_origin=str(json['securityOrigin']),
-            storage_key=str(json['storageKey']),
-            cache_name=str(json['cacheName']),
-            storage_bucket=storage.StorageBucket.from_json(json['storageBucket']) if json.get('storageBucket', None) is not None else None,
+            cache_id=CacheId(json['cacheId']),
+            security_origin=json['securityOrigin'],
+            storage_key=json['storageKey'],
+            cache_name=json['cacheName'],
+            storage_bucket=storage.StorageBucket.from_json(_storage_bucket) if (_storage_bucket := json.get('storageBucket')) is not None else None,
         )
 
 
@@ -157,10 +162,10 @@ class Header:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Header:
+    def from_json(cls, json: HeaderJSON) -> Header:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -178,33 +183,29 @@ class CachedResponse:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CachedResponse:
+    def from_json(cls, json: CachedResponseJSON) -> CachedResponse:
         return cls(
-            body=str(json['body']),
+            body=json['body'],
         )
 
 
 def delete_cache(
         cache_id: CacheId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes a cache.
 
     :param cache_id: Id of cache for deletion.
     '''
     params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CacheStorage.deleteCache',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['cacheId'] = cache_id
+    return Command('CacheStorage.deleteCache', params)
 
 
 def delete_entry(
         cache_id: CacheId,
         request: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes a cache entry.
 
@@ -212,20 +213,20 @@ def delete_entry(
     :param request: URL spec of the request.
     '''
     params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
+    params['cacheId'] = cache_id
     params['request'] = request
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CacheStorage.deleteEntry',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('CacheStorage.deleteEntry', params)
+
+
+def _parse_request_cache_names(json: RequestCacheNamesReturnsJSON) -> typing.List[Cache]:
+    return [Cache.from_json(i) for i in json['caches']]
 
 
 def request_cache_names(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cache]]:
+    ) -> Command[RequestCacheNamesReturnsJSON, typing.List[Cache]]:
     '''
     Requests cache names.
 
@@ -241,19 +242,18 @@ def request_cache_names(
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CacheStorage.requestCacheNames',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Cache.from_json(i) for i in json['caches']]
+    return Command('CacheStorage.requestCacheNames', params, _parse_request_cache_names)
+
+
+def _parse_request_cached_response(json: RequestCachedResponseReturnsJSON) -> CachedResponse:
+    return CachedResponse.from_json(json['response'])
 
 
 def request_cached_response(
         cache_id: CacheId,
         request_url: str,
         request_headers: typing.List[Header]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CachedResponse]:
+    ) -> Command[RequestCachedResponseReturnsJSON, CachedResponse]:
     '''
     Fetches cache entry.
 
@@ -263,15 +263,17 @@ def request_cached_response(
     :returns: Response read from the cache.
     '''
     params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
+    params['cacheId'] = cache_id
     params['requestURL'] = request_url
     params['requestHeaders'] = [i.to_json() for i in request_headers]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CacheStorage.requestCachedResponse',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CachedResponse.from_json(json['response'])
+    return Command('CacheStorage.requestCachedResponse', params, _parse_request_cached_response)
+
+
+def _parse_request_entries(json: RequestEntriesReturnsJSON) -> typing.Tuple[typing.List[DataEntry], float]:
+    return (
+        [DataEntry.from_json(i) for i in json['cacheDataEntries']],
+        float(json['returnCount'])
+    )
 
 
 def request_entries(
@@ -279,7 +281,7 @@ def request_entries(
         skip_count: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
         path_filter: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[DataEntry], float]]:
+    ) -> Command[RequestEntriesReturnsJSON, typing.Tuple[typing.List[DataEntry], float]]:
     '''
     Requests data from cache.
 
@@ -293,19 +295,56 @@ def request_entries(
         1. **returnCount** - Count of returned entries from this storage. If pathFilter is empty, it is the count of all entries from this storage.
     '''
     params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
+    params['cacheId'] = cache_id
     if skip_count is not None:
         params['skipCount'] = skip_count
     if page_size is not None:
         params['pageSize'] = page_size
     if path_filter is not None:
         params['pathFilter'] = path_filter
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CacheStorage.requestEntries',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [DataEntry.from_json(i) for i in json['cacheDataEntries']],
-        float(json['returnCount'])
-    )
+    return Command('CacheStorage.requestEntries', params, _parse_request_entries)
+
+
+if typing.TYPE_CHECKING:
+    class DataEntryJSON(typing.TypedDict):
+        requestURL: str
+        requestMethod: str
+        requestHeaders: typing.List[HeaderJSON]
+        responseTime: float
+        responseStatus: int
+        responseStatusText: str
+        responseType: str
+        responseHeaders: typing.List[HeaderJSON]
+
+
+    class _CacheJSON(typing.TypedDict):
+        cacheId: str
+        securityOrigin: str
+        storageKey: str
+        cacheName: str
+
+
+    class CacheJSON(_CacheJSON, total=False):
+        storageBucket: storage.StorageBucketJSON
+
+
+    class HeaderJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class CachedResponseJSON(typing.TypedDict):
+        body: str
+
+
+    class RequestCacheNamesReturnsJSON(typing.TypedDict):
+        caches: typing.List[CacheJSON]
+
+
+    class RequestCachedResponseReturnsJSON(typing.TypedDict):
+        response: CachedResponseJSON
+
+
+    class RequestEntriesReturnsJSON(typing.TypedDict):
+        cacheDataEntries: typing.List[DataEntryJSON]
+        returnCount: float
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -31,17 +30,17 @@ class Sink:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Sink:
+    def from_json(cls, json: SinkJSON) -> Sink:
         return cls(
-            name=str(json['name']),
-            id_=str(json['id']),
-            session=str(json['session']) if json.get('session', None) is not None else None,
+            name=json['name'],
+            id_=json['id'],
+            session=json.get('session'),
         )
 
 
 def enable(
         presentation_url: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts observing for sinks that can be used for tab mirroring, and if set,
     sinks compatible with ``presentationUrl`` as well. When sinks are found, a
@@ -54,26 +53,19 @@ def enable(
     params: T_JSON_DICT = dict()
     if presentation_url is not None:
         params['presentationUrl'] = presentation_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Cast.enable', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Stops observing for sinks and issues.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.disable',
-    }
-    json = yield cmd_dict
+    return Command('Cast.disable')
 
 
 def set_sink_to_use(
         sink_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets a sink to be used when the web page requests the browser to choose a
     sink via Presentation API, Remote Playback API, or Cast SDK.
@@ -82,16 +74,12 @@ def set_sink_to_use(
     '''
     params: T_JSON_DICT = dict()
     params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.setSinkToUse',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Cast.setSinkToUse', params)
 
 
 def start_desktop_mirroring(
         sink_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts mirroring the desktop to the sink.
 
@@ -99,16 +87,12 @@ def start_desktop_mirroring(
     '''
     params: T_JSON_DICT = dict()
     params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.startDesktopMirroring',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Cast.startDesktopMirroring', params)
 
 
 def start_tab_mirroring(
         sink_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts mirroring the tab to the sink.
 
@@ -116,16 +100,12 @@ def start_tab_mirroring(
     '''
     params: T_JSON_DICT = dict()
     params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.startTabMirroring',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Cast.startTabMirroring', params)
 
 
 def stop_casting(
         sink_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Stops the active Cast session on the sink.
 
@@ -133,11 +113,7 @@ def stop_casting(
     '''
     params: T_JSON_DICT = dict()
     params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Cast.stopCasting',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Cast.stopCasting', params)
 
 
 @event_class('Cast.sinksUpdated')
@@ -150,7 +126,7 @@ class SinksUpdated:
     sinks: typing.List[Sink]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SinksUpdated:
+    def from_json(cls, json: SinksUpdatedJSON) -> SinksUpdated:
         return cls(
             sinks=[Sink.from_json(i) for i in json['sinks']]
         )
@@ -166,7 +142,25 @@ class IssueUpdated:
     issue_message: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IssueUpdated:
+    def from_json(cls, json: IssueUpdatedJSON) -> IssueUpdated:
         return cls(
-            issue_message=str(json['issueMessage'])
+            issue_message=json['issueMessage']
         )
+
+
+if typing.TYPE_CHECKING:
+    class _SinkJSON(typing.TypedDict):
+        name: str
+        id: str
+
+
+    class SinkJSON(_SinkJSON, total=False):
+        session: str
+
+
+    class SinksUpdatedJSON(typing.TypedDict):
+        sinks: typing.List[SinkJSON]
+
+
+    class IssueUpdatedJSON(typing.TypedDict):
+        issueMessage: str
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -49,46 +48,37 @@ class ConsoleMessage:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ConsoleMessage:
+    def from_json(cls, json: ConsoleMessageJSON) -> ConsoleMessage:
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line=int(json['line']) if json.get('line', None) is not None else None,
-            column=int(json['column']) if json.get('column', None) is not None else None,
+            source=json['source'],
+            level=json['level'],
+            text=json['text'],
+            url=json.get('url'),
+            line=json.get('line'),
+            column=json.get('column'),
         )
 
 
-def clear_messages() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_messages() -> Command[T_JSON_DICT, None]:
     '''
     Does nothing.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Console.clearMessages',
-    }
-    json = yield cmd_dict
+    return Command('Console.clearMessages')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables console domain, prevents further console messages from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Console.disable',
-    }
-    json = yield cmd_dict
+    return Command('Console.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables console domain, sends the messages collected so far to the client by means of the
     ``messageAdded`` notification.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Console.enable',
-    }
-    json = yield cmd_dict
+    return Command('Console.enable')
 
 
 @event_class('Console.messageAdded')
@@ -101,7 +91,24 @@ class MessageAdded:
     message: ConsoleMessage
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> MessageAdded:
+    def from_json(cls, json: MessageAddedJSON) -> MessageAdded:
         return cls(
             message=ConsoleMessage.from_json(json['message'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _ConsoleMessageJSON(typing.TypedDict):
+        source: str
+        level: str
+        text: str
+
+
+    class ConsoleMessageJSON(_ConsoleMessageJSON, total=False):
+        url: str
+        line: int
+        column: int
+
+
+    class MessageAddedJSON(typing.TypedDict):
+        message: ConsoleMessageJSON
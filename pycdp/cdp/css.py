@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    page = lazy_import('page', globals())
 
 
 class StyleSheetId(str):
@@ -43,7 +46,10 @@ class StyleSheetOrigin(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetOrigin:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -62,18 +68,18 @@ class PseudoElementMatches:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['pseudoType'] = self.pseudo_type.to_json()
+        json['pseudoType'] = self.pseudo_type.value
         json['matches'] = [i.to_json() for i in self.matches]
         if self.pseudo_identifier is not None:
             json['pseudoIdentifier'] = self.pseudo_identifier
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PseudoElementMatches:
+    def from_json(cls, json: PseudoElementMatchesJSON) -> PseudoElementMatches:
         return cls(
             pseudo_type=dom.PseudoType.from_json(json['pseudoType']),
             matches=[RuleMatch.from_json(i) for i in json['matches']],
-            pseudo_identifier=str(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
+            pseudo_identifier=json.get('pseudoIdentifier'),
         )
 
 
@@ -96,10 +102,10 @@ class CSSAnimationStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSAnimationStyle:
+    def from_json(cls, json: CSSAnimationStyleJSON) -> CSSAnimationStyle:
         return cls(
             style=CSSStyle.from_json(json['style']),
-            name=str(json['name']) if json.get('name', None) is not None else None,
+            name=json.get('name'),
         )
 
 
@@ -122,10 +128,10 @@ class InheritedStyleEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InheritedStyleEntry:
+    def from_json(cls, json: InheritedStyleEntryJSON) -> InheritedStyleEntry:
         return cls(
             matched_css_rules=[RuleMatch.from_json(i) for i in json['matchedCSSRules']],
-            inline_style=CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
+            inline_style=CSSStyle.from_json(_inline_style) if (_inline_style := json.get('inlineStyle')) is not None else None,
         )
 
 
@@ -149,10 +155,10 @@ class InheritedAnimatedStyleEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InheritedAnimatedStyleEntry:
+    def from_json(cls, json: InheritedAnimatedStyleEntryJSON) -> InheritedAnimatedStyleEntry:
         return cls(
-            animation_styles=[CSSAnimationStyle.from_json(i) for i in json['animationStyles']] if json.get('animationStyles', None) is not None else None,
-            transitions_style=CSSStyle.from_json(json['transitionsStyle']) if json.get('transitionsStyle', None) is not None else None,
+            animation_styles=[CSSAnimationStyle.from_json(i) for i in _animation_styles] if (_animation_styles := json.get('animationStyles')) is not None else None,
+            transitions_style=CSSStyle.from_json(_transitions_style) if (_transitions_style := json.get('transitionsStyle')) is not None else None,
         )
 
 
@@ -170,7 +176,7 @@ class InheritedPseudoElementMatches:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InheritedPseudoElementMatches:
+    def from_json(cls, json: InheritedPseudoElementMatchesJSON) -> InheritedPseudoElementMatches:
         return cls(
             pseudo_elements=[PseudoElementMatches.from_json(i) for i in json['pseudoElements']],
         )
@@ -190,14 +196,14 @@ class RuleMatch:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['rule'] = self.rule.to_json()
-        json['matchingSelectors'] = [i for i in self.matching_selectors]
+        json['matchingSelectors'] = list(self.matching_selectors)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RuleMatch:
+    def from_json(cls, json: RuleMatchJSON) -> RuleMatch:
         return cls(
             rule=CSSRule.from_json(json['rule']),
-            matching_selectors=[int(i) for i in json['matchingSelectors']],
+            matching_selectors=json['matchingSelectors'],
         )
 
 
@@ -225,11 +231,11 @@ class Value:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Value:
+    def from_json(cls, json: ValueJSON) -> Value:
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            specificity=Specificity.from_json(json['specificity']) if json.get('specificity', None) is not None else None,
+            text=json['text'],
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            specificity=Specificity.from_json(_specificity) if (_specificity := json.get('specificity')) is not None else None,
         )
 
 
@@ -257,11 +263,11 @@ class Specificity:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Specificity:
+    def from_json(cls, json: SpecificityJSON) -> Specificity:
         return cls(
-            a=int(json['a']),
-            b=int(json['b']),
-            c=int(json['c']),
+            a=json['a'],
+            b=json['b'],
+            c=json['c'],
         )
 
 
@@ -283,10 +289,10 @@ class SelectorList:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SelectorList:
+    def from_json(cls, json: SelectorListJSON) -> SelectorList:
         return cls(
             selectors=[Value.from_json(i) for i in json['selectors']],
-            text=str(json['text']),
+            text=json['text'],
         )
 
 
@@ -358,10 +364,10 @@ class CSSStyleSheetHeader:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['styleSheetId'] = self.style_sheet_id.to_json()
-        json['frameId'] = self.frame_id.to_json()
+        json['styleSheetId'] = self.style_sheet_id
+        json['frameId'] = self.frame_id
         json['sourceURL'] = self.source_url
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['title'] = self.title
         json['disabled'] = self.disabled
         json['isInline'] = self.is_inline
@@ -375,7 +381,7 @@ class CSSStyleSheetHeader:
         if self.source_map_url is not None:
             json['sourceMapURL'] = self.source_map_url
         if self.owner_node is not None:
-            json['ownerNode'] = self.owner_node.to_json()
+            json['ownerNode'] = self.owner_node
         if self.has_source_url is not None:
             json['hasSourceURL'] = self.has_source_url
         if self.loading_failed is not None:
@@ -383,26 +389,26 @@ class CSSStyleSheetHeader:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSStyleSheetHeader:
+    def from_json(cls, json: CSSStyleSheetHeaderJSON) -> CSSStyleSheetHeader:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            source_url=str(json['sourceURL']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
+            frame_id=page.FrameId(json['frameId']),
+            source_url=json['sourceURL'],
             origin=StyleSheetOrigin.from_json(json['origin']),
-            title=str(json['title']),
-            disabled=bool(json['disabled']),
-            is_inline=bool(json['isInline']),
-            is_mutable=bool(json['isMutable']),
-            is_constructed=bool(json['isConstructed']),
+            title=json['title'],
+            disabled=json['disabled'],
+            is_inline=json['isInline'],
+            is_mutable=json['isMutable'],
+            is_constructed=json['isConstructed'],
             start_line=float(json['startLine']),
             start_column=float(json['startColumn']),
             length=float(json['length']),
             end_line=float(json['endLine']),
             end_column=float(json['endColumn']),
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            owner_node=dom.BackendNodeId.from_json(json['ownerNode']) if json.get('ownerNode', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            loading_failed=bool(json['loadingFailed']) if json.get('loadingFailed', None) is not None else None,
+            source_map_url=json.get('sourceMapURL'),
+            owner_node=dom.BackendNodeId(_owner_node) if (_owner_node := json.get('ownerNode')) is not None else None,
+            has_source_url=json.get('hasSourceURL'),
+            loading_failed=json.get('loadingFailed'),
         )
 
 
@@ -457,12 +463,12 @@ class CSSRule:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['selectorList'] = self.selector_list.to_json()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['style'] = self.style.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         if self.nesting_selectors is not None:
-            json['nestingSelectors'] = [i for i in self.nesting_selectors]
+            json['nestingSelectors'] = list(self.nesting_selectors)
         if self.media is not None:
             json['media'] = [i.to_json() for i in self.media]
         if self.container_queries is not None:
@@ -474,26 +480,26 @@ class CSSRule:
         if self.scopes is not None:
             json['scopes'] = [i.to_json() for i in self.scopes]
         if self.rule_types is not None:
-            json['ruleTypes'] = [i.to_json() for i in self.rule_types]
+            json['ruleTypes'] = [i.value for i in self.rule_types]
         if self.starting_styles is not None:
             json['startingStyles'] = [i.to_json() for i in self.starting_styles]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSRule:
+    def from_json(cls, json: CSSRuleJSON) -> CSSRule:
         return cls(
             selector_list=SelectorList.from_json(json['selectorList']),
             origin=StyleSheetOrigin.from_json(json['origin']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            nesting_selectors=[str(i) for i in json['nestingSelectors']] if json.get('nestingSelectors', None) is not None else None,
-            media=[CSSMedia.from_json(i) for i in json['media']] if json.get('media', None) is not None else None,
-            container_queries=[CSSContainerQuery.from_json(i) for i in json['containerQueries']] if json.get('containerQueries', None) is not None else None,
-            supports=[CSSSupports.from_json(i) for i in json['supports']] if json.get('supports', None) is not None else None,
-            layers=[CSSLayer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None,
-            scopes=[CSSScope.from_json(i) for i in json['scopes']] if json.get('scopes', None) is not None else None,
-            rule_types=[CSSRuleType.from_json(i) for i in json['ruleTypes']] if json.get('ruleTypes', None) is not None else None,
-            starting_styles=[CSSStartingStyle.from_json(i) for i in json['startingStyles']] if json.get('startingStyles', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
+            nesting_selectors=json.get('nestingSelectors'),
+            media=[CSSMedia.from_json(i) for i in _media] if (_media := json.get('media')) is not None else None,
+            container_queries=[CSSContainerQuery.from_json(i) for i in _container_queries] if (_container_queries := json.get('containerQueries')) is not None else None,
+            supports=[CSSSupports.from_json(i) for i in _supports] if (_supports := json.get('supports')) is not None else None,
+            layers=[CSSLayer.from_json(i) for i in _layers] if (_layers := json.get('layers')) is not None else None,
+            scopes=[CSSScope.from_json(i) for i in _scopes] if (_scopes := json.get('scopes')) is not None else None,
+            rule_types=[CSSRuleType.from_json(i) for i in _rule_types] if (_rule_types := json.get('ruleTypes')) is not None else None,
+            starting_styles=[CSSStartingStyle.from_json(i) for i in _starting_styles] if (_starting_styles := json.get('startingStyles')) is not None else None,
         )
 
 
@@ -515,7 +521,10 @@ class CSSRuleType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CSSRuleType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -538,19 +547,19 @@ class RuleUsage:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['styleSheetId'] = self.style_sheet_id.to_json()
+        json['styleSheetId'] = self.style_sheet_id
         json['startOffset'] = self.start_offset
         json['endOffset'] = self.end_offset
         json['used'] = self.used
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RuleUsage:
+    def from_json(cls, json: RuleUsageJSON) -> RuleUsage:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
             start_offset=float(json['startOffset']),
             end_offset=float(json['endOffset']),
-            used=bool(json['used']),
+            used=json['used'],
         )
 
 
@@ -580,12 +589,12 @@ class SourceRange:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SourceRange:
+    def from_json(cls, json: SourceRangeJSON) -> SourceRange:
         return cls(
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
         )
 
 
@@ -609,11 +618,11 @@ class ShorthandEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ShorthandEntry:
+    def from_json(cls, json: ShorthandEntryJSON) -> ShorthandEntry:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if json.get('important', None) is not None else None,
+            name=json['name'],
+            value=json['value'],
+            important=json.get('important'),
         )
 
 
@@ -632,10 +641,10 @@ class CSSComputedStyleProperty:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
+    def from_json(cls, json: CSSComputedStylePropertyJSON) -> CSSComputedStyleProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -665,7 +674,7 @@ class CSSStyle:
         json['cssProperties'] = [i.to_json() for i in self.css_properties]
         json['shorthandEntries'] = [i.to_json() for i in self.shorthand_entries]
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         if self.css_text is not None:
             json['cssText'] = self.css_text
         if self.range_ is not None:
@@ -673,13 +682,13 @@ class CSSStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSStyle:
+    def from_json(cls, json: CSSStyleJSON) -> CSSStyle:
         return cls(
             css_properties=[CSSProperty.from_json(i) for i in json['cssProperties']],
             shorthand_entries=[ShorthandEntry.from_json(i) for i in json['shorthandEntries']],
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            css_text=str(json['cssText']) if json.get('cssText', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
+            css_text=json.get('cssText'),
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
         )
 
 
@@ -737,17 +746,17 @@ class CSSProperty:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSProperty:
+    def from_json(cls, json: CSSPropertyJSON) -> CSSProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if json.get('important', None) is not None else None,
-            implicit=bool(json['implicit']) if json.get('implicit', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
-            parsed_ok=bool(json['parsedOk']) if json.get('parsedOk', None) is not None else None,
-            disabled=bool(json['disabled']) if json.get('disabled', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            longhand_properties=[CSSProperty.from_json(i) for i in json['longhandProperties']] if json.get('longhandProperties', None) is not None else None,
+            name=json['name'],
+            value=json['value'],
+            important=json.get('important'),
+            implicit=json.get('implicit'),
+            text=json.get('text'),
+            parsed_ok=json.get('parsedOk'),
+            disabled=json.get('disabled'),
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            longhand_properties=[CSSProperty.from_json(i) for i in _longhand_properties] if (_longhand_properties := json.get('longhandProperties')) is not None else None,
         )
 
 
@@ -787,20 +796,20 @@ class CSSMedia:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         if self.media_list is not None:
             json['mediaList'] = [i.to_json() for i in self.media_list]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSMedia:
+    def from_json(cls, json: CSSMediaJSON) -> CSSMedia:
         return cls(
-            text=str(json['text']),
-            source=str(json['source']),
-            source_url=str(json['sourceURL']) if json.get('sourceURL', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            media_list=[MediaQuery.from_json(i) for i in json['mediaList']] if json.get('mediaList', None) is not None else None,
+            text=json['text'],
+            source=json['source'],
+            source_url=json.get('sourceURL'),
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
+            media_list=[MediaQuery.from_json(i) for i in _media_list] if (_media_list := json.get('mediaList')) is not None else None,
         )
 
 
@@ -822,10 +831,10 @@ class MediaQuery:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> MediaQuery:
+    def from_json(cls, json: MediaQueryJSON) -> MediaQuery:
         return cls(
             expressions=[MediaQueryExpression.from_json(i) for i in json['expressions']],
-            active=bool(json['active']),
+            active=json['active'],
         )
 
 
@@ -861,13 +870,13 @@ class MediaQueryExpression:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> MediaQueryExpression:
+    def from_json(cls, json: MediaQueryExpressionJSON) -> MediaQueryExpression:
         return cls(
             value=float(json['value']),
-            unit=str(json['unit']),
-            feature=str(json['feature']),
-            value_range=SourceRange.from_json(json['valueRange']) if json.get('valueRange', None) is not None else None,
-            computed_length=float(json['computedLength']) if json.get('computedLength', None) is not None else None,
+            unit=json['unit'],
+            feature=json['feature'],
+            value_range=SourceRange.from_json(_value_range) if (_value_range := json.get('valueRange')) is not None else None,
+            computed_length=float(_computed_length) if (_computed_length := json.get('computedLength')) is not None else None,
         )
 
 
@@ -904,27 +913,27 @@ class CSSContainerQuery:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         if self.name is not None:
             json['name'] = self.name
         if self.physical_axes is not None:
-            json['physicalAxes'] = self.physical_axes.to_json()
+            json['physicalAxes'] = self.physical_axes.value
         if self.logical_axes is not None:
-            json['logicalAxes'] = self.logical_axes.to_json()
+            json['logicalAxes'] = self.logical_axes.value
         if self.queries_scroll_state is not None:
             json['queriesScrollState'] = self.queries_scroll_state
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSContainerQuery:
+    def from_json(cls, json: CSSContainerQueryJSON) -> CSSContainerQuery:
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            physical_axes=dom.PhysicalAxes.from_json(json['physicalAxes']) if json.get('physicalAxes', None) is not None else None,
-            logical_axes=dom.LogicalAxes.from_json(json['logicalAxes']) if json.get('logicalAxes', None) is not None else None,
-            queries_scroll_state=bool(json['queriesScrollState']) if json.get('queriesScrollState', None) is not None else None,
+            text=json['text'],
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
+            name=json.get('name'),
+            physical_axes=dom.PhysicalAxes.from_json(_physical_axes) if (_physical_axes := json.get('physicalAxes')) is not None else None,
+            logical_axes=dom.LogicalAxes.from_json(_logical_axes) if (_logical_axes := json.get('logicalAxes')) is not None else None,
+            queries_scroll_state=json.get('queriesScrollState'),
         )
 
 
@@ -953,16 +962,16 @@ class CSSSupports:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSSupports:
+    def from_json(cls, json: CSSSupportsJSON) -> CSSSupports:
         return cls(
-            text=str(json['text']),
-            active=bool(json['active']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            text=json['text'],
+            active=json['active'],
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -987,15 +996,15 @@ class CSSScope:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSScope:
+    def from_json(cls, json: CSSScopeJSON) -> CSSScope:
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            text=json['text'],
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1020,15 +1029,15 @@ class CSSLayer:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSLayer:
+    def from_json(cls, json: CSSLayerJSON) -> CSSLayer:
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            text=json['text'],
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1049,14 +1058,14 @@ class CSSStartingStyle:
         if self.range_ is not None:
             json['range'] = self.range_.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSStartingStyle:
+    def from_json(cls, json: CSSStartingStyleJSON) -> CSSStartingStyle:
         return cls(
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            range_=SourceRange.from_json(_range_) if (_range_ := json.get('range')) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1084,11 +1093,11 @@ class CSSLayerData:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSLayerData:
+    def from_json(cls, json: CSSLayerDataJSON) -> CSSLayerData:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             order=float(json['order']),
-            sub_layers=[CSSLayerData.from_json(i) for i in json['subLayers']] if json.get('subLayers', None) is not None else None,
+            sub_layers=[CSSLayerData.from_json(i) for i in _sub_layers] if (_sub_layers := json.get('subLayers')) is not None else None,
         )
 
 
@@ -1118,11 +1127,11 @@ class PlatformFontUsage:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlatformFontUsage:
+    def from_json(cls, json: PlatformFontUsageJSON) -> PlatformFontUsage:
         return cls(
-            family_name=str(json['familyName']),
-            post_script_name=str(json['postScriptName']),
-            is_custom_font=bool(json['isCustomFont']),
+            family_name=json['familyName'],
+            post_script_name=json['postScriptName'],
+            is_custom_font=json['isCustomFont'],
             glyph_count=float(json['glyphCount']),
         )
 
@@ -1157,10 +1166,10 @@ class FontVariationAxis:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FontVariationAxis:
+    def from_json(cls, json: FontVariationAxisJSON) -> FontVariationAxis:
         return cls(
-            tag=str(json['tag']),
-            name=str(json['name']),
+            tag=json['tag'],
+            name=json['name'],
             min_value=float(json['minValue']),
             max_value=float(json['maxValue']),
             default_value=float(json['defaultValue']),
@@ -1219,18 +1228,18 @@ class FontFace:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FontFace:
+    def from_json(cls, json: FontFaceJSON) -> FontFace:
         return cls(
-            font_family=str(json['fontFamily']),
-            font_style=str(json['fontStyle']),
-            font_variant=str(json['fontVariant']),
-            font_weight=str(json['fontWeight']),
-            font_stretch=str(json['fontStretch']),
-            font_display=str(json['fontDisplay']),
-            unicode_range=str(json['unicodeRange']),
-            src=str(json['src']),
-            platform_font_family=str(json['platformFontFamily']),
-            font_variation_axes=[FontVariationAxis.from_json(i) for i in json['fontVariationAxes']] if json.get('fontVariationAxes', None) is not None else None,
+            font_family=json['fontFamily'],
+            font_style=json['fontStyle'],
+            font_variant=json['fontVariant'],
+            font_weight=json['fontWeight'],
+            font_stretch=json['fontStretch'],
+            font_display=json['fontDisplay'],
+            unicode_range=json['unicodeRange'],
+            src=json['src'],
+            platform_font_family=json['platformFontFamily'],
+            font_variation_axes=[FontVariationAxis.from_json(i) for i in _font_variation_axes] if (_font_variation_axes := json.get('fontVariationAxes')) is not None else None,
         )
 
 
@@ -1251,18 +1260,18 @@ class CSSTryRule:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['style'] = self.style.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSTryRule:
+    def from_json(cls, json: CSSTryRuleJSON) -> CSSTryRule:
         return cls(
             origin=StyleSheetOrigin.from_json(json['origin']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1289,21 +1298,21 @@ class CSSPositionTryRule:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['name'] = self.name.to_json()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['style'] = self.style.to_json()
         json['active'] = self.active
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSPositionTryRule:
+    def from_json(cls, json: CSSPositionTryRuleJSON) -> CSSPositionTryRule:
         return cls(
             name=Value.from_json(json['name']),
             origin=StyleSheetOrigin.from_json(json['origin']),
             style=CSSStyle.from_json(json['style']),
-            active=bool(json['active']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            active=json['active'],
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1325,7 +1334,7 @@ class CSSKeyframesRule:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSKeyframesRule:
+    def from_json(cls, json: CSSKeyframesRuleJSON) -> CSSKeyframesRule:
         return cls(
             animation_name=Value.from_json(json['animationName']),
             keyframes=[CSSKeyframeRule.from_json(i) for i in json['keyframes']],
@@ -1355,12 +1364,12 @@ class CSSPropertyRegistration:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRegistration:
+    def from_json(cls, json: CSSPropertyRegistrationJSON) -> CSSPropertyRegistration:
         return cls(
-            property_name=str(json['propertyName']),
-            inherits=bool(json['inherits']),
-            syntax=str(json['syntax']),
-            initial_value=Value.from_json(json['initialValue']) if json.get('initialValue', None) is not None else None,
+            property_name=json['propertyName'],
+            inherits=json['inherits'],
+            syntax=json['syntax'],
+            initial_value=Value.from_json(_initial_value) if (_initial_value := json.get('initialValue')) is not None else None,
         )
 
 
@@ -1384,20 +1393,20 @@ class CSSFontPaletteValuesRule:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['fontPaletteName'] = self.font_palette_name.to_json()
         json['style'] = self.style.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSFontPaletteValuesRule:
+    def from_json(cls, json: CSSFontPaletteValuesRuleJSON) -> CSSFontPaletteValuesRule:
         return cls(
             origin=StyleSheetOrigin.from_json(json['origin']),
             font_palette_name=Value.from_json(json['fontPaletteName']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1421,20 +1430,20 @@ class CSSPropertyRule:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['propertyName'] = self.property_name.to_json()
         json['style'] = self.style.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRule:
+    def from_json(cls, json: CSSPropertyRuleJSON) -> CSSPropertyRule:
         return cls(
             origin=StyleSheetOrigin.from_json(json['origin']),
             property_name=Value.from_json(json['propertyName']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1456,10 +1465,10 @@ class CSSFunctionParameter:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSFunctionParameter:
+    def from_json(cls, json: CSSFunctionParameterJSON) -> CSSFunctionParameter:
         return cls(
-            name=str(json['name']),
-            type_=str(json['type']),
+            name=json['name'],
+            type_=json['type'],
         )
 
 
@@ -1496,13 +1505,13 @@ class CSSFunctionConditionNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSFunctionConditionNode:
+    def from_json(cls, json: CSSFunctionConditionNodeJSON) -> CSSFunctionConditionNode:
         return cls(
             children=[CSSFunctionNode.from_json(i) for i in json['children']],
-            condition_text=str(json['conditionText']),
-            media=CSSMedia.from_json(json['media']) if json.get('media', None) is not None else None,
-            container_queries=CSSContainerQuery.from_json(json['containerQueries']) if json.get('containerQueries', None) is not None else None,
-            supports=CSSSupports.from_json(json['supports']) if json.get('supports', None) is not None else None,
+            condition_text=json['conditionText'],
+            media=CSSMedia.from_json(_media) if (_media := json.get('media')) is not None else None,
+            container_queries=CSSContainerQuery.from_json(_container_queries) if (_container_queries := json.get('containerQueries')) is not None else None,
+            supports=CSSSupports.from_json(_supports) if (_supports := json.get('supports')) is not None else None,
         )
 
 
@@ -1526,10 +1535,10 @@ class CSSFunctionNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSFunctionNode:
+    def from_json(cls, json: CSSFunctionNodeJSON) -> CSSFunctionNode:
         return cls(
-            condition=CSSFunctionConditionNode.from_json(json['condition']) if json.get('condition', None) is not None else None,
-            style=CSSStyle.from_json(json['style']) if json.get('style', None) is not None else None,
+            condition=CSSFunctionConditionNode.from_json(_condition) if (_condition := json.get('condition')) is not None else None,
+            style=CSSStyle.from_json(_style) if (_style := json.get('style')) is not None else None,
         )
 
 
@@ -1557,21 +1566,21 @@ class CSSFunctionRule:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['name'] = self.name.to_json()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['parameters'] = [i.to_json() for i in self.parameters]
         json['children'] = [i.to_json() for i in self.children]
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSFunctionRule:
+    def from_json(cls, json: CSSFunctionRuleJSON) -> CSSFunctionRule:
         return cls(
             name=Value.from_json(json['name']),
             origin=StyleSheetOrigin.from_json(json['origin']),
             parameters=[CSSFunctionParameter.from_json(i) for i in json['parameters']],
             children=[CSSFunctionNode.from_json(i) for i in json['children']],
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1595,20 +1604,20 @@ class CSSKeyframeRule:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['origin'] = self.origin.to_json()
+        json['origin'] = self.origin.value
         json['keyText'] = self.key_text.to_json()
         json['style'] = self.style.to_json()
         if self.style_sheet_id is not None:
-            json['styleSheetId'] = self.style_sheet_id.to_json()
+            json['styleSheetId'] = self.style_sheet_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSKeyframeRule:
+    def from_json(cls, json: CSSKeyframeRuleJSON) -> CSSKeyframeRule:
         return cls(
             origin=StyleSheetOrigin.from_json(json['origin']),
             key_text=Value.from_json(json['keyText']),
             style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            style_sheet_id=StyleSheetId(_style_sheet_id) if (_style_sheet_id := json.get('styleSheetId')) is not None else None,
         )
 
 
@@ -1628,26 +1637,30 @@ class StyleDeclarationEdit:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['styleSheetId'] = self.style_sheet_id.to_json()
+        json['styleSheetId'] = self.style_sheet_id
         json['range'] = self.range_.to_json()
         json['text'] = self.text
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StyleDeclarationEdit:
+    def from_json(cls, json: StyleDeclarationEditJSON) -> StyleDeclarationEdit:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
+            style_sheet_id=StyleSheetId(json['styleSheetId']),
             range_=SourceRange.from_json(json['range']),
-            text=str(json['text']),
+            text=json['text'],
         )
 
 
+def _parse_add_rule(json: AddRuleReturnsJSON) -> CSSRule:
+    return CSSRule.from_json(json['rule'])
+
+
 def add_rule(
         style_sheet_id: StyleSheetId,
         rule_text: str,
         location: SourceRange,
         node_for_property_syntax_validation: typing.Optional[dom.NodeId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSRule]:
+    ) -> Command[AddRuleReturnsJSON, CSSRule]:
     '''
     Inserts a new rule with the given ``ruleText`` in a stylesheet with given ``styleSheetId``, at the
     position specified by ``location``.
@@ -1659,22 +1672,21 @@ def add_rule(
     :returns: The newly created rule.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['ruleText'] = rule_text
     params['location'] = location.to_json()
     if node_for_property_syntax_validation is not None:
-        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.addRule',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSRule.from_json(json['rule'])
+        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation
+    return Command('CSS.addRule', params, _parse_add_rule)
+
+
+def _parse_collect_class_names(json: CollectClassNamesReturnsJSON) -> typing.List[str]:
+    return json['classNames']
 
 
 def collect_class_names(
         style_sheet_id: StyleSheetId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[CollectClassNamesReturnsJSON, typing.List[str]]:
     '''
     Returns all class names from specified stylesheet.
 
@@ -1682,19 +1694,18 @@ def collect_class_names(
     :returns: Class name list.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.collectClassNames',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    params['styleSheetId'] = style_sheet_id
+    return Command('CSS.collectClassNames', params, _parse_collect_class_names)
+
+
+def _parse_create_style_sheet(json: CreateStyleSheetReturnsJSON) -> StyleSheetId:
+    return StyleSheetId(json['styleSheetId'])
 
 
 def create_style_sheet(
         frame_id: page.FrameId,
         force: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,StyleSheetId]:
+    ) -> Command[CreateStyleSheetReturnsJSON, StyleSheetId]:
     '''
     Creates a new special "via-inspector" stylesheet in the frame with given ``frameId``.
 
@@ -1703,42 +1714,31 @@ def create_style_sheet(
     :returns: Identifier of the created "via-inspector" stylesheet.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     if force is not None:
         params['force'] = force
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.createStyleSheet',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return StyleSheetId.from_json(json['styleSheetId'])
+    return Command('CSS.createStyleSheet', params, _parse_create_style_sheet)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables the CSS agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.disable',
-    }
-    json = yield cmd_dict
+    return Command('CSS.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables the CSS agent for the given page. Clients should not assume that the CSS agent has been
     enabled until the result of this command is received.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.enable',
-    }
-    json = yield cmd_dict
+    return Command('CSS.enable')
 
 
 def force_pseudo_state(
         node_id: dom.NodeId,
         forced_pseudo_classes: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Ensures that the given node will have specified pseudo-classes whenever its style is computed by
     the browser.
@@ -1747,19 +1747,15 @@ def force_pseudo_state(
     :param forced_pseudo_classes: Element pseudo classes to force when computing the element's style.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['forcedPseudoClasses'] = [i for i in forced_pseudo_classes]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.forcePseudoState',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    params['forcedPseudoClasses'] = list(forced_pseudo_classes)
+    return Command('CSS.forcePseudoState', params)
 
 
 def force_starting_style(
         node_id: dom.NodeId,
         forced: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Ensures that the given node is in its starting-style state.
 
@@ -1767,18 +1763,22 @@ def force_starting_style(
     :param forced: Boolean indicating if this is on or off.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['forced'] = forced
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.forceStartingStyle',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('CSS.forceStartingStyle', params)
+
+
+def _parse_get_background_colors(json: GetBackgroundColorsReturnsJSON) -> typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]:
+    return (
+        json.get('backgroundColors'),
+        json.get('computedFontSize'),
+        json.get('computedFontWeight')
+    )
 
 
 def get_background_colors(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]]:
+    ) -> Command[GetBackgroundColorsReturnsJSON, typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]]:
     '''
     :param node_id: Id of the node to get background colors for.
     :returns: A tuple with the following items:
@@ -1788,22 +1788,17 @@ def get_background_colors(
         2. **computedFontWeight** - *(Optional)* The computed font weight for this node, as a CSS computed value string (e.g. 'normal' or '100').
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getBackgroundColors',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [str(i) for i in json['backgroundColors']] if json.get('backgroundColors', None) is not None else None,
-        str(json['computedFontSize']) if json.get('computedFontSize', None) is not None else None,
-        str(json['computedFontWeight']) if json.get('computedFontWeight', None) is not None else None
-    )
+    params['nodeId'] = node_id
+    return Command('CSS.getBackgroundColors', params, _parse_get_background_colors)
+
+
+def _parse_get_computed_style_for_node(json: GetComputedStyleForNodeReturnsJSON) -> typing.List[CSSComputedStyleProperty]:
+    return [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']]
 
 
 def get_computed_style_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSComputedStyleProperty]]:
+    ) -> Command[GetComputedStyleForNodeReturnsJSON, typing.List[CSSComputedStyleProperty]]:
     '''
     Returns the computed style for a DOM node identified by ``nodeId``.
 
@@ -1811,13 +1806,12 @@ def get_computed_style_for_node(
     :returns: Computed style for the specified DOM node.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getComputedStyleForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']]
+    params['nodeId'] = node_id
+    return Command('CSS.getComputedStyleForNode', params, _parse_get_computed_style_for_node)
+
+
+def _parse_resolve_values(json: ResolveValuesReturnsJSON) -> typing.List[str]:
+    return json['results']
 
 
 def resolve_values(
@@ -1826,7 +1820,7 @@ def resolve_values(
         property_name: typing.Optional[str] = None,
         pseudo_type: typing.Optional[dom.PseudoType] = None,
         pseudo_identifier: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[ResolveValuesReturnsJSON, typing.List[str]]:
     '''
     Resolve the specified values in the context of the provided element.
     For example, a value of '1em' is evaluated according to the computed
@@ -1841,26 +1835,25 @@ def resolve_values(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['values'] = [i for i in values]
-    params['nodeId'] = node_id.to_json()
+    params['values'] = list(values)
+    params['nodeId'] = node_id
     if property_name is not None:
         params['propertyName'] = property_name
     if pseudo_type is not None:
-        params['pseudoType'] = pseudo_type.to_json()
+        params['pseudoType'] = pseudo_type.value
     if pseudo_identifier is not None:
         params['pseudoIdentifier'] = pseudo_identifier
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.resolveValues',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['results']]
+    return Command('CSS.resolveValues', params, _parse_resolve_values)
+
+
+def _parse_get_longhand_properties(json: GetLonghandPropertiesReturnsJSON) -> typing.List[CSSProperty]:
+    return [CSSProperty.from_json(i) for i in json['longhandProperties']]
 
 
 def get_longhand_properties(
         shorthand_name: str,
         value: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSProperty]]:
+    ) -> Command[GetLonghandPropertiesReturnsJSON, typing.List[CSSProperty]]:
     '''
 
 
@@ -1873,17 +1866,19 @@ def get_longhand_properties(
     params: T_JSON_DICT = dict()
     params['shorthandName'] = shorthand_name
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getLonghandProperties',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [CSSProperty.from_json(i) for i in json['longhandProperties']]
+    return Command('CSS.getLonghandProperties', params, _parse_get_longhand_properties)
+
+
+def _parse_get_inline_styles_for_node(json: GetInlineStylesForNodeReturnsJSON) -> typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle]]:
+    return (
+        CSSStyle.from_json(_inline_style) if (_inline_style := json.get('inlineStyle')) is not None else None,
+        CSSStyle.from_json(_attributes_style) if (_attributes_style := json.get('attributesStyle')) is not None else None
+    )
 
 
 def get_inline_styles_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle]]]:
+    ) -> Command[GetInlineStylesForNodeReturnsJSON, typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle]]]:
     '''
     Returns the styles defined inline (explicitly in the "style" attribute and implicitly, using DOM
     attributes) for a DOM node identified by ``nodeId``.
@@ -1895,21 +1890,21 @@ def get_inline_styles_for_node(
         1. **attributesStyle** - *(Optional)* Attribute-defined element style (e.g. resulting from "width=20 height=100%").
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getInlineStylesForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    return Command('CSS.getInlineStylesForNode', params, _parse_get_inline_styles_for_node)
+
+
+def _parse_get_animated_styles_for_node(json: GetAnimatedStylesForNodeReturnsJSON) -> typing.Tuple[typing.Optional[typing.List[CSSAnimationStyle]], typing.Optional[CSSStyle], typing.Optional[typing.List[InheritedAnimatedStyleEntry]]]:
     return (
-        CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
-        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None
+        [CSSAnimationStyle.from_json(i) for i in _animation_styles] if (_animation_styles := json.get('animationStyles')) is not None else None,
+        CSSStyle.from_json(_transitions_style) if (_transitions_style := json.get('transitionsStyle')) is not None else None,
+        [InheritedAnimatedStyleEntry.from_json(i) for i in _inherited] if (_inherited := json.get('inherited')) is not None else None
     )
 
 
 def get_animated_styles_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[CSSAnimationStyle]], typing.Optional[CSSStyle], typing.Optional[typing.List[InheritedAnimatedStyleEntry]]]]:
+    ) -> Command[GetAnimatedStylesForNodeReturnsJSON, typing.Tuple[typing.Optional[typing.List[CSSAnimationStyle]], typing.Optional[CSSStyle], typing.Optional[typing.List[InheritedAnimatedStyleEntry]]]]:
     '''
     Returns the styles coming from animations & transitions
     including the animation & transition styles coming from inheritance chain.
@@ -1924,22 +1919,32 @@ def get_animated_styles_for_node(
         2. **inherited** - *(Optional)* Inherited style entries for animationsStyle and transitionsStyle from the inheritance chain of the element.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getAnimatedStylesForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    return Command('CSS.getAnimatedStylesForNode', params, _parse_get_animated_styles_for_node)
+
+
+def _parse_get_matched_styles_for_node(json: GetMatchedStylesForNodeReturnsJSON) -> typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle], typing.Optional[typing.List[RuleMatch]], typing.Optional[typing.List[PseudoElementMatches]], typing.Optional[typing.List[InheritedStyleEntry]], typing.Optional[typing.List[InheritedPseudoElementMatches]], typing.Optional[typing.List[CSSKeyframesRule]], typing.Optional[typing.List[CSSPositionTryRule]], typing.Optional[int], typing.Optional[typing.List[CSSPropertyRule]], typing.Optional[typing.List[CSSPropertyRegistration]], typing.Optional[CSSFontPaletteValuesRule], typing.Optional[dom.NodeId], typing.Optional[typing.List[CSSFunctionRule]]]:
     return (
-        [CSSAnimationStyle.from_json(i) for i in json['animationStyles']] if json.get('animationStyles', None) is not None else None,
-        CSSStyle.from_json(json['transitionsStyle']) if json.get('transitionsStyle', None) is not None else None,
-        [InheritedAnimatedStyleEntry.from_json(i) for i in json['inherited']] if json.get('inherited', None) is not None else None
+        CSSStyle.from_json(_inline_style) if (_inline_style := json.get('inlineStyle')) is not None else None,
+        CSSStyle.from_json(_attributes_style) if (_attributes_style := json.get('attributesStyle')) is not None else None,
+        [RuleMatch.from_json(i) for i in _matched_css_rules] if (_matched_css_rules := json.get('matchedCSSRules')) is not None else None,
+        [PseudoElementMatches.from_json(i) for i in _pseudo_elements] if (_pseudo_elements := json.get('pseudoElements')) is not None else None,
+        [InheritedStyleEntry.from_json(i) for i in _inherited] if (_inherited := json.get('inherited')) is not None else None,
+        [InheritedPseudoElementMatches.from_json(i) for i in _inherited_pseudo_elements] if (_inherited_pseudo_elements := json.get('inheritedPseudoElements')) is not None else None,
+        [CSSKeyframesRule.from_json(i) for i in _css_keyframes_rules] if (_css_keyframes_rules := json.get('cssKeyframesRules')) is not None else None,
+        [CSSPositionTryRule.from_json(i) for i in _css_position_try_rules] if (_css_position_try_rules := json.get('cssPositionTryRules')) is not None else None,
+        json.get('activePositionFallbackIndex'),
+        [CSSPropertyRule.from_json(i) for i in _css_property_rules] if (_css_property_rules := json.get('cssPropertyRules')) is not None else None,
+        [CSSPropertyRegistration.from_json(i) for i in _css_property_registrations] if (_css_property_registrations := json.get('cssPropertyRegistrations')) is not None else None,
+        CSSFontPaletteValuesRule.from_json(_css_font_palette_values_rule) if (_css_font_palette_values_rule := json.get('cssFontPaletteValuesRule')) is not None else None,
+        dom.NodeId(_parent_layout_node_id) if (_parent_layout_node_id := json.get('parentLayoutNodeId')) is not None else None,
+        [CSSFunctionRule.from_json(i) for i in _css_function_rules] if (_css_function_rules := json.get('cssFunctionRules')) is not None else None
     )
 
 
 def get_matched_styles_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle], typing.Optional[typing.List[RuleMatch]], typing.Optional[typing.List[PseudoElementMatches]], typing.Optional[typing.List[InheritedStyleEntry]], typing.Optional[typing.List[InheritedPseudoElementMatches]], typing.Optional[typing.List[CSSKeyframesRule]], typing.Optional[typing.List[CSSPositionTryRule]], typing.Optional[int], typing.Optional[typing.List[CSSPropertyRule]], typing.Optional[typing.List[CSSPropertyRegistration]], typing.Optional[CSSFontPaletteValuesRule], typing.Optional[dom.NodeId], typing.Optional[typing.List[CSSFunctionRule]]]]:
+    ) -> Command[GetMatchedStylesForNodeReturnsJSON, typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle], typing.Optional[typing.List[RuleMatch]], typing.Optional[typing.List[PseudoElementMatches]], typing.Optional[typing.List[InheritedStyleEntry]], typing.Optional[typing.List[InheritedPseudoElementMatches]], typing.Optional[typing.List[CSSKeyframesRule]], typing.Optional[typing.List[CSSPositionTryRule]], typing.Optional[int], typing.Optional[typing.List[CSSPropertyRule]], typing.Optional[typing.List[CSSPropertyRegistration]], typing.Optional[CSSFontPaletteValuesRule], typing.Optional[dom.NodeId], typing.Optional[typing.List[CSSFunctionRule]]]]:
     '''
     Returns requested styles for a DOM node identified by ``nodeId``.
 
@@ -1962,46 +1967,30 @@ def get_matched_styles_for_node(
         13. **cssFunctionRules** - *(Optional)* A list of CSS at-function rules referenced by styles of this node.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getMatchedStylesForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
-        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None,
-        [RuleMatch.from_json(i) for i in json['matchedCSSRules']] if json.get('matchedCSSRules', None) is not None else None,
-        [PseudoElementMatches.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
-        [InheritedStyleEntry.from_json(i) for i in json['inherited']] if json.get('inherited', None) is not None else None,
-        [InheritedPseudoElementMatches.from_json(i) for i in json['inheritedPseudoElements']] if json.get('inheritedPseudoElements', None) is not None else None,
-        [CSSKeyframesRule.from_json(i) for i in json['cssKeyframesRules']] if json.get('cssKeyframesRules', None) is not None else None,
-        [CSSPositionTryRule.from_json(i) for i in json['cssPositionTryRules']] if json.get('cssPositionTryRules', None) is not None else None,
-        int(json['activePositionFallbackIndex']) if json.get('activePositionFallbackIndex', None) is not None else None,
-        [CSSPropertyRule.from_json(i) for i in json['cssPropertyRules']] if json.get('cssPropertyRules', None) is not None else None,
-        [CSSPropertyRegistration.from_json(i) for i in json['cssPropertyRegistrations']] if json.get('cssPropertyRegistrations', None) is not None else None,
-        CSSFontPaletteValuesRule.from_json(json['cssFontPaletteValuesRule']) if json.get('cssFontPaletteValuesRule', None) is not None else None,
-        dom.NodeId.from_json(json['parentLayoutNodeId']) if json.get('parentLayoutNodeId', None) is not None else None,
-        [CSSFunctionRule.from_json(i) for i in json['cssFunctionRules']] if json.get('cssFunctionRules', None) is not None else None
-    )
+    params['nodeId'] = node_id
+    return Command('CSS.getMatchedStylesForNode', params, _parse_get_matched_styles_for_node)
+
+
+def _parse_get_media_queries(json: GetMediaQueriesReturnsJSON) -> typing.List[CSSMedia]:
+    return [CSSMedia.from_json(i) for i in json['medias']]
 
 
-def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSMedia]]:
+def get_media_queries() -> Command[GetMediaQueriesReturnsJSON, typing.List[CSSMedia]]:
     '''
     Returns all media queries parsed by the rendering engine.
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getMediaQueries',
-    }
-    json = yield cmd_dict
-    return [CSSMedia.from_json(i) for i in json['medias']]
+    return Command('CSS.getMediaQueries', None, _parse_get_media_queries)
+
+
+def _parse_get_platform_fonts_for_node(json: GetPlatformFontsForNodeReturnsJSON) -> typing.List[PlatformFontUsage]:
+    return [PlatformFontUsage.from_json(i) for i in json['fonts']]
 
 
 def get_platform_fonts_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PlatformFontUsage]]:
+    ) -> Command[GetPlatformFontsForNodeReturnsJSON, typing.List[PlatformFontUsage]]:
     '''
     Requests information about platform fonts which we used to render child TextNodes in the given
     node.
@@ -2010,18 +1999,17 @@ def get_platform_fonts_for_node(
     :returns: Usage statistics for every employed platform font.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getPlatformFontsForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [PlatformFontUsage.from_json(i) for i in json['fonts']]
+    params['nodeId'] = node_id
+    return Command('CSS.getPlatformFontsForNode', params, _parse_get_platform_fonts_for_node)
+
+
+def _parse_get_style_sheet_text(json: GetStyleSheetTextReturnsJSON) -> str:
+    return json['text']
 
 
 def get_style_sheet_text(
         style_sheet_id: StyleSheetId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[GetStyleSheetTextReturnsJSON, str]:
     '''
     Returns the current textual content for a stylesheet.
 
@@ -2029,18 +2017,17 @@ def get_style_sheet_text(
     :returns: The stylesheet text.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getStyleSheetText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['text'])
+    params['styleSheetId'] = style_sheet_id
+    return Command('CSS.getStyleSheetText', params, _parse_get_style_sheet_text)
+
+
+def _parse_get_layers_for_node(json: GetLayersForNodeReturnsJSON) -> CSSLayerData:
+    return CSSLayerData.from_json(json['rootLayer'])
 
 
 def get_layers_for_node(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSLayerData]:
+    ) -> Command[GetLayersForNodeReturnsJSON, CSSLayerData]:
     '''
     Returns all layers parsed by the rendering engine for the tree scope of a node.
     Given a DOM element identified by nodeId, getLayersForNode returns the root
@@ -2053,19 +2040,18 @@ def get_layers_for_node(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getLayersForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSLayerData.from_json(json['rootLayer'])
+    params['nodeId'] = node_id
+    return Command('CSS.getLayersForNode', params, _parse_get_layers_for_node)
+
+
+def _parse_get_location_for_selector(json: GetLocationForSelectorReturnsJSON) -> typing.List[SourceRange]:
+    return [SourceRange.from_json(i) for i in json['ranges']]
 
 
 def get_location_for_selector(
         style_sheet_id: StyleSheetId,
         selector_text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[SourceRange]]:
+    ) -> Command[GetLocationForSelectorReturnsJSON, typing.List[SourceRange]]:
     '''
     Given a CSS selector text and a style sheet ID, getLocationForSelector
     returns an array of locations of the CSS selector in the style sheet.
@@ -2077,19 +2063,14 @@ def get_location_for_selector(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['selectorText'] = selector_text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.getLocationForSelector',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [SourceRange.from_json(i) for i in json['ranges']]
+    return Command('CSS.getLocationForSelector', params, _parse_get_location_for_selector)
 
 
 def track_computed_style_updates_for_node(
         node_id: typing.Optional[dom.NodeId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts tracking the given node for the computed style updates
     and whenever the computed style is updated for node, it queues
@@ -2104,17 +2085,13 @@ def track_computed_style_updates_for_node(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.trackComputedStyleUpdatesForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['nodeId'] = node_id
+    return Command('CSS.trackComputedStyleUpdatesForNode', params)
 
 
 def track_computed_style_updates(
         properties_to_track: typing.List[CSSComputedStyleProperty]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts tracking the given computed styles for updates. The specified array of properties
     replaces the one previously specified. Pass empty array to disable tracking.
@@ -2129,14 +2106,14 @@ def track_computed_style_updates(
     '''
     params: T_JSON_DICT = dict()
     params['propertiesToTrack'] = [i.to_json() for i in properties_to_track]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.trackComputedStyleUpdates',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('CSS.trackComputedStyleUpdates', params)
+
 
+def _parse_take_computed_style_updates(json: TakeComputedStyleUpdatesReturnsJSON) -> typing.List[dom.NodeId]:
+    return [dom.NodeId(i) for i in json['nodeIds']]
 
-def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[dom.NodeId]]:
+
+def take_computed_style_updates() -> Command[TakeComputedStyleUpdatesReturnsJSON, typing.List[dom.NodeId]]:
     '''
     Polls the next batch of computed style updates.
 
@@ -2144,18 +2121,14 @@ def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ty
 
     :returns: The list of node Ids that have their tracked computed styles updated.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.takeComputedStyleUpdates',
-    }
-    json = yield cmd_dict
-    return [dom.NodeId.from_json(i) for i in json['nodeIds']]
+    return Command('CSS.takeComputedStyleUpdates', None, _parse_take_computed_style_updates)
 
 
 def set_effective_property_value_for_node(
         node_id: dom.NodeId,
         property_name: str,
         value: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Find a rule with the given active property for the given node and set the new value for this
     property
@@ -2165,21 +2138,21 @@ def set_effective_property_value_for_node(
     :param value:
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['propertyName'] = property_name
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setEffectivePropertyValueForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('CSS.setEffectivePropertyValueForNode', params)
+
+
+def _parse_set_property_rule_property_name(json: SetPropertyRulePropertyNameReturnsJSON) -> Value:
+    return Value.from_json(json['propertyName'])
 
 
 def set_property_rule_property_name(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         property_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Value]:
+    ) -> Command[SetPropertyRulePropertyNameReturnsJSON, Value]:
     '''
     Modifies the property rule property name.
 
@@ -2189,22 +2162,21 @@ def set_property_rule_property_name(
     :returns: The resulting key text after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['propertyName'] = property_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setPropertyRulePropertyName',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Value.from_json(json['propertyName'])
+    return Command('CSS.setPropertyRulePropertyName', params, _parse_set_property_rule_property_name)
+
+
+def _parse_set_keyframe_key(json: SetKeyframeKeyReturnsJSON) -> Value:
+    return Value.from_json(json['keyText'])
 
 
 def set_keyframe_key(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         key_text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Value]:
+    ) -> Command[SetKeyframeKeyReturnsJSON, Value]:
     '''
     Modifies the keyframe rule key text.
 
@@ -2214,22 +2186,21 @@ def set_keyframe_key(
     :returns: The resulting key text after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['keyText'] = key_text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setKeyframeKey',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Value.from_json(json['keyText'])
+    return Command('CSS.setKeyframeKey', params, _parse_set_keyframe_key)
+
+
+def _parse_set_media_text(json: SetMediaTextReturnsJSON) -> CSSMedia:
+    return CSSMedia.from_json(json['media'])
 
 
 def set_media_text(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSMedia]:
+    ) -> Command[SetMediaTextReturnsJSON, CSSMedia]:
     '''
     Modifies the rule selector.
 
@@ -2239,22 +2210,21 @@ def set_media_text(
     :returns: The resulting CSS media rule after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setMediaText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSMedia.from_json(json['media'])
+    return Command('CSS.setMediaText', params, _parse_set_media_text)
+
+
+def _parse_set_container_query_text(json: SetContainerQueryTextReturnsJSON) -> CSSContainerQuery:
+    return CSSContainerQuery.from_json(json['containerQuery'])
 
 
 def set_container_query_text(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSContainerQuery]:
+    ) -> Command[SetContainerQueryTextReturnsJSON, CSSContainerQuery]:
     '''
     Modifies the expression of a container query.
 
@@ -2266,22 +2236,21 @@ def set_container_query_text(
     :returns: The resulting CSS container query rule after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setContainerQueryText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSContainerQuery.from_json(json['containerQuery'])
+    return Command('CSS.setContainerQueryText', params, _parse_set_container_query_text)
+
+
+def _parse_set_supports_text(json: SetSupportsTextReturnsJSON) -> CSSSupports:
+    return CSSSupports.from_json(json['supports'])
 
 
 def set_supports_text(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSSupports]:
+    ) -> Command[SetSupportsTextReturnsJSON, CSSSupports]:
     '''
     Modifies the expression of a supports at-rule.
 
@@ -2293,22 +2262,21 @@ def set_supports_text(
     :returns: The resulting CSS Supports rule after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setSupportsText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSSupports.from_json(json['supports'])
+    return Command('CSS.setSupportsText', params, _parse_set_supports_text)
+
+
+def _parse_set_scope_text(json: SetScopeTextReturnsJSON) -> CSSScope:
+    return CSSScope.from_json(json['scope'])
 
 
 def set_scope_text(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSScope]:
+    ) -> Command[SetScopeTextReturnsJSON, CSSScope]:
     '''
     Modifies the expression of a scope at-rule.
 
@@ -2320,22 +2288,21 @@ def set_scope_text(
     :returns: The resulting CSS Scope rule after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setScopeText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return CSSScope.from_json(json['scope'])
+    return Command('CSS.setScopeText', params, _parse_set_scope_text)
+
+
+def _parse_set_rule_selector(json: SetRuleSelectorReturnsJSON) -> SelectorList:
+    return SelectorList.from_json(json['selectorList'])
 
 
 def set_rule_selector(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
         selector: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SelectorList]:
+    ) -> Command[SetRuleSelectorReturnsJSON, SelectorList]:
     '''
     Modifies the rule selector.
 
@@ -2345,21 +2312,20 @@ def set_rule_selector(
     :returns: The resulting selector list after modification.
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['range'] = range_.to_json()
     params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setRuleSelector',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SelectorList.from_json(json['selectorList'])
+    return Command('CSS.setRuleSelector', params, _parse_set_rule_selector)
+
+
+def _parse_set_style_sheet_text(json: SetStyleSheetTextReturnsJSON) -> typing.Optional[str]:
+    return json.get('sourceMapURL')
 
 
 def set_style_sheet_text(
         style_sheet_id: StyleSheetId,
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[str]]:
+    ) -> Command[SetStyleSheetTextReturnsJSON, typing.Optional[str]]:
     '''
     Sets the new stylesheet text.
 
@@ -2368,20 +2334,19 @@ def set_style_sheet_text(
     :returns: *(Optional)* URL of source map associated with script (if any).
     '''
     params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
+    params['styleSheetId'] = style_sheet_id
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setStyleSheetText',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None
+    return Command('CSS.setStyleSheetText', params, _parse_set_style_sheet_text)
+
+
+def _parse_set_style_texts(json: SetStyleTextsReturnsJSON) -> typing.List[CSSStyle]:
+    return [CSSStyle.from_json(i) for i in json['styles']]
 
 
 def set_style_texts(
         edits: typing.List[StyleDeclarationEdit],
         node_for_property_syntax_validation: typing.Optional[dom.NodeId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSStyle]]:
+    ) -> Command[SetStyleTextsReturnsJSON, typing.List[CSSStyle]]:
     '''
     Applies specified style edits one after another in the given order.
 
@@ -2392,40 +2357,39 @@ def set_style_texts(
     params: T_JSON_DICT = dict()
     params['edits'] = [i.to_json() for i in edits]
     if node_for_property_syntax_validation is not None:
-        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setStyleTexts',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [CSSStyle.from_json(i) for i in json['styles']]
+        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation
+    return Command('CSS.setStyleTexts', params, _parse_set_style_texts)
 
 
-def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def start_rule_usage_tracking() -> Command[T_JSON_DICT, None]:
     '''
     Enables the selector recording.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.startRuleUsageTracking',
-    }
-    json = yield cmd_dict
+    return Command('CSS.startRuleUsageTracking')
 
 
-def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RuleUsage]]:
+def _parse_stop_rule_usage_tracking(json: StopRuleUsageTrackingReturnsJSON) -> typing.List[RuleUsage]:
+    return [RuleUsage.from_json(i) for i in json['ruleUsage']]
+
+
+def stop_rule_usage_tracking() -> Command[StopRuleUsageTrackingReturnsJSON, typing.List[RuleUsage]]:
     '''
     Stop tracking rule usage and return the list of rules that were used since last call to
     ``takeCoverageDelta`` (or since start of coverage instrumentation).
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.stopRuleUsageTracking',
-    }
-    json = yield cmd_dict
-    return [RuleUsage.from_json(i) for i in json['ruleUsage']]
+    return Command('CSS.stopRuleUsageTracking', None, _parse_stop_rule_usage_tracking)
+
+
+def _parse_take_coverage_delta(json: TakeCoverageDeltaReturnsJSON) -> typing.Tuple[typing.List[RuleUsage], float]:
+    return (
+        [RuleUsage.from_json(i) for i in json['coverage']],
+        float(json['timestamp'])
+    )
 
 
-def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[RuleUsage], float]]:
+def take_coverage_delta() -> Command[TakeCoverageDeltaReturnsJSON, typing.Tuple[typing.List[RuleUsage], float]]:
     '''
     Obtain list of rules that became used since last call to this method (or since start of coverage
     instrumentation).
@@ -2435,19 +2399,12 @@ def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tup
         0. **coverage** - 
         1. **timestamp** - Monotonically increasing time, in seconds.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.takeCoverageDelta',
-    }
-    json = yield cmd_dict
-    return (
-        [RuleUsage.from_json(i) for i in json['coverage']],
-        float(json['timestamp'])
-    )
+    return Command('CSS.takeCoverageDelta', None, _parse_take_coverage_delta)
 
 
 def set_local_fonts_enabled(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables/disables rendering of local CSS fonts (enabled by default).
 
@@ -2457,11 +2414,7 @@ def set_local_fonts_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'CSS.setLocalFontsEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('CSS.setLocalFontsEnabled', params)
 
 
 @event_class('CSS.fontsUpdated')
@@ -2475,9 +2428,9 @@ class FontsUpdated:
     font: typing.Optional[FontFace]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FontsUpdated:
+    def from_json(cls, json: FontsUpdatedJSON) -> FontsUpdated:
         return cls(
-            font=FontFace.from_json(json['font']) if json.get('font', None) is not None else None
+            font=FontFace.from_json(_font) if (_font := json.get('font')) is not None else None
         )
 
 
@@ -2507,7 +2460,7 @@ class StyleSheetAdded:
     header: CSSStyleSheetHeader
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StyleSheetAdded:
+    def from_json(cls, json: StyleSheetAddedJSON) -> StyleSheetAdded:
         return cls(
             header=CSSStyleSheetHeader.from_json(json['header'])
         )
@@ -2522,9 +2475,9 @@ class StyleSheetChanged:
     style_sheet_id: StyleSheetId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StyleSheetChanged:
+    def from_json(cls, json: StyleSheetChangedJSON) -> StyleSheetChanged:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            style_sheet_id=StyleSheetId(json['styleSheetId'])
         )
 
 
@@ -2538,9 +2491,9 @@ class StyleSheetRemoved:
     style_sheet_id: StyleSheetId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StyleSheetRemoved:
+    def from_json(cls, json: StyleSheetRemovedJSON) -> StyleSheetRemoved:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            style_sheet_id=StyleSheetId(json['styleSheetId'])
         )
 
 
@@ -2556,7 +2509,527 @@ class ComputedStyleUpdated:
     node_id: dom.NodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ComputedStyleUpdated:
+    def from_json(cls, json: ComputedStyleUpdatedJSON) -> ComputedStyleUpdated:
         return cls(
-            node_id=dom.NodeId.from_json(json['nodeId'])
+            node_id=dom.NodeId(json['nodeId'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _PseudoElementMatchesJSON(typing.TypedDict):
+        pseudoType: str
+        matches: typing.List[RuleMatchJSON]
+
+
+    class PseudoElementMatchesJSON(_PseudoElementMatchesJSON, total=False):
+        pseudoIdentifier: str
+
+
+    class _CSSAnimationStyleJSON(typing.TypedDict):
+        style: CSSStyleJSON
+
+
+    class CSSAnimationStyleJSON(_CSSAnimationStyleJSON, total=False):
+        name: str
+
+
+    class _InheritedStyleEntryJSON(typing.TypedDict):
+        matchedCSSRules: typing.List[RuleMatchJSON]
+
+
+    class InheritedStyleEntryJSON(_InheritedStyleEntryJSON, total=False):
+        inlineStyle: CSSStyleJSON
+
+
+    class InheritedAnimatedStyleEntryJSON(typing.TypedDict, total=False):
+        animationStyles: typing.List[CSSAnimationStyleJSON]
+        transitionsStyle: CSSStyleJSON
+
+
+    class InheritedPseudoElementMatchesJSON(typing.TypedDict):
+        pseudoElements: typing.List[PseudoElementMatchesJSON]
+
+
+    class RuleMatchJSON(typing.TypedDict):
+        rule: CSSRuleJSON
+        matchingSelectors: typing.List[int]
+
+
+    class _ValueJSON(typing.TypedDict):
+        text: str
+
+
+    class ValueJSON(_ValueJSON, total=False):
+        range: SourceRangeJSON
+        specificity: SpecificityJSON
+
+
+    class SpecificityJSON(typing.TypedDict):
+        a: int
+        b: int
+        c: int
+
+
+    class SelectorListJSON(typing.TypedDict):
+        selectors: typing.List[ValueJSON]
+        text: str
+
+
+    class _CSSStyleSheetHeaderJSON(typing.TypedDict):
+        styleSheetId: str
+        frameId: str
+        sourceURL: str
+        origin: str
+        title: str
+        disabled: bool
+        isInline: bool
+        isMutable: bool
+        isConstructed: bool
+        startLine: float
+        startColumn: float
+        length: float
+        endLine: float
+        endColumn: float
+
+
+    class CSSStyleSheetHeaderJSON(_CSSStyleSheetHeaderJSON, total=False):
+        sourceMapURL: str
+        ownerNode: int
+        hasSourceURL: bool
+        loadingFailed: bool
+
+
+    class _CSSRuleJSON(typing.TypedDict):
+        selectorList: SelectorListJSON
+        origin: str
+        style: CSSStyleJSON
+
+
+    class CSSRuleJSON(_CSSRuleJSON, total=False):
+        styleSheetId: str
+        nestingSelectors: typing.List[str]
+        media: typing.List[CSSMediaJSON]
+        containerQueries: typing.List[CSSContainerQueryJSON]
+        supports: typing.List[CSSSupportsJSON]
+        layers: typing.List[CSSLayerJSON]
+        scopes: typing.List[CSSScopeJSON]
+        ruleTypes: typing.List[str]
+        startingStyles: typing.List[CSSStartingStyleJSON]
+
+
+    class RuleUsageJSON(typing.TypedDict):
+        styleSheetId: str
+        startOffset: float
+        endOffset: float
+        used: bool
+
+
+    class SourceRangeJSON(typing.TypedDict):
+        startLine: int
+        startColumn: int
+        endLine: int
+        endColumn: int
+
+
+    class _ShorthandEntryJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class ShorthandEntryJSON(_ShorthandEntryJSON, total=False):
+        important: bool
+
+
+    class CSSComputedStylePropertyJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class _CSSStyleJSON(typing.TypedDict):
+        cssProperties: typing.List[CSSPropertyJSON]
+        shorthandEntries: typing.List[ShorthandEntryJSON]
+
+
+    class CSSStyleJSON(_CSSStyleJSON, total=False):
+        styleSheetId: str
+        cssText: str
+        range: SourceRangeJSON
+
+
+    class _CSSPropertyJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class CSSPropertyJSON(_CSSPropertyJSON, total=False):
+        important: bool
+        implicit: bool
+        text: str
+        parsedOk: bool
+        disabled: bool
+        range: SourceRangeJSON
+        longhandProperties: typing.List[CSSPropertyJSON]
+
+
+    class _CSSMediaJSON(typing.TypedDict):
+        text: str
+        source: str
+
+
+    class CSSMediaJSON(_CSSMediaJSON, total=False):
+        sourceURL: str
+        range: SourceRangeJSON
+        styleSheetId: str
+        mediaList: typing.List[MediaQueryJSON]
+
+
+    class MediaQueryJSON(typing.TypedDict):
+        expressions: typing.List[MediaQueryExpressionJSON]
+        active: bool
+
+
+    class _MediaQueryExpressionJSON(typing.TypedDict):
+        value: float
+        unit: str
+        feature: str
+
+
+    class MediaQueryExpressionJSON(_MediaQueryExpressionJSON, total=False):
+        valueRange: SourceRangeJSON
+        computedLength: float
+
+
+    class _CSSContainerQueryJSON(typing.TypedDict):
+        text: str
+
+
+    class CSSContainerQueryJSON(_CSSContainerQueryJSON, total=False):
+        range: SourceRangeJSON
+        styleSheetId: str
+        name: str
+        physicalAxes: str
+        logicalAxes: str
+        queriesScrollState: bool
+
+
+    class _CSSSupportsJSON(typing.TypedDict):
+        text: str
+        active: bool
+
+
+    class CSSSupportsJSON(_CSSSupportsJSON, total=False):
+        range: SourceRangeJSON
+        styleSheetId: str
+
+
+    class _CSSScopeJSON(typing.TypedDict):
+        text: str
+
+
+    class CSSScopeJSON(_CSSScopeJSON, total=False):
+        range: SourceRangeJSON
+        styleSheetId: str
+
+
+    class _CSSLayerJSON(typing.TypedDict):
+        text: str
+
+
+    class CSSLayerJSON(_CSSLayerJSON, total=False):
+        range: SourceRangeJSON
+        styleSheetId: str
+
+
+    class CSSStartingStyleJSON(typing.TypedDict, total=False):
+        range: SourceRangeJSON
+        styleSheetId: str
+
+
+    class _CSSLayerDataJSON(typing.TypedDict):
+        name: str
+        order: float
+
+
+    class CSSLayerDataJSON(_CSSLayerDataJSON, total=False):
+        subLayers: typing.List[CSSLayerDataJSON]
+
+
+    class PlatformFontUsageJSON(typing.TypedDict):
+        familyName: str
+        postScriptName: str
+        isCustomFont: bool
+        glyphCount: float
+
+
+    class FontVariationAxisJSON(typing.TypedDict):
+        tag: str
+        name: str
+        minValue: float
+        maxValue: float
+        defaultValue: float
+
+
+    class _FontFaceJSON(typing.TypedDict):
+        fontFamily: str
+        fontStyle: str
+        fontVariant: str
+        fontWeight: str
+        fontStretch: str
+        fontDisplay: str
+        unicodeRange: str
+        src: str
+        platformFontFamily: str
+
+
+    class FontFaceJSON(_FontFaceJSON, total=False):
+        fontVariationAxes: typing.List[FontVariationAxisJSON]
+
+
+    class _CSSTryRuleJSON(typing.TypedDict):
+        origin: str
+        style: CSSStyleJSON
+
+
+    class CSSTryRuleJSON(_CSSTryRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class _CSSPositionTryRuleJSON(typing.TypedDict):
+        name: ValueJSON
+        origin: str
+        style: CSSStyleJSON
+        active: bool
+
+
+    class CSSPositionTryRuleJSON(_CSSPositionTryRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class CSSKeyframesRuleJSON(typing.TypedDict):
+        animationName: ValueJSON
+        keyframes: typing.List[CSSKeyframeRuleJSON]
+
+
+    class _CSSPropertyRegistrationJSON(typing.TypedDict):
+        propertyName: str
+        inherits: bool
+        syntax: str
+
+
+    class CSSPropertyRegistrationJSON(_CSSPropertyRegistrationJSON, total=False):
+        initialValue: ValueJSON
+
+
+    class _CSSFontPaletteValuesRuleJSON(typing.TypedDict):
+        origin: str
+        fontPaletteName: ValueJSON
+        style: CSSStyleJSON
+
+
+    class CSSFontPaletteValuesRuleJSON(_CSSFontPaletteValuesRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class _CSSPropertyRuleJSON(typing.TypedDict):
+        origin: str
+        propertyName: ValueJSON
+        style: CSSStyleJSON
+
+
+    class CSSPropertyRuleJSON(_CSSPropertyRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class CSSFunctionParameterJSON(typing.TypedDict):
+        name: str
+        type: str
+
+
+    class _CSSFunctionConditionNodeJSON(typing.TypedDict):
+        children: typing.List[CSSFunctionNodeJSON]
+        conditionText: str
+
+
+    class CSSFunctionConditionNodeJSON(_CSSFunctionConditionNodeJSON, total=False):
+        media: CSSMediaJSON
+        containerQueries: CSSContainerQueryJSON
+        supports: CSSSupportsJSON
+
+
+    class CSSFunctionNodeJSON(typing.TypedDict, total=False):
+        condition: CSSFunctionConditionNodeJSON
+        style: CSSStyleJSON
+
+
+    class _CSSFunctionRuleJSON(typing.TypedDict):
+        name: ValueJSON
+        origin: str
+        parameters: typing.List[CSSFunctionParameterJSON]
+        children: typing.List[CSSFunctionNodeJSON]
+
+
+    class CSSFunctionRuleJSON(_CSSFunctionRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class _CSSKeyframeRuleJSON(typing.TypedDict):
+        origin: str
+        keyText: ValueJSON
+        style: CSSStyleJSON
+
+
+    class CSSKeyframeRuleJSON(_CSSKeyframeRuleJSON, total=False):
+        styleSheetId: str
+
+
+    class StyleDeclarationEditJSON(typing.TypedDict):
+        styleSheetId: str
+        range: SourceRangeJSON
+        text: str
+
+
+    class AddRuleReturnsJSON(typing.TypedDict):
+        rule: CSSRuleJSON
+
+
+    class CollectClassNamesReturnsJSON(typing.TypedDict):
+        classNames: typing.List[str]
+
+
+    class CreateStyleSheetReturnsJSON(typing.TypedDict):
+        styleSheetId: str
+
+
+    class GetBackgroundColorsReturnsJSON(typing.TypedDict, total=False):
+        backgroundColors: typing.List[str]
+        computedFontSize: str
+        computedFontWeight: str
+
+
+    class GetComputedStyleForNodeReturnsJSON(typing.TypedDict):
+        computedStyle: typing.List[CSSComputedStylePropertyJSON]
+
+
+    class ResolveValuesReturnsJSON(typing.TypedDict):
+        results: typing.List[str]
+
+
+    class GetLonghandPropertiesReturnsJSON(typing.TypedDict):
+        longhandProperties: typing.List[CSSPropertyJSON]
+
+
+    class GetInlineStylesForNodeReturnsJSON(typing.TypedDict, total=False):
+        inlineStyle: CSSStyleJSON
+        attributesStyle: CSSStyleJSON
+
+
+    class GetAnimatedStylesForNodeReturnsJSON(typing.TypedDict, total=False):
+        animationStyles: typing.List[CSSAnimationStyleJSON]
+        transitionsStyle: CSSStyleJSON
+        inherited: typing.List[InheritedAnimatedStyleEntryJSON]
+
+
+    class GetMatchedStylesForNodeReturnsJSON(typing.TypedDict, total=False):
+        inlineStyle: CSSStyleJSON
+        attributesStyle: CSSStyleJSON
+        matchedCSSRules: typing.List[RuleMatchJSON]
+        pseudoElements: typing.List[PseudoElementMatchesJSON]
+        inherited: typing.List[InheritedStyleEntryJSON]
+        inheritedPseudoElements: typing.List[InheritedPseudoElementMatchesJSON]
+        cssKeyframesRules: typing.List[CSSKeyframesRuleJSON]
+        cssPositionTryRules: typing.List[CSSPositionTryRuleJSON]
+        activePositionFallbackIndex: int
+        cssPropertyRules: typing.List[CSSPropertyRuleJSON]
+        cssPropertyRegistrations: typing.List[CSSPropertyRegistrationJSON]
+        cssFontPaletteValuesRule: CSSFontPaletteValuesRuleJSON
+        parentLayoutNodeId: int
+        cssFunctionRules: typing.List[CSSFunctionRuleJSON]
+
+
+    class GetMediaQueriesReturnsJSON(typing.TypedDict):
+        medias: typing.List[CSSMediaJSON]
+
+
+    class GetPlatformFontsForNodeReturnsJSON(typing.TypedDict):
+        fonts: typing.List[PlatformFontUsageJSON]
+
+
+    class GetStyleSheetTextReturnsJSON(typing.TypedDict):
+        text: str
+
+
+    class GetLayersForNodeReturnsJSON(typing.TypedDict):
+        rootLayer: CSSLayerDataJSON
+
+
+    class GetLocationForSelectorReturnsJSON(typing.TypedDict):
+        ranges: typing.List[SourceRangeJSON]
+
+
+    class TakeComputedStyleUpdatesReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class SetPropertyRulePropertyNameReturnsJSON(typing.TypedDict):
+        propertyName: ValueJSON
+
+
+    class SetKeyframeKeyReturnsJSON(typing.TypedDict):
+        keyText: ValueJSON
+
+
+    class SetMediaTextReturnsJSON(typing.TypedDict):
+        media: CSSMediaJSON
+
+
+    class SetContainerQueryTextReturnsJSON(typing.TypedDict):
+        containerQuery: CSSContainerQueryJSON
+
+
+    class SetSupportsTextReturnsJSON(typing.TypedDict):
+        supports: CSSSupportsJSON
+
+
+    class SetScopeTextReturnsJSON(typing.TypedDict):
+        scope: CSSScopeJSON
+
+
+    class SetRuleSelectorReturnsJSON(typing.TypedDict):
+        selectorList: SelectorListJSON
+
+
+    class SetStyleSheetTextReturnsJSON(typing.TypedDict, total=False):
+        sourceMapURL: str
+
+
+    class SetStyleTextsReturnsJSON(typing.TypedDict):
+        styles: typing.List[CSSStyleJSON]
+
+
+    class StopRuleUsageTrackingReturnsJSON(typing.TypedDict):
+        ruleUsage: typing.List[RuleUsageJSON]
+
+
+    class TakeCoverageDeltaReturnsJSON(typing.TypedDict):
+        coverage: typing.List[RuleUsageJSON]
+        timestamp: float
+
+
+    class FontsUpdatedJSON(typing.TypedDict, total=False):
+        font: FontFaceJSON
+
+
+    class StyleSheetAddedJSON(typing.TypedDict):
+        header: CSSStyleSheetHeaderJSON
+
+
+    class StyleSheetChangedJSON(typing.TypedDict):
+        styleSheetId: str
+
+
+    class StyleSheetRemovedJSON(typing.TypedDict):
+        styleSheetId: str
+
+
+    class ComputedStyleUpdatedJSON(typing.TypedDict):
+        nodeId: int
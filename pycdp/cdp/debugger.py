@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import runtime
+else:
+    runtime = lazy_import('runtime', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -61,18 +63,18 @@ class Location:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['lineNumber'] = self.line_number
         if self.column_number is not None:
             json['columnNumber'] = self.column_number
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Location:
+    def from_json(cls, json: LocationJSON) -> Location:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json.get('columnNumber'),
         )
 
 
@@ -92,10 +94,10 @@ class ScriptPosition:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScriptPosition:
+    def from_json(cls, json: ScriptPositionJSON) -> ScriptPosition:
         return cls(
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
@@ -112,15 +114,15 @@ class LocationRange:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['start'] = self.start.to_json()
         json['end'] = self.end.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LocationRange:
+    def from_json(cls, json: LocationRangeJSON) -> LocationRange:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
+            script_id=runtime.ScriptId(json['scriptId']),
             start=ScriptPosition.from_json(json['start']),
             end=ScriptPosition.from_json(json['end']),
         )
@@ -165,7 +167,7 @@ class CallFrame:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['callFrameId'] = self.call_frame_id.to_json()
+        json['callFrameId'] = self.call_frame_id
         json['functionName'] = self.function_name
         json['location'] = self.location.to_json()
         json['url'] = self.url
@@ -180,17 +182,17 @@ class CallFrame:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CallFrame:
+    def from_json(cls, json: CallFrameJSON) -> CallFrame:
         return cls(
-            call_frame_id=CallFrameId.from_json(json['callFrameId']),
-            function_name=str(json['functionName']),
+            call_frame_id=CallFrameId(json['callFrameId']),
+            function_name=json['functionName'],
             location=Location.from_json(json['location']),
-            url=str(json['url']),
+            url=json['url'],
             scope_chain=[Scope.from_json(i) for i in json['scopeChain']],
             this=runtime.RemoteObject.from_json(json['this']),
-            function_location=Location.from_json(json['functionLocation']) if json.get('functionLocation', None) is not None else None,
-            return_value=runtime.RemoteObject.from_json(json['returnValue']) if json.get('returnValue', None) is not None else None,
-            can_be_restarted=bool(json['canBeRestarted']) if json.get('canBeRestarted', None) is not None else None,
+            function_location=Location.from_json(_function_location) if (_function_location := json.get('functionLocation')) is not None else None,
+            return_value=runtime.RemoteObject.from_json(_return_value) if (_return_value := json.get('returnValue')) is not None else None,
+            can_be_restarted=json.get('canBeRestarted'),
         )
 
 
@@ -228,13 +230,13 @@ class Scope:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Scope:
+    def from_json(cls, json: ScopeJSON) -> Scope:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             object_=runtime.RemoteObject.from_json(json['object']),
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            start_location=Location.from_json(json['startLocation']) if json.get('startLocation', None) is not None else None,
-            end_location=Location.from_json(json['endLocation']) if json.get('endLocation', None) is not None else None,
+            name=json.get('name'),
+            start_location=Location.from_json(_start_location) if (_start_location := json.get('startLocation')) is not None else None,
+            end_location=Location.from_json(_end_location) if (_end_location := json.get('endLocation')) is not None else None,
         )
 
 
@@ -256,10 +258,10 @@ class SearchMatch:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SearchMatch:
+    def from_json(cls, json: SearchMatchJSON) -> SearchMatch:
         return cls(
             line_number=float(json['lineNumber']),
-            line_content=str(json['lineContent']),
+            line_content=json['lineContent'],
         )
 
 
@@ -278,7 +280,7 @@ class BreakLocation:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['lineNumber'] = self.line_number
         if self.column_number is not None:
             json['columnNumber'] = self.column_number
@@ -287,12 +289,12 @@ class BreakLocation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BreakLocation:
+    def from_json(cls, json: BreakLocationJSON) -> BreakLocation:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json.get('columnNumber'),
+            type_=json.get('type'),
         )
 
 
@@ -306,15 +308,15 @@ class WasmDisassemblyChunk:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['lines'] = [i for i in self.lines]
-        json['bytecodeOffsets'] = [i for i in self.bytecode_offsets]
+        json['lines'] = list(self.lines)
+        json['bytecodeOffsets'] = list(self.bytecode_offsets)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WasmDisassemblyChunk:
+    def from_json(cls, json: WasmDisassemblyChunkJSON) -> WasmDisassemblyChunk:
         return cls(
-            lines=[str(i) for i in json['lines']],
-            bytecode_offsets=[int(i) for i in json['bytecodeOffsets']],
+            lines=json['lines'],
+            bytecode_offsets=json['bytecodeOffsets'],
         )
 
 
@@ -330,7 +332,10 @@ class ScriptLanguage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ScriptLanguage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -352,10 +357,10 @@ class DebugSymbols:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DebugSymbols:
+    def from_json(cls, json: DebugSymbolsJSON) -> DebugSymbols:
         return cls(
-            type_=str(json['type']),
-            external_url=str(json['externalURL']) if json.get('externalURL', None) is not None else None,
+            type_=json['type'],
+            external_url=json.get('externalURL'),
         )
 
 
@@ -369,14 +374,14 @@ class ResolvedBreakpoint:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['breakpointId'] = self.breakpoint_id.to_json()
+        json['breakpointId'] = self.breakpoint_id
         json['location'] = self.location.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResolvedBreakpoint:
+    def from_json(cls, json: ResolvedBreakpointJSON) -> ResolvedBreakpoint:
         return cls(
-            breakpoint_id=BreakpointId.from_json(json['breakpointId']),
+            breakpoint_id=BreakpointId(json['breakpointId']),
             location=Location.from_json(json['location']),
         )
 
@@ -384,7 +389,7 @@ class ResolvedBreakpoint:
 def continue_to_location(
         location: Location,
         target_call_frames: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Continues execution until specific location is reached.
 
@@ -395,26 +400,23 @@ def continue_to_location(
     params['location'] = location.to_json()
     if target_call_frames is not None:
         params['targetCallFrames'] = target_call_frames
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.continueToLocation',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.continueToLocation', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables debugger for given page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.disable',
-    }
-    json = yield cmd_dict
+    return Command('Debugger.disable')
+
+
+def _parse_enable(json: EnableReturnsJSON) -> runtime.UniqueDebuggerId:
+    return runtime.UniqueDebuggerId(json['debuggerId'])
 
 
 def enable(
         max_scripts_cache_size: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.UniqueDebuggerId]:
+    ) -> Command[EnableReturnsJSON, runtime.UniqueDebuggerId]:
     '''
     Enables debugger for the given page. Clients should not assume that the debugging has been
     enabled until the result for this command is received.
@@ -425,12 +427,14 @@ def enable(
     params: T_JSON_DICT = dict()
     if max_scripts_cache_size is not None:
         params['maxScriptsCacheSize'] = max_scripts_cache_size
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.UniqueDebuggerId.from_json(json['debuggerId'])
+    return Command('Debugger.enable', params, _parse_enable)
+
+
+def _parse_evaluate_on_call_frame(json: EvaluateOnCallFrameReturnsJSON) -> typing.Tuple[runtime.RemoteObject, typing.Optional[runtime.ExceptionDetails]]:
+    return (
+        runtime.RemoteObject.from_json(json['result']),
+        runtime.ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
+    )
 
 
 def evaluate_on_call_frame(
@@ -443,7 +447,7 @@ def evaluate_on_call_frame(
         generate_preview: typing.Optional[bool] = None,
         throw_on_side_effect: typing.Optional[bool] = None,
         timeout: typing.Optional[runtime.TimeDelta] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[runtime.RemoteObject, typing.Optional[runtime.ExceptionDetails]]]:
+    ) -> Command[EvaluateOnCallFrameReturnsJSON, typing.Tuple[runtime.RemoteObject, typing.Optional[runtime.ExceptionDetails]]]:
     '''
     Evaluates expression on a given call frame.
 
@@ -462,7 +466,7 @@ def evaluate_on_call_frame(
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
     params: T_JSON_DICT = dict()
-    params['callFrameId'] = call_frame_id.to_json()
+    params['callFrameId'] = call_frame_id
     params['expression'] = expression
     if object_group is not None:
         params['objectGroup'] = object_group
@@ -477,23 +481,19 @@ def evaluate_on_call_frame(
     if throw_on_side_effect is not None:
         params['throwOnSideEffect'] = throw_on_side_effect
     if timeout is not None:
-        params['timeout'] = timeout.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.evaluateOnCallFrame',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        runtime.RemoteObject.from_json(json['result']),
-        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+        params['timeout'] = timeout
+    return Command('Debugger.evaluateOnCallFrame', params, _parse_evaluate_on_call_frame)
+
+
+def _parse_get_possible_breakpoints(json: GetPossibleBreakpointsReturnsJSON) -> typing.List[BreakLocation]:
+    return [BreakLocation.from_json(i) for i in json['locations']]
 
 
 def get_possible_breakpoints(
         start: Location,
         end: typing.Optional[Location] = None,
         restrict_to_function: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[BreakLocation]]:
+    ) -> Command[GetPossibleBreakpointsReturnsJSON, typing.List[BreakLocation]]:
     '''
     Returns possible locations for breakpoint. scriptId in start and end range locations should be
     the same.
@@ -509,17 +509,19 @@ def get_possible_breakpoints(
         params['end'] = end.to_json()
     if restrict_to_function is not None:
         params['restrictToFunction'] = restrict_to_function
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.getPossibleBreakpoints',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [BreakLocation.from_json(i) for i in json['locations']]
+    return Command('Debugger.getPossibleBreakpoints', params, _parse_get_possible_breakpoints)
+
+
+def _parse_get_script_source(json: GetScriptSourceReturnsJSON) -> typing.Tuple[str, typing.Optional[str]]:
+    return (
+        json['scriptSource'],
+        json.get('bytecode')
+    )
 
 
 def get_script_source(
         script_id: runtime.ScriptId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.Optional[str]]]:
+    ) -> Command[GetScriptSourceReturnsJSON, typing.Tuple[str, typing.Optional[str]]]:
     '''
     Returns source for the script with given id.
 
@@ -530,21 +532,22 @@ def get_script_source(
         1. **bytecode** - *(Optional)* Wasm bytecode. (Encoded as a base64 string when passed over JSON)
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.getScriptSource',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['scriptId'] = script_id
+    return Command('Debugger.getScriptSource', params, _parse_get_script_source)
+
+
+def _parse_disassemble_wasm_module(json: DisassembleWasmModuleReturnsJSON) -> typing.Tuple[typing.Optional[str], int, typing.List[int], WasmDisassemblyChunk]:
     return (
-        str(json['scriptSource']),
-        str(json['bytecode']) if json.get('bytecode', None) is not None else None
+        json.get('streamId'),
+        json['totalNumberOfLines'],
+        json['functionBodyOffsets'],
+        WasmDisassemblyChunk.from_json(json['chunk'])
     )
 
 
 def disassemble_wasm_module(
         script_id: runtime.ScriptId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], int, typing.List[int], WasmDisassemblyChunk]]:
+    ) -> Command[DisassembleWasmModuleReturnsJSON, typing.Tuple[typing.Optional[str], int, typing.List[int], WasmDisassemblyChunk]]:
     '''
 
 
@@ -559,23 +562,17 @@ def disassemble_wasm_module(
         3. **chunk** - The first chunk of disassembly.
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.disassembleWasmModule',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['streamId']) if json.get('streamId', None) is not None else None,
-        int(json['totalNumberOfLines']),
-        [int(i) for i in json['functionBodyOffsets']],
-        WasmDisassemblyChunk.from_json(json['chunk'])
-    )
+    params['scriptId'] = script_id
+    return Command('Debugger.disassembleWasmModule', params, _parse_disassemble_wasm_module)
+
+
+def _parse_next_wasm_disassembly_chunk(json: NextWasmDisassemblyChunkReturnsJSON) -> WasmDisassemblyChunk:
+    return WasmDisassemblyChunk.from_json(json['chunk'])
 
 
 def next_wasm_disassembly_chunk(
         stream_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,WasmDisassemblyChunk]:
+    ) -> Command[NextWasmDisassemblyChunkReturnsJSON, WasmDisassemblyChunk]:
     '''
     Disassemble the next chunk of lines for the module corresponding to the
     stream. If disassembly is complete, this API will invalidate the streamId
@@ -589,18 +586,17 @@ def next_wasm_disassembly_chunk(
     '''
     params: T_JSON_DICT = dict()
     params['streamId'] = stream_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.nextWasmDisassemblyChunk',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return WasmDisassemblyChunk.from_json(json['chunk'])
+    return Command('Debugger.nextWasmDisassemblyChunk', params, _parse_next_wasm_disassembly_chunk)
+
+
+def _parse_get_wasm_bytecode(json: GetWasmBytecodeReturnsJSON) -> str:
+    return json['bytecode']
 
 
 @deprecated(version="1.3")
 def get_wasm_bytecode(
         script_id: runtime.ScriptId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[GetWasmBytecodeReturnsJSON, str]:
     '''
     This command is deprecated. Use getScriptSource instead.
 
@@ -610,18 +606,17 @@ def get_wasm_bytecode(
     :returns: Script source. (Encoded as a base64 string when passed over JSON)
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.getWasmBytecode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['bytecode'])
+    params['scriptId'] = script_id
+    return Command('Debugger.getWasmBytecode', params, _parse_get_wasm_bytecode)
+
+
+def _parse_get_stack_trace(json: GetStackTraceReturnsJSON) -> runtime.StackTrace:
+    return runtime.StackTrace.from_json(json['stackTrace'])
 
 
 def get_stack_trace(
         stack_trace_id: runtime.StackTraceId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.StackTrace]:
+    ) -> Command[GetStackTraceReturnsJSON, runtime.StackTrace]:
     '''
     Returns stack trace with given ``stackTraceId``.
 
@@ -632,28 +627,20 @@ def get_stack_trace(
     '''
     params: T_JSON_DICT = dict()
     params['stackTraceId'] = stack_trace_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.getStackTrace',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.StackTrace.from_json(json['stackTrace'])
+    return Command('Debugger.getStackTrace', params, _parse_get_stack_trace)
 
 
-def pause() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def pause() -> Command[T_JSON_DICT, None]:
     '''
     Stops on the next JavaScript statement.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.pause',
-    }
-    json = yield cmd_dict
+    return Command('Debugger.pause')
 
 
 @deprecated(version="1.3")
 def pause_on_async_call(
         parent_stack_trace_id: runtime.StackTraceId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -665,34 +652,34 @@ def pause_on_async_call(
     '''
     params: T_JSON_DICT = dict()
     params['parentStackTraceId'] = parent_stack_trace_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.pauseOnAsyncCall',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.pauseOnAsyncCall', params)
 
 
 def remove_breakpoint(
         breakpoint_id: BreakpointId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes JavaScript breakpoint.
 
     :param breakpoint_id:
     '''
     params: T_JSON_DICT = dict()
-    params['breakpointId'] = breakpoint_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.removeBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['breakpointId'] = breakpoint_id
+    return Command('Debugger.removeBreakpoint', params)
+
+
+def _parse_restart_frame(json: RestartFrameReturnsJSON) -> typing.Tuple[typing.List[CallFrame], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId]]:
+    return (
+        [CallFrame.from_json(i) for i in json['callFrames']],
+        runtime.StackTrace.from_json(_async_stack_trace) if (_async_stack_trace := json.get('asyncStackTrace')) is not None else None,
+        runtime.StackTraceId.from_json(_async_stack_trace_id) if (_async_stack_trace_id := json.get('asyncStackTraceId')) is not None else None
+    )
 
 
 def restart_frame(
         call_frame_id: CallFrameId,
         mode: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[CallFrame], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId]]]:
+    ) -> Command[RestartFrameReturnsJSON, typing.Tuple[typing.List[CallFrame], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId]]]:
     '''
     Restarts particular call frame from the beginning. The old, deprecated
     behavior of ``restartFrame`` is to stay paused and allow further CDP commands
@@ -717,24 +704,15 @@ def restart_frame(
         2. **asyncStackTraceId** - *(Optional)* Async stack trace, if any.
     '''
     params: T_JSON_DICT = dict()
-    params['callFrameId'] = call_frame_id.to_json()
+    params['callFrameId'] = call_frame_id
     if mode is not None:
         params['mode'] = mode
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.restartFrame',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [CallFrame.from_json(i) for i in json['callFrames']],
-        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None
-    )
+    return Command('Debugger.restartFrame', params, _parse_restart_frame)
 
 
 def resume(
         terminate_on_resume: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Resumes JavaScript execution.
 
@@ -743,11 +721,11 @@ def resume(
     params: T_JSON_DICT = dict()
     if terminate_on_resume is not None:
         params['terminateOnResume'] = terminate_on_resume
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.resume',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.resume', params)
+
+
+def _parse_search_in_content(json: SearchInContentReturnsJSON) -> typing.List[SearchMatch]:
+    return [SearchMatch.from_json(i) for i in json['result']]
 
 
 def search_in_content(
@@ -755,7 +733,7 @@ def search_in_content(
         query: str,
         case_sensitive: typing.Optional[bool] = None,
         is_regex: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[SearchMatch]]:
+    ) -> Command[SearchInContentReturnsJSON, typing.List[SearchMatch]]:
     '''
     Searches for given string in script content.
 
@@ -766,23 +744,18 @@ def search_in_content(
     :returns: List of search matches.
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
+    params['scriptId'] = script_id
     params['query'] = query
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.searchInContent',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [SearchMatch.from_json(i) for i in json['result']]
+    return Command('Debugger.searchInContent', params, _parse_search_in_content)
 
 
 def set_async_call_stack_depth(
         max_depth: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables or disables async call stacks tracking.
 
@@ -790,16 +763,12 @@ def set_async_call_stack_depth(
     '''
     params: T_JSON_DICT = dict()
     params['maxDepth'] = max_depth
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setAsyncCallStackDepth',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setAsyncCallStackDepth', params)
 
 
 def set_blackbox_execution_contexts(
         unique_ids: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Replace previous blackbox execution contexts with passed ones. Forces backend to skip
     stepping/pausing in scripts in these execution contexts. VM will try to leave blackboxed script by
@@ -810,18 +779,14 @@ def set_blackbox_execution_contexts(
     :param unique_ids: Array of execution context unique ids for the debugger to ignore.
     '''
     params: T_JSON_DICT = dict()
-    params['uniqueIds'] = [i for i in unique_ids]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBlackboxExecutionContexts',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['uniqueIds'] = list(unique_ids)
+    return Command('Debugger.setBlackboxExecutionContexts', params)
 
 
 def set_blackbox_patterns(
         patterns: typing.List[str],
         skip_anonymous: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Replace previous blackbox patterns with passed ones. Forces backend to skip stepping/pausing in
     scripts with url matching one of the patterns. VM will try to leave blackboxed script by
@@ -833,20 +798,16 @@ def set_blackbox_patterns(
     :param skip_anonymous: *(Optional)* If true, also ignore scripts with no source url.
     '''
     params: T_JSON_DICT = dict()
-    params['patterns'] = [i for i in patterns]
+    params['patterns'] = list(patterns)
     if skip_anonymous is not None:
         params['skipAnonymous'] = skip_anonymous
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBlackboxPatterns',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setBlackboxPatterns', params)
 
 
 def set_blackboxed_ranges(
         script_id: runtime.ScriptId,
         positions: typing.List[ScriptPosition]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Makes backend skip steps in the script in blackboxed ranges. VM will try leave blacklisted
     scripts by performing 'step in' several times, finally resorting to 'step out' if unsuccessful.
@@ -859,19 +820,22 @@ def set_blackboxed_ranges(
     :param positions:
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
+    params['scriptId'] = script_id
     params['positions'] = [i.to_json() for i in positions]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBlackboxedRanges',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setBlackboxedRanges', params)
+
+
+def _parse_set_breakpoint(json: SetBreakpointReturnsJSON) -> typing.Tuple[BreakpointId, Location]:
+    return (
+        BreakpointId(json['breakpointId']),
+        Location.from_json(json['actualLocation'])
+    )
 
 
 def set_breakpoint(
         location: Location,
         condition: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BreakpointId, Location]]:
+    ) -> Command[SetBreakpointReturnsJSON, typing.Tuple[BreakpointId, Location]]:
     '''
     Sets JavaScript breakpoint at a given location.
 
@@ -886,20 +850,16 @@ def set_breakpoint(
     params['location'] = location.to_json()
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        BreakpointId.from_json(json['breakpointId']),
-        Location.from_json(json['actualLocation'])
-    )
+    return Command('Debugger.setBreakpoint', params, _parse_set_breakpoint)
+
+
+def _parse_set_instrumentation_breakpoint(json: SetInstrumentationBreakpointReturnsJSON) -> BreakpointId:
+    return BreakpointId(json['breakpointId'])
 
 
 def set_instrumentation_breakpoint(
         instrumentation: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,BreakpointId]:
+    ) -> Command[SetInstrumentationBreakpointReturnsJSON, BreakpointId]:
     '''
     Sets instrumentation breakpoint.
 
@@ -908,12 +868,14 @@ def set_instrumentation_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['instrumentation'] = instrumentation
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setInstrumentationBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return Command('Debugger.setInstrumentationBreakpoint', params, _parse_set_instrumentation_breakpoint)
+
+
+def _parse_set_breakpoint_by_url(json: SetBreakpointByUrlReturnsJSON) -> typing.Tuple[BreakpointId, typing.List[Location]]:
+    return (
+        BreakpointId(json['breakpointId']),
+        [Location.from_json(i) for i in json['locations']]
+    )
 
 
 def set_breakpoint_by_url(
@@ -923,7 +885,7 @@ def set_breakpoint_by_url(
         script_hash: typing.Optional[str] = None,
         column_number: typing.Optional[int] = None,
         condition: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BreakpointId, typing.List[Location]]]:
+    ) -> Command[SetBreakpointByUrlReturnsJSON, typing.Tuple[BreakpointId, typing.List[Location]]]:
     '''
     Sets JavaScript breakpoint at given location specified either by URL or URL regex. Once this
     command is issued, all existing parsed scripts will have breakpoints resolved and returned in
@@ -953,21 +915,17 @@ def set_breakpoint_by_url(
         params['columnNumber'] = column_number
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBreakpointByUrl',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        BreakpointId.from_json(json['breakpointId']),
-        [Location.from_json(i) for i in json['locations']]
-    )
+    return Command('Debugger.setBreakpointByUrl', params, _parse_set_breakpoint_by_url)
+
+
+def _parse_set_breakpoint_on_function_call(json: SetBreakpointOnFunctionCallReturnsJSON) -> BreakpointId:
+    return BreakpointId(json['breakpointId'])
 
 
 def set_breakpoint_on_function_call(
         object_id: runtime.RemoteObjectId,
         condition: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,BreakpointId]:
+    ) -> Command[SetBreakpointOnFunctionCallReturnsJSON, BreakpointId]:
     '''
     Sets JavaScript breakpoint before each call to the given function.
     If another function was created from the same source as a given one,
@@ -980,20 +938,15 @@ def set_breakpoint_on_function_call(
     :returns: Id of the created breakpoint for further reference.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params['objectId'] = object_id
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBreakpointOnFunctionCall',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return Command('Debugger.setBreakpointOnFunctionCall', params, _parse_set_breakpoint_on_function_call)
 
 
 def set_breakpoints_active(
         active: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Activates / deactivates all breakpoints on the page.
 
@@ -1001,16 +954,12 @@ def set_breakpoints_active(
     '''
     params: T_JSON_DICT = dict()
     params['active'] = active
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setBreakpointsActive',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setBreakpointsActive', params)
 
 
 def set_pause_on_exceptions(
         state: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Defines pause on exceptions state. Can be set to stop on all exceptions, uncaught exceptions,
     or caught exceptions, no exceptions. Initial pause on exceptions state is ``none``.
@@ -1019,16 +968,12 @@ def set_pause_on_exceptions(
     '''
     params: T_JSON_DICT = dict()
     params['state'] = state
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setPauseOnExceptions',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setPauseOnExceptions', params)
 
 
 def set_return_value(
         new_value: runtime.CallArgument
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Changes return value in top frame. Available only at return break position.
 
@@ -1038,11 +983,18 @@ def set_return_value(
     '''
     params: T_JSON_DICT = dict()
     params['newValue'] = new_value.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setReturnValue',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setReturnValue', params)
+
+
+def _parse_set_script_source(json: SetScriptSourceReturnsJSON) -> typing.Tuple[typing.Optional[typing.List[CallFrame]], typing.Optional[bool], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId], str, typing.Optional[runtime.ExceptionDetails]]:
+    return (
+        [CallFrame.from_json(i) for i in _call_frames] if (_call_frames := json.get('callFrames')) is not None else None,
+        json.get('stackChanged'),
+        runtime.StackTrace.from_json(_async_stack_trace) if (_async_stack_trace := json.get('asyncStackTrace')) is not None else None,
+        runtime.StackTraceId.from_json(_async_stack_trace_id) if (_async_stack_trace_id := json.get('asyncStackTraceId')) is not None else None,
+        json['status'],
+        runtime.ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
+    )
 
 
 def set_script_source(
@@ -1050,7 +1002,7 @@ def set_script_source(
         script_source: str,
         dry_run: typing.Optional[bool] = None,
         allow_top_frame_editing: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[CallFrame]], typing.Optional[bool], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId], str, typing.Optional[runtime.ExceptionDetails]]]:
+    ) -> Command[SetScriptSourceReturnsJSON, typing.Tuple[typing.Optional[typing.List[CallFrame]], typing.Optional[bool], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId], str, typing.Optional[runtime.ExceptionDetails]]]:
     '''
     Edits JavaScript source live.
 
@@ -1074,30 +1026,18 @@ def set_script_source(
         5. **exceptionDetails** - *(Optional)* Exception details if any. Only present when `` status`` is `` CompileError`.
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
+    params['scriptId'] = script_id
     params['scriptSource'] = script_source
     if dry_run is not None:
         params['dryRun'] = dry_run
     if allow_top_frame_editing is not None:
         params['allowTopFrameEditing'] = allow_top_frame_editing
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setScriptSource',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [CallFrame.from_json(i) for i in json['callFrames']] if json.get('callFrames', None) is not None else None,
-        bool(json['stackChanged']) if json.get('stackChanged', None) is not None else None,
-        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
-        str(json['status']),
-        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return Command('Debugger.setScriptSource', params, _parse_set_script_source)
 
 
 def set_skip_all_pauses(
         skip: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Makes page not interrupt on any pauses (breakpoint, exception, dom exception etc).
 
@@ -1105,11 +1045,7 @@ def set_skip_all_pauses(
     '''
     params: T_JSON_DICT = dict()
     params['skip'] = skip
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setSkipAllPauses',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.setSkipAllPauses', params)
 
 
 def set_variable_value(
@@ -1117,7 +1053,7 @@ def set_variable_value(
         variable_name: str,
         new_value: runtime.CallArgument,
         call_frame_id: CallFrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Changes value of variable in a callframe. Object-based scopes are not supported and must be
     mutated manually.
@@ -1131,18 +1067,14 @@ def set_variable_value(
     params['scopeNumber'] = scope_number
     params['variableName'] = variable_name
     params['newValue'] = new_value.to_json()
-    params['callFrameId'] = call_frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.setVariableValue',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['callFrameId'] = call_frame_id
+    return Command('Debugger.setVariableValue', params)
 
 
 def step_into(
         break_on_async_call: typing.Optional[bool] = None,
         skip_list: typing.Optional[typing.List[LocationRange]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Steps into the function call.
 
@@ -1154,26 +1086,19 @@ def step_into(
         params['breakOnAsyncCall'] = break_on_async_call
     if skip_list is not None:
         params['skipList'] = [i.to_json() for i in skip_list]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.stepInto',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.stepInto', params)
 
 
-def step_out() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def step_out() -> Command[T_JSON_DICT, None]:
     '''
     Steps out of the function call.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.stepOut',
-    }
-    json = yield cmd_dict
+    return Command('Debugger.stepOut')
 
 
 def step_over(
         skip_list: typing.Optional[typing.List[LocationRange]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Steps over the statement.
 
@@ -1182,11 +1107,7 @@ def step_over(
     params: T_JSON_DICT = dict()
     if skip_list is not None:
         params['skipList'] = [i.to_json() for i in skip_list]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Debugger.stepOver',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Debugger.stepOver', params)
 
 
 @deprecated(version="1.3")
@@ -1203,9 +1124,9 @@ class BreakpointResolved:
     location: Location
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BreakpointResolved:
+    def from_json(cls, json: BreakpointResolvedJSON) -> BreakpointResolved:
         return cls(
-            breakpoint_id=BreakpointId.from_json(json['breakpointId']),
+            breakpoint_id=BreakpointId(json['breakpointId']),
             location=Location.from_json(json['location'])
         )
 
@@ -1232,15 +1153,15 @@ class Paused:
     async_call_stack_trace_id: typing.Optional[runtime.StackTraceId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Paused:
+    def from_json(cls, json: PausedJSON) -> Paused:
         return cls(
             call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            reason=str(json['reason']),
-            data=dict(json['data']) if json.get('data', None) is not None else None,
-            hit_breakpoints=[str(i) for i in json['hitBreakpoints']] if json.get('hitBreakpoints', None) is not None else None,
-            async_stack_trace=runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-            async_stack_trace_id=runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
-            async_call_stack_trace_id=runtime.StackTraceId.from_json(json['asyncCallStackTraceId']) if json.get('asyncCallStackTraceId', None) is not None else None
+            reason=json['reason'],
+            data=json.get('data'),
+            hit_breakpoints=json.get('hitBreakpoints'),
+            async_stack_trace=runtime.StackTrace.from_json(_async_stack_trace) if (_async_stack_trace := json.get('asyncStackTrace')) is not None else None,
+            async_stack_trace_id=runtime.StackTraceId.from_json(_async_stack_trace_id) if (_async_stack_trace_id := json.get('asyncStackTraceId')) is not None else None,
+            async_call_stack_trace_id=runtime.StackTraceId.from_json(_async_call_stack_trace_id) if (_async_call_stack_trace_id := json.get('asyncCallStackTraceId')) is not None else None
         )
 
 
@@ -1303,26 +1224,26 @@ class ScriptFailedToParse:
     embedder_name: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScriptFailedToParse:
+    def from_json(cls, json: ScriptFailedToParseJSON) -> ScriptFailedToParse:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            build_id=str(json['buildId']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if json.get('executionContextAuxData', None) is not None else None,
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            is_module=bool(json['isModule']) if json.get('isModule', None) is not None else None,
-            length=int(json['length']) if json.get('length', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            code_offset=int(json['codeOffset']) if json.get('codeOffset', None) is not None else None,
-            script_language=ScriptLanguage.from_json(json['scriptLanguage']) if json.get('scriptLanguage', None) is not None else None,
-            embedder_name=str(json['embedderName']) if json.get('embedderName', None) is not None else None
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
+            execution_context_id=runtime.ExecutionContextId(json['executionContextId']),
+            hash_=json['hash'],
+            build_id=json['buildId'],
+            execution_context_aux_data=json.get('executionContextAuxData'),
+            source_map_url=json.get('sourceMapURL'),
+            has_source_url=json.get('hasSourceURL'),
+            is_module=json.get('isModule'),
+            length=json.get('length'),
+            stack_trace=runtime.StackTrace.from_json(_stack_trace) if (_stack_trace := json.get('stackTrace')) is not None else None,
+            code_offset=json.get('codeOffset'),
+            script_language=ScriptLanguage.from_json(_script_language) if (_script_language := json.get('scriptLanguage')) is not None else None,
+            embedder_name=json.get('embedderName')
         )
 
 
@@ -1379,27 +1300,265 @@ class ScriptParsed:
     resolved_breakpoints: typing.Optional[typing.List[ResolvedBreakpoint]]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScriptParsed:
+    def from_json(cls, json: ScriptParsedJSON) -> ScriptParsed:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            build_id=str(json['buildId']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if json.get('executionContextAuxData', None) is not None else None,
-            is_live_edit=bool(json['isLiveEdit']) if json.get('isLiveEdit', None) is not None else None,
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            is_module=bool(json['isModule']) if json.get('isModule', None) is not None else None,
-            length=int(json['length']) if json.get('length', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            code_offset=int(json['codeOffset']) if json.get('codeOffset', None) is not None else None,
-            script_language=ScriptLanguage.from_json(json['scriptLanguage']) if json.get('scriptLanguage', None) is not None else None,
-            debug_symbols=[DebugSymbols.from_json(i) for i in json['debugSymbols']] if json.get('debugSymbols', None) is not None else None,
-            embedder_name=str(json['embedderName']) if json.get('embedderName', None) is not None else None,
-            resolved_breakpoints=[ResolvedBreakpoint.from_json(i) for i in json['resolvedBreakpoints']] if json.get('resolvedBreakpoints', None) is not None else None
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
+            start_line=json['startLine'],
+            start_column=json['startColumn'],
+            end_line=json['endLine'],
+            end_column=json['endColumn'],
+            execution_context_id=runtime.ExecutionContextId(json['executionContextId']),
+            hash_=json['hash'],
+            build_id=json['buildId'],
+            execution_context_aux_data=json.get('executionContextAuxData'),
+            is_live_edit=json.get('isLiveEdit'),
+            source_map_url=json.get('sourceMapURL'),
+            has_source_url=json.get('hasSourceURL'),
+            is_module=json.get('isModule'),
+            length=json.get('length'),
+            stack_trace=runtime.StackTrace.from_json(_stack_trace) if (_stack_trace := json.get('stackTrace')) is not None else None,
+            code_offset=json.get('codeOffset'),
+            script_language=ScriptLanguage.from_json(_script_language) if (_script_language := json.get('scriptLanguage')) is not None else None,
+            debug_symbols=[DebugSymbols.from_json(i) for i in _debug_symbols] if (_debug_symbols := json.get('debugSymbols')) is not None else None,
+            embedder_name=json.get('embedderName'),
+            resolved_breakpoints=[ResolvedBreakpoint.from_json(i) for i in _resolved_breakpoints] if (_resolved_breakpoints := json.get('resolvedBreakpoints')) is not None else None
         )
+
+
+if typing.TYPE_CHECKING:
+    class _LocationJSON(typing.TypedDict):
+        scriptId: str
+        lineNumber: int
+
+
+    class LocationJSON(_LocationJSON, total=False):
+        columnNumber: int
+
+
+    class ScriptPositionJSON(typing.TypedDict):
+        lineNumber: int
+        columnNumber: int
+
+
+    class LocationRangeJSON(typing.TypedDict):
+        scriptId: str
+        start: ScriptPositionJSON
+        end: ScriptPositionJSON
+
+
+    class _CallFrameJSON(typing.TypedDict):
+        callFrameId: str
+        functionName: str
+        location: LocationJSON
+        url: str
+        scopeChain: typing.List[ScopeJSON]
+        this: runtime.RemoteObjectJSON
+
+
+    class CallFrameJSON(_CallFrameJSON, total=False):
+        functionLocation: LocationJSON
+        returnValue: runtime.RemoteObjectJSON
+        canBeRestarted: bool
+
+
+    class _ScopeJSON(typing.TypedDict):
+        type: str
+        object: runtime.RemoteObjectJSON
+
+
+    class ScopeJSON(_ScopeJSON, total=False):
+        name: str
+        startLocation: LocationJSON
+        endLocation: LocationJSON
+
+
+    class SearchMatchJSON(typing.TypedDict):
+        lineNumber: float
+        lineContent: str
+
+
+    class _BreakLocationJSON(typing.TypedDict):
+        scriptId: str
+        lineNumber: int
+
+
+    class BreakLocationJSON(_BreakLocationJSON, total=False):
+        columnNumber: int
+        type: str
+
+
+    class WasmDisassemblyChunkJSON(typing.TypedDict):
+        lines: typing.List[str]
+        bytecodeOffsets: typing.List[int]
+
+
+    class _DebugSymbolsJSON(typing.TypedDict):
+        type: str
+
+
+    class DebugSymbolsJSON(_DebugSymbolsJSON, total=False):
+        externalURL: str
+
+
+    class ResolvedBreakpointJSON(typing.TypedDict):
+        breakpointId: str
+        location: LocationJSON
+
+
+    class EnableReturnsJSON(typing.TypedDict):
+        debuggerId: str
+
+
+    class _EvaluateOnCallFrameReturnsJSON(typing.TypedDict):
+        result: runtime.RemoteObjectJSON
+
+
+    class EvaluateOnCallFrameReturnsJSON(_EvaluateOnCallFrameReturnsJSON, total=False):
+        exceptionDetails: runtime.ExceptionDetailsJSON
+
+
+    class GetPossibleBreakpointsReturnsJSON(typing.TypedDict):
+        locations: typing.List[BreakLocationJSON]
+
+
+    class _GetScriptSourceReturnsJSON(typing.TypedDict):
+        scriptSource: str
+
+
+    class GetScriptSourceReturnsJSON(_GetScriptSourceReturnsJSON, total=False):
+        bytecode: str
+
+
+    class _DisassembleWasmModuleReturnsJSON(typing.TypedDict):
+        totalNumberOfLines: int
+        functionBodyOffsets: typing.List[int]
+        chunk: WasmDisassemblyChunkJSON
+
+
+    class DisassembleWasmModuleReturnsJSON(_DisassembleWasmModuleReturnsJSON, total=False):
+        streamId: str
+
+
+    class NextWasmDisassemblyChunkReturnsJSON(typing.TypedDict):
+        chunk: WasmDisassemblyChunkJSON
+
+
+    class GetWasmBytecodeReturnsJSON(typing.TypedDict):
+        bytecode: str
+
+
+    class GetStackTraceReturnsJSON(typing.TypedDict):
+        stackTrace: runtime.StackTraceJSON
+
+
+    class _RestartFrameReturnsJSON(typing.TypedDict):
+        callFrames: typing.List[CallFrameJSON]
+
+
+    class RestartFrameReturnsJSON(_RestartFrameReturnsJSON, total=False):
+        asyncStackTrace: runtime.StackTraceJSON
+        asyncStackTraceId: runtime.StackTraceIdJSON
+
+
+    class SearchInContentReturnsJSON(typing.TypedDict):
+        result: typing.List[SearchMatchJSON]
+
+
+    class SetBreakpointReturnsJSON(typing.TypedDict):
+        breakpointId: str
+        actualLocation: LocationJSON
+
+
+    class SetInstrumentationBreakpointReturnsJSON(typing.TypedDict):
+        breakpointId: str
+
+
+    class SetBreakpointByUrlReturnsJSON(typing.TypedDict):
+        breakpointId: str
+        locations: typing.List[LocationJSON]
+
+
+    class SetBreakpointOnFunctionCallReturnsJSON(typing.TypedDict):
+        breakpointId: str
+
+
+    class _SetScriptSourceReturnsJSON(typing.TypedDict):
+        status: str
+
+
+    class SetScriptSourceReturnsJSON(_SetScriptSourceReturnsJSON, total=False):
+        callFrames: typing.List[CallFrameJSON]
+        stackChanged: bool
+        asyncStackTrace: runtime.StackTraceJSON
+        asyncStackTraceId: runtime.StackTraceIdJSON
+        exceptionDetails: runtime.ExceptionDetailsJSON
+
+
+    class BreakpointResolvedJSON(typing.TypedDict):
+        breakpointId: str
+        location: LocationJSON
+
+
+    class _PausedJSON(typing.TypedDict):
+        callFrames: typing.List[CallFrameJSON]
+        reason: str
+
+
+    class PausedJSON(_PausedJSON, total=False):
+        data: dict
+        hitBreakpoints: typing.List[str]
+        asyncStackTrace: runtime.StackTraceJSON
+        asyncStackTraceId: runtime.StackTraceIdJSON
+        asyncCallStackTraceId: runtime.StackTraceIdJSON
+
+
+    class _ScriptFailedToParseJSON(typing.TypedDict):
+        scriptId: str
+        url: str
+        startLine: int
+        startColumn: int
+        endLine: int
+        endColumn: int
+        executionContextId: int
+        hash: str
+        buildId: str
+
+
+    class ScriptFailedToParseJSON(_ScriptFailedToParseJSON, total=False):
+        executionContextAuxData: dict
+        sourceMapURL: str
+        hasSourceURL: bool
+        isModule: bool
+        length: int
+        stackTrace: runtime.StackTraceJSON
+        codeOffset: int
+        scriptLanguage: str
+        embedderName: str
+
+
+    class _ScriptParsedJSON(typing.TypedDict):
+        scriptId: str
+        url: str
+        startLine: int
+        startColumn: int
+        endLine: int
+        endColumn: int
+        executionContextId: int
+        hash: str
+        buildId: str
+
+
+    class ScriptParsedJSON(_ScriptParsedJSON, total=False):
+        executionContextAuxData: dict
+        isLiveEdit: bool
+        sourceMapURL: str
+        hasSourceURL: bool
+        isModule: bool
+        length: int
+        stackTrace: runtime.StackTraceJSON
+        codeOffset: int
+        scriptLanguage: str
+        debugSymbols: typing.List[DebugSymbolsJSON]
+        embedderName: str
+        resolvedBreakpoints: typing.List[ResolvedBreakpointJSON]
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class RequestId(str):
@@ -54,42 +53,36 @@ class PromptDevice:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['id'] = self.id_.to_json()
+        json['id'] = self.id_
         json['name'] = self.name
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PromptDevice:
+    def from_json(cls, json: PromptDeviceJSON) -> PromptDevice:
         return cls(
-            id_=DeviceId.from_json(json['id']),
-            name=str(json['name']),
+            id_=DeviceId(json['id']),
+            name=json['name'],
         )
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enable events in this domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceAccess.enable',
-    }
-    json = yield cmd_dict
+    return Command('DeviceAccess.enable')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disable events in this domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceAccess.disable',
-    }
-    json = yield cmd_dict
+    return Command('DeviceAccess.disable')
 
 
 def select_prompt(
         id_: RequestId,
         device_id: DeviceId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Select a device in response to a DeviceAccess.deviceRequestPrompted event.
 
@@ -97,30 +90,22 @@ def select_prompt(
     :param device_id:
     '''
     params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
-    params['deviceId'] = device_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceAccess.selectPrompt',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['id'] = id_
+    params['deviceId'] = device_id
+    return Command('DeviceAccess.selectPrompt', params)
 
 
 def cancel_prompt(
         id_: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Cancel a prompt in response to a DeviceAccess.deviceRequestPrompted event.
 
     :param id_:
     '''
     params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceAccess.cancelPrompt',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['id'] = id_
+    return Command('DeviceAccess.cancelPrompt', params)
 
 
 @event_class('DeviceAccess.deviceRequestPrompted')
@@ -134,8 +119,19 @@ class DeviceRequestPrompted:
     devices: typing.List[PromptDevice]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DeviceRequestPrompted:
+    def from_json(cls, json: DeviceRequestPromptedJSON) -> DeviceRequestPrompted:
         return cls(
-            id_=RequestId.from_json(json['id']),
+            id_=RequestId(json['id']),
             devices=[PromptDevice.from_json(i) for i in json['devices']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class PromptDeviceJSON(typing.TypedDict):
+        id: str
+        name: str
+
+
+    class DeviceRequestPromptedJSON(typing.TypedDict):
+        id: str
+        devices: typing.List[PromptDeviceJSON]
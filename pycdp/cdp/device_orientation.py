@@ -8,25 +8,21 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
-def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_device_orientation_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden Device Orientation.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceOrientation.clearDeviceOrientationOverride',
-    }
-    json = yield cmd_dict
+    return Command('DeviceOrientation.clearDeviceOrientationOverride')
 
 
 def set_device_orientation_override(
         alpha: float,
         beta: float,
         gamma: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the Device Orientation.
 
@@ -38,8 +34,4 @@ def set_device_orientation_override(
     params['alpha'] = alpha
     params['beta'] = beta
     params['gamma'] = gamma
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DeviceOrientation.setDeviceOrientationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DeviceOrientation.setDeviceOrientationOverride', params)
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import page
-from . import runtime
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import page
+    from . import runtime
+else:
+    page = lazy_import('page', globals())
+    runtime = lazy_import('runtime', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -64,15 +67,15 @@ class BackendNode:
         json: T_JSON_DICT = dict()
         json['nodeType'] = self.node_type
         json['nodeName'] = self.node_name
-        json['backendNodeId'] = self.backend_node_id.to_json()
+        json['backendNodeId'] = self.backend_node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackendNode:
+    def from_json(cls, json: BackendNodeJSON) -> BackendNode:
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            backend_node_id=BackendNodeId(json['backendNodeId']),
         )
 
 
@@ -122,7 +125,10 @@ class PseudoType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PseudoType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ShadowRootType(enum.Enum):
@@ -138,7 +144,10 @@ class ShadowRootType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ShadowRootType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CompatibilityMode(enum.Enum):
@@ -154,7 +163,10 @@ class CompatibilityMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CompatibilityMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PhysicalAxes(enum.Enum):
@@ -170,7 +182,10 @@ class PhysicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PhysicalAxes:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class LogicalAxes(enum.Enum):
@@ -186,7 +201,10 @@ class LogicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LogicalAxes:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ScrollOrientation(enum.Enum):
@@ -201,7 +219,10 @@ class ScrollOrientation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ScrollOrientation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -310,20 +331,20 @@ class Node:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['nodeId'] = self.node_id.to_json()
-        json['backendNodeId'] = self.backend_node_id.to_json()
+        json['nodeId'] = self.node_id
+        json['backendNodeId'] = self.backend_node_id
         json['nodeType'] = self.node_type
         json['nodeName'] = self.node_name
         json['localName'] = self.local_name
         json['nodeValue'] = self.node_value
         if self.parent_id is not None:
-            json['parentId'] = self.parent_id.to_json()
+            json['parentId'] = self.parent_id
         if self.child_node_count is not None:
             json['childNodeCount'] = self.child_node_count
         if self.children is not None:
             json['children'] = [i.to_json() for i in self.children]
         if self.attributes is not None:
-            json['attributes'] = [i for i in self.attributes]
+            json['attributes'] = list(self.attributes)
         if self.document_url is not None:
             json['documentURL'] = self.document_url
         if self.base_url is not None:
@@ -341,13 +362,13 @@ class Node:
         if self.value is not None:
             json['value'] = self.value
         if self.pseudo_type is not None:
-            json['pseudoType'] = self.pseudo_type.to_json()
+            json['pseudoType'] = self.pseudo_type.value
         if self.pseudo_identifier is not None:
             json['pseudoIdentifier'] = self.pseudo_identifier
         if self.shadow_root_type is not None:
-            json['shadowRootType'] = self.shadow_root_type.to_json()
+            json['shadowRootType'] = self.shadow_root_type.value
         if self.frame_id is not None:
-            json['frameId'] = self.frame_id.to_json()
+            json['frameId'] = self.frame_id
         if self.content_document is not None:
             json['contentDocument'] = self.content_document.to_json()
         if self.shadow_roots is not None:
@@ -363,7 +384,7 @@ class Node:
         if self.is_svg is not None:
             json['isSVG'] = self.is_svg
         if self.compatibility_mode is not None:
-            json['compatibilityMode'] = self.compatibility_mode.to_json()
+            json['compatibilityMode'] = self.compatibility_mode.value
         if self.assigned_slot is not None:
             json['assignedSlot'] = self.assigned_slot.to_json()
         if self.is_scrollable is not None:
@@ -371,40 +392,40 @@ class Node:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Node:
+    def from_json(cls, json: NodeJSON) -> Node:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            local_name=str(json['localName']),
-            node_value=str(json['nodeValue']),
-            parent_id=NodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            child_node_count=int(json['childNodeCount']) if json.get('childNodeCount', None) is not None else None,
-            children=[Node.from_json(i) for i in json['children']] if json.get('children', None) is not None else None,
-            attributes=[str(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
-            public_id=str(json['publicId']) if json.get('publicId', None) is not None else None,
-            system_id=str(json['systemId']) if json.get('systemId', None) is not None else None,
-            internal_subset=str(json['internalSubset']) if json.get('internalSubset', None) is not None else None,
-            xml_version=str(json['xmlVersion']) if json.get('xmlVersion', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            pseudo_type=PseudoType.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            pseudo_identifier=str(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
-            shadow_root_type=ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            content_document=Node.from_json(json['contentDocument']) if json.get('contentDocument', None) is not None else None,
-            shadow_roots=[Node.from_json(i) for i in json['shadowRoots']] if json.get('shadowRoots', None) is not None else None,
-            template_content=Node.from_json(json['templateContent']) if json.get('templateContent', None) is not None else None,
-            pseudo_elements=[Node.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
-            imported_document=Node.from_json(json['importedDocument']) if json.get('importedDocument', None) is not None else None,
-            distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']] if json.get('distributedNodes', None) is not None else None,
-            is_svg=bool(json['isSVG']) if json.get('isSVG', None) is not None else None,
-            compatibility_mode=CompatibilityMode.from_json(json['compatibilityMode']) if json.get('compatibilityMode', None) is not None else None,
-            assigned_slot=BackendNode.from_json(json['assignedSlot']) if json.get('assignedSlot', None) is not None else None,
-            is_scrollable=bool(json['isScrollable']) if json.get('isScrollable', None) is not None else None,
+            node_id=NodeId(json['nodeId']),
+            backend_node_id=BackendNodeId(json['backendNodeId']),
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            local_name=json['localName'],
+            node_value=json['nodeValue'],
+            parent_id=NodeId(_parent_id) if (_parent_id := json.get('parentId')) is not None else None,
+            child_node_count=json.get('childNodeCount'),
+            children=[Node.from_json(i) for i in _children] if (_children := json.get('children')) is not None else None,
+            attributes=json.get('attributes'),
+            document_url=json.get('documentURL'),
+            base_url=json.get('baseURL'),
+            public_id=json.get('publicId'),
+            system_id=json.get('systemId'),
+            internal_subset=json.get('internalSubset'),
+            xml_version=json.get('xmlVersion'),
+            name=json.get('name'),
+            value=json.get('value'),
+            pseudo_type=PseudoType.from_json(_pseudo_type) if (_pseudo_type := json.get('pseudoType')) is not None else None,
+            pseudo_identifier=json.get('pseudoIdentifier'),
+            shadow_root_type=ShadowRootType.from_json(_shadow_root_type) if (_shadow_root_type := json.get('shadowRootType')) is not None else None,
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None,
+            content_document=Node.from_json(_content_document) if (_content_document := json.get('contentDocument')) is not None else None,
+            shadow_roots=[Node.from_json(i) for i in _shadow_roots] if (_shadow_roots := json.get('shadowRoots')) is not None else None,
+            template_content=Node.from_json(_template_content) if (_template_content := json.get('templateContent')) is not None else None,
+            pseudo_elements=[Node.from_json(i) for i in _pseudo_elements] if (_pseudo_elements := json.get('pseudoElements')) is not None else None,
+            imported_document=Node.from_json(_imported_document) if (_imported_document := json.get('importedDocument')) is not None else None,
+            distributed_nodes=[BackendNode.from_json(i) for i in _distributed_nodes] if (_distributed_nodes := json.get('distributedNodes')) is not None else None,
+            is_svg=json.get('isSVG'),
+            compatibility_mode=CompatibilityMode.from_json(_compatibility_mode) if (_compatibility_mode := json.get('compatibilityMode')) is not None else None,
+            assigned_slot=BackendNode.from_json(_assigned_slot) if (_assigned_slot := json.get('assignedSlot')) is not None else None,
+            is_scrollable=json.get('isScrollable'),
         )
 
 
@@ -420,14 +441,14 @@ class DetachedElementInfo:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['treeNode'] = self.tree_node.to_json()
-        json['retainedNodeIds'] = [i.to_json() for i in self.retained_node_ids]
+        json['retainedNodeIds'] = list(self.retained_node_ids)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DetachedElementInfo:
+    def from_json(cls, json: DetachedElementInfoJSON) -> DetachedElementInfo:
         return cls(
             tree_node=Node.from_json(json['treeNode']),
-            retained_node_ids=[NodeId.from_json(i) for i in json['retainedNodeIds']],
+            retained_node_ids=[NodeId(i) for i in json['retainedNodeIds']],
         )
 
 
@@ -458,12 +479,12 @@ class RGBA:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RGBA:
+    def from_json(cls, json: RGBAJSON) -> RGBA:
         return cls(
-            r=int(json['r']),
-            g=int(json['g']),
-            b=int(json['b']),
-            a=float(json['a']) if json.get('a', None) is not None else None,
+            r=json['r'],
+            g=json['g'],
+            b=json['b'],
+            a=float(_a) if (_a := json.get('a')) is not None else None,
         )
 
 
@@ -510,10 +531,10 @@ class BoxModel:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['content'] = self.content.to_json()
-        json['padding'] = self.padding.to_json()
-        json['border'] = self.border.to_json()
-        json['margin'] = self.margin.to_json()
+        json['content'] = self.content
+        json['padding'] = self.padding
+        json['border'] = self.border
+        json['margin'] = self.margin
         json['width'] = self.width
         json['height'] = self.height
         if self.shape_outside is not None:
@@ -521,15 +542,15 @@ class BoxModel:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BoxModel:
+    def from_json(cls, json: BoxModelJSON) -> BoxModel:
         return cls(
-            content=Quad.from_json(json['content']),
-            padding=Quad.from_json(json['padding']),
-            border=Quad.from_json(json['border']),
-            margin=Quad.from_json(json['margin']),
-            width=int(json['width']),
-            height=int(json['height']),
-            shape_outside=ShapeOutsideInfo.from_json(json['shapeOutside']) if json.get('shapeOutside', None) is not None else None,
+            content=Quad(json['content']),
+            padding=Quad(json['padding']),
+            border=Quad(json['border']),
+            margin=Quad(json['margin']),
+            width=json['width'],
+            height=json['height'],
+            shape_outside=ShapeOutsideInfo.from_json(_shape_outside) if (_shape_outside := json.get('shapeOutside')) is not None else None,
         )
 
 
@@ -549,17 +570,17 @@ class ShapeOutsideInfo:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['bounds'] = self.bounds.to_json()
-        json['shape'] = [i for i in self.shape]
-        json['marginShape'] = [i for i in self.margin_shape]
+        json['bounds'] = self.bounds
+        json['shape'] = list(self.shape)
+        json['marginShape'] = list(self.margin_shape)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ShapeOutsideInfo:
+    def from_json(cls, json: ShapeOutsideInfoJSON) -> ShapeOutsideInfo:
         return cls(
-            bounds=Quad.from_json(json['bounds']),
-            shape=[i for i in json['shape']],
-            margin_shape=[i for i in json['marginShape']],
+            bounds=Quad(json['bounds']),
+            shape=json['shape'],
+            margin_shape=json['marginShape'],
         )
 
 
@@ -589,7 +610,7 @@ class Rect:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Rect:
+    def from_json(cls, json: RectJSON) -> Rect:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
@@ -613,16 +634,20 @@ class CSSComputedStyleProperty:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
+    def from_json(cls, json: CSSComputedStylePropertyJSON) -> CSSComputedStyleProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
+def _parse_collect_class_names_from_subtree(json: CollectClassNamesFromSubtreeReturnsJSON) -> typing.List[str]:
+    return json['classNames']
+
+
 def collect_class_names_from_subtree(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[CollectClassNamesFromSubtreeReturnsJSON, typing.List[str]]:
     '''
     Collects class names for the node with given id and all of it's child nodes.
 
@@ -632,20 +657,19 @@ def collect_class_names_from_subtree(
     :returns: Class name list.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.collectClassNamesFromSubtree',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    params['nodeId'] = node_id
+    return Command('DOM.collectClassNamesFromSubtree', params, _parse_collect_class_names_from_subtree)
+
+
+def _parse_copy_to(json: CopyToReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def copy_to(
         node_id: NodeId,
         target_node_id: NodeId,
         insert_before_node_id: typing.Optional[NodeId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[CopyToReturnsJSON, NodeId]:
     '''
     Creates a deep copy of the specified node and places it into the target container before the
     given anchor.
@@ -658,16 +682,15 @@ def copy_to(
     :returns: Id of the node clone.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
+    params['nodeId'] = node_id
+    params['targetNodeId'] = target_node_id
     if insert_before_node_id is not None:
-        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.copyTo',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+        params['insertBeforeNodeId'] = insert_before_node_id
+    return Command('DOM.copyTo', params, _parse_copy_to)
+
+
+def _parse_describe_node(json: DescribeNodeReturnsJSON) -> Node:
+    return Node.from_json(json['node'])
 
 
 def describe_node(
@@ -676,7 +699,7 @@ def describe_node(
         object_id: typing.Optional[runtime.RemoteObjectId] = None,
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Node]:
+    ) -> Command[DescribeNodeReturnsJSON, Node]:
     '''
     Describes node given its id, does not require domain to be enabled. Does not start tracking any
     objects, can be used for automation.
@@ -690,21 +713,16 @@ def describe_node(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if depth is not None:
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.describeNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Node.from_json(json['node'])
+    return Command('DOM.describeNode', params, _parse_describe_node)
 
 
 def scroll_into_view_if_needed(
@@ -712,7 +730,7 @@ def scroll_into_view_if_needed(
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None,
         rect: typing.Optional[Rect] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Scrolls the specified rect of the given node into view if not already visible.
     Note: exactly one between nodeId, backendNodeId and objectId should be passed
@@ -725,33 +743,26 @@ def scroll_into_view_if_needed(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if rect is not None:
         params['rect'] = rect.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.scrollIntoViewIfNeeded',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.scrollIntoViewIfNeeded', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables DOM agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.disable',
-    }
-    json = yield cmd_dict
+    return Command('DOM.disable')
 
 
 def discard_search_results(
         search_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Discards search results from the session with the given id. ``getSearchResults`` should no longer
     be called for that search.
@@ -762,16 +773,12 @@ def discard_search_results(
     '''
     params: T_JSON_DICT = dict()
     params['searchId'] = search_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.discardSearchResults',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.discardSearchResults', params)
 
 
 def enable(
         include_whitespace: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables DOM agent for the given page.
 
@@ -780,18 +787,14 @@ def enable(
     params: T_JSON_DICT = dict()
     if include_whitespace is not None:
         params['includeWhitespace'] = include_whitespace
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.enable', params)
 
 
 def focus(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Focuses the given element.
 
@@ -801,21 +804,21 @@ def focus(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.focus',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['objectId'] = object_id
+    return Command('DOM.focus', params)
+
+
+def _parse_get_attributes(json: GetAttributesReturnsJSON) -> typing.List[str]:
+    return json['attributes']
 
 
 def get_attributes(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[GetAttributesReturnsJSON, typing.List[str]]:
     '''
     Returns attributes for the specified node.
 
@@ -823,20 +826,19 @@ def get_attributes(
     :returns: An interleaved array of node attribute names and values.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getAttributes',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['attributes']]
+    params['nodeId'] = node_id
+    return Command('DOM.getAttributes', params, _parse_get_attributes)
+
+
+def _parse_get_box_model(json: GetBoxModelReturnsJSON) -> BoxModel:
+    return BoxModel.from_json(json['model'])
 
 
 def get_box_model(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,BoxModel]:
+    ) -> Command[GetBoxModelReturnsJSON, BoxModel]:
     '''
     Returns boxes for the given node.
 
@@ -847,24 +849,23 @@ def get_box_model(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getBoxModel',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return BoxModel.from_json(json['model'])
+        params['objectId'] = object_id
+    return Command('DOM.getBoxModel', params, _parse_get_box_model)
+
+
+def _parse_get_content_quads(json: GetContentQuadsReturnsJSON) -> typing.List[Quad]:
+    return [Quad(i) for i in json['quads']]
 
 
 def get_content_quads(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Quad]]:
+    ) -> Command[GetContentQuadsReturnsJSON, typing.List[Quad]]:
     '''
     Returns quads that describe node position on the page. This method
     might return multiple quads for inline nodes.
@@ -878,23 +879,22 @@ def get_content_quads(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getContentQuads',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Quad.from_json(i) for i in json['quads']]
+        params['objectId'] = object_id
+    return Command('DOM.getContentQuads', params, _parse_get_content_quads)
+
+
+def _parse_get_document(json: GetDocumentReturnsJSON) -> Node:
+    return Node.from_json(json['root'])
 
 
 def get_document(
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Node]:
+    ) -> Command[GetDocumentReturnsJSON, Node]:
     '''
     Returns the root DOM node (and optionally the subtree) to the caller.
     Implicitly enables the DOM domain events for the current target.
@@ -908,19 +908,18 @@ def get_document(
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getDocument',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Node.from_json(json['root'])
+    return Command('DOM.getDocument', params, _parse_get_document)
+
+
+def _parse_get_flattened_document(json: GetFlattenedDocumentReturnsJSON) -> typing.List[Node]:
+    return [Node.from_json(i) for i in json['nodes']]
 
 
 @deprecated(version="1.3")
 def get_flattened_document(
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Node]]:
+    ) -> Command[GetFlattenedDocumentReturnsJSON, typing.List[Node]]:
     '''
     Returns the root DOM node (and optionally the subtree) to the caller.
     Deprecated, as it is not designed to work well with the rest of the DOM agent.
@@ -937,19 +936,18 @@ def get_flattened_document(
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getFlattenedDocument',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Node.from_json(i) for i in json['nodes']]
+    return Command('DOM.getFlattenedDocument', params, _parse_get_flattened_document)
+
+
+def _parse_get_nodes_for_subtree_by_style(json: GetNodesForSubtreeByStyleReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def get_nodes_for_subtree_by_style(
         node_id: NodeId,
         computed_styles: typing.List[CSSComputedStyleProperty],
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+    ) -> Command[GetNodesForSubtreeByStyleReturnsJSON, typing.List[NodeId]]:
     '''
     Finds nodes with a given computed style in a subtree.
 
@@ -961,16 +959,19 @@ def get_nodes_for_subtree_by_style(
     :returns: Resulting nodes.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['computedStyles'] = [i.to_json() for i in computed_styles]
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getNodesForSubtreeByStyle',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return Command('DOM.getNodesForSubtreeByStyle', params, _parse_get_nodes_for_subtree_by_style)
+
+
+def _parse_get_node_for_location(json: GetNodeForLocationReturnsJSON) -> typing.Tuple[BackendNodeId, page.FrameId, typing.Optional[NodeId]]:
+    return (
+        BackendNodeId(json['backendNodeId']),
+        page.FrameId(json['frameId']),
+        NodeId(_node_id) if (_node_id := json.get('nodeId')) is not None else None
+    )
 
 
 def get_node_for_location(
@@ -978,7 +979,7 @@ def get_node_for_location(
         y: int,
         include_user_agent_shadow_dom: typing.Optional[bool] = None,
         ignore_pointer_events_none: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BackendNodeId, page.FrameId, typing.Optional[NodeId]]]:
+    ) -> Command[GetNodeForLocationReturnsJSON, typing.Tuple[BackendNodeId, page.FrameId, typing.Optional[NodeId]]]:
     '''
     Returns node id at given location. Depending on whether DOM domain is enabled, nodeId is
     either returned or not.
@@ -1000,23 +1001,18 @@ def get_node_for_location(
         params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
     if ignore_pointer_events_none is not None:
         params['ignorePointerEventsNone'] = ignore_pointer_events_none
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getNodeForLocation',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        page.FrameId.from_json(json['frameId']),
-        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
-    )
+    return Command('DOM.getNodeForLocation', params, _parse_get_node_for_location)
+
+
+def _parse_get_outer_html(json: GetOuterHTMLReturnsJSON) -> str:
+    return json['outerHTML']
 
 
 def get_outer_html(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[GetOuterHTMLReturnsJSON, str]:
     '''
     Returns node's HTML markup.
 
@@ -1027,22 +1023,21 @@ def get_outer_html(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getOuterHTML',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['outerHTML'])
+        params['objectId'] = object_id
+    return Command('DOM.getOuterHTML', params, _parse_get_outer_html)
+
+
+def _parse_get_relayout_boundary(json: GetRelayoutBoundaryReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def get_relayout_boundary(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[GetRelayoutBoundaryReturnsJSON, NodeId]:
     '''
     Returns the id of the nearest ancestor that is a relayout boundary.
 
@@ -1052,20 +1047,19 @@ def get_relayout_boundary(
     :returns: Relayout boundary node id for the given node.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getRelayoutBoundary',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    params['nodeId'] = node_id
+    return Command('DOM.getRelayoutBoundary', params, _parse_get_relayout_boundary)
+
+
+def _parse_get_search_results(json: GetSearchResultsReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def get_search_results(
         search_id: str,
         from_index: int,
         to_index: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+    ) -> Command[GetSearchResultsReturnsJSON, typing.List[NodeId]]:
     '''
     Returns search results from given ``fromIndex`` to given ``toIndex`` from the search with the given
     identifier.
@@ -1081,61 +1075,48 @@ def get_search_results(
     params['searchId'] = search_id
     params['fromIndex'] = from_index
     params['toIndex'] = to_index
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getSearchResults',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return Command('DOM.getSearchResults', params, _parse_get_search_results)
 
 
-def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def hide_highlight() -> Command[T_JSON_DICT, None]:
     '''
     Hides any highlight.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.hideHighlight',
-    }
-    json = yield cmd_dict
+    return Command('DOM.hideHighlight')
 
 
-def highlight_node() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def highlight_node() -> Command[T_JSON_DICT, None]:
     '''
     Highlights DOM node.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.highlightNode',
-    }
-    json = yield cmd_dict
+    return Command('DOM.highlightNode')
 
 
-def highlight_rect() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def highlight_rect() -> Command[T_JSON_DICT, None]:
     '''
     Highlights given rectangle.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.highlightRect',
-    }
-    json = yield cmd_dict
+    return Command('DOM.highlightRect')
 
 
-def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def mark_undoable_state() -> Command[T_JSON_DICT, None]:
     '''
     Marks last undoable state.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.markUndoableState',
-    }
-    json = yield cmd_dict
+    return Command('DOM.markUndoableState')
+
+
+def _parse_move_to(json: MoveToReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def move_to(
         node_id: NodeId,
         target_node_id: NodeId,
         insert_before_node_id: typing.Optional[NodeId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[MoveToReturnsJSON, NodeId]:
     '''
     Moves node into the new container, places it before the given anchor.
 
@@ -1145,22 +1126,24 @@ def move_to(
     :returns: New id of the moved node.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
+    params['nodeId'] = node_id
+    params['targetNodeId'] = target_node_id
     if insert_before_node_id is not None:
-        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.moveTo',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+        params['insertBeforeNodeId'] = insert_before_node_id
+    return Command('DOM.moveTo', params, _parse_move_to)
+
+
+def _parse_perform_search(json: PerformSearchReturnsJSON) -> typing.Tuple[str, int]:
+    return (
+        json['searchId'],
+        json['resultCount']
+    )
 
 
 def perform_search(
         query: str,
         include_user_agent_shadow_dom: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, int]]:
+    ) -> Command[PerformSearchReturnsJSON, typing.Tuple[str, int]]:
     '''
     Searches for a given string in the DOM tree. Use ``getSearchResults`` to access search results or
     ``cancelSearch`` to end this search session.
@@ -1178,20 +1161,16 @@ def perform_search(
     params['query'] = query
     if include_user_agent_shadow_dom is not None:
         params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.performSearch',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['searchId']),
-        int(json['resultCount'])
-    )
+    return Command('DOM.performSearch', params, _parse_perform_search)
+
+
+def _parse_push_node_by_path_to_frontend(json: PushNodeByPathToFrontendReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def push_node_by_path_to_frontend(
         path: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[PushNodeByPathToFrontendReturnsJSON, NodeId]:
     '''
     Requests that the node is sent to the caller given its path. // FIXME, use XPath
 
@@ -1202,17 +1181,16 @@ def push_node_by_path_to_frontend(
     '''
     params: T_JSON_DICT = dict()
     params['path'] = path
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.pushNodeByPathToFrontend',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return Command('DOM.pushNodeByPathToFrontend', params, _parse_push_node_by_path_to_frontend)
+
+
+def _parse_push_nodes_by_backend_ids_to_frontend(json: PushNodesByBackendIdsToFrontendReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def push_nodes_by_backend_ids_to_frontend(
         backend_node_ids: typing.List[BackendNodeId]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+    ) -> Command[PushNodesByBackendIdsToFrontendReturnsJSON, typing.List[NodeId]]:
     '''
     Requests that a batch of nodes is sent to the caller given their backend node ids.
 
@@ -1222,19 +1200,18 @@ def push_nodes_by_backend_ids_to_frontend(
     :returns: The array of ids of pushed nodes that correspond to the backend ids specified in backendNodeIds.
     '''
     params: T_JSON_DICT = dict()
-    params['backendNodeIds'] = [i.to_json() for i in backend_node_ids]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.pushNodesByBackendIdsToFrontend',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    params['backendNodeIds'] = list(backend_node_ids)
+    return Command('DOM.pushNodesByBackendIdsToFrontend', params, _parse_push_nodes_by_backend_ids_to_frontend)
+
+
+def _parse_query_selector(json: QuerySelectorReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def query_selector(
         node_id: NodeId,
         selector: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[QuerySelectorReturnsJSON, NodeId]:
     '''
     Executes ``querySelector`` on a given node.
 
@@ -1243,20 +1220,19 @@ def query_selector(
     :returns: Query selector result.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.querySelector',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return Command('DOM.querySelector', params, _parse_query_selector)
+
+
+def _parse_query_selector_all(json: QuerySelectorAllReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def query_selector_all(
         node_id: NodeId,
         selector: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+    ) -> Command[QuerySelectorAllReturnsJSON, typing.List[NodeId]]:
     '''
     Executes ``querySelectorAll`` on a given node.
 
@@ -1265,17 +1241,16 @@ def query_selector_all(
     :returns: Query selector result.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.querySelectorAll',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return Command('DOM.querySelectorAll', params, _parse_query_selector_all)
 
 
-def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+def _parse_get_top_layer_elements(json: GetTopLayerElementsReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
+
+
+def get_top_layer_elements() -> Command[GetTopLayerElementsReturnsJSON, typing.List[NodeId]]:
     '''
     Returns NodeIds of current top layer elements.
     Top layer is rendered closest to the user within a viewport, therefore its elements always
@@ -1285,17 +1260,17 @@ def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
 
     :returns: NodeIds of top layer elements
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getTopLayerElements',
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return Command('DOM.getTopLayerElements', None, _parse_get_top_layer_elements)
+
+
+def _parse_get_element_by_relation(json: GetElementByRelationReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def get_element_by_relation(
         node_id: NodeId,
         relation: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[GetElementByRelationReturnsJSON, NodeId]:
     '''
     Returns the NodeId of the matched element according to certain relations.
 
@@ -1306,32 +1281,24 @@ def get_element_by_relation(
     :returns: NodeId of the element matching the queried relation.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['relation'] = relation
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getElementByRelation',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return Command('DOM.getElementByRelation', params, _parse_get_element_by_relation)
 
 
-def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def redo() -> Command[T_JSON_DICT, None]:
     '''
     Re-does the last undone action.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.redo',
-    }
-    json = yield cmd_dict
+    return Command('DOM.redo')
 
 
 def remove_attribute(
         node_id: NodeId,
         name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes attribute with given name from an element with given id.
 
@@ -1339,37 +1306,29 @@ def remove_attribute(
     :param name: Name of the attribute to remove.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['name'] = name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.removeAttribute',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.removeAttribute', params)
 
 
 def remove_node(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes node with given id.
 
     :param node_id: Id of the node to remove.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.removeNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    return Command('DOM.removeNode', params)
 
 
 def request_child_nodes(
         node_id: NodeId,
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that children of the node with given id are returned to the caller in form of
     ``setChildNodes`` events where not only immediate children are retrieved, but all children down to
@@ -1380,21 +1339,21 @@ def request_child_nodes(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the sub-tree (default is false).
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     if depth is not None:
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.requestChildNodes',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.requestChildNodes', params)
+
+
+def _parse_request_node(json: RequestNodeReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def request_node(
         object_id: runtime.RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[RequestNodeReturnsJSON, NodeId]:
     '''
     Requests that the node is sent to the caller given the JavaScript node object reference. All
     nodes that form the path from the node to the root are also sent to the client as a series of
@@ -1404,13 +1363,12 @@ def request_node(
     :returns: Node id for given object.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.requestNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    params['objectId'] = object_id
+    return Command('DOM.requestNode', params, _parse_request_node)
+
+
+def _parse_resolve_node(json: ResolveNodeReturnsJSON) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['object'])
 
 
 def resolve_node(
@@ -1418,7 +1376,7 @@ def resolve_node(
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_group: typing.Optional[str] = None,
         execution_context_id: typing.Optional[runtime.ExecutionContextId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
+    ) -> Command[ResolveNodeReturnsJSON, runtime.RemoteObject]:
     '''
     Resolves the JavaScript node object for a given NodeId or BackendNodeId.
 
@@ -1430,26 +1388,21 @@ def resolve_node(
     '''
     params: T_JSON_DICT = dict()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_group is not None:
         params['objectGroup'] = object_group
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.resolveNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['object'])
+        params['executionContextId'] = execution_context_id
+    return Command('DOM.resolveNode', params, _parse_resolve_node)
 
 
 def set_attribute_value(
         node_id: NodeId,
         name: str,
         value: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets attribute for an element with given id.
 
@@ -1458,21 +1411,17 @@ def set_attribute_value(
     :param value: Attribute value.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['name'] = name
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setAttributeValue',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.setAttributeValue', params)
 
 
 def set_attributes_as_text(
         node_id: NodeId,
         text: str,
         name: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets attributes on element with given id. This method is useful when user edits some existing
     attribute value and types in several attribute name/value pairs.
@@ -1482,15 +1431,11 @@ def set_attributes_as_text(
     :param name: *(Optional)* Attribute name to replace with new attributes derived from text in case text parsed successfully.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['text'] = text
     if name is not None:
         params['name'] = name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setAttributesAsText',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.setAttributesAsText', params)
 
 
 def set_file_input_files(
@@ -1498,7 +1443,7 @@ def set_file_input_files(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets files for the given file input element.
 
@@ -1508,23 +1453,19 @@ def set_file_input_files(
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     '''
     params: T_JSON_DICT = dict()
-    params['files'] = [i for i in files]
+    params['files'] = list(files)
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setFileInputFiles',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['objectId'] = object_id
+    return Command('DOM.setFileInputFiles', params)
 
 
 def set_node_stack_traces_enabled(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets if stack traces should be captured for Nodes. See ``Node.getNodeStackTraces``. Default is disabled.
 
@@ -1534,16 +1475,16 @@ def set_node_stack_traces_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setNodeStackTracesEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.setNodeStackTracesEnabled', params)
+
+
+def _parse_get_node_stack_traces(json: GetNodeStackTracesReturnsJSON) -> typing.Optional[runtime.StackTrace]:
+    return runtime.StackTrace.from_json(_creation) if (_creation := json.get('creation')) is not None else None
 
 
 def get_node_stack_traces(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[runtime.StackTrace]]:
+    ) -> Command[GetNodeStackTracesReturnsJSON, typing.Optional[runtime.StackTrace]]:
     '''
     Gets stack traces associated with a Node. As of now, only provides stack trace for Node creation.
 
@@ -1553,18 +1494,17 @@ def get_node_stack_traces(
     :returns: *(Optional)* Creation stack trace, if available.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getNodeStackTraces',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.StackTrace.from_json(json['creation']) if json.get('creation', None) is not None else None
+    params['nodeId'] = node_id
+    return Command('DOM.getNodeStackTraces', params, _parse_get_node_stack_traces)
+
+
+def _parse_get_file_info(json: GetFileInfoReturnsJSON) -> str:
+    return json['path']
 
 
 def get_file_info(
         object_id: runtime.RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[GetFileInfoReturnsJSON, str]:
     '''
     Returns file information for the given
     File wrapper.
@@ -1575,16 +1515,15 @@ def get_file_info(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getFileInfo',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['path'])
+    params['objectId'] = object_id
+    return Command('DOM.getFileInfo', params, _parse_get_file_info)
 
 
-def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[DetachedElementInfo]]:
+def _parse_get_detached_dom_nodes(json: GetDetachedDomNodesReturnsJSON) -> typing.List[DetachedElementInfo]:
+    return [DetachedElementInfo.from_json(i) for i in json['detachedNodes']]
+
+
+def get_detached_dom_nodes() -> Command[GetDetachedDomNodesReturnsJSON, typing.List[DetachedElementInfo]]:
     '''
     Returns list of detached nodes
 
@@ -1592,16 +1531,12 @@ def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
 
     :returns: The list of detached nodes
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getDetachedDomNodes',
-    }
-    json = yield cmd_dict
-    return [DetachedElementInfo.from_json(i) for i in json['detachedNodes']]
+    return Command('DOM.getDetachedDomNodes', None, _parse_get_detached_dom_nodes)
 
 
 def set_inspected_node(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables console to refer to the node with given id via $x (see Command Line API for more details
     $x functions).
@@ -1611,18 +1546,18 @@ def set_inspected_node(
     :param node_id: DOM node id to be accessible by means of $x command line API.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setInspectedNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    return Command('DOM.setInspectedNode', params)
+
+
+def _parse_set_node_name(json: SetNodeNameReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def set_node_name(
         node_id: NodeId,
         name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[SetNodeNameReturnsJSON, NodeId]:
     '''
     Sets node name for a node with given id.
 
@@ -1631,20 +1566,15 @@ def set_node_name(
     :returns: New node's id.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['name'] = name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setNodeName',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return Command('DOM.setNodeName', params, _parse_set_node_name)
 
 
 def set_node_value(
         node_id: NodeId,
         value: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets node value for a node with given id.
 
@@ -1652,19 +1582,15 @@ def set_node_value(
     :param value: New node's value.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setNodeValue',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.setNodeValue', params)
 
 
 def set_outer_html(
         node_id: NodeId,
         outer_html: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets node HTML markup, returns new node id.
 
@@ -1672,30 +1598,30 @@ def set_outer_html(
     :param outer_html: Outer HTML markup to set.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     params['outerHTML'] = outer_html
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.setOuterHTML',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOM.setOuterHTML', params)
 
 
-def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def undo() -> Command[T_JSON_DICT, None]:
     '''
     Undoes the last performed action.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.undo',
-    }
-    json = yield cmd_dict
+    return Command('DOM.undo')
+
+
+def _parse_get_frame_owner(json: GetFrameOwnerReturnsJSON) -> typing.Tuple[BackendNodeId, typing.Optional[NodeId]]:
+    return (
+        BackendNodeId(json['backendNodeId']),
+        NodeId(_node_id) if (_node_id := json.get('nodeId')) is not None else None
+    )
 
 
 def get_frame_owner(
         frame_id: page.FrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BackendNodeId, typing.Optional[NodeId]]]:
+    ) -> Command[GetFrameOwnerReturnsJSON, typing.Tuple[BackendNodeId, typing.Optional[NodeId]]]:
     '''
     Returns iframe node that owns iframe with the given domain.
 
@@ -1708,16 +1634,12 @@ def get_frame_owner(
         1. **nodeId** - *(Optional)* Id of the node at given coordinates, only when enabled and requested document.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getFrameOwner',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
-    )
+    params['frameId'] = frame_id
+    return Command('DOM.getFrameOwner', params, _parse_get_frame_owner)
+
+
+def _parse_get_container_for_node(json: GetContainerForNodeReturnsJSON) -> typing.Optional[NodeId]:
+    return NodeId(_node_id) if (_node_id := json.get('nodeId')) is not None else None
 
 
 def get_container_for_node(
@@ -1726,7 +1648,7 @@ def get_container_for_node(
         physical_axes: typing.Optional[PhysicalAxes] = None,
         logical_axes: typing.Optional[LogicalAxes] = None,
         queries_scroll_state: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[NodeId]]:
+    ) -> Command[GetContainerForNodeReturnsJSON, typing.Optional[NodeId]]:
     '''
     Returns the query container of the given node based on container query
     conditions: containerName, physical and logical axes, and whether it queries
@@ -1744,26 +1666,25 @@ def get_container_for_node(
     :returns: *(Optional)* The container node for the given node, or null if not found.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     if container_name is not None:
         params['containerName'] = container_name
     if physical_axes is not None:
-        params['physicalAxes'] = physical_axes.to_json()
+        params['physicalAxes'] = physical_axes.value
     if logical_axes is not None:
-        params['logicalAxes'] = logical_axes.to_json()
+        params['logicalAxes'] = logical_axes.value
     if queries_scroll_state is not None:
         params['queriesScrollState'] = queries_scroll_state
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getContainerForNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
+    return Command('DOM.getContainerForNode', params, _parse_get_container_for_node)
+
+
+def _parse_get_querying_descendants_for_container(json: GetQueryingDescendantsForContainerReturnsJSON) -> typing.List[NodeId]:
+    return [NodeId(i) for i in json['nodeIds']]
 
 
 def get_querying_descendants_for_container(
         node_id: NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
+    ) -> Command[GetQueryingDescendantsForContainerReturnsJSON, typing.List[NodeId]]:
     '''
     Returns the descendants of a container query container that have
     container queries against this container.
@@ -1774,19 +1695,18 @@ def get_querying_descendants_for_container(
     :returns: Descendant nodes with container queries against the given container.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getQueryingDescendantsForContainer',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    params['nodeId'] = node_id
+    return Command('DOM.getQueryingDescendantsForContainer', params, _parse_get_querying_descendants_for_container)
+
+
+def _parse_get_anchor_element(json: GetAnchorElementReturnsJSON) -> NodeId:
+    return NodeId(json['nodeId'])
 
 
 def get_anchor_element(
         node_id: NodeId,
         anchor_specifier: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
+    ) -> Command[GetAnchorElementReturnsJSON, NodeId]:
     '''
     Returns the target anchor element of the given anchor query according to
     https://www.w3.org/TR/css-anchor-position-1/#target.
@@ -1798,15 +1718,10 @@ def get_anchor_element(
     :returns: The anchor element of the given anchor query.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     if anchor_specifier is not None:
         params['anchorSpecifier'] = anchor_specifier
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getAnchorElement',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return Command('DOM.getAnchorElement', params, _parse_get_anchor_element)
 
 
 @event_class('DOM.attributeModified')
@@ -1823,11 +1738,11 @@ class AttributeModified:
     value: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributeModified:
+    def from_json(cls, json: AttributeModifiedJSON) -> AttributeModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name']),
-            value=str(json['value'])
+            node_id=NodeId(json['nodeId']),
+            name=json['name'],
+            value=json['value']
         )
 
 
@@ -1843,10 +1758,10 @@ class AttributeRemoved:
     name: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributeRemoved:
+    def from_json(cls, json: AttributeRemovedJSON) -> AttributeRemoved:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name'])
+            node_id=NodeId(json['nodeId']),
+            name=json['name']
         )
 
 
@@ -1862,10 +1777,10 @@ class CharacterDataModified:
     character_data: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CharacterDataModified:
+    def from_json(cls, json: CharacterDataModifiedJSON) -> CharacterDataModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            character_data=str(json['characterData'])
+            node_id=NodeId(json['nodeId']),
+            character_data=json['characterData']
         )
 
 
@@ -1881,10 +1796,10 @@ class ChildNodeCountUpdated:
     child_node_count: int
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ChildNodeCountUpdated:
+    def from_json(cls, json: ChildNodeCountUpdatedJSON) -> ChildNodeCountUpdated:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            child_node_count=int(json['childNodeCount'])
+            node_id=NodeId(json['nodeId']),
+            child_node_count=json['childNodeCount']
         )
 
 
@@ -1902,10 +1817,10 @@ class ChildNodeInserted:
     node: Node
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ChildNodeInserted:
+    def from_json(cls, json: ChildNodeInsertedJSON) -> ChildNodeInserted:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            previous_node_id=NodeId.from_json(json['previousNodeId']),
+            parent_node_id=NodeId(json['parentNodeId']),
+            previous_node_id=NodeId(json['previousNodeId']),
             node=Node.from_json(json['node'])
         )
 
@@ -1922,10 +1837,10 @@ class ChildNodeRemoved:
     node_id: NodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ChildNodeRemoved:
+    def from_json(cls, json: ChildNodeRemovedJSON) -> ChildNodeRemoved:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            node_id=NodeId.from_json(json['nodeId'])
+            parent_node_id=NodeId(json['parentNodeId']),
+            node_id=NodeId(json['nodeId'])
         )
 
 
@@ -1943,9 +1858,9 @@ class DistributedNodesUpdated:
     distributed_nodes: typing.List[BackendNode]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DistributedNodesUpdated:
+    def from_json(cls, json: DistributedNodesUpdatedJSON) -> DistributedNodesUpdated:
         return cls(
-            insertion_point_id=NodeId.from_json(json['insertionPointId']),
+            insertion_point_id=NodeId(json['insertionPointId']),
             distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']]
         )
 
@@ -1977,9 +1892,9 @@ class InlineStyleInvalidated:
     node_ids: typing.List[NodeId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InlineStyleInvalidated:
+    def from_json(cls, json: InlineStyleInvalidatedJSON) -> InlineStyleInvalidated:
         return cls(
-            node_ids=[NodeId.from_json(i) for i in json['nodeIds']]
+            node_ids=[NodeId(i) for i in json['nodeIds']]
         )
 
 
@@ -1997,9 +1912,9 @@ class PseudoElementAdded:
     pseudo_element: Node
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PseudoElementAdded:
+    def from_json(cls, json: PseudoElementAddedJSON) -> PseudoElementAdded:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
+            parent_id=NodeId(json['parentId']),
             pseudo_element=Node.from_json(json['pseudoElement'])
         )
 
@@ -2035,10 +1950,10 @@ class ScrollableFlagUpdated:
     is_scrollable: bool
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScrollableFlagUpdated:
+    def from_json(cls, json: ScrollableFlagUpdatedJSON) -> ScrollableFlagUpdated:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            is_scrollable=bool(json['isScrollable'])
+            node_id=NodeId(json['nodeId']),
+            is_scrollable=json['isScrollable']
         )
 
 
@@ -2056,10 +1971,10 @@ class PseudoElementRemoved:
     pseudo_element_id: NodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PseudoElementRemoved:
+    def from_json(cls, json: PseudoElementRemovedJSON) -> PseudoElementRemoved:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
-            pseudo_element_id=NodeId.from_json(json['pseudoElementId'])
+            parent_id=NodeId(json['parentId']),
+            pseudo_element_id=NodeId(json['pseudoElementId'])
         )
 
 
@@ -2076,9 +1991,9 @@ class SetChildNodes:
     nodes: typing.List[Node]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SetChildNodes:
+    def from_json(cls, json: SetChildNodesJSON) -> SetChildNodes:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
+            parent_id=NodeId(json['parentId']),
             nodes=[Node.from_json(i) for i in json['nodes']]
         )
 
@@ -2097,10 +2012,10 @@ class ShadowRootPopped:
     root_id: NodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ShadowRootPopped:
+    def from_json(cls, json: ShadowRootPoppedJSON) -> ShadowRootPopped:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
-            root_id=NodeId.from_json(json['rootId'])
+            host_id=NodeId(json['hostId']),
+            root_id=NodeId(json['rootId'])
         )
 
 
@@ -2118,8 +2033,304 @@ class ShadowRootPushed:
     root: Node
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ShadowRootPushed:
+    def from_json(cls, json: ShadowRootPushedJSON) -> ShadowRootPushed:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
+            host_id=NodeId(json['hostId']),
             root=Node.from_json(json['root'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class BackendNodeJSON(typing.TypedDict):
+        nodeType: int
+        nodeName: str
+        backendNodeId: int
+
+
+    class _NodeJSON(typing.TypedDict):
+        nodeId: int
+        backendNodeId: int
+        nodeType: int
+        nodeName: str
+        localName: str
+        nodeValue: str
+
+
+    class NodeJSON(_NodeJSON, total=False):
+        parentId: int
+        childNodeCount: int
+        children: typing.List[NodeJSON]
+        attributes: typing.List[str]
+        documentURL: str
+        baseURL: str
+        publicId: str
+        systemId: str
+        internalSubset: str
+        xmlVersion: str
+        name: str
+        value: str
+        pseudoType: str
+        pseudoIdentifier: str
+        shadowRootType: str
+        frameId: str
+        contentDocument: NodeJSON
+        shadowRoots: typing.List[NodeJSON]
+        templateContent: NodeJSON
+        pseudoElements: typing.List[NodeJSON]
+        importedDocument: NodeJSON
+        distributedNodes: typing.List[BackendNodeJSON]
+        isSVG: bool
+        compatibilityMode: str
+        assignedSlot: BackendNodeJSON
+        isScrollable: bool
+
+
+    class DetachedElementInfoJSON(typing.TypedDict):
+        treeNode: NodeJSON
+        retainedNodeIds: typing.List[int]
+
+
+    class _RGBAJSON(typing.TypedDict):
+        r: int
+        g: int
+        b: int
+
+
+    class RGBAJSON(_RGBAJSON, total=False):
+        a: float
+
+
+    class _BoxModelJSON(typing.TypedDict):
+        content: typing.List[float]
+        padding: typing.List[float]
+        border: typing.List[float]
+        margin: typing.List[float]
+        width: int
+        height: int
+
+
+    class BoxModelJSON(_BoxModelJSON, total=False):
+        shapeOutside: ShapeOutsideInfoJSON
+
+
+    class ShapeOutsideInfoJSON(typing.TypedDict):
+        bounds: typing.List[float]
+        shape: typing.List[typing.Any]
+        marginShape: typing.List[typing.Any]
+
+
+    class RectJSON(typing.TypedDict):
+        x: float
+        y: float
+        width: float
+        height: float
+
+
+    class CSSComputedStylePropertyJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class CollectClassNamesFromSubtreeReturnsJSON(typing.TypedDict):
+        classNames: typing.List[str]
+
+
+    class CopyToReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class DescribeNodeReturnsJSON(typing.TypedDict):
+        node: NodeJSON
+
+
+    class GetAttributesReturnsJSON(typing.TypedDict):
+        attributes: typing.List[str]
+
+
+    class GetBoxModelReturnsJSON(typing.TypedDict):
+        model: BoxModelJSON
+
+
+    class GetContentQuadsReturnsJSON(typing.TypedDict):
+        quads: typing.List[typing.List[float]]
+
+
+    class GetDocumentReturnsJSON(typing.TypedDict):
+        root: NodeJSON
+
+
+    class GetFlattenedDocumentReturnsJSON(typing.TypedDict):
+        nodes: typing.List[NodeJSON]
+
+
+    class GetNodesForSubtreeByStyleReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class _GetNodeForLocationReturnsJSON(typing.TypedDict):
+        backendNodeId: int
+        frameId: str
+
+
+    class GetNodeForLocationReturnsJSON(_GetNodeForLocationReturnsJSON, total=False):
+        nodeId: int
+
+
+    class GetOuterHTMLReturnsJSON(typing.TypedDict):
+        outerHTML: str
+
+
+    class GetRelayoutBoundaryReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class GetSearchResultsReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class MoveToReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class PerformSearchReturnsJSON(typing.TypedDict):
+        searchId: str
+        resultCount: int
+
+
+    class PushNodeByPathToFrontendReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class PushNodesByBackendIdsToFrontendReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class QuerySelectorReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class QuerySelectorAllReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class GetTopLayerElementsReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class GetElementByRelationReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class RequestNodeReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class ResolveNodeReturnsJSON(typing.TypedDict):
+        object: runtime.RemoteObjectJSON
+
+
+    class GetNodeStackTracesReturnsJSON(typing.TypedDict, total=False):
+        creation: runtime.StackTraceJSON
+
+
+    class GetFileInfoReturnsJSON(typing.TypedDict):
+        path: str
+
+
+    class GetDetachedDomNodesReturnsJSON(typing.TypedDict):
+        detachedNodes: typing.List[DetachedElementInfoJSON]
+
+
+    class SetNodeNameReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class _GetFrameOwnerReturnsJSON(typing.TypedDict):
+        backendNodeId: int
+
+
+    class GetFrameOwnerReturnsJSON(_GetFrameOwnerReturnsJSON, total=False):
+        nodeId: int
+
+
+    class GetContainerForNodeReturnsJSON(typing.TypedDict, total=False):
+        nodeId: int
+
+
+    class GetQueryingDescendantsForContainerReturnsJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class GetAnchorElementReturnsJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class AttributeModifiedJSON(typing.TypedDict):
+        nodeId: int
+        name: str
+        value: str
+
+
+    class AttributeRemovedJSON(typing.TypedDict):
+        nodeId: int
+        name: str
+
+
+    class CharacterDataModifiedJSON(typing.TypedDict):
+        nodeId: int
+        characterData: str
+
+
+    class ChildNodeCountUpdatedJSON(typing.TypedDict):
+        nodeId: int
+        childNodeCount: int
+
+
+    class ChildNodeInsertedJSON(typing.TypedDict):
+        parentNodeId: int
+        previousNodeId: int
+        node: NodeJSON
+
+
+    class ChildNodeRemovedJSON(typing.TypedDict):
+        parentNodeId: int
+        nodeId: int
+
+
+    class DistributedNodesUpdatedJSON(typing.TypedDict):
+        insertionPointId: int
+        distributedNodes: typing.List[BackendNodeJSON]
+
+
+    class InlineStyleInvalidatedJSON(typing.TypedDict):
+        nodeIds: typing.List[int]
+
+
+    class PseudoElementAddedJSON(typing.TypedDict):
+        parentId: int
+        pseudoElement: NodeJSON
+
+
+    class ScrollableFlagUpdatedJSON(typing.TypedDict):
+        nodeId: int
+        isScrollable: bool
+
+
+    class PseudoElementRemovedJSON(typing.TypedDict):
+        parentId: int
+        pseudoElementId: int
+
+
+    class SetChildNodesJSON(typing.TypedDict):
+        parentId: int
+        nodes: typing.List[NodeJSON]
+
+
+    class ShadowRootPoppedJSON(typing.TypedDict):
+        hostId: int
+        rootId: int
+
+
+    class ShadowRootPushedJSON(typing.TypedDict):
+        hostId: int
+        root: NodeJSON
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import dom
-from . import runtime
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import runtime
+else:
+    dom = lazy_import('dom', globals())
+    runtime = lazy_import('runtime', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -29,7 +32,10 @@ class DOMBreakpointType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DOMBreakpointType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CSPViolationType(enum.Enum):
@@ -44,7 +50,10 @@ class CSPViolationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CSPViolationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -88,7 +97,7 @@ class EventListener:
         json['useCapture'] = self.use_capture
         json['passive'] = self.passive
         json['once'] = self.once
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['lineNumber'] = self.line_number
         json['columnNumber'] = self.column_number
         if self.handler is not None:
@@ -96,30 +105,34 @@ class EventListener:
         if self.original_handler is not None:
             json['originalHandler'] = self.original_handler.to_json()
         if self.backend_node_id is not None:
-            json['backendNodeId'] = self.backend_node_id.to_json()
+            json['backendNodeId'] = self.backend_node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> EventListener:
+    def from_json(cls, json: EventListenerJSON) -> EventListener:
         return cls(
-            type_=str(json['type']),
-            use_capture=bool(json['useCapture']),
-            passive=bool(json['passive']),
-            once=bool(json['once']),
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            handler=runtime.RemoteObject.from_json(json['handler']) if json.get('handler', None) is not None else None,
-            original_handler=runtime.RemoteObject.from_json(json['originalHandler']) if json.get('originalHandler', None) is not None else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
+            type_=json['type'],
+            use_capture=json['useCapture'],
+            passive=json['passive'],
+            once=json['once'],
+            script_id=runtime.ScriptId(json['scriptId']),
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
+            handler=runtime.RemoteObject.from_json(_handler) if (_handler := json.get('handler')) is not None else None,
+            original_handler=runtime.RemoteObject.from_json(_original_handler) if (_original_handler := json.get('originalHandler')) is not None else None,
+            backend_node_id=dom.BackendNodeId(_backend_node_id) if (_backend_node_id := json.get('backendNodeId')) is not None else None,
         )
 
 
+def _parse_get_event_listeners(json: GetEventListenersReturnsJSON) -> typing.List[EventListener]:
+    return [EventListener.from_json(i) for i in json['listeners']]
+
+
 def get_event_listeners(
         object_id: runtime.RemoteObjectId,
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[EventListener]]:
+    ) -> Command[GetEventListenersReturnsJSON, typing.List[EventListener]]:
     '''
     Returns event listeners of the given object.
 
@@ -129,23 +142,18 @@ def get_event_listeners(
     :returns: Array of relevant listeners.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params['objectId'] = object_id
     if depth is not None:
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.getEventListeners',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [EventListener.from_json(i) for i in json['listeners']]
+    return Command('DOMDebugger.getEventListeners', params, _parse_get_event_listeners)
 
 
 def remove_dom_breakpoint(
         node_id: dom.NodeId,
         type_: DOMBreakpointType
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes DOM breakpoint that was set using ``setDOMBreakpoint``.
 
@@ -153,19 +161,15 @@ def remove_dom_breakpoint(
     :param type_: Type of the breakpoint to remove.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['type'] = type_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.removeDOMBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    params['type'] = type_.value
+    return Command('DOMDebugger.removeDOMBreakpoint', params)
 
 
 def remove_event_listener_breakpoint(
         event_name: str,
         target_name: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes breakpoint on particular DOM event.
 
@@ -176,17 +180,13 @@ def remove_event_listener_breakpoint(
     params['eventName'] = event_name
     if target_name is not None:
         params['targetName'] = target_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.removeEventListenerBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.removeEventListenerBreakpoint', params)
 
 
 @deprecated(version="1.3")
 def remove_instrumentation_breakpoint(
         event_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes breakpoint on particular native event.
 
@@ -198,16 +198,12 @@ def remove_instrumentation_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.removeInstrumentationBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.removeInstrumentationBreakpoint', params)
 
 
 def remove_xhr_breakpoint(
         url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes breakpoint from XMLHttpRequest.
 
@@ -215,16 +211,12 @@ def remove_xhr_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.removeXHRBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.removeXHRBreakpoint', params)
 
 
 def set_break_on_csp_violation(
         violation_types: typing.List[CSPViolationType]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on particular CSP violations.
 
@@ -233,18 +225,14 @@ def set_break_on_csp_violation(
     :param violation_types: CSP Violations to stop upon.
     '''
     params: T_JSON_DICT = dict()
-    params['violationTypes'] = [i.to_json() for i in violation_types]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.setBreakOnCSPViolation',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['violationTypes'] = [i.value for i in violation_types]
+    return Command('DOMDebugger.setBreakOnCSPViolation', params)
 
 
 def set_dom_breakpoint(
         node_id: dom.NodeId,
         type_: DOMBreakpointType
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on particular operation with DOM.
 
@@ -252,19 +240,15 @@ def set_dom_breakpoint(
     :param type_: Type of the operation to stop upon.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['type'] = type_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.setDOMBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['nodeId'] = node_id
+    params['type'] = type_.value
+    return Command('DOMDebugger.setDOMBreakpoint', params)
 
 
 def set_event_listener_breakpoint(
         event_name: str,
         target_name: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on particular DOM event.
 
@@ -275,17 +259,13 @@ def set_event_listener_breakpoint(
     params['eventName'] = event_name
     if target_name is not None:
         params['targetName'] = target_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.setEventListenerBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.setEventListenerBreakpoint', params)
 
 
 @deprecated(version="1.3")
 def set_instrumentation_breakpoint(
         event_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on particular native event.
 
@@ -297,16 +277,12 @@ def set_instrumentation_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.setInstrumentationBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.setInstrumentationBreakpoint', params)
 
 
 def set_xhr_breakpoint(
         url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on XMLHttpRequest.
 
@@ -314,8 +290,25 @@ def set_xhr_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMDebugger.setXHRBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMDebugger.setXHRBreakpoint', params)
+
+
+if typing.TYPE_CHECKING:
+    class _EventListenerJSON(typing.TypedDict):
+        type: str
+        useCapture: bool
+        passive: bool
+        once: bool
+        scriptId: str
+        lineNumber: int
+        columnNumber: int
+
+
+    class EventListenerJSON(_EventListenerJSON, total=False):
+        handler: runtime.RemoteObjectJSON
+        originalHandler: runtime.RemoteObjectJSON
+        backendNodeId: int
+
+
+    class GetEventListenersReturnsJSON(typing.TypedDict):
+        listeners: typing.List[EventListenerJSON]
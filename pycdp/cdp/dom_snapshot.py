@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import dom
-from . import dom_debugger
-from . import page
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import dom_debugger
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    dom_debugger = lazy_import('dom_debugger', globals())
+    page = lazy_import('page', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -116,7 +120,7 @@ class DOMNode:
         json['nodeType'] = self.node_type
         json['nodeName'] = self.node_name
         json['nodeValue'] = self.node_value
-        json['backendNodeId'] = self.backend_node_id.to_json()
+        json['backendNodeId'] = self.backend_node_id
         if self.text_value is not None:
             json['textValue'] = self.text_value
         if self.input_value is not None:
@@ -126,11 +130,11 @@ class DOMNode:
         if self.option_selected is not None:
             json['optionSelected'] = self.option_selected
         if self.child_node_indexes is not None:
-            json['childNodeIndexes'] = [i for i in self.child_node_indexes]
+            json['childNodeIndexes'] = list(self.child_node_indexes)
         if self.attributes is not None:
             json['attributes'] = [i.to_json() for i in self.attributes]
         if self.pseudo_element_indexes is not None:
-            json['pseudoElementIndexes'] = [i for i in self.pseudo_element_indexes]
+            json['pseudoElementIndexes'] = list(self.pseudo_element_indexes)
         if self.layout_node_index is not None:
             json['layoutNodeIndex'] = self.layout_node_index
         if self.document_url is not None:
@@ -146,13 +150,13 @@ class DOMNode:
         if self.system_id is not None:
             json['systemId'] = self.system_id
         if self.frame_id is not None:
-            json['frameId'] = self.frame_id.to_json()
+            json['frameId'] = self.frame_id
         if self.content_document_index is not None:
             json['contentDocumentIndex'] = self.content_document_index
         if self.pseudo_type is not None:
-            json['pseudoType'] = self.pseudo_type.to_json()
+            json['pseudoType'] = self.pseudo_type.value
         if self.shadow_root_type is not None:
-            json['shadowRootType'] = self.shadow_root_type.to_json()
+            json['shadowRootType'] = self.shadow_root_type.value
         if self.is_clickable is not None:
             json['isClickable'] = self.is_clickable
         if self.event_listeners is not None:
@@ -168,36 +172,36 @@ class DOMNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DOMNode:
+    def from_json(cls, json: DOMNodeJSON) -> DOMNode:
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            node_value=str(json['nodeValue']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']),
-            text_value=str(json['textValue']) if json.get('textValue', None) is not None else None,
-            input_value=str(json['inputValue']) if json.get('inputValue', None) is not None else None,
-            input_checked=bool(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
-            option_selected=bool(json['optionSelected']) if json.get('optionSelected', None) is not None else None,
-            child_node_indexes=[int(i) for i in json['childNodeIndexes']] if json.get('childNodeIndexes', None) is not None else None,
-            attributes=[NameValue.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            pseudo_element_indexes=[int(i) for i in json['pseudoElementIndexes']] if json.get('pseudoElementIndexes', None) is not None else None,
-            layout_node_index=int(json['layoutNodeIndex']) if json.get('layoutNodeIndex', None) is not None else None,
-            document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
-            content_language=str(json['contentLanguage']) if json.get('contentLanguage', None) is not None else None,
-            document_encoding=str(json['documentEncoding']) if json.get('documentEncoding', None) is not None else None,
-            public_id=str(json['publicId']) if json.get('publicId', None) is not None else None,
-            system_id=str(json['systemId']) if json.get('systemId', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            content_document_index=int(json['contentDocumentIndex']) if json.get('contentDocumentIndex', None) is not None else None,
-            pseudo_type=dom.PseudoType.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            shadow_root_type=dom.ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            is_clickable=bool(json['isClickable']) if json.get('isClickable', None) is not None else None,
-            event_listeners=[dom_debugger.EventListener.from_json(i) for i in json['eventListeners']] if json.get('eventListeners', None) is not None else None,
-            current_source_url=str(json['currentSourceURL']) if json.get('currentSourceURL', None) is not None else None,
-            origin_url=str(json['originURL']) if json.get('originURL', None) is not None else None,
-            scroll_offset_x=float(json['scrollOffsetX']) if json.get('scrollOffsetX', None) is not None else None,
-            scroll_offset_y=float(json['scrollOffsetY']) if json.get('scrollOffsetY', None) is not None else None,
+            node_type=json['nodeType'],
+            node_name=json['nodeName'],
+            node_value=json['nodeValue'],
+            backend_node_id=dom.BackendNodeId(json['backendNodeId']),
+            text_value=json.get('textValue'),
+            input_value=json.get('inputValue'),
+            input_checked=json.get('inputChecked'),
+            option_selected=json.get('optionSelected'),
+            child_node_indexes=json.get('childNodeIndexes'),
+            attributes=[NameValue.from_json(i) for i in _attributes] if (_attributes := json.get('attributes')) is not None else None,
+            pseudo_element_indexes=json.get('pseudoElementIndexes'),
+            layout_node_index=json.get('layoutNodeIndex'),
+            document_url=json.get('documentURL'),
+            base_url=json.get('baseURL'),
+            content_language=json.get('contentLanguage'),
+            document_encoding=json.get('documentEncoding'),
+            public_id=json.get('publicId'),
+            system_id=json.get('systemId'),
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None,
+            content_document_index=json.get('contentDocumentIndex'),
+            pseudo_type=dom.PseudoType.from_json(_pseudo_type) if (_pseudo_type := json.get('pseudoType')) is not None else None,
+            shadow_root_type=dom.ShadowRootType.from_json(_shadow_root_type) if (_shadow_root_type := json.get('shadowRootType')) is not None else None,
+            is_clickable=json.get('isClickable'),
+            event_listeners=[dom_debugger.EventListener.from_json(i) for i in _event_listeners] if (_event_listeners := json.get('eventListeners')) is not None else None,
+            current_source_url=json.get('currentSourceURL'),
+            origin_url=json.get('originURL'),
+            scroll_offset_x=float(_scroll_offset_x) if (_scroll_offset_x := json.get('scrollOffsetX')) is not None else None,
+            scroll_offset_y=float(_scroll_offset_y) if (_scroll_offset_y := json.get('scrollOffsetY')) is not None else None,
         )
 
 
@@ -226,11 +230,11 @@ class InlineTextBox:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InlineTextBox:
+    def from_json(cls, json: InlineTextBoxJSON) -> InlineTextBox:
         return cls(
             bounding_box=dom.Rect.from_json(json['boundingBox']),
-            start_character_index=int(json['startCharacterIndex']),
-            num_characters=int(json['numCharacters']),
+            start_character_index=json['startCharacterIndex'],
+            num_characters=json['numCharacters'],
         )
 
 
@@ -279,15 +283,15 @@ class LayoutTreeNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayoutTreeNode:
+    def from_json(cls, json: LayoutTreeNodeJSON) -> LayoutTreeNode:
         return cls(
-            dom_node_index=int(json['domNodeIndex']),
+            dom_node_index=json['domNodeIndex'],
             bounding_box=dom.Rect.from_json(json['boundingBox']),
-            layout_text=str(json['layoutText']) if json.get('layoutText', None) is not None else None,
-            inline_text_nodes=[InlineTextBox.from_json(i) for i in json['inlineTextNodes']] if json.get('inlineTextNodes', None) is not None else None,
-            style_index=int(json['styleIndex']) if json.get('styleIndex', None) is not None else None,
-            paint_order=int(json['paintOrder']) if json.get('paintOrder', None) is not None else None,
-            is_stacking_context=bool(json['isStackingContext']) if json.get('isStackingContext', None) is not None else None,
+            layout_text=json.get('layoutText'),
+            inline_text_nodes=[InlineTextBox.from_json(i) for i in _inline_text_nodes] if (_inline_text_nodes := json.get('inlineTextNodes')) is not None else None,
+            style_index=json.get('styleIndex'),
+            paint_order=json.get('paintOrder'),
+            is_stacking_context=json.get('isStackingContext'),
         )
 
 
@@ -305,7 +309,7 @@ class ComputedStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ComputedStyle:
+    def from_json(cls, json: ComputedStyleJSON) -> ComputedStyle:
         return cls(
             properties=[NameValue.from_json(i) for i in json['properties']],
         )
@@ -329,10 +333,10 @@ class NameValue:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NameValue:
+    def from_json(cls, json: NameValueJSON) -> NameValue:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -377,15 +381,15 @@ class RareStringData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['index'] = [i for i in self.index]
-        json['value'] = [i.to_json() for i in self.value]
+        json['index'] = list(self.index)
+        json['value'] = list(self.value)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RareStringData:
+    def from_json(cls, json: RareStringDataJSON) -> RareStringData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[StringIndex.from_json(i) for i in json['value']],
+            index=json['index'],
+            value=[StringIndex(i) for i in json['value']],
         )
 
 
@@ -395,13 +399,13 @@ class RareBooleanData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['index'] = [i for i in self.index]
+        json['index'] = list(self.index)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RareBooleanData:
+    def from_json(cls, json: RareBooleanDataJSON) -> RareBooleanData:
         return cls(
-            index=[int(i) for i in json['index']],
+            index=json['index'],
         )
 
 
@@ -413,15 +417,15 @@ class RareIntegerData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['index'] = [i for i in self.index]
-        json['value'] = [i for i in self.value]
+        json['index'] = list(self.index)
+        json['value'] = list(self.value)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RareIntegerData:
+    def from_json(cls, json: RareIntegerDataJSON) -> RareIntegerData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[int(i) for i in json['value']],
+            index=json['index'],
+            value=json['value'],
         )
 
 
@@ -489,14 +493,14 @@ class DocumentSnapshot:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['documentURL'] = self.document_url.to_json()
-        json['title'] = self.title.to_json()
-        json['baseURL'] = self.base_url.to_json()
-        json['contentLanguage'] = self.content_language.to_json()
-        json['encodingName'] = self.encoding_name.to_json()
-        json['publicId'] = self.public_id.to_json()
-        json['systemId'] = self.system_id.to_json()
-        json['frameId'] = self.frame_id.to_json()
+        json['documentURL'] = self.document_url
+        json['title'] = self.title
+        json['baseURL'] = self.base_url
+        json['contentLanguage'] = self.content_language
+        json['encodingName'] = self.encoding_name
+        json['publicId'] = self.public_id
+        json['systemId'] = self.system_id
+        json['frameId'] = self.frame_id
         json['nodes'] = self.nodes.to_json()
         json['layout'] = self.layout.to_json()
         json['textBoxes'] = self.text_boxes.to_json()
@@ -511,23 +515,23 @@ class DocumentSnapshot:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DocumentSnapshot:
+    def from_json(cls, json: DocumentSnapshotJSON) -> DocumentSnapshot:
         return cls(
-            document_url=StringIndex.from_json(json['documentURL']),
-            title=StringIndex.from_json(json['title']),
-            base_url=StringIndex.from_json(json['baseURL']),
-            content_language=StringIndex.from_json(json['contentLanguage']),
-            encoding_name=StringIndex.from_json(json['encodingName']),
-            public_id=StringIndex.from_json(json['publicId']),
-            system_id=StringIndex.from_json(json['systemId']),
-            frame_id=StringIndex.from_json(json['frameId']),
+            document_url=StringIndex(json['documentURL']),
+            title=StringIndex(json['title']),
+            base_url=StringIndex(json['baseURL']),
+            content_language=StringIndex(json['contentLanguage']),
+            encoding_name=StringIndex(json['encodingName']),
+            public_id=StringIndex(json['publicId']),
+            system_id=StringIndex(json['systemId']),
+            frame_id=StringIndex(json['frameId']),
             nodes=NodeTreeSnapshot.from_json(json['nodes']),
             layout=LayoutTreeSnapshot.from_json(json['layout']),
             text_boxes=TextBoxSnapshot.from_json(json['textBoxes']),
-            scroll_offset_x=float(json['scrollOffsetX']) if json.get('scrollOffsetX', None) is not None else None,
-            scroll_offset_y=float(json['scrollOffsetY']) if json.get('scrollOffsetY', None) is not None else None,
-            content_width=float(json['contentWidth']) if json.get('contentWidth', None) is not None else None,
-            content_height=float(json['contentHeight']) if json.get('contentHeight', None) is not None else None,
+            scroll_offset_x=float(_scroll_offset_x) if (_scroll_offset_x := json.get('scrollOffsetX')) is not None else None,
+            scroll_offset_y=float(_scroll_offset_y) if (_scroll_offset_y := json.get('scrollOffsetY')) is not None else None,
+            content_width=float(_content_width) if (_content_width := json.get('contentWidth')) is not None else None,
+            content_height=float(_content_height) if (_content_height := json.get('contentHeight')) is not None else None,
         )
 
 
@@ -593,19 +597,19 @@ class NodeTreeSnapshot:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         if self.parent_index is not None:
-            json['parentIndex'] = [i for i in self.parent_index]
+            json['parentIndex'] = list(self.parent_index)
         if self.node_type is not None:
-            json['nodeType'] = [i for i in self.node_type]
+            json['nodeType'] = list(self.node_type)
         if self.shadow_root_type is not None:
             json['shadowRootType'] = self.shadow_root_type.to_json()
         if self.node_name is not None:
-            json['nodeName'] = [i.to_json() for i in self.node_name]
+            json['nodeName'] = list(self.node_name)
         if self.node_value is not None:
-            json['nodeValue'] = [i.to_json() for i in self.node_value]
+            json['nodeValue'] = list(self.node_value)
         if self.backend_node_id is not None:
-            json['backendNodeId'] = [i.to_json() for i in self.backend_node_id]
+            json['backendNodeId'] = list(self.backend_node_id)
         if self.attributes is not None:
-            json['attributes'] = [i.to_json() for i in self.attributes]
+            json['attributes'] = list(self.attributes)
         if self.text_value is not None:
             json['textValue'] = self.text_value.to_json()
         if self.input_value is not None:
@@ -629,25 +633,25 @@ class NodeTreeSnapshot:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodeTreeSnapshot:
+    def from_json(cls, json: NodeTreeSnapshotJSON) -> NodeTreeSnapshot:
         return cls(
-            parent_index=[int(i) for i in json['parentIndex']] if json.get('parentIndex', None) is not None else None,
-            node_type=[int(i) for i in json['nodeType']] if json.get('nodeType', None) is not None else None,
-            shadow_root_type=RareStringData.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            node_name=[StringIndex.from_json(i) for i in json['nodeName']] if json.get('nodeName', None) is not None else None,
-            node_value=[StringIndex.from_json(i) for i in json['nodeValue']] if json.get('nodeValue', None) is not None else None,
-            backend_node_id=[dom.BackendNodeId.from_json(i) for i in json['backendNodeId']] if json.get('backendNodeId', None) is not None else None,
-            attributes=[ArrayOfStrings.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            text_value=RareStringData.from_json(json['textValue']) if json.get('textValue', None) is not None else None,
-            input_value=RareStringData.from_json(json['inputValue']) if json.get('inputValue', None) is not None else None,
-            input_checked=RareBooleanData.from_json(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
-            option_selected=RareBooleanData.from_json(json['optionSelected']) if json.get('optionSelected', None) is not None else None,
-            content_document_index=RareIntegerData.from_json(json['contentDocumentIndex']) if json.get('contentDocumentIndex', None) is not None else None,
-            pseudo_type=RareStringData.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            pseudo_identifier=RareStringData.from_json(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
-            is_clickable=RareBooleanData.from_json(json['isClickable']) if json.get('isClickable', None) is not None else None,
-            current_source_url=RareStringData.from_json(json['currentSourceURL']) if json.get('currentSourceURL', None) is not None else None,
-            origin_url=RareStringData.from_json(json['originURL']) if json.get('originURL', None) is not None else None,
+            parent_index=json.get('parentIndex'),
+            node_type=json.get('nodeType'),
+            shadow_root_type=RareStringData.from_json(_shadow_root_type) if (_shadow_root_type := json.get('shadowRootType')) is not None else None,
+            node_name=[StringIndex(i) for i in _node_name] if (_node_name := json.get('nodeName')) is not None else None,
+            node_value=[StringIndex(i) for i in _node_value] if (_node_value := json.get('nodeValue')) is not None else None,
+            backend_node_id=[dom.BackendNodeId(i) for i in _backend_node_id] if (_backend_node_id := json.get('backendNodeId')) is not None else None,
+            attributes=[ArrayOfStrings(i) for i in _attributes] if (_attributes := json.get('attributes')) is not None else None,
+            text_value=RareStringData.from_json(_text_value) if (_text_value := json.get('textValue')) is not None else None,
+            input_value=RareStringData.from_json(_input_value) if (_input_value := json.get('inputValue')) is not None else None,
+            input_checked=RareBooleanData.from_json(_input_checked) if (_input_checked := json.get('inputChecked')) is not None else None,
+            option_selected=RareBooleanData.from_json(_option_selected) if (_option_selected := json.get('optionSelected')) is not None else None,
+            content_document_index=RareIntegerData.from_json(_content_document_index) if (_content_document_index := json.get('contentDocumentIndex')) is not None else None,
+            pseudo_type=RareStringData.from_json(_pseudo_type) if (_pseudo_type := json.get('pseudoType')) is not None else None,
+            pseudo_identifier=RareStringData.from_json(_pseudo_identifier) if (_pseudo_identifier := json.get('pseudoIdentifier')) is not None else None,
+            is_clickable=RareBooleanData.from_json(_is_clickable) if (_is_clickable := json.get('isClickable')) is not None else None,
+            current_source_url=RareStringData.from_json(_current_source_url) if (_current_source_url := json.get('currentSourceURL')) is not None else None,
+            origin_url=RareStringData.from_json(_origin_url) if (_origin_url := json.get('originURL')) is not None else None,
         )
 
 
@@ -693,39 +697,39 @@ class LayoutTreeSnapshot:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['nodeIndex'] = [i for i in self.node_index]
-        json['styles'] = [i.to_json() for i in self.styles]
-        json['bounds'] = [i.to_json() for i in self.bounds]
-        json['text'] = [i.to_json() for i in self.text]
+        json['nodeIndex'] = list(self.node_index)
+        json['styles'] = list(self.styles)
+        json['bounds'] = list(self.bounds)
+        json['text'] = list(self.text)
         json['stackingContexts'] = self.stacking_contexts.to_json()
         if self.paint_orders is not None:
-            json['paintOrders'] = [i for i in self.paint_orders]
+            json['paintOrders'] = list(self.paint_orders)
         if self.offset_rects is not None:
-            json['offsetRects'] = [i.to_json() for i in self.offset_rects]
+            json['offsetRects'] = list(self.offset_rects)
         if self.scroll_rects is not None:
-            json['scrollRects'] = [i.to_json() for i in self.scroll_rects]
+            json['scrollRects'] = list(self.scroll_rects)
         if self.client_rects is not None:
-            json['clientRects'] = [i.to_json() for i in self.client_rects]
+            json['clientRects'] = list(self.client_rects)
         if self.blended_background_colors is not None:
-            json['blendedBackgroundColors'] = [i.to_json() for i in self.blended_background_colors]
+            json['blendedBackgroundColors'] = list(self.blended_background_colors)
         if self.text_color_opacities is not None:
-            json['textColorOpacities'] = [i for i in self.text_color_opacities]
+            json['textColorOpacities'] = list(self.text_color_opacities)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayoutTreeSnapshot:
+    def from_json(cls, json: LayoutTreeSnapshotJSON) -> LayoutTreeSnapshot:
         return cls(
-            node_index=[int(i) for i in json['nodeIndex']],
-            styles=[ArrayOfStrings.from_json(i) for i in json['styles']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            text=[StringIndex.from_json(i) for i in json['text']],
+            node_index=json['nodeIndex'],
+            styles=[ArrayOfStrings(i) for i in json['styles']],
+            bounds=[Rectangle(i) for i in json['bounds']],
+            text=[StringIndex(i) for i in json['text']],
             stacking_contexts=RareBooleanData.from_json(json['stackingContexts']),
-            paint_orders=[int(i) for i in json['paintOrders']] if json.get('paintOrders', None) is not None else None,
-            offset_rects=[Rectangle.from_json(i) for i in json['offsetRects']] if json.get('offsetRects', None) is not None else None,
-            scroll_rects=[Rectangle.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
-            client_rects=[Rectangle.from_json(i) for i in json['clientRects']] if json.get('clientRects', None) is not None else None,
-            blended_background_colors=[StringIndex.from_json(i) for i in json['blendedBackgroundColors']] if json.get('blendedBackgroundColors', None) is not None else None,
-            text_color_opacities=[float(i) for i in json['textColorOpacities']] if json.get('textColorOpacities', None) is not None else None,
+            paint_orders=json.get('paintOrders'),
+            offset_rects=[Rectangle(i) for i in _offset_rects] if (_offset_rects := json.get('offsetRects')) is not None else None,
+            scroll_rects=[Rectangle(i) for i in _scroll_rects] if (_scroll_rects := json.get('scrollRects')) is not None else None,
+            client_rects=[Rectangle(i) for i in _client_rects] if (_client_rects := json.get('clientRects')) is not None else None,
+            blended_background_colors=[StringIndex(i) for i in _blended_background_colors] if (_blended_background_colors := json.get('blendedBackgroundColors')) is not None else None,
+            text_color_opacities=[float(i) for i in _text_color_opacities] if (_text_color_opacities := json.get('textColorOpacities')) is not None else None,
         )
 
 
@@ -751,40 +755,42 @@ class TextBoxSnapshot:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['layoutIndex'] = [i for i in self.layout_index]
-        json['bounds'] = [i.to_json() for i in self.bounds]
-        json['start'] = [i for i in self.start]
-        json['length'] = [i for i in self.length]
+        json['layoutIndex'] = list(self.layout_index)
+        json['bounds'] = list(self.bounds)
+        json['start'] = list(self.start)
+        json['length'] = list(self.length)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TextBoxSnapshot:
+    def from_json(cls, json: TextBoxSnapshotJSON) -> TextBoxSnapshot:
         return cls(
-            layout_index=[int(i) for i in json['layoutIndex']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            start=[int(i) for i in json['start']],
-            length=[int(i) for i in json['length']],
+            layout_index=json['layoutIndex'],
+            bounds=[Rectangle(i) for i in json['bounds']],
+            start=json['start'],
+            length=json['length'],
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables DOM snapshot agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMSnapshot.disable',
-    }
-    json = yield cmd_dict
+    return Command('DOMSnapshot.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables DOM snapshot agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMSnapshot.enable',
-    }
-    json = yield cmd_dict
+    return Command('DOMSnapshot.enable')
+
+
+def _parse_get_snapshot(json: GetSnapshotReturnsJSON) -> typing.Tuple[typing.List[DOMNode], typing.List[LayoutTreeNode], typing.List[ComputedStyle]]:
+    return (
+        [DOMNode.from_json(i) for i in json['domNodes']],
+        [LayoutTreeNode.from_json(i) for i in json['layoutTreeNodes']],
+        [ComputedStyle.from_json(i) for i in json['computedStyles']]
+    )
 
 
 @deprecated(version="1.3")
@@ -793,7 +799,7 @@ def get_snapshot(
         include_event_listeners: typing.Optional[bool] = None,
         include_paint_order: typing.Optional[bool] = None,
         include_user_agent_shadow_tree: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[DOMNode], typing.List[LayoutTreeNode], typing.List[ComputedStyle]]]:
+    ) -> Command[GetSnapshotReturnsJSON, typing.Tuple[typing.List[DOMNode], typing.List[LayoutTreeNode], typing.List[ComputedStyle]]]:
     '''
     Returns a document snapshot, including the full DOM tree of the root node (including iframes,
     template contents, and imported documents) in a flattened array, as well as layout and
@@ -813,22 +819,20 @@ def get_snapshot(
         2. **computedStyles** - Whitelisted ComputedStyle properties for each node in the layout tree.
     '''
     params: T_JSON_DICT = dict()
-    params['computedStyleWhitelist'] = [i for i in computed_style_whitelist]
+    params['computedStyleWhitelist'] = list(computed_style_whitelist)
     if include_event_listeners is not None:
         params['includeEventListeners'] = include_event_listeners
     if include_paint_order is not None:
         params['includePaintOrder'] = include_paint_order
     if include_user_agent_shadow_tree is not None:
         params['includeUserAgentShadowTree'] = include_user_agent_shadow_tree
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMSnapshot.getSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMSnapshot.getSnapshot', params, _parse_get_snapshot)
+
+
+def _parse_capture_snapshot(json: CaptureSnapshotReturnsJSON) -> typing.Tuple[typing.List[DocumentSnapshot], typing.List[str]]:
     return (
-        [DOMNode.from_json(i) for i in json['domNodes']],
-        [LayoutTreeNode.from_json(i) for i in json['layoutTreeNodes']],
-        [ComputedStyle.from_json(i) for i in json['computedStyles']]
+        [DocumentSnapshot.from_json(i) for i in json['documents']],
+        json['strings']
     )
 
 
@@ -838,7 +842,7 @@ def capture_snapshot(
         include_dom_rects: typing.Optional[bool] = None,
         include_blended_background_colors: typing.Optional[bool] = None,
         include_text_color_opacities: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[DocumentSnapshot], typing.List[str]]]:
+    ) -> Command[CaptureSnapshotReturnsJSON, typing.Tuple[typing.List[DocumentSnapshot], typing.List[str]]]:
     '''
     Returns a document snapshot, including the full DOM tree of the root node (including iframes,
     template contents, and imported documents) in a flattened array, as well as layout and
@@ -856,7 +860,7 @@ def capture_snapshot(
         1. **strings** - Shared string table that all string properties refer to with indexes.
     '''
     params: T_JSON_DICT = dict()
-    params['computedStyles'] = [i for i in computed_styles]
+    params['computedStyles'] = list(computed_styles)
     if include_paint_order is not None:
         params['includePaintOrder'] = include_paint_order
     if include_dom_rects is not None:
@@ -865,12 +869,157 @@ def capture_snapshot(
         params['includeBlendedBackgroundColors'] = include_blended_background_colors
     if include_text_color_opacities is not None:
         params['includeTextColorOpacities'] = include_text_color_opacities
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMSnapshot.captureSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [DocumentSnapshot.from_json(i) for i in json['documents']],
-        [str(i) for i in json['strings']]
-    )
+    return Command('DOMSnapshot.captureSnapshot', params, _parse_capture_snapshot)
+
+
+if typing.TYPE_CHECKING:
+    class _DOMNodeJSON(typing.TypedDict):
+        nodeType: int
+        nodeName: str
+        nodeValue: str
+        backendNodeId: int
+
+
+    class DOMNodeJSON(_DOMNodeJSON, total=False):
+        textValue: str
+        inputValue: str
+        inputChecked: bool
+        optionSelected: bool
+        childNodeIndexes: typing.List[int]
+        attributes: typing.List[NameValueJSON]
+        pseudoElementIndexes: typing.List[int]
+        layoutNodeIndex: int
+        documentURL: str
+        baseURL: str
+        contentLanguage: str
+        documentEncoding: str
+        publicId: str
+        systemId: str
+        frameId: str
+        contentDocumentIndex: int
+        pseudoType: str
+        shadowRootType: str
+        isClickable: bool
+        eventListeners: typing.List[dom_debugger.EventListenerJSON]
+        currentSourceURL: str
+        originURL: str
+        scrollOffsetX: float
+        scrollOffsetY: float
+
+
+    class InlineTextBoxJSON(typing.TypedDict):
+        boundingBox: dom.RectJSON
+        startCharacterIndex: int
+        numCharacters: int
+
+
+    class _LayoutTreeNodeJSON(typing.TypedDict):
+        domNodeIndex: int
+        boundingBox: dom.RectJSON
+
+
+    class LayoutTreeNodeJSON(_LayoutTreeNodeJSON, total=False):
+        layoutText: str
+        inlineTextNodes: typing.List[InlineTextBoxJSON]
+        styleIndex: int
+        paintOrder: int
+        isStackingContext: bool
+
+
+    class ComputedStyleJSON(typing.TypedDict):
+        properties: typing.List[NameValueJSON]
+
+
+    class NameValueJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class RareStringDataJSON(typing.TypedDict):
+        index: typing.List[int]
+        value: typing.List[int]
+
+
+    class RareBooleanDataJSON(typing.TypedDict):
+        index: typing.List[int]
+
+
+    class RareIntegerDataJSON(typing.TypedDict):
+        index: typing.List[int]
+        value: typing.List[int]
+
+
+    class _DocumentSnapshotJSON(typing.TypedDict):
+        documentURL: int
+        title: int
+        baseURL: int
+        contentLanguage: int
+        encodingName: int
+        publicId: int
+        systemId: int
+        frameId: int
+        nodes: NodeTreeSnapshotJSON
+        layout: LayoutTreeSnapshotJSON
+        textBoxes: TextBoxSnapshotJSON
+
+
+    class DocumentSnapshotJSON(_DocumentSnapshotJSON, total=False):
+        scrollOffsetX: float
+        scrollOffsetY: float
+        contentWidth: float
+        contentHeight: float
+
+
+    class NodeTreeSnapshotJSON(typing.TypedDict, total=False):
+        parentIndex: typing.List[int]
+        nodeType: typing.List[int]
+        shadowRootType: RareStringDataJSON
+        nodeName: typing.List[int]
+        nodeValue: typing.List[int]
+        backendNodeId: typing.List[int]
+        attributes: typing.List[typing.List[int]]
+        textValue: RareStringDataJSON
+        inputValue: RareStringDataJSON
+        inputChecked: RareBooleanDataJSON
+        optionSelected: RareBooleanDataJSON
+        contentDocumentIndex: RareIntegerDataJSON
+        pseudoType: RareStringDataJSON
+        pseudoIdentifier: RareStringDataJSON
+        isClickable: RareBooleanDataJSON
+        currentSourceURL: RareStringDataJSON
+        originURL: RareStringDataJSON
+
+
+    class _LayoutTreeSnapshotJSON(typing.TypedDict):
+        nodeIndex: typing.List[int]
+        styles: typing.List[typing.List[int]]
+        bounds: typing.List[typing.List[float]]
+        text: typing.List[int]
+        stackingContexts: RareBooleanDataJSON
+
+
+    class LayoutTreeSnapshotJSON(_LayoutTreeSnapshotJSON, total=False):
+        paintOrders: typing.List[int]
+        offsetRects: typing.List[typing.List[float]]
+        scrollRects: typing.List[typing.List[float]]
+        clientRects: typing.List[typing.List[float]]
+        blendedBackgroundColors: typing.List[int]
+        textColorOpacities: typing.List[float]
+
+
+    class TextBoxSnapshotJSON(typing.TypedDict):
+        layoutIndex: typing.List[int]
+        bounds: typing.List[typing.List[float]]
+        start: typing.List[int]
+        length: typing.List[int]
+
+
+    class GetSnapshotReturnsJSON(typing.TypedDict):
+        domNodes: typing.List[DOMNodeJSON]
+        layoutTreeNodes: typing.List[LayoutTreeNodeJSON]
+        computedStyles: typing.List[ComputedStyleJSON]
+
+
+    class CaptureSnapshotReturnsJSON(typing.TypedDict):
+        documents: typing.List[DocumentSnapshotJSON]
+        strings: typing.List[str]
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class SerializedStorageKey(str):
@@ -44,15 +43,15 @@ class StorageId:
         if self.security_origin is not None:
             json['securityOrigin'] = self.security_origin
         if self.storage_key is not None:
-            json['storageKey'] = self.storage_key.to_json()
+            json['storageKey'] = self.storage_key
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StorageId:
+    def from_json(cls, json: StorageIdJSON) -> StorageId:
         return cls(
-            is_local_storage=bool(json['isLocalStorage']),
-            security_origin=str(json['securityOrigin']) if json.get('securityOrigin', None) is not None else None,
-            storage_key=SerializedStorageKey.from_json(json['storageKey']) if json.get('storageKey', None) is not None else None,
+            is_local_storage=json['isLocalStorage'],
+            security_origin=json.get('securityOrigin'),
+            storage_key=SerializedStorageKey(_storage_key) if (_storage_key := json.get('storageKey')) is not None else None,
         )
 
 
@@ -73,60 +72,49 @@ class Item(list):
 
 def clear(
         storage_id: StorageId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param storage_id:
     '''
     params: T_JSON_DICT = dict()
     params['storageId'] = storage_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.clear',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMStorage.clear', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables storage tracking, prevents storage events from being sent to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.disable',
-    }
-    json = yield cmd_dict
+    return Command('DOMStorage.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables storage tracking, storage events will now be delivered to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.enable',
-    }
-    json = yield cmd_dict
+    return Command('DOMStorage.enable')
+
+
+def _parse_get_dom_storage_items(json: GetDOMStorageItemsReturnsJSON) -> typing.List[Item]:
+    return [Item(i) for i in json['entries']]
 
 
 def get_dom_storage_items(
         storage_id: StorageId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Item]]:
+    ) -> Command[GetDOMStorageItemsReturnsJSON, typing.List[Item]]:
     '''
     :param storage_id:
     :returns: 
     '''
     params: T_JSON_DICT = dict()
     params['storageId'] = storage_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.getDOMStorageItems',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Item.from_json(i) for i in json['entries']]
+    return Command('DOMStorage.getDOMStorageItems', params, _parse_get_dom_storage_items)
 
 
 def remove_dom_storage_item(
         storage_id: StorageId,
         key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param storage_id:
     :param key:
@@ -134,18 +122,14 @@ def remove_dom_storage_item(
     params: T_JSON_DICT = dict()
     params['storageId'] = storage_id.to_json()
     params['key'] = key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.removeDOMStorageItem',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMStorage.removeDOMStorageItem', params)
 
 
 def set_dom_storage_item(
         storage_id: StorageId,
         key: str,
         value: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param storage_id:
     :param key:
@@ -155,11 +139,7 @@ def set_dom_storage_item(
     params['storageId'] = storage_id.to_json()
     params['key'] = key
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOMStorage.setDOMStorageItem',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('DOMStorage.setDOMStorageItem', params)
 
 
 @event_class('DOMStorage.domStorageItemAdded')
@@ -170,11 +150,11 @@ class DomStorageItemAdded:
     new_value: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DomStorageItemAdded:
+    def from_json(cls, json: DomStorageItemAddedJSON) -> DomStorageItemAdded:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            new_value=str(json['newValue'])
+            key=json['key'],
+            new_value=json['newValue']
         )
 
 
@@ -185,10 +165,10 @@ class DomStorageItemRemoved:
     key: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DomStorageItemRemoved:
+    def from_json(cls, json: DomStorageItemRemovedJSON) -> DomStorageItemRemoved:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key'])
+            key=json['key']
         )
 
 
@@ -201,12 +181,12 @@ class DomStorageItemUpdated:
     new_value: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DomStorageItemUpdated:
+    def from_json(cls, json: DomStorageItemUpdatedJSON) -> DomStorageItemUpdated:
         return cls(
             storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            old_value=str(json['oldValue']),
-            new_value=str(json['newValue'])
+            key=json['key'],
+            old_value=json['oldValue'],
+            new_value=json['newValue']
         )
 
 
@@ -216,7 +196,43 @@ class DomStorageItemsCleared:
     storage_id: StorageId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DomStorageItemsCleared:
+    def from_json(cls, json: DomStorageItemsClearedJSON) -> DomStorageItemsCleared:
         return cls(
             storage_id=StorageId.from_json(json['storageId'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _StorageIdJSON(typing.TypedDict):
+        isLocalStorage: bool
+
+
+    class StorageIdJSON(_StorageIdJSON, total=False):
+        securityOrigin: str
+        storageKey: str
+
+
+    class GetDOMStorageItemsReturnsJSON(typing.TypedDict):
+        entries: typing.List[typing.List[str]]
+
+
+    class DomStorageItemAddedJSON(typing.TypedDict):
+        storageId: StorageIdJSON
+        key: str
+        newValue: str
+
+
+    class DomStorageItemRemovedJSON(typing.TypedDict):
+        storageId: StorageIdJSON
+        key: str
+
+
+    class DomStorageItemUpdatedJSON(typing.TypedDict):
+        storageId: StorageIdJSON
+        key: str
+        oldValue: str
+        newValue: str
+
+
+    class DomStorageItemsClearedJSON(typing.TypedDict):
+        storageId: StorageIdJSON
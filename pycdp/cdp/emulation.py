@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import dom
-from . import network
-from . import page
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -64,16 +68,16 @@ class SafeAreaInsets:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SafeAreaInsets:
+    def from_json(cls, json: SafeAreaInsetsJSON) -> SafeAreaInsets:
         return cls(
-            top=int(json['top']) if json.get('top', None) is not None else None,
-            top_max=int(json['topMax']) if json.get('topMax', None) is not None else None,
-            left=int(json['left']) if json.get('left', None) is not None else None,
-            left_max=int(json['leftMax']) if json.get('leftMax', None) is not None else None,
-            bottom=int(json['bottom']) if json.get('bottom', None) is not None else None,
-            bottom_max=int(json['bottomMax']) if json.get('bottomMax', None) is not None else None,
-            right=int(json['right']) if json.get('right', None) is not None else None,
-            right_max=int(json['rightMax']) if json.get('rightMax', None) is not None else None,
+            top=json.get('top'),
+            top_max=json.get('topMax'),
+            left=json.get('left'),
+            left_max=json.get('leftMax'),
+            bottom=json.get('bottom'),
+            bottom_max=json.get('bottomMax'),
+            right=json.get('right'),
+            right_max=json.get('rightMax'),
         )
 
 
@@ -95,10 +99,10 @@ class ScreenOrientation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreenOrientation:
+    def from_json(cls, json: ScreenOrientationJSON) -> ScreenOrientation:
         return cls(
-            type_=str(json['type']),
-            angle=int(json['angle']),
+            type_=json['type'],
+            angle=json['angle'],
         )
 
 
@@ -124,11 +128,11 @@ class DisplayFeature:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DisplayFeature:
+    def from_json(cls, json: DisplayFeatureJSON) -> DisplayFeature:
         return cls(
-            orientation=str(json['orientation']),
-            offset=int(json['offset']),
-            mask_length=int(json['maskLength']),
+            orientation=json['orientation'],
+            offset=json['offset'],
+            mask_length=json['maskLength'],
         )
 
 
@@ -143,9 +147,9 @@ class DevicePosture:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DevicePosture:
+    def from_json(cls, json: DevicePostureJSON) -> DevicePosture:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
         )
 
 
@@ -162,10 +166,10 @@ class MediaFeature:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> MediaFeature:
+    def from_json(cls, json: MediaFeatureJSON) -> MediaFeature:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -185,7 +189,10 @@ class VirtualTimePolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> VirtualTimePolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -204,10 +211,10 @@ class UserAgentBrandVersion:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> UserAgentBrandVersion:
+    def from_json(cls, json: UserAgentBrandVersionJSON) -> UserAgentBrandVersion:
         return cls(
-            brand=str(json['brand']),
-            version=str(json['version']),
+            brand=json['brand'],
+            version=json['version'],
         )
 
 
@@ -259,18 +266,18 @@ class UserAgentMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> UserAgentMetadata:
+    def from_json(cls, json: UserAgentMetadataJSON) -> UserAgentMetadata:
         return cls(
-            platform=str(json['platform']),
-            platform_version=str(json['platformVersion']),
-            architecture=str(json['architecture']),
-            model=str(json['model']),
-            mobile=bool(json['mobile']),
-            brands=[UserAgentBrandVersion.from_json(i) for i in json['brands']] if json.get('brands', None) is not None else None,
-            full_version_list=[UserAgentBrandVersion.from_json(i) for i in json['fullVersionList']] if json.get('fullVersionList', None) is not None else None,
-            full_version=str(json['fullVersion']) if json.get('fullVersion', None) is not None else None,
-            bitness=str(json['bitness']) if json.get('bitness', None) is not None else None,
-            wow64=bool(json['wow64']) if json.get('wow64', None) is not None else None,
+            platform=json['platform'],
+            platform_version=json['platformVersion'],
+            architecture=json['architecture'],
+            model=json['model'],
+            mobile=json['mobile'],
+            brands=[UserAgentBrandVersion.from_json(i) for i in _brands] if (_brands := json.get('brands')) is not None else None,
+            full_version_list=[UserAgentBrandVersion.from_json(i) for i in _full_version_list] if (_full_version_list := json.get('fullVersionList')) is not None else None,
+            full_version=json.get('fullVersion'),
+            bitness=json.get('bitness'),
+            wow64=json.get('wow64'),
         )
 
 
@@ -293,7 +300,10 @@ class SensorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SensorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -315,11 +325,11 @@ class SensorMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SensorMetadata:
+    def from_json(cls, json: SensorMetadataJSON) -> SensorMetadata:
         return cls(
-            available=bool(json['available']) if json.get('available', None) is not None else None,
-            minimum_frequency=float(json['minimumFrequency']) if json.get('minimumFrequency', None) is not None else None,
-            maximum_frequency=float(json['maximumFrequency']) if json.get('maximumFrequency', None) is not None else None,
+            available=json.get('available'),
+            minimum_frequency=float(_minimum_frequency) if (_minimum_frequency := json.get('minimumFrequency')) is not None else None,
+            maximum_frequency=float(_maximum_frequency) if (_maximum_frequency := json.get('maximumFrequency')) is not None else None,
         )
 
 
@@ -333,7 +343,7 @@ class SensorReadingSingle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SensorReadingSingle:
+    def from_json(cls, json: SensorReadingSingleJSON) -> SensorReadingSingle:
         return cls(
             value=float(json['value']),
         )
@@ -355,7 +365,7 @@ class SensorReadingXYZ:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SensorReadingXYZ:
+    def from_json(cls, json: SensorReadingXYZJSON) -> SensorReadingXYZ:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
@@ -382,7 +392,7 @@ class SensorReadingQuaternion:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SensorReadingQuaternion:
+    def from_json(cls, json: SensorReadingQuaternionJSON) -> SensorReadingQuaternion:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
@@ -410,11 +420,11 @@ class SensorReading:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SensorReading:
+    def from_json(cls, json: SensorReadingJSON) -> SensorReading:
         return cls(
-            single=SensorReadingSingle.from_json(json['single']) if json.get('single', None) is not None else None,
-            xyz=SensorReadingXYZ.from_json(json['xyz']) if json.get('xyz', None) is not None else None,
-            quaternion=SensorReadingQuaternion.from_json(json['quaternion']) if json.get('quaternion', None) is not None else None,
+            single=SensorReadingSingle.from_json(_single) if (_single := json.get('single')) is not None else None,
+            xyz=SensorReadingXYZ.from_json(_xyz) if (_xyz := json.get('xyz')) is not None else None,
+            quaternion=SensorReadingQuaternion.from_json(_quaternion) if (_quaternion := json.get('quaternion')) is not None else None,
         )
 
 
@@ -426,7 +436,10 @@ class PressureSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PressureState(enum.Enum):
@@ -440,7 +453,10 @@ class PressureState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -454,9 +470,9 @@ class PressureMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PressureMetadata:
+    def from_json(cls, json: PressureMetadataJSON) -> PressureMetadata:
         return cls(
-            available=bool(json['available']) if json.get('available', None) is not None else None,
+            available=json.get('available'),
         )
 
 
@@ -472,11 +488,18 @@ class DisabledImageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DisabledImageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
+
+
+def _parse_can_emulate(json: CanEmulateReturnsJSON) -> bool:
+    return json['result']
 
 
 @deprecated(version="1.3")
-def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+def can_emulate() -> Command[CanEmulateReturnsJSON, bool]:
     '''
     Tells whether emulation is supported.
 
@@ -484,48 +507,35 @@ def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
 
     :returns: True if emulation is supported.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.canEmulate',
-    }
-    json = yield cmd_dict
-    return bool(json['result'])
+    return Command('Emulation.canEmulate', None, _parse_can_emulate)
 
 
-def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_device_metrics_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden device metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.clearDeviceMetricsOverride',
-    }
-    json = yield cmd_dict
+    return Command('Emulation.clearDeviceMetricsOverride')
 
 
-def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_geolocation_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden Geolocation Position and Error.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.clearGeolocationOverride',
-    }
-    json = yield cmd_dict
+    return Command('Emulation.clearGeolocationOverride')
 
 
-def reset_page_scale_factor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def reset_page_scale_factor() -> Command[T_JSON_DICT, None]:
     '''
     Requests that page scale factor is reset to initial values.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.resetPageScaleFactor',
-    }
-    json = yield cmd_dict
+    return Command('Emulation.resetPageScaleFactor')
 
 
 def set_focus_emulation_enabled(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables or disables simulating a focused and active page.
 
@@ -535,16 +545,12 @@ def set_focus_emulation_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setFocusEmulationEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setFocusEmulationEnabled', params)
 
 
 def set_auto_dark_mode_override(
         enabled: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Automatically render all web contents using a dark theme.
 
@@ -555,16 +561,12 @@ def set_auto_dark_mode_override(
     params: T_JSON_DICT = dict()
     if enabled is not None:
         params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setAutoDarkModeOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setAutoDarkModeOverride', params)
 
 
 def set_cpu_throttling_rate(
         rate: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables CPU throttling to emulate slow CPUs.
 
@@ -572,16 +574,12 @@ def set_cpu_throttling_rate(
     '''
     params: T_JSON_DICT = dict()
     params['rate'] = rate
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setCPUThrottlingRate',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setCPUThrottlingRate', params)
 
 
 def set_default_background_color_override(
         color: typing.Optional[dom.RGBA] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets or clears an override of the default background color of the frame. This override is used
     if the content does not specify one.
@@ -591,16 +589,12 @@ def set_default_background_color_override(
     params: T_JSON_DICT = dict()
     if color is not None:
         params['color'] = color.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setDefaultBackgroundColorOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setDefaultBackgroundColorOverride', params)
 
 
 def set_safe_area_insets_override(
         insets: SafeAreaInsets
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the values for env(safe-area-inset-*) and env(safe-area-max-inset-*). Unset values will cause the
     respective variables to be undefined, even if previously overridden.
@@ -611,11 +605,7 @@ def set_safe_area_insets_override(
     '''
     params: T_JSON_DICT = dict()
     params['insets'] = insets.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setSafeAreaInsetsOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setSafeAreaInsetsOverride', params)
 
 
 def set_device_metrics_override(
@@ -633,7 +623,7 @@ def set_device_metrics_override(
         viewport: typing.Optional[page.Viewport] = None,
         display_feature: typing.Optional[DisplayFeature] = None,
         device_posture: typing.Optional[DevicePosture] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
     window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
@@ -679,16 +669,12 @@ def set_device_metrics_override(
         params['displayFeature'] = display_feature.to_json()
     if device_posture is not None:
         params['devicePosture'] = device_posture.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setDeviceMetricsOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setDeviceMetricsOverride', params)
 
 
 def set_device_posture_override(
         posture: DevicePosture
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Start reporting the given posture value to the Device Posture API.
     This override can also be set in setDeviceMetricsOverride().
@@ -699,14 +685,10 @@ def set_device_posture_override(
     '''
     params: T_JSON_DICT = dict()
     params['posture'] = posture.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setDevicePostureOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setDevicePostureOverride', params)
 
 
-def clear_device_posture_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_device_posture_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears a device posture override set with either setDeviceMetricsOverride()
     or setDevicePostureOverride() and starts using posture information from the
@@ -715,15 +697,12 @@ def clear_device_posture_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.clearDevicePostureOverride',
-    }
-    json = yield cmd_dict
+    return Command('Emulation.clearDevicePostureOverride')
 
 
 def set_scrollbars_hidden(
         hidden: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -733,16 +712,12 @@ def set_scrollbars_hidden(
     '''
     params: T_JSON_DICT = dict()
     params['hidden'] = hidden
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setScrollbarsHidden',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setScrollbarsHidden', params)
 
 
 def set_document_cookie_disabled(
         disabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -752,17 +727,13 @@ def set_document_cookie_disabled(
     '''
     params: T_JSON_DICT = dict()
     params['disabled'] = disabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setDocumentCookieDisabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setDocumentCookieDisabled', params)
 
 
 def set_emit_touch_events_for_mouse(
         enabled: bool,
         configuration: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -775,17 +746,13 @@ def set_emit_touch_events_for_mouse(
     params['enabled'] = enabled
     if configuration is not None:
         params['configuration'] = configuration
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setEmitTouchEventsForMouse',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setEmitTouchEventsForMouse', params)
 
 
 def set_emulated_media(
         media: typing.Optional[str] = None,
         features: typing.Optional[typing.List[MediaFeature]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Emulates the given media type or media feature for CSS media queries.
 
@@ -797,16 +764,12 @@ def set_emulated_media(
         params['media'] = media
     if features is not None:
         params['features'] = [i.to_json() for i in features]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setEmulatedMedia',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setEmulatedMedia', params)
 
 
 def set_emulated_vision_deficiency(
         type_: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Emulates the given vision deficiency.
 
@@ -814,18 +777,14 @@ def set_emulated_vision_deficiency(
     '''
     params: T_JSON_DICT = dict()
     params['type'] = type_
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setEmulatedVisionDeficiency',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setEmulatedVisionDeficiency', params)
 
 
 def set_geolocation_override(
         latitude: typing.Optional[float] = None,
         longitude: typing.Optional[float] = None,
         accuracy: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position
     unavailable.
@@ -841,16 +800,16 @@ def set_geolocation_override(
         params['longitude'] = longitude
     if accuracy is not None:
         params['accuracy'] = accuracy
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setGeolocationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setGeolocationOverride', params)
+
+
+def _parse_get_overridden_sensor_information(json: GetOverriddenSensorInformationReturnsJSON) -> float:
+    return float(json['requestedSamplingFrequency'])
 
 
 def get_overridden_sensor_information(
         type_: SensorType
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+    ) -> Command[GetOverriddenSensorInformationReturnsJSON, float]:
     '''
 
 
@@ -860,20 +819,15 @@ def get_overridden_sensor_information(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['type'] = type_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.getOverriddenSensorInformation',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return float(json['requestedSamplingFrequency'])
+    params['type'] = type_.value
+    return Command('Emulation.getOverriddenSensorInformation', params, _parse_get_overridden_sensor_information)
 
 
 def set_sensor_override_enabled(
         enabled: bool,
         type_: SensorType,
         metadata: typing.Optional[SensorMetadata] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides a platform sensor of a given type. If ``enabled`` is true, calls to
     Sensor.start() will use a virtual sensor as backend rather than fetching
@@ -889,20 +843,16 @@ def set_sensor_override_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    params['type'] = type_.to_json()
+    params['type'] = type_.value
     if metadata is not None:
         params['metadata'] = metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setSensorOverrideEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setSensorOverrideEnabled', params)
 
 
 def set_sensor_override_readings(
         type_: SensorType,
         reading: SensorReading
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Updates the sensor readings reported by a sensor type previously overridden
     by setSensorOverrideEnabled.
@@ -913,20 +863,16 @@ def set_sensor_override_readings(
     :param reading:
     '''
     params: T_JSON_DICT = dict()
-    params['type'] = type_.to_json()
+    params['type'] = type_.value
     params['reading'] = reading.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setSensorOverrideReadings',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setSensorOverrideReadings', params)
 
 
 def set_pressure_source_override_enabled(
         enabled: bool,
         source: PressureSource,
         metadata: typing.Optional[PressureMetadata] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides a pressure source of a given type, as used by the Compute
     Pressure API, so that updates to PressureObserver.observe() are provided
@@ -941,20 +887,16 @@ def set_pressure_source_override_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    params['source'] = source.to_json()
+    params['source'] = source.value
     if metadata is not None:
         params['metadata'] = metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setPressureSourceOverrideEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setPressureSourceOverrideEnabled', params)
 
 
 def set_pressure_state_override(
         source: PressureSource,
         state: PressureState
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Provides a given pressure state that will be processed and eventually be
     delivered to PressureObserver users. ``source`` must have been previously
@@ -966,19 +908,15 @@ def set_pressure_state_override(
     :param state:
     '''
     params: T_JSON_DICT = dict()
-    params['source'] = source.to_json()
-    params['state'] = state.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setPressureStateOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['source'] = source.value
+    params['state'] = state.value
+    return Command('Emulation.setPressureStateOverride', params)
 
 
 def set_idle_override(
         is_user_active: bool,
         is_screen_unlocked: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the Idle state.
 
@@ -988,27 +926,20 @@ def set_idle_override(
     params: T_JSON_DICT = dict()
     params['isUserActive'] = is_user_active
     params['isScreenUnlocked'] = is_screen_unlocked
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setIdleOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setIdleOverride', params)
 
 
-def clear_idle_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_idle_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears Idle state overrides.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.clearIdleOverride',
-    }
-    json = yield cmd_dict
+    return Command('Emulation.clearIdleOverride')
 
 
 @deprecated(version="1.3")
 def set_navigator_overrides(
         platform: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides value returned by the javascript navigator object.
 
@@ -1020,16 +951,12 @@ def set_navigator_overrides(
     '''
     params: T_JSON_DICT = dict()
     params['platform'] = platform
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setNavigatorOverrides',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setNavigatorOverrides', params)
 
 
 def set_page_scale_factor(
         page_scale_factor: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets a specified page scale factor.
 
@@ -1039,16 +966,12 @@ def set_page_scale_factor(
     '''
     params: T_JSON_DICT = dict()
     params['pageScaleFactor'] = page_scale_factor
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setPageScaleFactor',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setPageScaleFactor', params)
 
 
 def set_script_execution_disabled(
         value: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Switches script execution in the page.
 
@@ -1056,17 +979,13 @@ def set_script_execution_disabled(
     '''
     params: T_JSON_DICT = dict()
     params['value'] = value
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setScriptExecutionDisabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setScriptExecutionDisabled', params)
 
 
 def set_touch_emulation_enabled(
         enabled: bool,
         max_touch_points: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables touch on platforms which do not support them.
 
@@ -1077,11 +996,11 @@ def set_touch_emulation_enabled(
     params['enabled'] = enabled
     if max_touch_points is not None:
         params['maxTouchPoints'] = max_touch_points
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setTouchEmulationEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setTouchEmulationEnabled', params)
+
+
+def _parse_set_virtual_time_policy(json: SetVirtualTimePolicyReturnsJSON) -> float:
+    return float(json['virtualTimeTicksBase'])
 
 
 def set_virtual_time_policy(
@@ -1089,7 +1008,7 @@ def set_virtual_time_policy(
         budget: typing.Optional[float] = None,
         max_virtual_time_task_starvation_count: typing.Optional[int] = None,
         initial_virtual_time: typing.Optional[network.TimeSinceEpoch] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+    ) -> Command[SetVirtualTimePolicyReturnsJSON, float]:
     '''
     Turns on virtual time for all frames (replacing real-time with a synthetic time source) and sets
     the current virtual time policy.  Note this supersedes any previous time budget.
@@ -1103,24 +1022,19 @@ def set_virtual_time_policy(
     :returns: Absolute timestamp at which virtual time was first enabled (up time in milliseconds).
     '''
     params: T_JSON_DICT = dict()
-    params['policy'] = policy.to_json()
+    params['policy'] = policy.value
     if budget is not None:
         params['budget'] = budget
     if max_virtual_time_task_starvation_count is not None:
         params['maxVirtualTimeTaskStarvationCount'] = max_virtual_time_task_starvation_count
     if initial_virtual_time is not None:
-        params['initialVirtualTime'] = initial_virtual_time.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setVirtualTimePolicy',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return float(json['virtualTimeTicksBase'])
+        params['initialVirtualTime'] = initial_virtual_time
+    return Command('Emulation.setVirtualTimePolicy', params, _parse_set_virtual_time_policy)
 
 
 def set_locale_override(
         locale: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides default host system locale with the specified one.
 
@@ -1131,16 +1045,12 @@ def set_locale_override(
     params: T_JSON_DICT = dict()
     if locale is not None:
         params['locale'] = locale
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setLocaleOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setLocaleOverride', params)
 
 
 def set_timezone_override(
         timezone_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides default host system timezone with the specified one.
 
@@ -1148,18 +1058,14 @@ def set_timezone_override(
     '''
     params: T_JSON_DICT = dict()
     params['timezoneId'] = timezone_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setTimezoneOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setTimezoneOverride', params)
 
 
 @deprecated(version="1.3")
 def set_visible_size(
         width: int,
         height: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Resizes the frame/viewport of the page. Note that this does not affect the frame's container
     (e.g. browser window). Can be used to produce screenshots of the specified size. Not supported
@@ -1175,16 +1081,12 @@ def set_visible_size(
     params: T_JSON_DICT = dict()
     params['width'] = width
     params['height'] = height
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setVisibleSize',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setVisibleSize', params)
 
 
 def set_disabled_image_types(
         image_types: typing.List[DisabledImageType]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -1193,17 +1095,13 @@ def set_disabled_image_types(
     :param image_types: Image types to disable.
     '''
     params: T_JSON_DICT = dict()
-    params['imageTypes'] = [i.to_json() for i in image_types]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setDisabledImageTypes',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['imageTypes'] = [i.value for i in image_types]
+    return Command('Emulation.setDisabledImageTypes', params)
 
 
 def set_hardware_concurrency_override(
         hardware_concurrency: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -1213,11 +1111,7 @@ def set_hardware_concurrency_override(
     '''
     params: T_JSON_DICT = dict()
     params['hardwareConcurrency'] = hardware_concurrency
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setHardwareConcurrencyOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setHardwareConcurrencyOverride', params)
 
 
 def set_user_agent_override(
@@ -1225,7 +1119,7 @@ def set_user_agent_override(
         accept_language: typing.Optional[str] = None,
         platform: typing.Optional[str] = None,
         user_agent_metadata: typing.Optional[UserAgentMetadata] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Allows overriding user agent with the given string.
     ``userAgentMetadata`` must be set for Client Hint headers to be sent.
@@ -1243,16 +1137,12 @@ def set_user_agent_override(
         params['platform'] = platform
     if user_agent_metadata is not None:
         params['userAgentMetadata'] = user_agent_metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setUserAgentOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setUserAgentOverride', params)
 
 
 def set_automation_override(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Allows overriding the automation flag.
 
@@ -1262,11 +1152,7 @@ def set_automation_override(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setAutomationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Emulation.setAutomationOverride', params)
 
 
 @event_class('Emulation.virtualTimeBudgetExpired')
@@ -1284,3 +1170,101 @@ class VirtualTimeBudgetExpired:
         return cls(
 
         )
+
+
+if typing.TYPE_CHECKING:
+    class SafeAreaInsetsJSON(typing.TypedDict, total=False):
+        top: int
+        topMax: int
+        left: int
+        leftMax: int
+        bottom: int
+        bottomMax: int
+        right: int
+        rightMax: int
+
+
+    class ScreenOrientationJSON(typing.TypedDict):
+        type: str
+        angle: int
+
+
+    class DisplayFeatureJSON(typing.TypedDict):
+        orientation: str
+        offset: int
+        maskLength: int
+
+
+    class DevicePostureJSON(typing.TypedDict):
+        type: str
+
+
+    class MediaFeatureJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class UserAgentBrandVersionJSON(typing.TypedDict):
+        brand: str
+        version: str
+
+
+    class _UserAgentMetadataJSON(typing.TypedDict):
+        platform: str
+        platformVersion: str
+        architecture: str
+        model: str
+        mobile: bool
+
+
+    class UserAgentMetadataJSON(_UserAgentMetadataJSON, total=False):
+        brands: typing.List[UserAgentBrandVersionJSON]
+        fullVersionList: typing.List[UserAgentBrandVersionJSON]
+        fullVersion: str
+        bitness: str
+        wow64: bool
+
+
+    class SensorMetadataJSON(typing.TypedDict, total=False):
+        available: bool
+        minimumFrequency: float
+        maximumFrequency: float
+
+
+    class SensorReadingSingleJSON(typing.TypedDict):
+        value: float
+
+
+    class SensorReadingXYZJSON(typing.TypedDict):
+        x: float
+        y: float
+        z: float
+
+
+    class SensorReadingQuaternionJSON(typing.TypedDict):
+        x: float
+        y: float
+        z: float
+        w: float
+
+
+    class SensorReadingJSON(typing.TypedDict, total=False):
+        single: SensorReadingSingleJSON
+        xyz: SensorReadingXYZJSON
+        quaternion: SensorReadingQuaternionJSON
+
+
+    class PressureMetadataJSON(typing.TypedDict, total=False):
+        available: bool
+
+
+    class CanEmulateReturnsJSON(typing.TypedDict):
+        result: bool
+
+
+    class GetOverriddenSensorInformationReturnsJSON(typing.TypedDict):
+        requestedSamplingFrequency: float
+
+
+    class SetVirtualTimePolicyReturnsJSON(typing.TypedDict):
+        virtualTimeTicksBase: float
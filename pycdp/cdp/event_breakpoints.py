@@ -8,13 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 def set_instrumentation_breakpoint(
         event_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets breakpoint on particular native event.
 
@@ -22,16 +21,12 @@ def set_instrumentation_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'EventBreakpoints.setInstrumentationBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('EventBreakpoints.setInstrumentationBreakpoint', params)
 
 
 def remove_instrumentation_breakpoint(
         event_name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes breakpoint on particular native event.
 
@@ -39,18 +34,11 @@ def remove_instrumentation_breakpoint(
     '''
     params: T_JSON_DICT = dict()
     params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'EventBreakpoints.removeInstrumentationBreakpoint',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('EventBreakpoints.removeInstrumentationBreakpoint', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Removes all breakpoints
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'EventBreakpoints.disable',
-    }
-    json = yield cmd_dict
+    return Command('EventBreakpoints.disable')
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class StorageArea(enum.Enum):
@@ -26,12 +25,19 @@ class StorageArea(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageArea:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
+
+
+def _parse_load_unpacked(json: LoadUnpackedReturnsJSON) -> str:
+    return json['id']
 
 
 def load_unpacked(
         path: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[LoadUnpackedReturnsJSON, str]:
     '''
     Installs an unpacked extension from the filesystem similar to
     --load-extension CLI flags. Returns extension ID once the extension
@@ -44,17 +50,12 @@ def load_unpacked(
     '''
     params: T_JSON_DICT = dict()
     params['path'] = path
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.loadUnpacked',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['id'])
+    return Command('Extensions.loadUnpacked', params, _parse_load_unpacked)
 
 
 def uninstall(
         id_: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Uninstalls an unpacked extension (others not supported) from the profile.
     Available if the client is connected using the --remote-debugging-pipe flag
@@ -64,18 +65,18 @@ def uninstall(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.uninstall',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Extensions.uninstall', params)
+
+
+def _parse_get_storage_items(json: GetStorageItemsReturnsJSON) -> dict:
+    return json['data']
 
 
 def get_storage_items(
         id_: str,
         storage_area: StorageArea,
         keys: typing.Optional[typing.List[str]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
+    ) -> Command[GetStorageItemsReturnsJSON, dict]:
     '''
     Gets data from extension storage in the given ``storageArea``. If ``keys`` is
     specified, these are used to filter the result.
@@ -87,22 +88,17 @@ def get_storage_items(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
+    params['storageArea'] = storage_area.value
     if keys is not None:
-        params['keys'] = [i for i in keys]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.getStorageItems',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return dict(json['data'])
+        params['keys'] = list(keys)
+    return Command('Extensions.getStorageItems', params, _parse_get_storage_items)
 
 
 def remove_storage_items(
         id_: str,
         storage_area: StorageArea,
         keys: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes ``keys`` from extension storage in the given ``storageArea``.
 
@@ -112,19 +108,15 @@ def remove_storage_items(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
-    params['keys'] = [i for i in keys]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.removeStorageItems',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['storageArea'] = storage_area.value
+    params['keys'] = list(keys)
+    return Command('Extensions.removeStorageItems', params)
 
 
 def clear_storage_items(
         id_: str,
         storage_area: StorageArea
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears extension storage in the given ``storageArea``.
 
@@ -133,19 +125,15 @@ def clear_storage_items(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.clearStorageItems',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['storageArea'] = storage_area.value
+    return Command('Extensions.clearStorageItems', params)
 
 
 def set_storage_items(
         id_: str,
         storage_area: StorageArea,
         values: dict
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets ``values`` in extension storage in the given ``storageArea``. The provided ``values``
     will be merged with existing values in the storage area.
@@ -156,10 +144,15 @@ def set_storage_items(
     '''
     params: T_JSON_DICT = dict()
     params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
+    params['storageArea'] = storage_area.value
     params['values'] = values
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Extensions.setStorageItems',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Extensions.setStorageItems', params)
+
+
+if typing.TYPE_CHECKING:
+    class LoadUnpackedReturnsJSON(typing.TypedDict):
+        id: str
+
+
+    class GetStorageItemsReturnsJSON(typing.TypedDict):
+        data: dict
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class LoginState(enum.Enum):
@@ -25,7 +24,10 @@ class LoginState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LoginState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class DialogType(enum.Enum):
@@ -42,7 +44,10 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class DialogButton(enum.Enum):
@@ -58,7 +63,10 @@ class DialogButton(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogButton:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AccountUrlType(enum.Enum):
@@ -73,7 +81,10 @@ class AccountUrlType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AccountUrlType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -111,7 +122,7 @@ class Account:
         json['pictureUrl'] = self.picture_url
         json['idpConfigUrl'] = self.idp_config_url
         json['idpLoginUrl'] = self.idp_login_url
-        json['loginState'] = self.login_state.to_json()
+        json['loginState'] = self.login_state.value
         if self.terms_of_service_url is not None:
             json['termsOfServiceUrl'] = self.terms_of_service_url
         if self.privacy_policy_url is not None:
@@ -119,49 +130,42 @@ class Account:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Account:
+    def from_json(cls, json: AccountJSON) -> Account:
         return cls(
-            account_id=str(json['accountId']),
-            email=str(json['email']),
-            name=str(json['name']),
-            given_name=str(json['givenName']),
-            picture_url=str(json['pictureUrl']),
-            idp_config_url=str(json['idpConfigUrl']),
-            idp_login_url=str(json['idpLoginUrl']),
+            account_id=json['accountId'],
+            email=json['email'],
+            name=json['name'],
+            given_name=json['givenName'],
+            picture_url=json['pictureUrl'],
+            idp_config_url=json['idpConfigUrl'],
+            idp_login_url=json['idpLoginUrl'],
             login_state=LoginState.from_json(json['loginState']),
-            terms_of_service_url=str(json['termsOfServiceUrl']) if json.get('termsOfServiceUrl', None) is not None else None,
-            privacy_policy_url=str(json['privacyPolicyUrl']) if json.get('privacyPolicyUrl', None) is not None else None,
+            terms_of_service_url=json.get('termsOfServiceUrl'),
+            privacy_policy_url=json.get('privacyPolicyUrl'),
         )
 
 
 def enable(
         disable_rejection_delay: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param disable_rejection_delay: *(Optional)* Allows callers to disable the promise rejection delay that would normally happen, if this is unimportant to what's being tested. (step 4 of https://fedidcg.github.io/FedCM/#browser-api-rp-sign-in)
     '''
     params: T_JSON_DICT = dict()
     if disable_rejection_delay is not None:
         params['disableRejectionDelay'] = disable_rejection_delay
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('FedCm.enable', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.disable',
-    }
-    json = yield cmd_dict
+    return Command('FedCm.disable')
 
 
 def select_account(
         dialog_id: str,
         account_index: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param dialog_id:
     :param account_index:
@@ -169,36 +173,28 @@ def select_account(
     params: T_JSON_DICT = dict()
     params['dialogId'] = dialog_id
     params['accountIndex'] = account_index
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.selectAccount',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('FedCm.selectAccount', params)
 
 
 def click_dialog_button(
         dialog_id: str,
         dialog_button: DialogButton
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param dialog_id:
     :param dialog_button:
     '''
     params: T_JSON_DICT = dict()
     params['dialogId'] = dialog_id
-    params['dialogButton'] = dialog_button.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.clickDialogButton',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['dialogButton'] = dialog_button.value
+    return Command('FedCm.clickDialogButton', params)
 
 
 def open_url(
         dialog_id: str,
         account_index: int,
         account_url_type: AccountUrlType
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param dialog_id:
     :param account_index:
@@ -207,18 +203,14 @@ def open_url(
     params: T_JSON_DICT = dict()
     params['dialogId'] = dialog_id
     params['accountIndex'] = account_index
-    params['accountUrlType'] = account_url_type.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.openUrl',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['accountUrlType'] = account_url_type.value
+    return Command('FedCm.openUrl', params)
 
 
 def dismiss_dialog(
         dialog_id: str,
         trigger_cooldown: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param dialog_id:
     :param trigger_cooldown: *(Optional)*
@@ -227,22 +219,15 @@ def dismiss_dialog(
     params['dialogId'] = dialog_id
     if trigger_cooldown is not None:
         params['triggerCooldown'] = trigger_cooldown
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.dismissDialog',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('FedCm.dismissDialog', params)
 
 
-def reset_cooldown() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def reset_cooldown() -> Command[T_JSON_DICT, None]:
     '''
     Resets the cooldown time, if any, to allow the next FedCM call to show
     a dialog even if one was recently dismissed by the user.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FedCm.resetCooldown',
-    }
-    json = yield cmd_dict
+    return Command('FedCm.resetCooldown')
 
 
 @event_class('FedCm.dialogShown')
@@ -257,13 +242,13 @@ class DialogShown:
     subtitle: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DialogShown:
+    def from_json(cls, json: DialogShownJSON) -> DialogShown:
         return cls(
-            dialog_id=str(json['dialogId']),
+            dialog_id=json['dialogId'],
             dialog_type=DialogType.from_json(json['dialogType']),
             accounts=[Account.from_json(i) for i in json['accounts']],
-            title=str(json['title']),
-            subtitle=str(json['subtitle']) if json.get('subtitle', None) is not None else None
+            title=json['title'],
+            subtitle=json.get('subtitle')
         )
 
 
@@ -277,7 +262,39 @@ class DialogClosed:
     dialog_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DialogClosed:
+    def from_json(cls, json: DialogClosedJSON) -> DialogClosed:
         return cls(
-            dialog_id=str(json['dialogId'])
+            dialog_id=json['dialogId']
         )
+
+
+if typing.TYPE_CHECKING:
+    class _AccountJSON(typing.TypedDict):
+        accountId: str
+        email: str
+        name: str
+        givenName: str
+        pictureUrl: str
+        idpConfigUrl: str
+        idpLoginUrl: str
+        loginState: str
+
+
+    class AccountJSON(_AccountJSON, total=False):
+        termsOfServiceUrl: str
+        privacyPolicyUrl: str
+
+
+    class _DialogShownJSON(typing.TypedDict):
+        dialogId: str
+        dialogType: str
+        accounts: typing.List[AccountJSON]
+        title: str
+
+
+    class DialogShownJSON(_DialogShownJSON, total=False):
+        subtitle: str
+
+
+    class DialogClosedJSON(typing.TypedDict):
+        dialogId: str
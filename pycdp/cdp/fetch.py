@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import io
-from . import network
-from . import page
+if typing.TYPE_CHECKING:
+    from . import io
+    from . import network
+    from . import page
+else:
+    io = lazy_import('io', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
 
 
 class RequestId(str):
@@ -47,7 +51,10 @@ class RequestStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RequestStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -67,17 +74,17 @@ class RequestPattern:
         if self.url_pattern is not None:
             json['urlPattern'] = self.url_pattern
         if self.resource_type is not None:
-            json['resourceType'] = self.resource_type.to_json()
+            json['resourceType'] = self.resource_type.value
         if self.request_stage is not None:
-            json['requestStage'] = self.request_stage.to_json()
+            json['requestStage'] = self.request_stage.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
+    def from_json(cls, json: RequestPatternJSON) -> RequestPattern:
         return cls(
-            url_pattern=str(json['urlPattern']) if json.get('urlPattern', None) is not None else None,
-            resource_type=network.ResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            request_stage=RequestStage.from_json(json['requestStage']) if json.get('requestStage', None) is not None else None,
+            url_pattern=json.get('urlPattern'),
+            resource_type=network.ResourceType.from_json(_resource_type) if (_resource_type := json.get('resourceType')) is not None else None,
+            request_stage=RequestStage.from_json(_request_stage) if (_request_stage := json.get('requestStage')) is not None else None,
         )
 
 
@@ -97,10 +104,10 @@ class HeaderEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> HeaderEntry:
+    def from_json(cls, json: HeaderEntryJSON) -> HeaderEntry:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -131,12 +138,12 @@ class AuthChallenge:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
+    def from_json(cls, json: AuthChallengeJSON) -> AuthChallenge:
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if json.get('source', None) is not None else None,
+            origin=json['origin'],
+            scheme=json['scheme'],
+            realm=json['realm'],
+            source=json.get('source'),
         )
 
 
@@ -168,28 +175,25 @@ class AuthChallengeResponse:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
+    def from_json(cls, json: AuthChallengeResponseJSON) -> AuthChallengeResponse:
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if json.get('username', None) is not None else None,
-            password=str(json['password']) if json.get('password', None) is not None else None,
+            response=json['response'],
+            username=json.get('username'),
+            password=json.get('password'),
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables the fetch domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.disable',
-    }
-    json = yield cmd_dict
+    return Command('Fetch.disable')
 
 
 def enable(
         patterns: typing.Optional[typing.List[RequestPattern]] = None,
         handle_auth_requests: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables issuing of requestPaused events. A request will be paused until client
     calls one of failRequest, fulfillRequest or continueRequest/continueWithAuth.
@@ -202,17 +206,13 @@ def enable(
         params['patterns'] = [i.to_json() for i in patterns]
     if handle_auth_requests is not None:
         params['handleAuthRequests'] = handle_auth_requests
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Fetch.enable', params)
 
 
 def fail_request(
         request_id: RequestId,
         error_reason: network.ErrorReason
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Causes the request to fail with specified reason.
 
@@ -220,13 +220,9 @@ def fail_request(
     :param error_reason: Causes the request to fail with the given reason.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['errorReason'] = error_reason.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.failRequest',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['requestId'] = request_id
+    params['errorReason'] = error_reason.value
+    return Command('Fetch.failRequest', params)
 
 
 def fulfill_request(
@@ -236,7 +232,7 @@ def fulfill_request(
         binary_response_headers: typing.Optional[str] = None,
         body: typing.Optional[str] = None,
         response_phrase: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     r'''
     Provides response to the request.
 
@@ -248,7 +244,7 @@ def fulfill_request(
     :param response_phrase: *(Optional)* A textual representation of responseCode. If absent, a standard phrase matching responseCode is used.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     params['responseCode'] = response_code
     if response_headers is not None:
         params['responseHeaders'] = [i.to_json() for i in response_headers]
@@ -258,11 +254,7 @@ def fulfill_request(
         params['body'] = body
     if response_phrase is not None:
         params['responsePhrase'] = response_phrase
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.fulfillRequest',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Fetch.fulfillRequest', params)
 
 
 def continue_request(
@@ -272,7 +264,7 @@ def continue_request(
         post_data: typing.Optional[str] = None,
         headers: typing.Optional[typing.List[HeaderEntry]] = None,
         intercept_response: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Continues the request, optionally modifying some of its parameters.
 
@@ -284,7 +276,7 @@ def continue_request(
     :param intercept_response: **(EXPERIMENTAL)** *(Optional)* If set, overrides response interception behavior for this request.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     if url is not None:
         params['url'] = url
     if method is not None:
@@ -295,17 +287,13 @@ def continue_request(
         params['headers'] = [i.to_json() for i in headers]
     if intercept_response is not None:
         params['interceptResponse'] = intercept_response
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.continueRequest',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Fetch.continueRequest', params)
 
 
 def continue_with_auth(
         request_id: RequestId,
         auth_challenge_response: AuthChallengeResponse
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Continues a request supplying authChallengeResponse following authRequired event.
 
@@ -313,13 +301,9 @@ def continue_with_auth(
     :param auth_challenge_response: Response to  with an authChallenge.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     params['authChallengeResponse'] = auth_challenge_response.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.continueWithAuth',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Fetch.continueWithAuth', params)
 
 
 def continue_response(
@@ -328,7 +312,7 @@ def continue_response(
         response_phrase: typing.Optional[str] = None,
         response_headers: typing.Optional[typing.List[HeaderEntry]] = None,
         binary_response_headers: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     r'''
     Continues loading of the paused response, optionally modifying the
     response headers. If either responseCode or headers are modified, all of them
@@ -343,7 +327,7 @@ def continue_response(
     :param binary_response_headers: *(Optional)* Alternative way of specifying response headers as a \0-separated series of name: value pairs. Prefer the above method unless you need to represent some non-UTF8 values that can't be transmitted over the protocol as text. (Encoded as a base64 string when passed over JSON)
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     if response_code is not None:
         params['responseCode'] = response_code
     if response_phrase is not None:
@@ -352,16 +336,19 @@ def continue_response(
         params['responseHeaders'] = [i.to_json() for i in response_headers]
     if binary_response_headers is not None:
         params['binaryResponseHeaders'] = binary_response_headers
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.continueResponse',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Fetch.continueResponse', params)
+
+
+def _parse_get_response_body(json: GetResponseBodyReturnsJSON) -> typing.Tuple[str, bool]:
+    return (
+        json['body'],
+        json['base64Encoded']
+    )
 
 
 def get_response_body(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
+    ) -> Command[GetResponseBodyReturnsJSON, typing.Tuple[str, bool]]:
     '''
     Causes the body of the response to be received from the server and
     returned as a single string. May only be issued for a request that
@@ -381,21 +368,17 @@ def get_response_body(
         1. **base64Encoded** - True, if content was sent as base64.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.getResponseBody',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    params['requestId'] = request_id
+    return Command('Fetch.getResponseBody', params, _parse_get_response_body)
+
+
+def _parse_take_response_body_as_stream(json: TakeResponseBodyAsStreamReturnsJSON) -> io.StreamHandle:
+    return io.StreamHandle(json['stream'])
 
 
 def take_response_body_as_stream(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,io.StreamHandle]:
+    ) -> Command[TakeResponseBodyAsStreamReturnsJSON, io.StreamHandle]:
     '''
     Returns a handle to the stream representing the response body.
     The request must be paused in the HeadersReceived stage.
@@ -412,13 +395,8 @@ def take_response_body_as_stream(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Fetch.takeResponseBodyAsStream',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    params['requestId'] = request_id
+    return Command('Fetch.takeResponseBodyAsStream', params, _parse_take_response_body_as_stream)
 
 
 @event_class('Fetch.requestPaused')
@@ -461,18 +439,18 @@ class RequestPaused:
     redirected_request_id: typing.Optional[RequestId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestPaused:
+    def from_json(cls, json: RequestPausedJSON) -> RequestPaused:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=network.ResourceType.from_json(json['resourceType']),
-            response_error_reason=network.ErrorReason.from_json(json['responseErrorReason']) if json.get('responseErrorReason', None) is not None else None,
-            response_status_code=int(json['responseStatusCode']) if json.get('responseStatusCode', None) is not None else None,
-            response_status_text=str(json['responseStatusText']) if json.get('responseStatusText', None) is not None else None,
-            response_headers=[HeaderEntry.from_json(i) for i in json['responseHeaders']] if json.get('responseHeaders', None) is not None else None,
-            network_id=network.RequestId.from_json(json['networkId']) if json.get('networkId', None) is not None else None,
-            redirected_request_id=RequestId.from_json(json['redirectedRequestId']) if json.get('redirectedRequestId', None) is not None else None
+            response_error_reason=network.ErrorReason.from_json(_response_error_reason) if (_response_error_reason := json.get('responseErrorReason')) is not None else None,
+            response_status_code=json.get('responseStatusCode'),
+            response_status_text=json.get('responseStatusText'),
+            response_headers=[HeaderEntry.from_json(i) for i in _response_headers] if (_response_headers := json.get('responseHeaders')) is not None else None,
+            network_id=network.RequestId(_network_id) if (_network_id := json.get('networkId')) is not None else None,
+            redirected_request_id=RequestId(_redirected_request_id) if (_redirected_request_id := json.get('redirectedRequestId')) is not None else None
         )
 
 
@@ -497,11 +475,75 @@ class AuthRequired:
     auth_challenge: AuthChallenge
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AuthRequired:
+    def from_json(cls, json: AuthRequiredJSON) -> AuthRequired:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=network.ResourceType.from_json(json['resourceType']),
             auth_challenge=AuthChallenge.from_json(json['authChallenge'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class RequestPatternJSON(typing.TypedDict, total=False):
+        urlPattern: str
+        resourceType: str
+        requestStage: str
+
+
+    class HeaderEntryJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class _AuthChallengeJSON(typing.TypedDict):
+        origin: str
+        scheme: str
+        realm: str
+
+
+    class AuthChallengeJSON(_AuthChallengeJSON, total=False):
+        source: str
+
+
+    class _AuthChallengeResponseJSON(typing.TypedDict):
+        response: str
+
+
+    class AuthChallengeResponseJSON(_AuthChallengeResponseJSON, total=False):
+        username: str
+        password: str
+
+
+    class GetResponseBodyReturnsJSON(typing.TypedDict):
+        body: str
+        base64Encoded: bool
+
+
+    class TakeResponseBodyAsStreamReturnsJSON(typing.TypedDict):
+        stream: str
+
+
+    class _RequestPausedJSON(typing.TypedDict):
+        requestId: str
+        request: network.RequestJSON
+        frameId: str
+        resourceType: str
+
+
+    class RequestPausedJSON(_RequestPausedJSON, total=False):
+        responseErrorReason: str
+        responseStatusCode: int
+        responseStatusText: str
+        responseHeaders: typing.List[HeaderEntryJSON]
+        networkId: str
+        redirectedRequestId: str
+
+
+    class AuthRequiredJSON(typing.TypedDict):
+        requestId: str
+        request: network.RequestJSON
+        frameId: str
+        resourceType: str
+        authChallenge: AuthChallengeJSON
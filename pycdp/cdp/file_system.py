@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import network
-from . import storage
+if typing.TYPE_CHECKING:
+    from . import network
+    from . import storage
+else:
+    network = lazy_import('network', globals())
+    storage = lazy_import('storage', globals())
 
 
 @dataclass
@@ -30,18 +33,18 @@ class File:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['name'] = self.name
-        json['lastModified'] = self.last_modified.to_json()
+        json['lastModified'] = self.last_modified
         json['size'] = self.size
         json['type'] = self.type_
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> File:
+    def from_json(cls, json: FileJSON) -> File:
         return cls(
-            name=str(json['name']),
-            last_modified=network.TimeSinceEpoch.from_json(json['lastModified']),
+            name=json['name'],
+            last_modified=network.TimeSinceEpoch(json['lastModified']),
             size=float(json['size']),
-            type_=str(json['type']),
+            type_=json['type'],
         )
 
 
@@ -57,15 +60,15 @@ class Directory:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['name'] = self.name
-        json['nestedDirectories'] = [i for i in self.nested_directories]
+        json['nestedDirectories'] = list(self.nested_directories)
         json['nestedFiles'] = [i.to_json() for i in self.nested_files]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Directory:
+    def from_json(cls, json: DirectoryJSON) -> Directory:
         return cls(
-            name=str(json['name']),
-            nested_directories=[str(i) for i in json['nestedDirectories']],
+            name=json['name'],
+            nested_directories=json['nestedDirectories'],
             nested_files=[File.from_json(i) for i in json['nestedFiles']],
         )
 
@@ -83,33 +86,59 @@ class BucketFileSystemLocator:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['storageKey'] = self.storage_key.to_json()
-        json['pathComponents'] = [i for i in self.path_components]
+        json['storageKey'] = self.storage_key
+        json['pathComponents'] = list(self.path_components)
         if self.bucket_name is not None:
             json['bucketName'] = self.bucket_name
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BucketFileSystemLocator:
+    def from_json(cls, json: BucketFileSystemLocatorJSON) -> BucketFileSystemLocator:
         return cls(
-            storage_key=storage.SerializedStorageKey.from_json(json['storageKey']),
-            path_components=[str(i) for i in json['pathComponents']],
-            bucket_name=str(json['bucketName']) if json.get('bucketName', None) is not None else None,
+            storage_key=storage.SerializedStorageKey(json['storageKey']),
+            path_components=json['pathComponents'],
+            bucket_name=json.get('bucketName'),
         )
 
 
+def _parse_get_directory(json: GetDirectoryReturnsJSON) -> Directory:
+    return Directory.from_json(json['directory'])
+
+
 def get_directory(
         bucket_file_system_locator: BucketFileSystemLocator
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Directory]:
+    ) -> Command[GetDirectoryReturnsJSON, Directory]:
     '''
     :param bucket_file_system_locator:
     :returns: Returns the directory object at the path.
     '''
     params: T_JSON_DICT = dict()
     params['bucketFileSystemLocator'] = bucket_file_system_locator.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'FileSystem.getDirectory',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Directory.from_json(json['directory'])
+    return Command('FileSystem.getDirectory', params, _parse_get_directory)
+
+
+if typing.TYPE_CHECKING:
+    class FileJSON(typing.TypedDict):
+        name: str
+        lastModified: float
+        size: float
+        type: str
+
+
+    class DirectoryJSON(typing.TypedDict):
+        name: str
+        nestedDirectories: typing.List[str]
+        nestedFiles: typing.List[FileJSON]
+
+
+    class _BucketFileSystemLocatorJSON(typing.TypedDict):
+        storageKey: str
+        pathComponents: typing.List[str]
+
+
+    class BucketFileSystemLocatorJSON(_BucketFileSystemLocatorJSON, total=False):
+        bucketName: str
+
+
+    class GetDirectoryReturnsJSON(typing.TypedDict):
+        directory: DirectoryJSON
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 from deprecated.sphinx import deprecated # type: ignore
@@ -40,20 +39,27 @@ class ScreenshotParams:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreenshotParams:
+    def from_json(cls, json: ScreenshotParamsJSON) -> ScreenshotParams:
         return cls(
-            format_=str(json['format']) if json.get('format', None) is not None else None,
-            quality=int(json['quality']) if json.get('quality', None) is not None else None,
-            optimize_for_speed=bool(json['optimizeForSpeed']) if json.get('optimizeForSpeed', None) is not None else None,
+            format_=json.get('format'),
+            quality=json.get('quality'),
+            optimize_for_speed=json.get('optimizeForSpeed'),
         )
 
 
+def _parse_begin_frame(json: BeginFrameReturnsJSON) -> typing.Tuple[bool, typing.Optional[str]]:
+    return (
+        json['hasDamage'],
+        json.get('screenshotData')
+    )
+
+
 def begin_frame(
         frame_time_ticks: typing.Optional[float] = None,
         interval: typing.Optional[float] = None,
         no_display_updates: typing.Optional[bool] = None,
         screenshot: typing.Optional[ScreenshotParams] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[bool, typing.Optional[str]]]:
+    ) -> Command[BeginFrameReturnsJSON, typing.Tuple[bool, typing.Optional[str]]]:
     '''
     Sends a BeginFrame to the target and returns when the frame was completed. Optionally captures a
     screenshot from the resulting frame. Requires that the target was created with enabled
@@ -78,38 +84,39 @@ def begin_frame(
         params['noDisplayUpdates'] = no_display_updates
     if screenshot is not None:
         params['screenshot'] = screenshot.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeadlessExperimental.beginFrame',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        bool(json['hasDamage']),
-        str(json['screenshotData']) if json.get('screenshotData', None) is not None else None
-    )
+    return Command('HeadlessExperimental.beginFrame', params, _parse_begin_frame)
 
 
 @deprecated(version="1.3")
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables headless events for the target.
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeadlessExperimental.disable',
-    }
-    json = yield cmd_dict
+    return Command('HeadlessExperimental.disable')
 
 
 @deprecated(version="1.3")
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables headless events for the target.
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeadlessExperimental.enable',
-    }
-    json = yield cmd_dict
+    return Command('HeadlessExperimental.enable')
+
+
+if typing.TYPE_CHECKING:
+    class ScreenshotParamsJSON(typing.TypedDict, total=False):
+        format: str
+        quality: int
+        optimizeForSpeed: bool
+
+
+    class _BeginFrameReturnsJSON(typing.TypedDict):
+        hasDamage: bool
+
+
+    class BeginFrameReturnsJSON(_BeginFrameReturnsJSON, total=False):
+        screenshotData: str
@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import runtime
+else:
+    runtime = lazy_import('runtime', globals())
 
 
 class HeapSnapshotObjectId(str):
@@ -55,11 +57,11 @@ class SamplingHeapProfileNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileNode:
+    def from_json(cls, json: SamplingHeapProfileNodeJSON) -> SamplingHeapProfileNode:
         return cls(
             call_frame=runtime.CallFrame.from_json(json['callFrame']),
             self_size=float(json['selfSize']),
-            id_=int(json['id']),
+            id_=json['id'],
             children=[SamplingHeapProfileNode.from_json(i) for i in json['children']],
         )
 
@@ -87,10 +89,10 @@ class SamplingHeapProfileSample:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileSample:
+    def from_json(cls, json: SamplingHeapProfileSampleJSON) -> SamplingHeapProfileSample:
         return cls(
             size=float(json['size']),
-            node_id=int(json['nodeId']),
+            node_id=json['nodeId'],
             ordinal=float(json['ordinal']),
         )
 
@@ -111,7 +113,7 @@ class SamplingHeapProfile:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfile:
+    def from_json(cls, json: SamplingHeapProfileJSON) -> SamplingHeapProfile:
         return cls(
             head=SamplingHeapProfileNode.from_json(json['head']),
             samples=[SamplingHeapProfileSample.from_json(i) for i in json['samples']],
@@ -120,7 +122,7 @@ class SamplingHeapProfile:
 
 def add_inspected_heap_object(
         heap_object_id: HeapSnapshotObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables console to refer to the node with given id via $x (see Command Line API for more details
     $x functions).
@@ -128,94 +130,79 @@ def add_inspected_heap_object(
     :param heap_object_id: Heap snapshot object id to be accessible by means of $x command line API.
     '''
     params: T_JSON_DICT = dict()
-    params['heapObjectId'] = heap_object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.addInspectedHeapObject',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['heapObjectId'] = heap_object_id
+    return Command('HeapProfiler.addInspectedHeapObject', params)
 
 
-def collect_garbage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def collect_garbage() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.collectGarbage',
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.collectGarbage')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.disable',
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.enable',
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.enable')
+
+
+def _parse_get_heap_object_id(json: GetHeapObjectIdReturnsJSON) -> HeapSnapshotObjectId:
+    return HeapSnapshotObjectId(json['heapSnapshotObjectId'])
 
 
 def get_heap_object_id(
         object_id: runtime.RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,HeapSnapshotObjectId]:
+    ) -> Command[GetHeapObjectIdReturnsJSON, HeapSnapshotObjectId]:
     '''
     :param object_id: Identifier of the object to get heap object id for.
     :returns: Id of the heap snapshot object corresponding to the passed remote object id.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.getHeapObjectId',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return HeapSnapshotObjectId.from_json(json['heapSnapshotObjectId'])
+    params['objectId'] = object_id
+    return Command('HeapProfiler.getHeapObjectId', params, _parse_get_heap_object_id)
+
+
+def _parse_get_object_by_heap_object_id(json: GetObjectByHeapObjectIdReturnsJSON) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['result'])
 
 
 def get_object_by_heap_object_id(
         object_id: HeapSnapshotObjectId,
         object_group: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
+    ) -> Command[GetObjectByHeapObjectIdReturnsJSON, runtime.RemoteObject]:
     '''
     :param object_id:
     :param object_group: *(Optional)* Symbolic group name that can be used to release multiple objects.
     :returns: Evaluation result.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params['objectId'] = object_id
     if object_group is not None:
         params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.getObjectByHeapObjectId',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['result'])
+    return Command('HeapProfiler.getObjectByHeapObjectId', params, _parse_get_object_by_heap_object_id)
+
 
+def _parse_get_sampling_profile(json: GetSamplingProfileReturnsJSON) -> SamplingHeapProfile:
+    return SamplingHeapProfile.from_json(json['profile'])
 
-def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProfile]:
+
+def get_sampling_profile() -> Command[GetSamplingProfileReturnsJSON, SamplingHeapProfile]:
     '''
 
 
     :returns: Return the sampling profile being collected.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.getSamplingProfile',
-    }
-    json = yield cmd_dict
-    return SamplingHeapProfile.from_json(json['profile'])
+    return Command('HeapProfiler.getSamplingProfile', None, _parse_get_sampling_profile)
 
 
 def start_sampling(
         sampling_interval: typing.Optional[float] = None,
         include_objects_collected_by_major_gc: typing.Optional[bool] = None,
         include_objects_collected_by_minor_gc: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param sampling_interval: *(Optional)* Average sample interval in bytes. Poisson distribution is used for the intervals. The default value is 32768 bytes.
     :param include_objects_collected_by_major_gc: *(Optional)* By default, the sampling heap profiler reports only objects which are still alive when the profile is returned via getSamplingProfile or stopSampling, which is useful for determining what functions contribute the most to steady-state memory usage. This flag instructs the sampling heap profiler to also include information about objects discarded by major GC, which will show which functions cause large temporary memory usage or long GC pauses.
@@ -228,40 +215,32 @@ def start_sampling(
         params['includeObjectsCollectedByMajorGC'] = include_objects_collected_by_major_gc
     if include_objects_collected_by_minor_gc is not None:
         params['includeObjectsCollectedByMinorGC'] = include_objects_collected_by_minor_gc
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.startSampling',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.startSampling', params)
 
 
 def start_tracking_heap_objects(
         track_allocations: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param track_allocations: *(Optional)*
     '''
     params: T_JSON_DICT = dict()
     if track_allocations is not None:
         params['trackAllocations'] = track_allocations
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.startTrackingHeapObjects',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.startTrackingHeapObjects', params)
 
 
-def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProfile]:
+def _parse_stop_sampling(json: StopSamplingReturnsJSON) -> SamplingHeapProfile:
+    return SamplingHeapProfile.from_json(json['profile'])
+
+
+def stop_sampling() -> Command[StopSamplingReturnsJSON, SamplingHeapProfile]:
     '''
 
 
     :returns: Recorded sampling heap profile.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.stopSampling',
-    }
-    json = yield cmd_dict
-    return SamplingHeapProfile.from_json(json['profile'])
+    return Command('HeapProfiler.stopSampling', None, _parse_stop_sampling)
 
 
 def stop_tracking_heap_objects(
@@ -269,7 +248,7 @@ def stop_tracking_heap_objects(
         treat_global_objects_as_roots: typing.Optional[bool] = None,
         capture_numeric_value: typing.Optional[bool] = None,
         expose_internals: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param report_progress: *(Optional)* If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken when the tracking is stopped.
     :param treat_global_objects_as_roots: **(DEPRECATED)** *(Optional)* Deprecated in favor of ```exposeInternals```.
@@ -285,11 +264,7 @@ def stop_tracking_heap_objects(
         params['captureNumericValue'] = capture_numeric_value
     if expose_internals is not None:
         params['exposeInternals'] = expose_internals
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.stopTrackingHeapObjects',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.stopTrackingHeapObjects', params)
 
 
 def take_heap_snapshot(
@@ -297,7 +272,7 @@ def take_heap_snapshot(
         treat_global_objects_as_roots: typing.Optional[bool] = None,
         capture_numeric_value: typing.Optional[bool] = None,
         expose_internals: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param report_progress: *(Optional)* If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken.
     :param treat_global_objects_as_roots: **(DEPRECATED)** *(Optional)* If true, a raw snapshot without artificial roots will be generated. Deprecated in favor of ```exposeInternals```.
@@ -313,11 +288,7 @@ def take_heap_snapshot(
         params['captureNumericValue'] = capture_numeric_value
     if expose_internals is not None:
         params['exposeInternals'] = expose_internals
-    cmd_dict: T_JSON_DICT = {
-        'method': 'HeapProfiler.takeHeapSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('HeapProfiler.takeHeapSnapshot', params)
 
 
 @event_class('HeapProfiler.addHeapSnapshotChunk')
@@ -326,9 +297,9 @@ class AddHeapSnapshotChunk:
     chunk: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AddHeapSnapshotChunk:
+    def from_json(cls, json: AddHeapSnapshotChunkJSON) -> AddHeapSnapshotChunk:
         return cls(
-            chunk=str(json['chunk'])
+            chunk=json['chunk']
         )
 
 
@@ -344,9 +315,9 @@ class HeapStatsUpdate:
     stats_update: typing.List[int]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> HeapStatsUpdate:
+    def from_json(cls, json: HeapStatsUpdateJSON) -> HeapStatsUpdate:
         return cls(
-            stats_update=[int(i) for i in json['statsUpdate']]
+            stats_update=json['statsUpdate']
         )
 
 
@@ -362,9 +333,9 @@ class LastSeenObjectId:
     timestamp: float
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LastSeenObjectId:
+    def from_json(cls, json: LastSeenObjectIdJSON) -> LastSeenObjectId:
         return cls(
-            last_seen_object_id=int(json['lastSeenObjectId']),
+            last_seen_object_id=json['lastSeenObjectId'],
             timestamp=float(json['timestamp'])
         )
 
@@ -377,11 +348,11 @@ class ReportHeapSnapshotProgress:
     finished: typing.Optional[bool]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportHeapSnapshotProgress:
+    def from_json(cls, json: ReportHeapSnapshotProgressJSON) -> ReportHeapSnapshotProgress:
         return cls(
-            done=int(json['done']),
-            total=int(json['total']),
-            finished=bool(json['finished']) if json.get('finished', None) is not None else None
+            done=json['done'],
+            total=json['total'],
+            finished=json.get('finished')
         )
 
 
@@ -395,3 +366,60 @@ class ResetProfiles:
         return cls(
 
         )
+
+
+if typing.TYPE_CHECKING:
+    class SamplingHeapProfileNodeJSON(typing.TypedDict):
+        callFrame: runtime.CallFrameJSON
+        selfSize: float
+        id: int
+        children: typing.List[SamplingHeapProfileNodeJSON]
+
+
+    class SamplingHeapProfileSampleJSON(typing.TypedDict):
+        size: float
+        nodeId: int
+        ordinal: float
+
+
+    class SamplingHeapProfileJSON(typing.TypedDict):
+        head: SamplingHeapProfileNodeJSON
+        samples: typing.List[SamplingHeapProfileSampleJSON]
+
+
+    class GetHeapObjectIdReturnsJSON(typing.TypedDict):
+        heapSnapshotObjectId: str
+
+
+    class GetObjectByHeapObjectIdReturnsJSON(typing.TypedDict):
+        result: runtime.RemoteObjectJSON
+
+
+    class GetSamplingProfileReturnsJSON(typing.TypedDict):
+        profile: SamplingHeapProfileJSON
+
+
+    class StopSamplingReturnsJSON(typing.TypedDict):
+        profile: SamplingHeapProfileJSON
+
+
+    class AddHeapSnapshotChunkJSON(typing.TypedDict):
+        chunk: str
+
+
+    class HeapStatsUpdateJSON(typing.TypedDict):
+        statsUpdate: typing.List[int]
+
+
+    class LastSeenObjectIdJSON(typing.TypedDict):
+        lastSeenObjectId: int
+        timestamp: float
+
+
+    class _ReportHeapSnapshotProgressJSON(typing.TypedDict):
+        done: int
+        total: int
+
+
+    class ReportHeapSnapshotProgressJSON(_ReportHeapSnapshotProgressJSON, total=False):
+        finished: bool
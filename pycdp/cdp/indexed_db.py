@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import runtime
-from . import storage
+if typing.TYPE_CHECKING:
+    from . import runtime
+    from . import storage
+else:
+    runtime = lazy_import('runtime', globals())
+    storage = lazy_import('storage', globals())
 
 
 @dataclass
@@ -38,9 +41,9 @@ class DatabaseWithObjectStores:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DatabaseWithObjectStores:
+    def from_json(cls, json: DatabaseWithObjectStoresJSON) -> DatabaseWithObjectStores:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             version=float(json['version']),
             object_stores=[ObjectStore.from_json(i) for i in json['objectStores']],
         )
@@ -72,11 +75,11 @@ class ObjectStore:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ObjectStore:
+    def from_json(cls, json: ObjectStoreJSON) -> ObjectStore:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             key_path=KeyPath.from_json(json['keyPath']),
-            auto_increment=bool(json['autoIncrement']),
+            auto_increment=json['autoIncrement'],
             indexes=[ObjectStoreIndex.from_json(i) for i in json['indexes']],
         )
 
@@ -107,12 +110,12 @@ class ObjectStoreIndex:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ObjectStoreIndex:
+    def from_json(cls, json: ObjectStoreIndexJSON) -> ObjectStoreIndex:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             key_path=KeyPath.from_json(json['keyPath']),
-            unique=bool(json['unique']),
-            multi_entry=bool(json['multiEntry']),
+            unique=json['unique'],
+            multi_entry=json['multiEntry'],
         )
 
 
@@ -150,13 +153,13 @@ class Key:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Key:
+    def from_json(cls, json: KeyJSON) -> Key:
         return cls(
-            type_=str(json['type']),
-            number=float(json['number']) if json.get('number', None) is not None else None,
-            string=str(json['string']) if json.get('string', None) is not None else None,
-            date=float(json['date']) if json.get('date', None) is not None else None,
-            array=[Key.from_json(i) for i in json['array']] if json.get('array', None) is not None else None,
+            type_=json['type'],
+            number=float(_number) if (_number := json.get('number')) is not None else None,
+            string=json.get('string'),
+            date=float(_date) if (_date := json.get('date')) is not None else None,
+            array=[Key.from_json(i) for i in _array] if (_array := json.get('array')) is not None else None,
         )
 
 
@@ -188,12 +191,12 @@ class KeyRange:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> KeyRange:
+    def from_json(cls, json: KeyRangeJSON) -> KeyRange:
         return cls(
-            lower_open=bool(json['lowerOpen']),
-            upper_open=bool(json['upperOpen']),
-            lower=Key.from_json(json['lower']) if json.get('lower', None) is not None else None,
-            upper=Key.from_json(json['upper']) if json.get('upper', None) is not None else None,
+            lower_open=json['lowerOpen'],
+            upper_open=json['upperOpen'],
+            lower=Key.from_json(_lower) if (_lower := json.get('lower')) is not None else None,
+            upper=Key.from_json(_upper) if (_upper := json.get('upper')) is not None else None,
         )
 
 
@@ -219,7 +222,7 @@ class DataEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DataEntry:
+    def from_json(cls, json: DataEntryJSON) -> DataEntry:
         return cls(
             key=runtime.RemoteObject.from_json(json['key']),
             primary_key=runtime.RemoteObject.from_json(json['primaryKey']),
@@ -247,15 +250,15 @@ class KeyPath:
         if self.string is not None:
             json['string'] = self.string
         if self.array is not None:
-            json['array'] = [i for i in self.array]
+            json['array'] = list(self.array)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> KeyPath:
+    def from_json(cls, json: KeyPathJSON) -> KeyPath:
         return cls(
-            type_=str(json['type']),
-            string=str(json['string']) if json.get('string', None) is not None else None,
-            array=[str(i) for i in json['array']] if json.get('array', None) is not None else None,
+            type_=json['type'],
+            string=json.get('string'),
+            array=json.get('array'),
         )
 
 
@@ -265,7 +268,7 @@ def clear_object_store(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears all entries from an object store.
 
@@ -284,11 +287,7 @@ def clear_object_store(
         params['storageBucket'] = storage_bucket.to_json()
     params['databaseName'] = database_name
     params['objectStoreName'] = object_store_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.clearObjectStore',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.clearObjectStore', params)
 
 
 def delete_database(
@@ -296,7 +295,7 @@ def delete_database(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes a database.
 
@@ -313,11 +312,7 @@ def delete_database(
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
     params['databaseName'] = database_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.deleteDatabase',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.deleteDatabase', params)
 
 
 def delete_object_store_entries(
@@ -327,7 +322,7 @@ def delete_object_store_entries(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Delete a range of entries from an object store
 
@@ -348,31 +343,28 @@ def delete_object_store_entries(
     params['databaseName'] = database_name
     params['objectStoreName'] = object_store_name
     params['keyRange'] = key_range.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.deleteObjectStoreEntries',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.deleteObjectStoreEntries', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables events from backend.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.disable',
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables events from backend.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.enable',
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.enable')
+
+
+def _parse_request_data(json: RequestDataReturnsJSON) -> typing.Tuple[typing.List[DataEntry], bool]:
+    return (
+        [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
+        json['hasMore']
+    )
 
 
 def request_data(
@@ -385,7 +377,7 @@ def request_data(
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None,
         key_range: typing.Optional[KeyRange] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[DataEntry], bool]]:
+    ) -> Command[RequestDataReturnsJSON, typing.Tuple[typing.List[DataEntry], bool]]:
     '''
     Requests data from object store or index.
 
@@ -417,14 +409,13 @@ def request_data(
     params['pageSize'] = page_size
     if key_range is not None:
         params['keyRange'] = key_range.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.requestData',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('IndexedDB.requestData', params, _parse_request_data)
+
+
+def _parse_get_metadata(json: GetMetadataReturnsJSON) -> typing.Tuple[float, float]:
     return (
-        [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
-        bool(json['hasMore'])
+        float(json['entriesCount']),
+        float(json['keyGeneratorValue'])
     )
 
 
@@ -434,7 +425,7 @@ def get_metadata(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float]]:
+    ) -> Command[GetMetadataReturnsJSON, typing.Tuple[float, float]]:
     '''
     Gets metadata of an object store.
 
@@ -457,15 +448,11 @@ def get_metadata(
         params['storageBucket'] = storage_bucket.to_json()
     params['databaseName'] = database_name
     params['objectStoreName'] = object_store_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.getMetadata',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        float(json['entriesCount']),
-        float(json['keyGeneratorValue'])
-    )
+    return Command('IndexedDB.getMetadata', params, _parse_get_metadata)
+
+
+def _parse_request_database(json: RequestDatabaseReturnsJSON) -> DatabaseWithObjectStores:
+    return DatabaseWithObjectStores.from_json(json['databaseWithObjectStores'])
 
 
 def request_database(
@@ -473,7 +460,7 @@ def request_database(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,DatabaseWithObjectStores]:
+    ) -> Command[RequestDatabaseReturnsJSON, DatabaseWithObjectStores]:
     '''
     Requests database with given name in given frame.
 
@@ -491,19 +478,18 @@ def request_database(
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
     params['databaseName'] = database_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.requestDatabase',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return DatabaseWithObjectStores.from_json(json['databaseWithObjectStores'])
+    return Command('IndexedDB.requestDatabase', params, _parse_request_database)
+
+
+def _parse_request_database_names(json: RequestDatabaseNamesReturnsJSON) -> typing.List[str]:
+    return json['databaseNames']
 
 
 def request_database_names(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
         storage_bucket: typing.Optional[storage.StorageBucket] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[RequestDatabaseNamesReturnsJSON, typing.List[str]]:
     '''
     Requests database names for given security origin.
 
@@ -519,9 +505,79 @@ def request_database_names(
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IndexedDB.requestDatabaseNames',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['databaseNames']]
+    return Command('IndexedDB.requestDatabaseNames', params, _parse_request_database_names)
+
+
+if typing.TYPE_CHECKING:
+    class DatabaseWithObjectStoresJSON(typing.TypedDict):
+        name: str
+        version: float
+        objectStores: typing.List[ObjectStoreJSON]
+
+
+    class ObjectStoreJSON(typing.TypedDict):
+        name: str
+        keyPath: KeyPathJSON
+        autoIncrement: bool
+        indexes: typing.List[ObjectStoreIndexJSON]
+
+
+    class ObjectStoreIndexJSON(typing.TypedDict):
+        name: str
+        keyPath: KeyPathJSON
+        unique: bool
+        multiEntry: bool
+
+
+    class _KeyJSON(typing.TypedDict):
+        type: str
+
+
+    class KeyJSON(_KeyJSON, total=False):
+        number: float
+        string: str
+        date: float
+        array: typing.List[KeyJSON]
+
+
+    class _KeyRangeJSON(typing.TypedDict):
+        lowerOpen: bool
+        upperOpen: bool
+
+
+    class KeyRangeJSON(_KeyRangeJSON, total=False):
+        lower: KeyJSON
+        upper: KeyJSON
+
+
+    class DataEntryJSON(typing.TypedDict):
+        key: runtime.RemoteObjectJSON
+        primaryKey: runtime.RemoteObjectJSON
+        value: runtime.RemoteObjectJSON
+
+
+    class _KeyPathJSON(typing.TypedDict):
+        type: str
+
+
+    class KeyPathJSON(_KeyPathJSON, total=False):
+        string: str
+        array: typing.List[str]
+
+
+    class RequestDataReturnsJSON(typing.TypedDict):
+        objectStoreDataEntries: typing.List[DataEntryJSON]
+        hasMore: bool
+
+
+    class GetMetadataReturnsJSON(typing.TypedDict):
+        entriesCount: float
+        keyGeneratorValue: float
+
+
+    class RequestDatabaseReturnsJSON(typing.TypedDict):
+        databaseWithObjectStores: DatabaseWithObjectStoresJSON
+
+
+    class RequestDatabaseNamesReturnsJSON(typing.TypedDict):
+        databaseNames: typing.List[str]
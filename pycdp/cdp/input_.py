@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -73,19 +72,19 @@ class TouchPoint:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TouchPoint:
+    def from_json(cls, json: TouchPointJSON) -> TouchPoint:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
-            radius_x=float(json['radiusX']) if json.get('radiusX', None) is not None else None,
-            radius_y=float(json['radiusY']) if json.get('radiusY', None) is not None else None,
-            rotation_angle=float(json['rotationAngle']) if json.get('rotationAngle', None) is not None else None,
-            force=float(json['force']) if json.get('force', None) is not None else None,
-            tangential_pressure=float(json['tangentialPressure']) if json.get('tangentialPressure', None) is not None else None,
-            tilt_x=float(json['tiltX']) if json.get('tiltX', None) is not None else None,
-            tilt_y=float(json['tiltY']) if json.get('tiltY', None) is not None else None,
-            twist=int(json['twist']) if json.get('twist', None) is not None else None,
-            id_=float(json['id']) if json.get('id', None) is not None else None,
+            radius_x=float(_radius_x) if (_radius_x := json.get('radiusX')) is not None else None,
+            radius_y=float(_radius_y) if (_radius_y := json.get('radiusY')) is not None else None,
+            rotation_angle=float(_rotation_angle) if (_rotation_angle := json.get('rotationAngle')) is not None else None,
+            force=float(_force) if (_force := json.get('force')) is not None else None,
+            tangential_pressure=float(_tangential_pressure) if (_tangential_pressure := json.get('tangentialPressure')) is not None else None,
+            tilt_x=float(_tilt_x) if (_tilt_x := json.get('tiltX')) is not None else None,
+            tilt_y=float(_tilt_y) if (_tilt_y := json.get('tiltY')) is not None else None,
+            twist=json.get('twist'),
+            id_=float(_id_) if (_id_ := json.get('id')) is not None else None,
         )
 
 
@@ -99,7 +98,10 @@ class GestureSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GestureSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class MouseButton(enum.Enum):
@@ -115,7 +117,10 @@ class MouseButton(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MouseButton:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class TimeSinceEpoch(float):
@@ -160,12 +165,12 @@ class DragDataItem:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DragDataItem:
+    def from_json(cls, json: DragDataItemJSON) -> DragDataItem:
         return cls(
-            mime_type=str(json['mimeType']),
-            data=str(json['data']),
-            title=str(json['title']) if json.get('title', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
+            mime_type=json['mimeType'],
+            data=json['data'],
+            title=json.get('title'),
+            base_url=json.get('baseURL'),
         )
 
 
@@ -184,15 +189,15 @@ class DragData:
         json['items'] = [i.to_json() for i in self.items]
         json['dragOperationsMask'] = self.drag_operations_mask
         if self.files is not None:
-            json['files'] = [i for i in self.files]
+            json['files'] = list(self.files)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DragData:
+    def from_json(cls, json: DragDataJSON) -> DragData:
         return cls(
             items=[DragDataItem.from_json(i) for i in json['items']],
-            drag_operations_mask=int(json['dragOperationsMask']),
-            files=[str(i) for i in json['files']] if json.get('files', None) is not None else None,
+            drag_operations_mask=json['dragOperationsMask'],
+            files=json.get('files'),
         )
 
 
@@ -202,7 +207,7 @@ def dispatch_drag_event(
         y: float,
         data: DragData,
         modifiers: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Dispatches a drag event into the page.
 
@@ -221,11 +226,7 @@ def dispatch_drag_event(
     params['data'] = data.to_json()
     if modifiers is not None:
         params['modifiers'] = modifiers
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.dispatchDragEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.dispatchDragEvent', params)
 
 
 def dispatch_key_event(
@@ -244,7 +245,7 @@ def dispatch_key_event(
         is_system_key: typing.Optional[bool] = None,
         location: typing.Optional[int] = None,
         commands: typing.Optional[typing.List[str]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Dispatches a key event to the page.
 
@@ -269,7 +270,7 @@ def dispatch_key_event(
     if modifiers is not None:
         params['modifiers'] = modifiers
     if timestamp is not None:
-        params['timestamp'] = timestamp.to_json()
+        params['timestamp'] = timestamp
     if text is not None:
         params['text'] = text
     if unmodified_text is not None:
@@ -293,17 +294,13 @@ def dispatch_key_event(
     if location is not None:
         params['location'] = location
     if commands is not None:
-        params['commands'] = [i for i in commands]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.dispatchKeyEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['commands'] = list(commands)
+    return Command('Input.dispatchKeyEvent', params)
 
 
 def insert_text(
         text: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     This method emulates inserting text that doesn't come from a key press,
     for example an emoji keyboard or an IME.
@@ -314,11 +311,7 @@ def insert_text(
     '''
     params: T_JSON_DICT = dict()
     params['text'] = text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.insertText',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.insertText', params)
 
 
 def ime_set_composition(
@@ -327,7 +320,7 @@ def ime_set_composition(
         selection_end: int,
         replacement_start: typing.Optional[int] = None,
         replacement_end: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     This method sets the current candidate text for IME.
     Use imeCommitComposition to commit the final text.
@@ -349,11 +342,7 @@ def ime_set_composition(
         params['replacementStart'] = replacement_start
     if replacement_end is not None:
         params['replacementEnd'] = replacement_end
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.imeSetComposition',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.imeSetComposition', params)
 
 
 def dispatch_mouse_event(
@@ -373,7 +362,7 @@ def dispatch_mouse_event(
         delta_x: typing.Optional[float] = None,
         delta_y: typing.Optional[float] = None,
         pointer_type: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Dispatches a mouse event to the page.
 
@@ -401,9 +390,9 @@ def dispatch_mouse_event(
     if modifiers is not None:
         params['modifiers'] = modifiers
     if timestamp is not None:
-        params['timestamp'] = timestamp.to_json()
+        params['timestamp'] = timestamp
     if button is not None:
-        params['button'] = button.to_json()
+        params['button'] = button.value
     if buttons is not None:
         params['buttons'] = buttons
     if click_count is not None:
@@ -424,11 +413,7 @@ def dispatch_mouse_event(
         params['deltaY'] = delta_y
     if pointer_type is not None:
         params['pointerType'] = pointer_type
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.dispatchMouseEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.dispatchMouseEvent', params)
 
 
 def dispatch_touch_event(
@@ -436,7 +421,7 @@ def dispatch_touch_event(
         touch_points: typing.List[TouchPoint],
         modifiers: typing.Optional[int] = None,
         timestamp: typing.Optional[TimeSinceEpoch] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Dispatches a touch event to the page.
 
@@ -451,22 +436,15 @@ def dispatch_touch_event(
     if modifiers is not None:
         params['modifiers'] = modifiers
     if timestamp is not None:
-        params['timestamp'] = timestamp.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.dispatchTouchEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['timestamp'] = timestamp
+    return Command('Input.dispatchTouchEvent', params)
 
 
-def cancel_dragging() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def cancel_dragging() -> Command[T_JSON_DICT, None]:
     '''
     Cancels any active dragging in the page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.cancelDragging',
-    }
-    json = yield cmd_dict
+    return Command('Input.cancelDragging')
 
 
 def emulate_touch_from_mouse_event(
@@ -479,7 +457,7 @@ def emulate_touch_from_mouse_event(
         delta_y: typing.Optional[float] = None,
         modifiers: typing.Optional[int] = None,
         click_count: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Emulates touch event from the mouse event parameters.
 
@@ -499,9 +477,9 @@ def emulate_touch_from_mouse_event(
     params['type'] = type_
     params['x'] = x
     params['y'] = y
-    params['button'] = button.to_json()
+    params['button'] = button.value
     if timestamp is not None:
-        params['timestamp'] = timestamp.to_json()
+        params['timestamp'] = timestamp
     if delta_x is not None:
         params['deltaX'] = delta_x
     if delta_y is not None:
@@ -510,16 +488,12 @@ def emulate_touch_from_mouse_event(
         params['modifiers'] = modifiers
     if click_count is not None:
         params['clickCount'] = click_count
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.emulateTouchFromMouseEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.emulateTouchFromMouseEvent', params)
 
 
 def set_ignore_input_events(
         ignore: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Ignores input events (useful while auditing page).
 
@@ -527,16 +501,12 @@ def set_ignore_input_events(
     '''
     params: T_JSON_DICT = dict()
     params['ignore'] = ignore
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.setIgnoreInputEvents',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.setIgnoreInputEvents', params)
 
 
 def set_intercept_drags(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Prevents default drag and drop behavior and instead emits ``Input.dragIntercepted`` events.
     Drag and drop behavior can be directly controlled via ``Input.dispatchDragEvent``.
@@ -547,11 +517,7 @@ def set_intercept_drags(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.setInterceptDrags',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.setInterceptDrags', params)
 
 
 def synthesize_pinch_gesture(
@@ -560,7 +526,7 @@ def synthesize_pinch_gesture(
         scale_factor: float,
         relative_speed: typing.Optional[int] = None,
         gesture_source_type: typing.Optional[GestureSourceType] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Synthesizes a pinch gesture over a time period by issuing appropriate touch events.
 
@@ -579,12 +545,8 @@ def synthesize_pinch_gesture(
     if relative_speed is not None:
         params['relativeSpeed'] = relative_speed
     if gesture_source_type is not None:
-        params['gestureSourceType'] = gesture_source_type.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.synthesizePinchGesture',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['gestureSourceType'] = gesture_source_type.value
+    return Command('Input.synthesizePinchGesture', params)
 
 
 def synthesize_scroll_gesture(
@@ -600,7 +562,7 @@ def synthesize_scroll_gesture(
         repeat_count: typing.Optional[int] = None,
         repeat_delay_ms: typing.Optional[int] = None,
         interaction_marker_name: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Synthesizes a scroll gesture over a time period by issuing appropriate touch events.
 
@@ -635,18 +597,14 @@ def synthesize_scroll_gesture(
     if speed is not None:
         params['speed'] = speed
     if gesture_source_type is not None:
-        params['gestureSourceType'] = gesture_source_type.to_json()
+        params['gestureSourceType'] = gesture_source_type.value
     if repeat_count is not None:
         params['repeatCount'] = repeat_count
     if repeat_delay_ms is not None:
         params['repeatDelayMs'] = repeat_delay_ms
     if interaction_marker_name is not None:
         params['interactionMarkerName'] = interaction_marker_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.synthesizeScrollGesture',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Input.synthesizeScrollGesture', params)
 
 
 def synthesize_tap_gesture(
@@ -655,7 +613,7 @@ def synthesize_tap_gesture(
         duration: typing.Optional[int] = None,
         tap_count: typing.Optional[int] = None,
         gesture_source_type: typing.Optional[GestureSourceType] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Synthesizes a tap gesture over a time period by issuing appropriate touch events.
 
@@ -675,12 +633,8 @@ def synthesize_tap_gesture(
     if tap_count is not None:
         params['tapCount'] = tap_count
     if gesture_source_type is not None:
-        params['gestureSourceType'] = gesture_source_type.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Input.synthesizeTapGesture',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['gestureSourceType'] = gesture_source_type.value
+    return Command('Input.synthesizeTapGesture', params)
 
 
 @event_class('Input.dragIntercepted')
@@ -695,7 +649,48 @@ class DragIntercepted:
     data: DragData
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DragIntercepted:
+    def from_json(cls, json: DragInterceptedJSON) -> DragIntercepted:
         return cls(
             data=DragData.from_json(json['data'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _TouchPointJSON(typing.TypedDict):
+        x: float
+        y: float
+
+
+    class TouchPointJSON(_TouchPointJSON, total=False):
+        radiusX: float
+        radiusY: float
+        rotationAngle: float
+        force: float
+        tangentialPressure: float
+        tiltX: float
+        tiltY: float
+        twist: int
+        id: float
+
+
+    class _DragDataItemJSON(typing.TypedDict):
+        mimeType: str
+        data: str
+
+
+    class DragDataItemJSON(_DragDataItemJSON, total=False):
+        title: str
+        baseURL: str
+
+
+    class _DragDataJSON(typing.TypedDict):
+        items: typing.List[DragDataItemJSON]
+        dragOperationsMask: int
+
+
+    class DragDataJSON(_DragDataJSON, total=False):
+        files: typing.List[str]
+
+
+    class DragInterceptedJSON(typing.TypedDict):
+        data: DragDataJSON
@@ -8,28 +8,21 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables inspector domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Inspector.disable',
-    }
-    json = yield cmd_dict
+    return Command('Inspector.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables inspector domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Inspector.enable',
-    }
-    json = yield cmd_dict
+    return Command('Inspector.enable')
 
 
 @event_class('Inspector.detached')
@@ -42,9 +35,9 @@ class Detached:
     reason: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Detached:
+    def from_json(cls, json: DetachedJSON) -> Detached:
         return cls(
-            reason=str(json['reason'])
+            reason=json['reason']
         )
 
 
@@ -76,3 +69,8 @@ class TargetReloadedAfterCrash:
         return cls(
 
         )
+
+
+if typing.TYPE_CHECKING:
+    class DetachedJSON(typing.TypedDict):
+        reason: str
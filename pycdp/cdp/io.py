@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import runtime
+else:
+    runtime = lazy_import('runtime', globals())
 
 
 class StreamHandle(str):
@@ -32,26 +34,30 @@ class StreamHandle(str):
 
 def close(
         handle: StreamHandle
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Close the stream, discard any temporary backing storage.
 
     :param handle: Handle of the stream to close.
     '''
     params: T_JSON_DICT = dict()
-    params['handle'] = handle.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IO.close',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['handle'] = handle
+    return Command('IO.close', params)
+
+
+def _parse_read(json: ReadReturnsJSON) -> typing.Tuple[typing.Optional[bool], str, bool]:
+    return (
+        json.get('base64Encoded'),
+        json['data'],
+        json['eof']
+    )
 
 
 def read(
         handle: StreamHandle,
         offset: typing.Optional[int] = None,
         size: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[bool], str, bool]]:
+    ) -> Command[ReadReturnsJSON, typing.Tuple[typing.Optional[bool], str, bool]]:
     '''
     Read a chunk of the stream
 
@@ -65,26 +71,21 @@ def read(
         2. **eof** - Set if the end-of-file condition occurred while reading.
     '''
     params: T_JSON_DICT = dict()
-    params['handle'] = handle.to_json()
+    params['handle'] = handle
     if offset is not None:
         params['offset'] = offset
     if size is not None:
         params['size'] = size
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IO.read',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        bool(json['base64Encoded']) if json.get('base64Encoded', None) is not None else None,
-        str(json['data']),
-        bool(json['eof'])
-    )
+    return Command('IO.read', params, _parse_read)
+
+
+def _parse_resolve_blob(json: ResolveBlobReturnsJSON) -> str:
+    return json['uuid']
 
 
 def resolve_blob(
         object_id: runtime.RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[ResolveBlobReturnsJSON, str]:
     '''
     Return UUID of Blob object specified by a remote object id.
 
@@ -92,10 +93,19 @@ def resolve_blob(
     :returns: UUID of the specified Blob.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'IO.resolveBlob',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['uuid'])
+    params['objectId'] = object_id
+    return Command('IO.resolveBlob', params, _parse_resolve_blob)
+
+
+if typing.TYPE_CHECKING:
+    class _ReadReturnsJSON(typing.TypedDict):
+        data: str
+        eof: bool
+
+
+    class ReadReturnsJSON(_ReadReturnsJSON, total=False):
+        base64Encoded: bool
+
+
+    class ResolveBlobReturnsJSON(typing.TypedDict):
+        uuid: str
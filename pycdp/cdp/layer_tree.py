@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
+if typing.TYPE_CHECKING:
+    from . import dom
+else:
+    dom = lazy_import('dom', globals())
 
 
 class LayerId(str):
@@ -62,10 +64,10 @@ class ScrollRect:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScrollRect:
+    def from_json(cls, json: ScrollRectJSON) -> ScrollRect:
         return cls(
             rect=dom.Rect.from_json(json['rect']),
-            type_=str(json['type']),
+            type_=json['type'],
         )
 
 
@@ -91,18 +93,18 @@ class StickyPositionConstraint:
         json['stickyBoxRect'] = self.sticky_box_rect.to_json()
         json['containingBlockRect'] = self.containing_block_rect.to_json()
         if self.nearest_layer_shifting_sticky_box is not None:
-            json['nearestLayerShiftingStickyBox'] = self.nearest_layer_shifting_sticky_box.to_json()
+            json['nearestLayerShiftingStickyBox'] = self.nearest_layer_shifting_sticky_box
         if self.nearest_layer_shifting_containing_block is not None:
-            json['nearestLayerShiftingContainingBlock'] = self.nearest_layer_shifting_containing_block.to_json()
+            json['nearestLayerShiftingContainingBlock'] = self.nearest_layer_shifting_containing_block
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StickyPositionConstraint:
+    def from_json(cls, json: StickyPositionConstraintJSON) -> StickyPositionConstraint:
         return cls(
             sticky_box_rect=dom.Rect.from_json(json['stickyBoxRect']),
             containing_block_rect=dom.Rect.from_json(json['containingBlockRect']),
-            nearest_layer_shifting_sticky_box=LayerId.from_json(json['nearestLayerShiftingStickyBox']) if json.get('nearestLayerShiftingStickyBox', None) is not None else None,
-            nearest_layer_shifting_containing_block=LayerId.from_json(json['nearestLayerShiftingContainingBlock']) if json.get('nearestLayerShiftingContainingBlock', None) is not None else None,
+            nearest_layer_shifting_sticky_box=LayerId(_nearest_layer_shifting_sticky_box) if (_nearest_layer_shifting_sticky_box := json.get('nearestLayerShiftingStickyBox')) is not None else None,
+            nearest_layer_shifting_containing_block=LayerId(_nearest_layer_shifting_containing_block) if (_nearest_layer_shifting_containing_block := json.get('nearestLayerShiftingContainingBlock')) is not None else None,
         )
 
 
@@ -128,11 +130,11 @@ class PictureTile:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PictureTile:
+    def from_json(cls, json: PictureTileJSON) -> PictureTile:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
-            picture=str(json['picture']),
+            picture=json['picture'],
         )
 
 
@@ -192,7 +194,7 @@ class Layer:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['layerId'] = self.layer_id.to_json()
+        json['layerId'] = self.layer_id
         json['offsetX'] = self.offset_x
         json['offsetY'] = self.offset_y
         json['width'] = self.width
@@ -200,11 +202,11 @@ class Layer:
         json['paintCount'] = self.paint_count
         json['drawsContent'] = self.draws_content
         if self.parent_layer_id is not None:
-            json['parentLayerId'] = self.parent_layer_id.to_json()
+            json['parentLayerId'] = self.parent_layer_id
         if self.backend_node_id is not None:
-            json['backendNodeId'] = self.backend_node_id.to_json()
+            json['backendNodeId'] = self.backend_node_id
         if self.transform is not None:
-            json['transform'] = [i for i in self.transform]
+            json['transform'] = list(self.transform)
         if self.anchor_x is not None:
             json['anchorX'] = self.anchor_x
         if self.anchor_y is not None:
@@ -220,24 +222,24 @@ class Layer:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Layer:
+    def from_json(cls, json: LayerJSON) -> Layer:
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
+            layer_id=LayerId(json['layerId']),
             offset_x=float(json['offsetX']),
             offset_y=float(json['offsetY']),
             width=float(json['width']),
             height=float(json['height']),
-            paint_count=int(json['paintCount']),
-            draws_content=bool(json['drawsContent']),
-            parent_layer_id=LayerId.from_json(json['parentLayerId']) if json.get('parentLayerId', None) is not None else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            transform=[float(i) for i in json['transform']] if json.get('transform', None) is not None else None,
-            anchor_x=float(json['anchorX']) if json.get('anchorX', None) is not None else None,
-            anchor_y=float(json['anchorY']) if json.get('anchorY', None) is not None else None,
-            anchor_z=float(json['anchorZ']) if json.get('anchorZ', None) is not None else None,
-            invisible=bool(json['invisible']) if json.get('invisible', None) is not None else None,
-            scroll_rects=[ScrollRect.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
-            sticky_position_constraint=StickyPositionConstraint.from_json(json['stickyPositionConstraint']) if json.get('stickyPositionConstraint', None) is not None else None,
+            paint_count=json['paintCount'],
+            draws_content=json['drawsContent'],
+            parent_layer_id=LayerId(_parent_layer_id) if (_parent_layer_id := json.get('parentLayerId')) is not None else None,
+            backend_node_id=dom.BackendNodeId(_backend_node_id) if (_backend_node_id := json.get('backendNodeId')) is not None else None,
+            transform=[float(i) for i in _transform] if (_transform := json.get('transform')) is not None else None,
+            anchor_x=float(_anchor_x) if (_anchor_x := json.get('anchorX')) is not None else None,
+            anchor_y=float(_anchor_y) if (_anchor_y := json.get('anchorY')) is not None else None,
+            anchor_z=float(_anchor_z) if (_anchor_z := json.get('anchorZ')) is not None else None,
+            invisible=json.get('invisible'),
+            scroll_rects=[ScrollRect.from_json(i) for i in _scroll_rects] if (_scroll_rects := json.get('scrollRects')) is not None else None,
+            sticky_position_constraint=StickyPositionConstraint.from_json(_sticky_position_constraint) if (_sticky_position_constraint := json.get('stickyPositionConstraint')) is not None else None,
         )
 
 
@@ -256,9 +258,16 @@ class PaintProfile(list):
         return 'PaintProfile({})'.format(super().__repr__())
 
 
+def _parse_compositing_reasons(json: CompositingReasonsReturnsJSON) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    return (
+        json['compositingReasons'],
+        json['compositingReasonIds']
+    )
+
+
 def compositing_reasons(
         layer_id: LayerId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[str], typing.List[str]]]:
+    ) -> Command[CompositingReasonsReturnsJSON, typing.Tuple[typing.List[str], typing.List[str]]]:
     '''
     Provides the reasons why the given layer was composited.
 
@@ -269,41 +278,31 @@ def compositing_reasons(
         1. **compositingReasonIds** - A list of strings specifying reason IDs for the given layer to become composited.
     '''
     params: T_JSON_DICT = dict()
-    params['layerId'] = layer_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.compositingReasons',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [str(i) for i in json['compositingReasons']],
-        [str(i) for i in json['compositingReasonIds']]
-    )
+    params['layerId'] = layer_id
+    return Command('LayerTree.compositingReasons', params, _parse_compositing_reasons)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables compositing tree inspection.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.disable',
-    }
-    json = yield cmd_dict
+    return Command('LayerTree.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables compositing tree inspection.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.enable',
-    }
-    json = yield cmd_dict
+    return Command('LayerTree.enable')
+
+
+def _parse_load_snapshot(json: LoadSnapshotReturnsJSON) -> SnapshotId:
+    return SnapshotId(json['snapshotId'])
 
 
 def load_snapshot(
         tiles: typing.List[PictureTile]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SnapshotId]:
+    ) -> Command[LoadSnapshotReturnsJSON, SnapshotId]:
     '''
     Returns the snapshot identifier.
 
@@ -312,17 +311,16 @@ def load_snapshot(
     '''
     params: T_JSON_DICT = dict()
     params['tiles'] = [i.to_json() for i in tiles]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.loadSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SnapshotId.from_json(json['snapshotId'])
+    return Command('LayerTree.loadSnapshot', params, _parse_load_snapshot)
+
+
+def _parse_make_snapshot(json: MakeSnapshotReturnsJSON) -> SnapshotId:
+    return SnapshotId(json['snapshotId'])
 
 
 def make_snapshot(
         layer_id: LayerId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SnapshotId]:
+    ) -> Command[MakeSnapshotReturnsJSON, SnapshotId]:
     '''
     Returns the layer snapshot identifier.
 
@@ -330,13 +328,12 @@ def make_snapshot(
     :returns: The id of the layer snapshot.
     '''
     params: T_JSON_DICT = dict()
-    params['layerId'] = layer_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.makeSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SnapshotId.from_json(json['snapshotId'])
+    params['layerId'] = layer_id
+    return Command('LayerTree.makeSnapshot', params, _parse_make_snapshot)
+
+
+def _parse_profile_snapshot(json: ProfileSnapshotReturnsJSON) -> typing.List[PaintProfile]:
+    return [PaintProfile(i) for i in json['timings']]
 
 
 def profile_snapshot(
@@ -344,7 +341,7 @@ def profile_snapshot(
         min_repeat_count: typing.Optional[int] = None,
         min_duration: typing.Optional[float] = None,
         clip_rect: typing.Optional[dom.Rect] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PaintProfile]]:
+    ) -> Command[ProfileSnapshotReturnsJSON, typing.List[PaintProfile]]:
     '''
     :param snapshot_id: The id of the layer snapshot.
     :param min_repeat_count: *(Optional)* The maximum number of times to replay the snapshot (1, if not specified).
@@ -353,36 +350,31 @@ def profile_snapshot(
     :returns: The array of paint profiles, one per run.
     '''
     params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
+    params['snapshotId'] = snapshot_id
     if min_repeat_count is not None:
         params['minRepeatCount'] = min_repeat_count
     if min_duration is not None:
         params['minDuration'] = min_duration
     if clip_rect is not None:
         params['clipRect'] = clip_rect.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.profileSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [PaintProfile.from_json(i) for i in json['timings']]
+    return Command('LayerTree.profileSnapshot', params, _parse_profile_snapshot)
 
 
 def release_snapshot(
         snapshot_id: SnapshotId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Releases layer snapshot captured by the back-end.
 
     :param snapshot_id: The id of the layer snapshot.
     '''
     params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.releaseSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['snapshotId'] = snapshot_id
+    return Command('LayerTree.releaseSnapshot', params)
+
+
+def _parse_replay_snapshot(json: ReplaySnapshotReturnsJSON) -> str:
+    return json['dataURL']
 
 
 def replay_snapshot(
@@ -390,7 +382,7 @@ def replay_snapshot(
         from_step: typing.Optional[int] = None,
         to_step: typing.Optional[int] = None,
         scale: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[ReplaySnapshotReturnsJSON, str]:
     '''
     Replays the layer snapshot and returns the resulting bitmap.
 
@@ -401,24 +393,23 @@ def replay_snapshot(
     :returns: A data: URL for resulting image.
     '''
     params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
+    params['snapshotId'] = snapshot_id
     if from_step is not None:
         params['fromStep'] = from_step
     if to_step is not None:
         params['toStep'] = to_step
     if scale is not None:
         params['scale'] = scale
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.replaySnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['dataURL'])
+    return Command('LayerTree.replaySnapshot', params, _parse_replay_snapshot)
+
+
+def _parse_snapshot_command_log(json: SnapshotCommandLogReturnsJSON) -> typing.List[dict]:
+    return json['commandLog']
 
 
 def snapshot_command_log(
         snapshot_id: SnapshotId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[dict]]:
+    ) -> Command[SnapshotCommandLogReturnsJSON, typing.List[dict]]:
     '''
     Replays the layer snapshot and returns canvas log.
 
@@ -426,13 +417,8 @@ def snapshot_command_log(
     :returns: The array of canvas function calls.
     '''
     params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'LayerTree.snapshotCommandLog',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [dict(i) for i in json['commandLog']]
+    params['snapshotId'] = snapshot_id
+    return Command('LayerTree.snapshotCommandLog', params, _parse_snapshot_command_log)
 
 
 @event_class('LayerTree.layerPainted')
@@ -444,9 +430,9 @@ class LayerPainted:
     clip: dom.Rect
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayerPainted:
+    def from_json(cls, json: LayerPaintedJSON) -> LayerPainted:
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
+            layer_id=LayerId(json['layerId']),
             clip=dom.Rect.from_json(json['clip'])
         )
 
@@ -458,7 +444,85 @@ class LayerTreeDidChange:
     layers: typing.Optional[typing.List[Layer]]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayerTreeDidChange:
+    def from_json(cls, json: LayerTreeDidChangeJSON) -> LayerTreeDidChange:
         return cls(
-            layers=[Layer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None
+            layers=[Layer.from_json(i) for i in _layers] if (_layers := json.get('layers')) is not None else None
         )
+
+
+if typing.TYPE_CHECKING:
+    class ScrollRectJSON(typing.TypedDict):
+        rect: dom.RectJSON
+        type: str
+
+
+    class _StickyPositionConstraintJSON(typing.TypedDict):
+        stickyBoxRect: dom.RectJSON
+        containingBlockRect: dom.RectJSON
+
+
+    class StickyPositionConstraintJSON(_StickyPositionConstraintJSON, total=False):
+        nearestLayerShiftingStickyBox: str
+        nearestLayerShiftingContainingBlock: str
+
+
+    class PictureTileJSON(typing.TypedDict):
+        x: float
+        y: float
+        picture: str
+
+
+    class _LayerJSON(typing.TypedDict):
+        layerId: str
+        offsetX: float
+        offsetY: float
+        width: float
+        height: float
+        paintCount: int
+        drawsContent: bool
+
+
+    class LayerJSON(_LayerJSON, total=False):
+        parentLayerId: str
+        backendNodeId: int
+        transform: typing.List[float]
+        anchorX: float
+        anchorY: float
+        anchorZ: float
+        invisible: bool
+        scrollRects: typing.List[ScrollRectJSON]
+        stickyPositionConstraint: StickyPositionConstraintJSON
+
+
+    class CompositingReasonsReturnsJSON(typing.TypedDict):
+        compositingReasons: typing.List[str]
+        compositingReasonIds: typing.List[str]
+
+
+    class LoadSnapshotReturnsJSON(typing.TypedDict):
+        snapshotId: str
+
+
+    class MakeSnapshotReturnsJSON(typing.TypedDict):
+        snapshotId: str
+
+
+    class ProfileSnapshotReturnsJSON(typing.TypedDict):
+        timings: typing.List[typing.List[float]]
+
+
+    class ReplaySnapshotReturnsJSON(typing.TypedDict):
+        dataURL: str
+
+
+    class SnapshotCommandLogReturnsJSON(typing.TypedDict):
+        commandLog: typing.List[dict]
+
+
+    class LayerPaintedJSON(typing.TypedDict):
+        layerId: str
+        clip: dom.RectJSON
+
+
+    class LayerTreeDidChangeJSON(typing.TypedDict, total=False):
+        layers: typing.List[LayerJSON]
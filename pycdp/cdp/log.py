@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import network
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import network
+    from . import runtime
+else:
+    network = lazy_import('network', globals())
+    runtime = lazy_import('runtime', globals())
 
 
 @dataclass
@@ -57,7 +60,7 @@ class LogEntry:
         json['source'] = self.source
         json['level'] = self.level
         json['text'] = self.text
-        json['timestamp'] = self.timestamp.to_json()
+        json['timestamp'] = self.timestamp
         if self.category is not None:
             json['category'] = self.category
         if self.url is not None:
@@ -67,7 +70,7 @@ class LogEntry:
         if self.stack_trace is not None:
             json['stackTrace'] = self.stack_trace.to_json()
         if self.network_request_id is not None:
-            json['networkRequestId'] = self.network_request_id.to_json()
+            json['networkRequestId'] = self.network_request_id
         if self.worker_id is not None:
             json['workerId'] = self.worker_id
         if self.args is not None:
@@ -75,19 +78,19 @@ class LogEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LogEntry:
+    def from_json(cls, json: LogEntryJSON) -> LogEntry:
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            timestamp=runtime.Timestamp.from_json(json['timestamp']),
-            category=str(json['category']) if json.get('category', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line_number=int(json['lineNumber']) if json.get('lineNumber', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            network_request_id=network.RequestId.from_json(json['networkRequestId']) if json.get('networkRequestId', None) is not None else None,
-            worker_id=str(json['workerId']) if json.get('workerId', None) is not None else None,
-            args=[runtime.RemoteObject.from_json(i) for i in json['args']] if json.get('args', None) is not None else None,
+            source=json['source'],
+            level=json['level'],
+            text=json['text'],
+            timestamp=runtime.Timestamp(json['timestamp']),
+            category=json.get('category'),
+            url=json.get('url'),
+            line_number=json.get('lineNumber'),
+            stack_trace=runtime.StackTrace.from_json(_stack_trace) if (_stack_trace := json.get('stackTrace')) is not None else None,
+            network_request_id=network.RequestId(_network_request_id) if (_network_request_id := json.get('networkRequestId')) is not None else None,
+            worker_id=json.get('workerId'),
+            args=[runtime.RemoteObject.from_json(i) for i in _args] if (_args := json.get('args')) is not None else None,
         )
 
 
@@ -109,47 +112,38 @@ class ViolationSetting:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ViolationSetting:
+    def from_json(cls, json: ViolationSettingJSON) -> ViolationSetting:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             threshold=float(json['threshold']),
         )
 
 
-def clear() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear() -> Command[T_JSON_DICT, None]:
     '''
     Clears the log.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Log.clear',
-    }
-    json = yield cmd_dict
+    return Command('Log.clear')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables log domain, prevents further log entries from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Log.disable',
-    }
-    json = yield cmd_dict
+    return Command('Log.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables log domain, sends the entries collected so far to the client by means of the
     ``entryAdded`` notification.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Log.enable',
-    }
-    json = yield cmd_dict
+    return Command('Log.enable')
 
 
 def start_violations_report(
         config: typing.List[ViolationSetting]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     start violation reporting.
 
@@ -157,21 +151,14 @@ def start_violations_report(
     '''
     params: T_JSON_DICT = dict()
     params['config'] = [i.to_json() for i in config]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Log.startViolationsReport',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Log.startViolationsReport', params)
 
 
-def stop_violations_report() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_violations_report() -> Command[T_JSON_DICT, None]:
     '''
     Stop violation reporting.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Log.stopViolationsReport',
-    }
-    json = yield cmd_dict
+    return Command('Log.stopViolationsReport')
 
 
 @event_class('Log.entryAdded')
@@ -184,7 +171,34 @@ class EntryAdded:
     entry: LogEntry
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> EntryAdded:
+    def from_json(cls, json: EntryAddedJSON) -> EntryAdded:
         return cls(
             entry=LogEntry.from_json(json['entry'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _LogEntryJSON(typing.TypedDict):
+        source: str
+        level: str
+        text: str
+        timestamp: float
+
+
+    class LogEntryJSON(_LogEntryJSON, total=False):
+        category: str
+        url: str
+        lineNumber: int
+        stackTrace: runtime.StackTraceJSON
+        networkRequestId: str
+        workerId: str
+        args: typing.List[runtime.RemoteObjectJSON]
+
+
+    class ViolationSettingJSON(typing.TypedDict):
+        name: str
+        threshold: float
+
+
+    class EntryAddedJSON(typing.TypedDict):
+        entry: LogEntryJSON
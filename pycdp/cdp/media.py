@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class PlayerId(str):
@@ -65,10 +64,10 @@ class PlayerMessage:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerMessage:
+    def from_json(cls, json: PlayerMessageJSON) -> PlayerMessage:
         return cls(
-            level=str(json['level']),
-            message=str(json['message']),
+            level=json['level'],
+            message=json['message'],
         )
 
 
@@ -88,10 +87,10 @@ class PlayerProperty:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerProperty:
+    def from_json(cls, json: PlayerPropertyJSON) -> PlayerProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -106,15 +105,15 @@ class PlayerEvent:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['timestamp'] = self.timestamp.to_json()
+        json['timestamp'] = self.timestamp
         json['value'] = self.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerEvent:
+    def from_json(cls, json: PlayerEventJSON) -> PlayerEvent:
         return cls(
-            timestamp=Timestamp.from_json(json['timestamp']),
-            value=str(json['value']),
+            timestamp=Timestamp(json['timestamp']),
+            value=json['value'],
         )
 
 
@@ -135,10 +134,10 @@ class PlayerErrorSourceLocation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerErrorSourceLocation:
+    def from_json(cls, json: PlayerErrorSourceLocationJSON) -> PlayerErrorSourceLocation:
         return cls(
-            file=str(json['file']),
-            line=int(json['line']),
+            file=json['file'],
+            line=json['line'],
         )
 
 
@@ -173,34 +172,28 @@ class PlayerError:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerError:
+    def from_json(cls, json: PlayerErrorJSON) -> PlayerError:
         return cls(
-            error_type=str(json['errorType']),
-            code=int(json['code']),
+            error_type=json['errorType'],
+            code=json['code'],
             stack=[PlayerErrorSourceLocation.from_json(i) for i in json['stack']],
             cause=[PlayerError.from_json(i) for i in json['cause']],
-            data=dict(json['data']),
+            data=json['data'],
         )
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables the Media domain
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Media.enable',
-    }
-    json = yield cmd_dict
+    return Command('Media.enable')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables the Media domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Media.disable',
-    }
-    json = yield cmd_dict
+    return Command('Media.disable')
 
 
 @event_class('Media.playerPropertiesChanged')
@@ -214,9 +207,9 @@ class PlayerPropertiesChanged:
     properties: typing.List[PlayerProperty]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerPropertiesChanged:
+    def from_json(cls, json: PlayerPropertiesChangedJSON) -> PlayerPropertiesChanged:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
+            player_id=PlayerId(json['playerId']),
             properties=[PlayerProperty.from_json(i) for i in json['properties']]
         )
 
@@ -232,9 +225,9 @@ class PlayerEventsAdded:
     events: typing.List[PlayerEvent]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerEventsAdded:
+    def from_json(cls, json: PlayerEventsAddedJSON) -> PlayerEventsAdded:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
+            player_id=PlayerId(json['playerId']),
             events=[PlayerEvent.from_json(i) for i in json['events']]
         )
 
@@ -249,9 +242,9 @@ class PlayerMessagesLogged:
     messages: typing.List[PlayerMessage]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerMessagesLogged:
+    def from_json(cls, json: PlayerMessagesLoggedJSON) -> PlayerMessagesLogged:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
+            player_id=PlayerId(json['playerId']),
             messages=[PlayerMessage.from_json(i) for i in json['messages']]
         )
 
@@ -266,9 +259,9 @@ class PlayerErrorsRaised:
     errors: typing.List[PlayerError]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayerErrorsRaised:
+    def from_json(cls, json: PlayerErrorsRaisedJSON) -> PlayerErrorsRaised:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
+            player_id=PlayerId(json['playerId']),
             errors=[PlayerError.from_json(i) for i in json['errors']]
         )
 
@@ -284,7 +277,60 @@ class PlayersCreated:
     players: typing.List[PlayerId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PlayersCreated:
+    def from_json(cls, json: PlayersCreatedJSON) -> PlayersCreated:
         return cls(
-            players=[PlayerId.from_json(i) for i in json['players']]
+            players=[PlayerId(i) for i in json['players']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class PlayerMessageJSON(typing.TypedDict):
+        level: str
+        message: str
+
+
+    class PlayerPropertyJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class PlayerEventJSON(typing.TypedDict):
+        timestamp: float
+        value: str
+
+
+    class PlayerErrorSourceLocationJSON(typing.TypedDict):
+        file: str
+        line: int
+
+
+    class PlayerErrorJSON(typing.TypedDict):
+        errorType: str
+        code: int
+        stack: typing.List[PlayerErrorSourceLocationJSON]
+        cause: typing.List[PlayerErrorJSON]
+        data: dict
+
+
+    class PlayerPropertiesChangedJSON(typing.TypedDict):
+        playerId: str
+        properties: typing.List[PlayerPropertyJSON]
+
+
+    class PlayerEventsAddedJSON(typing.TypedDict):
+        playerId: str
+        events: typing.List[PlayerEventJSON]
+
+
+    class PlayerMessagesLoggedJSON(typing.TypedDict):
+        playerId: str
+        messages: typing.List[PlayerMessageJSON]
+
+
+    class PlayerErrorsRaisedJSON(typing.TypedDict):
+        playerId: str
+        errors: typing.List[PlayerErrorJSON]
+
+
+    class PlayersCreatedJSON(typing.TypedDict):
+        players: typing.List[str]
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class PressureLevel(enum.Enum):
@@ -24,7 +23,10 @@ class PressureLevel(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureLevel:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -45,15 +47,15 @@ class SamplingProfileNode:
         json: T_JSON_DICT = dict()
         json['size'] = self.size
         json['total'] = self.total
-        json['stack'] = [i for i in self.stack]
+        json['stack'] = list(self.stack)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SamplingProfileNode:
+    def from_json(cls, json: SamplingProfileNodeJSON) -> SamplingProfileNode:
         return cls(
             size=float(json['size']),
             total=float(json['total']),
-            stack=[str(i) for i in json['stack']],
+            stack=json['stack'],
         )
 
 
@@ -73,7 +75,7 @@ class SamplingProfile:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SamplingProfile:
+    def from_json(cls, json: SamplingProfileJSON) -> SamplingProfile:
         return cls(
             samples=[SamplingProfileNode.from_json(i) for i in json['samples']],
             modules=[Module.from_json(i) for i in json['modules']],
@@ -107,11 +109,11 @@ class Module:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Module:
+    def from_json(cls, json: ModuleJSON) -> Module:
         return cls(
-            name=str(json['name']),
-            uuid=str(json['uuid']),
-            base_address=str(json['baseAddress']),
+            name=json['name'],
+            uuid=json['uuid'],
+            base_address=json['baseAddress'],
             size=float(json['size']),
         )
 
@@ -135,14 +137,22 @@ class DOMCounter:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DOMCounter:
+    def from_json(cls, json: DOMCounterJSON) -> DOMCounter:
         return cls(
-            name=str(json['name']),
-            count=int(json['count']),
+            name=json['name'],
+            count=json['count'],
         )
 
 
-def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[int, int, int]]:
+def _parse_get_dom_counters(json: GetDOMCountersReturnsJSON) -> typing.Tuple[int, int, int]:
+    return (
+        json['documents'],
+        json['nodes'],
+        json['jsEventListeners']
+    )
+
+
+def get_dom_counters() -> Command[GetDOMCountersReturnsJSON, typing.Tuple[int, int, int]]:
     '''
     Retruns current DOM object counters.
 
@@ -152,54 +162,40 @@ def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
         1. **nodes** - 
         2. **jsEventListeners** - 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.getDOMCounters',
-    }
-    json = yield cmd_dict
-    return (
-        int(json['documents']),
-        int(json['nodes']),
-        int(json['jsEventListeners'])
-    )
+    return Command('Memory.getDOMCounters', None, _parse_get_dom_counters)
+
+
+def _parse_get_dom_counters_for_leak_detection(json: GetDOMCountersForLeakDetectionReturnsJSON) -> typing.List[DOMCounter]:
+    return [DOMCounter.from_json(i) for i in json['counters']]
 
 
-def get_dom_counters_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[DOMCounter]]:
+def get_dom_counters_for_leak_detection() -> Command[GetDOMCountersForLeakDetectionReturnsJSON, typing.List[DOMCounter]]:
     '''
     Retruns DOM object counters after preparing renderer for leak detection.
 
     :returns: DOM object counters.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.getDOMCountersForLeakDetection',
-    }
-    json = yield cmd_dict
-    return [DOMCounter.from_json(i) for i in json['counters']]
+    return Command('Memory.getDOMCountersForLeakDetection', None, _parse_get_dom_counters_for_leak_detection)
 
 
-def prepare_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def prepare_for_leak_detection() -> Command[T_JSON_DICT, None]:
     '''
     Prepares for leak detection by terminating workers, stopping spellcheckers,
     dropping non-essential internal caches, running garbage collections, etc.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.prepareForLeakDetection',
-    }
-    json = yield cmd_dict
+    return Command('Memory.prepareForLeakDetection')
 
 
-def forcibly_purge_java_script_memory() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def forcibly_purge_java_script_memory() -> Command[T_JSON_DICT, None]:
     '''
     Simulate OomIntervention by purging V8 memory.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.forciblyPurgeJavaScriptMemory',
-    }
-    json = yield cmd_dict
+    return Command('Memory.forciblyPurgeJavaScriptMemory')
 
 
 def set_pressure_notifications_suppressed(
         suppressed: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable/disable suppressing memory pressure notifications in all processes.
 
@@ -207,34 +203,26 @@ def set_pressure_notifications_suppressed(
     '''
     params: T_JSON_DICT = dict()
     params['suppressed'] = suppressed
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.setPressureNotificationsSuppressed',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Memory.setPressureNotificationsSuppressed', params)
 
 
 def simulate_pressure_notification(
         level: PressureLevel
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Simulate a memory pressure notification in all processes.
 
     :param level: Memory pressure level of the notification.
     '''
     params: T_JSON_DICT = dict()
-    params['level'] = level.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.simulatePressureNotification',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['level'] = level.value
+    return Command('Memory.simulatePressureNotification', params)
 
 
 def start_sampling(
         sampling_interval: typing.Optional[int] = None,
         suppress_randomness: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Start collecting native memory profile.
 
@@ -246,60 +234,99 @@ def start_sampling(
         params['samplingInterval'] = sampling_interval
     if suppress_randomness is not None:
         params['suppressRandomness'] = suppress_randomness
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.startSampling',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Memory.startSampling', params)
 
 
-def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_sampling() -> Command[T_JSON_DICT, None]:
     '''
     Stop collecting native memory profile.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.stopSampling',
-    }
-    json = yield cmd_dict
+    return Command('Memory.stopSampling')
+
 
+def _parse_get_all_time_sampling_profile(json: GetAllTimeSamplingProfileReturnsJSON) -> SamplingProfile:
+    return SamplingProfile.from_json(json['profile'])
 
-def get_all_time_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingProfile]:
+
+def get_all_time_sampling_profile() -> Command[GetAllTimeSamplingProfileReturnsJSON, SamplingProfile]:
     '''
     Retrieve native memory allocations profile
     collected since renderer process startup.
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.getAllTimeSamplingProfile',
-    }
-    json = yield cmd_dict
+    return Command('Memory.getAllTimeSamplingProfile', None, _parse_get_all_time_sampling_profile)
+
+
+def _parse_get_browser_sampling_profile(json: GetBrowserSamplingProfileReturnsJSON) -> SamplingProfile:
     return SamplingProfile.from_json(json['profile'])
 
 
-def get_browser_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingProfile]:
+def get_browser_sampling_profile() -> Command[GetBrowserSamplingProfileReturnsJSON, SamplingProfile]:
     '''
     Retrieve native memory allocations profile
     collected since browser process startup.
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.getBrowserSamplingProfile',
-    }
-    json = yield cmd_dict
+    return Command('Memory.getBrowserSamplingProfile', None, _parse_get_browser_sampling_profile)
+
+
+def _parse_get_sampling_profile(json: GetSamplingProfileReturnsJSON) -> SamplingProfile:
     return SamplingProfile.from_json(json['profile'])
 
 
-def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingProfile]:
+def get_sampling_profile() -> Command[GetSamplingProfileReturnsJSON, SamplingProfile]:
     '''
     Retrieve native memory allocations profile collected since last
     ``startSampling`` call.
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Memory.getSamplingProfile',
-    }
-    json = yield cmd_dict
-    return SamplingProfile.from_json(json['profile'])
+    return Command('Memory.getSamplingProfile', None, _parse_get_sampling_profile)
+
+
+if typing.TYPE_CHECKING:
+    class SamplingProfileNodeJSON(typing.TypedDict):
+        size: float
+        total: float
+        stack: typing.List[str]
+
+
+    class SamplingProfileJSON(typing.TypedDict):
+        samples: typing.List[SamplingProfileNodeJSON]
+        modules: typing.List[ModuleJSON]
+
+
+    class ModuleJSON(typing.TypedDict):
+        name: str
+        uuid: str
+        baseAddress: str
+        size: float
+
+
+    class DOMCounterJSON(typing.TypedDict):
+        name: str
+        count: int
+
+
+    class GetDOMCountersReturnsJSON(typing.TypedDict):
+        documents: int
+        nodes: int
+        jsEventListeners: int
+
+
+    class GetDOMCountersForLeakDetectionReturnsJSON(typing.TypedDict):
+        counters: typing.List[DOMCounterJSON]
+
+
+    class GetAllTimeSamplingProfileReturnsJSON(typing.TypedDict):
+        profile: SamplingProfileJSON
+
+
+    class GetBrowserSamplingProfileReturnsJSON(typing.TypedDict):
+        profile: SamplingProfileJSON
+
+
+    class GetSamplingProfileReturnsJSON(typing.TypedDict):
+        profile: SamplingProfileJSON
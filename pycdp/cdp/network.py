@@ -8,15 +8,22 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import debugger
-from . import emulation
-from . import io
-from . import page
-from . import runtime
-from . import security
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import debugger
+    from . import emulation
+    from . import io
+    from . import page
+    from . import runtime
+    from . import security
+else:
+    debugger = lazy_import('debugger', globals())
+    emulation = lazy_import('emulation', globals())
+    io = lazy_import('io', globals())
+    page = lazy_import('page', globals())
+    runtime = lazy_import('runtime', globals())
+    security = lazy_import('security', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -48,7 +55,10 @@ class ResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class LoaderId(str):
@@ -122,7 +132,10 @@ class ErrorReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ErrorReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class TimeSinceEpoch(float):
@@ -189,7 +202,10 @@ class ConnectionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieSameSite(enum.Enum):
@@ -206,7 +222,10 @@ class CookieSameSite(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSameSite:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookiePriority(enum.Enum):
@@ -223,7 +242,10 @@ class CookiePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookiePriority:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieSourceScheme(enum.Enum):
@@ -241,7 +263,10 @@ class CookieSourceScheme(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSourceScheme:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -341,7 +366,7 @@ class ResourceTiming:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResourceTiming:
+    def from_json(cls, json: ResourceTimingJSON) -> ResourceTiming:
         return cls(
             request_time=float(json['requestTime']),
             proxy_start=float(json['proxyStart']),
@@ -362,8 +387,8 @@ class ResourceTiming:
             push_end=float(json['pushEnd']),
             receive_headers_start=float(json['receiveHeadersStart']),
             receive_headers_end=float(json['receiveHeadersEnd']),
-            worker_router_evaluation_start=float(json['workerRouterEvaluationStart']) if json.get('workerRouterEvaluationStart', None) is not None else None,
-            worker_cache_lookup_start=float(json['workerCacheLookupStart']) if json.get('workerCacheLookupStart', None) is not None else None,
+            worker_router_evaluation_start=float(_worker_router_evaluation_start) if (_worker_router_evaluation_start := json.get('workerRouterEvaluationStart')) is not None else None,
+            worker_cache_lookup_start=float(_worker_cache_lookup_start) if (_worker_cache_lookup_start := json.get('workerCacheLookupStart')) is not None else None,
         )
 
 
@@ -382,7 +407,10 @@ class ResourcePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourcePriority:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -399,9 +427,9 @@ class PostDataEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PostDataEntry:
+    def from_json(cls, json: PostDataEntryJSON) -> PostDataEntry:
         return cls(
-            bytes_=str(json['bytes']) if json.get('bytes', None) is not None else None,
+            bytes_=json.get('bytes'),
         )
 
 
@@ -456,8 +484,8 @@ class Request:
         json: T_JSON_DICT = dict()
         json['url'] = self.url
         json['method'] = self.method
-        json['headers'] = self.headers.to_json()
-        json['initialPriority'] = self.initial_priority.to_json()
+        json['headers'] = self.headers
+        json['initialPriority'] = self.initial_priority.value
         json['referrerPolicy'] = self.referrer_policy
         if self.url_fragment is not None:
             json['urlFragment'] = self.url_fragment
@@ -468,7 +496,7 @@ class Request:
         if self.post_data_entries is not None:
             json['postDataEntries'] = [i.to_json() for i in self.post_data_entries]
         if self.mixed_content_type is not None:
-            json['mixedContentType'] = self.mixed_content_type.to_json()
+            json['mixedContentType'] = self.mixed_content_type.value
         if self.is_link_preload is not None:
             json['isLinkPreload'] = self.is_link_preload
         if self.trust_token_params is not None:
@@ -478,21 +506,21 @@ class Request:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Request:
+    def from_json(cls, json: RequestJSON) -> Request:
         return cls(
-            url=str(json['url']),
-            method=str(json['method']),
-            headers=Headers.from_json(json['headers']),
+            url=json['url'],
+            method=json['method'],
+            headers=Headers(json['headers']),
             initial_priority=ResourcePriority.from_json(json['initialPriority']),
-            referrer_policy=str(json['referrerPolicy']),
-            url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
-            post_data=str(json['postData']) if json.get('postData', None) is not None else None,
-            has_post_data=bool(json['hasPostData']) if json.get('hasPostData', None) is not None else None,
-            post_data_entries=[PostDataEntry.from_json(i) for i in json['postDataEntries']] if json.get('postDataEntries', None) is not None else None,
-            mixed_content_type=security.MixedContentType.from_json(json['mixedContentType']) if json.get('mixedContentType', None) is not None else None,
-            is_link_preload=bool(json['isLinkPreload']) if json.get('isLinkPreload', None) is not None else None,
-            trust_token_params=TrustTokenParams.from_json(json['trustTokenParams']) if json.get('trustTokenParams', None) is not None else None,
-            is_same_site=bool(json['isSameSite']) if json.get('isSameSite', None) is not None else None,
+            referrer_policy=json['referrerPolicy'],
+            url_fragment=json.get('urlFragment'),
+            post_data=json.get('postData'),
+            has_post_data=json.get('hasPostData'),
+            post_data_entries=[PostDataEntry.from_json(i) for i in _post_data_entries] if (_post_data_entries := json.get('postDataEntries')) is not None else None,
+            mixed_content_type=security.MixedContentType.from_json(_mixed_content_type) if (_mixed_content_type := json.get('mixedContentType')) is not None else None,
+            is_link_preload=json.get('isLinkPreload'),
+            trust_token_params=TrustTokenParams.from_json(_trust_token_params) if (_trust_token_params := json.get('trustTokenParams')) is not None else None,
+            is_same_site=json.get('isSameSite'),
         )
 
 
@@ -539,16 +567,16 @@ class SignedCertificateTimestamp:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedCertificateTimestamp:
+    def from_json(cls, json: SignedCertificateTimestampJSON) -> SignedCertificateTimestamp:
         return cls(
-            status=str(json['status']),
-            origin=str(json['origin']),
-            log_description=str(json['logDescription']),
-            log_id=str(json['logId']),
+            status=json['status'],
+            origin=json['origin'],
+            log_description=json['logDescription'],
+            log_id=json['logId'],
             timestamp=float(json['timestamp']),
-            hash_algorithm=str(json['hashAlgorithm']),
-            signature_algorithm=str(json['signatureAlgorithm']),
-            signature_data=str(json['signatureData']),
+            hash_algorithm=json['hashAlgorithm'],
+            signature_algorithm=json['signatureAlgorithm'],
+            signature_data=json['signatureData'],
         )
 
 
@@ -609,14 +637,14 @@ class SecurityDetails:
         json['protocol'] = self.protocol
         json['keyExchange'] = self.key_exchange
         json['cipher'] = self.cipher
-        json['certificateId'] = self.certificate_id.to_json()
+        json['certificateId'] = self.certificate_id
         json['subjectName'] = self.subject_name
-        json['sanList'] = [i for i in self.san_list]
+        json['sanList'] = list(self.san_list)
         json['issuer'] = self.issuer
-        json['validFrom'] = self.valid_from.to_json()
-        json['validTo'] = self.valid_to.to_json()
+        json['validFrom'] = self.valid_from
+        json['validTo'] = self.valid_to
         json['signedCertificateTimestampList'] = [i.to_json() for i in self.signed_certificate_timestamp_list]
-        json['certificateTransparencyCompliance'] = self.certificate_transparency_compliance.to_json()
+        json['certificateTransparencyCompliance'] = self.certificate_transparency_compliance.value
         json['encryptedClientHello'] = self.encrypted_client_hello
         if self.key_exchange_group is not None:
             json['keyExchangeGroup'] = self.key_exchange_group
@@ -627,23 +655,23 @@ class SecurityDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SecurityDetails:
+    def from_json(cls, json: SecurityDetailsJSON) -> SecurityDetails:
         return cls(
-            protocol=str(json['protocol']),
-            key_exchange=str(json['keyExchange']),
-            cipher=str(json['cipher']),
-            certificate_id=security.CertificateId.from_json(json['certificateId']),
-            subject_name=str(json['subjectName']),
-            san_list=[str(i) for i in json['sanList']],
-            issuer=str(json['issuer']),
-            valid_from=TimeSinceEpoch.from_json(json['validFrom']),
-            valid_to=TimeSinceEpoch.from_json(json['validTo']),
+            protocol=json['protocol'],
+            key_exchange=json['keyExchange'],
+            cipher=json['cipher'],
+            certificate_id=security.CertificateId(json['certificateId']),
+            subject_name=json['subjectName'],
+            san_list=json['sanList'],
+            issuer=json['issuer'],
+            valid_from=TimeSinceEpoch(json['validFrom']),
+            valid_to=TimeSinceEpoch(json['validTo']),
             signed_certificate_timestamp_list=[SignedCertificateTimestamp.from_json(i) for i in json['signedCertificateTimestampList']],
             certificate_transparency_compliance=CertificateTransparencyCompliance.from_json(json['certificateTransparencyCompliance']),
-            encrypted_client_hello=bool(json['encryptedClientHello']),
-            key_exchange_group=str(json['keyExchangeGroup']) if json.get('keyExchangeGroup', None) is not None else None,
-            mac=str(json['mac']) if json.get('mac', None) is not None else None,
-            server_signature_algorithm=int(json['serverSignatureAlgorithm']) if json.get('serverSignatureAlgorithm', None) is not None else None,
+            encrypted_client_hello=json['encryptedClientHello'],
+            key_exchange_group=json.get('keyExchangeGroup'),
+            mac=json.get('mac'),
+            server_signature_algorithm=json.get('serverSignatureAlgorithm'),
         )
 
 
@@ -660,7 +688,10 @@ class CertificateTransparencyCompliance(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateTransparencyCompliance:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class BlockedReason(enum.Enum):
@@ -688,7 +719,10 @@ class BlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CorsError(enum.Enum):
@@ -736,7 +770,10 @@ class CorsError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CorsError:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -747,15 +784,15 @@ class CorsErrorStatus:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['corsError'] = self.cors_error.to_json()
+        json['corsError'] = self.cors_error.value
         json['failedParameter'] = self.failed_parameter
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CorsErrorStatus:
+    def from_json(cls, json: CorsErrorStatusJSON) -> CorsErrorStatus:
         return cls(
             cors_error=CorsError.from_json(json['corsError']),
-            failed_parameter=str(json['failedParameter']),
+            failed_parameter=json['failedParameter'],
         )
 
 
@@ -773,7 +810,10 @@ class ServiceWorkerResponseSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerResponseSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -795,18 +835,18 @@ class TrustTokenParams:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['operation'] = self.operation.to_json()
+        json['operation'] = self.operation.value
         json['refreshPolicy'] = self.refresh_policy
         if self.issuers is not None:
-            json['issuers'] = [i for i in self.issuers]
+            json['issuers'] = list(self.issuers)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TrustTokenParams:
+    def from_json(cls, json: TrustTokenParamsJSON) -> TrustTokenParams:
         return cls(
             operation=TrustTokenOperationType.from_json(json['operation']),
-            refresh_policy=str(json['refreshPolicy']),
-            issuers=[str(i) for i in json['issuers']] if json.get('issuers', None) is not None else None,
+            refresh_policy=json['refreshPolicy'],
+            issuers=json.get('issuers'),
         )
 
 
@@ -820,7 +860,10 @@ class TrustTokenOperationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TrustTokenOperationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AlternateProtocolUsage(enum.Enum):
@@ -841,7 +884,10 @@ class AlternateProtocolUsage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AlternateProtocolUsage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ServiceWorkerRouterSource(enum.Enum):
@@ -858,7 +904,10 @@ class ServiceWorkerRouterSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerRouterSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -879,17 +928,17 @@ class ServiceWorkerRouterInfo:
         if self.rule_id_matched is not None:
             json['ruleIdMatched'] = self.rule_id_matched
         if self.matched_source_type is not None:
-            json['matchedSourceType'] = self.matched_source_type.to_json()
+            json['matchedSourceType'] = self.matched_source_type.value
         if self.actual_source_type is not None:
-            json['actualSourceType'] = self.actual_source_type.to_json()
+            json['actualSourceType'] = self.actual_source_type.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRouterInfo:
+    def from_json(cls, json: ServiceWorkerRouterInfoJSON) -> ServiceWorkerRouterInfo:
         return cls(
-            rule_id_matched=int(json['ruleIdMatched']) if json.get('ruleIdMatched', None) is not None else None,
-            matched_source_type=ServiceWorkerRouterSource.from_json(json['matchedSourceType']) if json.get('matchedSourceType', None) is not None else None,
-            actual_source_type=ServiceWorkerRouterSource.from_json(json['actualSourceType']) if json.get('actualSourceType', None) is not None else None,
+            rule_id_matched=json.get('ruleIdMatched'),
+            matched_source_type=ServiceWorkerRouterSource.from_json(_matched_source_type) if (_matched_source_type := json.get('matchedSourceType')) is not None else None,
+            actual_source_type=ServiceWorkerRouterSource.from_json(_actual_source_type) if (_actual_source_type := json.get('actualSourceType')) is not None else None,
         )
 
 
@@ -987,17 +1036,17 @@ class Response:
         json['url'] = self.url
         json['status'] = self.status
         json['statusText'] = self.status_text
-        json['headers'] = self.headers.to_json()
+        json['headers'] = self.headers
         json['mimeType'] = self.mime_type
         json['charset'] = self.charset
         json['connectionReused'] = self.connection_reused
         json['connectionId'] = self.connection_id
         json['encodedDataLength'] = self.encoded_data_length
-        json['securityState'] = self.security_state.to_json()
+        json['securityState'] = self.security_state.value
         if self.headers_text is not None:
             json['headersText'] = self.headers_text
         if self.request_headers is not None:
-            json['requestHeaders'] = self.request_headers.to_json()
+            json['requestHeaders'] = self.request_headers
         if self.request_headers_text is not None:
             json['requestHeadersText'] = self.request_headers_text
         if self.remote_ip_address is not None:
@@ -1017,49 +1066,49 @@ class Response:
         if self.timing is not None:
             json['timing'] = self.timing.to_json()
         if self.service_worker_response_source is not None:
-            json['serviceWorkerResponseSource'] = self.service_worker_response_source.to_json()
+            json['serviceWorkerResponseSource'] = self.service_worker_response_source.value
         if self.response_time is not None:
-            json['responseTime'] = self.response_time.to_json()
+            json['responseTime'] = self.response_time
         if self.cache_storage_cache_name is not None:
             json['cacheStorageCacheName'] = self.cache_storage_cache_name
         if self.protocol is not None:
             json['protocol'] = self.protocol
         if self.alternate_protocol_usage is not None:
-            json['alternateProtocolUsage'] = self.alternate_protocol_usage.to_json()
+            json['alternateProtocolUsage'] = self.alternate_protocol_usage.value
         if self.security_details is not None:
             json['securityDetails'] = self.security_details.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Response:
+    def from_json(cls, json: ResponseJSON) -> Response:
         return cls(
-            url=str(json['url']),
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            mime_type=str(json['mimeType']),
-            charset=str(json['charset']),
-            connection_reused=bool(json['connectionReused']),
+            url=json['url'],
+            status=json['status'],
+            status_text=json['statusText'],
+            headers=Headers(json['headers']),
+            mime_type=json['mimeType'],
+            charset=json['charset'],
+            connection_reused=json['connectionReused'],
             connection_id=float(json['connectionId']),
             encoded_data_length=float(json['encodedDataLength']),
             security_state=security.SecurityState.from_json(json['securityState']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if json.get('requestHeaders', None) is not None else None,
-            request_headers_text=str(json['requestHeadersText']) if json.get('requestHeadersText', None) is not None else None,
-            remote_ip_address=str(json['remoteIPAddress']) if json.get('remoteIPAddress', None) is not None else None,
-            remote_port=int(json['remotePort']) if json.get('remotePort', None) is not None else None,
-            from_disk_cache=bool(json['fromDiskCache']) if json.get('fromDiskCache', None) is not None else None,
-            from_service_worker=bool(json['fromServiceWorker']) if json.get('fromServiceWorker', None) is not None else None,
-            from_prefetch_cache=bool(json['fromPrefetchCache']) if json.get('fromPrefetchCache', None) is not None else None,
-            from_early_hints=bool(json['fromEarlyHints']) if json.get('fromEarlyHints', None) is not None else None,
-            service_worker_router_info=ServiceWorkerRouterInfo.from_json(json['serviceWorkerRouterInfo']) if json.get('serviceWorkerRouterInfo', None) is not None else None,
-            timing=ResourceTiming.from_json(json['timing']) if json.get('timing', None) is not None else None,
-            service_worker_response_source=ServiceWorkerResponseSource.from_json(json['serviceWorkerResponseSource']) if json.get('serviceWorkerResponseSource', None) is not None else None,
-            response_time=TimeSinceEpoch.from_json(json['responseTime']) if json.get('responseTime', None) is not None else None,
-            cache_storage_cache_name=str(json['cacheStorageCacheName']) if json.get('cacheStorageCacheName', None) is not None else None,
-            protocol=str(json['protocol']) if json.get('protocol', None) is not None else None,
-            alternate_protocol_usage=AlternateProtocolUsage.from_json(json['alternateProtocolUsage']) if json.get('alternateProtocolUsage', None) is not None else None,
-            security_details=SecurityDetails.from_json(json['securityDetails']) if json.get('securityDetails', None) is not None else None,
+            headers_text=json.get('headersText'),
+            request_headers=Headers(_request_headers) if (_request_headers := json.get('requestHeaders')) is not None else None,
+            request_headers_text=json.get('requestHeadersText'),
+            remote_ip_address=json.get('remoteIPAddress'),
+            remote_port=json.get('remotePort'),
+            from_disk_cache=json.get('fromDiskCache'),
+            from_service_worker=json.get('fromServiceWorker'),
+            from_prefetch_cache=json.get('fromPrefetchCache'),
+            from_early_hints=json.get('fromEarlyHints'),
+            service_worker_router_info=ServiceWorkerRouterInfo.from_json(_service_worker_router_info) if (_service_worker_router_info := json.get('serviceWorkerRouterInfo')) is not None else None,
+            timing=ResourceTiming.from_json(_timing) if (_timing := json.get('timing')) is not None else None,
+            service_worker_response_source=ServiceWorkerResponseSource.from_json(_service_worker_response_source) if (_service_worker_response_source := json.get('serviceWorkerResponseSource')) is not None else None,
+            response_time=TimeSinceEpoch(_response_time) if (_response_time := json.get('responseTime')) is not None else None,
+            cache_storage_cache_name=json.get('cacheStorageCacheName'),
+            protocol=json.get('protocol'),
+            alternate_protocol_usage=AlternateProtocolUsage.from_json(_alternate_protocol_usage) if (_alternate_protocol_usage := json.get('alternateProtocolUsage')) is not None else None,
+            security_details=SecurityDetails.from_json(_security_details) if (_security_details := json.get('securityDetails')) is not None else None,
         )
 
 
@@ -1073,13 +1122,13 @@ class WebSocketRequest:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['headers'] = self.headers.to_json()
+        json['headers'] = self.headers
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketRequest:
+    def from_json(cls, json: WebSocketRequestJSON) -> WebSocketRequest:
         return cls(
-            headers=Headers.from_json(json['headers']),
+            headers=Headers(json['headers']),
         )
 
 
@@ -1110,24 +1159,24 @@ class WebSocketResponse:
         json: T_JSON_DICT = dict()
         json['status'] = self.status
         json['statusText'] = self.status_text
-        json['headers'] = self.headers.to_json()
+        json['headers'] = self.headers
         if self.headers_text is not None:
             json['headersText'] = self.headers_text
         if self.request_headers is not None:
-            json['requestHeaders'] = self.request_headers.to_json()
+            json['requestHeaders'] = self.request_headers
         if self.request_headers_text is not None:
             json['requestHeadersText'] = self.request_headers_text
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketResponse:
+    def from_json(cls, json: WebSocketResponseJSON) -> WebSocketResponse:
         return cls(
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if json.get('requestHeaders', None) is not None else None,
-            request_headers_text=str(json['requestHeadersText']) if json.get('requestHeadersText', None) is not None else None,
+            status=json['status'],
+            status_text=json['statusText'],
+            headers=Headers(json['headers']),
+            headers_text=json.get('headersText'),
+            request_headers=Headers(_request_headers) if (_request_headers := json.get('requestHeaders')) is not None else None,
+            request_headers_text=json.get('requestHeadersText'),
         )
 
 
@@ -1155,11 +1204,11 @@ class WebSocketFrame:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketFrame:
+    def from_json(cls, json: WebSocketFrameJSON) -> WebSocketFrame:
         return cls(
             opcode=float(json['opcode']),
-            mask=bool(json['mask']),
-            payload_data=str(json['payloadData']),
+            mask=json['mask'],
+            payload_data=json['payloadData'],
         )
 
 
@@ -1183,19 +1232,19 @@ class CachedResource:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['url'] = self.url
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         json['bodySize'] = self.body_size
         if self.response is not None:
             json['response'] = self.response.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CachedResource:
+    def from_json(cls, json: CachedResourceJSON) -> CachedResource:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             type_=ResourceType.from_json(json['type']),
             body_size=float(json['bodySize']),
-            response=Response.from_json(json['response']) if json.get('response', None) is not None else None,
+            response=Response.from_json(_response) if (_response := json.get('response')) is not None else None,
         )
 
 
@@ -1237,18 +1286,18 @@ class Initiator:
         if self.column_number is not None:
             json['columnNumber'] = self.column_number
         if self.request_id is not None:
-            json['requestId'] = self.request_id.to_json()
+            json['requestId'] = self.request_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Initiator:
+    def from_json(cls, json: InitiatorJSON) -> Initiator:
         return cls(
-            type_=str(json['type']),
-            stack=runtime.StackTrace.from_json(json['stack']) if json.get('stack', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line_number=float(json['lineNumber']) if json.get('lineNumber', None) is not None else None,
-            column_number=float(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
-            request_id=RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
+            type_=json['type'],
+            stack=runtime.StackTrace.from_json(_stack) if (_stack := json.get('stack')) is not None else None,
+            url=json.get('url'),
+            line_number=float(_line_number) if (_line_number := json.get('lineNumber')) is not None else None,
+            column_number=float(_column_number) if (_column_number := json.get('columnNumber')) is not None else None,
+            request_id=RequestId(_request_id) if (_request_id := json.get('requestId')) is not None else None,
         )
 
 
@@ -1272,10 +1321,10 @@ class CookiePartitionKey:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CookiePartitionKey:
+    def from_json(cls, json: CookiePartitionKeyJSON) -> CookiePartitionKey:
         return cls(
-            top_level_site=str(json['topLevelSite']),
-            has_cross_site_ancestor=bool(json['hasCrossSiteAncestor']),
+            top_level_site=json['topLevelSite'],
+            has_cross_site_ancestor=json['hasCrossSiteAncestor'],
         )
 
 
@@ -1344,14 +1393,14 @@ class Cookie:
         json['httpOnly'] = self.http_only
         json['secure'] = self.secure
         json['session'] = self.session
-        json['priority'] = self.priority.to_json()
+        json['priority'] = self.priority.value
         json['sameParty'] = self.same_party
-        json['sourceScheme'] = self.source_scheme.to_json()
+        json['sourceScheme'] = self.source_scheme.value
         json['sourcePort'] = self.source_port
         if self.expires is not None:
             json['expires'] = self.expires
         if self.same_site is not None:
-            json['sameSite'] = self.same_site.to_json()
+            json['sameSite'] = self.same_site.value
         if self.partition_key is not None:
             json['partitionKey'] = self.partition_key.to_json()
         if self.partition_key_opaque is not None:
@@ -1359,24 +1408,24 @@ class Cookie:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Cookie:
+    def from_json(cls, json: CookieJSON) -> Cookie:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            domain=str(json['domain']),
-            path=str(json['path']),
-            size=int(json['size']),
-            http_only=bool(json['httpOnly']),
-            secure=bool(json['secure']),
-            session=bool(json['session']),
+            name=json['name'],
+            value=json['value'],
+            domain=json['domain'],
+            path=json['path'],
+            size=json['size'],
+            http_only=json['httpOnly'],
+            secure=json['secure'],
+            session=json['session'],
             priority=CookiePriority.from_json(json['priority']),
-            same_party=bool(json['sameParty']),
+            same_party=json['sameParty'],
             source_scheme=CookieSourceScheme.from_json(json['sourceScheme']),
-            source_port=int(json['sourcePort']),
-            expires=float(json['expires']) if json.get('expires', None) is not None else None,
-            same_site=CookieSameSite.from_json(json['sameSite']) if json.get('sameSite', None) is not None else None,
-            partition_key=CookiePartitionKey.from_json(json['partitionKey']) if json.get('partitionKey', None) is not None else None,
-            partition_key_opaque=bool(json['partitionKeyOpaque']) if json.get('partitionKeyOpaque', None) is not None else None,
+            source_port=json['sourcePort'],
+            expires=float(_expires) if (_expires := json.get('expires')) is not None else None,
+            same_site=CookieSameSite.from_json(_same_site) if (_same_site := json.get('sameSite')) is not None else None,
+            partition_key=CookiePartitionKey.from_json(_partition_key) if (_partition_key := json.get('partitionKey')) is not None else None,
+            partition_key_opaque=json.get('partitionKeyOpaque'),
         )
 
 
@@ -1412,7 +1461,10 @@ class SetCookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SetCookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieBlockedReason(enum.Enum):
@@ -1443,7 +1495,10 @@ class CookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CookieExemptionReason(enum.Enum):
@@ -1467,7 +1522,10 @@ class CookieExemptionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExemptionReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1489,18 +1547,18 @@ class BlockedSetCookieWithReason:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['blockedReasons'] = [i.to_json() for i in self.blocked_reasons]
+        json['blockedReasons'] = [i.value for i in self.blocked_reasons]
         json['cookieLine'] = self.cookie_line
         if self.cookie is not None:
             json['cookie'] = self.cookie.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BlockedSetCookieWithReason:
+    def from_json(cls, json: BlockedSetCookieWithReasonJSON) -> BlockedSetCookieWithReason:
         return cls(
             blocked_reasons=[SetCookieBlockedReason.from_json(i) for i in json['blockedReasons']],
-            cookie_line=str(json['cookieLine']),
-            cookie=Cookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
+            cookie_line=json['cookieLine'],
+            cookie=Cookie.from_json(_cookie) if (_cookie := json.get('cookie')) is not None else None,
         )
 
 
@@ -1521,16 +1579,16 @@ class ExemptedSetCookieWithReason:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['exemptionReason'] = self.exemption_reason.to_json()
+        json['exemptionReason'] = self.exemption_reason.value
         json['cookieLine'] = self.cookie_line
         json['cookie'] = self.cookie.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExemptedSetCookieWithReason:
+    def from_json(cls, json: ExemptedSetCookieWithReasonJSON) -> ExemptedSetCookieWithReason:
         return cls(
             exemption_reason=CookieExemptionReason.from_json(json['exemptionReason']),
-            cookie_line=str(json['cookieLine']),
+            cookie_line=json['cookieLine'],
             cookie=Cookie.from_json(json['cookie']),
         )
 
@@ -1554,17 +1612,17 @@ class AssociatedCookie:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['cookie'] = self.cookie.to_json()
-        json['blockedReasons'] = [i.to_json() for i in self.blocked_reasons]
+        json['blockedReasons'] = [i.value for i in self.blocked_reasons]
         if self.exemption_reason is not None:
-            json['exemptionReason'] = self.exemption_reason.to_json()
+            json['exemptionReason'] = self.exemption_reason.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AssociatedCookie:
+    def from_json(cls, json: AssociatedCookieJSON) -> AssociatedCookie:
         return cls(
             cookie=Cookie.from_json(json['cookie']),
             blocked_reasons=[CookieBlockedReason.from_json(i) for i in json['blockedReasons']],
-            exemption_reason=CookieExemptionReason.from_json(json['exemptionReason']) if json.get('exemptionReason', None) is not None else None,
+            exemption_reason=CookieExemptionReason.from_json(_exemption_reason) if (_exemption_reason := json.get('exemptionReason')) is not None else None,
         )
 
 
@@ -1633,15 +1691,15 @@ class CookieParam:
         if self.http_only is not None:
             json['httpOnly'] = self.http_only
         if self.same_site is not None:
-            json['sameSite'] = self.same_site.to_json()
+            json['sameSite'] = self.same_site.value
         if self.expires is not None:
-            json['expires'] = self.expires.to_json()
+            json['expires'] = self.expires
         if self.priority is not None:
-            json['priority'] = self.priority.to_json()
+            json['priority'] = self.priority.value
         if self.same_party is not None:
             json['sameParty'] = self.same_party
         if self.source_scheme is not None:
-            json['sourceScheme'] = self.source_scheme.to_json()
+            json['sourceScheme'] = self.source_scheme.value
         if self.source_port is not None:
             json['sourcePort'] = self.source_port
         if self.partition_key is not None:
@@ -1649,22 +1707,22 @@ class CookieParam:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CookieParam:
+    def from_json(cls, json: CookieParamJSON) -> CookieParam:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            domain=str(json['domain']) if json.get('domain', None) is not None else None,
-            path=str(json['path']) if json.get('path', None) is not None else None,
-            secure=bool(json['secure']) if json.get('secure', None) is not None else None,
-            http_only=bool(json['httpOnly']) if json.get('httpOnly', None) is not None else None,
-            same_site=CookieSameSite.from_json(json['sameSite']) if json.get('sameSite', None) is not None else None,
-            expires=TimeSinceEpoch.from_json(json['expires']) if json.get('expires', None) is not None else None,
-            priority=CookiePriority.from_json(json['priority']) if json.get('priority', None) is not None else None,
-            same_party=bool(json['sameParty']) if json.get('sameParty', None) is not None else None,
-            source_scheme=CookieSourceScheme.from_json(json['sourceScheme']) if json.get('sourceScheme', None) is not None else None,
-            source_port=int(json['sourcePort']) if json.get('sourcePort', None) is not None else None,
-            partition_key=CookiePartitionKey.from_json(json['partitionKey']) if json.get('partitionKey', None) is not None else None,
+            name=json['name'],
+            value=json['value'],
+            url=json.get('url'),
+            domain=json.get('domain'),
+            path=json.get('path'),
+            secure=json.get('secure'),
+            http_only=json.get('httpOnly'),
+            same_site=CookieSameSite.from_json(_same_site) if (_same_site := json.get('sameSite')) is not None else None,
+            expires=TimeSinceEpoch(_expires) if (_expires := json.get('expires')) is not None else None,
+            priority=CookiePriority.from_json(_priority) if (_priority := json.get('priority')) is not None else None,
+            same_party=json.get('sameParty'),
+            source_scheme=CookieSourceScheme.from_json(_source_scheme) if (_source_scheme := json.get('sourceScheme')) is not None else None,
+            source_port=json.get('sourcePort'),
+            partition_key=CookiePartitionKey.from_json(_partition_key) if (_partition_key := json.get('partitionKey')) is not None else None,
         )
 
 
@@ -1695,12 +1753,12 @@ class AuthChallenge:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
+    def from_json(cls, json: AuthChallengeJSON) -> AuthChallenge:
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if json.get('source', None) is not None else None,
+            origin=json['origin'],
+            scheme=json['scheme'],
+            realm=json['realm'],
+            source=json.get('source'),
         )
 
 
@@ -1732,11 +1790,11 @@ class AuthChallengeResponse:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
+    def from_json(cls, json: AuthChallengeResponseJSON) -> AuthChallengeResponse:
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if json.get('username', None) is not None else None,
-            password=str(json['password']) if json.get('password', None) is not None else None,
+            response=json['response'],
+            username=json.get('username'),
+            password=json.get('password'),
         )
 
 
@@ -1753,7 +1811,10 @@ class InterceptionStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterceptionStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1776,17 +1837,17 @@ class RequestPattern:
         if self.url_pattern is not None:
             json['urlPattern'] = self.url_pattern
         if self.resource_type is not None:
-            json['resourceType'] = self.resource_type.to_json()
+            json['resourceType'] = self.resource_type.value
         if self.interception_stage is not None:
-            json['interceptionStage'] = self.interception_stage.to_json()
+            json['interceptionStage'] = self.interception_stage.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
+    def from_json(cls, json: RequestPatternJSON) -> RequestPattern:
         return cls(
-            url_pattern=str(json['urlPattern']) if json.get('urlPattern', None) is not None else None,
-            resource_type=ResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            interception_stage=InterceptionStage.from_json(json['interceptionStage']) if json.get('interceptionStage', None) is not None else None,
+            url_pattern=json.get('urlPattern'),
+            resource_type=ResourceType.from_json(_resource_type) if (_resource_type := json.get('resourceType')) is not None else None,
+            interception_stage=InterceptionStage.from_json(_interception_stage) if (_interception_stage := json.get('interceptionStage')) is not None else None,
         )
 
 
@@ -1836,21 +1897,21 @@ class SignedExchangeSignature:
         if self.cert_sha256 is not None:
             json['certSha256'] = self.cert_sha256
         if self.certificates is not None:
-            json['certificates'] = [i for i in self.certificates]
+            json['certificates'] = list(self.certificates)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedExchangeSignature:
+    def from_json(cls, json: SignedExchangeSignatureJSON) -> SignedExchangeSignature:
         return cls(
-            label=str(json['label']),
-            signature=str(json['signature']),
-            integrity=str(json['integrity']),
-            validity_url=str(json['validityUrl']),
-            date=int(json['date']),
-            expires=int(json['expires']),
-            cert_url=str(json['certUrl']) if json.get('certUrl', None) is not None else None,
-            cert_sha256=str(json['certSha256']) if json.get('certSha256', None) is not None else None,
-            certificates=[str(i) for i in json['certificates']] if json.get('certificates', None) is not None else None,
+            label=json['label'],
+            signature=json['signature'],
+            integrity=json['integrity'],
+            validity_url=json['validityUrl'],
+            date=json['date'],
+            expires=json['expires'],
+            cert_url=json.get('certUrl'),
+            cert_sha256=json.get('certSha256'),
+            certificates=json.get('certificates'),
         )
 
 
@@ -1879,19 +1940,19 @@ class SignedExchangeHeader:
         json: T_JSON_DICT = dict()
         json['requestUrl'] = self.request_url
         json['responseCode'] = self.response_code
-        json['responseHeaders'] = self.response_headers.to_json()
+        json['responseHeaders'] = self.response_headers
         json['signatures'] = [i.to_json() for i in self.signatures]
         json['headerIntegrity'] = self.header_integrity
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedExchangeHeader:
+    def from_json(cls, json: SignedExchangeHeaderJSON) -> SignedExchangeHeader:
         return cls(
-            request_url=str(json['requestUrl']),
-            response_code=int(json['responseCode']),
-            response_headers=Headers.from_json(json['responseHeaders']),
+            request_url=json['requestUrl'],
+            response_code=json['responseCode'],
+            response_headers=Headers(json['responseHeaders']),
             signatures=[SignedExchangeSignature.from_json(i) for i in json['signatures']],
-            header_integrity=str(json['headerIntegrity']),
+            header_integrity=json['headerIntegrity'],
         )
 
 
@@ -1911,7 +1972,10 @@ class SignedExchangeErrorField(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SignedExchangeErrorField:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1934,15 +1998,15 @@ class SignedExchangeError:
         if self.signature_index is not None:
             json['signatureIndex'] = self.signature_index
         if self.error_field is not None:
-            json['errorField'] = self.error_field.to_json()
+            json['errorField'] = self.error_field.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedExchangeError:
+    def from_json(cls, json: SignedExchangeErrorJSON) -> SignedExchangeError:
         return cls(
-            message=str(json['message']),
-            signature_index=int(json['signatureIndex']) if json.get('signatureIndex', None) is not None else None,
-            error_field=SignedExchangeErrorField.from_json(json['errorField']) if json.get('errorField', None) is not None else None,
+            message=json['message'],
+            signature_index=json.get('signatureIndex'),
+            error_field=SignedExchangeErrorField.from_json(_error_field) if (_error_field := json.get('errorField')) is not None else None,
         )
 
 
@@ -1975,12 +2039,12 @@ class SignedExchangeInfo:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedExchangeInfo:
+    def from_json(cls, json: SignedExchangeInfoJSON) -> SignedExchangeInfo:
         return cls(
             outer_response=Response.from_json(json['outerResponse']),
-            header=SignedExchangeHeader.from_json(json['header']) if json.get('header', None) is not None else None,
-            security_details=SecurityDetails.from_json(json['securityDetails']) if json.get('securityDetails', None) is not None else None,
-            errors=[SignedExchangeError.from_json(i) for i in json['errors']] if json.get('errors', None) is not None else None,
+            header=SignedExchangeHeader.from_json(_header) if (_header := json.get('header')) is not None else None,
+            security_details=SecurityDetails.from_json(_security_details) if (_security_details := json.get('securityDetails')) is not None else None,
+            errors=[SignedExchangeError.from_json(i) for i in _errors] if (_errors := json.get('errors')) is not None else None,
         )
 
 
@@ -1998,7 +2062,10 @@ class ContentEncoding(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentEncoding:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class DirectSocketDnsQueryType(enum.Enum):
@@ -2010,7 +2077,10 @@ class DirectSocketDnsQueryType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DirectSocketDnsQueryType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2039,17 +2109,17 @@ class DirectTCPSocketOptions:
         if self.receive_buffer_size is not None:
             json['receiveBufferSize'] = self.receive_buffer_size
         if self.dns_query_type is not None:
-            json['dnsQueryType'] = self.dns_query_type.to_json()
+            json['dnsQueryType'] = self.dns_query_type.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DirectTCPSocketOptions:
+    def from_json(cls, json: DirectTCPSocketOptionsJSON) -> DirectTCPSocketOptions:
         return cls(
-            no_delay=bool(json['noDelay']),
-            keep_alive_delay=float(json['keepAliveDelay']) if json.get('keepAliveDelay', None) is not None else None,
-            send_buffer_size=float(json['sendBufferSize']) if json.get('sendBufferSize', None) is not None else None,
-            receive_buffer_size=float(json['receiveBufferSize']) if json.get('receiveBufferSize', None) is not None else None,
-            dns_query_type=DirectSocketDnsQueryType.from_json(json['dnsQueryType']) if json.get('dnsQueryType', None) is not None else None,
+            no_delay=json['noDelay'],
+            keep_alive_delay=float(_keep_alive_delay) if (_keep_alive_delay := json.get('keepAliveDelay')) is not None else None,
+            send_buffer_size=float(_send_buffer_size) if (_send_buffer_size := json.get('sendBufferSize')) is not None else None,
+            receive_buffer_size=float(_receive_buffer_size) if (_receive_buffer_size := json.get('receiveBufferSize')) is not None else None,
+            dns_query_type=DirectSocketDnsQueryType.from_json(_dns_query_type) if (_dns_query_type := json.get('dnsQueryType')) is not None else None,
         )
 
 
@@ -2066,7 +2136,10 @@ class PrivateNetworkRequestPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrivateNetworkRequestPolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class IPAddressSpace(enum.Enum):
@@ -2080,7 +2153,10 @@ class IPAddressSpace(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> IPAddressSpace:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2096,7 +2172,7 @@ class ConnectTiming:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ConnectTiming:
+    def from_json(cls, json: ConnectTimingJSON) -> ConnectTiming:
         return cls(
             request_time=float(json['requestTime']),
         )
@@ -2113,14 +2189,14 @@ class ClientSecurityState:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['initiatorIsSecureContext'] = self.initiator_is_secure_context
-        json['initiatorIPAddressSpace'] = self.initiator_ip_address_space.to_json()
-        json['privateNetworkRequestPolicy'] = self.private_network_request_policy.to_json()
+        json['initiatorIPAddressSpace'] = self.initiator_ip_address_space.value
+        json['privateNetworkRequestPolicy'] = self.private_network_request_policy.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ClientSecurityState:
+    def from_json(cls, json: ClientSecurityStateJSON) -> ClientSecurityState:
         return cls(
-            initiator_is_secure_context=bool(json['initiatorIsSecureContext']),
+            initiator_is_secure_context=json['initiatorIsSecureContext'],
             initiator_ip_address_space=IPAddressSpace.from_json(json['initiatorIPAddressSpace']),
             private_network_request_policy=PrivateNetworkRequestPolicy.from_json(json['privateNetworkRequestPolicy']),
         )
@@ -2140,7 +2216,10 @@ class CrossOriginOpenerPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginOpenerPolicyValue:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2155,8 +2234,8 @@ class CrossOriginOpenerPolicyStatus:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['value'] = self.value.to_json()
-        json['reportOnlyValue'] = self.report_only_value.to_json()
+        json['value'] = self.value.value
+        json['reportOnlyValue'] = self.report_only_value.value
         if self.reporting_endpoint is not None:
             json['reportingEndpoint'] = self.reporting_endpoint
         if self.report_only_reporting_endpoint is not None:
@@ -2164,12 +2243,12 @@ class CrossOriginOpenerPolicyStatus:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CrossOriginOpenerPolicyStatus:
+    def from_json(cls, json: CrossOriginOpenerPolicyStatusJSON) -> CrossOriginOpenerPolicyStatus:
         return cls(
             value=CrossOriginOpenerPolicyValue.from_json(json['value']),
             report_only_value=CrossOriginOpenerPolicyValue.from_json(json['reportOnlyValue']),
-            reporting_endpoint=str(json['reportingEndpoint']) if json.get('reportingEndpoint', None) is not None else None,
-            report_only_reporting_endpoint=str(json['reportOnlyReportingEndpoint']) if json.get('reportOnlyReportingEndpoint', None) is not None else None,
+            reporting_endpoint=json.get('reportingEndpoint'),
+            report_only_reporting_endpoint=json.get('reportOnlyReportingEndpoint'),
         )
 
 
@@ -2183,7 +2262,10 @@ class CrossOriginEmbedderPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginEmbedderPolicyValue:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2198,8 +2280,8 @@ class CrossOriginEmbedderPolicyStatus:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['value'] = self.value.to_json()
-        json['reportOnlyValue'] = self.report_only_value.to_json()
+        json['value'] = self.value.value
+        json['reportOnlyValue'] = self.report_only_value.value
         if self.reporting_endpoint is not None:
             json['reportingEndpoint'] = self.reporting_endpoint
         if self.report_only_reporting_endpoint is not None:
@@ -2207,12 +2289,12 @@ class CrossOriginEmbedderPolicyStatus:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CrossOriginEmbedderPolicyStatus:
+    def from_json(cls, json: CrossOriginEmbedderPolicyStatusJSON) -> CrossOriginEmbedderPolicyStatus:
         return cls(
             value=CrossOriginEmbedderPolicyValue.from_json(json['value']),
             report_only_value=CrossOriginEmbedderPolicyValue.from_json(json['reportOnlyValue']),
-            reporting_endpoint=str(json['reportingEndpoint']) if json.get('reportingEndpoint', None) is not None else None,
-            report_only_reporting_endpoint=str(json['reportOnlyReportingEndpoint']) if json.get('reportOnlyReportingEndpoint', None) is not None else None,
+            reporting_endpoint=json.get('reportingEndpoint'),
+            report_only_reporting_endpoint=json.get('reportOnlyReportingEndpoint'),
         )
 
 
@@ -2225,7 +2307,10 @@ class ContentSecurityPolicySource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicySource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2240,14 +2325,14 @@ class ContentSecurityPolicyStatus:
         json: T_JSON_DICT = dict()
         json['effectiveDirectives'] = self.effective_directives
         json['isEnforced'] = self.is_enforced
-        json['source'] = self.source.to_json()
+        json['source'] = self.source.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyStatus:
+    def from_json(cls, json: ContentSecurityPolicyStatusJSON) -> ContentSecurityPolicyStatus:
         return cls(
-            effective_directives=str(json['effectiveDirectives']),
-            is_enforced=bool(json['isEnforced']),
+            effective_directives=json['effectiveDirectives'],
+            is_enforced=json['isEnforced'],
             source=ContentSecurityPolicySource.from_json(json['source']),
         )
 
@@ -2271,11 +2356,11 @@ class SecurityIsolationStatus:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SecurityIsolationStatus:
+    def from_json(cls, json: SecurityIsolationStatusJSON) -> SecurityIsolationStatus:
         return cls(
-            coop=CrossOriginOpenerPolicyStatus.from_json(json['coop']) if json.get('coop', None) is not None else None,
-            coep=CrossOriginEmbedderPolicyStatus.from_json(json['coep']) if json.get('coep', None) is not None else None,
-            csp=[ContentSecurityPolicyStatus.from_json(i) for i in json['csp']] if json.get('csp', None) is not None else None,
+            coop=CrossOriginOpenerPolicyStatus.from_json(_coop) if (_coop := json.get('coop')) is not None else None,
+            coep=CrossOriginEmbedderPolicyStatus.from_json(_coep) if (_coep := json.get('coep')) is not None else None,
+            csp=[ContentSecurityPolicyStatus.from_json(i) for i in _csp] if (_csp := json.get('csp')) is not None else None,
         )
 
 
@@ -2293,7 +2378,10 @@ class ReportStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReportStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ReportId(str):
@@ -2339,28 +2427,28 @@ class ReportingApiReport:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['id'] = self.id_.to_json()
+        json['id'] = self.id_
         json['initiatorUrl'] = self.initiator_url
         json['destination'] = self.destination
         json['type'] = self.type_
-        json['timestamp'] = self.timestamp.to_json()
+        json['timestamp'] = self.timestamp
         json['depth'] = self.depth
         json['completedAttempts'] = self.completed_attempts
         json['body'] = self.body
-        json['status'] = self.status.to_json()
+        json['status'] = self.status.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportingApiReport:
+    def from_json(cls, json: ReportingApiReportJSON) -> ReportingApiReport:
         return cls(
-            id_=ReportId.from_json(json['id']),
-            initiator_url=str(json['initiatorUrl']),
-            destination=str(json['destination']),
-            type_=str(json['type']),
-            timestamp=TimeSinceEpoch.from_json(json['timestamp']),
-            depth=int(json['depth']),
-            completed_attempts=int(json['completedAttempts']),
-            body=dict(json['body']),
+            id_=ReportId(json['id']),
+            initiator_url=json['initiatorUrl'],
+            destination=json['destination'],
+            type_=json['type'],
+            timestamp=TimeSinceEpoch(json['timestamp']),
+            depth=json['depth'],
+            completed_attempts=json['completedAttempts'],
+            body=json['body'],
             status=ReportStatus.from_json(json['status']),
         )
 
@@ -2380,10 +2468,10 @@ class ReportingApiEndpoint:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpoint:
+    def from_json(cls, json: ReportingApiEndpointJSON) -> ReportingApiEndpoint:
         return cls(
-            url=str(json['url']),
-            group_name=str(json['groupName']),
+            url=json['url'],
+            group_name=json['groupName'],
         )
 
 
@@ -2417,20 +2505,20 @@ class LoadNetworkResourcePageResult:
         if self.http_status_code is not None:
             json['httpStatusCode'] = self.http_status_code
         if self.stream is not None:
-            json['stream'] = self.stream.to_json()
+            json['stream'] = self.stream
         if self.headers is not None:
-            json['headers'] = self.headers.to_json()
+            json['headers'] = self.headers
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourcePageResult:
+    def from_json(cls, json: LoadNetworkResourcePageResultJSON) -> LoadNetworkResourcePageResult:
         return cls(
-            success=bool(json['success']),
-            net_error=float(json['netError']) if json.get('netError', None) is not None else None,
-            net_error_name=str(json['netErrorName']) if json.get('netErrorName', None) is not None else None,
-            http_status_code=float(json['httpStatusCode']) if json.get('httpStatusCode', None) is not None else None,
-            stream=io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None,
-            headers=Headers.from_json(json['headers']) if json.get('headers', None) is not None else None,
+            success=json['success'],
+            net_error=float(_net_error) if (_net_error := json.get('netError')) is not None else None,
+            net_error_name=json.get('netErrorName'),
+            http_status_code=float(_http_status_code) if (_http_status_code := json.get('httpStatusCode')) is not None else None,
+            stream=io.StreamHandle(_stream) if (_stream := json.get('stream')) is not None else None,
+            headers=Headers(_headers) if (_headers := json.get('headers')) is not None else None,
         )
 
 
@@ -2451,16 +2539,16 @@ class LoadNetworkResourceOptions:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourceOptions:
+    def from_json(cls, json: LoadNetworkResourceOptionsJSON) -> LoadNetworkResourceOptions:
         return cls(
-            disable_cache=bool(json['disableCache']),
-            include_credentials=bool(json['includeCredentials']),
+            disable_cache=json['disableCache'],
+            include_credentials=json['includeCredentials'],
         )
 
 
 def set_accepted_encodings(
         encodings: typing.List[ContentEncoding]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets a list of content encodings that will be accepted. Empty list means no encoding is accepted.
 
@@ -2469,28 +2557,25 @@ def set_accepted_encodings(
     :param encodings: List of accepted content encodings.
     '''
     params: T_JSON_DICT = dict()
-    params['encodings'] = [i.to_json() for i in encodings]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setAcceptedEncodings',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['encodings'] = [i.value for i in encodings]
+    return Command('Network.setAcceptedEncodings', params)
 
 
-def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_accepted_encodings_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears accepted encodings set by setAcceptedEncodings
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.clearAcceptedEncodingsOverride',
-    }
-    json = yield cmd_dict
+    return Command('Network.clearAcceptedEncodingsOverride')
+
+
+def _parse_can_clear_browser_cache(json: CanClearBrowserCacheReturnsJSON) -> bool:
+    return json['result']
 
 
 @deprecated(version="1.3")
-def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+def can_clear_browser_cache() -> Command[CanClearBrowserCacheReturnsJSON, bool]:
     '''
     Tells whether clearing browser cache is supported.
 
@@ -2498,15 +2583,15 @@ def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
 
     :returns: True if browser cache can be cleared.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.canClearBrowserCache',
-    }
-    json = yield cmd_dict
-    return bool(json['result'])
+    return Command('Network.canClearBrowserCache', None, _parse_can_clear_browser_cache)
+
+
+def _parse_can_clear_browser_cookies(json: CanClearBrowserCookiesReturnsJSON) -> bool:
+    return json['result']
 
 
 @deprecated(version="1.3")
-def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+def can_clear_browser_cookies() -> Command[CanClearBrowserCookiesReturnsJSON, bool]:
     '''
     Tells whether clearing browser cookies is supported.
 
@@ -2514,15 +2599,15 @@ def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool
 
     :returns: True if browser cookies can be cleared.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.canClearBrowserCookies',
-    }
-    json = yield cmd_dict
-    return bool(json['result'])
+    return Command('Network.canClearBrowserCookies', None, _parse_can_clear_browser_cookies)
+
+
+def _parse_can_emulate_network_conditions(json: CanEmulateNetworkConditionsReturnsJSON) -> bool:
+    return json['result']
 
 
 @deprecated(version="1.3")
-def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+def can_emulate_network_conditions() -> Command[CanEmulateNetworkConditionsReturnsJSON, bool]:
     '''
     Tells whether emulation of network conditions is supported.
 
@@ -2530,31 +2615,21 @@ def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT
 
     :returns: True if emulation of network conditions is supported.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.canEmulateNetworkConditions',
-    }
-    json = yield cmd_dict
-    return bool(json['result'])
+    return Command('Network.canEmulateNetworkConditions', None, _parse_can_emulate_network_conditions)
 
 
-def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_browser_cache() -> Command[T_JSON_DICT, None]:
     '''
     Clears browser cache.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.clearBrowserCache',
-    }
-    json = yield cmd_dict
+    return Command('Network.clearBrowserCache')
 
 
-def clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_browser_cookies() -> Command[T_JSON_DICT, None]:
     '''
     Clears browser cookies.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.clearBrowserCookies',
-    }
-    json = yield cmd_dict
+    return Command('Network.clearBrowserCookies')
 
 
 @deprecated(version="1.3")
@@ -2567,7 +2642,7 @@ def continue_intercepted_request(
         post_data: typing.Optional[str] = None,
         headers: typing.Optional[Headers] = None,
         auth_challenge_response: typing.Optional[AuthChallengeResponse] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Response to Network.requestIntercepted which either modifies the request to continue with any
     modifications, or blocks it, or completes it with the provided response bytes. If a network
@@ -2589,9 +2664,9 @@ def continue_intercepted_request(
     :param auth_challenge_response: *(Optional)* Response to a requestIntercepted with an authChallenge. Must not be set otherwise.
     '''
     params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
+    params['interceptionId'] = interception_id
     if error_reason is not None:
-        params['errorReason'] = error_reason.to_json()
+        params['errorReason'] = error_reason.value
     if raw_response is not None:
         params['rawResponse'] = raw_response
     if url is not None:
@@ -2601,14 +2676,10 @@ def continue_intercepted_request(
     if post_data is not None:
         params['postData'] = post_data
     if headers is not None:
-        params['headers'] = headers.to_json()
+        params['headers'] = headers
     if auth_challenge_response is not None:
         params['authChallengeResponse'] = auth_challenge_response.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.continueInterceptedRequest',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.continueInterceptedRequest', params)
 
 
 def delete_cookies(
@@ -2617,7 +2688,7 @@ def delete_cookies(
         domain: typing.Optional[str] = None,
         path: typing.Optional[str] = None,
         partition_key: typing.Optional[CookiePartitionKey] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes browser cookies with matching name and url or domain/path/partitionKey pair.
 
@@ -2637,21 +2708,14 @@ def delete_cookies(
         params['path'] = path
     if partition_key is not None:
         params['partitionKey'] = partition_key.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.deleteCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.deleteCookies', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables network tracking, prevents network events from being sent to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.disable',
-    }
-    json = yield cmd_dict
+    return Command('Network.disable')
 
 
 def emulate_network_conditions(
@@ -2663,7 +2727,7 @@ def emulate_network_conditions(
         packet_loss: typing.Optional[float] = None,
         packet_queue_length: typing.Optional[int] = None,
         packet_reordering: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Activates emulation of network conditions.
 
@@ -2682,25 +2746,21 @@ def emulate_network_conditions(
     params['downloadThroughput'] = download_throughput
     params['uploadThroughput'] = upload_throughput
     if connection_type is not None:
-        params['connectionType'] = connection_type.to_json()
+        params['connectionType'] = connection_type.value
     if packet_loss is not None:
         params['packetLoss'] = packet_loss
     if packet_queue_length is not None:
         params['packetQueueLength'] = packet_queue_length
     if packet_reordering is not None:
         params['packetReordering'] = packet_reordering
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.emulateNetworkConditions',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.emulateNetworkConditions', params)
 
 
 def enable(
         max_total_buffer_size: typing.Optional[int] = None,
         max_resource_buffer_size: typing.Optional[int] = None,
         max_post_data_size: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables network tracking, network events will now be delivered to the client.
 
@@ -2715,15 +2775,15 @@ def enable(
         params['maxResourceBufferSize'] = max_resource_buffer_size
     if max_post_data_size is not None:
         params['maxPostDataSize'] = max_post_data_size
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.enable', params)
+
+
+def _parse_get_all_cookies(json: GetAllCookiesReturnsJSON) -> typing.List[Cookie]:
+    return [Cookie.from_json(i) for i in json['cookies']]
 
 
 @deprecated(version="1.3")
-def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cookie]]:
+def get_all_cookies() -> Command[GetAllCookiesReturnsJSON, typing.List[Cookie]]:
     '''
     Returns all browser cookies. Depending on the backend support, will return detailed cookie
     information in the ``cookies`` field.
@@ -2733,16 +2793,16 @@ def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Co
 
     :returns: Array of cookie objects.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getAllCookies',
-    }
-    json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+    return Command('Network.getAllCookies', None, _parse_get_all_cookies)
+
+
+def _parse_get_certificate(json: GetCertificateReturnsJSON) -> typing.List[str]:
+    return json['tableNames']
 
 
 def get_certificate(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[GetCertificateReturnsJSON, typing.List[str]]:
     '''
     Returns the DER-encoded certificate.
 
@@ -2753,17 +2813,16 @@ def get_certificate(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getCertificate',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['tableNames']]
+    return Command('Network.getCertificate', params, _parse_get_certificate)
+
+
+def _parse_get_cookies(json: GetCookiesReturnsJSON) -> typing.List[Cookie]:
+    return [Cookie.from_json(i) for i in json['cookies']]
 
 
 def get_cookies(
         urls: typing.Optional[typing.List[str]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cookie]]:
+    ) -> Command[GetCookiesReturnsJSON, typing.List[Cookie]]:
     '''
     Returns all browser cookies for the current URL. Depending on the backend support, will return
     detailed cookie information in the ``cookies`` field.
@@ -2773,18 +2832,20 @@ def get_cookies(
     '''
     params: T_JSON_DICT = dict()
     if urls is not None:
-        params['urls'] = [i for i in urls]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+        params['urls'] = list(urls)
+    return Command('Network.getCookies', params, _parse_get_cookies)
+
+
+def _parse_get_response_body(json: GetResponseBodyReturnsJSON) -> typing.Tuple[str, bool]:
+    return (
+        json['body'],
+        json['base64Encoded']
+    )
 
 
 def get_response_body(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
+    ) -> Command[GetResponseBodyReturnsJSON, typing.Tuple[str, bool]]:
     '''
     Returns content served for the given request.
 
@@ -2795,21 +2856,17 @@ def get_response_body(
         1. **base64Encoded** - True, if content was sent as base64.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getResponseBody',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    params['requestId'] = request_id
+    return Command('Network.getResponseBody', params, _parse_get_response_body)
+
+
+def _parse_get_request_post_data(json: GetRequestPostDataReturnsJSON) -> str:
+    return json['postData']
 
 
 def get_request_post_data(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[GetRequestPostDataReturnsJSON, str]:
     '''
     Returns post data sent with the request. Returns an error when no data was sent with the request.
 
@@ -2817,18 +2874,20 @@ def get_request_post_data(
     :returns: Request body string, omitting files from multipart requests
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getRequestPostData',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['postData'])
+    params['requestId'] = request_id
+    return Command('Network.getRequestPostData', params, _parse_get_request_post_data)
+
+
+def _parse_get_response_body_for_interception(json: GetResponseBodyForInterceptionReturnsJSON) -> typing.Tuple[str, bool]:
+    return (
+        json['body'],
+        json['base64Encoded']
+    )
 
 
 def get_response_body_for_interception(
         interception_id: InterceptionId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
+    ) -> Command[GetResponseBodyForInterceptionReturnsJSON, typing.Tuple[str, bool]]:
     '''
     Returns content served for the given currently intercepted request.
 
@@ -2841,21 +2900,17 @@ def get_response_body_for_interception(
         1. **base64Encoded** - True, if content was sent as base64.
     '''
     params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getResponseBodyForInterception',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    params['interceptionId'] = interception_id
+    return Command('Network.getResponseBodyForInterception', params, _parse_get_response_body_for_interception)
+
+
+def _parse_take_response_body_for_interception_as_stream(json: TakeResponseBodyForInterceptionAsStreamReturnsJSON) -> io.StreamHandle:
+    return io.StreamHandle(json['stream'])
 
 
 def take_response_body_for_interception_as_stream(
         interception_id: InterceptionId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,io.StreamHandle]:
+    ) -> Command[TakeResponseBodyForInterceptionAsStreamReturnsJSON, io.StreamHandle]:
     '''
     Returns a handle to the stream representing the response body. Note that after this command,
     the intercepted request can't be continued as is -- you either need to cancel it or to provide
@@ -2868,18 +2923,13 @@ def take_response_body_for_interception_as_stream(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.takeResponseBodyForInterceptionAsStream',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    params['interceptionId'] = interception_id
+    return Command('Network.takeResponseBodyForInterceptionAsStream', params, _parse_take_response_body_for_interception_as_stream)
 
 
 def replay_xhr(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     This method sends a new XMLHttpRequest which is identical to the original one. The following
     parameters should be identical: method, url, async, request body, extra headers, withCredentials
@@ -2890,12 +2940,12 @@ def replay_xhr(
     :param request_id: Identifier of XHR to replay.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.replayXHR',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['requestId'] = request_id
+    return Command('Network.replayXHR', params)
+
+
+def _parse_search_in_response_body(json: SearchInResponseBodyReturnsJSON) -> typing.List[debugger.SearchMatch]:
+    return [debugger.SearchMatch.from_json(i) for i in json['result']]
 
 
 def search_in_response_body(
@@ -2903,7 +2953,7 @@ def search_in_response_body(
         query: str,
         case_sensitive: typing.Optional[bool] = None,
         is_regex: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[debugger.SearchMatch]]:
+    ) -> Command[SearchInResponseBodyReturnsJSON, typing.List[debugger.SearchMatch]]:
     '''
     Searches for given string in response content.
 
@@ -2916,23 +2966,18 @@ def search_in_response_body(
     :returns: List of search matches.
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params['requestId'] = request_id
     params['query'] = query
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.searchInResponseBody',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return Command('Network.searchInResponseBody', params, _parse_search_in_response_body)
 
 
 def set_blocked_ur_ls(
         urls: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Blocks URLs from loading.
 
@@ -2941,17 +2986,13 @@ def set_blocked_ur_ls(
     :param urls: URL patterns to block. Wildcards ('*') are allowed.
     '''
     params: T_JSON_DICT = dict()
-    params['urls'] = [i for i in urls]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setBlockedURLs',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['urls'] = list(urls)
+    return Command('Network.setBlockedURLs', params)
 
 
 def set_bypass_service_worker(
         bypass: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Toggles ignoring of service worker for each request.
 
@@ -2959,16 +3000,12 @@ def set_bypass_service_worker(
     '''
     params: T_JSON_DICT = dict()
     params['bypass'] = bypass
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setBypassServiceWorker',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setBypassServiceWorker', params)
 
 
 def set_cache_disabled(
         cache_disabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Toggles ignoring cache for each request. If ``true``, cache will not be used.
 
@@ -2976,11 +3013,11 @@ def set_cache_disabled(
     '''
     params: T_JSON_DICT = dict()
     params['cacheDisabled'] = cache_disabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setCacheDisabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setCacheDisabled', params)
+
+
+def _parse_set_cookie(json: SetCookieReturnsJSON) -> bool:
+    return json['success']
 
 
 def set_cookie(
@@ -2998,7 +3035,7 @@ def set_cookie(
         source_scheme: typing.Optional[CookieSourceScheme] = None,
         source_port: typing.Optional[int] = None,
         partition_key: typing.Optional[CookiePartitionKey] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+    ) -> Command[SetCookieReturnsJSON, bool]:
     '''
     Sets a cookie with the given cookie data; may overwrite equivalent cookies if they exist.
 
@@ -3032,30 +3069,25 @@ def set_cookie(
     if http_only is not None:
         params['httpOnly'] = http_only
     if same_site is not None:
-        params['sameSite'] = same_site.to_json()
+        params['sameSite'] = same_site.value
     if expires is not None:
-        params['expires'] = expires.to_json()
+        params['expires'] = expires
     if priority is not None:
-        params['priority'] = priority.to_json()
+        params['priority'] = priority.value
     if same_party is not None:
         params['sameParty'] = same_party
     if source_scheme is not None:
-        params['sourceScheme'] = source_scheme.to_json()
+        params['sourceScheme'] = source_scheme.value
     if source_port is not None:
         params['sourcePort'] = source_port
     if partition_key is not None:
         params['partitionKey'] = partition_key.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setCookie',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return bool(json['success'])
+    return Command('Network.setCookie', params, _parse_set_cookie)
 
 
 def set_cookies(
         cookies: typing.List[CookieParam]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets given cookies.
 
@@ -3063,33 +3095,25 @@ def set_cookies(
     '''
     params: T_JSON_DICT = dict()
     params['cookies'] = [i.to_json() for i in cookies]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setCookies', params)
 
 
 def set_extra_http_headers(
         headers: Headers
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Specifies whether to always send extra HTTP headers with the requests from this page.
 
     :param headers: Map with extra HTTP headers.
     '''
     params: T_JSON_DICT = dict()
-    params['headers'] = headers.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setExtraHTTPHeaders',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['headers'] = headers
+    return Command('Network.setExtraHTTPHeaders', params)
 
 
 def set_attach_debug_stack(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Specifies whether to attach a page script stack id in requests
 
@@ -3099,17 +3123,13 @@ def set_attach_debug_stack(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setAttachDebugStack',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setAttachDebugStack', params)
 
 
 @deprecated(version="1.3")
 def set_request_interception(
         patterns: typing.List[RequestPattern]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets the requests to intercept that match the provided patterns and optionally resource types.
     Deprecated, please use Fetch.enable instead.
@@ -3122,11 +3142,7 @@ def set_request_interception(
     '''
     params: T_JSON_DICT = dict()
     params['patterns'] = [i.to_json() for i in patterns]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setRequestInterception',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setRequestInterception', params)
 
 
 def set_user_agent_override(
@@ -3134,7 +3150,7 @@ def set_user_agent_override(
         accept_language: typing.Optional[str] = None,
         platform: typing.Optional[str] = None,
         user_agent_metadata: typing.Optional[emulation.UserAgentMetadata] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Allows overriding user agent with the given string.
 
@@ -3151,16 +3167,16 @@ def set_user_agent_override(
         params['platform'] = platform
     if user_agent_metadata is not None:
         params['userAgentMetadata'] = user_agent_metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setUserAgentOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setUserAgentOverride', params)
+
+
+def _parse_stream_resource_content(json: StreamResourceContentReturnsJSON) -> str:
+    return json['bufferedData']
 
 
 def stream_resource_content(
         request_id: RequestId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[StreamResourceContentReturnsJSON, str]:
     '''
     Enables streaming of the response for the given requestId.
     If enabled, the dataReceived event contains the data that was received during streaming.
@@ -3171,18 +3187,17 @@ def stream_resource_content(
     :returns: Data that has been buffered until streaming is enabled. (Encoded as a base64 string when passed over JSON)
     '''
     params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.streamResourceContent',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['bufferedData'])
+    params['requestId'] = request_id
+    return Command('Network.streamResourceContent', params, _parse_stream_resource_content)
+
+
+def _parse_get_security_isolation_status(json: GetSecurityIsolationStatusReturnsJSON) -> SecurityIsolationStatus:
+    return SecurityIsolationStatus.from_json(json['status'])
 
 
 def get_security_isolation_status(
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SecurityIsolationStatus]:
+    ) -> Command[GetSecurityIsolationStatusReturnsJSON, SecurityIsolationStatus]:
     '''
     Returns information about the COEP/COOP isolation status.
 
@@ -3193,18 +3208,13 @@ def get_security_isolation_status(
     '''
     params: T_JSON_DICT = dict()
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.getSecurityIsolationStatus',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SecurityIsolationStatus.from_json(json['status'])
+        params['frameId'] = frame_id
+    return Command('Network.getSecurityIsolationStatus', params, _parse_get_security_isolation_status)
 
 
 def enable_reporting_api(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables tracking for the Reporting API, events generated by the Reporting API will now be delivered to the client.
     Enabling triggers 'reportingApiReportAdded' for all existing reports.
@@ -3215,18 +3225,18 @@ def enable_reporting_api(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.enableReportingApi',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.enableReportingApi', params)
+
+
+def _parse_load_network_resource(json: LoadNetworkResourceReturnsJSON) -> LoadNetworkResourcePageResult:
+    return LoadNetworkResourcePageResult.from_json(json['resource'])
 
 
 def load_network_resource(
         url: str,
         options: LoadNetworkResourceOptions,
         frame_id: typing.Optional[page.FrameId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,LoadNetworkResourcePageResult]:
+    ) -> Command[LoadNetworkResourceReturnsJSON, LoadNetworkResourcePageResult]:
     '''
     Fetches the resource and returns the content.
 
@@ -3239,22 +3249,17 @@ def load_network_resource(
     '''
     params: T_JSON_DICT = dict()
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
+        params['frameId'] = frame_id
     params['url'] = url
     params['options'] = options.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.loadNetworkResource',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return LoadNetworkResourcePageResult.from_json(json['resource'])
+    return Command('Network.loadNetworkResource', params, _parse_load_network_resource)
 
 
 def set_cookie_controls(
         enable_third_party_cookie_restriction: bool,
         disable_third_party_cookie_metadata: bool,
         disable_third_party_cookie_heuristics: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets Controls for third-party cookie access
     Page reload is required before the new cookie bahavior will be observed
@@ -3269,11 +3274,7 @@ def set_cookie_controls(
     params['enableThirdPartyCookieRestriction'] = enable_third_party_cookie_restriction
     params['disableThirdPartyCookieMetadata'] = disable_third_party_cookie_metadata
     params['disableThirdPartyCookieHeuristics'] = disable_third_party_cookie_heuristics
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Network.setCookieControls',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Network.setCookieControls', params)
 
 
 @event_class('Network.dataReceived')
@@ -3294,13 +3295,13 @@ class DataReceived:
     data: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DataReceived:
+    def from_json(cls, json: DataReceivedJSON) -> DataReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            data_length=int(json['dataLength']),
-            encoded_data_length=int(json['encodedDataLength']),
-            data=str(json['data']) if json.get('data', None) is not None else None
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            data_length=json['dataLength'],
+            encoded_data_length=json['encodedDataLength'],
+            data=json.get('data')
         )
 
 
@@ -3322,13 +3323,13 @@ class EventSourceMessageReceived:
     data: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> EventSourceMessageReceived:
+    def from_json(cls, json: EventSourceMessageReceivedJSON) -> EventSourceMessageReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            event_name=str(json['eventName']),
-            event_id=str(json['eventId']),
-            data=str(json['data'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            event_name=json['eventName'],
+            event_id=json['eventId'],
+            data=json['data']
         )
 
 
@@ -3354,15 +3355,15 @@ class LoadingFailed:
     cors_error_status: typing.Optional[CorsErrorStatus]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadingFailed:
+    def from_json(cls, json: LoadingFailedJSON) -> LoadingFailed:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             type_=ResourceType.from_json(json['type']),
-            error_text=str(json['errorText']),
-            canceled=bool(json['canceled']) if json.get('canceled', None) is not None else None,
-            blocked_reason=BlockedReason.from_json(json['blockedReason']) if json.get('blockedReason', None) is not None else None,
-            cors_error_status=CorsErrorStatus.from_json(json['corsErrorStatus']) if json.get('corsErrorStatus', None) is not None else None
+            error_text=json['errorText'],
+            canceled=json.get('canceled'),
+            blocked_reason=BlockedReason.from_json(_blocked_reason) if (_blocked_reason := json.get('blockedReason')) is not None else None,
+            cors_error_status=CorsErrorStatus.from_json(_cors_error_status) if (_cors_error_status := json.get('corsErrorStatus')) is not None else None
         )
 
 
@@ -3380,10 +3381,10 @@ class LoadingFinished:
     encoded_data_length: float
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadingFinished:
+    def from_json(cls, json: LoadingFinishedJSON) -> LoadingFinished:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             encoded_data_length=float(json['encodedDataLength'])
         )
 
@@ -3432,20 +3433,20 @@ class RequestIntercepted:
     request_id: typing.Optional[RequestId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestIntercepted:
+    def from_json(cls, json: RequestInterceptedJSON) -> RequestIntercepted:
         return cls(
-            interception_id=InterceptionId.from_json(json['interceptionId']),
+            interception_id=InterceptionId(json['interceptionId']),
             request=Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
+            frame_id=page.FrameId(json['frameId']),
             resource_type=ResourceType.from_json(json['resourceType']),
-            is_navigation_request=bool(json['isNavigationRequest']),
-            is_download=bool(json['isDownload']) if json.get('isDownload', None) is not None else None,
-            redirect_url=str(json['redirectUrl']) if json.get('redirectUrl', None) is not None else None,
-            auth_challenge=AuthChallenge.from_json(json['authChallenge']) if json.get('authChallenge', None) is not None else None,
-            response_error_reason=ErrorReason.from_json(json['responseErrorReason']) if json.get('responseErrorReason', None) is not None else None,
-            response_status_code=int(json['responseStatusCode']) if json.get('responseStatusCode', None) is not None else None,
-            response_headers=Headers.from_json(json['responseHeaders']) if json.get('responseHeaders', None) is not None else None,
-            request_id=RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None
+            is_navigation_request=json['isNavigationRequest'],
+            is_download=json.get('isDownload'),
+            redirect_url=json.get('redirectUrl'),
+            auth_challenge=AuthChallenge.from_json(_auth_challenge) if (_auth_challenge := json.get('authChallenge')) is not None else None,
+            response_error_reason=ErrorReason.from_json(_response_error_reason) if (_response_error_reason := json.get('responseErrorReason')) is not None else None,
+            response_status_code=json.get('responseStatusCode'),
+            response_headers=Headers(_response_headers) if (_response_headers := json.get('responseHeaders')) is not None else None,
+            request_id=RequestId(_request_id) if (_request_id := json.get('requestId')) is not None else None
         )
 
 
@@ -3459,9 +3460,9 @@ class RequestServedFromCache:
     request_id: RequestId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestServedFromCache:
+    def from_json(cls, json: RequestServedFromCacheJSON) -> RequestServedFromCache:
         return cls(
-            request_id=RequestId.from_json(json['requestId'])
+            request_id=RequestId(json['requestId'])
         )
 
 
@@ -3499,20 +3500,20 @@ class RequestWillBeSent:
     has_user_gesture: typing.Optional[bool]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSent:
+    def from_json(cls, json: RequestWillBeSentJSON) -> RequestWillBeSent:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            document_url=str(json['documentURL']),
+            request_id=RequestId(json['requestId']),
+            loader_id=LoaderId(json['loaderId']),
+            document_url=json['documentURL'],
             request=Request.from_json(json['request']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
+            timestamp=MonotonicTime(json['timestamp']),
+            wall_time=TimeSinceEpoch(json['wallTime']),
             initiator=Initiator.from_json(json['initiator']),
-            redirect_has_extra_info=bool(json['redirectHasExtraInfo']),
-            redirect_response=Response.from_json(json['redirectResponse']) if json.get('redirectResponse', None) is not None else None,
-            type_=ResourceType.from_json(json['type']) if json.get('type', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            has_user_gesture=bool(json['hasUserGesture']) if json.get('hasUserGesture', None) is not None else None
+            redirect_has_extra_info=json['redirectHasExtraInfo'],
+            redirect_response=Response.from_json(_redirect_response) if (_redirect_response := json.get('redirectResponse')) is not None else None,
+            type_=ResourceType.from_json(_type_) if (_type_ := json.get('type')) is not None else None,
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None,
+            has_user_gesture=json.get('hasUserGesture')
         )
 
 
@@ -3532,11 +3533,11 @@ class ResourceChangedPriority:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResourceChangedPriority:
+    def from_json(cls, json: ResourceChangedPriorityJSON) -> ResourceChangedPriority:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             new_priority=ResourcePriority.from_json(json['newPriority']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3554,9 +3555,9 @@ class SignedExchangeReceived:
     info: SignedExchangeInfo
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SignedExchangeReceived:
+    def from_json(cls, json: SignedExchangeReceivedJSON) -> SignedExchangeReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             info=SignedExchangeInfo.from_json(json['info'])
         )
 
@@ -3584,15 +3585,15 @@ class ResponseReceived:
     frame_id: typing.Optional[page.FrameId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResponseReceived:
+    def from_json(cls, json: ResponseReceivedJSON) -> ResponseReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            loader_id=LoaderId(json['loaderId']),
+            timestamp=MonotonicTime(json['timestamp']),
             type_=ResourceType.from_json(json['type']),
             response=Response.from_json(json['response']),
-            has_extra_info=bool(json['hasExtraInfo']),
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None
+            has_extra_info=json['hasExtraInfo'],
+            frame_id=page.FrameId(_frame_id) if (_frame_id := json.get('frameId')) is not None else None
         )
 
 
@@ -3608,10 +3609,10 @@ class WebSocketClosed:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketClosed:
+    def from_json(cls, json: WebSocketClosedJSON) -> WebSocketClosed:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3629,11 +3630,11 @@ class WebSocketCreated:
     initiator: typing.Optional[Initiator]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketCreated:
+    def from_json(cls, json: WebSocketCreatedJSON) -> WebSocketCreated:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            url=str(json['url']),
-            initiator=Initiator.from_json(json['initiator']) if json.get('initiator', None) is not None else None
+            request_id=RequestId(json['requestId']),
+            url=json['url'],
+            initiator=Initiator.from_json(_initiator) if (_initiator := json.get('initiator')) is not None else None
         )
 
 
@@ -3651,11 +3652,11 @@ class WebSocketFrameError:
     error_message: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameError:
+    def from_json(cls, json: WebSocketFrameErrorJSON) -> WebSocketFrameError:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            error_message=str(json['errorMessage'])
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            error_message=json['errorMessage']
         )
 
 
@@ -3673,10 +3674,10 @@ class WebSocketFrameReceived:
     response: WebSocketFrame
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameReceived:
+    def from_json(cls, json: WebSocketFrameReceivedJSON) -> WebSocketFrameReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketFrame.from_json(json['response'])
         )
 
@@ -3695,10 +3696,10 @@ class WebSocketFrameSent:
     response: WebSocketFrame
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameSent:
+    def from_json(cls, json: WebSocketFrameSentJSON) -> WebSocketFrameSent:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketFrame.from_json(json['response'])
         )
 
@@ -3717,10 +3718,10 @@ class WebSocketHandshakeResponseReceived:
     response: WebSocketResponse
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketHandshakeResponseReceived:
+    def from_json(cls, json: WebSocketHandshakeResponseReceivedJSON) -> WebSocketHandshakeResponseReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
             response=WebSocketResponse.from_json(json['response'])
         )
 
@@ -3741,11 +3742,11 @@ class WebSocketWillSendHandshakeRequest:
     request: WebSocketRequest
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebSocketWillSendHandshakeRequest:
+    def from_json(cls, json: WebSocketWillSendHandshakeRequestJSON) -> WebSocketWillSendHandshakeRequest:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
+            request_id=RequestId(json['requestId']),
+            timestamp=MonotonicTime(json['timestamp']),
+            wall_time=TimeSinceEpoch(json['wallTime']),
             request=WebSocketRequest.from_json(json['request'])
         )
 
@@ -3766,12 +3767,12 @@ class WebTransportCreated:
     initiator: typing.Optional[Initiator]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebTransportCreated:
+    def from_json(cls, json: WebTransportCreatedJSON) -> WebTransportCreated:
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            url=str(json['url']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            initiator=Initiator.from_json(json['initiator']) if json.get('initiator', None) is not None else None
+            transport_id=RequestId(json['transportId']),
+            url=json['url'],
+            timestamp=MonotonicTime(json['timestamp']),
+            initiator=Initiator.from_json(_initiator) if (_initiator := json.get('initiator')) is not None else None
         )
 
 
@@ -3787,10 +3788,10 @@ class WebTransportConnectionEstablished:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebTransportConnectionEstablished:
+    def from_json(cls, json: WebTransportConnectionEstablishedJSON) -> WebTransportConnectionEstablished:
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            transport_id=RequestId(json['transportId']),
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3806,10 +3807,10 @@ class WebTransportClosed:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebTransportClosed:
+    def from_json(cls, json: WebTransportClosedJSON) -> WebTransportClosed:
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            transport_id=RequestId(json['transportId']),
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3830,14 +3831,14 @@ class DirectTCPSocketCreated:
     initiator: typing.Optional[Initiator]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DirectTCPSocketCreated:
+    def from_json(cls, json: DirectTCPSocketCreatedJSON) -> DirectTCPSocketCreated:
         return cls(
-            identifier=RequestId.from_json(json['identifier']),
-            remote_addr=str(json['remoteAddr']),
-            remote_port=int(json['remotePort']),
+            identifier=RequestId(json['identifier']),
+            remote_addr=json['remoteAddr'],
+            remote_port=json['remotePort'],
             options=DirectTCPSocketOptions.from_json(json['options']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            initiator=Initiator.from_json(json['initiator']) if json.get('initiator', None) is not None else None
+            timestamp=MonotonicTime(json['timestamp']),
+            initiator=Initiator.from_json(_initiator) if (_initiator := json.get('initiator')) is not None else None
         )
 
 
@@ -3859,14 +3860,14 @@ class DirectTCPSocketOpened:
     local_port: typing.Optional[int]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DirectTCPSocketOpened:
+    def from_json(cls, json: DirectTCPSocketOpenedJSON) -> DirectTCPSocketOpened:
         return cls(
-            identifier=RequestId.from_json(json['identifier']),
-            remote_addr=str(json['remoteAddr']),
-            remote_port=int(json['remotePort']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            local_addr=str(json['localAddr']) if json.get('localAddr', None) is not None else None,
-            local_port=int(json['localPort']) if json.get('localPort', None) is not None else None
+            identifier=RequestId(json['identifier']),
+            remote_addr=json['remoteAddr'],
+            remote_port=json['remotePort'],
+            timestamp=MonotonicTime(json['timestamp']),
+            local_addr=json.get('localAddr'),
+            local_port=json.get('localPort')
         )
 
 
@@ -3883,11 +3884,11 @@ class DirectTCPSocketAborted:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DirectTCPSocketAborted:
+    def from_json(cls, json: DirectTCPSocketAbortedJSON) -> DirectTCPSocketAborted:
         return cls(
-            identifier=RequestId.from_json(json['identifier']),
-            error_message=str(json['errorMessage']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            identifier=RequestId(json['identifier']),
+            error_message=json['errorMessage'],
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3903,10 +3904,10 @@ class DirectTCPSocketClosed:
     timestamp: MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DirectTCPSocketClosed:
+    def from_json(cls, json: DirectTCPSocketClosedJSON) -> DirectTCPSocketClosed:
         return cls(
-            identifier=RequestId.from_json(json['identifier']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            identifier=RequestId(json['identifier']),
+            timestamp=MonotonicTime(json['timestamp'])
         )
 
 
@@ -3936,14 +3937,14 @@ class RequestWillBeSentExtraInfo:
     site_has_cookie_in_other_partition: typing.Optional[bool]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSentExtraInfo:
+    def from_json(cls, json: RequestWillBeSentExtraInfoJSON) -> RequestWillBeSentExtraInfo:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             associated_cookies=[AssociatedCookie.from_json(i) for i in json['associatedCookies']],
-            headers=Headers.from_json(json['headers']),
+            headers=Headers(json['headers']),
             connect_timing=ConnectTiming.from_json(json['connectTiming']),
-            client_security_state=ClientSecurityState.from_json(json['clientSecurityState']) if json.get('clientSecurityState', None) is not None else None,
-            site_has_cookie_in_other_partition=bool(json['siteHasCookieInOtherPartition']) if json.get('siteHasCookieInOtherPartition', None) is not None else None
+            client_security_state=ClientSecurityState.from_json(_client_security_state) if (_client_security_state := json.get('clientSecurityState')) is not None else None,
+            site_has_cookie_in_other_partition=json.get('siteHasCookieInOtherPartition')
         )
 
 
@@ -3988,17 +3989,17 @@ class ResponseReceivedExtraInfo:
     exempted_cookies: typing.Optional[typing.List[ExemptedSetCookieWithReason]]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedExtraInfo:
+    def from_json(cls, json: ResponseReceivedExtraInfoJSON) -> ResponseReceivedExtraInfo:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
+            request_id=RequestId(json['requestId']),
             blocked_cookies=[BlockedSetCookieWithReason.from_json(i) for i in json['blockedCookies']],
-            headers=Headers.from_json(json['headers']),
+            headers=Headers(json['headers']),
             resource_ip_address_space=IPAddressSpace.from_json(json['resourceIPAddressSpace']),
-            status_code=int(json['statusCode']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            cookie_partition_key=CookiePartitionKey.from_json(json['cookiePartitionKey']) if json.get('cookiePartitionKey', None) is not None else None,
-            cookie_partition_key_opaque=bool(json['cookiePartitionKeyOpaque']) if json.get('cookiePartitionKeyOpaque', None) is not None else None,
-            exempted_cookies=[ExemptedSetCookieWithReason.from_json(i) for i in json['exemptedCookies']] if json.get('exemptedCookies', None) is not None else None
+            status_code=json['statusCode'],
+            headers_text=json.get('headersText'),
+            cookie_partition_key=CookiePartitionKey.from_json(_cookie_partition_key) if (_cookie_partition_key := json.get('cookiePartitionKey')) is not None else None,
+            cookie_partition_key_opaque=json.get('cookiePartitionKeyOpaque'),
+            exempted_cookies=[ExemptedSetCookieWithReason.from_json(i) for i in _exempted_cookies] if (_exempted_cookies := json.get('exemptedCookies')) is not None else None
         )
 
 
@@ -4021,10 +4022,10 @@ class ResponseReceivedEarlyHints:
     headers: Headers
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedEarlyHints:
+    def from_json(cls, json: ResponseReceivedEarlyHintsJSON) -> ResponseReceivedEarlyHints:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            headers=Headers.from_json(json['headers'])
+            request_id=RequestId(json['requestId']),
+            headers=Headers(json['headers'])
         )
 
 
@@ -4054,14 +4055,14 @@ class TrustTokenOperationDone:
     issued_token_count: typing.Optional[int]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TrustTokenOperationDone:
+    def from_json(cls, json: TrustTokenOperationDoneJSON) -> TrustTokenOperationDone:
         return cls(
-            status=str(json['status']),
+            status=json['status'],
             type_=TrustTokenOperationType.from_json(json['type']),
-            request_id=RequestId.from_json(json['requestId']),
-            top_level_origin=str(json['topLevelOrigin']) if json.get('topLevelOrigin', None) is not None else None,
-            issuer_origin=str(json['issuerOrigin']) if json.get('issuerOrigin', None) is not None else None,
-            issued_token_count=int(json['issuedTokenCount']) if json.get('issuedTokenCount', None) is not None else None
+            request_id=RequestId(json['requestId']),
+            top_level_origin=json.get('topLevelOrigin'),
+            issuer_origin=json.get('issuerOrigin'),
+            issued_token_count=json.get('issuedTokenCount')
         )
 
 
@@ -4097,10 +4098,10 @@ class SubresourceWebBundleMetadataReceived:
     urls: typing.List[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataReceived:
+    def from_json(cls, json: SubresourceWebBundleMetadataReceivedJSON) -> SubresourceWebBundleMetadataReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            urls=[str(i) for i in json['urls']]
+            request_id=RequestId(json['requestId']),
+            urls=json['urls']
         )
 
 
@@ -4118,10 +4119,10 @@ class SubresourceWebBundleMetadataError:
     error_message: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataError:
+    def from_json(cls, json: SubresourceWebBundleMetadataErrorJSON) -> SubresourceWebBundleMetadataError:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            error_message=str(json['errorMessage'])
+            request_id=RequestId(json['requestId']),
+            error_message=json['errorMessage']
         )
 
 
@@ -4144,11 +4145,11 @@ class SubresourceWebBundleInnerResponseParsed:
     bundle_request_id: typing.Optional[RequestId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseParsed:
+    def from_json(cls, json: SubresourceWebBundleInnerResponseParsedJSON) -> SubresourceWebBundleInnerResponseParsed:
         return cls(
-            inner_request_id=RequestId.from_json(json['innerRequestId']),
-            inner_request_url=str(json['innerRequestURL']),
-            bundle_request_id=RequestId.from_json(json['bundleRequestId']) if json.get('bundleRequestId', None) is not None else None
+            inner_request_id=RequestId(json['innerRequestId']),
+            inner_request_url=json['innerRequestURL'],
+            bundle_request_id=RequestId(_bundle_request_id) if (_bundle_request_id := json.get('bundleRequestId')) is not None else None
         )
 
 
@@ -4172,12 +4173,12 @@ class SubresourceWebBundleInnerResponseError:
     bundle_request_id: typing.Optional[RequestId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseError:
+    def from_json(cls, json: SubresourceWebBundleInnerResponseErrorJSON) -> SubresourceWebBundleInnerResponseError:
         return cls(
-            inner_request_id=RequestId.from_json(json['innerRequestId']),
-            inner_request_url=str(json['innerRequestURL']),
-            error_message=str(json['errorMessage']),
-            bundle_request_id=RequestId.from_json(json['bundleRequestId']) if json.get('bundleRequestId', None) is not None else None
+            inner_request_id=RequestId(json['innerRequestId']),
+            inner_request_url=json['innerRequestURL'],
+            error_message=json['errorMessage'],
+            bundle_request_id=RequestId(_bundle_request_id) if (_bundle_request_id := json.get('bundleRequestId')) is not None else None
         )
 
 
@@ -4193,7 +4194,7 @@ class ReportingApiReportAdded:
     report: ReportingApiReport
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportAdded:
+    def from_json(cls, json: ReportingApiReportAddedJSON) -> ReportingApiReportAdded:
         return cls(
             report=ReportingApiReport.from_json(json['report'])
         )
@@ -4210,7 +4211,7 @@ class ReportingApiReportUpdated:
     report: ReportingApiReport
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportUpdated:
+    def from_json(cls, json: ReportingApiReportUpdatedJSON) -> ReportingApiReportUpdated:
         return cls(
             report=ReportingApiReport.from_json(json['report'])
         )
@@ -4229,8 +4230,763 @@ class ReportingApiEndpointsChangedForOrigin:
     endpoints: typing.List[ReportingApiEndpoint]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpointsChangedForOrigin:
+    def from_json(cls, json: ReportingApiEndpointsChangedForOriginJSON) -> ReportingApiEndpointsChangedForOrigin:
         return cls(
-            origin=str(json['origin']),
+            origin=json['origin'],
             endpoints=[ReportingApiEndpoint.from_json(i) for i in json['endpoints']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class _ResourceTimingJSON(typing.TypedDict):
+        requestTime: float
+        proxyStart: float
+        proxyEnd: float
+        dnsStart: float
+        dnsEnd: float
+        connectStart: float
+        connectEnd: float
+        sslStart: float
+        sslEnd: float
+        workerStart: float
+        workerReady: float
+        workerFetchStart: float
+        workerRespondWithSettled: float
+        sendStart: float
+        sendEnd: float
+        pushStart: float
+        pushEnd: float
+        receiveHeadersStart: float
+        receiveHeadersEnd: float
+
+
+    class ResourceTimingJSON(_ResourceTimingJSON, total=False):
+        workerRouterEvaluationStart: float
+        workerCacheLookupStart: float
+
+
+    class PostDataEntryJSON(typing.TypedDict, total=False):
+        bytes: str
+
+
+    class _RequestJSON(typing.TypedDict):
+        url: str
+        method: str
+        headers: dict
+        initialPriority: str
+        referrerPolicy: str
+
+
+    class RequestJSON(_RequestJSON, total=False):
+        urlFragment: str
+        postData: str
+        hasPostData: bool
+        postDataEntries: typing.List[PostDataEntryJSON]
+        mixedContentType: str
+        isLinkPreload: bool
+        trustTokenParams: TrustTokenParamsJSON
+        isSameSite: bool
+
+
+    class SignedCertificateTimestampJSON(typing.TypedDict):
+        status: str
+        origin: str
+        logDescription: str
+        logId: str
+        timestamp: float
+        hashAlgorithm: str
+        signatureAlgorithm: str
+        signatureData: str
+
+
+    class _SecurityDetailsJSON(typing.TypedDict):
+        protocol: str
+        keyExchange: str
+        cipher: str
+        certificateId: int
+        subjectName: str
+        sanList: typing.List[str]
+        issuer: str
+        validFrom: float
+        validTo: float
+        signedCertificateTimestampList: typing.List[SignedCertificateTimestampJSON]
+        certificateTransparencyCompliance: str
+        encryptedClientHello: bool
+
+
+    class SecurityDetailsJSON(_SecurityDetailsJSON, total=False):
+        keyExchangeGroup: str
+        mac: str
+        serverSignatureAlgorithm: int
+
+
+    class CorsErrorStatusJSON(typing.TypedDict):
+        corsError: str
+        failedParameter: str
+
+
+    class _TrustTokenParamsJSON(typing.TypedDict):
+        operation: str
+        refreshPolicy: str
+
+
+    class TrustTokenParamsJSON(_TrustTokenParamsJSON, total=False):
+        issuers: typing.List[str]
+
+
+    class ServiceWorkerRouterInfoJSON(typing.TypedDict, total=False):
+        ruleIdMatched: int
+        matchedSourceType: str
+        actualSourceType: str
+
+
+    class _ResponseJSON(typing.TypedDict):
+        url: str
+        status: int
+        statusText: str
+        headers: dict
+        mimeType: str
+        charset: str
+        connectionReused: bool
+        connectionId: float
+        encodedDataLength: float
+        securityState: str
+
+
+    class ResponseJSON(_ResponseJSON, total=False):
+        headersText: str
+        requestHeaders: dict
+        requestHeadersText: str
+        remoteIPAddress: str
+        remotePort: int
+        fromDiskCache: bool
+        fromServiceWorker: bool
+        fromPrefetchCache: bool
+        fromEarlyHints: bool
+        serviceWorkerRouterInfo: ServiceWorkerRouterInfoJSON
+        timing: ResourceTimingJSON
+        serviceWorkerResponseSource: str
+        responseTime: float
+        cacheStorageCacheName: str
+        protocol: str
+        alternateProtocolUsage: str
+        securityDetails: SecurityDetailsJSON
+
+
+    class WebSocketRequestJSON(typing.TypedDict):
+        headers: dict
+
+
+    class _WebSocketResponseJSON(typing.TypedDict):
+        status: int
+        statusText: str
+        headers: dict
+
+
+    class WebSocketResponseJSON(_WebSocketResponseJSON, total=False):
+        headersText: str
+        requestHeaders: dict
+        requestHeadersText: str
+
+
+    class WebSocketFrameJSON(typing.TypedDict):
+        opcode: float
+        mask: bool
+        payloadData: str
+
+
+    class _CachedResourceJSON(typing.TypedDict):
+        url: str
+        type: str
+        bodySize: float
+
+
+    class CachedResourceJSON(_CachedResourceJSON, total=False):
+        response: ResponseJSON
+
+
+    class _InitiatorJSON(typing.TypedDict):
+        type: str
+
+
+    class InitiatorJSON(_InitiatorJSON, total=False):
+        stack: runtime.StackTraceJSON
+        url: str
+        lineNumber: float
+        columnNumber: float
+        requestId: str
+
+
+    class CookiePartitionKeyJSON(typing.TypedDict):
+        topLevelSite: str
+        hasCrossSiteAncestor: bool
+
+
+    class _CookieJSON(typing.TypedDict):
+        name: str
+        value: str
+        domain: str
+        path: str
+        size: int
+        httpOnly: bool
+        secure: bool
+        session: bool
+        priority: str
+        sameParty: bool
+        sourceScheme: str
+        sourcePort: int
+
+
+    class CookieJSON(_CookieJSON, total=False):
+        expires: float
+        sameSite: str
+        partitionKey: CookiePartitionKeyJSON
+        partitionKeyOpaque: bool
+
+
+    class _BlockedSetCookieWithReasonJSON(typing.TypedDict):
+        blockedReasons: typing.List[str]
+        cookieLine: str
+
+
+    class BlockedSetCookieWithReasonJSON(_BlockedSetCookieWithReasonJSON, total=False):
+        cookie: CookieJSON
+
+
+    class ExemptedSetCookieWithReasonJSON(typing.TypedDict):
+        exemptionReason: str
+        cookieLine: str
+        cookie: CookieJSON
+
+
+    class _AssociatedCookieJSON(typing.TypedDict):
+        cookie: CookieJSON
+        blockedReasons: typing.List[str]
+
+
+    class AssociatedCookieJSON(_AssociatedCookieJSON, total=False):
+        exemptionReason: str
+
+
+    class _CookieParamJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class CookieParamJSON(_CookieParamJSON, total=False):
+        url: str
+        domain: str
+        path: str
+        secure: bool
+        httpOnly: bool
+        sameSite: str
+        expires: float
+        priority: str
+        sameParty: bool
+        sourceScheme: str
+        sourcePort: int
+        partitionKey: CookiePartitionKeyJSON
+
+
+    class _AuthChallengeJSON(typing.TypedDict):
+        origin: str
+        scheme: str
+        realm: str
+
+
+    class AuthChallengeJSON(_AuthChallengeJSON, total=False):
+        source: str
+
+
+    class _AuthChallengeResponseJSON(typing.TypedDict):
+        response: str
+
+
+    class AuthChallengeResponseJSON(_AuthChallengeResponseJSON, total=False):
+        username: str
+        password: str
+
+
+    class RequestPatternJSON(typing.TypedDict, total=False):
+        urlPattern: str
+        resourceType: str
+        interceptionStage: str
+
+
+    class _SignedExchangeSignatureJSON(typing.TypedDict):
+        label: str
+        signature: str
+        integrity: str
+        validityUrl: str
+        date: int
+        expires: int
+
+
+    class SignedExchangeSignatureJSON(_SignedExchangeSignatureJSON, total=False):
+        certUrl: str
+        certSha256: str
+        certificates: typing.List[str]
+
+
+    class SignedExchangeHeaderJSON(typing.TypedDict):
+        requestUrl: str
+        responseCode: int
+        responseHeaders: dict
+        signatures: typing.List[SignedExchangeSignatureJSON]
+        headerIntegrity: str
+
+
+    class _SignedExchangeErrorJSON(typing.TypedDict):
+        message: str
+
+
+    class SignedExchangeErrorJSON(_SignedExchangeErrorJSON, total=False):
+        signatureIndex: int
+        errorField: str
+
+
+    class _SignedExchangeInfoJSON(typing.TypedDict):
+        outerResponse: ResponseJSON
+
+
+    class SignedExchangeInfoJSON(_SignedExchangeInfoJSON, total=False):
+        header: SignedExchangeHeaderJSON
+        securityDetails: SecurityDetailsJSON
+        errors: typing.List[SignedExchangeErrorJSON]
+
+
+    class _DirectTCPSocketOptionsJSON(typing.TypedDict):
+        noDelay: bool
+
+
+    class DirectTCPSocketOptionsJSON(_DirectTCPSocketOptionsJSON, total=False):
+        keepAliveDelay: float
+        sendBufferSize: float
+        receiveBufferSize: float
+        dnsQueryType: str
+
+
+    class ConnectTimingJSON(typing.TypedDict):
+        requestTime: float
+
+
+    class ClientSecurityStateJSON(typing.TypedDict):
+        initiatorIsSecureContext: bool
+        initiatorIPAddressSpace: str
+        privateNetworkRequestPolicy: str
+
+
+    class _CrossOriginOpenerPolicyStatusJSON(typing.TypedDict):
+        value: str
+        reportOnlyValue: str
+
+
+    class CrossOriginOpenerPolicyStatusJSON(_CrossOriginOpenerPolicyStatusJSON, total=False):
+        reportingEndpoint: str
+        reportOnlyReportingEndpoint: str
+
+
+    class _CrossOriginEmbedderPolicyStatusJSON(typing.TypedDict):
+        value: str
+        reportOnlyValue: str
+
+
+    class CrossOriginEmbedderPolicyStatusJSON(_CrossOriginEmbedderPolicyStatusJSON, total=False):
+        reportingEndpoint: str
+        reportOnlyReportingEndpoint: str
+
+
+    class ContentSecurityPolicyStatusJSON(typing.TypedDict):
+        effectiveDirectives: str
+        isEnforced: bool
+        source: str
+
+
+    class SecurityIsolationStatusJSON(typing.TypedDict, total=False):
+        coop: CrossOriginOpenerPolicyStatusJSON
+        coep: CrossOriginEmbedderPolicyStatusJSON
+        csp: typing.List[ContentSecurityPolicyStatusJSON]
+
+
+    class ReportingApiReportJSON(typing.TypedDict):
+        id: str
+        initiatorUrl: str
+        destination: str
+        type: str
+        timestamp: float
+        depth: int
+        completedAttempts: int
+        body: dict
+        status: str
+
+
+    class ReportingApiEndpointJSON(typing.TypedDict):
+        url: str
+        groupName: str
+
+
+    class _LoadNetworkResourcePageResultJSON(typing.TypedDict):
+        success: bool
+
+
+    class LoadNetworkResourcePageResultJSON(_LoadNetworkResourcePageResultJSON, total=False):
+        netError: float
+        netErrorName: str
+        httpStatusCode: float
+        stream: str
+        headers: dict
+
+
+    class LoadNetworkResourceOptionsJSON(typing.TypedDict):
+        disableCache: bool
+        includeCredentials: bool
+
+
+    class CanClearBrowserCacheReturnsJSON(typing.TypedDict):
+        result: bool
+
+
+    class CanClearBrowserCookiesReturnsJSON(typing.TypedDict):
+        result: bool
+
+
+    class CanEmulateNetworkConditionsReturnsJSON(typing.TypedDict):
+        result: bool
+
+
+    class GetAllCookiesReturnsJSON(typing.TypedDict):
+        cookies: typing.List[CookieJSON]
+
+
+    class GetCertificateReturnsJSON(typing.TypedDict):
+        tableNames: typing.List[str]
+
+
+    class GetCookiesReturnsJSON(typing.TypedDict):
+        cookies: typing.List[CookieJSON]
+
+
+    class GetResponseBodyReturnsJSON(typing.TypedDict):
+        body: str
+        base64Encoded: bool
+
+
+    class GetRequestPostDataReturnsJSON(typing.TypedDict):
+        postData: str
+
+
+    class GetResponseBodyForInterceptionReturnsJSON(typing.TypedDict):
+        body: str
+        base64Encoded: bool
+
+
+    class TakeResponseBodyForInterceptionAsStreamReturnsJSON(typing.TypedDict):
+        stream: str
+
+
+    class SearchInResponseBodyReturnsJSON(typing.TypedDict):
+        result: typing.List[debugger.SearchMatchJSON]
+
+
+    class SetCookieReturnsJSON(typing.TypedDict):
+        success: bool
+
+
+    class StreamResourceContentReturnsJSON(typing.TypedDict):
+        bufferedData: str
+
+
+    class GetSecurityIsolationStatusReturnsJSON(typing.TypedDict):
+        status: SecurityIsolationStatusJSON
+
+
+    class LoadNetworkResourceReturnsJSON(typing.TypedDict):
+        resource: LoadNetworkResourcePageResultJSON
+
+
+    class _DataReceivedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        dataLength: int
+        encodedDataLength: int
+
+
+    class DataReceivedJSON(_DataReceivedJSON, total=False):
+        data: str
+
+
+    class EventSourceMessageReceivedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        eventName: str
+        eventId: str
+        data: str
+
+
+    class _LoadingFailedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        type: str
+        errorText: str
+
+
+    class LoadingFailedJSON(_LoadingFailedJSON, total=False):
+        canceled: bool
+        blockedReason: str
+        corsErrorStatus: CorsErrorStatusJSON
+
+
+    class LoadingFinishedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        encodedDataLength: float
+
+
+    class _RequestInterceptedJSON(typing.TypedDict):
+        interceptionId: str
+        request: RequestJSON
+        frameId: str
+        resourceType: str
+        isNavigationRequest: bool
+
+
+    class RequestInterceptedJSON(_RequestInterceptedJSON, total=False):
+        isDownload: bool
+        redirectUrl: str
+        authChallenge: AuthChallengeJSON
+        responseErrorReason: str
+        responseStatusCode: int
+        responseHeaders: dict
+        requestId: str
+
+
+    class RequestServedFromCacheJSON(typing.TypedDict):
+        requestId: str
+
+
+    class _RequestWillBeSentJSON(typing.TypedDict):
+        requestId: str
+        loaderId: str
+        documentURL: str
+        request: RequestJSON
+        timestamp: float
+        wallTime: float
+        initiator: InitiatorJSON
+        redirectHasExtraInfo: bool
+
+
+    class RequestWillBeSentJSON(_RequestWillBeSentJSON, total=False):
+        redirectResponse: ResponseJSON
+        type: str
+        frameId: str
+        hasUserGesture: bool
+
+
+    class ResourceChangedPriorityJSON(typing.TypedDict):
+        requestId: str
+        newPriority: str
+        timestamp: float
+
+
+    class SignedExchangeReceivedJSON(typing.TypedDict):
+        requestId: str
+        info: SignedExchangeInfoJSON
+
+
+    class _ResponseReceivedJSON(typing.TypedDict):
+        requestId: str
+        loaderId: str
+        timestamp: float
+        type: str
+        response: ResponseJSON
+        hasExtraInfo: bool
+
+
+    class ResponseReceivedJSON(_ResponseReceivedJSON, total=False):
+        frameId: str
+
+
+    class WebSocketClosedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+
+
+    class _WebSocketCreatedJSON(typing.TypedDict):
+        requestId: str
+        url: str
+
+
+    class WebSocketCreatedJSON(_WebSocketCreatedJSON, total=False):
+        initiator: InitiatorJSON
+
+
+    class WebSocketFrameErrorJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        errorMessage: str
+
+
+    class WebSocketFrameReceivedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        response: WebSocketFrameJSON
+
+
+    class WebSocketFrameSentJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        response: WebSocketFrameJSON
+
+
+    class WebSocketHandshakeResponseReceivedJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        response: WebSocketResponseJSON
+
+
+    class WebSocketWillSendHandshakeRequestJSON(typing.TypedDict):
+        requestId: str
+        timestamp: float
+        wallTime: float
+        request: WebSocketRequestJSON
+
+
+    class _WebTransportCreatedJSON(typing.TypedDict):
+        transportId: str
+        url: str
+        timestamp: float
+
+
+    class WebTransportCreatedJSON(_WebTransportCreatedJSON, total=False):
+        initiator: InitiatorJSON
+
+
+    class WebTransportConnectionEstablishedJSON(typing.TypedDict):
+        transportId: str
+        timestamp: float
+
+
+    class WebTransportClosedJSON(typing.TypedDict):
+        transportId: str
+        timestamp: float
+
+
+    class _DirectTCPSocketCreatedJSON(typing.TypedDict):
+        identifier: str
+        remoteAddr: str
+        remotePort: int
+        options: DirectTCPSocketOptionsJSON
+        timestamp: float
+
+
+    class DirectTCPSocketCreatedJSON(_DirectTCPSocketCreatedJSON, total=False):
+        initiator: InitiatorJSON
+
+
+    class _DirectTCPSocketOpenedJSON(typing.TypedDict):
+        identifier: str
+        remoteAddr: str
+        remotePort: int
+        timestamp: float
+
+
+    class DirectTCPSocketOpenedJSON(_DirectTCPSocketOpenedJSON, total=False):
+        localAddr: str
+        localPort: int
+
+
+    class DirectTCPSocketAbortedJSON(typing.TypedDict):
+        identifier: str
+        errorMessage: str
+        timestamp: float
+
+
+    class DirectTCPSocketClosedJSON(typing.TypedDict):
+        identifier: str
+        timestamp: float
+
+
+    class _RequestWillBeSentExtraInfoJSON(typing.TypedDict):
+        requestId: str
+        associatedCookies: typing.List[AssociatedCookieJSON]
+        headers: dict
+        connectTiming: ConnectTimingJSON
+
+
+    class RequestWillBeSentExtraInfoJSON(_RequestWillBeSentExtraInfoJSON, total=False):
+        clientSecurityState: ClientSecurityStateJSON
+        siteHasCookieInOtherPartition: bool
+
+
+    class _ResponseReceivedExtraInfoJSON(typing.TypedDict):
+        requestId: str
+        blockedCookies: typing.List[BlockedSetCookieWithReasonJSON]
+        headers: dict
+        resourceIPAddressSpace: str
+        statusCode: int
+
+
+    class ResponseReceivedExtraInfoJSON(_ResponseReceivedExtraInfoJSON, total=False):
+        headersText: str
+        cookiePartitionKey: CookiePartitionKeyJSON
+        cookiePartitionKeyOpaque: bool
+        exemptedCookies: typing.List[ExemptedSetCookieWithReasonJSON]
+
+
+    class ResponseReceivedEarlyHintsJSON(typing.TypedDict):
+        requestId: str
+        headers: dict
+
+
+    class _TrustTokenOperationDoneJSON(typing.TypedDict):
+        status: str
+        type: str
+        requestId: str
+
+
+    class TrustTokenOperationDoneJSON(_TrustTokenOperationDoneJSON, total=False):
+        topLevelOrigin: str
+        issuerOrigin: str
+        issuedTokenCount: int
+
+
+    class SubresourceWebBundleMetadataReceivedJSON(typing.TypedDict):
+        requestId: str
+        urls: typing.List[str]
+
+
+    class SubresourceWebBundleMetadataErrorJSON(typing.TypedDict):
+        requestId: str
+        errorMessage: str
+
+
+    class _SubresourceWebBundleInnerResponseParsedJSON(typing.TypedDict):
+        innerRequestId: str
+        innerRequestURL: str
+
+
+    class SubresourceWebBundleInnerResponseParsedJSON(_SubresourceWebBundleInnerResponseParsedJSON, total=False):
+        bundleRequestId: str
+
+
+    class _SubresourceWebBundleInnerResponseErrorJSON(typing.TypedDict):
+        innerRequestId: str
+        innerRequestURL: str
+        errorMessage: str
+
+
+    class SubresourceWebBundleInnerResponseErrorJSON(_SubresourceWebBundleInnerResponseErrorJSON, total=False):
+        bundleRequestId: str
+
+
+    class ReportingApiReportAddedJSON(typing.TypedDict):
+        report: ReportingApiReportJSON
+
+
+    class ReportingApiReportUpdatedJSON(typing.TypedDict):
+        report: ReportingApiReportJSON
+
+
+    class ReportingApiEndpointsChangedForOriginJSON(typing.TypedDict):
+        origin: str
+        endpoints: typing.List[ReportingApiEndpointJSON]
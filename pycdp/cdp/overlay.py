@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import dom
-from . import page
-from . import runtime
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+    from . import runtime
+else:
+    dom = lazy_import('dom', globals())
+    page = lazy_import('page', globals())
+    runtime = lazy_import('runtime', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -35,7 +39,7 @@ class SourceOrderConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SourceOrderConfig:
+    def from_json(cls, json: SourceOrderConfigJSON) -> SourceOrderConfig:
         return cls(
             parent_outline_color=dom.RGBA.from_json(json['parentOutlineColor']),
             child_outline_color=dom.RGBA.from_json(json['childOutlineColor']),
@@ -152,28 +156,28 @@ class GridHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> GridHighlightConfig:
+    def from_json(cls, json: GridHighlightConfigJSON) -> GridHighlightConfig:
         return cls(
-            show_grid_extension_lines=bool(json['showGridExtensionLines']) if json.get('showGridExtensionLines', None) is not None else None,
-            show_positive_line_numbers=bool(json['showPositiveLineNumbers']) if json.get('showPositiveLineNumbers', None) is not None else None,
-            show_negative_line_numbers=bool(json['showNegativeLineNumbers']) if json.get('showNegativeLineNumbers', None) is not None else None,
-            show_area_names=bool(json['showAreaNames']) if json.get('showAreaNames', None) is not None else None,
-            show_line_names=bool(json['showLineNames']) if json.get('showLineNames', None) is not None else None,
-            show_track_sizes=bool(json['showTrackSizes']) if json.get('showTrackSizes', None) is not None else None,
-            grid_border_color=dom.RGBA.from_json(json['gridBorderColor']) if json.get('gridBorderColor', None) is not None else None,
-            cell_border_color=dom.RGBA.from_json(json['cellBorderColor']) if json.get('cellBorderColor', None) is not None else None,
-            row_line_color=dom.RGBA.from_json(json['rowLineColor']) if json.get('rowLineColor', None) is not None else None,
-            column_line_color=dom.RGBA.from_json(json['columnLineColor']) if json.get('columnLineColor', None) is not None else None,
-            grid_border_dash=bool(json['gridBorderDash']) if json.get('gridBorderDash', None) is not None else None,
-            cell_border_dash=bool(json['cellBorderDash']) if json.get('cellBorderDash', None) is not None else None,
-            row_line_dash=bool(json['rowLineDash']) if json.get('rowLineDash', None) is not None else None,
-            column_line_dash=bool(json['columnLineDash']) if json.get('columnLineDash', None) is not None else None,
-            row_gap_color=dom.RGBA.from_json(json['rowGapColor']) if json.get('rowGapColor', None) is not None else None,
-            row_hatch_color=dom.RGBA.from_json(json['rowHatchColor']) if json.get('rowHatchColor', None) is not None else None,
-            column_gap_color=dom.RGBA.from_json(json['columnGapColor']) if json.get('columnGapColor', None) is not None else None,
-            column_hatch_color=dom.RGBA.from_json(json['columnHatchColor']) if json.get('columnHatchColor', None) is not None else None,
-            area_border_color=dom.RGBA.from_json(json['areaBorderColor']) if json.get('areaBorderColor', None) is not None else None,
-            grid_background_color=dom.RGBA.from_json(json['gridBackgroundColor']) if json.get('gridBackgroundColor', None) is not None else None,
+            show_grid_extension_lines=json.get('showGridExtensionLines'),
+            show_positive_line_numbers=json.get('showPositiveLineNumbers'),
+            show_negative_line_numbers=json.get('showNegativeLineNumbers'),
+            show_area_names=json.get('showAreaNames'),
+            show_line_names=json.get('showLineNames'),
+            show_track_sizes=json.get('showTrackSizes'),
+            grid_border_color=dom.RGBA.from_json(_grid_border_color) if (_grid_border_color := json.get('gridBorderColor')) is not None else None,
+            cell_border_color=dom.RGBA.from_json(_cell_border_color) if (_cell_border_color := json.get('cellBorderColor')) is not None else None,
+            row_line_color=dom.RGBA.from_json(_row_line_color) if (_row_line_color := json.get('rowLineColor')) is not None else None,
+            column_line_color=dom.RGBA.from_json(_column_line_color) if (_column_line_color := json.get('columnLineColor')) is not None else None,
+            grid_border_dash=json.get('gridBorderDash'),
+            cell_border_dash=json.get('cellBorderDash'),
+            row_line_dash=json.get('rowLineDash'),
+            column_line_dash=json.get('columnLineDash'),
+            row_gap_color=dom.RGBA.from_json(_row_gap_color) if (_row_gap_color := json.get('rowGapColor')) is not None else None,
+            row_hatch_color=dom.RGBA.from_json(_row_hatch_color) if (_row_hatch_color := json.get('rowHatchColor')) is not None else None,
+            column_gap_color=dom.RGBA.from_json(_column_gap_color) if (_column_gap_color := json.get('columnGapColor')) is not None else None,
+            column_hatch_color=dom.RGBA.from_json(_column_hatch_color) if (_column_hatch_color := json.get('columnHatchColor')) is not None else None,
+            area_border_color=dom.RGBA.from_json(_area_border_color) if (_area_border_color := json.get('areaBorderColor')) is not None else None,
+            grid_background_color=dom.RGBA.from_json(_grid_background_color) if (_grid_background_color := json.get('gridBackgroundColor')) is not None else None,
         )
 
 
@@ -227,16 +231,16 @@ class FlexContainerHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FlexContainerHighlightConfig:
+    def from_json(cls, json: FlexContainerHighlightConfigJSON) -> FlexContainerHighlightConfig:
         return cls(
-            container_border=LineStyle.from_json(json['containerBorder']) if json.get('containerBorder', None) is not None else None,
-            line_separator=LineStyle.from_json(json['lineSeparator']) if json.get('lineSeparator', None) is not None else None,
-            item_separator=LineStyle.from_json(json['itemSeparator']) if json.get('itemSeparator', None) is not None else None,
-            main_distributed_space=BoxStyle.from_json(json['mainDistributedSpace']) if json.get('mainDistributedSpace', None) is not None else None,
-            cross_distributed_space=BoxStyle.from_json(json['crossDistributedSpace']) if json.get('crossDistributedSpace', None) is not None else None,
-            row_gap_space=BoxStyle.from_json(json['rowGapSpace']) if json.get('rowGapSpace', None) is not None else None,
-            column_gap_space=BoxStyle.from_json(json['columnGapSpace']) if json.get('columnGapSpace', None) is not None else None,
-            cross_alignment=LineStyle.from_json(json['crossAlignment']) if json.get('crossAlignment', None) is not None else None,
+            container_border=LineStyle.from_json(_container_border) if (_container_border := json.get('containerBorder')) is not None else None,
+            line_separator=LineStyle.from_json(_line_separator) if (_line_separator := json.get('lineSeparator')) is not None else None,
+            item_separator=LineStyle.from_json(_item_separator) if (_item_separator := json.get('itemSeparator')) is not None else None,
+            main_distributed_space=BoxStyle.from_json(_main_distributed_space) if (_main_distributed_space := json.get('mainDistributedSpace')) is not None else None,
+            cross_distributed_space=BoxStyle.from_json(_cross_distributed_space) if (_cross_distributed_space := json.get('crossDistributedSpace')) is not None else None,
+            row_gap_space=BoxStyle.from_json(_row_gap_space) if (_row_gap_space := json.get('rowGapSpace')) is not None else None,
+            column_gap_space=BoxStyle.from_json(_column_gap_space) if (_column_gap_space := json.get('columnGapSpace')) is not None else None,
+            cross_alignment=LineStyle.from_json(_cross_alignment) if (_cross_alignment := json.get('crossAlignment')) is not None else None,
         )
 
 
@@ -265,11 +269,11 @@ class FlexItemHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FlexItemHighlightConfig:
+    def from_json(cls, json: FlexItemHighlightConfigJSON) -> FlexItemHighlightConfig:
         return cls(
-            base_size_box=BoxStyle.from_json(json['baseSizeBox']) if json.get('baseSizeBox', None) is not None else None,
-            base_size_border=LineStyle.from_json(json['baseSizeBorder']) if json.get('baseSizeBorder', None) is not None else None,
-            flexibility_arrow=LineStyle.from_json(json['flexibilityArrow']) if json.get('flexibilityArrow', None) is not None else None,
+            base_size_box=BoxStyle.from_json(_base_size_box) if (_base_size_box := json.get('baseSizeBox')) is not None else None,
+            base_size_border=LineStyle.from_json(_base_size_border) if (_base_size_border := json.get('baseSizeBorder')) is not None else None,
+            flexibility_arrow=LineStyle.from_json(_flexibility_arrow) if (_flexibility_arrow := json.get('flexibilityArrow')) is not None else None,
         )
 
 
@@ -293,10 +297,10 @@ class LineStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LineStyle:
+    def from_json(cls, json: LineStyleJSON) -> LineStyle:
         return cls(
-            color=dom.RGBA.from_json(json['color']) if json.get('color', None) is not None else None,
-            pattern=str(json['pattern']) if json.get('pattern', None) is not None else None,
+            color=dom.RGBA.from_json(_color) if (_color := json.get('color')) is not None else None,
+            pattern=json.get('pattern'),
         )
 
 
@@ -320,10 +324,10 @@ class BoxStyle:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BoxStyle:
+    def from_json(cls, json: BoxStyleJSON) -> BoxStyle:
         return cls(
-            fill_color=dom.RGBA.from_json(json['fillColor']) if json.get('fillColor', None) is not None else None,
-            hatch_color=dom.RGBA.from_json(json['hatchColor']) if json.get('hatchColor', None) is not None else None,
+            fill_color=dom.RGBA.from_json(_fill_color) if (_fill_color := json.get('fillColor')) is not None else None,
+            hatch_color=dom.RGBA.from_json(_hatch_color) if (_hatch_color := json.get('hatchColor')) is not None else None,
         )
 
 
@@ -337,7 +341,10 @@ class ContrastAlgorithm(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContrastAlgorithm:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -431,7 +438,7 @@ class HighlightConfig:
         if self.css_grid_color is not None:
             json['cssGridColor'] = self.css_grid_color.to_json()
         if self.color_format is not None:
-            json['colorFormat'] = self.color_format.to_json()
+            json['colorFormat'] = self.color_format.value
         if self.grid_highlight_config is not None:
             json['gridHighlightConfig'] = self.grid_highlight_config.to_json()
         if self.flex_container_highlight_config is not None:
@@ -439,33 +446,33 @@ class HighlightConfig:
         if self.flex_item_highlight_config is not None:
             json['flexItemHighlightConfig'] = self.flex_item_highlight_config.to_json()
         if self.contrast_algorithm is not None:
-            json['contrastAlgorithm'] = self.contrast_algorithm.to_json()
+            json['contrastAlgorithm'] = self.contrast_algorithm.value
         if self.container_query_container_highlight_config is not None:
             json['containerQueryContainerHighlightConfig'] = self.container_query_container_highlight_config.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> HighlightConfig:
+    def from_json(cls, json: HighlightConfigJSON) -> HighlightConfig:
         return cls(
-            show_info=bool(json['showInfo']) if json.get('showInfo', None) is not None else None,
-            show_styles=bool(json['showStyles']) if json.get('showStyles', None) is not None else None,
-            show_rulers=bool(json['showRulers']) if json.get('showRulers', None) is not None else None,
-            show_accessibility_info=bool(json['showAccessibilityInfo']) if json.get('showAccessibilityInfo', None) is not None else None,
-            show_extension_lines=bool(json['showExtensionLines']) if json.get('showExtensionLines', None) is not None else None,
-            content_color=dom.RGBA.from_json(json['contentColor']) if json.get('contentColor', None) is not None else None,
-            padding_color=dom.RGBA.from_json(json['paddingColor']) if json.get('paddingColor', None) is not None else None,
-            border_color=dom.RGBA.from_json(json['borderColor']) if json.get('borderColor', None) is not None else None,
-            margin_color=dom.RGBA.from_json(json['marginColor']) if json.get('marginColor', None) is not None else None,
-            event_target_color=dom.RGBA.from_json(json['eventTargetColor']) if json.get('eventTargetColor', None) is not None else None,
-            shape_color=dom.RGBA.from_json(json['shapeColor']) if json.get('shapeColor', None) is not None else None,
-            shape_margin_color=dom.RGBA.from_json(json['shapeMarginColor']) if json.get('shapeMarginColor', None) is not None else None,
-            css_grid_color=dom.RGBA.from_json(json['cssGridColor']) if json.get('cssGridColor', None) is not None else None,
-            color_format=ColorFormat.from_json(json['colorFormat']) if json.get('colorFormat', None) is not None else None,
-            grid_highlight_config=GridHighlightConfig.from_json(json['gridHighlightConfig']) if json.get('gridHighlightConfig', None) is not None else None,
-            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(json['flexContainerHighlightConfig']) if json.get('flexContainerHighlightConfig', None) is not None else None,
-            flex_item_highlight_config=FlexItemHighlightConfig.from_json(json['flexItemHighlightConfig']) if json.get('flexItemHighlightConfig', None) is not None else None,
-            contrast_algorithm=ContrastAlgorithm.from_json(json['contrastAlgorithm']) if json.get('contrastAlgorithm', None) is not None else None,
-            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(json['containerQueryContainerHighlightConfig']) if json.get('containerQueryContainerHighlightConfig', None) is not None else None,
+            show_info=json.get('showInfo'),
+            show_styles=json.get('showStyles'),
+            show_rulers=json.get('showRulers'),
+            show_accessibility_info=json.get('showAccessibilityInfo'),
+            show_extension_lines=json.get('showExtensionLines'),
+            content_color=dom.RGBA.from_json(_content_color) if (_content_color := json.get('contentColor')) is not None else None,
+            padding_color=dom.RGBA.from_json(_padding_color) if (_padding_color := json.get('paddingColor')) is not None else None,
+            border_color=dom.RGBA.from_json(_border_color) if (_border_color := json.get('borderColor')) is not None else None,
+            margin_color=dom.RGBA.from_json(_margin_color) if (_margin_color := json.get('marginColor')) is not None else None,
+            event_target_color=dom.RGBA.from_json(_event_target_color) if (_event_target_color := json.get('eventTargetColor')) is not None else None,
+            shape_color=dom.RGBA.from_json(_shape_color) if (_shape_color := json.get('shapeColor')) is not None else None,
+            shape_margin_color=dom.RGBA.from_json(_shape_margin_color) if (_shape_margin_color := json.get('shapeMarginColor')) is not None else None,
+            css_grid_color=dom.RGBA.from_json(_css_grid_color) if (_css_grid_color := json.get('cssGridColor')) is not None else None,
+            color_format=ColorFormat.from_json(_color_format) if (_color_format := json.get('colorFormat')) is not None else None,
+            grid_highlight_config=GridHighlightConfig.from_json(_grid_highlight_config) if (_grid_highlight_config := json.get('gridHighlightConfig')) is not None else None,
+            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(_flex_container_highlight_config) if (_flex_container_highlight_config := json.get('flexContainerHighlightConfig')) is not None else None,
+            flex_item_highlight_config=FlexItemHighlightConfig.from_json(_flex_item_highlight_config) if (_flex_item_highlight_config := json.get('flexItemHighlightConfig')) is not None else None,
+            contrast_algorithm=ContrastAlgorithm.from_json(_contrast_algorithm) if (_contrast_algorithm := json.get('contrastAlgorithm')) is not None else None,
+            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(_container_query_container_highlight_config) if (_container_query_container_highlight_config := json.get('containerQueryContainerHighlightConfig')) is not None else None,
         )
 
 
@@ -480,7 +487,10 @@ class ColorFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ColorFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -497,14 +507,14 @@ class GridNodeHighlightConfig:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['gridHighlightConfig'] = self.grid_highlight_config.to_json()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> GridNodeHighlightConfig:
+    def from_json(cls, json: GridNodeHighlightConfigJSON) -> GridNodeHighlightConfig:
         return cls(
             grid_highlight_config=GridHighlightConfig.from_json(json['gridHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            node_id=dom.NodeId(json['nodeId']),
         )
 
 
@@ -519,14 +529,14 @@ class FlexNodeHighlightConfig:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['flexContainerHighlightConfig'] = self.flex_container_highlight_config.to_json()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FlexNodeHighlightConfig:
+    def from_json(cls, json: FlexNodeHighlightConfigJSON) -> FlexNodeHighlightConfig:
         return cls(
             flex_container_highlight_config=FlexContainerHighlightConfig.from_json(json['flexContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            node_id=dom.NodeId(json['nodeId']),
         )
 
 
@@ -557,12 +567,12 @@ class ScrollSnapContainerHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScrollSnapContainerHighlightConfig:
+    def from_json(cls, json: ScrollSnapContainerHighlightConfigJSON) -> ScrollSnapContainerHighlightConfig:
         return cls(
-            snapport_border=LineStyle.from_json(json['snapportBorder']) if json.get('snapportBorder', None) is not None else None,
-            snap_area_border=LineStyle.from_json(json['snapAreaBorder']) if json.get('snapAreaBorder', None) is not None else None,
-            scroll_margin_color=dom.RGBA.from_json(json['scrollMarginColor']) if json.get('scrollMarginColor', None) is not None else None,
-            scroll_padding_color=dom.RGBA.from_json(json['scrollPaddingColor']) if json.get('scrollPaddingColor', None) is not None else None,
+            snapport_border=LineStyle.from_json(_snapport_border) if (_snapport_border := json.get('snapportBorder')) is not None else None,
+            snap_area_border=LineStyle.from_json(_snap_area_border) if (_snap_area_border := json.get('snapAreaBorder')) is not None else None,
+            scroll_margin_color=dom.RGBA.from_json(_scroll_margin_color) if (_scroll_margin_color := json.get('scrollMarginColor')) is not None else None,
+            scroll_padding_color=dom.RGBA.from_json(_scroll_padding_color) if (_scroll_padding_color := json.get('scrollPaddingColor')) is not None else None,
         )
 
 
@@ -577,14 +587,14 @@ class ScrollSnapHighlightConfig:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['scrollSnapContainerHighlightConfig'] = self.scroll_snap_container_highlight_config.to_json()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScrollSnapHighlightConfig:
+    def from_json(cls, json: ScrollSnapHighlightConfigJSON) -> ScrollSnapHighlightConfig:
         return cls(
             scroll_snap_container_highlight_config=ScrollSnapContainerHighlightConfig.from_json(json['scrollSnapContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            node_id=dom.NodeId(json['nodeId']),
         )
 
 
@@ -612,11 +622,11 @@ class HingeConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> HingeConfig:
+    def from_json(cls, json: HingeConfigJSON) -> HingeConfig:
         return cls(
             rect=dom.Rect.from_json(json['rect']),
-            content_color=dom.RGBA.from_json(json['contentColor']) if json.get('contentColor', None) is not None else None,
-            outline_color=dom.RGBA.from_json(json['outlineColor']) if json.get('outlineColor', None) is not None else None,
+            content_color=dom.RGBA.from_json(_content_color) if (_content_color := json.get('contentColor')) is not None else None,
+            outline_color=dom.RGBA.from_json(_outline_color) if (_outline_color := json.get('outlineColor')) is not None else None,
         )
 
 
@@ -642,11 +652,11 @@ class WindowControlsOverlayConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WindowControlsOverlayConfig:
+    def from_json(cls, json: WindowControlsOverlayConfigJSON) -> WindowControlsOverlayConfig:
         return cls(
-            show_css=bool(json['showCSS']),
-            selected_platform=str(json['selectedPlatform']),
-            theme_color=str(json['themeColor']),
+            show_css=json['showCSS'],
+            selected_platform=json['selectedPlatform'],
+            theme_color=json['themeColor'],
         )
 
 
@@ -661,14 +671,14 @@ class ContainerQueryHighlightConfig:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['containerQueryContainerHighlightConfig'] = self.container_query_container_highlight_config.to_json()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContainerQueryHighlightConfig:
+    def from_json(cls, json: ContainerQueryHighlightConfigJSON) -> ContainerQueryHighlightConfig:
         return cls(
             container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(json['containerQueryContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            node_id=dom.NodeId(json['nodeId']),
         )
 
 
@@ -689,10 +699,10 @@ class ContainerQueryContainerHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContainerQueryContainerHighlightConfig:
+    def from_json(cls, json: ContainerQueryContainerHighlightConfigJSON) -> ContainerQueryContainerHighlightConfig:
         return cls(
-            container_border=LineStyle.from_json(json['containerBorder']) if json.get('containerBorder', None) is not None else None,
-            descendant_border=LineStyle.from_json(json['descendantBorder']) if json.get('descendantBorder', None) is not None else None,
+            container_border=LineStyle.from_json(_container_border) if (_container_border := json.get('containerBorder')) is not None else None,
+            descendant_border=LineStyle.from_json(_descendant_border) if (_descendant_border := json.get('descendantBorder')) is not None else None,
         )
 
 
@@ -707,14 +717,14 @@ class IsolatedElementHighlightConfig:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['isolationModeHighlightConfig'] = self.isolation_mode_highlight_config.to_json()
-        json['nodeId'] = self.node_id.to_json()
+        json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IsolatedElementHighlightConfig:
+    def from_json(cls, json: IsolatedElementHighlightConfigJSON) -> IsolatedElementHighlightConfig:
         return cls(
             isolation_mode_highlight_config=IsolationModeHighlightConfig.from_json(json['isolationModeHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            node_id=dom.NodeId(json['nodeId']),
         )
 
 
@@ -740,11 +750,11 @@ class IsolationModeHighlightConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IsolationModeHighlightConfig:
+    def from_json(cls, json: IsolationModeHighlightConfigJSON) -> IsolationModeHighlightConfig:
         return cls(
-            resizer_color=dom.RGBA.from_json(json['resizerColor']) if json.get('resizerColor', None) is not None else None,
-            resizer_handle_color=dom.RGBA.from_json(json['resizerHandleColor']) if json.get('resizerHandleColor', None) is not None else None,
-            mask_color=dom.RGBA.from_json(json['maskColor']) if json.get('maskColor', None) is not None else None,
+            resizer_color=dom.RGBA.from_json(_resizer_color) if (_resizer_color := json.get('resizerColor')) is not None else None,
+            resizer_handle_color=dom.RGBA.from_json(_resizer_handle_color) if (_resizer_handle_color := json.get('resizerHandleColor')) is not None else None,
+            mask_color=dom.RGBA.from_json(_mask_color) if (_mask_color := json.get('maskColor')) is not None else None,
         )
 
 
@@ -760,27 +770,28 @@ class InspectMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.disable',
-    }
-    json = yield cmd_dict
+    return Command('Overlay.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.enable',
-    }
-    json = yield cmd_dict
+    return Command('Overlay.enable')
+
+
+def _parse_get_highlight_object_for_test(json: GetHighlightObjectForTestReturnsJSON) -> dict:
+    return json['highlight']
 
 
 def get_highlight_object_for_test(
@@ -789,7 +800,7 @@ def get_highlight_object_for_test(
         include_style: typing.Optional[bool] = None,
         color_format: typing.Optional[ColorFormat] = None,
         show_accessibility_info: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
+    ) -> Command[GetHighlightObjectForTestReturnsJSON, dict]:
     '''
     For testing.
 
@@ -801,26 +812,25 @@ def get_highlight_object_for_test(
     :returns: Highlight data for the node.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params['nodeId'] = node_id
     if include_distance is not None:
         params['includeDistance'] = include_distance
     if include_style is not None:
         params['includeStyle'] = include_style
     if color_format is not None:
-        params['colorFormat'] = color_format.to_json()
+        params['colorFormat'] = color_format.value
     if show_accessibility_info is not None:
         params['showAccessibilityInfo'] = show_accessibility_info
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.getHighlightObjectForTest',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return dict(json['highlight'])
+    return Command('Overlay.getHighlightObjectForTest', params, _parse_get_highlight_object_for_test)
+
+
+def _parse_get_grid_highlight_objects_for_test(json: GetGridHighlightObjectsForTestReturnsJSON) -> dict:
+    return json['highlights']
 
 
 def get_grid_highlight_objects_for_test(
         node_ids: typing.List[dom.NodeId]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
+    ) -> Command[GetGridHighlightObjectsForTestReturnsJSON, dict]:
     '''
     For Persistent Grid testing.
 
@@ -828,18 +838,17 @@ def get_grid_highlight_objects_for_test(
     :returns: Grid Highlight data for the node ids provided.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeIds'] = [i.to_json() for i in node_ids]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.getGridHighlightObjectsForTest',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return dict(json['highlights'])
+    params['nodeIds'] = list(node_ids)
+    return Command('Overlay.getGridHighlightObjectsForTest', params, _parse_get_grid_highlight_objects_for_test)
+
+
+def _parse_get_source_order_highlight_object_for_test(json: GetSourceOrderHighlightObjectForTestReturnsJSON) -> dict:
+    return json['highlight']
 
 
 def get_source_order_highlight_object_for_test(
         node_id: dom.NodeId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
+    ) -> Command[GetSourceOrderHighlightObjectForTestReturnsJSON, dict]:
     '''
     For Source Order Viewer testing.
 
@@ -847,23 +856,15 @@ def get_source_order_highlight_object_for_test(
     :returns: Source order highlight data for the node id provided.
     '''
     params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.getSourceOrderHighlightObjectForTest',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return dict(json['highlight'])
+    params['nodeId'] = node_id
+    return Command('Overlay.getSourceOrderHighlightObjectForTest', params, _parse_get_source_order_highlight_object_for_test)
 
 
-def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def hide_highlight() -> Command[T_JSON_DICT, None]:
     '''
     Hides any highlight.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.hideHighlight',
-    }
-    json = yield cmd_dict
+    return Command('Overlay.hideHighlight')
 
 
 @deprecated(version="1.3")
@@ -871,7 +872,7 @@ def highlight_frame(
         frame_id: page.FrameId,
         content_color: typing.Optional[dom.RGBA] = None,
         content_outline_color: typing.Optional[dom.RGBA] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights owner element of the frame with given id.
     Deprecated: Doesn't work reliably and cannot be fixed due to process
@@ -885,16 +886,12 @@ def highlight_frame(
     :param content_outline_color: *(Optional)* The content box highlight outline color (default: transparent).
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     if content_color is not None:
         params['contentColor'] = content_color.to_json()
     if content_outline_color is not None:
         params['contentOutlineColor'] = content_outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightFrame',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.highlightFrame', params)
 
 
 def highlight_node(
@@ -903,7 +900,7 @@ def highlight_node(
         backend_node_id: typing.Optional[dom.BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None,
         selector: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights DOM node with given id or with the given JavaScript object wrapper. Either nodeId or
     objectId must be specified.
@@ -917,25 +914,21 @@ def highlight_node(
     params: T_JSON_DICT = dict()
     params['highlightConfig'] = highlight_config.to_json()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if selector is not None:
         params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightNode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.highlightNode', params)
 
 
 def highlight_quad(
         quad: dom.Quad,
         color: typing.Optional[dom.RGBA] = None,
         outline_color: typing.Optional[dom.RGBA] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights given quad. Coordinates are absolute with respect to the main frame viewport.
 
@@ -944,16 +937,12 @@ def highlight_quad(
     :param outline_color: *(Optional)* The highlight outline color (default: transparent).
     '''
     params: T_JSON_DICT = dict()
-    params['quad'] = quad.to_json()
+    params['quad'] = quad
     if color is not None:
         params['color'] = color.to_json()
     if outline_color is not None:
         params['outlineColor'] = outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightQuad',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.highlightQuad', params)
 
 
 def highlight_rect(
@@ -963,7 +952,7 @@ def highlight_rect(
         height: int,
         color: typing.Optional[dom.RGBA] = None,
         outline_color: typing.Optional[dom.RGBA] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights given rectangle. Coordinates are absolute with respect to the main frame viewport.
 
@@ -983,11 +972,7 @@ def highlight_rect(
         params['color'] = color.to_json()
     if outline_color is not None:
         params['outlineColor'] = outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightRect',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.highlightRect', params)
 
 
 def highlight_source_order(
@@ -995,7 +980,7 @@ def highlight_source_order(
         node_id: typing.Optional[dom.NodeId] = None,
         backend_node_id: typing.Optional[dom.BackendNodeId] = None,
         object_id: typing.Optional[runtime.RemoteObjectId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights the source order of the children of the DOM node with given id or with the given
     JavaScript object wrapper. Either nodeId or objectId must be specified.
@@ -1008,22 +993,18 @@ def highlight_source_order(
     params: T_JSON_DICT = dict()
     params['sourceOrderConfig'] = source_order_config.to_json()
     if node_id is not None:
-        params['nodeId'] = node_id.to_json()
+        params['nodeId'] = node_id
     if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
+        params['backendNodeId'] = backend_node_id
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightSourceOrder',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['objectId'] = object_id
+    return Command('Overlay.highlightSourceOrder', params)
 
 
 def set_inspect_mode(
         mode: InspectMode,
         highlight_config: typing.Optional[HighlightConfig] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enters the 'inspect' mode. In this mode, elements that user is hovering over are highlighted.
     Backend then generates 'inspectNodeRequested' event upon element selection.
@@ -1032,19 +1013,15 @@ def set_inspect_mode(
     :param highlight_config: *(Optional)* A descriptor for the highlight appearance of hovered-over nodes. May be omitted if ```enabled == false```.
     '''
     params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
+    params['mode'] = mode.value
     if highlight_config is not None:
         params['highlightConfig'] = highlight_config.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setInspectMode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setInspectMode', params)
 
 
 def set_show_ad_highlights(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlights owner element of all frames detected to be ads.
 
@@ -1052,32 +1029,24 @@ def set_show_ad_highlights(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowAdHighlights',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowAdHighlights', params)
 
 
 def set_paused_in_debugger_message(
         message: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param message: *(Optional)* The message to display, also triggers resume and step over controls.
     '''
     params: T_JSON_DICT = dict()
     if message is not None:
         params['message'] = message
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setPausedInDebuggerMessage',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setPausedInDebuggerMessage', params)
 
 
 def set_show_debug_borders(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that backend shows debug borders on layers
 
@@ -1085,16 +1054,12 @@ def set_show_debug_borders(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowDebugBorders',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowDebugBorders', params)
 
 
 def set_show_fps_counter(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that backend shows the FPS counter
 
@@ -1102,16 +1067,12 @@ def set_show_fps_counter(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowFPSCounter',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowFPSCounter', params)
 
 
 def set_show_grid_overlays(
         grid_node_highlight_configs: typing.List[GridNodeHighlightConfig]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Highlight multiple elements with the CSS Grid overlay.
 
@@ -1119,61 +1080,45 @@ def set_show_grid_overlays(
     '''
     params: T_JSON_DICT = dict()
     params['gridNodeHighlightConfigs'] = [i.to_json() for i in grid_node_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowGridOverlays',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowGridOverlays', params)
 
 
 def set_show_flex_overlays(
         flex_node_highlight_configs: typing.List[FlexNodeHighlightConfig]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param flex_node_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
     params: T_JSON_DICT = dict()
     params['flexNodeHighlightConfigs'] = [i.to_json() for i in flex_node_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowFlexOverlays',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowFlexOverlays', params)
 
 
 def set_show_scroll_snap_overlays(
         scroll_snap_highlight_configs: typing.List[ScrollSnapHighlightConfig]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param scroll_snap_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
     params: T_JSON_DICT = dict()
     params['scrollSnapHighlightConfigs'] = [i.to_json() for i in scroll_snap_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowScrollSnapOverlays',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowScrollSnapOverlays', params)
 
 
 def set_show_container_query_overlays(
         container_query_highlight_configs: typing.List[ContainerQueryHighlightConfig]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param container_query_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
     params: T_JSON_DICT = dict()
     params['containerQueryHighlightConfigs'] = [i.to_json() for i in container_query_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowContainerQueryOverlays',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowContainerQueryOverlays', params)
 
 
 def set_show_paint_rects(
         result: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that backend shows paint rectangles
 
@@ -1181,16 +1126,12 @@ def set_show_paint_rects(
     '''
     params: T_JSON_DICT = dict()
     params['result'] = result
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowPaintRects',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowPaintRects', params)
 
 
 def set_show_layout_shift_regions(
         result: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that backend shows layout shift regions
 
@@ -1198,16 +1139,12 @@ def set_show_layout_shift_regions(
     '''
     params: T_JSON_DICT = dict()
     params['result'] = result
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowLayoutShiftRegions',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowLayoutShiftRegions', params)
 
 
 def set_show_scroll_bottleneck_rects(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests that backend shows scroll bottleneck rects
 
@@ -1215,17 +1152,13 @@ def set_show_scroll_bottleneck_rects(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowScrollBottleneckRects',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowScrollBottleneckRects', params)
 
 
 @deprecated(version="1.3")
 def set_show_hit_test_borders(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deprecated, no longer has any effect.
 
@@ -1235,17 +1168,13 @@ def set_show_hit_test_borders(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowHitTestBorders',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowHitTestBorders', params)
 
 
 @deprecated(version="1.3")
 def set_show_web_vitals(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deprecated, no longer has any effect.
 
@@ -1255,16 +1184,12 @@ def set_show_web_vitals(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowWebVitals',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowWebVitals', params)
 
 
 def set_show_viewport_size_on_resize(
         show: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Paints viewport size upon main frame resize.
 
@@ -1272,16 +1197,12 @@ def set_show_viewport_size_on_resize(
     '''
     params: T_JSON_DICT = dict()
     params['show'] = show
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowViewportSizeOnResize',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowViewportSizeOnResize', params)
 
 
 def set_show_hinge(
         hinge_config: typing.Optional[HingeConfig] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Add a dual screen device hinge
 
@@ -1290,16 +1211,12 @@ def set_show_hinge(
     params: T_JSON_DICT = dict()
     if hinge_config is not None:
         params['hingeConfig'] = hinge_config.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowHinge',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowHinge', params)
 
 
 def set_show_isolated_elements(
         isolated_element_highlight_configs: typing.List[IsolatedElementHighlightConfig]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Show elements in isolation mode with overlays.
 
@@ -1307,16 +1224,12 @@ def set_show_isolated_elements(
     '''
     params: T_JSON_DICT = dict()
     params['isolatedElementHighlightConfigs'] = [i.to_json() for i in isolated_element_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowIsolatedElements',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowIsolatedElements', params)
 
 
 def set_show_window_controls_overlay(
         window_controls_overlay_config: typing.Optional[WindowControlsOverlayConfig] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Show Window Controls Overlay for PWA
 
@@ -1325,11 +1238,7 @@ def set_show_window_controls_overlay(
     params: T_JSON_DICT = dict()
     if window_controls_overlay_config is not None:
         params['windowControlsOverlayConfig'] = window_controls_overlay_config.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.setShowWindowControlsOverlay',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Overlay.setShowWindowControlsOverlay', params)
 
 
 @event_class('Overlay.inspectNodeRequested')
@@ -1343,9 +1252,9 @@ class InspectNodeRequested:
     backend_node_id: dom.BackendNodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InspectNodeRequested:
+    def from_json(cls, json: InspectNodeRequestedJSON) -> InspectNodeRequested:
         return cls(
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId'])
+            backend_node_id=dom.BackendNodeId(json['backendNodeId'])
         )
 
 
@@ -1358,9 +1267,9 @@ class NodeHighlightRequested:
     node_id: dom.NodeId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodeHighlightRequested:
+    def from_json(cls, json: NodeHighlightRequestedJSON) -> NodeHighlightRequested:
         return cls(
-            node_id=dom.NodeId.from_json(json['nodeId'])
+            node_id=dom.NodeId(json['nodeId'])
         )
 
 
@@ -1374,7 +1283,7 @@ class ScreenshotRequested:
     viewport: page.Viewport
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreenshotRequested:
+    def from_json(cls, json: ScreenshotRequestedJSON) -> ScreenshotRequested:
         return cls(
             viewport=page.Viewport.from_json(json['viewport'])
         )
@@ -1393,3 +1302,163 @@ class InspectModeCanceled:
         return cls(
 
         )
+
+
+if typing.TYPE_CHECKING:
+    class SourceOrderConfigJSON(typing.TypedDict):
+        parentOutlineColor: dom.RGBAJSON
+        childOutlineColor: dom.RGBAJSON
+
+
+    class GridHighlightConfigJSON(typing.TypedDict, total=False):
+        showGridExtensionLines: bool
+        showPositiveLineNumbers: bool
+        showNegativeLineNumbers: bool
+        showAreaNames: bool
+        showLineNames: bool
+        showTrackSizes: bool
+        gridBorderColor: dom.RGBAJSON
+        cellBorderColor: dom.RGBAJSON
+        rowLineColor: dom.RGBAJSON
+        columnLineColor: dom.RGBAJSON
+        gridBorderDash: bool
+        cellBorderDash: bool
+        rowLineDash: bool
+        columnLineDash: bool
+        rowGapColor: dom.RGBAJSON
+        rowHatchColor: dom.RGBAJSON
+        columnGapColor: dom.RGBAJSON
+        columnHatchColor: dom.RGBAJSON
+        areaBorderColor: dom.RGBAJSON
+        gridBackgroundColor: dom.RGBAJSON
+
+
+    class FlexContainerHighlightConfigJSON(typing.TypedDict, total=False):
+        containerBorder: LineStyleJSON
+        lineSeparator: LineStyleJSON
+        itemSeparator: LineStyleJSON
+        mainDistributedSpace: BoxStyleJSON
+        crossDistributedSpace: BoxStyleJSON
+        rowGapSpace: BoxStyleJSON
+        columnGapSpace: BoxStyleJSON
+        crossAlignment: LineStyleJSON
+
+
+    class FlexItemHighlightConfigJSON(typing.TypedDict, total=False):
+        baseSizeBox: BoxStyleJSON
+        baseSizeBorder: LineStyleJSON
+        flexibilityArrow: LineStyleJSON
+
+
+    class LineStyleJSON(typing.TypedDict, total=False):
+        color: dom.RGBAJSON
+        pattern: str
+
+
+    class BoxStyleJSON(typing.TypedDict, total=False):
+        fillColor: dom.RGBAJSON
+        hatchColor: dom.RGBAJSON
+
+
+    class HighlightConfigJSON(typing.TypedDict, total=False):
+        showInfo: bool
+        showStyles: bool
+        showRulers: bool
+        showAccessibilityInfo: bool
+        showExtensionLines: bool
+        contentColor: dom.RGBAJSON
+        paddingColor: dom.RGBAJSON
+        borderColor: dom.RGBAJSON
+        marginColor: dom.RGBAJSON
+        eventTargetColor: dom.RGBAJSON
+        shapeColor: dom.RGBAJSON
+        shapeMarginColor: dom.RGBAJSON
+        cssGridColor: dom.RGBAJSON
+        colorFormat: str
+        gridHighlightConfig: GridHighlightConfigJSON
+        flexContainerHighlightConfig: FlexContainerHighlightConfigJSON
+        flexItemHighlightConfig: FlexItemHighlightConfigJSON
+        contrastAlgorithm: str
+        containerQueryContainerHighlightConfig: ContainerQueryContainerHighlightConfigJSON
+
+
+    class GridNodeHighlightConfigJSON(typing.TypedDict):
+        gridHighlightConfig: GridHighlightConfigJSON
+        nodeId: int
+
+
+    class FlexNodeHighlightConfigJSON(typing.TypedDict):
+        flexContainerHighlightConfig: FlexContainerHighlightConfigJSON
+        nodeId: int
+
+
+    class ScrollSnapContainerHighlightConfigJSON(typing.TypedDict, total=False):
+        snapportBorder: LineStyleJSON
+        snapAreaBorder: LineStyleJSON
+        scrollMarginColor: dom.RGBAJSON
+        scrollPaddingColor: dom.RGBAJSON
+
+
+    class ScrollSnapHighlightConfigJSON(typing.TypedDict):
+        scrollSnapContainerHighlightConfig: ScrollSnapContainerHighlightConfigJSON
+        nodeId: int
+
+
+    class _HingeConfigJSON(typing.TypedDict):
+        rect: dom.RectJSON
+
+
+    class HingeConfigJSON(_HingeConfigJSON, total=False):
+        contentColor: dom.RGBAJSON
+        outlineColor: dom.RGBAJSON
+
+
+    class WindowControlsOverlayConfigJSON(typing.TypedDict):
+        showCSS: bool
+        selectedPlatform: str
+        themeColor: str
+
+
+    class ContainerQueryHighlightConfigJSON(typing.TypedDict):
+        containerQueryContainerHighlightConfig: ContainerQueryContainerHighlightConfigJSON
+        nodeId: int
+
+
+    class ContainerQueryContainerHighlightConfigJSON(typing.TypedDict, total=False):
+        containerBorder: LineStyleJSON
+        descendantBorder: LineStyleJSON
+
+
+    class IsolatedElementHighlightConfigJSON(typing.TypedDict):
+        isolationModeHighlightConfig: IsolationModeHighlightConfigJSON
+        nodeId: int
+
+
+    class IsolationModeHighlightConfigJSON(typing.TypedDict, total=False):
+        resizerColor: dom.RGBAJSON
+        resizerHandleColor: dom.RGBAJSON
+        maskColor: dom.RGBAJSON
+
+
+    class GetHighlightObjectForTestReturnsJSON(typing.TypedDict):
+        highlight: dict
+
+
+    class GetGridHighlightObjectsForTestReturnsJSON(typing.TypedDict):
+        highlights: dict
+
+
+    class GetSourceOrderHighlightObjectForTestReturnsJSON(typing.TypedDict):
+        highlight: dict
+
+
+    class InspectNodeRequestedJSON(typing.TypedDict):
+        backendNodeId: int
+
+
+    class NodeHighlightRequestedJSON(typing.TypedDict):
+        nodeId: int
+
+
+    class ScreenshotRequestedJSON(typing.TypedDict):
+        viewport: page.ViewportJSON
@@ -8,15 +8,22 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import debugger
-from . import dom
-from . import emulation
-from . import io
-from . import network
-from . import runtime
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import debugger
+    from . import dom
+    from . import emulation
+    from . import io
+    from . import network
+    from . import runtime
+else:
+    debugger = lazy_import('debugger', globals())
+    dom = lazy_import('dom', globals())
+    emulation = lazy_import('emulation', globals())
+    io = lazy_import('io', globals())
+    network = lazy_import('network', globals())
+    runtime = lazy_import('runtime', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -48,7 +55,10 @@ class AdFrameType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AdFrameExplanation(enum.Enum):
@@ -61,7 +71,10 @@ class AdFrameExplanation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameExplanation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -75,16 +88,16 @@ class AdFrameStatus:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['adFrameType'] = self.ad_frame_type.to_json()
+        json['adFrameType'] = self.ad_frame_type.value
         if self.explanations is not None:
-            json['explanations'] = [i.to_json() for i in self.explanations]
+            json['explanations'] = [i.value for i in self.explanations]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AdFrameStatus:
+    def from_json(cls, json: AdFrameStatusJSON) -> AdFrameStatus:
         return cls(
             ad_frame_type=AdFrameType.from_json(json['adFrameType']),
-            explanations=[AdFrameExplanation.from_json(i) for i in json['explanations']] if json.get('explanations', None) is not None else None,
+            explanations=[AdFrameExplanation.from_json(i) for i in _explanations] if (_explanations := json.get('explanations')) is not None else None,
         )
 
 
@@ -103,15 +116,15 @@ class AdScriptId:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['scriptId'] = self.script_id.to_json()
-        json['debuggerId'] = self.debugger_id.to_json()
+        json['scriptId'] = self.script_id
+        json['debuggerId'] = self.debugger_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AdScriptId:
+    def from_json(cls, json: AdScriptIdJSON) -> AdScriptId:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            debugger_id=runtime.UniqueDebuggerId.from_json(json['debuggerId']),
+            script_id=runtime.ScriptId(json['scriptId']),
+            debugger_id=runtime.UniqueDebuggerId(json['debuggerId']),
         )
 
 
@@ -129,7 +142,10 @@ class SecureContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecureContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class CrossOriginIsolatedContextType(enum.Enum):
@@ -145,7 +161,10 @@ class CrossOriginIsolatedContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginIsolatedContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class GatedAPIFeatures(enum.Enum):
@@ -159,7 +178,10 @@ class GatedAPIFeatures(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GatedAPIFeatures:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PermissionsPolicyFeature(enum.Enum):
@@ -268,7 +290,10 @@ class PermissionsPolicyFeature(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyFeature:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PermissionsPolicyBlockReason(enum.Enum):
@@ -285,7 +310,10 @@ class PermissionsPolicyBlockReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyBlockReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -296,14 +324,14 @@ class PermissionsPolicyBlockLocator:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['frameId'] = self.frame_id.to_json()
-        json['blockReason'] = self.block_reason.to_json()
+        json['frameId'] = self.frame_id
+        json['blockReason'] = self.block_reason.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyBlockLocator:
+    def from_json(cls, json: PermissionsPolicyBlockLocatorJSON) -> PermissionsPolicyBlockLocator:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
+            frame_id=FrameId(json['frameId']),
             block_reason=PermissionsPolicyBlockReason.from_json(json['blockReason']),
         )
 
@@ -318,18 +346,18 @@ class PermissionsPolicyFeatureState:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['feature'] = self.feature.to_json()
+        json['feature'] = self.feature.value
         json['allowed'] = self.allowed
         if self.locator is not None:
             json['locator'] = self.locator.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyFeatureState:
+    def from_json(cls, json: PermissionsPolicyFeatureStateJSON) -> PermissionsPolicyFeatureState:
         return cls(
             feature=PermissionsPolicyFeature.from_json(json['feature']),
-            allowed=bool(json['allowed']),
-            locator=PermissionsPolicyBlockLocator.from_json(json['locator']) if json.get('locator', None) is not None else None,
+            allowed=json['allowed'],
+            locator=PermissionsPolicyBlockLocator.from_json(_locator) if (_locator := json.get('locator')) is not None else None,
         )
 
 
@@ -356,7 +384,10 @@ class OriginTrialTokenStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialTokenStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class OriginTrialStatus(enum.Enum):
@@ -373,7 +404,10 @@ class OriginTrialStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class OriginTrialUsageRestriction(enum.Enum):
@@ -385,7 +419,10 @@ class OriginTrialUsageRestriction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialUsageRestriction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -407,19 +444,19 @@ class OriginTrialToken:
         json['origin'] = self.origin
         json['matchSubDomains'] = self.match_sub_domains
         json['trialName'] = self.trial_name
-        json['expiryTime'] = self.expiry_time.to_json()
+        json['expiryTime'] = self.expiry_time
         json['isThirdParty'] = self.is_third_party
-        json['usageRestriction'] = self.usage_restriction.to_json()
+        json['usageRestriction'] = self.usage_restriction.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> OriginTrialToken:
+    def from_json(cls, json: OriginTrialTokenJSON) -> OriginTrialToken:
         return cls(
-            origin=str(json['origin']),
-            match_sub_domains=bool(json['matchSubDomains']),
-            trial_name=str(json['trialName']),
-            expiry_time=network.TimeSinceEpoch.from_json(json['expiryTime']),
-            is_third_party=bool(json['isThirdParty']),
+            origin=json['origin'],
+            match_sub_domains=json['matchSubDomains'],
+            trial_name=json['trialName'],
+            expiry_time=network.TimeSinceEpoch(json['expiryTime']),
+            is_third_party=json['isThirdParty'],
             usage_restriction=OriginTrialUsageRestriction.from_json(json['usageRestriction']),
         )
 
@@ -437,17 +474,17 @@ class OriginTrialTokenWithStatus:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['rawTokenText'] = self.raw_token_text
-        json['status'] = self.status.to_json()
+        json['status'] = self.status.value
         if self.parsed_token is not None:
             json['parsedToken'] = self.parsed_token.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> OriginTrialTokenWithStatus:
+    def from_json(cls, json: OriginTrialTokenWithStatusJSON) -> OriginTrialTokenWithStatus:
         return cls(
-            raw_token_text=str(json['rawTokenText']),
+            raw_token_text=json['rawTokenText'],
             status=OriginTrialTokenStatus.from_json(json['status']),
-            parsed_token=OriginTrialToken.from_json(json['parsedToken']) if json.get('parsedToken', None) is not None else None,
+            parsed_token=OriginTrialToken.from_json(_parsed_token) if (_parsed_token := json.get('parsedToken')) is not None else None,
         )
 
 
@@ -462,14 +499,14 @@ class OriginTrial:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['trialName'] = self.trial_name
-        json['status'] = self.status.to_json()
+        json['status'] = self.status.value
         json['tokensWithStatus'] = [i.to_json() for i in self.tokens_with_status]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> OriginTrial:
+    def from_json(cls, json: OriginTrialJSON) -> OriginTrial:
         return cls(
-            trial_name=str(json['trialName']),
+            trial_name=json['trialName'],
             status=OriginTrialStatus.from_json(json['status']),
             tokens_with_status=[OriginTrialTokenWithStatus.from_json(i) for i in json['tokensWithStatus']],
         )
@@ -491,9 +528,9 @@ class SecurityOriginDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SecurityOriginDetails:
+    def from_json(cls, json: SecurityOriginDetailsJSON) -> SecurityOriginDetails:
         return cls(
-            is_localhost=bool(json['isLocalhost']),
+            is_localhost=json['isLocalhost'],
         )
 
 
@@ -552,17 +589,17 @@ class Frame:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['id'] = self.id_.to_json()
-        json['loaderId'] = self.loader_id.to_json()
+        json['id'] = self.id_
+        json['loaderId'] = self.loader_id
         json['url'] = self.url
         json['domainAndRegistry'] = self.domain_and_registry
         json['securityOrigin'] = self.security_origin
         json['mimeType'] = self.mime_type
-        json['secureContextType'] = self.secure_context_type.to_json()
-        json['crossOriginIsolatedContextType'] = self.cross_origin_isolated_context_type.to_json()
-        json['gatedAPIFeatures'] = [i.to_json() for i in self.gated_api_features]
+        json['secureContextType'] = self.secure_context_type.value
+        json['crossOriginIsolatedContextType'] = self.cross_origin_isolated_context_type.value
+        json['gatedAPIFeatures'] = [i.value for i in self.gated_api_features]
         if self.parent_id is not None:
-            json['parentId'] = self.parent_id.to_json()
+            json['parentId'] = self.parent_id
         if self.name is not None:
             json['name'] = self.name
         if self.url_fragment is not None:
@@ -576,23 +613,23 @@ class Frame:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Frame:
+    def from_json(cls, json: FrameJSON) -> Frame:
         return cls(
-            id_=FrameId.from_json(json['id']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            url=str(json['url']),
-            domain_and_registry=str(json['domainAndRegistry']),
-            security_origin=str(json['securityOrigin']),
-            mime_type=str(json['mimeType']),
+            id_=FrameId(json['id']),
+            loader_id=network.LoaderId(json['loaderId']),
+            url=json['url'],
+            domain_and_registry=json['domainAndRegistry'],
+            security_origin=json['securityOrigin'],
+            mime_type=json['mimeType'],
             secure_context_type=SecureContextType.from_json(json['secureContextType']),
             cross_origin_isolated_context_type=CrossOriginIsolatedContextType.from_json(json['crossOriginIsolatedContextType']),
             gated_api_features=[GatedAPIFeatures.from_json(i) for i in json['gatedAPIFeatures']],
-            parent_id=FrameId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
-            security_origin_details=SecurityOriginDetails.from_json(json['securityOriginDetails']) if json.get('securityOriginDetails', None) is not None else None,
-            unreachable_url=str(json['unreachableUrl']) if json.get('unreachableUrl', None) is not None else None,
-            ad_frame_status=AdFrameStatus.from_json(json['adFrameStatus']) if json.get('adFrameStatus', None) is not None else None,
+            parent_id=FrameId(_parent_id) if (_parent_id := json.get('parentId')) is not None else None,
+            name=json.get('name'),
+            url_fragment=json.get('urlFragment'),
+            security_origin_details=SecurityOriginDetails.from_json(_security_origin_details) if (_security_origin_details := json.get('securityOriginDetails')) is not None else None,
+            unreachable_url=json.get('unreachableUrl'),
+            ad_frame_status=AdFrameStatus.from_json(_ad_frame_status) if (_ad_frame_status := json.get('adFrameStatus')) is not None else None,
         )
 
 
@@ -625,10 +662,10 @@ class FrameResource:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['url'] = self.url
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         json['mimeType'] = self.mime_type
         if self.last_modified is not None:
-            json['lastModified'] = self.last_modified.to_json()
+            json['lastModified'] = self.last_modified
         if self.content_size is not None:
             json['contentSize'] = self.content_size
         if self.failed is not None:
@@ -638,15 +675,15 @@ class FrameResource:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameResource:
+    def from_json(cls, json: FrameResourceJSON) -> FrameResource:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             type_=network.ResourceType.from_json(json['type']),
-            mime_type=str(json['mimeType']),
-            last_modified=network.TimeSinceEpoch.from_json(json['lastModified']) if json.get('lastModified', None) is not None else None,
-            content_size=float(json['contentSize']) if json.get('contentSize', None) is not None else None,
-            failed=bool(json['failed']) if json.get('failed', None) is not None else None,
-            canceled=bool(json['canceled']) if json.get('canceled', None) is not None else None,
+            mime_type=json['mimeType'],
+            last_modified=network.TimeSinceEpoch(_last_modified) if (_last_modified := json.get('lastModified')) is not None else None,
+            content_size=float(_content_size) if (_content_size := json.get('contentSize')) is not None else None,
+            failed=json.get('failed'),
+            canceled=json.get('canceled'),
         )
 
 
@@ -673,11 +710,11 @@ class FrameResourceTree:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameResourceTree:
+    def from_json(cls, json: FrameResourceTreeJSON) -> FrameResourceTree:
         return cls(
             frame=Frame.from_json(json['frame']),
             resources=[FrameResource.from_json(i) for i in json['resources']],
-            child_frames=[FrameResourceTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            child_frames=[FrameResourceTree.from_json(i) for i in _child_frames] if (_child_frames := json.get('childFrames')) is not None else None,
         )
 
 
@@ -700,10 +737,10 @@ class FrameTree:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameTree:
+    def from_json(cls, json: FrameTreeJSON) -> FrameTree:
         return cls(
             frame=Frame.from_json(json['frame']),
-            child_frames=[FrameTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            child_frames=[FrameTree.from_json(i) for i in _child_frames] if (_child_frames := json.get('childFrames')) is not None else None,
         )
 
 
@@ -745,7 +782,10 @@ class TransitionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TransitionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -774,16 +814,16 @@ class NavigationEntry:
         json['url'] = self.url
         json['userTypedURL'] = self.user_typed_url
         json['title'] = self.title
-        json['transitionType'] = self.transition_type.to_json()
+        json['transitionType'] = self.transition_type.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NavigationEntry:
+    def from_json(cls, json: NavigationEntryJSON) -> NavigationEntry:
         return cls(
-            id_=int(json['id']),
-            url=str(json['url']),
-            user_typed_url=str(json['userTypedURL']),
-            title=str(json['title']),
+            id_=json['id'],
+            url=json['url'],
+            user_typed_url=json['userTypedURL'],
+            title=json['title'],
             transition_type=TransitionType.from_json(json['transitionType']),
         )
 
@@ -823,11 +863,11 @@ class ScreencastFrameMetadata:
         json['scrollOffsetX'] = self.scroll_offset_x
         json['scrollOffsetY'] = self.scroll_offset_y
         if self.timestamp is not None:
-            json['timestamp'] = self.timestamp.to_json()
+            json['timestamp'] = self.timestamp
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreencastFrameMetadata:
+    def from_json(cls, json: ScreencastFrameMetadataJSON) -> ScreencastFrameMetadata:
         return cls(
             offset_top=float(json['offsetTop']),
             page_scale_factor=float(json['pageScaleFactor']),
@@ -835,7 +875,7 @@ class ScreencastFrameMetadata:
             device_height=float(json['deviceHeight']),
             scroll_offset_x=float(json['scrollOffsetX']),
             scroll_offset_y=float(json['scrollOffsetY']),
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']) if json.get('timestamp', None) is not None else None,
+            timestamp=network.TimeSinceEpoch(_timestamp) if (_timestamp := json.get('timestamp')) is not None else None,
         )
 
 
@@ -853,7 +893,10 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -882,12 +925,12 @@ class AppManifestError:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AppManifestError:
+    def from_json(cls, json: AppManifestErrorJSON) -> AppManifestError:
         return cls(
-            message=str(json['message']),
-            critical=int(json['critical']),
-            line=int(json['line']),
-            column=int(json['column']),
+            message=json['message'],
+            critical=json['critical'],
+            line=json['line'],
+            column=json['column'],
         )
 
 
@@ -905,9 +948,9 @@ class AppManifestParsedProperties:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AppManifestParsedProperties:
+    def from_json(cls, json: AppManifestParsedPropertiesJSON) -> AppManifestParsedProperties:
         return cls(
-            scope=str(json['scope']),
+            scope=json['scope'],
         )
 
 
@@ -937,12 +980,12 @@ class LayoutViewport:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayoutViewport:
+    def from_json(cls, json: LayoutViewportJSON) -> LayoutViewport:
         return cls(
-            page_x=int(json['pageX']),
-            page_y=int(json['pageY']),
-            client_width=int(json['clientWidth']),
-            client_height=int(json['clientHeight']),
+            page_x=json['pageX'],
+            page_y=json['pageY'],
+            client_width=json['clientWidth'],
+            client_height=json['clientHeight'],
         )
 
 
@@ -989,7 +1032,7 @@ class VisualViewport:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VisualViewport:
+    def from_json(cls, json: VisualViewportJSON) -> VisualViewport:
         return cls(
             offset_x=float(json['offsetX']),
             offset_y=float(json['offsetY']),
@@ -998,7 +1041,7 @@ class VisualViewport:
             client_width=float(json['clientWidth']),
             client_height=float(json['clientHeight']),
             scale=float(json['scale']),
-            zoom=float(json['zoom']) if json.get('zoom', None) is not None else None,
+            zoom=float(_zoom) if (_zoom := json.get('zoom')) is not None else None,
         )
 
 
@@ -1032,7 +1075,7 @@ class Viewport:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Viewport:
+    def from_json(cls, json: ViewportJSON) -> Viewport:
         return cls(
             x=float(json['x']),
             y=float(json['y']),
@@ -1087,15 +1130,15 @@ class FontFamilies:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FontFamilies:
+    def from_json(cls, json: FontFamiliesJSON) -> FontFamilies:
         return cls(
-            standard=str(json['standard']) if json.get('standard', None) is not None else None,
-            fixed=str(json['fixed']) if json.get('fixed', None) is not None else None,
-            serif=str(json['serif']) if json.get('serif', None) is not None else None,
-            sans_serif=str(json['sansSerif']) if json.get('sansSerif', None) is not None else None,
-            cursive=str(json['cursive']) if json.get('cursive', None) is not None else None,
-            fantasy=str(json['fantasy']) if json.get('fantasy', None) is not None else None,
-            math=str(json['math']) if json.get('math', None) is not None else None,
+            standard=json.get('standard'),
+            fixed=json.get('fixed'),
+            serif=json.get('serif'),
+            sans_serif=json.get('sansSerif'),
+            cursive=json.get('cursive'),
+            fantasy=json.get('fantasy'),
+            math=json.get('math'),
         )
 
 
@@ -1117,9 +1160,9 @@ class ScriptFontFamilies:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScriptFontFamilies:
+    def from_json(cls, json: ScriptFontFamiliesJSON) -> ScriptFontFamilies:
         return cls(
-            script=str(json['script']),
+            script=json['script'],
             font_families=FontFamilies.from_json(json['fontFamilies']),
         )
 
@@ -1144,10 +1187,10 @@ class FontSizes:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FontSizes:
+    def from_json(cls, json: FontSizesJSON) -> FontSizes:
         return cls(
-            standard=int(json['standard']) if json.get('standard', None) is not None else None,
-            fixed=int(json['fixed']) if json.get('fixed', None) is not None else None,
+            standard=json.get('standard'),
+            fixed=json.get('fixed'),
         )
 
 
@@ -1168,7 +1211,10 @@ class ClientNavigationReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ClientNavigationDisposition(enum.Enum):
@@ -1182,7 +1228,10 @@ class ClientNavigationDisposition(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationDisposition:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1200,10 +1249,10 @@ class InstallabilityErrorArgument:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InstallabilityErrorArgument:
+    def from_json(cls, json: InstallabilityErrorArgumentJSON) -> InstallabilityErrorArgument:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            name=json['name'],
+            value=json['value'],
         )
 
 
@@ -1225,9 +1274,9 @@ class InstallabilityError:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InstallabilityError:
+    def from_json(cls, json: InstallabilityErrorJSON) -> InstallabilityError:
         return cls(
-            error_id=str(json['errorId']),
+            error_id=json['errorId'],
             error_arguments=[InstallabilityErrorArgument.from_json(i) for i in json['errorArguments']],
         )
 
@@ -1250,7 +1299,10 @@ class ReferrerPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReferrerPolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1273,10 +1325,10 @@ class CompilationCacheParams:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CompilationCacheParams:
+    def from_json(cls, json: CompilationCacheParamsJSON) -> CompilationCacheParams:
         return cls(
-            url=str(json['url']),
-            eager=bool(json['eager']) if json.get('eager', None) is not None else None,
+            url=json['url'],
+            eager=json.get('eager'),
         )
 
 
@@ -1291,14 +1343,14 @@ class FileFilter:
         if self.name is not None:
             json['name'] = self.name
         if self.accepts is not None:
-            json['accepts'] = [i for i in self.accepts]
+            json['accepts'] = list(self.accepts)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FileFilter:
+    def from_json(cls, json: FileFilterJSON) -> FileFilter:
         return cls(
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            accepts=[str(i) for i in json['accepts']] if json.get('accepts', None) is not None else None,
+            name=json.get('name'),
+            accepts=json.get('accepts'),
         )
 
 
@@ -1329,13 +1381,13 @@ class FileHandler:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FileHandler:
+    def from_json(cls, json: FileHandlerJSON) -> FileHandler:
         return cls(
-            action=str(json['action']),
-            name=str(json['name']),
-            launch_type=str(json['launchType']),
-            icons=[ImageResource.from_json(i) for i in json['icons']] if json.get('icons', None) is not None else None,
-            accepts=[FileFilter.from_json(i) for i in json['accepts']] if json.get('accepts', None) is not None else None,
+            action=json['action'],
+            name=json['name'],
+            launch_type=json['launchType'],
+            icons=[ImageResource.from_json(i) for i in _icons] if (_icons := json.get('icons')) is not None else None,
+            accepts=[FileFilter.from_json(i) for i in _accepts] if (_accepts := json.get('accepts')) is not None else None,
         )
 
 
@@ -1362,11 +1414,11 @@ class ImageResource:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ImageResource:
+    def from_json(cls, json: ImageResourceJSON) -> ImageResource:
         return cls(
-            url=str(json['url']),
-            sizes=str(json['sizes']) if json.get('sizes', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            url=json['url'],
+            sizes=json.get('sizes'),
+            type_=json.get('type'),
         )
 
 
@@ -1380,9 +1432,9 @@ class LaunchHandler:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LaunchHandler:
+    def from_json(cls, json: LaunchHandlerJSON) -> LaunchHandler:
         return cls(
-            client_mode=str(json['clientMode']),
+            client_mode=json['clientMode'],
         )
 
 
@@ -1399,10 +1451,10 @@ class ProtocolHandler:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ProtocolHandler:
+    def from_json(cls, json: ProtocolHandlerJSON) -> ProtocolHandler:
         return cls(
-            protocol=str(json['protocol']),
-            url=str(json['url']),
+            protocol=json['protocol'],
+            url=json['url'],
         )
 
 
@@ -1420,10 +1472,10 @@ class RelatedApplication:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RelatedApplication:
+    def from_json(cls, json: RelatedApplicationJSON) -> RelatedApplication:
         return cls(
-            url=str(json['url']),
-            id_=str(json['id']) if json.get('id', None) is not None else None,
+            url=json['url'],
+            id_=json.get('id'),
         )
 
 
@@ -1442,10 +1494,10 @@ class ScopeExtension:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScopeExtension:
+    def from_json(cls, json: ScopeExtensionJSON) -> ScopeExtension:
         return cls(
-            origin=str(json['origin']),
-            has_origin_wildcard=bool(json['hasOriginWildcard']),
+            origin=json['origin'],
+            has_origin_wildcard=json['hasOriginWildcard'],
         )
 
 
@@ -1466,11 +1518,11 @@ class Screenshot:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Screenshot:
+    def from_json(cls, json: ScreenshotJSON) -> Screenshot:
         return cls(
             image=ImageResource.from_json(json['image']),
-            form_factor=str(json['formFactor']),
-            label=str(json['label']) if json.get('label', None) is not None else None,
+            form_factor=json['formFactor'],
+            label=json.get('label'),
         )
 
 
@@ -1507,15 +1559,15 @@ class ShareTarget:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ShareTarget:
+    def from_json(cls, json: ShareTargetJSON) -> ShareTarget:
         return cls(
-            action=str(json['action']),
-            method=str(json['method']),
-            enctype=str(json['enctype']),
-            title=str(json['title']) if json.get('title', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            files=[FileFilter.from_json(i) for i in json['files']] if json.get('files', None) is not None else None,
+            action=json['action'],
+            method=json['method'],
+            enctype=json['enctype'],
+            title=json.get('title'),
+            text=json.get('text'),
+            url=json.get('url'),
+            files=[FileFilter.from_json(i) for i in _files] if (_files := json.get('files')) is not None else None,
         )
 
 
@@ -1532,10 +1584,10 @@ class Shortcut:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Shortcut:
+    def from_json(cls, json: ShortcutJSON) -> Shortcut:
         return cls(
-            name=str(json['name']),
-            url=str(json['url']),
+            name=json['name'],
+            url=json['url'],
         )
 
 
@@ -1608,7 +1660,7 @@ class WebAppManifest:
         if self.display is not None:
             json['display'] = self.display
         if self.display_overrides is not None:
-            json['displayOverrides'] = [i for i in self.display_overrides]
+            json['displayOverrides'] = list(self.display_overrides)
         if self.file_handlers is not None:
             json['fileHandlers'] = [i.to_json() for i in self.file_handlers]
         if self.icons is not None:
@@ -1648,31 +1700,31 @@ class WebAppManifest:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WebAppManifest:
-        return cls(
-            background_color=str(json['backgroundColor']) if json.get('backgroundColor', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            dir_=str(json['dir']) if json.get('dir', None) is not None else None,
-            display=str(json['display']) if json.get('display', None) is not None else None,
-            display_overrides=[str(i) for i in json['displayOverrides']] if json.get('displayOverrides', None) is not None else None,
-            file_handlers=[FileHandler.from_json(i) for i in json['fileHandlers']] if json.get('fileHandlers', None) is not None else None,
-            icons=[ImageResource.from_json(i) for i in json['icons']] if json.get('icons', None) is not None else None,
-            id_=str(json['id']) if json.get('id', None) is not None else None,
-            lang=str(json['lang']) if json.get('lang', None) is not None else None,
-            launch_handler=LaunchHandler.from_json(json['launchHandler']) if json.get('launchHandler', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            orientation=str(json['orientation']) if json.get('orientation', None) is not None else None,
-            prefer_related_applications=bool(json['preferRelatedApplications']) if json.get('preferRelatedApplications', None) is not None else None,
-            protocol_handlers=[ProtocolHandler.from_json(i) for i in json['protocolHandlers']] if json.get('protocolHandlers', None) is not None else None,
-            related_applications=[RelatedApplication.from_json(i) for i in json['relatedApplications']] if json.get('relatedApplications', None) is not None else None,
-            scope=str(json['scope']) if json.get('scope', None) is not None else None,
-            scope_extensions=[ScopeExtension.from_json(i) for i in json['scopeExtensions']] if json.get('scopeExtensions', None) is not None else None,
-            screenshots=[Screenshot.from_json(i) for i in json['screenshots']] if json.get('screenshots', None) is not None else None,
-            share_target=ShareTarget.from_json(json['shareTarget']) if json.get('shareTarget', None) is not None else None,
-            short_name=str(json['shortName']) if json.get('shortName', None) is not None else None,
-            shortcuts=[Shortcut.from_json(i) for i in json['shortcuts']] if json.get('shortcuts', None) is not None else None,
-            start_url=str(json['startUrl']) if json.get('startUrl', None) is not None else None,
-            theme_color=str(json['themeColor']) if json.get('themeColor', None) is not None else None,
+    def from_json(cls, json: WebAppManifestJSON) -> WebAppManifest:
+        return cls(
+            background_color=json.get('backgroundColor'),
+            description=json.get('description'),
+            dir_=json.get('dir'),
+            display=json.get('display'),
+            display_overrides=json.get('displayOverrides'),
+            file_handlers=[FileHandler.from_json(i) for i in _file_handlers] if (_file_handlers := json.get('fileHandlers')) is not None else None,
+            icons=[ImageResource.from_json(i) for i in _icons] if (_icons := json.get('icons')) is not None else None,
+            id_=json.get('id'),
+            lang=json.get('lang'),
+            launch_handler=LaunchHandler.from_json(_launch_handler) if (_launch_handler := json.get('launchHandler')) is not None else None,
+            name=json.get('name'),
+            orientation=json.get('orientation'),
+            prefer_related_applications=json.get('preferRelatedApplications'),
+            protocol_handlers=[ProtocolHandler.from_json(i) for i in _protocol_handlers] if (_protocol_handlers := json.get('protocolHandlers')) is not None else None,
+            related_applications=[RelatedApplication.from_json(i) for i in _related_applications] if (_related_applications := json.get('relatedApplications')) is not None else None,
+            scope=json.get('scope'),
+            scope_extensions=[ScopeExtension.from_json(i) for i in _scope_extensions] if (_scope_extensions := json.get('scopeExtensions')) is not None else None,
+            screenshots=[Screenshot.from_json(i) for i in _screenshots] if (_screenshots := json.get('screenshots')) is not None else None,
+            share_target=ShareTarget.from_json(_share_target) if (_share_target := json.get('shareTarget')) is not None else None,
+            short_name=json.get('shortName'),
+            shortcuts=[Shortcut.from_json(i) for i in _shortcuts] if (_shortcuts := json.get('shortcuts')) is not None else None,
+            start_url=json.get('startUrl'),
+            theme_color=json.get('themeColor'),
         )
 
 
@@ -1690,7 +1742,10 @@ class AutoResponseMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AutoResponseMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class NavigationType(enum.Enum):
@@ -1705,7 +1760,10 @@ class NavigationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> NavigationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class BackForwardCacheNotRestoredReason(enum.Enum):
@@ -1858,7 +1916,10 @@ class BackForwardCacheNotRestoredReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class BackForwardCacheNotRestoredReasonType(enum.Enum):
@@ -1874,7 +1935,10 @@ class BackForwardCacheNotRestoredReasonType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReasonType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1902,12 +1966,12 @@ class BackForwardCacheBlockingDetails:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheBlockingDetails:
+    def from_json(cls, json: BackForwardCacheBlockingDetailsJSON) -> BackForwardCacheBlockingDetails:
         return cls(
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            function=str(json['function']) if json.get('function', None) is not None else None,
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
+            url=json.get('url'),
+            function=json.get('function'),
         )
 
 
@@ -1928,8 +1992,8 @@ class BackForwardCacheNotRestoredExplanation:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['type'] = self.type_.to_json()
-        json['reason'] = self.reason.to_json()
+        json['type'] = self.type_.value
+        json['reason'] = self.reason.value
         if self.context is not None:
             json['context'] = self.context
         if self.details is not None:
@@ -1937,12 +2001,12 @@ class BackForwardCacheNotRestoredExplanation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanation:
+    def from_json(cls, json: BackForwardCacheNotRestoredExplanationJSON) -> BackForwardCacheNotRestoredExplanation:
         return cls(
             type_=BackForwardCacheNotRestoredReasonType.from_json(json['type']),
             reason=BackForwardCacheNotRestoredReason.from_json(json['reason']),
-            context=str(json['context']) if json.get('context', None) is not None else None,
-            details=[BackForwardCacheBlockingDetails.from_json(i) for i in json['details']] if json.get('details', None) is not None else None,
+            context=json.get('context'),
+            details=[BackForwardCacheBlockingDetails.from_json(i) for i in _details] if (_details := json.get('details')) is not None else None,
         )
 
 
@@ -1965,18 +2029,22 @@ class BackForwardCacheNotRestoredExplanationTree:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanationTree:
+    def from_json(cls, json: BackForwardCacheNotRestoredExplanationTreeJSON) -> BackForwardCacheNotRestoredExplanationTree:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['explanations']],
             children=[BackForwardCacheNotRestoredExplanationTree.from_json(i) for i in json['children']],
         )
 
 
+def _parse_add_script_to_evaluate_on_load(json: AddScriptToEvaluateOnLoadReturnsJSON) -> ScriptIdentifier:
+    return ScriptIdentifier(json['identifier'])
+
+
 @deprecated(version="1.3")
 def add_script_to_evaluate_on_load(
         script_source: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ScriptIdentifier]:
+    ) -> Command[AddScriptToEvaluateOnLoadReturnsJSON, ScriptIdentifier]:
     '''
     Deprecated, please use addScriptToEvaluateOnNewDocument instead.
 
@@ -1989,12 +2057,11 @@ def add_script_to_evaluate_on_load(
     '''
     params: T_JSON_DICT = dict()
     params['scriptSource'] = script_source
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.addScriptToEvaluateOnLoad',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return ScriptIdentifier.from_json(json['identifier'])
+    return Command('Page.addScriptToEvaluateOnLoad', params, _parse_add_script_to_evaluate_on_load)
+
+
+def _parse_add_script_to_evaluate_on_new_document(json: AddScriptToEvaluateOnNewDocumentReturnsJSON) -> ScriptIdentifier:
+    return ScriptIdentifier(json['identifier'])
 
 
 def add_script_to_evaluate_on_new_document(
@@ -2002,7 +2069,7 @@ def add_script_to_evaluate_on_new_document(
         world_name: typing.Optional[str] = None,
         include_command_line_api: typing.Optional[bool] = None,
         run_immediately: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ScriptIdentifier]:
+    ) -> Command[AddScriptToEvaluateOnNewDocumentReturnsJSON, ScriptIdentifier]:
     '''
     Evaluates given script in every frame upon creation (before loading frame's scripts).
 
@@ -2020,22 +2087,18 @@ def add_script_to_evaluate_on_new_document(
         params['includeCommandLineAPI'] = include_command_line_api
     if run_immediately is not None:
         params['runImmediately'] = run_immediately
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.addScriptToEvaluateOnNewDocument',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return ScriptIdentifier.from_json(json['identifier'])
+    return Command('Page.addScriptToEvaluateOnNewDocument', params, _parse_add_script_to_evaluate_on_new_document)
 
 
-def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def bring_to_front() -> Command[T_JSON_DICT, None]:
     '''
     Brings page to front (activates tab).
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.bringToFront',
-    }
-    json = yield cmd_dict
+    return Command('Page.bringToFront')
+
+
+def _parse_capture_screenshot(json: CaptureScreenshotReturnsJSON) -> str:
+    return json['data']
 
 
 def capture_screenshot(
@@ -2045,7 +2108,7 @@ def capture_screenshot(
         from_surface: typing.Optional[bool] = None,
         capture_beyond_viewport: typing.Optional[bool] = None,
         optimize_for_speed: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[CaptureScreenshotReturnsJSON, str]:
     '''
     Capture page screenshot.
 
@@ -2070,17 +2133,16 @@ def capture_screenshot(
         params['captureBeyondViewport'] = capture_beyond_viewport
     if optimize_for_speed is not None:
         params['optimizeForSpeed'] = optimize_for_speed
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.captureScreenshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['data'])
+    return Command('Page.captureScreenshot', params, _parse_capture_screenshot)
+
+
+def _parse_capture_snapshot(json: CaptureSnapshotReturnsJSON) -> str:
+    return json['data']
 
 
 def capture_snapshot(
         format_: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    ) -> Command[CaptureSnapshotReturnsJSON, str]:
     '''
     Returns a snapshot of the page as a string. For MHTML format, the serialization includes
     iframes, shadow DOM, external resources, and element-inline styles.
@@ -2093,16 +2155,11 @@ def capture_snapshot(
     params: T_JSON_DICT = dict()
     if format_ is not None:
         params['format'] = format_
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.captureSnapshot',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return str(json['data'])
+    return Command('Page.captureSnapshot', params, _parse_capture_snapshot)
 
 
 @deprecated(version="1.3")
-def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_device_metrics_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden device metrics.
 
@@ -2110,14 +2167,11 @@ def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.clearDeviceMetricsOverride',
-    }
-    json = yield cmd_dict
+    return Command('Page.clearDeviceMetricsOverride')
 
 
 @deprecated(version="1.3")
-def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_device_orientation_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden Device Orientation.
 
@@ -2125,30 +2179,28 @@ def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.clearDeviceOrientationOverride',
-    }
-    json = yield cmd_dict
+    return Command('Page.clearDeviceOrientationOverride')
 
 
 @deprecated(version="1.3")
-def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_geolocation_override() -> Command[T_JSON_DICT, None]:
     '''
     Clears the overridden Geolocation Position and Error.
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.clearGeolocationOverride',
-    }
-    json = yield cmd_dict
+    return Command('Page.clearGeolocationOverride')
+
+
+def _parse_create_isolated_world(json: CreateIsolatedWorldReturnsJSON) -> runtime.ExecutionContextId:
+    return runtime.ExecutionContextId(json['executionContextId'])
 
 
 def create_isolated_world(
         frame_id: FrameId,
         world_name: typing.Optional[str] = None,
         grant_univeral_access: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.ExecutionContextId]:
+    ) -> Command[CreateIsolatedWorldReturnsJSON, runtime.ExecutionContextId]:
     '''
     Creates an isolated world for the given frame.
 
@@ -2158,24 +2210,19 @@ def create_isolated_world(
     :returns: Execution context of the isolated world.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     if world_name is not None:
         params['worldName'] = world_name
     if grant_univeral_access is not None:
         params['grantUniveralAccess'] = grant_univeral_access
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.createIsolatedWorld',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return runtime.ExecutionContextId.from_json(json['executionContextId'])
+    return Command('Page.createIsolatedWorld', params, _parse_create_isolated_world)
 
 
 @deprecated(version="1.3")
 def delete_cookie(
         cookie_name: str,
         url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes browser cookie with given name, domain and path.
 
@@ -2189,26 +2236,19 @@ def delete_cookie(
     params: T_JSON_DICT = dict()
     params['cookieName'] = cookie_name
     params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.deleteCookie',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.deleteCookie', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables page domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.disable',
-    }
-    json = yield cmd_dict
+    return Command('Page.disable')
 
 
 def enable(
         enable_file_chooser_opened_event: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables page domain notifications.
 
@@ -2217,16 +2257,22 @@ def enable(
     params: T_JSON_DICT = dict()
     if enable_file_chooser_opened_event is not None:
         params['enableFileChooserOpenedEvent'] = enable_file_chooser_opened_event
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.enable', params)
+
+
+def _parse_get_app_manifest(json: GetAppManifestReturnsJSON) -> typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]:
+    return (
+        json['url'],
+        [AppManifestError.from_json(i) for i in json['errors']],
+        json.get('data'),
+        AppManifestParsedProperties.from_json(_parsed) if (_parsed := json.get('parsed')) is not None else None,
+        WebAppManifest.from_json(json['manifest'])
+    )
 
 
 def get_app_manifest(
         manifest_id: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]]:
+    ) -> Command[GetAppManifestReturnsJSON, typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]]:
     '''
     Gets the processed manifest for this current document.
       This API always waits for the manifest to be loaded.
@@ -2246,21 +2292,14 @@ def get_app_manifest(
     params: T_JSON_DICT = dict()
     if manifest_id is not None:
         params['manifestId'] = manifest_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getAppManifest',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['url']),
-        [AppManifestError.from_json(i) for i in json['errors']],
-        str(json['data']) if json.get('data', None) is not None else None,
-        AppManifestParsedProperties.from_json(json['parsed']) if json.get('parsed', None) is not None else None,
-        WebAppManifest.from_json(json['manifest'])
-    )
+    return Command('Page.getAppManifest', params, _parse_get_app_manifest)
+
 
+def _parse_get_installability_errors(json: GetInstallabilityErrorsReturnsJSON) -> typing.List[InstallabilityError]:
+    return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
 
-def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[InstallabilityError]]:
+
+def get_installability_errors() -> Command[GetInstallabilityErrorsReturnsJSON, typing.List[InstallabilityError]]:
     '''
 
 
@@ -2268,15 +2307,15 @@ def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typi
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getInstallabilityErrors',
-    }
-    json = yield cmd_dict
-    return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
+    return Command('Page.getInstallabilityErrors', None, _parse_get_installability_errors)
+
+
+def _parse_get_manifest_icons(json: GetManifestIconsReturnsJSON) -> typing.Optional[str]:
+    return json.get('primaryIcon')
 
 
 @deprecated(version="1.3")
-def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[str]]:
+def get_manifest_icons() -> Command[GetManifestIconsReturnsJSON, typing.Optional[str]]:
     '''
     Deprecated because it's not guaranteed that the returned icon is in fact the one used for PWA installation.
 
@@ -2286,14 +2325,17 @@ def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Opti
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getManifestIcons',
-    }
-    json = yield cmd_dict
-    return str(json['primaryIcon']) if json.get('primaryIcon', None) is not None else None
+    return Command('Page.getManifestIcons', None, _parse_get_manifest_icons)
+
+
+def _parse_get_app_id(json: GetAppIdReturnsJSON) -> typing.Tuple[typing.Optional[str], typing.Optional[str]]:
+    return (
+        json.get('appId'),
+        json.get('recommendedId')
+    )
 
 
-def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], typing.Optional[str]]]:
+def get_app_id() -> Command[GetAppIdReturnsJSON, typing.Tuple[typing.Optional[str], typing.Optional[str]]]:
     '''
     Returns the unique (PWA) app id.
     Only returns values if the feature flag 'WebAppEnableManifestId' is enabled
@@ -2305,19 +2347,16 @@ def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing
         0. **appId** - *(Optional)* App id, either from manifest's id attribute or computed from start_url
         1. **recommendedId** - *(Optional)* Recommendation for manifest's id attribute to match current id computed from start_url
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getAppId',
-    }
-    json = yield cmd_dict
-    return (
-        str(json['appId']) if json.get('appId', None) is not None else None,
-        str(json['recommendedId']) if json.get('recommendedId', None) is not None else None
-    )
+    return Command('Page.getAppId', None, _parse_get_app_id)
+
+
+def _parse_get_ad_script_id(json: GetAdScriptIdReturnsJSON) -> typing.Optional[AdScriptId]:
+    return AdScriptId.from_json(_ad_script_id) if (_ad_script_id := json.get('adScriptId')) is not None else None
 
 
 def get_ad_script_id(
         frame_id: FrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[AdScriptId]]:
+    ) -> Command[GetAdScriptIdReturnsJSON, typing.Optional[AdScriptId]]:
     '''
 
 
@@ -2327,29 +2366,35 @@ def get_ad_script_id(
     :returns: *(Optional)* Identifies the bottom-most script which caused the frame to be labelled as an ad. Only sent if frame is labelled as an ad and id is available.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getAdScriptId',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return AdScriptId.from_json(json['adScriptId']) if json.get('adScriptId', None) is not None else None
+    params['frameId'] = frame_id
+    return Command('Page.getAdScriptId', params, _parse_get_ad_script_id)
+
+
+def _parse_get_frame_tree(json: GetFrameTreeReturnsJSON) -> FrameTree:
+    return FrameTree.from_json(json['frameTree'])
 
 
-def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
+def get_frame_tree() -> Command[GetFrameTreeReturnsJSON, FrameTree]:
     '''
     Returns present frame tree structure.
 
     :returns: Present frame tree structure.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getFrameTree',
-    }
-    json = yield cmd_dict
-    return FrameTree.from_json(json['frameTree'])
+    return Command('Page.getFrameTree', None, _parse_get_frame_tree)
+
+
+def _parse_get_layout_metrics(json: GetLayoutMetricsReturnsJSON) -> typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]:
+    return (
+        LayoutViewport.from_json(json['layoutViewport']),
+        VisualViewport.from_json(json['visualViewport']),
+        dom.Rect.from_json(json['contentSize']),
+        LayoutViewport.from_json(json['cssLayoutViewport']),
+        VisualViewport.from_json(json['cssVisualViewport']),
+        dom.Rect.from_json(json['cssContentSize'])
+    )
 
 
-def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]]:
+def get_layout_metrics() -> Command[GetLayoutMetricsReturnsJSON, typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]]:
     '''
     Returns metrics relating to the layouting of the page, such as viewport bounds/scale.
 
@@ -2362,21 +2407,17 @@ def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tupl
         4. **cssVisualViewport** - Metrics relating to the visual viewport in CSS pixels.
         5. **cssContentSize** - Size of scrollable area in CSS pixels.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getLayoutMetrics',
-    }
-    json = yield cmd_dict
+    return Command('Page.getLayoutMetrics', None, _parse_get_layout_metrics)
+
+
+def _parse_get_navigation_history(json: GetNavigationHistoryReturnsJSON) -> typing.Tuple[int, typing.List[NavigationEntry]]:
     return (
-        LayoutViewport.from_json(json['layoutViewport']),
-        VisualViewport.from_json(json['visualViewport']),
-        dom.Rect.from_json(json['contentSize']),
-        LayoutViewport.from_json(json['cssLayoutViewport']),
-        VisualViewport.from_json(json['cssVisualViewport']),
-        dom.Rect.from_json(json['cssContentSize'])
+        json['currentIndex'],
+        [NavigationEntry.from_json(i) for i in json['entries']]
     )
 
 
-def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[int, typing.List[NavigationEntry]]]:
+def get_navigation_history() -> Command[GetNavigationHistoryReturnsJSON, typing.Tuple[int, typing.List[NavigationEntry]]]:
     '''
     Returns navigation history for the current page.
 
@@ -2385,30 +2426,27 @@ def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
         0. **currentIndex** - Index of the current navigation history entry.
         1. **entries** - Array of navigation history entries.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getNavigationHistory',
-    }
-    json = yield cmd_dict
-    return (
-        int(json['currentIndex']),
-        [NavigationEntry.from_json(i) for i in json['entries']]
-    )
+    return Command('Page.getNavigationHistory', None, _parse_get_navigation_history)
 
 
-def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def reset_navigation_history() -> Command[T_JSON_DICT, None]:
     '''
     Resets navigation history for the current page.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.resetNavigationHistory',
-    }
-    json = yield cmd_dict
+    return Command('Page.resetNavigationHistory')
+
+
+def _parse_get_resource_content(json: GetResourceContentReturnsJSON) -> typing.Tuple[str, bool]:
+    return (
+        json['content'],
+        json['base64Encoded']
+    )
 
 
 def get_resource_content(
         frame_id: FrameId,
         url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
+    ) -> Command[GetResourceContentReturnsJSON, typing.Tuple[str, bool]]:
     '''
     Returns content of the given resource.
 
@@ -2422,20 +2460,16 @@ def get_resource_content(
         1. **base64Encoded** - True, if content was served as base64.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getResourceContent',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['content']),
-        bool(json['base64Encoded'])
-    )
+    return Command('Page.getResourceContent', params, _parse_get_resource_content)
 
 
-def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourceTree]:
+def _parse_get_resource_tree(json: GetResourceTreeReturnsJSON) -> FrameResourceTree:
+    return FrameResourceTree.from_json(json['frameTree'])
+
+
+def get_resource_tree() -> Command[GetResourceTreeReturnsJSON, FrameResourceTree]:
     '''
     Returns present frame / resource tree structure.
 
@@ -2443,17 +2477,13 @@ def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourc
 
     :returns: Present frame / resource tree structure.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getResourceTree',
-    }
-    json = yield cmd_dict
-    return FrameResourceTree.from_json(json['frameTree'])
+    return Command('Page.getResourceTree', None, _parse_get_resource_tree)
 
 
 def handle_java_script_dialog(
         accept: bool,
         prompt_text: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload).
 
@@ -2464,11 +2494,15 @@ def handle_java_script_dialog(
     params['accept'] = accept
     if prompt_text is not None:
         params['promptText'] = prompt_text
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.handleJavaScriptDialog',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.handleJavaScriptDialog', params)
+
+
+def _parse_navigate(json: NavigateReturnsJSON) -> typing.Tuple[FrameId, typing.Optional[network.LoaderId], typing.Optional[str]]:
+    return (
+        FrameId(json['frameId']),
+        network.LoaderId(_loader_id) if (_loader_id := json.get('loaderId')) is not None else None,
+        json.get('errorText')
+    )
 
 
 def navigate(
@@ -2477,7 +2511,7 @@ def navigate(
         transition_type: typing.Optional[TransitionType] = None,
         frame_id: typing.Optional[FrameId] = None,
         referrer_policy: typing.Optional[ReferrerPolicy] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[FrameId, typing.Optional[network.LoaderId], typing.Optional[str]]]:
+    ) -> Command[NavigateReturnsJSON, typing.Tuple[FrameId, typing.Optional[network.LoaderId], typing.Optional[str]]]:
     '''
     Navigates current page to the given URL.
 
@@ -2497,26 +2531,17 @@ def navigate(
     if referrer is not None:
         params['referrer'] = referrer
     if transition_type is not None:
-        params['transitionType'] = transition_type.to_json()
+        params['transitionType'] = transition_type.value
     if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
+        params['frameId'] = frame_id
     if referrer_policy is not None:
-        params['referrerPolicy'] = referrer_policy.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.navigate',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        FrameId.from_json(json['frameId']),
-        network.LoaderId.from_json(json['loaderId']) if json.get('loaderId', None) is not None else None,
-        str(json['errorText']) if json.get('errorText', None) is not None else None
-    )
+        params['referrerPolicy'] = referrer_policy.value
+    return Command('Page.navigate', params, _parse_navigate)
 
 
 def navigate_to_history_entry(
         entry_id: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Navigates current page to the given history entry.
 
@@ -2524,11 +2549,14 @@ def navigate_to_history_entry(
     '''
     params: T_JSON_DICT = dict()
     params['entryId'] = entry_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.navigateToHistoryEntry',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.navigateToHistoryEntry', params)
+
+
+def _parse_print_to_pdf(json: PrintToPDFReturnsJSON) -> typing.Tuple[str, typing.Optional[io.StreamHandle]]:
+    return (
+        json['data'],
+        io.StreamHandle(_stream) if (_stream := json.get('stream')) is not None else None
+    )
 
 
 def print_to_pdf(
@@ -2549,7 +2577,7 @@ def print_to_pdf(
         transfer_mode: typing.Optional[str] = None,
         generate_tagged_pdf: typing.Optional[bool] = None,
         generate_document_outline: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.Optional[io.StreamHandle]]]:
+    ) -> Command[PrintToPDFReturnsJSON, typing.Tuple[str, typing.Optional[io.StreamHandle]]]:
     '''
     Print page as PDF.
 
@@ -2610,22 +2638,14 @@ def print_to_pdf(
         params['generateTaggedPDF'] = generate_tagged_pdf
     if generate_document_outline is not None:
         params['generateDocumentOutline'] = generate_document_outline
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.printToPDF',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['data']),
-        io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None
-    )
+    return Command('Page.printToPDF', params, _parse_print_to_pdf)
 
 
 def reload(
         ignore_cache: typing.Optional[bool] = None,
         script_to_evaluate_on_load: typing.Optional[str] = None,
         loader_id: typing.Optional[network.LoaderId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Reloads given page optionally ignoring the cache.
 
@@ -2639,18 +2659,14 @@ def reload(
     if script_to_evaluate_on_load is not None:
         params['scriptToEvaluateOnLoad'] = script_to_evaluate_on_load
     if loader_id is not None:
-        params['loaderId'] = loader_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.reload',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['loaderId'] = loader_id
+    return Command('Page.reload', params)
 
 
 @deprecated(version="1.3")
 def remove_script_to_evaluate_on_load(
         identifier: ScriptIdentifier
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deprecated, please use removeScriptToEvaluateOnNewDocument instead.
 
@@ -2661,34 +2677,26 @@ def remove_script_to_evaluate_on_load(
     :param identifier:
     '''
     params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.removeScriptToEvaluateOnLoad',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['identifier'] = identifier
+    return Command('Page.removeScriptToEvaluateOnLoad', params)
 
 
 def remove_script_to_evaluate_on_new_document(
         identifier: ScriptIdentifier
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes given script from the list.
 
     :param identifier:
     '''
     params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.removeScriptToEvaluateOnNewDocument',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['identifier'] = identifier
+    return Command('Page.removeScriptToEvaluateOnNewDocument', params)
 
 
 def screencast_frame_ack(
         session_id: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Acknowledges that a screencast frame has been received by the frontend.
 
@@ -2698,11 +2706,11 @@ def screencast_frame_ack(
     '''
     params: T_JSON_DICT = dict()
     params['sessionId'] = session_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.screencastFrameAck',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.screencastFrameAck', params)
+
+
+def _parse_search_in_resource(json: SearchInResourceReturnsJSON) -> typing.List[debugger.SearchMatch]:
+    return [debugger.SearchMatch.from_json(i) for i in json['result']]
 
 
 def search_in_resource(
@@ -2711,7 +2719,7 @@ def search_in_resource(
         query: str,
         case_sensitive: typing.Optional[bool] = None,
         is_regex: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[debugger.SearchMatch]]:
+    ) -> Command[SearchInResourceReturnsJSON, typing.List[debugger.SearchMatch]]:
     '''
     Searches for given string in resource content.
 
@@ -2725,24 +2733,19 @@ def search_in_resource(
     :returns: List of search matches.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     params['url'] = url
     params['query'] = query
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.searchInResource',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return Command('Page.searchInResource', params, _parse_search_in_resource)
 
 
 def set_ad_blocking_enabled(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable Chrome's experimental ad filter on all sites.
 
@@ -2752,16 +2755,12 @@ def set_ad_blocking_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setAdBlockingEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setAdBlockingEnabled', params)
 
 
 def set_bypass_csp(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable page Content Security Policy by-passing.
 
@@ -2769,16 +2768,16 @@ def set_bypass_csp(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setBypassCSP',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setBypassCSP', params)
+
+
+def _parse_get_permissions_policy_state(json: GetPermissionsPolicyStateReturnsJSON) -> typing.List[PermissionsPolicyFeatureState]:
+    return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
 
 
 def get_permissions_policy_state(
         frame_id: FrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PermissionsPolicyFeatureState]]:
+    ) -> Command[GetPermissionsPolicyStateReturnsJSON, typing.List[PermissionsPolicyFeatureState]]:
     '''
     Get Permissions Policy state on given frame.
 
@@ -2788,18 +2787,17 @@ def get_permissions_policy_state(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getPermissionsPolicyState',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
+    params['frameId'] = frame_id
+    return Command('Page.getPermissionsPolicyState', params, _parse_get_permissions_policy_state)
+
+
+def _parse_get_origin_trials(json: GetOriginTrialsReturnsJSON) -> typing.List[OriginTrial]:
+    return [OriginTrial.from_json(i) for i in json['originTrials']]
 
 
 def get_origin_trials(
         frame_id: FrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[OriginTrial]]:
+    ) -> Command[GetOriginTrialsReturnsJSON, typing.List[OriginTrial]]:
     '''
     Get Origin Trials on given frame.
 
@@ -2809,13 +2807,8 @@ def get_origin_trials(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.getOriginTrials',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [OriginTrial.from_json(i) for i in json['originTrials']]
+    params['frameId'] = frame_id
+    return Command('Page.getOriginTrials', params, _parse_get_origin_trials)
 
 
 @deprecated(version="1.3")
@@ -2832,7 +2825,7 @@ def set_device_metrics_override(
         dont_set_visible_size: typing.Optional[bool] = None,
         screen_orientation: typing.Optional[emulation.ScreenOrientation] = None,
         viewport: typing.Optional[Viewport] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
     window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
@@ -2876,11 +2869,7 @@ def set_device_metrics_override(
         params['screenOrientation'] = screen_orientation.to_json()
     if viewport is not None:
         params['viewport'] = viewport.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setDeviceMetricsOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setDeviceMetricsOverride', params)
 
 
 @deprecated(version="1.3")
@@ -2888,7 +2877,7 @@ def set_device_orientation_override(
         alpha: float,
         beta: float,
         gamma: float
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the Device Orientation.
 
@@ -2904,17 +2893,13 @@ def set_device_orientation_override(
     params['alpha'] = alpha
     params['beta'] = beta
     params['gamma'] = gamma
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setDeviceOrientationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setDeviceOrientationOverride', params)
 
 
 def set_font_families(
         font_families: FontFamilies,
         for_scripts: typing.Optional[typing.List[ScriptFontFamilies]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set generic font families.
 
@@ -2927,16 +2912,12 @@ def set_font_families(
     params['fontFamilies'] = font_families.to_json()
     if for_scripts is not None:
         params['forScripts'] = [i.to_json() for i in for_scripts]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setFontFamilies',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setFontFamilies', params)
 
 
 def set_font_sizes(
         font_sizes: FontSizes
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set default font sizes.
 
@@ -2946,17 +2927,13 @@ def set_font_sizes(
     '''
     params: T_JSON_DICT = dict()
     params['fontSizes'] = font_sizes.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setFontSizes',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setFontSizes', params)
 
 
 def set_document_content(
         frame_id: FrameId,
         html: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets given markup as the document's HTML.
 
@@ -2964,20 +2941,16 @@ def set_document_content(
     :param html: HTML content to set.
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params['frameId'] = frame_id
     params['html'] = html
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setDocumentContent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setDocumentContent', params)
 
 
 @deprecated(version="1.3")
 def set_download_behavior(
         behavior: str,
         download_path: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set the behavior when downloading a file.
 
@@ -2992,11 +2965,7 @@ def set_download_behavior(
     params['behavior'] = behavior
     if download_path is not None:
         params['downloadPath'] = download_path
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setDownloadBehavior',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setDownloadBehavior', params)
 
 
 @deprecated(version="1.3")
@@ -3004,7 +2973,7 @@ def set_geolocation_override(
         latitude: typing.Optional[float] = None,
         longitude: typing.Optional[float] = None,
         accuracy: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position
     unavailable.
@@ -3022,16 +2991,12 @@ def set_geolocation_override(
         params['longitude'] = longitude
     if accuracy is not None:
         params['accuracy'] = accuracy
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setGeolocationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setGeolocationOverride', params)
 
 
 def set_lifecycle_events_enabled(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Controls whether page will emit lifecycle events.
 
@@ -3039,18 +3004,14 @@ def set_lifecycle_events_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setLifecycleEventsEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setLifecycleEventsEnabled', params)
 
 
 @deprecated(version="1.3")
 def set_touch_emulation_enabled(
         enabled: bool,
         configuration: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Toggles mouse event-based touch event emulation.
 
@@ -3065,11 +3026,7 @@ def set_touch_emulation_enabled(
     params['enabled'] = enabled
     if configuration is not None:
         params['configuration'] = configuration
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setTouchEmulationEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setTouchEmulationEnabled', params)
 
 
 def start_screencast(
@@ -3078,7 +3035,7 @@ def start_screencast(
         max_width: typing.Optional[int] = None,
         max_height: typing.Optional[int] = None,
         every_nth_frame: typing.Optional[int] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Starts sending each frame using the ``screencastFrame`` event.
 
@@ -3101,48 +3058,35 @@ def start_screencast(
         params['maxHeight'] = max_height
     if every_nth_frame is not None:
         params['everyNthFrame'] = every_nth_frame
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.startScreencast',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.startScreencast', params)
 
 
-def stop_loading() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_loading() -> Command[T_JSON_DICT, None]:
     '''
     Force the page stop all navigations and pending resource fetches.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.stopLoading',
-    }
-    json = yield cmd_dict
+    return Command('Page.stopLoading')
 
 
-def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def crash() -> Command[T_JSON_DICT, None]:
     '''
     Crashes renderer on the IO thread, generates minidumps.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.crash',
-    }
-    json = yield cmd_dict
+    return Command('Page.crash')
 
 
-def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def close() -> Command[T_JSON_DICT, None]:
     '''
     Tries to close page, running its beforeunload hooks, if any.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.close',
-    }
-    json = yield cmd_dict
+    return Command('Page.close')
 
 
 def set_web_lifecycle_state(
         state: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Tries to update the web lifecycle state of the page.
     It will transition the page to the given state according to:
@@ -3154,28 +3098,21 @@ def set_web_lifecycle_state(
     '''
     params: T_JSON_DICT = dict()
     params['state'] = state
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setWebLifecycleState',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setWebLifecycleState', params)
 
 
-def stop_screencast() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_screencast() -> Command[T_JSON_DICT, None]:
     '''
     Stops sending each frame in the ``screencastFrame``.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.stopScreencast',
-    }
-    json = yield cmd_dict
+    return Command('Page.stopScreencast')
 
 
 def produce_compilation_cache(
         scripts: typing.List[CompilationCacheParams]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Requests backend to produce compilation cache for the specified scripts.
     ``scripts`` are appended to the list of scripts for which the cache
@@ -3190,17 +3127,13 @@ def produce_compilation_cache(
     '''
     params: T_JSON_DICT = dict()
     params['scripts'] = [i.to_json() for i in scripts]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.produceCompilationCache',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.produceCompilationCache', params)
 
 
 def add_compilation_cache(
         url: str,
         data: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Seeds compilation cache for given url. Compilation cache does not survive
     cross-process navigation.
@@ -3213,28 +3146,21 @@ def add_compilation_cache(
     params: T_JSON_DICT = dict()
     params['url'] = url
     params['data'] = data
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.addCompilationCache',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.addCompilationCache', params)
 
 
-def clear_compilation_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def clear_compilation_cache() -> Command[T_JSON_DICT, None]:
     '''
     Clears seeded compilation cache.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.clearCompilationCache',
-    }
-    json = yield cmd_dict
+    return Command('Page.clearCompilationCache')
 
 
 def set_spc_transaction_mode(
         mode: AutoResponseMode
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets the Secure Payment Confirmation transaction mode.
     https://w3c.github.io/secure-payment-confirmation/#sctn-automation-set-spc-transaction-mode
@@ -3244,17 +3170,13 @@ def set_spc_transaction_mode(
     :param mode:
     '''
     params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setSPCTransactionMode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['mode'] = mode.value
+    return Command('Page.setSPCTransactionMode', params)
 
 
 def set_rph_registration_mode(
         mode: AutoResponseMode
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Extensions for Custom Handlers API:
     https://html.spec.whatwg.org/multipage/system-state.html#rph-automation
@@ -3264,18 +3186,14 @@ def set_rph_registration_mode(
     :param mode:
     '''
     params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setRPHRegistrationMode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['mode'] = mode.value
+    return Command('Page.setRPHRegistrationMode', params)
 
 
 def generate_test_report(
         message: str,
         group: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Generates a report for testing.
 
@@ -3288,28 +3206,21 @@ def generate_test_report(
     params['message'] = message
     if group is not None:
         params['group'] = group
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.generateTestReport',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.generateTestReport', params)
 
 
-def wait_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def wait_for_debugger() -> Command[T_JSON_DICT, None]:
     '''
     Pauses page execution. Can be resumed using generic Runtime.runIfWaitingForDebugger.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.waitForDebugger',
-    }
-    json = yield cmd_dict
+    return Command('Page.waitForDebugger')
 
 
 def set_intercept_file_chooser_dialog(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Intercept file chooser requests and transfer control to protocol clients.
     When file chooser interception is enabled, native file chooser dialog is not shown.
@@ -3319,16 +3230,12 @@ def set_intercept_file_chooser_dialog(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setInterceptFileChooserDialog',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setInterceptFileChooserDialog', params)
 
 
 def set_prerendering_allowed(
         is_allowed: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable/disable prerendering manually.
 
@@ -3344,11 +3251,7 @@ def set_prerendering_allowed(
     '''
     params: T_JSON_DICT = dict()
     params['isAllowed'] = is_allowed
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Page.setPrerenderingAllowed',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Page.setPrerenderingAllowed', params)
 
 
 @event_class('Page.domContentEventFired')
@@ -3357,9 +3260,9 @@ class DomContentEventFired:
     timestamp: network.MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DomContentEventFired:
+    def from_json(cls, json: DomContentEventFiredJSON) -> DomContentEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
@@ -3377,11 +3280,11 @@ class FileChooserOpened:
     backend_node_id: typing.Optional[dom.BackendNodeId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FileChooserOpened:
+    def from_json(cls, json: FileChooserOpenedJSON) -> FileChooserOpened:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            mode=str(json['mode']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None
+            frame_id=FrameId(json['frameId']),
+            mode=json['mode'],
+            backend_node_id=dom.BackendNodeId(_backend_node_id) if (_backend_node_id := json.get('backendNodeId')) is not None else None
         )
 
 
@@ -3399,11 +3302,11 @@ class FrameAttached:
     stack: typing.Optional[runtime.StackTrace]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameAttached:
+    def from_json(cls, json: FrameAttachedJSON) -> FrameAttached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            parent_frame_id=FrameId.from_json(json['parentFrameId']),
-            stack=runtime.StackTrace.from_json(json['stack']) if json.get('stack', None) is not None else None
+            frame_id=FrameId(json['frameId']),
+            parent_frame_id=FrameId(json['parentFrameId']),
+            stack=runtime.StackTrace.from_json(_stack) if (_stack := json.get('stack')) is not None else None
         )
 
 
@@ -3418,9 +3321,9 @@ class FrameClearedScheduledNavigation:
     frame_id: FrameId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameClearedScheduledNavigation:
+    def from_json(cls, json: FrameClearedScheduledNavigationJSON) -> FrameClearedScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
@@ -3435,10 +3338,10 @@ class FrameDetached:
     reason: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameDetached:
+    def from_json(cls, json: FrameDetachedJSON) -> FrameDetached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            reason=str(json['reason'])
+            frame_id=FrameId(json['frameId']),
+            reason=json['reason']
         )
 
 
@@ -3455,9 +3358,9 @@ class FrameSubtreeWillBeDetached:
     frame_id: FrameId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameSubtreeWillBeDetached:
+    def from_json(cls, json: FrameSubtreeWillBeDetachedJSON) -> FrameSubtreeWillBeDetached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
@@ -3472,7 +3375,7 @@ class FrameNavigated:
     type_: NavigationType
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameNavigated:
+    def from_json(cls, json: FrameNavigatedJSON) -> FrameNavigated:
         return cls(
             frame=Frame.from_json(json['frame']),
             type_=NavigationType.from_json(json['type'])
@@ -3491,7 +3394,7 @@ class DocumentOpened:
     frame: Frame
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DocumentOpened:
+    def from_json(cls, json: DocumentOpenedJSON) -> DocumentOpened:
         return cls(
             frame=Frame.from_json(json['frame'])
         )
@@ -3540,12 +3443,12 @@ class FrameStartedNavigating:
     navigation_type: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameStartedNavigating:
+    def from_json(cls, json: FrameStartedNavigatingJSON) -> FrameStartedNavigating:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            url=str(json['url']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            navigation_type=str(json['navigationType'])
+            frame_id=FrameId(json['frameId']),
+            url=json['url'],
+            loader_id=network.LoaderId(json['loaderId']),
+            navigation_type=json['navigationType']
         )
 
 
@@ -3568,11 +3471,11 @@ class FrameRequestedNavigation:
     disposition: ClientNavigationDisposition
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameRequestedNavigation:
+    def from_json(cls, json: FrameRequestedNavigationJSON) -> FrameRequestedNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
+            frame_id=FrameId(json['frameId']),
             reason=ClientNavigationReason.from_json(json['reason']),
-            url=str(json['url']),
+            url=json['url'],
             disposition=ClientNavigationDisposition.from_json(json['disposition'])
         )
 
@@ -3595,12 +3498,12 @@ class FrameScheduledNavigation:
     url: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameScheduledNavigation:
+    def from_json(cls, json: FrameScheduledNavigationJSON) -> FrameScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
+            frame_id=FrameId(json['frameId']),
             delay=float(json['delay']),
             reason=ClientNavigationReason.from_json(json['reason']),
-            url=str(json['url'])
+            url=json['url']
         )
 
 
@@ -3616,9 +3519,9 @@ class FrameStartedLoading:
     frame_id: FrameId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameStartedLoading:
+    def from_json(cls, json: FrameStartedLoadingJSON) -> FrameStartedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
@@ -3634,9 +3537,9 @@ class FrameStoppedLoading:
     frame_id: FrameId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FrameStoppedLoading:
+    def from_json(cls, json: FrameStoppedLoadingJSON) -> FrameStoppedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            frame_id=FrameId(json['frameId'])
         )
 
 
@@ -3660,12 +3563,12 @@ class DownloadWillBegin:
     suggested_filename: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
+    def from_json(cls, json: DownloadWillBeginJSON) -> DownloadWillBegin:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            guid=str(json['guid']),
-            url=str(json['url']),
-            suggested_filename=str(json['suggestedFilename'])
+            frame_id=FrameId(json['frameId']),
+            guid=json['guid'],
+            url=json['url'],
+            suggested_filename=json['suggestedFilename']
         )
 
 
@@ -3689,12 +3592,12 @@ class DownloadProgress:
     state: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
+    def from_json(cls, json: DownloadProgressJSON) -> DownloadProgress:
         return cls(
-            guid=str(json['guid']),
+            guid=json['guid'],
             total_bytes=float(json['totalBytes']),
             received_bytes=float(json['receivedBytes']),
-            state=str(json['state'])
+            state=json['state']
         )
 
 
@@ -3741,10 +3644,10 @@ class JavascriptDialogClosed:
     user_input: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogClosed:
+    def from_json(cls, json: JavascriptDialogClosedJSON) -> JavascriptDialogClosed:
         return cls(
-            result=bool(json['result']),
-            user_input=str(json['userInput'])
+            result=json['result'],
+            user_input=json['userInput']
         )
 
 
@@ -3769,13 +3672,13 @@ class JavascriptDialogOpening:
     default_prompt: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogOpening:
+    def from_json(cls, json: JavascriptDialogOpeningJSON) -> JavascriptDialogOpening:
         return cls(
-            url=str(json['url']),
-            message=str(json['message']),
+            url=json['url'],
+            message=json['message'],
             type_=DialogType.from_json(json['type']),
-            has_browser_handler=bool(json['hasBrowserHandler']),
-            default_prompt=str(json['defaultPrompt']) if json.get('defaultPrompt', None) is not None else None
+            has_browser_handler=json['hasBrowserHandler'],
+            default_prompt=json.get('defaultPrompt')
         )
 
 
@@ -3794,12 +3697,12 @@ class LifecycleEvent:
     timestamp: network.MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LifecycleEvent:
+    def from_json(cls, json: LifecycleEventJSON) -> LifecycleEvent:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            name=str(json['name']),
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            frame_id=FrameId(json['frameId']),
+            loader_id=network.LoaderId(json['loaderId']),
+            name=json['name'],
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
@@ -3824,12 +3727,12 @@ class BackForwardCacheNotUsed:
     not_restored_explanations_tree: typing.Optional[BackForwardCacheNotRestoredExplanationTree]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotUsed:
+    def from_json(cls, json: BackForwardCacheNotUsedJSON) -> BackForwardCacheNotUsed:
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            frame_id=FrameId.from_json(json['frameId']),
+            loader_id=network.LoaderId(json['loaderId']),
+            frame_id=FrameId(json['frameId']),
             not_restored_explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['notRestoredExplanations']],
-            not_restored_explanations_tree=BackForwardCacheNotRestoredExplanationTree.from_json(json['notRestoredExplanationsTree']) if json.get('notRestoredExplanationsTree', None) is not None else None
+            not_restored_explanations_tree=BackForwardCacheNotRestoredExplanationTree.from_json(_not_restored_explanations_tree) if (_not_restored_explanations_tree := json.get('notRestoredExplanationsTree')) is not None else None
         )
 
 
@@ -3839,9 +3742,9 @@ class LoadEventFired:
     timestamp: network.MonotonicTime
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LoadEventFired:
+    def from_json(cls, json: LoadEventFiredJSON) -> LoadEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            timestamp=network.MonotonicTime(json['timestamp'])
         )
 
 
@@ -3861,11 +3764,11 @@ class NavigatedWithinDocument:
     navigation_type: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NavigatedWithinDocument:
+    def from_json(cls, json: NavigatedWithinDocumentJSON) -> NavigatedWithinDocument:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            url=str(json['url']),
-            navigation_type=str(json['navigationType'])
+            frame_id=FrameId(json['frameId']),
+            url=json['url'],
+            navigation_type=json['navigationType']
         )
 
 
@@ -3885,11 +3788,11 @@ class ScreencastFrame:
     session_id: int
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreencastFrame:
+    def from_json(cls, json: ScreencastFrameJSON) -> ScreencastFrame:
         return cls(
-            data=str(json['data']),
+            data=json['data'],
             metadata=ScreencastFrameMetadata.from_json(json['metadata']),
-            session_id=int(json['sessionId'])
+            session_id=json['sessionId']
         )
 
 
@@ -3905,9 +3808,9 @@ class ScreencastVisibilityChanged:
     visible: bool
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScreencastVisibilityChanged:
+    def from_json(cls, json: ScreencastVisibilityChangedJSON) -> ScreencastVisibilityChanged:
         return cls(
-            visible=bool(json['visible'])
+            visible=json['visible']
         )
 
 
@@ -3928,12 +3831,12 @@ class WindowOpen:
     user_gesture: bool
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
+    def from_json(cls, json: WindowOpenJSON) -> WindowOpen:
         return cls(
-            url=str(json['url']),
-            window_name=str(json['windowName']),
-            window_features=[str(i) for i in json['windowFeatures']],
-            user_gesture=bool(json['userGesture'])
+            url=json['url'],
+            window_name=json['windowName'],
+            window_features=json['windowFeatures'],
+            user_gesture=json['userGesture']
         )
 
 
@@ -3951,8 +3854,596 @@ class CompilationCacheProduced:
     data: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CompilationCacheProduced:
+    def from_json(cls, json: CompilationCacheProducedJSON) -> CompilationCacheProduced:
         return cls(
-            url=str(json['url']),
-            data=str(json['data'])
+            url=json['url'],
+            data=json['data']
         )
+
+
+if typing.TYPE_CHECKING:
+    class _AdFrameStatusJSON(typing.TypedDict):
+        adFrameType: str
+
+
+    class AdFrameStatusJSON(_AdFrameStatusJSON, total=False):
+        explanations: typing.List[str]
+
+
+    class AdScriptIdJSON(typing.TypedDict):
+        scriptId: str
+        debuggerId: str
+
+
+    class PermissionsPolicyBlockLocatorJSON(typing.TypedDict):
+        frameId: str
+        blockReason: str
+
+
+    class _PermissionsPolicyFeatureStateJSON(typing.TypedDict):
+        feature: str
+        allowed: bool
+
+
+    class PermissionsPolicyFeatureStateJSON(_PermissionsPolicyFeatureStateJSON, total=False):
+        locator: PermissionsPolicyBlockLocatorJSON
+
+
+    class OriginTrialTokenJSON(typing.TypedDict):
+        origin: str
+        matchSubDomains: bool
+        trialName: str
+        expiryTime: float
+        isThirdParty: bool
+        usageRestriction: str
+
+
+    class _OriginTrialTokenWithStatusJSON(typing.TypedDict):
+        rawTokenText: str
+        status: str
+
+
+    class OriginTrialTokenWithStatusJSON(_OriginTrialTokenWithStatusJSON, total=False):
+        parsedToken: OriginTrialTokenJSON
+
+
+    class OriginTrialJSON(typing.TypedDict):
+        trialName: str
+        status: str
+        tokensWithStatus: typing.List[OriginTrialTokenWithStatusJSON]
+
+
+    class SecurityOriginDetailsJSON(typing.TypedDict):
+        isLocalhost: bool
+
+
+    class _FrameJSON(typing.TypedDict):
+        id: str
+        loaderId: str
+        url: str
+        domainAndRegistry: str
+        securityOrigin: str
+        mimeType: str
+        secureContextType: str
+        crossOriginIsolatedContextType: str
+        gatedAPIFeatures: typing.List[str]
+
+
+    class FrameJSON(_FrameJSON, total=False):
+        parentId: str
+        name: str
+        urlFragment: str
+        securityOriginDetails: SecurityOriginDetailsJSON
+        unreachableUrl: str
+        adFrameStatus: AdFrameStatusJSON
+
+
+    class _FrameResourceJSON(typing.TypedDict):
+        url: str
+        type: str
+        mimeType: str
+
+
+    class FrameResourceJSON(_FrameResourceJSON, total=False):
+        lastModified: float
+        contentSize: float
+        failed: bool
+        canceled: bool
+
+
+    class _FrameResourceTreeJSON(typing.TypedDict):
+        frame: FrameJSON
+        resources: typing.List[FrameResourceJSON]
+
+
+    class FrameResourceTreeJSON(_FrameResourceTreeJSON, total=False):
+        childFrames: typing.List[FrameResourceTreeJSON]
+
+
+    class _FrameTreeJSON(typing.TypedDict):
+        frame: FrameJSON
+
+
+    class FrameTreeJSON(_FrameTreeJSON, total=False):
+        childFrames: typing.List[FrameTreeJSON]
+
+
+    class NavigationEntryJSON(typing.TypedDict):
+        id: int
+        url: str
+        userTypedURL: str
+        title: str
+        transitionType: str
+
+
+    class _ScreencastFrameMetadataJSON(typing.TypedDict):
+        offsetTop: float
+        pageScaleFactor: float
+        deviceWidth: float
+        deviceHeight: float
+        scrollOffsetX: float
+        scrollOffsetY: float
+
+
+    class ScreencastFrameMetadataJSON(_ScreencastFrameMetadataJSON, total=False):
+        timestamp: float
+
+
+    class AppManifestErrorJSON(typing.TypedDict):
+        message: str
+        critical: int
+        line: int
+        column: int
+
+
+    class AppManifestParsedPropertiesJSON(typing.TypedDict):
+        scope: str
+
+
+    class LayoutViewportJSON(typing.TypedDict):
+        pageX: int
+        pageY: int
+        clientWidth: int
+        clientHeight: int
+
+
+    class _VisualViewportJSON(typing.TypedDict):
+        offsetX: float
+        offsetY: float
+        pageX: float
+        pageY: float
+        clientWidth: float
+        clientHeight: float
+        scale: float
+
+
+    class VisualViewportJSON(_VisualViewportJSON, total=False):
+        zoom: float
+
+
+    class ViewportJSON(typing.TypedDict):
+        x: float
+        y: float
+        width: float
+        height: float
+        scale: float
+
+
+    class FontFamiliesJSON(typing.TypedDict, total=False):
+        standard: str
+        fixed: str
+        serif: str
+        sansSerif: str
+        cursive: str
+        fantasy: str
+        math: str
+
+
+    class ScriptFontFamiliesJSON(typing.TypedDict):
+        script: str
+        fontFamilies: FontFamiliesJSON
+
+
+    class FontSizesJSON(typing.TypedDict, total=False):
+        standard: int
+        fixed: int
+
+
+    class InstallabilityErrorArgumentJSON(typing.TypedDict):
+        name: str
+        value: str
+
+
+    class InstallabilityErrorJSON(typing.TypedDict):
+        errorId: str
+        errorArguments: typing.List[InstallabilityErrorArgumentJSON]
+
+
+    class _CompilationCacheParamsJSON(typing.TypedDict):
+        url: str
+
+
+    class CompilationCacheParamsJSON(_CompilationCacheParamsJSON, total=False):
+        eager: bool
+
+
+    class FileFilterJSON(typing.TypedDict, total=False):
+        name: str
+        accepts: typing.List[str]
+
+
+    class _FileHandlerJSON(typing.TypedDict):
+        action: str
+        name: str
+        launchType: str
+
+
+    class FileHandlerJSON(_FileHandlerJSON, total=False):
+        icons: typing.List[ImageResourceJSON]
+        accepts: typing.List[FileFilterJSON]
+
+
+    class _ImageResourceJSON(typing.TypedDict):
+        url: str
+
+
+    class ImageResourceJSON(_ImageResourceJSON, total=False):
+        sizes: str
+        type: str
+
+
+    class LaunchHandlerJSON(typing.TypedDict):
+        clientMode: str
+
+
+    class ProtocolHandlerJSON(typing.TypedDict):
+        protocol: str
+        url: str
+
+
+    class _RelatedApplicationJSON(typing.TypedDict):
+        url: str
+
+
+    class RelatedApplicationJSON(_RelatedApplicationJSON, total=False):
+        id: str
+
+
+    class ScopeExtensionJSON(typing.TypedDict):
+        origin: str
+        hasOriginWildcard: bool
+
+
+    class _ScreenshotJSON(typing.TypedDict):
+        image: ImageResourceJSON
+        formFactor: str
+
+
+    class ScreenshotJSON(_ScreenshotJSON, total=False):
+        label: str
+
+
+    class _ShareTargetJSON(typing.TypedDict):
+        action: str
+        method: str
+        enctype: str
+
+
+    class ShareTargetJSON(_ShareTargetJSON, total=False):
+        title: str
+        text: str
+        url: str
+        files: typing.List[FileFilterJSON]
+
+
+    class ShortcutJSON(typing.TypedDict):
+        name: str
+        url: str
+
+
+    class WebAppManifestJSON(typing.TypedDict, total=False):
+        backgroundColor: str
+        description: str
+        dir: str
+        display: str
+        displayOverrides: typing.List[str]
+        fileHandlers: typing.List[FileHandlerJSON]
+        icons: typing.List[ImageResourceJSON]
+        id: str
+        lang: str
+        launchHandler: LaunchHandlerJSON
+        name: str
+        orientation: str
+        preferRelatedApplications: bool
+        protocolHandlers: typing.List[ProtocolHandlerJSON]
+        relatedApplications: typing.List[RelatedApplicationJSON]
+        scope: str
+        scopeExtensions: typing.List[ScopeExtensionJSON]
+        screenshots: typing.List[ScreenshotJSON]
+        shareTarget: ShareTargetJSON
+        shortName: str
+        shortcuts: typing.List[ShortcutJSON]
+        startUrl: str
+        themeColor: str
+
+
+    class _BackForwardCacheBlockingDetailsJSON(typing.TypedDict):
+        lineNumber: int
+        columnNumber: int
+
+
+    class BackForwardCacheBlockingDetailsJSON(_BackForwardCacheBlockingDetailsJSON, total=False):
+        url: str
+        function: str
+
+
+    class _BackForwardCacheNotRestoredExplanationJSON(typing.TypedDict):
+        type: str
+        reason: str
+
+
+    class BackForwardCacheNotRestoredExplanationJSON(_BackForwardCacheNotRestoredExplanationJSON, total=False):
+        context: str
+        details: typing.List[BackForwardCacheBlockingDetailsJSON]
+
+
+    class BackForwardCacheNotRestoredExplanationTreeJSON(typing.TypedDict):
+        url: str
+        explanations: typing.List[BackForwardCacheNotRestoredExplanationJSON]
+        children: typing.List[BackForwardCacheNotRestoredExplanationTreeJSON]
+
+
+    class AddScriptToEvaluateOnLoadReturnsJSON(typing.TypedDict):
+        identifier: str
+
+
+    class AddScriptToEvaluateOnNewDocumentReturnsJSON(typing.TypedDict):
+        identifier: str
+
+
+    class CaptureScreenshotReturnsJSON(typing.TypedDict):
+        data: str
+
+
+    class CaptureSnapshotReturnsJSON(typing.TypedDict):
+        data: str
+
+
+    class CreateIsolatedWorldReturnsJSON(typing.TypedDict):
+        executionContextId: int
+
+
+    class _GetAppManifestReturnsJSON(typing.TypedDict):
+        url: str
+        errors: typing.List[AppManifestErrorJSON]
+        manifest: WebAppManifestJSON
+
+
+    class GetAppManifestReturnsJSON(_GetAppManifestReturnsJSON, total=False):
+        data: str
+        parsed: AppManifestParsedPropertiesJSON
+
+
+    class GetInstallabilityErrorsReturnsJSON(typing.TypedDict):
+        installabilityErrors: typing.List[InstallabilityErrorJSON]
+
+
+    class GetManifestIconsReturnsJSON(typing.TypedDict, total=False):
+        primaryIcon: str
+
+
+    class GetAppIdReturnsJSON(typing.TypedDict, total=False):
+        appId: str
+        recommendedId: str
+
+
+    class GetAdScriptIdReturnsJSON(typing.TypedDict, total=False):
+        adScriptId: AdScriptIdJSON
+
+
+    class GetFrameTreeReturnsJSON(typing.TypedDict):
+        frameTree: FrameTreeJSON
+
+
+    class GetLayoutMetricsReturnsJSON(typing.TypedDict):
+        layoutViewport: LayoutViewportJSON
+        visualViewport: VisualViewportJSON
+        contentSize: dom.RectJSON
+        cssLayoutViewport: LayoutViewportJSON
+        cssVisualViewport: VisualViewportJSON
+        cssContentSize: dom.RectJSON
+
+
+    class GetNavigationHistoryReturnsJSON(typing.TypedDict):
+        currentIndex: int
+        entries: typing.List[NavigationEntryJSON]
+
+
+    class GetResourceContentReturnsJSON(typing.TypedDict):
+        content: str
+        base64Encoded: bool
+
+
+    class GetResourceTreeReturnsJSON(typing.TypedDict):
+        frameTree: FrameResourceTreeJSON
+
+
+    class _NavigateReturnsJSON(typing.TypedDict):
+        frameId: str
+
+
+    class NavigateReturnsJSON(_NavigateReturnsJSON, total=False):
+        loaderId: str
+        errorText: str
+
+
+    class _PrintToPDFReturnsJSON(typing.TypedDict):
+        data: str
+
+
+    class PrintToPDFReturnsJSON(_PrintToPDFReturnsJSON, total=False):
+        stream: str
+
+
+    class SearchInResourceReturnsJSON(typing.TypedDict):
+        result: typing.List[debugger.SearchMatchJSON]
+
+
+    class GetPermissionsPolicyStateReturnsJSON(typing.TypedDict):
+        states: typing.List[PermissionsPolicyFeatureStateJSON]
+
+
+    class GetOriginTrialsReturnsJSON(typing.TypedDict):
+        originTrials: typing.List[OriginTrialJSON]
+
+
+    class DomContentEventFiredJSON(typing.TypedDict):
+        timestamp: float
+
+
+    class _FileChooserOpenedJSON(typing.TypedDict):
+        frameId: str
+        mode: str
+
+
+    class FileChooserOpenedJSON(_FileChooserOpenedJSON, total=False):
+        backendNodeId: int
+
+
+    class _FrameAttachedJSON(typing.TypedDict):
+        frameId: str
+        parentFrameId: str
+
+
+    class FrameAttachedJSON(_FrameAttachedJSON, total=False):
+        stack: runtime.StackTraceJSON
+
+
+    class FrameClearedScheduledNavigationJSON(typing.TypedDict):
+        frameId: str
+
+
+    class FrameDetachedJSON(typing.TypedDict):
+        frameId: str
+        reason: str
+
+
+    class FrameSubtreeWillBeDetachedJSON(typing.TypedDict):
+        frameId: str
+
+
+    class FrameNavigatedJSON(typing.TypedDict):
+        frame: FrameJSON
+        type: str
+
+
+    class DocumentOpenedJSON(typing.TypedDict):
+        frame: FrameJSON
+
+
+    class FrameStartedNavigatingJSON(typing.TypedDict):
+        frameId: str
+        url: str
+        loaderId: str
+        navigationType: str
+
+
+    class FrameRequestedNavigationJSON(typing.TypedDict):
+        frameId: str
+        reason: str
+        url: str
+        disposition: str
+
+
+    class FrameScheduledNavigationJSON(typing.TypedDict):
+        frameId: str
+        delay: float
+        reason: str
+        url: str
+
+
+    class FrameStartedLoadingJSON(typing.TypedDict):
+        frameId: str
+
+
+    class FrameStoppedLoadingJSON(typing.TypedDict):
+        frameId: str
+
+
+    class DownloadWillBeginJSON(typing.TypedDict):
+        frameId: str
+        guid: str
+        url: str
+        suggestedFilename: str
+
+
+    class DownloadProgressJSON(typing.TypedDict):
+        guid: str
+        totalBytes: float
+        receivedBytes: float
+        state: str
+
+
+    class JavascriptDialogClosedJSON(typing.TypedDict):
+        result: bool
+        userInput: str
+
+
+    class _JavascriptDialogOpeningJSON(typing.TypedDict):
+        url: str
+        message: str
+        type: str
+        hasBrowserHandler: bool
+
+
+    class JavascriptDialogOpeningJSON(_JavascriptDialogOpeningJSON, total=False):
+        defaultPrompt: str
+
+
+    class LifecycleEventJSON(typing.TypedDict):
+        frameId: str
+        loaderId: str
+        name: str
+        timestamp: float
+
+
+    class _BackForwardCacheNotUsedJSON(typing.TypedDict):
+        loaderId: str
+        frameId: str
+        notRestoredExplanations: typing.List[BackForwardCacheNotRestoredExplanationJSON]
+
+
+    class BackForwardCacheNotUsedJSON(_BackForwardCacheNotUsedJSON, total=False):
+        notRestoredExplanationsTree: BackForwardCacheNotRestoredExplanationTreeJSON
+
+
+    class LoadEventFiredJSON(typing.TypedDict):
+        timestamp: float
+
+
+    class NavigatedWithinDocumentJSON(typing.TypedDict):
+        frameId: str
+        url: str
+        navigationType: str
+
+
+    class ScreencastFrameJSON(typing.TypedDict):
+        data: str
+        metadata: ScreencastFrameMetadataJSON
+        sessionId: int
+
+
+    class ScreencastVisibilityChangedJSON(typing.TypedDict):
+        visible: bool
+
+
+    class WindowOpenJSON(typing.TypedDict):
+        url: str
+        windowName: str
+        windowFeatures: typing.List[str]
+        userGesture: bool
+
+
+    class CompilationCacheProducedJSON(typing.TypedDict):
+        url: str
+        data: str
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 from deprecated.sphinx import deprecated # type: ignore
@@ -33,26 +32,23 @@ class Metric:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Metric:
+    def from_json(cls, json: MetricJSON) -> Metric:
         return cls(
-            name=str(json['name']),
+            name=json['name'],
             value=float(json['value']),
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disable collecting and reporting metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Performance.disable',
-    }
-    json = yield cmd_dict
+    return Command('Performance.disable')
 
 
 def enable(
         time_domain: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable collecting and reporting metrics.
 
@@ -61,17 +57,13 @@ def enable(
     params: T_JSON_DICT = dict()
     if time_domain is not None:
         params['timeDomain'] = time_domain
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Performance.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Performance.enable', params)
 
 
 @deprecated(version="1.3")
 def set_time_domain(
         time_domain: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets time domain to use for collecting and reporting duration metrics.
     Note that this must be called before enabling metrics collection. Calling
@@ -85,24 +77,20 @@ def set_time_domain(
     '''
     params: T_JSON_DICT = dict()
     params['timeDomain'] = time_domain
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Performance.setTimeDomain',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Performance.setTimeDomain', params)
 
 
-def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric]]:
+def _parse_get_metrics(json: GetMetricsReturnsJSON) -> typing.List[Metric]:
+    return [Metric.from_json(i) for i in json['metrics']]
+
+
+def get_metrics() -> Command[GetMetricsReturnsJSON, typing.List[Metric]]:
     '''
     Retrieve current values of run-time metrics.
 
     :returns: Current values for run-time metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Performance.getMetrics',
-    }
-    json = yield cmd_dict
-    return [Metric.from_json(i) for i in json['metrics']]
+    return Command('Performance.getMetrics', None, _parse_get_metrics)
 
 
 @event_class('Performance.metrics')
@@ -117,8 +105,23 @@ class Metrics:
     title: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Metrics:
+    def from_json(cls, json: MetricsJSON) -> Metrics:
         return cls(
             metrics=[Metric.from_json(i) for i in json['metrics']],
-            title=str(json['title'])
+            title=json['title']
         )
+
+
+if typing.TYPE_CHECKING:
+    class MetricJSON(typing.TypedDict):
+        name: str
+        value: float
+
+
+    class GetMetricsReturnsJSON(typing.TypedDict):
+        metrics: typing.List[MetricJSON]
+
+
+    class MetricsJSON(typing.TypedDict):
+        metrics: typing.List[MetricJSON]
+        title: str
@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import network
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
 
 
 @dataclass
@@ -38,26 +42,26 @@ class LargestContentfulPaint:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['renderTime'] = self.render_time.to_json()
-        json['loadTime'] = self.load_time.to_json()
+        json['renderTime'] = self.render_time
+        json['loadTime'] = self.load_time
         json['size'] = self.size
         if self.element_id is not None:
             json['elementId'] = self.element_id
         if self.url is not None:
             json['url'] = self.url
         if self.node_id is not None:
-            json['nodeId'] = self.node_id.to_json()
+            json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LargestContentfulPaint:
+    def from_json(cls, json: LargestContentfulPaintJSON) -> LargestContentfulPaint:
         return cls(
-            render_time=network.TimeSinceEpoch.from_json(json['renderTime']),
-            load_time=network.TimeSinceEpoch.from_json(json['loadTime']),
+            render_time=network.TimeSinceEpoch(json['renderTime']),
+            load_time=network.TimeSinceEpoch(json['loadTime']),
             size=float(json['size']),
-            element_id=str(json['elementId']) if json.get('elementId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            node_id=dom.BackendNodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None,
+            element_id=json.get('elementId'),
+            url=json.get('url'),
+            node_id=dom.BackendNodeId(_node_id) if (_node_id := json.get('nodeId')) is not None else None,
         )
 
 
@@ -74,15 +78,15 @@ class LayoutShiftAttribution:
         json['previousRect'] = self.previous_rect.to_json()
         json['currentRect'] = self.current_rect.to_json()
         if self.node_id is not None:
-            json['nodeId'] = self.node_id.to_json()
+            json['nodeId'] = self.node_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayoutShiftAttribution:
+    def from_json(cls, json: LayoutShiftAttributionJSON) -> LayoutShiftAttribution:
         return cls(
             previous_rect=dom.Rect.from_json(json['previousRect']),
             current_rect=dom.Rect.from_json(json['currentRect']),
-            node_id=dom.BackendNodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None,
+            node_id=dom.BackendNodeId(_node_id) if (_node_id := json.get('nodeId')) is not None else None,
         )
 
 
@@ -104,16 +108,16 @@ class LayoutShift:
         json: T_JSON_DICT = dict()
         json['value'] = self.value
         json['hadRecentInput'] = self.had_recent_input
-        json['lastInputTime'] = self.last_input_time.to_json()
+        json['lastInputTime'] = self.last_input_time
         json['sources'] = [i.to_json() for i in self.sources]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> LayoutShift:
+    def from_json(cls, json: LayoutShiftJSON) -> LayoutShift:
         return cls(
             value=float(json['value']),
-            had_recent_input=bool(json['hadRecentInput']),
-            last_input_time=network.TimeSinceEpoch.from_json(json['lastInputTime']),
+            had_recent_input=json['hadRecentInput'],
+            last_input_time=network.TimeSinceEpoch(json['lastInputTime']),
             sources=[LayoutShiftAttribution.from_json(i) for i in json['sources']],
         )
 
@@ -142,10 +146,10 @@ class TimelineEvent:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['frameId'] = self.frame_id.to_json()
+        json['frameId'] = self.frame_id
         json['type'] = self.type_
         json['name'] = self.name
-        json['time'] = self.time.to_json()
+        json['time'] = self.time
         if self.duration is not None:
             json['duration'] = self.duration
         if self.lcp_details is not None:
@@ -155,21 +159,21 @@ class TimelineEvent:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TimelineEvent:
+    def from_json(cls, json: TimelineEventJSON) -> TimelineEvent:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            type_=str(json['type']),
-            name=str(json['name']),
-            time=network.TimeSinceEpoch.from_json(json['time']),
-            duration=float(json['duration']) if json.get('duration', None) is not None else None,
-            lcp_details=LargestContentfulPaint.from_json(json['lcpDetails']) if json.get('lcpDetails', None) is not None else None,
-            layout_shift_details=LayoutShift.from_json(json['layoutShiftDetails']) if json.get('layoutShiftDetails', None) is not None else None,
+            frame_id=page.FrameId(json['frameId']),
+            type_=json['type'],
+            name=json['name'],
+            time=network.TimeSinceEpoch(json['time']),
+            duration=float(_duration) if (_duration := json.get('duration')) is not None else None,
+            lcp_details=LargestContentfulPaint.from_json(_lcp_details) if (_lcp_details := json.get('lcpDetails')) is not None else None,
+            layout_shift_details=LayoutShift.from_json(_layout_shift_details) if (_layout_shift_details := json.get('layoutShiftDetails')) is not None else None,
         )
 
 
 def enable(
         event_types: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Previously buffered events would be reported before method returns.
     See also: timelineEventAdded
@@ -177,12 +181,8 @@ def enable(
     :param event_types: The types of event to report, as specified in https://w3c.github.io/performance-timeline/#dom-performanceentry-entrytype The specified filter overrides any previous filters, passing empty filter disables recording. Note that not all types exposed to the web platform are currently supported.
     '''
     params: T_JSON_DICT = dict()
-    params['eventTypes'] = [i for i in event_types]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PerformanceTimeline.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['eventTypes'] = list(event_types)
+    return Command('PerformanceTimeline.enable', params)
 
 
 @event_class('PerformanceTimeline.timelineEventAdded')
@@ -194,7 +194,53 @@ class TimelineEventAdded:
     event: TimelineEvent
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TimelineEventAdded:
+    def from_json(cls, json: TimelineEventAddedJSON) -> TimelineEventAdded:
         return cls(
             event=TimelineEvent.from_json(json['event'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _LargestContentfulPaintJSON(typing.TypedDict):
+        renderTime: float
+        loadTime: float
+        size: float
+
+
+    class LargestContentfulPaintJSON(_LargestContentfulPaintJSON, total=False):
+        elementId: str
+        url: str
+        nodeId: int
+
+
+    class _LayoutShiftAttributionJSON(typing.TypedDict):
+        previousRect: dom.RectJSON
+        currentRect: dom.RectJSON
+
+
+    class LayoutShiftAttributionJSON(_LayoutShiftAttributionJSON, total=False):
+        nodeId: int
+
+
+    class LayoutShiftJSON(typing.TypedDict):
+        value: float
+        hadRecentInput: bool
+        lastInputTime: float
+        sources: typing.List[LayoutShiftAttributionJSON]
+
+
+    class _TimelineEventJSON(typing.TypedDict):
+        frameId: str
+        type: str
+        name: str
+        time: float
+
+
+    class TimelineEventJSON(_TimelineEventJSON, total=False):
+        duration: float
+        lcpDetails: LargestContentfulPaintJSON
+        layoutShiftDetails: LayoutShiftJSON
+
+
+    class TimelineEventAddedJSON(typing.TypedDict):
+        event: TimelineEventJSON
@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import dom
-from . import network
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+else:
+    dom = lazy_import('dom', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
 
 
 class RuleSetId(str):
@@ -75,32 +79,32 @@ class RuleSet:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['id'] = self.id_.to_json()
-        json['loaderId'] = self.loader_id.to_json()
+        json['id'] = self.id_
+        json['loaderId'] = self.loader_id
         json['sourceText'] = self.source_text
         if self.backend_node_id is not None:
-            json['backendNodeId'] = self.backend_node_id.to_json()
+            json['backendNodeId'] = self.backend_node_id
         if self.url is not None:
             json['url'] = self.url
         if self.request_id is not None:
-            json['requestId'] = self.request_id.to_json()
+            json['requestId'] = self.request_id
         if self.error_type is not None:
-            json['errorType'] = self.error_type.to_json()
+            json['errorType'] = self.error_type.value
         if self.error_message is not None:
             json['errorMessage'] = self.error_message
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RuleSet:
+    def from_json(cls, json: RuleSetJSON) -> RuleSet:
         return cls(
-            id_=RuleSetId.from_json(json['id']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            source_text=str(json['sourceText']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            request_id=network.RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
-            error_type=RuleSetErrorType.from_json(json['errorType']) if json.get('errorType', None) is not None else None,
-            error_message=str(json['errorMessage']) if json.get('errorMessage', None) is not None else None,
+            id_=RuleSetId(json['id']),
+            loader_id=network.LoaderId(json['loaderId']),
+            source_text=json['sourceText'],
+            backend_node_id=dom.BackendNodeId(_backend_node_id) if (_backend_node_id := json.get('backendNodeId')) is not None else None,
+            url=json.get('url'),
+            request_id=network.RequestId(_request_id) if (_request_id := json.get('requestId')) is not None else None,
+            error_type=RuleSetErrorType.from_json(_error_type) if (_error_type := json.get('errorType')) is not None else None,
+            error_message=json.get('errorMessage'),
         )
 
 
@@ -113,7 +117,10 @@ class RuleSetErrorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RuleSetErrorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SpeculationAction(enum.Enum):
@@ -130,7 +137,10 @@ class SpeculationAction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SpeculationAction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SpeculationTargetHint(enum.Enum):
@@ -146,7 +156,10 @@ class SpeculationTargetHint(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SpeculationTargetHint:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -169,20 +182,20 @@ class PreloadingAttemptKey:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['loaderId'] = self.loader_id.to_json()
-        json['action'] = self.action.to_json()
+        json['loaderId'] = self.loader_id
+        json['action'] = self.action.value
         json['url'] = self.url
         if self.target_hint is not None:
-            json['targetHint'] = self.target_hint.to_json()
+            json['targetHint'] = self.target_hint.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptKey:
+    def from_json(cls, json: PreloadingAttemptKeyJSON) -> PreloadingAttemptKey:
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
+            loader_id=network.LoaderId(json['loaderId']),
             action=SpeculationAction.from_json(json['action']),
-            url=str(json['url']),
-            target_hint=SpeculationTargetHint.from_json(json['targetHint']) if json.get('targetHint', None) is not None else None,
+            url=json['url'],
+            target_hint=SpeculationTargetHint.from_json(_target_hint) if (_target_hint := json.get('targetHint')) is not None else None,
         )
 
 
@@ -204,16 +217,16 @@ class PreloadingAttemptSource:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['key'] = self.key.to_json()
-        json['ruleSetIds'] = [i.to_json() for i in self.rule_set_ids]
-        json['nodeIds'] = [i.to_json() for i in self.node_ids]
+        json['ruleSetIds'] = list(self.rule_set_ids)
+        json['nodeIds'] = list(self.node_ids)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSource:
+    def from_json(cls, json: PreloadingAttemptSourceJSON) -> PreloadingAttemptSource:
         return cls(
             key=PreloadingAttemptKey.from_json(json['key']),
-            rule_set_ids=[RuleSetId.from_json(i) for i in json['ruleSetIds']],
-            node_ids=[dom.BackendNodeId.from_json(i) for i in json['nodeIds']],
+            rule_set_ids=[RuleSetId(i) for i in json['ruleSetIds']],
+            node_ids=[dom.BackendNodeId(i) for i in json['nodeIds']],
         )
 
 
@@ -322,7 +335,10 @@ class PrerenderFinalStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrerenderFinalStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PreloadingStatus(enum.Enum):
@@ -342,7 +358,10 @@ class PreloadingStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PreloadingStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class PrefetchStatus(enum.Enum):
@@ -389,7 +408,10 @@ class PrefetchStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrefetchStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -413,28 +435,22 @@ class PrerenderMismatchedHeaders:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PrerenderMismatchedHeaders:
+    def from_json(cls, json: PrerenderMismatchedHeadersJSON) -> PrerenderMismatchedHeaders:
         return cls(
-            header_name=str(json['headerName']),
-            initial_value=str(json['initialValue']) if json.get('initialValue', None) is not None else None,
-            activation_value=str(json['activationValue']) if json.get('activationValue', None) is not None else None,
+            header_name=json['headerName'],
+            initial_value=json.get('initialValue'),
+            activation_value=json.get('activationValue'),
         )
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Preload.enable',
-    }
-    json = yield cmd_dict
+    return Command('Preload.enable')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Preload.disable',
-    }
-    json = yield cmd_dict
+    return Command('Preload.disable')
 
 
 @event_class('Preload.ruleSetUpdated')
@@ -446,7 +462,7 @@ class RuleSetUpdated:
     rule_set: RuleSet
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RuleSetUpdated:
+    def from_json(cls, json: RuleSetUpdatedJSON) -> RuleSetUpdated:
         return cls(
             rule_set=RuleSet.from_json(json['ruleSet'])
         )
@@ -458,9 +474,9 @@ class RuleSetRemoved:
     id_: RuleSetId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RuleSetRemoved:
+    def from_json(cls, json: RuleSetRemovedJSON) -> RuleSetRemoved:
         return cls(
-            id_=RuleSetId.from_json(json['id'])
+            id_=RuleSetId(json['id'])
         )
 
 
@@ -477,13 +493,13 @@ class PreloadEnabledStateUpdated:
     disabled_by_holdback_prerender_speculation_rules: bool
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PreloadEnabledStateUpdated:
+    def from_json(cls, json: PreloadEnabledStateUpdatedJSON) -> PreloadEnabledStateUpdated:
         return cls(
-            disabled_by_preference=bool(json['disabledByPreference']),
-            disabled_by_data_saver=bool(json['disabledByDataSaver']),
-            disabled_by_battery_saver=bool(json['disabledByBatterySaver']),
-            disabled_by_holdback_prefetch_speculation_rules=bool(json['disabledByHoldbackPrefetchSpeculationRules']),
-            disabled_by_holdback_prerender_speculation_rules=bool(json['disabledByHoldbackPrerenderSpeculationRules'])
+            disabled_by_preference=json['disabledByPreference'],
+            disabled_by_data_saver=json['disabledByDataSaver'],
+            disabled_by_battery_saver=json['disabledByBatterySaver'],
+            disabled_by_holdback_prefetch_speculation_rules=json['disabledByHoldbackPrefetchSpeculationRules'],
+            disabled_by_holdback_prerender_speculation_rules=json['disabledByHoldbackPrerenderSpeculationRules']
         )
 
 
@@ -503,15 +519,15 @@ class PrefetchStatusUpdated:
     request_id: network.RequestId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PrefetchStatusUpdated:
+    def from_json(cls, json: PrefetchStatusUpdatedJSON) -> PrefetchStatusUpdated:
         return cls(
             key=PreloadingAttemptKey.from_json(json['key']),
-            pipeline_id=PreloadPipelineId.from_json(json['pipelineId']),
-            initiating_frame_id=page.FrameId.from_json(json['initiatingFrameId']),
-            prefetch_url=str(json['prefetchUrl']),
+            pipeline_id=PreloadPipelineId(json['pipelineId']),
+            initiating_frame_id=page.FrameId(json['initiatingFrameId']),
+            prefetch_url=json['prefetchUrl'],
             status=PreloadingStatus.from_json(json['status']),
             prefetch_status=PrefetchStatus.from_json(json['prefetchStatus']),
-            request_id=network.RequestId.from_json(json['requestId'])
+            request_id=network.RequestId(json['requestId'])
         )
 
 
@@ -531,14 +547,14 @@ class PrerenderStatusUpdated:
     mismatched_headers: typing.Optional[typing.List[PrerenderMismatchedHeaders]]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PrerenderStatusUpdated:
+    def from_json(cls, json: PrerenderStatusUpdatedJSON) -> PrerenderStatusUpdated:
         return cls(
             key=PreloadingAttemptKey.from_json(json['key']),
-            pipeline_id=PreloadPipelineId.from_json(json['pipelineId']),
+            pipeline_id=PreloadPipelineId(json['pipelineId']),
             status=PreloadingStatus.from_json(json['status']),
-            prerender_status=PrerenderFinalStatus.from_json(json['prerenderStatus']) if json.get('prerenderStatus', None) is not None else None,
-            disallowed_mojo_interface=str(json['disallowedMojoInterface']) if json.get('disallowedMojoInterface', None) is not None else None,
-            mismatched_headers=[PrerenderMismatchedHeaders.from_json(i) for i in json['mismatchedHeaders']] if json.get('mismatchedHeaders', None) is not None else None
+            prerender_status=PrerenderFinalStatus.from_json(_prerender_status) if (_prerender_status := json.get('prerenderStatus')) is not None else None,
+            disallowed_mojo_interface=json.get('disallowedMojoInterface'),
+            mismatched_headers=[PrerenderMismatchedHeaders.from_json(i) for i in _mismatched_headers] if (_mismatched_headers := json.get('mismatchedHeaders')) is not None else None
         )
 
 
@@ -552,8 +568,91 @@ class PreloadingAttemptSourcesUpdated:
     preloading_attempt_sources: typing.List[PreloadingAttemptSource]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSourcesUpdated:
+    def from_json(cls, json: PreloadingAttemptSourcesUpdatedJSON) -> PreloadingAttemptSourcesUpdated:
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
+            loader_id=network.LoaderId(json['loaderId']),
             preloading_attempt_sources=[PreloadingAttemptSource.from_json(i) for i in json['preloadingAttemptSources']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class _RuleSetJSON(typing.TypedDict):
+        id: str
+        loaderId: str
+        sourceText: str
+
+
+    class RuleSetJSON(_RuleSetJSON, total=False):
+        backendNodeId: int
+        url: str
+        requestId: str
+        errorType: str
+        errorMessage: str
+
+
+    class _PreloadingAttemptKeyJSON(typing.TypedDict):
+        loaderId: str
+        action: str
+        url: str
+
+
+    class PreloadingAttemptKeyJSON(_PreloadingAttemptKeyJSON, total=False):
+        targetHint: str
+
+
+    class PreloadingAttemptSourceJSON(typing.TypedDict):
+        key: PreloadingAttemptKeyJSON
+        ruleSetIds: typing.List[str]
+        nodeIds: typing.List[int]
+
+
+    class _PrerenderMismatchedHeadersJSON(typing.TypedDict):
+        headerName: str
+
+
+    class PrerenderMismatchedHeadersJSON(_PrerenderMismatchedHeadersJSON, total=False):
+        initialValue: str
+        activationValue: str
+
+
+    class RuleSetUpdatedJSON(typing.TypedDict):
+        ruleSet: RuleSetJSON
+
+
+    class RuleSetRemovedJSON(typing.TypedDict):
+        id: str
+
+
+    class PreloadEnabledStateUpdatedJSON(typing.TypedDict):
+        disabledByPreference: bool
+        disabledByDataSaver: bool
+        disabledByBatterySaver: bool
+        disabledByHoldbackPrefetchSpeculationRules: bool
+        disabledByHoldbackPrerenderSpeculationRules: bool
+
+
+    class PrefetchStatusUpdatedJSON(typing.TypedDict):
+        key: PreloadingAttemptKeyJSON
+        pipelineId: str
+        initiatingFrameId: str
+        prefetchUrl: str
+        status: str
+        prefetchStatus: str
+        requestId: str
+
+
+    class _PrerenderStatusUpdatedJSON(typing.TypedDict):
+        key: PreloadingAttemptKeyJSON
+        pipelineId: str
+        status: str
+
+
+    class PrerenderStatusUpdatedJSON(_PrerenderStatusUpdatedJSON, total=False):
+        prerenderStatus: str
+        disallowedMojoInterface: str
+        mismatchedHeaders: typing.List[PrerenderMismatchedHeadersJSON]
+
+
+    class PreloadingAttemptSourcesUpdatedJSON(typing.TypedDict):
+        loaderId: str
+        preloadingAttemptSources: typing.List[PreloadingAttemptSourceJSON]
@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import debugger
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import debugger
+    from . import runtime
+else:
+    debugger = lazy_import('debugger', globals())
+    runtime = lazy_import('runtime', globals())
 
 
 @dataclass
@@ -46,7 +49,7 @@ class ProfileNode:
         if self.hit_count is not None:
             json['hitCount'] = self.hit_count
         if self.children is not None:
-            json['children'] = [i for i in self.children]
+            json['children'] = list(self.children)
         if self.deopt_reason is not None:
             json['deoptReason'] = self.deopt_reason
         if self.position_ticks is not None:
@@ -54,14 +57,14 @@ class ProfileNode:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ProfileNode:
+    def from_json(cls, json: ProfileNodeJSON) -> ProfileNode:
         return cls(
-            id_=int(json['id']),
+            id_=json['id'],
             call_frame=runtime.CallFrame.from_json(json['callFrame']),
-            hit_count=int(json['hitCount']) if json.get('hitCount', None) is not None else None,
-            children=[int(i) for i in json['children']] if json.get('children', None) is not None else None,
-            deopt_reason=str(json['deoptReason']) if json.get('deoptReason', None) is not None else None,
-            position_ticks=[PositionTickInfo.from_json(i) for i in json['positionTicks']] if json.get('positionTicks', None) is not None else None,
+            hit_count=json.get('hitCount'),
+            children=json.get('children'),
+            deopt_reason=json.get('deoptReason'),
+            position_ticks=[PositionTickInfo.from_json(i) for i in _position_ticks] if (_position_ticks := json.get('positionTicks')) is not None else None,
         )
 
 
@@ -92,19 +95,19 @@ class Profile:
         json['startTime'] = self.start_time
         json['endTime'] = self.end_time
         if self.samples is not None:
-            json['samples'] = [i for i in self.samples]
+            json['samples'] = list(self.samples)
         if self.time_deltas is not None:
-            json['timeDeltas'] = [i for i in self.time_deltas]
+            json['timeDeltas'] = list(self.time_deltas)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Profile:
+    def from_json(cls, json: ProfileJSON) -> Profile:
         return cls(
             nodes=[ProfileNode.from_json(i) for i in json['nodes']],
             start_time=float(json['startTime']),
             end_time=float(json['endTime']),
-            samples=[int(i) for i in json['samples']] if json.get('samples', None) is not None else None,
-            time_deltas=[int(i) for i in json['timeDeltas']] if json.get('timeDeltas', None) is not None else None,
+            samples=json.get('samples'),
+            time_deltas=json.get('timeDeltas'),
         )
 
 
@@ -126,10 +129,10 @@ class PositionTickInfo:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PositionTickInfo:
+    def from_json(cls, json: PositionTickInfoJSON) -> PositionTickInfo:
         return cls(
-            line=int(json['line']),
-            ticks=int(json['ticks']),
+            line=json['line'],
+            ticks=json['ticks'],
         )
 
 
@@ -155,11 +158,11 @@ class CoverageRange:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CoverageRange:
+    def from_json(cls, json: CoverageRangeJSON) -> CoverageRange:
         return cls(
-            start_offset=int(json['startOffset']),
-            end_offset=int(json['endOffset']),
-            count=int(json['count']),
+            start_offset=json['startOffset'],
+            end_offset=json['endOffset'],
+            count=json['count'],
         )
 
 
@@ -185,11 +188,11 @@ class FunctionCoverage:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FunctionCoverage:
+    def from_json(cls, json: FunctionCoverageJSON) -> FunctionCoverage:
         return cls(
-            function_name=str(json['functionName']),
+            function_name=json['functionName'],
             ranges=[CoverageRange.from_json(i) for i in json['ranges']],
-            is_block_coverage=bool(json['isBlockCoverage']),
+            is_block_coverage=json['isBlockCoverage'],
         )
 
 
@@ -209,53 +212,47 @@ class ScriptCoverage:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['url'] = self.url
         json['functions'] = [i.to_json() for i in self.functions]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ScriptCoverage:
+    def from_json(cls, json: ScriptCoverageJSON) -> ScriptCoverage:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
+            script_id=runtime.ScriptId(json['scriptId']),
+            url=json['url'],
             functions=[FunctionCoverage.from_json(i) for i in json['functions']],
         )
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.disable',
-    }
-    json = yield cmd_dict
+    return Command('Profiler.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.enable',
-    }
-    json = yield cmd_dict
+    return Command('Profiler.enable')
 
 
-def get_best_effort_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ScriptCoverage]]:
+def _parse_get_best_effort_coverage(json: GetBestEffortCoverageReturnsJSON) -> typing.List[ScriptCoverage]:
+    return [ScriptCoverage.from_json(i) for i in json['result']]
+
+
+def get_best_effort_coverage() -> Command[GetBestEffortCoverageReturnsJSON, typing.List[ScriptCoverage]]:
     '''
     Collect coverage data for the current isolate. The coverage data may be incomplete due to
     garbage collection.
 
     :returns: Coverage data for the current isolate.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.getBestEffortCoverage',
-    }
-    json = yield cmd_dict
-    return [ScriptCoverage.from_json(i) for i in json['result']]
+    return Command('Profiler.getBestEffortCoverage', None, _parse_get_best_effort_coverage)
 
 
 def set_sampling_interval(
         interval: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Changes CPU profiler sampling interval. Must be called before CPU profiles recording started.
 
@@ -263,26 +260,23 @@ def set_sampling_interval(
     '''
     params: T_JSON_DICT = dict()
     params['interval'] = interval
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.setSamplingInterval',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Profiler.setSamplingInterval', params)
 
 
-def start() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def start() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.start',
-    }
-    json = yield cmd_dict
+    return Command('Profiler.start')
+
+
+def _parse_start_precise_coverage(json: StartPreciseCoverageReturnsJSON) -> float:
+    return float(json['timestamp'])
 
 
 def start_precise_coverage(
         call_count: typing.Optional[bool] = None,
         detailed: typing.Optional[bool] = None,
         allow_triggered_updates: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+    ) -> Command[StartPreciseCoverageReturnsJSON, float]:
     '''
     Enable precise code coverage. Coverage data for JavaScript executed before enabling precise code
     coverage may be incomplete. Enabling prevents running optimized code and resets execution
@@ -300,39 +294,38 @@ def start_precise_coverage(
         params['detailed'] = detailed
     if allow_triggered_updates is not None:
         params['allowTriggeredUpdates'] = allow_triggered_updates
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.startPreciseCoverage',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return float(json['timestamp'])
+    return Command('Profiler.startPreciseCoverage', params, _parse_start_precise_coverage)
+
+
+def _parse_stop(json: StopReturnsJSON) -> Profile:
+    return Profile.from_json(json['profile'])
 
 
-def stop() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Profile]:
+def stop() -> Command[StopReturnsJSON, Profile]:
     '''
 
 
     :returns: Recorded profile.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.stop',
-    }
-    json = yield cmd_dict
-    return Profile.from_json(json['profile'])
+    return Command('Profiler.stop', None, _parse_stop)
 
 
-def stop_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_precise_coverage() -> Command[T_JSON_DICT, None]:
     '''
     Disable precise code coverage. Disabling releases unnecessary execution count records and allows
     executing optimized code.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.stopPreciseCoverage',
-    }
-    json = yield cmd_dict
+    return Command('Profiler.stopPreciseCoverage')
+
+
+def _parse_take_precise_coverage(json: TakePreciseCoverageReturnsJSON) -> typing.Tuple[typing.List[ScriptCoverage], float]:
+    return (
+        [ScriptCoverage.from_json(i) for i in json['result']],
+        float(json['timestamp'])
+    )
 
 
-def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[ScriptCoverage], float]]:
+def take_precise_coverage() -> Command[TakePreciseCoverageReturnsJSON, typing.Tuple[typing.List[ScriptCoverage], float]]:
     '''
     Collect coverage data for the current isolate, and resets execution counters. Precise code
     coverage needs to have started.
@@ -342,14 +335,7 @@ def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.T
         0. **result** - Coverage data for the current isolate.
         1. **timestamp** - Monotonically increasing time (in seconds) when the coverage update was taken in the backend.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Profiler.takePreciseCoverage',
-    }
-    json = yield cmd_dict
-    return (
-        [ScriptCoverage.from_json(i) for i in json['result']],
-        float(json['timestamp'])
-    )
+    return Command('Profiler.takePreciseCoverage', None, _parse_take_precise_coverage)
 
 
 @event_class('Profiler.consoleProfileFinished')
@@ -363,12 +349,12 @@ class ConsoleProfileFinished:
     title: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileFinished:
+    def from_json(cls, json: ConsoleProfileFinishedJSON) -> ConsoleProfileFinished:
         return cls(
-            id_=str(json['id']),
+            id_=json['id'],
             location=debugger.Location.from_json(json['location']),
             profile=Profile.from_json(json['profile']),
-            title=str(json['title']) if json.get('title', None) is not None else None
+            title=json.get('title')
         )
 
 
@@ -385,11 +371,11 @@ class ConsoleProfileStarted:
     title: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileStarted:
+    def from_json(cls, json: ConsoleProfileStartedJSON) -> ConsoleProfileStarted:
         return cls(
-            id_=str(json['id']),
+            id_=json['id'],
             location=debugger.Location.from_json(json['location']),
-            title=str(json['title']) if json.get('title', None) is not None else None
+            title=json.get('title')
         )
 
 
@@ -412,9 +398,98 @@ class PreciseCoverageDeltaUpdate:
     result: typing.List[ScriptCoverage]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PreciseCoverageDeltaUpdate:
+    def from_json(cls, json: PreciseCoverageDeltaUpdateJSON) -> PreciseCoverageDeltaUpdate:
         return cls(
             timestamp=float(json['timestamp']),
-            occasion=str(json['occasion']),
+            occasion=json['occasion'],
             result=[ScriptCoverage.from_json(i) for i in json['result']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class _ProfileNodeJSON(typing.TypedDict):
+        id: int
+        callFrame: runtime.CallFrameJSON
+
+
+    class ProfileNodeJSON(_ProfileNodeJSON, total=False):
+        hitCount: int
+        children: typing.List[int]
+        deoptReason: str
+        positionTicks: typing.List[PositionTickInfoJSON]
+
+
+    class _ProfileJSON(typing.TypedDict):
+        nodes: typing.List[ProfileNodeJSON]
+        startTime: float
+        endTime: float
+
+
+    class ProfileJSON(_ProfileJSON, total=False):
+        samples: typing.List[int]
+        timeDeltas: typing.List[int]
+
+
+    class PositionTickInfoJSON(typing.TypedDict):
+        line: int
+        ticks: int
+
+
+    class CoverageRangeJSON(typing.TypedDict):
+        startOffset: int
+        endOffset: int
+        count: int
+
+
+    class FunctionCoverageJSON(typing.TypedDict):
+        functionName: str
+        ranges: typing.List[CoverageRangeJSON]
+        isBlockCoverage: bool
+
+
+    class ScriptCoverageJSON(typing.TypedDict):
+        scriptId: str
+        url: str
+        functions: typing.List[FunctionCoverageJSON]
+
+
+    class GetBestEffortCoverageReturnsJSON(typing.TypedDict):
+        result: typing.List[ScriptCoverageJSON]
+
+
+    class StartPreciseCoverageReturnsJSON(typing.TypedDict):
+        timestamp: float
+
+
+    class StopReturnsJSON(typing.TypedDict):
+        profile: ProfileJSON
+
+
+    class TakePreciseCoverageReturnsJSON(typing.TypedDict):
+        result: typing.List[ScriptCoverageJSON]
+        timestamp: float
+
+
+    class _ConsoleProfileFinishedJSON(typing.TypedDict):
+        id: str
+        location: debugger.LocationJSON
+        profile: ProfileJSON
+
+
+    class ConsoleProfileFinishedJSON(_ConsoleProfileFinishedJSON, total=False):
+        title: str
+
+
+    class _ConsoleProfileStartedJSON(typing.TypedDict):
+        id: str
+        location: debugger.LocationJSON
+
+
+    class ConsoleProfileStartedJSON(_ConsoleProfileStartedJSON, total=False):
+        title: str
+
+
+    class PreciseCoverageDeltaUpdateJSON(typing.TypedDict):
+        timestamp: float
+        occasion: str
+        result: typing.List[ScriptCoverageJSON]
@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import target
+if typing.TYPE_CHECKING:
+    from . import target
+else:
+    target = lazy_import('target', globals())
 
 
 @dataclass
@@ -29,14 +31,14 @@ class FileHandlerAccept:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['mediaType'] = self.media_type
-        json['fileExtensions'] = [i for i in self.file_extensions]
+        json['fileExtensions'] = list(self.file_extensions)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FileHandlerAccept:
+    def from_json(cls, json: FileHandlerAcceptJSON) -> FileHandlerAccept:
         return cls(
-            media_type=str(json['mediaType']),
-            file_extensions=[str(i) for i in json['fileExtensions']],
+            media_type=json['mediaType'],
+            file_extensions=json['fileExtensions'],
         )
 
 
@@ -56,11 +58,11 @@ class FileHandler:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FileHandler:
+    def from_json(cls, json: FileHandlerJSON) -> FileHandler:
         return cls(
-            action=str(json['action']),
+            action=json['action'],
             accepts=[FileHandlerAccept.from_json(i) for i in json['accepts']],
-            display_name=str(json['displayName']),
+            display_name=json['displayName'],
         )
 
 
@@ -76,12 +78,22 @@ class DisplayMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DisplayMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
+
+
+def _parse_get_os_app_state(json: GetOsAppStateReturnsJSON) -> typing.Tuple[int, typing.List[FileHandler]]:
+    return (
+        json['badgeCount'],
+        [FileHandler.from_json(i) for i in json['fileHandlers']]
+    )
 
 
 def get_os_app_state(
         manifest_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[int, typing.List[FileHandler]]]:
+    ) -> Command[GetOsAppStateReturnsJSON, typing.Tuple[int, typing.List[FileHandler]]]:
     '''
     Returns the following OS state for the given manifest id.
 
@@ -93,21 +105,13 @@ def get_os_app_state(
     '''
     params: T_JSON_DICT = dict()
     params['manifestId'] = manifest_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.getOsAppState',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        int(json['badgeCount']),
-        [FileHandler.from_json(i) for i in json['fileHandlers']]
-    )
+    return Command('PWA.getOsAppState', params, _parse_get_os_app_state)
 
 
 def install(
         manifest_id: str,
         install_url_or_bundle_url: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Installs the given manifest identity, optionally using the given install_url
     or IWA bundle location.
@@ -127,16 +131,12 @@ def install(
     params['manifestId'] = manifest_id
     if install_url_or_bundle_url is not None:
         params['installUrlOrBundleUrl'] = install_url_or_bundle_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.install',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('PWA.install', params)
 
 
 def uninstall(
         manifest_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Uninstalls the given manifest_id and closes any opened app windows.
 
@@ -144,17 +144,17 @@ def uninstall(
     '''
     params: T_JSON_DICT = dict()
     params['manifestId'] = manifest_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.uninstall',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('PWA.uninstall', params)
+
+
+def _parse_launch(json: LaunchReturnsJSON) -> target.TargetID:
+    return target.TargetID(json['targetId'])
 
 
 def launch(
         manifest_id: str,
         url: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,target.TargetID]:
+    ) -> Command[LaunchReturnsJSON, target.TargetID]:
     '''
     Launches the installed web app, or an url in the same web app instead of the
     default start url if it is provided. Returns a page Target.TargetID which
@@ -168,18 +168,17 @@ def launch(
     params['manifestId'] = manifest_id
     if url is not None:
         params['url'] = url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.launch',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return target.TargetID.from_json(json['targetId'])
+    return Command('PWA.launch', params, _parse_launch)
+
+
+def _parse_launch_files_in_app(json: LaunchFilesInAppReturnsJSON) -> typing.List[target.TargetID]:
+    return [target.TargetID(i) for i in json['targetIds']]
 
 
 def launch_files_in_app(
         manifest_id: str,
         files: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[target.TargetID]]:
+    ) -> Command[LaunchFilesInAppReturnsJSON, typing.List[target.TargetID]]:
     '''
     Opens one or more local files from an installed web app identified by its
     manifestId. The web app needs to have file handlers registered to process
@@ -201,18 +200,13 @@ def launch_files_in_app(
     '''
     params: T_JSON_DICT = dict()
     params['manifestId'] = manifest_id
-    params['files'] = [i for i in files]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.launchFilesInApp',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [target.TargetID.from_json(i) for i in json['targetIds']]
+    params['files'] = list(files)
+    return Command('PWA.launchFilesInApp', params, _parse_launch_files_in_app)
 
 
 def open_current_page_in_app(
         manifest_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Opens the current page in its web app identified by the manifest id, needs
     to be called on a page target. This function returns immediately without
@@ -222,18 +216,14 @@ def open_current_page_in_app(
     '''
     params: T_JSON_DICT = dict()
     params['manifestId'] = manifest_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.openCurrentPageInApp',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('PWA.openCurrentPageInApp', params)
 
 
 def change_app_user_settings(
         manifest_id: str,
         link_capturing: typing.Optional[bool] = None,
         display_mode: typing.Optional[DisplayMode] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Changes user settings of the web app identified by its manifestId. If the
     app was not installed, this command returns an error. Unset parameters will
@@ -254,9 +244,30 @@ def change_app_user_settings(
     if link_capturing is not None:
         params['linkCapturing'] = link_capturing
     if display_mode is not None:
-        params['displayMode'] = display_mode.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'PWA.changeAppUserSettings',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['displayMode'] = display_mode.value
+    return Command('PWA.changeAppUserSettings', params)
+
+
+if typing.TYPE_CHECKING:
+    class FileHandlerAcceptJSON(typing.TypedDict):
+        mediaType: str
+        fileExtensions: typing.List[str]
+
+
+    class FileHandlerJSON(typing.TypedDict):
+        action: str
+        accepts: typing.List[FileHandlerAcceptJSON]
+        displayName: str
+
+
+    class GetOsAppStateReturnsJSON(typing.TypedDict):
+        badgeCount: int
+        fileHandlers: typing.List[FileHandlerJSON]
+
+
+    class LaunchReturnsJSON(typing.TypedDict):
+        targetId: str
+
+
+    class LaunchFilesInAppReturnsJSON(typing.TypedDict):
+        targetIds: typing.List[str]
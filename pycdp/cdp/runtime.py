@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class ScriptId(str):
@@ -52,11 +51,11 @@ class SerializationOptions:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SerializationOptions:
+    def from_json(cls, json: SerializationOptionsJSON) -> SerializationOptions:
         return cls(
-            serialization=str(json['serialization']),
-            max_depth=int(json['maxDepth']) if json.get('maxDepth', None) is not None else None,
-            additional_parameters=dict(json['additionalParameters']) if json.get('additionalParameters', None) is not None else None,
+            serialization=json['serialization'],
+            max_depth=json.get('maxDepth'),
+            additional_parameters=json.get('additionalParameters'),
         )
 
 
@@ -88,12 +87,12 @@ class DeepSerializedValue:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DeepSerializedValue:
+    def from_json(cls, json: DeepSerializedValueJSON) -> DeepSerializedValue:
         return cls(
-            type_=str(json['type']),
-            value=json['value'] if json.get('value', None) is not None else None,
-            object_id=str(json['objectId']) if json.get('objectId', None) is not None else None,
-            weak_local_object_reference=int(json['weakLocalObjectReference']) if json.get('weakLocalObjectReference', None) is not None else None,
+            type_=json['type'],
+            value=json.get('value'),
+            object_id=json.get('objectId'),
+            weak_local_object_reference=json.get('weakLocalObjectReference'),
         )
 
 
@@ -175,13 +174,13 @@ class RemoteObject:
         if self.value is not None:
             json['value'] = self.value
         if self.unserializable_value is not None:
-            json['unserializableValue'] = self.unserializable_value.to_json()
+            json['unserializableValue'] = self.unserializable_value
         if self.description is not None:
             json['description'] = self.description
         if self.deep_serialized_value is not None:
             json['deepSerializedValue'] = self.deep_serialized_value.to_json()
         if self.object_id is not None:
-            json['objectId'] = self.object_id.to_json()
+            json['objectId'] = self.object_id
         if self.preview is not None:
             json['preview'] = self.preview.to_json()
         if self.custom_preview is not None:
@@ -189,18 +188,18 @@ class RemoteObject:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RemoteObject:
+    def from_json(cls, json: RemoteObjectJSON) -> RemoteObject:
         return cls(
-            type_=str(json['type']),
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
-            class_name=str(json['className']) if json.get('className', None) is not None else None,
-            value=json['value'] if json.get('value', None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if json.get('unserializableValue', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            deep_serialized_value=DeepSerializedValue.from_json(json['deepSerializedValue']) if json.get('deepSerializedValue', None) is not None else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if json.get('objectId', None) is not None else None,
-            preview=ObjectPreview.from_json(json['preview']) if json.get('preview', None) is not None else None,
-            custom_preview=CustomPreview.from_json(json['customPreview']) if json.get('customPreview', None) is not None else None,
+            type_=json['type'],
+            subtype=json.get('subtype'),
+            class_name=json.get('className'),
+            value=json.get('value'),
+            unserializable_value=UnserializableValue(_unserializable_value) if (_unserializable_value := json.get('unserializableValue')) is not None else None,
+            description=json.get('description'),
+            deep_serialized_value=DeepSerializedValue.from_json(_deep_serialized_value) if (_deep_serialized_value := json.get('deepSerializedValue')) is not None else None,
+            object_id=RemoteObjectId(_object_id) if (_object_id := json.get('objectId')) is not None else None,
+            preview=ObjectPreview.from_json(_preview) if (_preview := json.get('preview')) is not None else None,
+            custom_preview=CustomPreview.from_json(_custom_preview) if (_custom_preview := json.get('customPreview')) is not None else None,
         )
 
 
@@ -219,14 +218,14 @@ class CustomPreview:
         json: T_JSON_DICT = dict()
         json['header'] = self.header
         if self.body_getter_id is not None:
-            json['bodyGetterId'] = self.body_getter_id.to_json()
+            json['bodyGetterId'] = self.body_getter_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CustomPreview:
+    def from_json(cls, json: CustomPreviewJSON) -> CustomPreview:
         return cls(
-            header=str(json['header']),
-            body_getter_id=RemoteObjectId.from_json(json['bodyGetterId']) if json.get('bodyGetterId', None) is not None else None,
+            header=json['header'],
+            body_getter_id=RemoteObjectId(_body_getter_id) if (_body_getter_id := json.get('bodyGetterId')) is not None else None,
         )
 
 
@@ -267,14 +266,14 @@ class ObjectPreview:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ObjectPreview:
+    def from_json(cls, json: ObjectPreviewJSON) -> ObjectPreview:
         return cls(
-            type_=str(json['type']),
-            overflow=bool(json['overflow']),
+            type_=json['type'],
+            overflow=json['overflow'],
             properties=[PropertyPreview.from_json(i) for i in json['properties']],
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            entries=[EntryPreview.from_json(i) for i in json['entries']] if json.get('entries', None) is not None else None,
+            subtype=json.get('subtype'),
+            description=json.get('description'),
+            entries=[EntryPreview.from_json(i) for i in _entries] if (_entries := json.get('entries')) is not None else None,
         )
 
 
@@ -308,13 +307,13 @@ class PropertyPreview:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PropertyPreview:
+    def from_json(cls, json: PropertyPreviewJSON) -> PropertyPreview:
         return cls(
-            name=str(json['name']),
-            type_=str(json['type']),
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            value_preview=ObjectPreview.from_json(json['valuePreview']) if json.get('valuePreview', None) is not None else None,
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
+            name=json['name'],
+            type_=json['type'],
+            value=json.get('value'),
+            value_preview=ObjectPreview.from_json(_value_preview) if (_value_preview := json.get('valuePreview')) is not None else None,
+            subtype=json.get('subtype'),
         )
 
 
@@ -334,10 +333,10 @@ class EntryPreview:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> EntryPreview:
+    def from_json(cls, json: EntryPreviewJSON) -> EntryPreview:
         return cls(
             value=ObjectPreview.from_json(json['value']),
-            key=ObjectPreview.from_json(json['key']) if json.get('key', None) is not None else None,
+            key=ObjectPreview.from_json(_key) if (_key := json.get('key')) is not None else None,
         )
 
 
@@ -402,18 +401,18 @@ class PropertyDescriptor:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PropertyDescriptor:
+    def from_json(cls, json: PropertyDescriptorJSON) -> PropertyDescriptor:
         return cls(
-            name=str(json['name']),
-            configurable=bool(json['configurable']),
-            enumerable=bool(json['enumerable']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
-            writable=bool(json['writable']) if json.get('writable', None) is not None else None,
-            get=RemoteObject.from_json(json['get']) if json.get('get', None) is not None else None,
-            set_=RemoteObject.from_json(json['set']) if json.get('set', None) is not None else None,
-            was_thrown=bool(json['wasThrown']) if json.get('wasThrown', None) is not None else None,
-            is_own=bool(json['isOwn']) if json.get('isOwn', None) is not None else None,
-            symbol=RemoteObject.from_json(json['symbol']) if json.get('symbol', None) is not None else None,
+            name=json['name'],
+            configurable=json['configurable'],
+            enumerable=json['enumerable'],
+            value=RemoteObject.from_json(_value) if (_value := json.get('value')) is not None else None,
+            writable=json.get('writable'),
+            get=RemoteObject.from_json(_get) if (_get := json.get('get')) is not None else None,
+            set_=RemoteObject.from_json(_set_) if (_set_ := json.get('set')) is not None else None,
+            was_thrown=json.get('wasThrown'),
+            is_own=json.get('isOwn'),
+            symbol=RemoteObject.from_json(_symbol) if (_symbol := json.get('symbol')) is not None else None,
         )
 
 
@@ -436,10 +435,10 @@ class InternalPropertyDescriptor:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InternalPropertyDescriptor:
+    def from_json(cls, json: InternalPropertyDescriptorJSON) -> InternalPropertyDescriptor:
         return cls(
-            name=str(json['name']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
+            name=json['name'],
+            value=RemoteObject.from_json(_value) if (_value := json.get('value')) is not None else None,
         )
 
 
@@ -474,12 +473,12 @@ class PrivatePropertyDescriptor:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> PrivatePropertyDescriptor:
+    def from_json(cls, json: PrivatePropertyDescriptorJSON) -> PrivatePropertyDescriptor:
         return cls(
-            name=str(json['name']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
-            get=RemoteObject.from_json(json['get']) if json.get('get', None) is not None else None,
-            set_=RemoteObject.from_json(json['set']) if json.get('set', None) is not None else None,
+            name=json['name'],
+            value=RemoteObject.from_json(_value) if (_value := json.get('value')) is not None else None,
+            get=RemoteObject.from_json(_get) if (_get := json.get('get')) is not None else None,
+            set_=RemoteObject.from_json(_set_) if (_set_ := json.get('set')) is not None else None,
         )
 
 
@@ -503,17 +502,17 @@ class CallArgument:
         if self.value is not None:
             json['value'] = self.value
         if self.unserializable_value is not None:
-            json['unserializableValue'] = self.unserializable_value.to_json()
+            json['unserializableValue'] = self.unserializable_value
         if self.object_id is not None:
-            json['objectId'] = self.object_id.to_json()
+            json['objectId'] = self.object_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CallArgument:
+    def from_json(cls, json: CallArgumentJSON) -> CallArgument:
         return cls(
-            value=json['value'] if json.get('value', None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if json.get('unserializableValue', None) is not None else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if json.get('objectId', None) is not None else None,
+            value=json.get('value'),
+            unserializable_value=UnserializableValue(_unserializable_value) if (_unserializable_value := json.get('unserializableValue')) is not None else None,
+            object_id=RemoteObjectId(_object_id) if (_object_id := json.get('objectId')) is not None else None,
         )
 
 
@@ -557,7 +556,7 @@ class ExecutionContextDescription:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['id'] = self.id_.to_json()
+        json['id'] = self.id_
         json['origin'] = self.origin
         json['name'] = self.name
         json['uniqueId'] = self.unique_id
@@ -566,13 +565,13 @@ class ExecutionContextDescription:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDescription:
+    def from_json(cls, json: ExecutionContextDescriptionJSON) -> ExecutionContextDescription:
         return cls(
-            id_=ExecutionContextId.from_json(json['id']),
-            origin=str(json['origin']),
-            name=str(json['name']),
-            unique_id=str(json['uniqueId']),
-            aux_data=dict(json['auxData']) if json.get('auxData', None) is not None else None,
+            id_=ExecutionContextId(json['id']),
+            origin=json['origin'],
+            name=json['name'],
+            unique_id=json['uniqueId'],
+            aux_data=json.get('auxData'),
         )
 
 
@@ -621,7 +620,7 @@ class ExceptionDetails:
         json['lineNumber'] = self.line_number
         json['columnNumber'] = self.column_number
         if self.script_id is not None:
-            json['scriptId'] = self.script_id.to_json()
+            json['scriptId'] = self.script_id
         if self.url is not None:
             json['url'] = self.url
         if self.stack_trace is not None:
@@ -629,24 +628,24 @@ class ExceptionDetails:
         if self.exception is not None:
             json['exception'] = self.exception.to_json()
         if self.execution_context_id is not None:
-            json['executionContextId'] = self.execution_context_id.to_json()
+            json['executionContextId'] = self.execution_context_id
         if self.exception_meta_data is not None:
             json['exceptionMetaData'] = self.exception_meta_data
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExceptionDetails:
+    def from_json(cls, json: ExceptionDetailsJSON) -> ExceptionDetails:
         return cls(
-            exception_id=int(json['exceptionId']),
-            text=str(json['text']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            script_id=ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            stack_trace=StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            exception=RemoteObject.from_json(json['exception']) if json.get('exception', None) is not None else None,
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']) if json.get('executionContextId', None) is not None else None,
-            exception_meta_data=dict(json['exceptionMetaData']) if json.get('exceptionMetaData', None) is not None else None,
+            exception_id=json['exceptionId'],
+            text=json['text'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
+            script_id=ScriptId(_script_id) if (_script_id := json.get('scriptId')) is not None else None,
+            url=json.get('url'),
+            stack_trace=StackTrace.from_json(_stack_trace) if (_stack_trace := json.get('stackTrace')) is not None else None,
+            exception=RemoteObject.from_json(_exception) if (_exception := json.get('exception')) is not None else None,
+            execution_context_id=ExecutionContextId(_execution_context_id) if (_execution_context_id := json.get('executionContextId')) is not None else None,
+            exception_meta_data=json.get('exceptionMetaData'),
         )
 
 
@@ -703,20 +702,20 @@ class CallFrame:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['functionName'] = self.function_name
-        json['scriptId'] = self.script_id.to_json()
+        json['scriptId'] = self.script_id
         json['url'] = self.url
         json['lineNumber'] = self.line_number
         json['columnNumber'] = self.column_number
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CallFrame:
+    def from_json(cls, json: CallFrameJSON) -> CallFrame:
         return cls(
-            function_name=str(json['functionName']),
-            script_id=ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            function_name=json['functionName'],
+            script_id=ScriptId(json['scriptId']),
+            url=json['url'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
@@ -750,12 +749,12 @@ class StackTrace:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StackTrace:
+    def from_json(cls, json: StackTraceJSON) -> StackTrace:
         return cls(
             call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            parent=StackTrace.from_json(json['parent']) if json.get('parent', None) is not None else None,
-            parent_id=StackTraceId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
+            description=json.get('description'),
+            parent=StackTrace.from_json(_parent) if (_parent := json.get('parent')) is not None else None,
+            parent_id=StackTraceId.from_json(_parent_id) if (_parent_id := json.get('parentId')) is not None else None,
         )
 
 
@@ -788,22 +787,29 @@ class StackTraceId:
         json: T_JSON_DICT = dict()
         json['id'] = self.id_
         if self.debugger_id is not None:
-            json['debuggerId'] = self.debugger_id.to_json()
+            json['debuggerId'] = self.debugger_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StackTraceId:
+    def from_json(cls, json: StackTraceIdJSON) -> StackTraceId:
         return cls(
-            id_=str(json['id']),
-            debugger_id=UniqueDebuggerId.from_json(json['debuggerId']) if json.get('debuggerId', None) is not None else None,
+            id_=json['id'],
+            debugger_id=UniqueDebuggerId(_debugger_id) if (_debugger_id := json.get('debuggerId')) is not None else None,
         )
 
 
+def _parse_await_promise(json: AwaitPromiseReturnsJSON) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
+    )
+
+
 def await_promise(
         promise_object_id: RemoteObjectId,
         return_by_value: typing.Optional[bool] = None,
         generate_preview: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
+    ) -> Command[AwaitPromiseReturnsJSON, typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
     '''
     Add handler to promise with given promise object id.
 
@@ -816,19 +822,18 @@ def await_promise(
         1. **exceptionDetails** - *(Optional)* Exception details if stack strace is available.
     '''
     params: T_JSON_DICT = dict()
-    params['promiseObjectId'] = promise_object_id.to_json()
+    params['promiseObjectId'] = promise_object_id
     if return_by_value is not None:
         params['returnByValue'] = return_by_value
     if generate_preview is not None:
         params['generatePreview'] = generate_preview
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.awaitPromise',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.awaitPromise', params, _parse_await_promise)
+
+
+def _parse_call_function_on(json: CallFunctionOnReturnsJSON) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
     return (
         RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
     )
 
 
@@ -846,7 +851,7 @@ def call_function_on(
         throw_on_side_effect: typing.Optional[bool] = None,
         unique_context_id: typing.Optional[str] = None,
         serialization_options: typing.Optional[SerializationOptions] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
+    ) -> Command[CallFunctionOnReturnsJSON, typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
     '''
     Calls function with given declaration on the given object. Object group of the result is
     inherited from the target object.
@@ -872,7 +877,7 @@ def call_function_on(
     params: T_JSON_DICT = dict()
     params['functionDeclaration'] = function_declaration
     if object_id is not None:
-        params['objectId'] = object_id.to_json()
+        params['objectId'] = object_id
     if arguments is not None:
         params['arguments'] = [i.to_json() for i in arguments]
     if silent is not None:
@@ -886,7 +891,7 @@ def call_function_on(
     if await_promise is not None:
         params['awaitPromise'] = await_promise
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
+        params['executionContextId'] = execution_context_id
     if object_group is not None:
         params['objectGroup'] = object_group
     if throw_on_side_effect is not None:
@@ -895,14 +900,13 @@ def call_function_on(
         params['uniqueContextId'] = unique_context_id
     if serialization_options is not None:
         params['serializationOptions'] = serialization_options.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.callFunctionOn',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.callFunctionOn', params, _parse_call_function_on)
+
+
+def _parse_compile_script(json: CompileScriptReturnsJSON) -> typing.Tuple[typing.Optional[ScriptId], typing.Optional[ExceptionDetails]]:
     return (
-        RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+        ScriptId(_script_id) if (_script_id := json.get('scriptId')) is not None else None,
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
     )
 
 
@@ -911,7 +915,7 @@ def compile_script(
         source_url: str,
         persist_script: bool,
         execution_context_id: typing.Optional[ExecutionContextId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[ScriptId], typing.Optional[ExceptionDetails]]]:
+    ) -> Command[CompileScriptReturnsJSON, typing.Tuple[typing.Optional[ScriptId], typing.Optional[ExceptionDetails]]]:
     '''
     Compiles expression.
 
@@ -929,48 +933,38 @@ def compile_script(
     params['sourceURL'] = source_url
     params['persistScript'] = persist_script
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.compileScript',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+        params['executionContextId'] = execution_context_id
+    return Command('Runtime.compileScript', params, _parse_compile_script)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables reporting of execution contexts creation.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.disable',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.disable')
 
 
-def discard_console_entries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def discard_console_entries() -> Command[T_JSON_DICT, None]:
     '''
     Discards collected exceptions and console API calls.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.discardConsoleEntries',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.discardConsoleEntries')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables reporting of execution contexts creation by means of ``executionContextCreated`` event.
     When the reporting gets enabled the event will be sent immediately for each existing execution
     context.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.enable',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.enable')
+
+
+def _parse_evaluate(json: EvaluateReturnsJSON) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
+    )
 
 
 def evaluate(
@@ -990,7 +984,7 @@ def evaluate(
         allow_unsafe_eval_blocked_by_csp: typing.Optional[bool] = None,
         unique_context_id: typing.Optional[str] = None,
         serialization_options: typing.Optional[SerializationOptions] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
+    ) -> Command[EvaluateReturnsJSON, typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
     '''
     Evaluates expression on global object.
 
@@ -1024,7 +1018,7 @@ def evaluate(
     if silent is not None:
         params['silent'] = silent
     if context_id is not None:
-        params['contextId'] = context_id.to_json()
+        params['contextId'] = context_id
     if return_by_value is not None:
         params['returnByValue'] = return_by_value
     if generate_preview is not None:
@@ -1036,7 +1030,7 @@ def evaluate(
     if throw_on_side_effect is not None:
         params['throwOnSideEffect'] = throw_on_side_effect
     if timeout is not None:
-        params['timeout'] = timeout.to_json()
+        params['timeout'] = timeout
     if disable_breaks is not None:
         params['disableBreaks'] = disable_breaks
     if repl_mode is not None:
@@ -1047,18 +1041,14 @@ def evaluate(
         params['uniqueContextId'] = unique_context_id
     if serialization_options is not None:
         params['serializationOptions'] = serialization_options.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.evaluate',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return Command('Runtime.evaluate', params, _parse_evaluate)
+
+
+def _parse_get_isolate_id(json: GetIsolateIdReturnsJSON) -> str:
+    return json['id']
 
 
-def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+def get_isolate_id() -> Command[GetIsolateIdReturnsJSON, str]:
     '''
     Returns the isolate id.
 
@@ -1066,14 +1056,19 @@ def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
 
     :returns: The isolate id.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.getIsolateId',
-    }
-    json = yield cmd_dict
-    return str(json['id'])
+    return Command('Runtime.getIsolateId', None, _parse_get_isolate_id)
+
+
+def _parse_get_heap_usage(json: GetHeapUsageReturnsJSON) -> typing.Tuple[float, float, float, float]:
+    return (
+        float(json['usedSize']),
+        float(json['totalSize']),
+        float(json['embedderHeapUsedSize']),
+        float(json['backingStorageSize'])
+    )
 
 
-def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float, float, float]]:
+def get_heap_usage() -> Command[GetHeapUsageReturnsJSON, typing.Tuple[float, float, float, float]]:
     '''
     Returns the JavaScript heap usage.
     It is the total usage of the corresponding isolate not scoped to a particular Runtime.
@@ -1087,15 +1082,15 @@ def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[fl
         2. **embedderHeapUsedSize** - Used size in bytes in the embedder's garbage-collected heap.
         3. **backingStorageSize** - Size in bytes of backing storage for array buffers and external strings.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.getHeapUsage',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.getHeapUsage', None, _parse_get_heap_usage)
+
+
+def _parse_get_properties(json: GetPropertiesReturnsJSON) -> typing.Tuple[typing.List[PropertyDescriptor], typing.Optional[typing.List[InternalPropertyDescriptor]], typing.Optional[typing.List[PrivatePropertyDescriptor]], typing.Optional[ExceptionDetails]]:
     return (
-        float(json['usedSize']),
-        float(json['totalSize']),
-        float(json['embedderHeapUsedSize']),
-        float(json['backingStorageSize'])
+        [PropertyDescriptor.from_json(i) for i in json['result']],
+        [InternalPropertyDescriptor.from_json(i) for i in _internal_properties] if (_internal_properties := json.get('internalProperties')) is not None else None,
+        [PrivatePropertyDescriptor.from_json(i) for i in _private_properties] if (_private_properties := json.get('privateProperties')) is not None else None,
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
     )
 
 
@@ -1105,7 +1100,7 @@ def get_properties(
         accessor_properties_only: typing.Optional[bool] = None,
         generate_preview: typing.Optional[bool] = None,
         non_indexed_properties_only: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[PropertyDescriptor], typing.Optional[typing.List[InternalPropertyDescriptor]], typing.Optional[typing.List[PrivatePropertyDescriptor]], typing.Optional[ExceptionDetails]]]:
+    ) -> Command[GetPropertiesReturnsJSON, typing.Tuple[typing.List[PropertyDescriptor], typing.Optional[typing.List[InternalPropertyDescriptor]], typing.Optional[typing.List[PrivatePropertyDescriptor]], typing.Optional[ExceptionDetails]]]:
     '''
     Returns properties of a given object. Object group of the result is inherited from the target
     object.
@@ -1123,7 +1118,7 @@ def get_properties(
         3. **exceptionDetails** - *(Optional)* Exception details.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params['objectId'] = object_id
     if own_properties is not None:
         params['ownProperties'] = own_properties
     if accessor_properties_only is not None:
@@ -1132,22 +1127,16 @@ def get_properties(
         params['generatePreview'] = generate_preview
     if non_indexed_properties_only is not None:
         params['nonIndexedPropertiesOnly'] = non_indexed_properties_only
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.getProperties',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        [PropertyDescriptor.from_json(i) for i in json['result']],
-        [InternalPropertyDescriptor.from_json(i) for i in json['internalProperties']] if json.get('internalProperties', None) is not None else None,
-        [PrivatePropertyDescriptor.from_json(i) for i in json['privateProperties']] if json.get('privateProperties', None) is not None else None,
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return Command('Runtime.getProperties', params, _parse_get_properties)
+
+
+def _parse_global_lexical_scope_names(json: GlobalLexicalScopeNamesReturnsJSON) -> typing.List[str]:
+    return json['names']
 
 
 def global_lexical_scope_names(
         execution_context_id: typing.Optional[ExecutionContextId] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[GlobalLexicalScopeNamesReturnsJSON, typing.List[str]]:
     '''
     Returns all let, const and class variables from global scope.
 
@@ -1156,56 +1145,46 @@ def global_lexical_scope_names(
     '''
     params: T_JSON_DICT = dict()
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.globalLexicalScopeNames',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['names']]
+        params['executionContextId'] = execution_context_id
+    return Command('Runtime.globalLexicalScopeNames', params, _parse_global_lexical_scope_names)
+
+
+def _parse_query_objects(json: QueryObjectsReturnsJSON) -> RemoteObject:
+    return RemoteObject.from_json(json['objects'])
 
 
 def query_objects(
         prototype_object_id: RemoteObjectId,
         object_group: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,RemoteObject]:
+    ) -> Command[QueryObjectsReturnsJSON, RemoteObject]:
     '''
     :param prototype_object_id: Identifier of the prototype to return objects for.
     :param object_group: *(Optional)* Symbolic group name that can be used to release the results.
     :returns: Array with objects.
     '''
     params: T_JSON_DICT = dict()
-    params['prototypeObjectId'] = prototype_object_id.to_json()
+    params['prototypeObjectId'] = prototype_object_id
     if object_group is not None:
         params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.queryObjects',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return RemoteObject.from_json(json['objects'])
+    return Command('Runtime.queryObjects', params, _parse_query_objects)
 
 
 def release_object(
         object_id: RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Releases remote object with given id.
 
     :param object_id: Identifier of the object to release.
     '''
     params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.releaseObject',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['objectId'] = object_id
+    return Command('Runtime.releaseObject', params)
 
 
 def release_object_group(
         object_group: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Releases all remote objects that belong to a given group.
 
@@ -1213,21 +1192,21 @@ def release_object_group(
     '''
     params: T_JSON_DICT = dict()
     params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.releaseObjectGroup',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.releaseObjectGroup', params)
 
 
-def run_if_waiting_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def run_if_waiting_for_debugger() -> Command[T_JSON_DICT, None]:
     '''
     Tells inspected instance to run if it was waiting for debugger to attach.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.runIfWaitingForDebugger',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.runIfWaitingForDebugger')
+
+
+def _parse_run_script(json: RunScriptReturnsJSON) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
+    )
 
 
 def run_script(
@@ -1239,7 +1218,7 @@ def run_script(
         return_by_value: typing.Optional[bool] = None,
         generate_preview: typing.Optional[bool] = None,
         await_promise: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
+    ) -> Command[RunScriptReturnsJSON, typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]]:
     '''
     Runs script with given id in a given context.
 
@@ -1257,9 +1236,9 @@ def run_script(
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
     params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
+    params['scriptId'] = script_id
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
+        params['executionContextId'] = execution_context_id
     if object_group is not None:
         params['objectGroup'] = object_group
     if silent is not None:
@@ -1272,20 +1251,12 @@ def run_script(
         params['generatePreview'] = generate_preview
     if await_promise is not None:
         params['awaitPromise'] = await_promise
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.runScript',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return Command('Runtime.runScript', params, _parse_run_script)
 
 
 def set_async_call_stack_depth(
         max_depth: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables or disables async call stacks tracking.
 
@@ -1293,16 +1264,12 @@ def set_async_call_stack_depth(
     '''
     params: T_JSON_DICT = dict()
     params['maxDepth'] = max_depth
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.setAsyncCallStackDepth',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.setAsyncCallStackDepth', params)
 
 
 def set_custom_object_formatter_enabled(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -1312,16 +1279,12 @@ def set_custom_object_formatter_enabled(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.setCustomObjectFormatterEnabled',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.setCustomObjectFormatterEnabled', params)
 
 
 def set_max_call_stack_size_to_capture(
         size: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
 
 
@@ -1331,31 +1294,24 @@ def set_max_call_stack_size_to_capture(
     '''
     params: T_JSON_DICT = dict()
     params['size'] = size
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.setMaxCallStackSizeToCapture',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.setMaxCallStackSizeToCapture', params)
 
 
-def terminate_execution() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def terminate_execution() -> Command[T_JSON_DICT, None]:
     '''
     Terminate current or next JavaScript execution.
     Will cancel the termination when the outer-most script execution ends.
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.terminateExecution',
-    }
-    json = yield cmd_dict
+    return Command('Runtime.terminateExecution')
 
 
 def add_binding(
         name: str,
         execution_context_id: typing.Optional[ExecutionContextId] = None,
         execution_context_name: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     If executionContextId is empty, adds binding with the given name on the
     global objects of all inspected contexts, including those created later,
@@ -1371,19 +1327,15 @@ def add_binding(
     params: T_JSON_DICT = dict()
     params['name'] = name
     if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
+        params['executionContextId'] = execution_context_id
     if execution_context_name is not None:
         params['executionContextName'] = execution_context_name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.addBinding',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.addBinding', params)
 
 
 def remove_binding(
         name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     This method does not remove binding function from global object but
     unsubscribes current runtime agent from Runtime.bindingCalled notifications.
@@ -1392,16 +1344,16 @@ def remove_binding(
     '''
     params: T_JSON_DICT = dict()
     params['name'] = name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.removeBinding',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Runtime.removeBinding', params)
+
+
+def _parse_get_exception_details(json: GetExceptionDetailsReturnsJSON) -> typing.Optional[ExceptionDetails]:
+    return ExceptionDetails.from_json(_exception_details) if (_exception_details := json.get('exceptionDetails')) is not None else None
 
 
 def get_exception_details(
         error_object_id: RemoteObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[ExceptionDetails]]:
+    ) -> Command[GetExceptionDetailsReturnsJSON, typing.Optional[ExceptionDetails]]:
     '''
     This method tries to lookup and populate exception details for a
     JavaScript Error object.
@@ -1415,13 +1367,8 @@ def get_exception_details(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['errorObjectId'] = error_object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Runtime.getExceptionDetails',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    params['errorObjectId'] = error_object_id
+    return Command('Runtime.getExceptionDetails', params, _parse_get_exception_details)
 
 
 @event_class('Runtime.bindingCalled')
@@ -1438,11 +1385,11 @@ class BindingCalled:
     execution_context_id: ExecutionContextId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BindingCalled:
+    def from_json(cls, json: BindingCalledJSON) -> BindingCalled:
         return cls(
-            name=str(json['name']),
-            payload=str(json['payload']),
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId'])
+            name=json['name'],
+            payload=json['payload'],
+            execution_context_id=ExecutionContextId(json['executionContextId'])
         )
 
 
@@ -1470,14 +1417,14 @@ class ConsoleAPICalled:
     context: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ConsoleAPICalled:
+    def from_json(cls, json: ConsoleAPICalledJSON) -> ConsoleAPICalled:
         return cls(
-            type_=str(json['type']),
+            type_=json['type'],
             args=[RemoteObject.from_json(i) for i in json['args']],
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
-            timestamp=Timestamp.from_json(json['timestamp']),
-            stack_trace=StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            context=str(json['context']) if json.get('context', None) is not None else None
+            execution_context_id=ExecutionContextId(json['executionContextId']),
+            timestamp=Timestamp(json['timestamp']),
+            stack_trace=StackTrace.from_json(_stack_trace) if (_stack_trace := json.get('stackTrace')) is not None else None,
+            context=json.get('context')
         )
 
 
@@ -1493,10 +1440,10 @@ class ExceptionRevoked:
     exception_id: int
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExceptionRevoked:
+    def from_json(cls, json: ExceptionRevokedJSON) -> ExceptionRevoked:
         return cls(
-            reason=str(json['reason']),
-            exception_id=int(json['exceptionId'])
+            reason=json['reason'],
+            exception_id=json['exceptionId']
         )
 
 
@@ -1511,9 +1458,9 @@ class ExceptionThrown:
     exception_details: ExceptionDetails
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExceptionThrown:
+    def from_json(cls, json: ExceptionThrownJSON) -> ExceptionThrown:
         return cls(
-            timestamp=Timestamp.from_json(json['timestamp']),
+            timestamp=Timestamp(json['timestamp']),
             exception_details=ExceptionDetails.from_json(json['exceptionDetails'])
         )
 
@@ -1528,7 +1475,7 @@ class ExecutionContextCreated:
     context: ExecutionContextDescription
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExecutionContextCreated:
+    def from_json(cls, json: ExecutionContextCreatedJSON) -> ExecutionContextCreated:
         return cls(
             context=ExecutionContextDescription.from_json(json['context'])
         )
@@ -1546,10 +1493,10 @@ class ExecutionContextDestroyed:
     execution_context_unique_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDestroyed:
+    def from_json(cls, json: ExecutionContextDestroyedJSON) -> ExecutionContextDestroyed:
         return cls(
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
-            execution_context_unique_id=str(json['executionContextUniqueId'])
+            execution_context_id=ExecutionContextId(json['executionContextId']),
+            execution_context_unique_id=json['executionContextUniqueId']
         )
 
 
@@ -1581,9 +1528,293 @@ class InspectRequested:
     execution_context_id: typing.Optional[ExecutionContextId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InspectRequested:
+    def from_json(cls, json: InspectRequestedJSON) -> InspectRequested:
         return cls(
             object_=RemoteObject.from_json(json['object']),
-            hints=dict(json['hints']),
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']) if json.get('executionContextId', None) is not None else None
+            hints=json['hints'],
+            execution_context_id=ExecutionContextId(_execution_context_id) if (_execution_context_id := json.get('executionContextId')) is not None else None
         )
+
+
+if typing.TYPE_CHECKING:
+    class _SerializationOptionsJSON(typing.TypedDict):
+        serialization: str
+
+
+    class SerializationOptionsJSON(_SerializationOptionsJSON, total=False):
+        maxDepth: int
+        additionalParameters: dict
+
+
+    class _DeepSerializedValueJSON(typing.TypedDict):
+        type: str
+
+
+    class DeepSerializedValueJSON(_DeepSerializedValueJSON, total=False):
+        value: typing.Any
+        objectId: str
+        weakLocalObjectReference: int
+
+
+    class _RemoteObjectJSON(typing.TypedDict):
+        type: str
+
+
+    class RemoteObjectJSON(_RemoteObjectJSON, total=False):
+        subtype: str
+        className: str
+        value: typing.Any
+        unserializableValue: str
+        description: str
+        deepSerializedValue: DeepSerializedValueJSON
+        objectId: str
+        preview: ObjectPreviewJSON
+        customPreview: CustomPreviewJSON
+
+
+    class _CustomPreviewJSON(typing.TypedDict):
+        header: str
+
+
+    class CustomPreviewJSON(_CustomPreviewJSON, total=False):
+        bodyGetterId: str
+
+
+    class _ObjectPreviewJSON(typing.TypedDict):
+        type: str
+        overflow: bool
+        properties: typing.List[PropertyPreviewJSON]
+
+
+    class ObjectPreviewJSON(_ObjectPreviewJSON, total=False):
+        subtype: str
+        description: str
+        entries: typing.List[EntryPreviewJSON]
+
+
+    class _PropertyPreviewJSON(typing.TypedDict):
+        name: str
+        type: str
+
+
+    class PropertyPreviewJSON(_PropertyPreviewJSON, total=False):
+        value: str
+        valuePreview: ObjectPreviewJSON
+        subtype: str
+
+
+    class _EntryPreviewJSON(typing.TypedDict):
+        value: ObjectPreviewJSON
+
+
+    class EntryPreviewJSON(_EntryPreviewJSON, total=False):
+        key: ObjectPreviewJSON
+
+
+    class _PropertyDescriptorJSON(typing.TypedDict):
+        name: str
+        configurable: bool
+        enumerable: bool
+
+
+    class PropertyDescriptorJSON(_PropertyDescriptorJSON, total=False):
+        value: RemoteObjectJSON
+        writable: bool
+        get: RemoteObjectJSON
+        set: RemoteObjectJSON
+        wasThrown: bool
+        isOwn: bool
+        symbol: RemoteObjectJSON
+
+
+    class _InternalPropertyDescriptorJSON(typing.TypedDict):
+        name: str
+
+
+    class InternalPropertyDescriptorJSON(_InternalPropertyDescriptorJSON, total=False):
+        value: RemoteObjectJSON
+
+
+    class _PrivatePropertyDescriptorJSON(typing.TypedDict):
+        name: str
+
+
+    class PrivatePropertyDescriptorJSON(_PrivatePropertyDescriptorJSON, total=False):
+        value: RemoteObjectJSON
+        get: RemoteObjectJSON
+        set: RemoteObjectJSON
+
+
+    class CallArgumentJSON(typing.TypedDict, total=False):
+        value: typing.Any
+        unserializableValue: str
+        objectId: str
+
+
+    class _ExecutionContextDescriptionJSON(typing.TypedDict):
+        id: int
+        origin: str
+        name: str
+        uniqueId: str
+
+
+    class ExecutionContextDescriptionJSON(_ExecutionContextDescriptionJSON, total=False):
+        auxData: dict
+
+
+    class _ExceptionDetailsJSON(typing.TypedDict):
+        exceptionId: int
+        text: str
+        lineNumber: int
+        columnNumber: int
+
+
+    class ExceptionDetailsJSON(_ExceptionDetailsJSON, total=False):
+        scriptId: str
+        url: str
+        stackTrace: StackTraceJSON
+        exception: RemoteObjectJSON
+        executionContextId: int
+        exceptionMetaData: dict
+
+
+    class CallFrameJSON(typing.TypedDict):
+        functionName: str
+        scriptId: str
+        url: str
+        lineNumber: int
+        columnNumber: int
+
+
+    class _StackTraceJSON(typing.TypedDict):
+        callFrames: typing.List[CallFrameJSON]
+
+
+    class StackTraceJSON(_StackTraceJSON, total=False):
+        description: str
+        parent: StackTraceJSON
+        parentId: StackTraceIdJSON
+
+
+    class _StackTraceIdJSON(typing.TypedDict):
+        id: str
+
+
+    class StackTraceIdJSON(_StackTraceIdJSON, total=False):
+        debuggerId: str
+
+
+    class _AwaitPromiseReturnsJSON(typing.TypedDict):
+        result: RemoteObjectJSON
+
+
+    class AwaitPromiseReturnsJSON(_AwaitPromiseReturnsJSON, total=False):
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class _CallFunctionOnReturnsJSON(typing.TypedDict):
+        result: RemoteObjectJSON
+
+
+    class CallFunctionOnReturnsJSON(_CallFunctionOnReturnsJSON, total=False):
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class CompileScriptReturnsJSON(typing.TypedDict, total=False):
+        scriptId: str
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class _EvaluateReturnsJSON(typing.TypedDict):
+        result: RemoteObjectJSON
+
+
+    class EvaluateReturnsJSON(_EvaluateReturnsJSON, total=False):
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class GetIsolateIdReturnsJSON(typing.TypedDict):
+        id: str
+
+
+    class GetHeapUsageReturnsJSON(typing.TypedDict):
+        usedSize: float
+        totalSize: float
+        embedderHeapUsedSize: float
+        backingStorageSize: float
+
+
+    class _GetPropertiesReturnsJSON(typing.TypedDict):
+        result: typing.List[PropertyDescriptorJSON]
+
+
+    class GetPropertiesReturnsJSON(_GetPropertiesReturnsJSON, total=False):
+        internalProperties: typing.List[InternalPropertyDescriptorJSON]
+        privateProperties: typing.List[PrivatePropertyDescriptorJSON]
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class GlobalLexicalScopeNamesReturnsJSON(typing.TypedDict):
+        names: typing.List[str]
+
+
+    class QueryObjectsReturnsJSON(typing.TypedDict):
+        objects: RemoteObjectJSON
+
+
+    class _RunScriptReturnsJSON(typing.TypedDict):
+        result: RemoteObjectJSON
+
+
+    class RunScriptReturnsJSON(_RunScriptReturnsJSON, total=False):
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class GetExceptionDetailsReturnsJSON(typing.TypedDict, total=False):
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class BindingCalledJSON(typing.TypedDict):
+        name: str
+        payload: str
+        executionContextId: int
+
+
+    class _ConsoleAPICalledJSON(typing.TypedDict):
+        type: str
+        args: typing.List[RemoteObjectJSON]
+        executionContextId: int
+        timestamp: float
+
+
+    class ConsoleAPICalledJSON(_ConsoleAPICalledJSON, total=False):
+        stackTrace: StackTraceJSON
+        context: str
+
+
+    class ExceptionRevokedJSON(typing.TypedDict):
+        reason: str
+        exceptionId: int
+
+
+    class ExceptionThrownJSON(typing.TypedDict):
+        timestamp: float
+        exceptionDetails: ExceptionDetailsJSON
+
+
+    class ExecutionContextCreatedJSON(typing.TypedDict):
+        context: ExecutionContextDescriptionJSON
+
+
+    class ExecutionContextDestroyedJSON(typing.TypedDict):
+        executionContextId: int
+        executionContextUniqueId: str
+
+
+    class _InspectRequestedJSON(typing.TypedDict):
+        object: RemoteObjectJSON
+        hints: dict
+
+
+    class InspectRequestedJSON(_InspectRequestedJSON, total=False):
+        executionContextId: int
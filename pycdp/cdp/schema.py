@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -30,21 +29,31 @@ class Domain:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Domain:
+    def from_json(cls, json: DomainJSON) -> Domain:
         return cls(
-            name=str(json['name']),
-            version=str(json['version']),
+            name=json['name'],
+            version=json['version'],
         )
 
 
-def get_domains() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Domain]]:
+def _parse_get_domains(json: GetDomainsReturnsJSON) -> typing.List[Domain]:
+    return [Domain.from_json(i) for i in json['domains']]
+
+
+def get_domains() -> Command[GetDomainsReturnsJSON, typing.List[Domain]]:
     '''
     Returns supported domains.
 
     :returns: List of supported domains.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Schema.getDomains',
-    }
-    json = yield cmd_dict
-    return [Domain.from_json(i) for i in json['domains']]
+    return Command('Schema.getDomains', None, _parse_get_domains)
+
+
+if typing.TYPE_CHECKING:
+    class DomainJSON(typing.TypedDict):
+        name: str
+        version: str
+
+
+    class GetDomainsReturnsJSON(typing.TypedDict):
+        domains: typing.List[DomainJSON]
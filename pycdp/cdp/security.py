@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import network
+if typing.TYPE_CHECKING:
+    from . import network
+else:
+    network = lazy_import('network', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -44,7 +46,10 @@ class MixedContentType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SecurityState(enum.Enum):
@@ -63,7 +68,10 @@ class SecurityState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecurityState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -130,11 +138,11 @@ class CertificateSecurityState:
         json['protocol'] = self.protocol
         json['keyExchange'] = self.key_exchange
         json['cipher'] = self.cipher
-        json['certificate'] = [i for i in self.certificate]
+        json['certificate'] = list(self.certificate)
         json['subjectName'] = self.subject_name
         json['issuer'] = self.issuer
-        json['validFrom'] = self.valid_from.to_json()
-        json['validTo'] = self.valid_to.to_json()
+        json['validFrom'] = self.valid_from
+        json['validTo'] = self.valid_to
         json['certificateHasWeakSignature'] = self.certificate_has_weak_signature
         json['certificateHasSha1Signature'] = self.certificate_has_sha1_signature
         json['modernSSL'] = self.modern_ssl
@@ -151,26 +159,26 @@ class CertificateSecurityState:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CertificateSecurityState:
+    def from_json(cls, json: CertificateSecurityStateJSON) -> CertificateSecurityState:
         return cls(
-            protocol=str(json['protocol']),
-            key_exchange=str(json['keyExchange']),
-            cipher=str(json['cipher']),
-            certificate=[str(i) for i in json['certificate']],
-            subject_name=str(json['subjectName']),
-            issuer=str(json['issuer']),
-            valid_from=network.TimeSinceEpoch.from_json(json['validFrom']),
-            valid_to=network.TimeSinceEpoch.from_json(json['validTo']),
-            certificate_has_weak_signature=bool(json['certificateHasWeakSignature']),
-            certificate_has_sha1_signature=bool(json['certificateHasSha1Signature']),
-            modern_ssl=bool(json['modernSSL']),
-            obsolete_ssl_protocol=bool(json['obsoleteSslProtocol']),
-            obsolete_ssl_key_exchange=bool(json['obsoleteSslKeyExchange']),
-            obsolete_ssl_cipher=bool(json['obsoleteSslCipher']),
-            obsolete_ssl_signature=bool(json['obsoleteSslSignature']),
-            key_exchange_group=str(json['keyExchangeGroup']) if json.get('keyExchangeGroup', None) is not None else None,
-            mac=str(json['mac']) if json.get('mac', None) is not None else None,
-            certificate_network_error=str(json['certificateNetworkError']) if json.get('certificateNetworkError', None) is not None else None,
+            protocol=json['protocol'],
+            key_exchange=json['keyExchange'],
+            cipher=json['cipher'],
+            certificate=json['certificate'],
+            subject_name=json['subjectName'],
+            issuer=json['issuer'],
+            valid_from=network.TimeSinceEpoch(json['validFrom']),
+            valid_to=network.TimeSinceEpoch(json['validTo']),
+            certificate_has_weak_signature=json['certificateHasWeakSignature'],
+            certificate_has_sha1_signature=json['certificateHasSha1Signature'],
+            modern_ssl=json['modernSSL'],
+            obsolete_ssl_protocol=json['obsoleteSslProtocol'],
+            obsolete_ssl_key_exchange=json['obsoleteSslKeyExchange'],
+            obsolete_ssl_cipher=json['obsoleteSslCipher'],
+            obsolete_ssl_signature=json['obsoleteSslSignature'],
+            key_exchange_group=json.get('keyExchangeGroup'),
+            mac=json.get('mac'),
+            certificate_network_error=json.get('certificateNetworkError'),
         )
 
 
@@ -183,7 +191,10 @@ class SafetyTipStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SafetyTipStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -196,16 +207,16 @@ class SafetyTipInfo:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['safetyTipStatus'] = self.safety_tip_status.to_json()
+        json['safetyTipStatus'] = self.safety_tip_status.value
         if self.safe_url is not None:
             json['safeUrl'] = self.safe_url
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SafetyTipInfo:
+    def from_json(cls, json: SafetyTipInfoJSON) -> SafetyTipInfo:
         return cls(
             safety_tip_status=SafetyTipStatus.from_json(json['safetyTipStatus']),
-            safe_url=str(json['safeUrl']) if json.get('safeUrl', None) is not None else None,
+            safe_url=json.get('safeUrl'),
         )
 
 
@@ -228,8 +239,8 @@ class VisibleSecurityState:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['securityState'] = self.security_state.to_json()
-        json['securityStateIssueIds'] = [i for i in self.security_state_issue_ids]
+        json['securityState'] = self.security_state.value
+        json['securityStateIssueIds'] = list(self.security_state_issue_ids)
         if self.certificate_security_state is not None:
             json['certificateSecurityState'] = self.certificate_security_state.to_json()
         if self.safety_tip_info is not None:
@@ -237,12 +248,12 @@ class VisibleSecurityState:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityState:
+    def from_json(cls, json: VisibleSecurityStateJSON) -> VisibleSecurityState:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
-            security_state_issue_ids=[str(i) for i in json['securityStateIssueIds']],
-            certificate_security_state=CertificateSecurityState.from_json(json['certificateSecurityState']) if json.get('certificateSecurityState', None) is not None else None,
-            safety_tip_info=SafetyTipInfo.from_json(json['safetyTipInfo']) if json.get('safetyTipInfo', None) is not None else None,
+            security_state_issue_ids=json['securityStateIssueIds'],
+            certificate_security_state=CertificateSecurityState.from_json(_certificate_security_state) if (_certificate_security_state := json.get('certificateSecurityState')) is not None else None,
+            safety_tip_info=SafetyTipInfo.from_json(_safety_tip_info) if (_safety_tip_info := json.get('safetyTipInfo')) is not None else None,
         )
 
 
@@ -274,26 +285,26 @@ class SecurityStateExplanation:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['securityState'] = self.security_state.to_json()
+        json['securityState'] = self.security_state.value
         json['title'] = self.title
         json['summary'] = self.summary
         json['description'] = self.description
-        json['mixedContentType'] = self.mixed_content_type.to_json()
-        json['certificate'] = [i for i in self.certificate]
+        json['mixedContentType'] = self.mixed_content_type.value
+        json['certificate'] = list(self.certificate)
         if self.recommendations is not None:
-            json['recommendations'] = [i for i in self.recommendations]
+            json['recommendations'] = list(self.recommendations)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SecurityStateExplanation:
+    def from_json(cls, json: SecurityStateExplanationJSON) -> SecurityStateExplanation:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
-            title=str(json['title']),
-            summary=str(json['summary']),
-            description=str(json['description']),
+            title=json['title'],
+            summary=json['summary'],
+            description=json['description'],
             mixed_content_type=MixedContentType.from_json(json['mixedContentType']),
-            certificate=[str(i) for i in json['certificate']],
-            recommendations=[str(i) for i in json['recommendations']] if json.get('recommendations', None) is not None else None,
+            certificate=json['certificate'],
+            recommendations=json.get('recommendations'),
         )
 
 
@@ -330,18 +341,18 @@ class InsecureContentStatus:
         json['containedMixedForm'] = self.contained_mixed_form
         json['ranContentWithCertErrors'] = self.ran_content_with_cert_errors
         json['displayedContentWithCertErrors'] = self.displayed_content_with_cert_errors
-        json['ranInsecureContentStyle'] = self.ran_insecure_content_style.to_json()
-        json['displayedInsecureContentStyle'] = self.displayed_insecure_content_style.to_json()
+        json['ranInsecureContentStyle'] = self.ran_insecure_content_style.value
+        json['displayedInsecureContentStyle'] = self.displayed_insecure_content_style.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InsecureContentStatus:
+    def from_json(cls, json: InsecureContentStatusJSON) -> InsecureContentStatus:
         return cls(
-            ran_mixed_content=bool(json['ranMixedContent']),
-            displayed_mixed_content=bool(json['displayedMixedContent']),
-            contained_mixed_form=bool(json['containedMixedForm']),
-            ran_content_with_cert_errors=bool(json['ranContentWithCertErrors']),
-            displayed_content_with_cert_errors=bool(json['displayedContentWithCertErrors']),
+            ran_mixed_content=json['ranMixedContent'],
+            displayed_mixed_content=json['displayedMixedContent'],
+            contained_mixed_form=json['containedMixedForm'],
+            ran_content_with_cert_errors=json['ranContentWithCertErrors'],
+            displayed_content_with_cert_errors=json['displayedContentWithCertErrors'],
             ran_insecure_content_style=SecurityState.from_json(json['ranInsecureContentStyle']),
             displayed_insecure_content_style=SecurityState.from_json(json['displayedInsecureContentStyle']),
         )
@@ -360,32 +371,29 @@ class CertificateErrorAction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateErrorAction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables tracking security state changes.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Security.disable',
-    }
-    json = yield cmd_dict
+    return Command('Security.disable')
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables tracking security state changes.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Security.enable',
-    }
-    json = yield cmd_dict
+    return Command('Security.enable')
 
 
 def set_ignore_certificate_errors(
         ignore: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable/disable whether all certificate errors should be ignored.
 
@@ -393,18 +401,14 @@ def set_ignore_certificate_errors(
     '''
     params: T_JSON_DICT = dict()
     params['ignore'] = ignore
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Security.setIgnoreCertificateErrors',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Security.setIgnoreCertificateErrors', params)
 
 
 @deprecated(version="1.3")
 def handle_certificate_error(
         event_id: int,
         action: CertificateErrorAction
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Handles a certificate error that fired a certificateError event.
 
@@ -415,18 +419,14 @@ def handle_certificate_error(
     '''
     params: T_JSON_DICT = dict()
     params['eventId'] = event_id
-    params['action'] = action.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Security.handleCertificateError',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['action'] = action.value
+    return Command('Security.handleCertificateError', params)
 
 
 @deprecated(version="1.3")
 def set_override_certificate_errors(
         override: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable/disable overriding certificate errors. If enabled, all certificate error events need to
     be handled by the DevTools client and should be answered with ``handleCertificateError`` commands.
@@ -437,11 +437,7 @@ def set_override_certificate_errors(
     '''
     params: T_JSON_DICT = dict()
     params['override'] = override
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Security.setOverrideCertificateErrors',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Security.setOverrideCertificateErrors', params)
 
 
 @deprecated(version="1.3")
@@ -462,11 +458,11 @@ class CertificateError:
     request_url: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CertificateError:
+    def from_json(cls, json: CertificateErrorJSON) -> CertificateError:
         return cls(
-            event_id=int(json['eventId']),
-            error_type=str(json['errorType']),
-            request_url=str(json['requestURL'])
+            event_id=json['eventId'],
+            error_type=json['errorType'],
+            request_url=json['requestURL']
         )
 
 
@@ -482,7 +478,7 @@ class VisibleSecurityStateChanged:
     visible_security_state: VisibleSecurityState
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityStateChanged:
+    def from_json(cls, json: VisibleSecurityStateChangedJSON) -> VisibleSecurityStateChanged:
         return cls(
             visible_security_state=VisibleSecurityState.from_json(json['visibleSecurityState'])
         )
@@ -508,11 +504,98 @@ class SecurityStateChanged:
     summary: typing.Optional[str]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SecurityStateChanged:
+    def from_json(cls, json: SecurityStateChangedJSON) -> SecurityStateChanged:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
-            scheme_is_cryptographic=bool(json['schemeIsCryptographic']),
+            scheme_is_cryptographic=json['schemeIsCryptographic'],
             explanations=[SecurityStateExplanation.from_json(i) for i in json['explanations']],
             insecure_content_status=InsecureContentStatus.from_json(json['insecureContentStatus']),
-            summary=str(json['summary']) if json.get('summary', None) is not None else None
+            summary=json.get('summary')
         )
+
+
+if typing.TYPE_CHECKING:
+    class _CertificateSecurityStateJSON(typing.TypedDict):
+        protocol: str
+        keyExchange: str
+        cipher: str
+        certificate: typing.List[str]
+        subjectName: str
+        issuer: str
+        validFrom: float
+        validTo: float
+        certificateHasWeakSignature: bool
+        certificateHasSha1Signature: bool
+        modernSSL: bool
+        obsoleteSslProtocol: bool
+        obsoleteSslKeyExchange: bool
+        obsoleteSslCipher: bool
+        obsoleteSslSignature: bool
+
+
+    class CertificateSecurityStateJSON(_CertificateSecurityStateJSON, total=False):
+        keyExchangeGroup: str
+        mac: str
+        certificateNetworkError: str
+
+
+    class _SafetyTipInfoJSON(typing.TypedDict):
+        safetyTipStatus: str
+
+
+    class SafetyTipInfoJSON(_SafetyTipInfoJSON, total=False):
+        safeUrl: str
+
+
+    class _VisibleSecurityStateJSON(typing.TypedDict):
+        securityState: str
+        securityStateIssueIds: typing.List[str]
+
+
+    class VisibleSecurityStateJSON(_VisibleSecurityStateJSON, total=False):
+        certificateSecurityState: CertificateSecurityStateJSON
+        safetyTipInfo: SafetyTipInfoJSON
+
+
+    class _SecurityStateExplanationJSON(typing.TypedDict):
+        securityState: str
+        title: str
+        summary: str
+        description: str
+        mixedContentType: str
+        certificate: typing.List[str]
+
+
+    class SecurityStateExplanationJSON(_SecurityStateExplanationJSON, total=False):
+        recommendations: typing.List[str]
+
+
+    class InsecureContentStatusJSON(typing.TypedDict):
+        ranMixedContent: bool
+        displayedMixedContent: bool
+        containedMixedForm: bool
+        ranContentWithCertErrors: bool
+        displayedContentWithCertErrors: bool
+        ranInsecureContentStyle: str
+        displayedInsecureContentStyle: str
+
+
+    class CertificateErrorJSON(typing.TypedDict):
+        eventId: int
+        errorType: str
+        requestURL: str
+
+
+    class VisibleSecurityStateChangedJSON(typing.TypedDict):
+        visibleSecurityState: VisibleSecurityStateJSON
+
+
+    class _SecurityStateChangedJSON(typing.TypedDict):
+        securityState: str
+        schemeIsCryptographic: bool
+        explanations: typing.List[SecurityStateExplanationJSON]
+        insecureContentStatus: InsecureContentStatusJSON
+
+
+    class SecurityStateChangedJSON(_SecurityStateChangedJSON, total=False):
+        summary: str
@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import target
+if typing.TYPE_CHECKING:
+    from . import target
+else:
+    target = lazy_import('target', globals())
 
 
 class RegistrationID(str):
@@ -39,17 +41,17 @@ class ServiceWorkerRegistration:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['registrationId'] = self.registration_id.to_json()
+        json['registrationId'] = self.registration_id
         json['scopeURL'] = self.scope_url
         json['isDeleted'] = self.is_deleted
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRegistration:
+    def from_json(cls, json: ServiceWorkerRegistrationJSON) -> ServiceWorkerRegistration:
         return cls(
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            scope_url=str(json['scopeURL']),
-            is_deleted=bool(json['isDeleted']),
+            registration_id=RegistrationID(json['registrationId']),
+            scope_url=json['scopeURL'],
+            is_deleted=json['isDeleted'],
         )
 
 
@@ -64,7 +66,10 @@ class ServiceWorkerVersionRunningStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionRunningStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ServiceWorkerVersionStatus(enum.Enum):
@@ -80,7 +85,10 @@ class ServiceWorkerVersionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -114,35 +122,35 @@ class ServiceWorkerVersion:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['versionId'] = self.version_id
-        json['registrationId'] = self.registration_id.to_json()
+        json['registrationId'] = self.registration_id
         json['scriptURL'] = self.script_url
-        json['runningStatus'] = self.running_status.to_json()
-        json['status'] = self.status.to_json()
+        json['runningStatus'] = self.running_status.value
+        json['status'] = self.status.value
         if self.script_last_modified is not None:
             json['scriptLastModified'] = self.script_last_modified
         if self.script_response_time is not None:
             json['scriptResponseTime'] = self.script_response_time
         if self.controlled_clients is not None:
-            json['controlledClients'] = [i.to_json() for i in self.controlled_clients]
+            json['controlledClients'] = list(self.controlled_clients)
         if self.target_id is not None:
-            json['targetId'] = self.target_id.to_json()
+            json['targetId'] = self.target_id
         if self.router_rules is not None:
             json['routerRules'] = self.router_rules
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerVersion:
+    def from_json(cls, json: ServiceWorkerVersionJSON) -> ServiceWorkerVersion:
         return cls(
-            version_id=str(json['versionId']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            script_url=str(json['scriptURL']),
+            version_id=json['versionId'],
+            registration_id=RegistrationID(json['registrationId']),
+            script_url=json['scriptURL'],
             running_status=ServiceWorkerVersionRunningStatus.from_json(json['runningStatus']),
             status=ServiceWorkerVersionStatus.from_json(json['status']),
-            script_last_modified=float(json['scriptLastModified']) if json.get('scriptLastModified', None) is not None else None,
-            script_response_time=float(json['scriptResponseTime']) if json.get('scriptResponseTime', None) is not None else None,
-            controlled_clients=[target.TargetID.from_json(i) for i in json['controlledClients']] if json.get('controlledClients', None) is not None else None,
-            target_id=target.TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None,
-            router_rules=str(json['routerRules']) if json.get('routerRules', None) is not None else None,
+            script_last_modified=float(_script_last_modified) if (_script_last_modified := json.get('scriptLastModified')) is not None else None,
+            script_response_time=float(_script_response_time) if (_script_response_time := json.get('scriptResponseTime')) is not None else None,
+            controlled_clients=[target.TargetID(i) for i in _controlled_clients] if (_controlled_clients := json.get('controlledClients')) is not None else None,
+            target_id=target.TargetID(_target_id) if (_target_id := json.get('targetId')) is not None else None,
+            router_rules=json.get('routerRules'),
         )
 
 
@@ -166,7 +174,7 @@ class ServiceWorkerErrorMessage:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['errorMessage'] = self.error_message
-        json['registrationId'] = self.registration_id.to_json()
+        json['registrationId'] = self.registration_id
         json['versionId'] = self.version_id
         json['sourceURL'] = self.source_url
         json['lineNumber'] = self.line_number
@@ -174,14 +182,14 @@ class ServiceWorkerErrorMessage:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerErrorMessage:
+    def from_json(cls, json: ServiceWorkerErrorMessageJSON) -> ServiceWorkerErrorMessage:
         return cls(
-            error_message=str(json['errorMessage']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            version_id=str(json['versionId']),
-            source_url=str(json['sourceURL']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            error_message=json['errorMessage'],
+            registration_id=RegistrationID(json['registrationId']),
+            version_id=json['versionId'],
+            source_url=json['sourceURL'],
+            line_number=json['lineNumber'],
+            column_number=json['columnNumber'],
         )
 
 
@@ -189,7 +197,7 @@ def deliver_push_message(
         origin: str,
         registration_id: RegistrationID,
         data: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param origin:
     :param registration_id:
@@ -197,21 +205,14 @@ def deliver_push_message(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
+    params['registrationId'] = registration_id
     params['data'] = data
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.deliverPushMessage',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.deliverPushMessage', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.disable',
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.disable')
 
 
 def dispatch_sync_event(
@@ -219,7 +220,7 @@ def dispatch_sync_event(
         registration_id: RegistrationID,
         tag: str,
         last_chance: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param origin:
     :param registration_id:
@@ -228,21 +229,17 @@ def dispatch_sync_event(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
+    params['registrationId'] = registration_id
     params['tag'] = tag
     params['lastChance'] = last_chance
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.dispatchSyncEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.dispatchSyncEvent', params)
 
 
 def dispatch_periodic_sync_event(
         origin: str,
         registration_id: RegistrationID,
         tag: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param origin:
     :param registration_id:
@@ -250,134 +247,96 @@ def dispatch_periodic_sync_event(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
+    params['registrationId'] = registration_id
     params['tag'] = tag
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.dispatchPeriodicSyncEvent',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.dispatchPeriodicSyncEvent', params)
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.enable',
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.enable')
 
 
 def inspect_worker(
         version_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param version_id:
     '''
     params: T_JSON_DICT = dict()
     params['versionId'] = version_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.inspectWorker',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.inspectWorker', params)
 
 
 def set_force_update_on_page_load(
         force_update_on_page_load: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param force_update_on_page_load:
     '''
     params: T_JSON_DICT = dict()
     params['forceUpdateOnPageLoad'] = force_update_on_page_load
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.setForceUpdateOnPageLoad',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.setForceUpdateOnPageLoad', params)
 
 
 def skip_waiting(
         scope_url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param scope_url:
     '''
     params: T_JSON_DICT = dict()
     params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.skipWaiting',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.skipWaiting', params)
 
 
 def start_worker(
         scope_url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param scope_url:
     '''
     params: T_JSON_DICT = dict()
     params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.startWorker',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.startWorker', params)
 
 
-def stop_all_workers() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def stop_all_workers() -> Command[T_JSON_DICT, None]:
 
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.stopAllWorkers',
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.stopAllWorkers')
 
 
 def stop_worker(
         version_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param version_id:
     '''
     params: T_JSON_DICT = dict()
     params['versionId'] = version_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.stopWorker',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.stopWorker', params)
 
 
 def unregister(
         scope_url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param scope_url:
     '''
     params: T_JSON_DICT = dict()
     params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.unregister',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.unregister', params)
 
 
 def update_registration(
         scope_url: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     :param scope_url:
     '''
     params: T_JSON_DICT = dict()
     params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
-        'method': 'ServiceWorker.updateRegistration',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('ServiceWorker.updateRegistration', params)
 
 
 @event_class('ServiceWorker.workerErrorReported')
@@ -386,7 +345,7 @@ class WorkerErrorReported:
     error_message: ServiceWorkerErrorMessage
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WorkerErrorReported:
+    def from_json(cls, json: WorkerErrorReportedJSON) -> WorkerErrorReported:
         return cls(
             error_message=ServiceWorkerErrorMessage.from_json(json['errorMessage'])
         )
@@ -398,7 +357,7 @@ class WorkerRegistrationUpdated:
     registrations: typing.List[ServiceWorkerRegistration]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WorkerRegistrationUpdated:
+    def from_json(cls, json: WorkerRegistrationUpdatedJSON) -> WorkerRegistrationUpdated:
         return cls(
             registrations=[ServiceWorkerRegistration.from_json(i) for i in json['registrations']]
         )
@@ -410,7 +369,51 @@ class WorkerVersionUpdated:
     versions: typing.List[ServiceWorkerVersion]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> WorkerVersionUpdated:
+    def from_json(cls, json: WorkerVersionUpdatedJSON) -> WorkerVersionUpdated:
         return cls(
             versions=[ServiceWorkerVersion.from_json(i) for i in json['versions']]
         )
+
+
+if typing.TYPE_CHECKING:
+    class ServiceWorkerRegistrationJSON(typing.TypedDict):
+        registrationId: str
+        scopeURL: str
+        isDeleted: bool
+
+
+    class _ServiceWorkerVersionJSON(typing.TypedDict):
+        versionId: str
+        registrationId: str
+        scriptURL: str
+        runningStatus: str
+        status: str
+
+
+    class ServiceWorkerVersionJSON(_ServiceWorkerVersionJSON, total=False):
+        scriptLastModified: float
+        scriptResponseTime: float
+        controlledClients: typing.List[str]
+        targetId: str
+        routerRules: str
+
+
+    class ServiceWorkerErrorMessageJSON(typing.TypedDict):
+        errorMessage: str
+        registrationId: str
+        versionId: str
+        sourceURL: str
+        lineNumber: int
+        columnNumber: int
+
+
+    class WorkerErrorReportedJSON(typing.TypedDict):
+        errorMessage: ServiceWorkerErrorMessageJSON
+
+
+    class WorkerRegistrationUpdatedJSON(typing.TypedDict):
+        registrations: typing.List[ServiceWorkerRegistrationJSON]
+
+
+    class WorkerVersionUpdatedJSON(typing.TypedDict):
+        versions: typing.List[ServiceWorkerVersionJSON]
@@ -8,12 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import browser
-from . import network
-from . import page
+if typing.TYPE_CHECKING:
+    from . import browser
+    from . import network
+    from . import page
+else:
+    browser = lazy_import('browser', globals())
+    network = lazy_import('network', globals())
+    page = lazy_import('page', globals())
 
 
 class SerializedStorageKey(str):
@@ -51,7 +55,10 @@ class StorageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -67,12 +74,12 @@ class UsageForType:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['storageType'] = self.storage_type.to_json()
+        json['storageType'] = self.storage_type.value
         json['usage'] = self.usage
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> UsageForType:
+    def from_json(cls, json: UsageForTypeJSON) -> UsageForType:
         return cls(
             storage_type=StorageType.from_json(json['storageType']),
             usage=float(json['usage']),
@@ -96,9 +103,9 @@ class TrustTokens:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TrustTokens:
+    def from_json(cls, json: TrustTokensJSON) -> TrustTokens:
         return cls(
-            issuer_origin=str(json['issuerOrigin']),
+            issuer_origin=json['issuerOrigin'],
             count=float(json['count']),
         )
 
@@ -139,7 +146,10 @@ class InterestGroupAccessType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAccessType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class InterestGroupAuctionEventType(enum.Enum):
@@ -154,7 +164,10 @@ class InterestGroupAuctionEventType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAuctionEventType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class InterestGroupAuctionFetchType(enum.Enum):
@@ -172,7 +185,10 @@ class InterestGroupAuctionFetchType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAuctionFetchType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class SharedStorageAccessType(enum.Enum):
@@ -206,7 +222,10 @@ class SharedStorageAccessType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedStorageAccessType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -225,10 +244,10 @@ class SharedStorageEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageEntry:
+    def from_json(cls, json: SharedStorageEntryJSON) -> SharedStorageEntry:
         return cls(
-            key=str(json['key']),
-            value=str(json['value']),
+            key=json['key'],
+            value=json['value'],
         )
 
 
@@ -252,19 +271,19 @@ class SharedStorageMetadata:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['creationTime'] = self.creation_time.to_json()
+        json['creationTime'] = self.creation_time
         json['length'] = self.length
         json['remainingBudget'] = self.remaining_budget
         json['bytesUsed'] = self.bytes_used
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageMetadata:
+    def from_json(cls, json: SharedStorageMetadataJSON) -> SharedStorageMetadata:
         return cls(
-            creation_time=network.TimeSinceEpoch.from_json(json['creationTime']),
-            length=int(json['length']),
+            creation_time=network.TimeSinceEpoch(json['creationTime']),
+            length=json['length'],
             remaining_budget=float(json['remainingBudget']),
-            bytes_used=int(json['bytesUsed']),
+            bytes_used=json['bytesUsed'],
         )
 
 
@@ -284,10 +303,10 @@ class SharedStorageReportingMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageReportingMetadata:
+    def from_json(cls, json: SharedStorageReportingMetadataJSON) -> SharedStorageReportingMetadata:
         return cls(
-            event_type=str(json['eventType']),
-            reporting_url=str(json['reportingUrl']),
+            event_type=json['eventType'],
+            reporting_url=json['reportingUrl'],
         )
 
 
@@ -309,9 +328,9 @@ class SharedStorageUrlWithMetadata:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageUrlWithMetadata:
+    def from_json(cls, json: SharedStorageUrlWithMetadataJSON) -> SharedStorageUrlWithMetadata:
         return cls(
-            url=str(json['url']),
+            url=json['url'],
             reporting_metadata=[SharedStorageReportingMetadata.from_json(i) for i in json['reportingMetadata']],
         )
 
@@ -387,15 +406,15 @@ class SharedStorageAccessParams:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessParams:
+    def from_json(cls, json: SharedStorageAccessParamsJSON) -> SharedStorageAccessParams:
         return cls(
-            script_source_url=str(json['scriptSourceUrl']) if json.get('scriptSourceUrl', None) is not None else None,
-            operation_name=str(json['operationName']) if json.get('operationName', None) is not None else None,
-            serialized_data=str(json['serializedData']) if json.get('serializedData', None) is not None else None,
-            urls_with_metadata=[SharedStorageUrlWithMetadata.from_json(i) for i in json['urlsWithMetadata']] if json.get('urlsWithMetadata', None) is not None else None,
-            key=str(json['key']) if json.get('key', None) is not None else None,
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            ignore_if_present=bool(json['ignoreIfPresent']) if json.get('ignoreIfPresent', None) is not None else None,
+            script_source_url=json.get('scriptSourceUrl'),
+            operation_name=json.get('operationName'),
+            serialized_data=json.get('serializedData'),
+            urls_with_metadata=[SharedStorageUrlWithMetadata.from_json(i) for i in _urls_with_metadata] if (_urls_with_metadata := json.get('urlsWithMetadata')) is not None else None,
+            key=json.get('key'),
+            value=json.get('value'),
+            ignore_if_present=json.get('ignoreIfPresent'),
         )
 
 
@@ -408,7 +427,10 @@ class StorageBucketsDurability(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageBucketsDurability:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -420,16 +442,16 @@ class StorageBucket:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['storageKey'] = self.storage_key.to_json()
+        json['storageKey'] = self.storage_key
         if self.name is not None:
             json['name'] = self.name
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StorageBucket:
+    def from_json(cls, json: StorageBucketJSON) -> StorageBucket:
         return cls(
-            storage_key=SerializedStorageKey.from_json(json['storageKey']),
-            name=str(json['name']) if json.get('name', None) is not None else None,
+            storage_key=SerializedStorageKey(json['storageKey']),
+            name=json.get('name'),
         )
 
 
@@ -452,20 +474,20 @@ class StorageBucketInfo:
         json: T_JSON_DICT = dict()
         json['bucket'] = self.bucket.to_json()
         json['id'] = self.id_
-        json['expiration'] = self.expiration.to_json()
+        json['expiration'] = self.expiration
         json['quota'] = self.quota
         json['persistent'] = self.persistent
-        json['durability'] = self.durability.to_json()
+        json['durability'] = self.durability.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StorageBucketInfo:
+    def from_json(cls, json: StorageBucketInfoJSON) -> StorageBucketInfo:
         return cls(
             bucket=StorageBucket.from_json(json['bucket']),
-            id_=str(json['id']),
-            expiration=network.TimeSinceEpoch.from_json(json['expiration']),
+            id_=json['id'],
+            expiration=network.TimeSinceEpoch(json['expiration']),
             quota=float(json['quota']),
-            persistent=bool(json['persistent']),
+            persistent=json['persistent'],
             durability=StorageBucketsDurability.from_json(json['durability']),
         )
 
@@ -479,7 +501,10 @@ class AttributionReportingSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class UnsignedInt64AsBase10(str):
@@ -527,14 +552,14 @@ class AttributionReportingFilterDataEntry:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['key'] = self.key
-        json['values'] = [i for i in self.values]
+        json['values'] = list(self.values)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterDataEntry:
+    def from_json(cls, json: AttributionReportingFilterDataEntryJSON) -> AttributionReportingFilterDataEntry:
         return cls(
-            key=str(json['key']),
-            values=[str(i) for i in json['values']],
+            key=json['key'],
+            values=json['values'],
         )
 
 
@@ -553,10 +578,10 @@ class AttributionReportingFilterConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterConfig:
+    def from_json(cls, json: AttributionReportingFilterConfigJSON) -> AttributionReportingFilterConfig:
         return cls(
             filter_values=[AttributionReportingFilterDataEntry.from_json(i) for i in json['filterValues']],
-            lookback_window=int(json['lookbackWindow']) if json.get('lookbackWindow', None) is not None else None,
+            lookback_window=json.get('lookbackWindow'),
         )
 
 
@@ -573,7 +598,7 @@ class AttributionReportingFilterPair:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterPair:
+    def from_json(cls, json: AttributionReportingFilterPairJSON) -> AttributionReportingFilterPair:
         return cls(
             filters=[AttributionReportingFilterConfig.from_json(i) for i in json['filters']],
             not_filters=[AttributionReportingFilterConfig.from_json(i) for i in json['notFilters']],
@@ -589,14 +614,14 @@ class AttributionReportingAggregationKeysEntry:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['key'] = self.key
-        json['value'] = self.value.to_json()
+        json['value'] = self.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregationKeysEntry:
+    def from_json(cls, json: AttributionReportingAggregationKeysEntryJSON) -> AttributionReportingAggregationKeysEntry:
         return cls(
-            key=str(json['key']),
-            value=UnsignedInt128AsBase16.from_json(json['value']),
+            key=json['key'],
+            value=UnsignedInt128AsBase16(json['value']),
         )
 
 
@@ -611,14 +636,14 @@ class AttributionReportingEventReportWindows:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['start'] = self.start
-        json['ends'] = [i for i in self.ends]
+        json['ends'] = list(self.ends)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventReportWindows:
+    def from_json(cls, json: AttributionReportingEventReportWindowsJSON) -> AttributionReportingEventReportWindows:
         return cls(
-            start=int(json['start']),
-            ends=[int(i) for i in json['ends']],
+            start=json['start'],
+            ends=json['ends'],
         )
 
 
@@ -632,12 +657,12 @@ class AttributionReportingTriggerSpec:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['triggerData'] = [i for i in self.trigger_data]
+        json['triggerData'] = list(self.trigger_data)
         json['eventReportWindows'] = self.event_report_windows.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerSpec:
+    def from_json(cls, json: AttributionReportingTriggerSpecJSON) -> AttributionReportingTriggerSpec:
         return cls(
             trigger_data=[float(i) for i in json['triggerData']],
             event_report_windows=AttributionReportingEventReportWindows.from_json(json['eventReportWindows']),
@@ -653,7 +678,10 @@ class AttributionReportingTriggerDataMatching(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingTriggerDataMatching:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -668,17 +696,17 @@ class AttributionReportingAggregatableDebugReportingData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['keyPiece'] = self.key_piece.to_json()
+        json['keyPiece'] = self.key_piece
         json['value'] = self.value
-        json['types'] = [i for i in self.types]
+        json['types'] = list(self.types)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDebugReportingData:
+    def from_json(cls, json: AttributionReportingAggregatableDebugReportingDataJSON) -> AttributionReportingAggregatableDebugReportingData:
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
+            key_piece=UnsignedInt128AsBase16(json['keyPiece']),
             value=float(json['value']),
-            types=[str(i) for i in json['types']],
+            types=json['types'],
         )
 
 
@@ -696,7 +724,7 @@ class AttributionReportingAggregatableDebugReportingConfig:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['keyPiece'] = self.key_piece.to_json()
+        json['keyPiece'] = self.key_piece
         json['debugData'] = [i.to_json() for i in self.debug_data]
         if self.budget is not None:
             json['budget'] = self.budget
@@ -705,12 +733,12 @@ class AttributionReportingAggregatableDebugReportingConfig:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDebugReportingConfig:
+    def from_json(cls, json: AttributionReportingAggregatableDebugReportingConfigJSON) -> AttributionReportingAggregatableDebugReportingConfig:
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
+            key_piece=UnsignedInt128AsBase16(json['keyPiece']),
             debug_data=[AttributionReportingAggregatableDebugReportingData.from_json(i) for i in json['debugData']],
-            budget=float(json['budget']) if json.get('budget', None) is not None else None,
-            aggregation_coordinator_origin=str(json['aggregationCoordinatorOrigin']) if json.get('aggregationCoordinatorOrigin', None) is not None else None,
+            budget=float(_budget) if (_budget := json.get('budget')) is not None else None,
+            aggregation_coordinator_origin=json.get('aggregationCoordinatorOrigin'),
         )
 
 
@@ -726,15 +754,15 @@ class AttributionScopesData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['values'] = [i for i in self.values]
+        json['values'] = list(self.values)
         json['limit'] = self.limit
         json['maxEventStates'] = self.max_event_states
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionScopesData:
+    def from_json(cls, json: AttributionScopesDataJSON) -> AttributionScopesData:
         return cls(
-            values=[str(i) for i in json['values']],
+            values=json['values'],
             limit=float(json['limit']),
             max_event_states=float(json['maxEventStates']),
         )
@@ -782,49 +810,49 @@ class AttributionReportingSourceRegistration:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['time'] = self.time.to_json()
+        json['time'] = self.time
         json['expiry'] = self.expiry
         json['triggerSpecs'] = [i.to_json() for i in self.trigger_specs]
         json['aggregatableReportWindow'] = self.aggregatable_report_window
-        json['type'] = self.type_.to_json()
+        json['type'] = self.type_.value
         json['sourceOrigin'] = self.source_origin
         json['reportingOrigin'] = self.reporting_origin
-        json['destinationSites'] = [i for i in self.destination_sites]
-        json['eventId'] = self.event_id.to_json()
-        json['priority'] = self.priority.to_json()
+        json['destinationSites'] = list(self.destination_sites)
+        json['eventId'] = self.event_id
+        json['priority'] = self.priority
         json['filterData'] = [i.to_json() for i in self.filter_data]
         json['aggregationKeys'] = [i.to_json() for i in self.aggregation_keys]
-        json['triggerDataMatching'] = self.trigger_data_matching.to_json()
-        json['destinationLimitPriority'] = self.destination_limit_priority.to_json()
+        json['triggerDataMatching'] = self.trigger_data_matching.value
+        json['destinationLimitPriority'] = self.destination_limit_priority
         json['aggregatableDebugReportingConfig'] = self.aggregatable_debug_reporting_config.to_json()
         json['maxEventLevelReports'] = self.max_event_level_reports
         if self.debug_key is not None:
-            json['debugKey'] = self.debug_key.to_json()
+            json['debugKey'] = self.debug_key
         if self.scopes_data is not None:
             json['scopesData'] = self.scopes_data.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistration:
+    def from_json(cls, json: AttributionReportingSourceRegistrationJSON) -> AttributionReportingSourceRegistration:
         return cls(
-            time=network.TimeSinceEpoch.from_json(json['time']),
-            expiry=int(json['expiry']),
+            time=network.TimeSinceEpoch(json['time']),
+            expiry=json['expiry'],
             trigger_specs=[AttributionReportingTriggerSpec.from_json(i) for i in json['triggerSpecs']],
-            aggregatable_report_window=int(json['aggregatableReportWindow']),
+            aggregatable_report_window=json['aggregatableReportWindow'],
             type_=AttributionReportingSourceType.from_json(json['type']),
-            source_origin=str(json['sourceOrigin']),
-            reporting_origin=str(json['reportingOrigin']),
-            destination_sites=[str(i) for i in json['destinationSites']],
-            event_id=UnsignedInt64AsBase10.from_json(json['eventId']),
-            priority=SignedInt64AsBase10.from_json(json['priority']),
+            source_origin=json['sourceOrigin'],
+            reporting_origin=json['reportingOrigin'],
+            destination_sites=json['destinationSites'],
+            event_id=UnsignedInt64AsBase10(json['eventId']),
+            priority=SignedInt64AsBase10(json['priority']),
             filter_data=[AttributionReportingFilterDataEntry.from_json(i) for i in json['filterData']],
             aggregation_keys=[AttributionReportingAggregationKeysEntry.from_json(i) for i in json['aggregationKeys']],
             trigger_data_matching=AttributionReportingTriggerDataMatching.from_json(json['triggerDataMatching']),
-            destination_limit_priority=SignedInt64AsBase10.from_json(json['destinationLimitPriority']),
+            destination_limit_priority=SignedInt64AsBase10(json['destinationLimitPriority']),
             aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
-            max_event_level_reports=int(json['maxEventLevelReports']),
-            debug_key=UnsignedInt64AsBase10.from_json(json['debugKey']) if json.get('debugKey', None) is not None else None,
-            scopes_data=AttributionScopesData.from_json(json['scopesData']) if json.get('scopesData', None) is not None else None,
+            max_event_level_reports=json['maxEventLevelReports'],
+            debug_key=UnsignedInt64AsBase10(_debug_key) if (_debug_key := json.get('debugKey')) is not None else None,
+            scopes_data=AttributionScopesData.from_json(_scopes_data) if (_scopes_data := json.get('scopesData')) is not None else None,
         )
 
 
@@ -851,7 +879,10 @@ class AttributionReportingSourceRegistrationResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceRegistrationResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AttributionReportingSourceRegistrationTimeConfig(enum.Enum):
@@ -863,7 +894,10 @@ class AttributionReportingSourceRegistrationTimeConfig(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceRegistrationTimeConfig:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -880,15 +914,15 @@ class AttributionReportingAggregatableValueDictEntry:
         json: T_JSON_DICT = dict()
         json['key'] = self.key
         json['value'] = self.value
-        json['filteringId'] = self.filtering_id.to_json()
+        json['filteringId'] = self.filtering_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableValueDictEntry:
+    def from_json(cls, json: AttributionReportingAggregatableValueDictEntryJSON) -> AttributionReportingAggregatableValueDictEntry:
         return cls(
-            key=str(json['key']),
+            key=json['key'],
             value=float(json['value']),
-            filtering_id=UnsignedInt64AsBase10.from_json(json['filteringId']),
+            filtering_id=UnsignedInt64AsBase10(json['filteringId']),
         )
 
 
@@ -905,7 +939,7 @@ class AttributionReportingAggregatableValueEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableValueEntry:
+    def from_json(cls, json: AttributionReportingAggregatableValueEntryJSON) -> AttributionReportingAggregatableValueEntry:
         return cls(
             values=[AttributionReportingAggregatableValueDictEntry.from_json(i) for i in json['values']],
             filters=AttributionReportingFilterPair.from_json(json['filters']),
@@ -924,20 +958,20 @@ class AttributionReportingEventTriggerData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['data'] = self.data.to_json()
-        json['priority'] = self.priority.to_json()
+        json['data'] = self.data
+        json['priority'] = self.priority
         json['filters'] = self.filters.to_json()
         if self.dedup_key is not None:
-            json['dedupKey'] = self.dedup_key.to_json()
+            json['dedupKey'] = self.dedup_key
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventTriggerData:
+    def from_json(cls, json: AttributionReportingEventTriggerDataJSON) -> AttributionReportingEventTriggerData:
         return cls(
-            data=UnsignedInt64AsBase10.from_json(json['data']),
-            priority=SignedInt64AsBase10.from_json(json['priority']),
+            data=UnsignedInt64AsBase10(json['data']),
+            priority=SignedInt64AsBase10(json['priority']),
             filters=AttributionReportingFilterPair.from_json(json['filters']),
-            dedup_key=UnsignedInt64AsBase10.from_json(json['dedupKey']) if json.get('dedupKey', None) is not None else None,
+            dedup_key=UnsignedInt64AsBase10(_dedup_key) if (_dedup_key := json.get('dedupKey')) is not None else None,
         )
 
 
@@ -951,16 +985,16 @@ class AttributionReportingAggregatableTriggerData:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['keyPiece'] = self.key_piece.to_json()
-        json['sourceKeys'] = [i for i in self.source_keys]
+        json['keyPiece'] = self.key_piece
+        json['sourceKeys'] = list(self.source_keys)
         json['filters'] = self.filters.to_json()
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableTriggerData:
+    def from_json(cls, json: AttributionReportingAggregatableTriggerDataJSON) -> AttributionReportingAggregatableTriggerData:
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
-            source_keys=[str(i) for i in json['sourceKeys']],
+            key_piece=UnsignedInt128AsBase16(json['keyPiece']),
+            source_keys=json['sourceKeys'],
             filters=AttributionReportingFilterPair.from_json(json['filters']),
         )
 
@@ -975,14 +1009,14 @@ class AttributionReportingAggregatableDedupKey:
         json: T_JSON_DICT = dict()
         json['filters'] = self.filters.to_json()
         if self.dedup_key is not None:
-            json['dedupKey'] = self.dedup_key.to_json()
+            json['dedupKey'] = self.dedup_key
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDedupKey:
+    def from_json(cls, json: AttributionReportingAggregatableDedupKeyJSON) -> AttributionReportingAggregatableDedupKey:
         return cls(
             filters=AttributionReportingFilterPair.from_json(json['filters']),
-            dedup_key=UnsignedInt64AsBase10.from_json(json['dedupKey']) if json.get('dedupKey', None) is not None else None,
+            dedup_key=UnsignedInt64AsBase10(_dedup_key) if (_dedup_key := json.get('dedupKey')) is not None else None,
         )
 
 
@@ -1023,11 +1057,11 @@ class AttributionReportingTriggerRegistration:
         json['aggregatableValues'] = [i.to_json() for i in self.aggregatable_values]
         json['aggregatableFilteringIdMaxBytes'] = self.aggregatable_filtering_id_max_bytes
         json['debugReporting'] = self.debug_reporting
-        json['sourceRegistrationTimeConfig'] = self.source_registration_time_config.to_json()
+        json['sourceRegistrationTimeConfig'] = self.source_registration_time_config.value
         json['aggregatableDebugReportingConfig'] = self.aggregatable_debug_reporting_config.to_json()
-        json['scopes'] = [i for i in self.scopes]
+        json['scopes'] = list(self.scopes)
         if self.debug_key is not None:
-            json['debugKey'] = self.debug_key.to_json()
+            json['debugKey'] = self.debug_key
         if self.aggregation_coordinator_origin is not None:
             json['aggregationCoordinatorOrigin'] = self.aggregation_coordinator_origin
         if self.trigger_context_id is not None:
@@ -1035,21 +1069,21 @@ class AttributionReportingTriggerRegistration:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistration:
+    def from_json(cls, json: AttributionReportingTriggerRegistrationJSON) -> AttributionReportingTriggerRegistration:
         return cls(
             filters=AttributionReportingFilterPair.from_json(json['filters']),
             aggregatable_dedup_keys=[AttributionReportingAggregatableDedupKey.from_json(i) for i in json['aggregatableDedupKeys']],
             event_trigger_data=[AttributionReportingEventTriggerData.from_json(i) for i in json['eventTriggerData']],
             aggregatable_trigger_data=[AttributionReportingAggregatableTriggerData.from_json(i) for i in json['aggregatableTriggerData']],
             aggregatable_values=[AttributionReportingAggregatableValueEntry.from_json(i) for i in json['aggregatableValues']],
-            aggregatable_filtering_id_max_bytes=int(json['aggregatableFilteringIdMaxBytes']),
-            debug_reporting=bool(json['debugReporting']),
+            aggregatable_filtering_id_max_bytes=json['aggregatableFilteringIdMaxBytes'],
+            debug_reporting=json['debugReporting'],
             source_registration_time_config=AttributionReportingSourceRegistrationTimeConfig.from_json(json['sourceRegistrationTimeConfig']),
             aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
-            scopes=[str(i) for i in json['scopes']],
-            debug_key=UnsignedInt64AsBase10.from_json(json['debugKey']) if json.get('debugKey', None) is not None else None,
-            aggregation_coordinator_origin=str(json['aggregationCoordinatorOrigin']) if json.get('aggregationCoordinatorOrigin', None) is not None else None,
-            trigger_context_id=str(json['triggerContextId']) if json.get('triggerContextId', None) is not None else None,
+            scopes=json['scopes'],
+            debug_key=UnsignedInt64AsBase10(_debug_key) if (_debug_key := json.get('debugKey')) is not None else None,
+            aggregation_coordinator_origin=json.get('aggregationCoordinatorOrigin'),
+            trigger_context_id=json.get('triggerContextId'),
         )
 
 
@@ -1079,7 +1113,10 @@ class AttributionReportingEventLevelResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingEventLevelResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AttributionReportingAggregatableResult(enum.Enum):
@@ -1104,7 +1141,10 @@ class AttributionReportingAggregatableResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingAggregatableResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1123,23 +1163,27 @@ class RelatedWebsiteSet:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['primarySites'] = [i for i in self.primary_sites]
-        json['associatedSites'] = [i for i in self.associated_sites]
-        json['serviceSites'] = [i for i in self.service_sites]
+        json['primarySites'] = list(self.primary_sites)
+        json['associatedSites'] = list(self.associated_sites)
+        json['serviceSites'] = list(self.service_sites)
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RelatedWebsiteSet:
+    def from_json(cls, json: RelatedWebsiteSetJSON) -> RelatedWebsiteSet:
         return cls(
-            primary_sites=[str(i) for i in json['primarySites']],
-            associated_sites=[str(i) for i in json['associatedSites']],
-            service_sites=[str(i) for i in json['serviceSites']],
+            primary_sites=json['primarySites'],
+            associated_sites=json['associatedSites'],
+            service_sites=json['serviceSites'],
         )
 
 
+def _parse_get_storage_key_for_frame(json: GetStorageKeyForFrameReturnsJSON) -> SerializedStorageKey:
+    return SerializedStorageKey(json['storageKey'])
+
+
 def get_storage_key_for_frame(
         frame_id: page.FrameId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SerializedStorageKey]:
+    ) -> Command[GetStorageKeyForFrameReturnsJSON, SerializedStorageKey]:
     '''
     Returns a storage key given a frame id.
 
@@ -1147,19 +1191,14 @@ def get_storage_key_for_frame(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getStorageKeyForFrame',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SerializedStorageKey.from_json(json['storageKey'])
+    params['frameId'] = frame_id
+    return Command('Storage.getStorageKeyForFrame', params, _parse_get_storage_key_for_frame)
 
 
 def clear_data_for_origin(
         origin: str,
         storage_types: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears storage for origin.
 
@@ -1169,17 +1208,13 @@ def clear_data_for_origin(
     params: T_JSON_DICT = dict()
     params['origin'] = origin
     params['storageTypes'] = storage_types
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.clearDataForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.clearDataForOrigin', params)
 
 
 def clear_data_for_storage_key(
         storage_key: str,
         storage_types: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears storage for storage key.
 
@@ -1189,16 +1224,16 @@ def clear_data_for_storage_key(
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
     params['storageTypes'] = storage_types
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.clearDataForStorageKey',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.clearDataForStorageKey', params)
+
+
+def _parse_get_cookies(json: GetCookiesReturnsJSON) -> typing.List[network.Cookie]:
+    return [network.Cookie.from_json(i) for i in json['cookies']]
 
 
 def get_cookies(
         browser_context_id: typing.Optional[browser.BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[network.Cookie]]:
+    ) -> Command[GetCookiesReturnsJSON, typing.List[network.Cookie]]:
     '''
     Returns all browser cookies.
 
@@ -1207,19 +1242,14 @@ def get_cookies(
     '''
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [network.Cookie.from_json(i) for i in json['cookies']]
+        params['browserContextId'] = browser_context_id
+    return Command('Storage.getCookies', params, _parse_get_cookies)
 
 
 def set_cookies(
         cookies: typing.List[network.CookieParam],
         browser_context_id: typing.Optional[browser.BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets given cookies.
 
@@ -1229,17 +1259,13 @@ def set_cookies(
     params: T_JSON_DICT = dict()
     params['cookies'] = [i.to_json() for i in cookies]
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Storage.setCookies', params)
 
 
 def clear_cookies(
         browser_context_id: typing.Optional[browser.BrowserContextID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears cookies.
 
@@ -1247,17 +1273,22 @@ def clear_cookies(
     '''
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.clearCookies',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['browserContextId'] = browser_context_id
+    return Command('Storage.clearCookies', params)
+
+
+def _parse_get_usage_and_quota(json: GetUsageAndQuotaReturnsJSON) -> typing.Tuple[float, float, bool, typing.List[UsageForType]]:
+    return (
+        float(json['usage']),
+        float(json['quota']),
+        json['overrideActive'],
+        [UsageForType.from_json(i) for i in json['usageBreakdown']]
+    )
 
 
 def get_usage_and_quota(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float, bool, typing.List[UsageForType]]]:
+    ) -> Command[GetUsageAndQuotaReturnsJSON, typing.Tuple[float, float, bool, typing.List[UsageForType]]]:
     '''
     Returns usage and quota in bytes.
 
@@ -1271,23 +1302,13 @@ def get_usage_and_quota(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getUsageAndQuota',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        float(json['usage']),
-        float(json['quota']),
-        bool(json['overrideActive']),
-        [UsageForType.from_json(i) for i in json['usageBreakdown']]
-    )
+    return Command('Storage.getUsageAndQuota', params, _parse_get_usage_and_quota)
 
 
 def override_quota_for_origin(
         origin: str,
         quota_size: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Override quota for the specified origin
 
@@ -1300,16 +1321,12 @@ def override_quota_for_origin(
     params['origin'] = origin
     if quota_size is not None:
         params['quotaSize'] = quota_size
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.overrideQuotaForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.overrideQuotaForOrigin', params)
 
 
 def track_cache_storage_for_origin(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Registers origin to be notified when an update occurs to its cache storage list.
 
@@ -1317,16 +1334,12 @@ def track_cache_storage_for_origin(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.trackCacheStorageForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.trackCacheStorageForOrigin', params)
 
 
 def track_cache_storage_for_storage_key(
         storage_key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Registers storage key to be notified when an update occurs to its cache storage list.
 
@@ -1334,16 +1347,12 @@ def track_cache_storage_for_storage_key(
     '''
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.trackCacheStorageForStorageKey',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.trackCacheStorageForStorageKey', params)
 
 
 def track_indexed_db_for_origin(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Registers origin to be notified when an update occurs to its IndexedDB.
 
@@ -1351,16 +1360,12 @@ def track_indexed_db_for_origin(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.trackIndexedDBForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.trackIndexedDBForOrigin', params)
 
 
 def track_indexed_db_for_storage_key(
         storage_key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Registers storage key to be notified when an update occurs to its IndexedDB.
 
@@ -1368,16 +1373,12 @@ def track_indexed_db_for_storage_key(
     '''
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.trackIndexedDBForStorageKey',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.trackIndexedDBForStorageKey', params)
 
 
 def untrack_cache_storage_for_origin(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Unregisters origin from receiving notifications for cache storage.
 
@@ -1385,16 +1386,12 @@ def untrack_cache_storage_for_origin(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.untrackCacheStorageForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.untrackCacheStorageForOrigin', params)
 
 
 def untrack_cache_storage_for_storage_key(
         storage_key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Unregisters storage key from receiving notifications for cache storage.
 
@@ -1402,16 +1399,12 @@ def untrack_cache_storage_for_storage_key(
     '''
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.untrackCacheStorageForStorageKey',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.untrackCacheStorageForStorageKey', params)
 
 
 def untrack_indexed_db_for_origin(
         origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Unregisters origin from receiving notifications for IndexedDB.
 
@@ -1419,16 +1412,12 @@ def untrack_indexed_db_for_origin(
     '''
     params: T_JSON_DICT = dict()
     params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.untrackIndexedDBForOrigin',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.untrackIndexedDBForOrigin', params)
 
 
 def untrack_indexed_db_for_storage_key(
         storage_key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Unregisters storage key from receiving notifications for IndexedDB.
 
@@ -1436,14 +1425,14 @@ def untrack_indexed_db_for_storage_key(
     '''
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.untrackIndexedDBForStorageKey',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.untrackIndexedDBForStorageKey', params)
+
+
+def _parse_get_trust_tokens(json: GetTrustTokensReturnsJSON) -> typing.List[TrustTokens]:
+    return [TrustTokens.from_json(i) for i in json['tokens']]
 
 
-def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[TrustTokens]]:
+def get_trust_tokens() -> Command[GetTrustTokensReturnsJSON, typing.List[TrustTokens]]:
     '''
     Returns the number of stored Trust Tokens per issuer for the
     current browsing context.
@@ -1452,16 +1441,16 @@ def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[T
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getTrustTokens',
-    }
-    json = yield cmd_dict
-    return [TrustTokens.from_json(i) for i in json['tokens']]
+    return Command('Storage.getTrustTokens', None, _parse_get_trust_tokens)
+
+
+def _parse_clear_trust_tokens(json: ClearTrustTokensReturnsJSON) -> bool:
+    return json['didDeleteTokens']
 
 
 def clear_trust_tokens(
         issuer_origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+    ) -> Command[ClearTrustTokensReturnsJSON, bool]:
     '''
     Removes all Trust Tokens issued by the provided issuerOrigin.
     Leaves other stored data, including the issuer's Redemption Records, intact.
@@ -1473,18 +1462,17 @@ def clear_trust_tokens(
     '''
     params: T_JSON_DICT = dict()
     params['issuerOrigin'] = issuer_origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.clearTrustTokens',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return bool(json['didDeleteTokens'])
+    return Command('Storage.clearTrustTokens', params, _parse_clear_trust_tokens)
+
+
+def _parse_get_interest_group_details(json: GetInterestGroupDetailsReturnsJSON) -> dict:
+    return json['details']
 
 
 def get_interest_group_details(
         owner_origin: str,
         name: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
+    ) -> Command[GetInterestGroupDetailsReturnsJSON, dict]:
     '''
     Gets details for a named interest group.
 
@@ -1497,17 +1485,12 @@ def get_interest_group_details(
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
     params['name'] = name
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getInterestGroupDetails',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return dict(json['details'])
+    return Command('Storage.getInterestGroupDetails', params, _parse_get_interest_group_details)
 
 
 def set_interest_group_tracking(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables/Disables issuing of interestGroupAccessed events.
 
@@ -1517,16 +1500,12 @@ def set_interest_group_tracking(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setInterestGroupTracking',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setInterestGroupTracking', params)
 
 
 def set_interest_group_auction_tracking(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables/Disables issuing of interestGroupAuctionEventOccurred and
     interestGroupAuctionNetworkRequestCreated.
@@ -1537,16 +1516,16 @@ def set_interest_group_auction_tracking(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setInterestGroupAuctionTracking',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setInterestGroupAuctionTracking', params)
+
+
+def _parse_get_shared_storage_metadata(json: GetSharedStorageMetadataReturnsJSON) -> SharedStorageMetadata:
+    return SharedStorageMetadata.from_json(json['metadata'])
 
 
 def get_shared_storage_metadata(
         owner_origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SharedStorageMetadata]:
+    ) -> Command[GetSharedStorageMetadataReturnsJSON, SharedStorageMetadata]:
     '''
     Gets metadata for an origin's shared storage.
 
@@ -1557,17 +1536,16 @@ def get_shared_storage_metadata(
     '''
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getSharedStorageMetadata',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SharedStorageMetadata.from_json(json['metadata'])
+    return Command('Storage.getSharedStorageMetadata', params, _parse_get_shared_storage_metadata)
+
+
+def _parse_get_shared_storage_entries(json: GetSharedStorageEntriesReturnsJSON) -> typing.List[SharedStorageEntry]:
+    return [SharedStorageEntry.from_json(i) for i in json['entries']]
 
 
 def get_shared_storage_entries(
         owner_origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[SharedStorageEntry]]:
+    ) -> Command[GetSharedStorageEntriesReturnsJSON, typing.List[SharedStorageEntry]]:
     '''
     Gets the entries in an given origin's shared storage.
 
@@ -1578,12 +1556,7 @@ def get_shared_storage_entries(
     '''
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getSharedStorageEntries',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [SharedStorageEntry.from_json(i) for i in json['entries']]
+    return Command('Storage.getSharedStorageEntries', params, _parse_get_shared_storage_entries)
 
 
 def set_shared_storage_entry(
@@ -1591,7 +1564,7 @@ def set_shared_storage_entry(
         key: str,
         value: str,
         ignore_if_present: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets entry with ``key`` and ``value`` for a given origin's shared storage.
 
@@ -1608,17 +1581,13 @@ def set_shared_storage_entry(
     params['value'] = value
     if ignore_if_present is not None:
         params['ignoreIfPresent'] = ignore_if_present
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setSharedStorageEntry',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setSharedStorageEntry', params)
 
 
 def delete_shared_storage_entry(
         owner_origin: str,
         key: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes entry for ``key`` (if it exists) for a given origin's shared storage.
 
@@ -1630,16 +1599,12 @@ def delete_shared_storage_entry(
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
     params['key'] = key
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.deleteSharedStorageEntry',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.deleteSharedStorageEntry', params)
 
 
 def clear_shared_storage_entries(
         owner_origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears all entries for a given origin's shared storage.
 
@@ -1649,16 +1614,12 @@ def clear_shared_storage_entries(
     '''
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.clearSharedStorageEntries',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.clearSharedStorageEntries', params)
 
 
 def reset_shared_storage_budget(
         owner_origin: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Resets the budget for ``ownerOrigin`` by clearing all budget withdrawals.
 
@@ -1668,16 +1629,12 @@ def reset_shared_storage_budget(
     '''
     params: T_JSON_DICT = dict()
     params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.resetSharedStorageBudget',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.resetSharedStorageBudget', params)
 
 
 def set_shared_storage_tracking(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables/disables issuing of sharedStorageAccessed events.
 
@@ -1687,17 +1644,13 @@ def set_shared_storage_tracking(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setSharedStorageTracking',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setSharedStorageTracking', params)
 
 
 def set_storage_bucket_tracking(
         storage_key: str,
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Set tracking for a storage key's buckets.
 
@@ -1709,16 +1662,12 @@ def set_storage_bucket_tracking(
     params: T_JSON_DICT = dict()
     params['storageKey'] = storage_key
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setStorageBucketTracking',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setStorageBucketTracking', params)
 
 
 def delete_storage_bucket(
         bucket: StorageBucket
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes the Storage Bucket with the given storage key and bucket name.
 
@@ -1728,14 +1677,14 @@ def delete_storage_bucket(
     '''
     params: T_JSON_DICT = dict()
     params['bucket'] = bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.deleteStorageBucket',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.deleteStorageBucket', params)
 
 
-def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+def _parse_run_bounce_tracking_mitigations(json: RunBounceTrackingMitigationsReturnsJSON) -> typing.List[str]:
+    return json['deletedSites']
+
+
+def run_bounce_tracking_mitigations() -> Command[RunBounceTrackingMitigationsReturnsJSON, typing.List[str]]:
     '''
     Deletes state for sites identified as potential bounce trackers, immediately.
 
@@ -1743,16 +1692,12 @@ def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DIC
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.runBounceTrackingMitigations',
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['deletedSites']]
+    return Command('Storage.runBounceTrackingMitigations', None, _parse_run_bounce_tracking_mitigations)
 
 
 def set_attribution_reporting_local_testing_mode(
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     https://wicg.github.io/attribution-reporting-api/
 
@@ -1762,16 +1707,12 @@ def set_attribution_reporting_local_testing_mode(
     '''
     params: T_JSON_DICT = dict()
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setAttributionReportingLocalTestingMode',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setAttributionReportingLocalTestingMode', params)
 
 
 def set_attribution_reporting_tracking(
         enable: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables/disables issuing of Attribution Reporting events.
 
@@ -1781,14 +1722,14 @@ def set_attribution_reporting_tracking(
     '''
     params: T_JSON_DICT = dict()
     params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.setAttributionReportingTracking',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Storage.setAttributionReportingTracking', params)
+
 
+def _parse_send_pending_attribution_reports(json: SendPendingAttributionReportsReturnsJSON) -> int:
+    return json['numSent']
 
-def send_pending_attribution_reports() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,int]:
+
+def send_pending_attribution_reports() -> Command[SendPendingAttributionReportsReturnsJSON, int]:
     '''
     Sends all pending Attribution Reports immediately, regardless of their
     scheduled report time.
@@ -1797,14 +1738,14 @@ def send_pending_attribution_reports() -> typing.Generator[T_JSON_DICT,T_JSON_DI
 
     :returns: The number of reports that were sent.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.sendPendingAttributionReports',
-    }
-    json = yield cmd_dict
-    return int(json['numSent'])
+    return Command('Storage.sendPendingAttributionReports', None, _parse_send_pending_attribution_reports)
+
+
+def _parse_get_related_website_sets(json: GetRelatedWebsiteSetsReturnsJSON) -> typing.List[RelatedWebsiteSet]:
+    return [RelatedWebsiteSet.from_json(i) for i in json['sets']]
 
 
-def get_related_website_sets() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RelatedWebsiteSet]]:
+def get_related_website_sets() -> Command[GetRelatedWebsiteSetsReturnsJSON, typing.List[RelatedWebsiteSet]]:
     '''
     Returns the effective Related Website Sets in use by this profile for the browser
     session. The effective Related Website Sets will not change during a browser session.
@@ -1813,17 +1754,17 @@ def get_related_website_sets() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getRelatedWebsiteSets',
-    }
-    json = yield cmd_dict
-    return [RelatedWebsiteSet.from_json(i) for i in json['sets']]
+    return Command('Storage.getRelatedWebsiteSets', None, _parse_get_related_website_sets)
+
+
+def _parse_get_affected_urls_for_third_party_cookie_metadata(json: GetAffectedUrlsForThirdPartyCookieMetadataReturnsJSON) -> typing.List[str]:
+    return json['matchedUrls']
 
 
 def get_affected_urls_for_third_party_cookie_metadata(
         first_party_url: str,
         third_party_urls: typing.List[str]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+    ) -> Command[GetAffectedUrlsForThirdPartyCookieMetadataReturnsJSON, typing.List[str]]:
     '''
     Returns the list of URLs from a page and its embedded resources that match
     existing grace period URL pattern rules.
@@ -1837,13 +1778,8 @@ def get_affected_urls_for_third_party_cookie_metadata(
     '''
     params: T_JSON_DICT = dict()
     params['firstPartyUrl'] = first_party_url
-    params['thirdPartyUrls'] = [i for i in third_party_urls]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Storage.getAffectedUrlsForThirdPartyCookieMetadata',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['matchedUrls']]
+    params['thirdPartyUrls'] = list(third_party_urls)
+    return Command('Storage.getAffectedUrlsForThirdPartyCookieMetadata', params, _parse_get_affected_urls_for_third_party_cookie_metadata)
 
 
 @event_class('Storage.cacheStorageContentUpdated')
@@ -1862,12 +1798,12 @@ class CacheStorageContentUpdated:
     cache_name: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CacheStorageContentUpdated:
+    def from_json(cls, json: CacheStorageContentUpdatedJSON) -> CacheStorageContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId']),
-            cache_name=str(json['cacheName'])
+            origin=json['origin'],
+            storage_key=json['storageKey'],
+            bucket_id=json['bucketId'],
+            cache_name=json['cacheName']
         )
 
 
@@ -1885,11 +1821,11 @@ class CacheStorageListUpdated:
     bucket_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CacheStorageListUpdated:
+    def from_json(cls, json: CacheStorageListUpdatedJSON) -> CacheStorageListUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId'])
+            origin=json['origin'],
+            storage_key=json['storageKey'],
+            bucket_id=json['bucketId']
         )
 
 
@@ -1911,13 +1847,13 @@ class IndexedDBContentUpdated:
     object_store_name: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IndexedDBContentUpdated:
+    def from_json(cls, json: IndexedDBContentUpdatedJSON) -> IndexedDBContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId']),
-            database_name=str(json['databaseName']),
-            object_store_name=str(json['objectStoreName'])
+            origin=json['origin'],
+            storage_key=json['storageKey'],
+            bucket_id=json['bucketId'],
+            database_name=json['databaseName'],
+            object_store_name=json['objectStoreName']
         )
 
 
@@ -1935,11 +1871,11 @@ class IndexedDBListUpdated:
     bucket_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> IndexedDBListUpdated:
+    def from_json(cls, json: IndexedDBListUpdatedJSON) -> IndexedDBListUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId'])
+            origin=json['origin'],
+            storage_key=json['storageKey'],
+            bucket_id=json['bucketId']
         )
 
 
@@ -1964,16 +1900,16 @@ class InterestGroupAccessed:
     unique_auction_id: typing.Optional[InterestGroupAuctionId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InterestGroupAccessed:
+    def from_json(cls, json: InterestGroupAccessedJSON) -> InterestGroupAccessed:
         return cls(
-            access_time=network.TimeSinceEpoch.from_json(json['accessTime']),
+            access_time=network.TimeSinceEpoch(json['accessTime']),
             type_=InterestGroupAccessType.from_json(json['type']),
-            owner_origin=str(json['ownerOrigin']),
-            name=str(json['name']),
-            component_seller_origin=str(json['componentSellerOrigin']) if json.get('componentSellerOrigin', None) is not None else None,
-            bid=float(json['bid']) if json.get('bid', None) is not None else None,
-            bid_currency=str(json['bidCurrency']) if json.get('bidCurrency', None) is not None else None,
-            unique_auction_id=InterestGroupAuctionId.from_json(json['uniqueAuctionId']) if json.get('uniqueAuctionId', None) is not None else None
+            owner_origin=json['ownerOrigin'],
+            name=json['name'],
+            component_seller_origin=json.get('componentSellerOrigin'),
+            bid=float(_bid) if (_bid := json.get('bid')) is not None else None,
+            bid_currency=json.get('bidCurrency'),
+            unique_auction_id=InterestGroupAuctionId(_unique_auction_id) if (_unique_auction_id := json.get('uniqueAuctionId')) is not None else None
         )
 
 
@@ -1993,13 +1929,13 @@ class InterestGroupAuctionEventOccurred:
     auction_config: typing.Optional[dict]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionEventOccurred:
+    def from_json(cls, json: InterestGroupAuctionEventOccurredJSON) -> InterestGroupAuctionEventOccurred:
         return cls(
-            event_time=network.TimeSinceEpoch.from_json(json['eventTime']),
+            event_time=network.TimeSinceEpoch(json['eventTime']),
             type_=InterestGroupAuctionEventType.from_json(json['type']),
-            unique_auction_id=InterestGroupAuctionId.from_json(json['uniqueAuctionId']),
-            parent_auction_id=InterestGroupAuctionId.from_json(json['parentAuctionId']) if json.get('parentAuctionId', None) is not None else None,
-            auction_config=dict(json['auctionConfig']) if json.get('auctionConfig', None) is not None else None
+            unique_auction_id=InterestGroupAuctionId(json['uniqueAuctionId']),
+            parent_auction_id=InterestGroupAuctionId(_parent_auction_id) if (_parent_auction_id := json.get('parentAuctionId')) is not None else None,
+            auction_config=json.get('auctionConfig')
         )
 
 
@@ -2020,11 +1956,11 @@ class InterestGroupAuctionNetworkRequestCreated:
     auctions: typing.List[InterestGroupAuctionId]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionNetworkRequestCreated:
+    def from_json(cls, json: InterestGroupAuctionNetworkRequestCreatedJSON) -> InterestGroupAuctionNetworkRequestCreated:
         return cls(
             type_=InterestGroupAuctionFetchType.from_json(json['type']),
-            request_id=network.RequestId.from_json(json['requestId']),
-            auctions=[InterestGroupAuctionId.from_json(i) for i in json['auctions']]
+            request_id=network.RequestId(json['requestId']),
+            auctions=[InterestGroupAuctionId(i) for i in json['auctions']]
         )
 
 
@@ -2048,12 +1984,12 @@ class SharedStorageAccessed:
     params: SharedStorageAccessParams
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessed:
+    def from_json(cls, json: SharedStorageAccessedJSON) -> SharedStorageAccessed:
         return cls(
-            access_time=network.TimeSinceEpoch.from_json(json['accessTime']),
+            access_time=network.TimeSinceEpoch(json['accessTime']),
             type_=SharedStorageAccessType.from_json(json['type']),
-            main_frame_id=page.FrameId.from_json(json['mainFrameId']),
-            owner_origin=str(json['ownerOrigin']),
+            main_frame_id=page.FrameId(json['mainFrameId']),
+            owner_origin=json['ownerOrigin'],
             params=SharedStorageAccessParams.from_json(json['params'])
         )
 
@@ -2064,7 +2000,7 @@ class StorageBucketCreatedOrUpdated:
     bucket_info: StorageBucketInfo
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StorageBucketCreatedOrUpdated:
+    def from_json(cls, json: StorageBucketCreatedOrUpdatedJSON) -> StorageBucketCreatedOrUpdated:
         return cls(
             bucket_info=StorageBucketInfo.from_json(json['bucketInfo'])
         )
@@ -2076,9 +2012,9 @@ class StorageBucketDeleted:
     bucket_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> StorageBucketDeleted:
+    def from_json(cls, json: StorageBucketDeletedJSON) -> StorageBucketDeleted:
         return cls(
-            bucket_id=str(json['bucketId'])
+            bucket_id=json['bucketId']
         )
 
 
@@ -2094,7 +2030,7 @@ class AttributionReportingSourceRegistered:
     result: AttributionReportingSourceRegistrationResult
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistered:
+    def from_json(cls, json: AttributionReportingSourceRegisteredJSON) -> AttributionReportingSourceRegistered:
         return cls(
             registration=AttributionReportingSourceRegistration.from_json(json['registration']),
             result=AttributionReportingSourceRegistrationResult.from_json(json['result'])
@@ -2114,9 +2050,344 @@ class AttributionReportingTriggerRegistered:
     aggregatable: AttributionReportingAggregatableResult
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistered:
+    def from_json(cls, json: AttributionReportingTriggerRegisteredJSON) -> AttributionReportingTriggerRegistered:
         return cls(
             registration=AttributionReportingTriggerRegistration.from_json(json['registration']),
             event_level=AttributionReportingEventLevelResult.from_json(json['eventLevel']),
             aggregatable=AttributionReportingAggregatableResult.from_json(json['aggregatable'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class UsageForTypeJSON(typing.TypedDict):
+        storageType: str
+        usage: float
+
+
+    class TrustTokensJSON(typing.TypedDict):
+        issuerOrigin: str
+        count: float
+
+
+    class SharedStorageEntryJSON(typing.TypedDict):
+        key: str
+        value: str
+
+
+    class SharedStorageMetadataJSON(typing.TypedDict):
+        creationTime: float
+        length: int
+        remainingBudget: float
+        bytesUsed: int
+
+
+    class SharedStorageReportingMetadataJSON(typing.TypedDict):
+        eventType: str
+        reportingUrl: str
+
+
+    class SharedStorageUrlWithMetadataJSON(typing.TypedDict):
+        url: str
+        reportingMetadata: typing.List[SharedStorageReportingMetadataJSON]
+
+
+    class SharedStorageAccessParamsJSON(typing.TypedDict, total=False):
+        scriptSourceUrl: str
+        operationName: str
+        serializedData: str
+        urlsWithMetadata: typing.List[SharedStorageUrlWithMetadataJSON]
+        key: str
+        value: str
+        ignoreIfPresent: bool
+
+
+    class _StorageBucketJSON(typing.TypedDict):
+        storageKey: str
+
+
+    class StorageBucketJSON(_StorageBucketJSON, total=False):
+        name: str
+
+
+    class StorageBucketInfoJSON(typing.TypedDict):
+        bucket: StorageBucketJSON
+        id: str
+        expiration: float
+        quota: float
+        persistent: bool
+        durability: str
+
+
+    class AttributionReportingFilterDataEntryJSON(typing.TypedDict):
+        key: str
+        values: typing.List[str]
+
+
+    class _AttributionReportingFilterConfigJSON(typing.TypedDict):
+        filterValues: typing.List[AttributionReportingFilterDataEntryJSON]
+
+
+    class AttributionReportingFilterConfigJSON(_AttributionReportingFilterConfigJSON, total=False):
+        lookbackWindow: int
+
+
+    class AttributionReportingFilterPairJSON(typing.TypedDict):
+        filters: typing.List[AttributionReportingFilterConfigJSON]
+        notFilters: typing.List[AttributionReportingFilterConfigJSON]
+
+
+    class AttributionReportingAggregationKeysEntryJSON(typing.TypedDict):
+        key: str
+        value: str
+
+
+    class AttributionReportingEventReportWindowsJSON(typing.TypedDict):
+        start: int
+        ends: typing.List[int]
+
+
+    class AttributionReportingTriggerSpecJSON(typing.TypedDict):
+        triggerData: typing.List[float]
+        eventReportWindows: AttributionReportingEventReportWindowsJSON
+
+
+    class AttributionReportingAggregatableDebugReportingDataJSON(typing.TypedDict):
+        keyPiece: str
+        value: float
+        types: typing.List[str]
+
+
+    class _AttributionReportingAggregatableDebugReportingConfigJSON(typing.TypedDict):
+        keyPiece: str
+        debugData: typing.List[AttributionReportingAggregatableDebugReportingDataJSON]
+
+
+    class AttributionReportingAggregatableDebugReportingConfigJSON(_AttributionReportingAggregatableDebugReportingConfigJSON, total=False):
+        budget: float
+        aggregationCoordinatorOrigin: str
+
+
+    class AttributionScopesDataJSON(typing.TypedDict):
+        values: typing.List[str]
+        limit: float
+        maxEventStates: float
+
+
+    class _AttributionReportingSourceRegistrationJSON(typing.TypedDict):
+        time: float
+        expiry: int
+        triggerSpecs: typing.List[AttributionReportingTriggerSpecJSON]
+        aggregatableReportWindow: int
+        type: str
+        sourceOrigin: str
+        reportingOrigin: str
+        destinationSites: typing.List[str]
+        eventId: str
+        priority: str
+        filterData: typing.List[AttributionReportingFilterDataEntryJSON]
+        aggregationKeys: typing.List[AttributionReportingAggregationKeysEntryJSON]
+        triggerDataMatching: str
+        destinationLimitPriority: str
+        aggregatableDebugReportingConfig: AttributionReportingAggregatableDebugReportingConfigJSON
+        maxEventLevelReports: int
+
+
+    class AttributionReportingSourceRegistrationJSON(_AttributionReportingSourceRegistrationJSON, total=False):
+        debugKey: str
+        scopesData: AttributionScopesDataJSON
+
+
+    class AttributionReportingAggregatableValueDictEntryJSON(typing.TypedDict):
+        key: str
+        value: float
+        filteringId: str
+
+
+    class AttributionReportingAggregatableValueEntryJSON(typing.TypedDict):
+        values: typing.List[AttributionReportingAggregatableValueDictEntryJSON]
+        filters: AttributionReportingFilterPairJSON
+
+
+    class _AttributionReportingEventTriggerDataJSON(typing.TypedDict):
+        data: str
+        priority: str
+        filters: AttributionReportingFilterPairJSON
+
+
+    class AttributionReportingEventTriggerDataJSON(_AttributionReportingEventTriggerDataJSON, total=False):
+        dedupKey: str
+
+
+    class AttributionReportingAggregatableTriggerDataJSON(typing.TypedDict):
+        keyPiece: str
+        sourceKeys: typing.List[str]
+        filters: AttributionReportingFilterPairJSON
+
+
+    class _AttributionReportingAggregatableDedupKeyJSON(typing.TypedDict):
+        filters: AttributionReportingFilterPairJSON
+
+
+    class AttributionReportingAggregatableDedupKeyJSON(_AttributionReportingAggregatableDedupKeyJSON, total=False):
+        dedupKey: str
+
+
+    class _AttributionReportingTriggerRegistrationJSON(typing.TypedDict):
+        filters: AttributionReportingFilterPairJSON
+        aggregatableDedupKeys: typing.List[AttributionReportingAggregatableDedupKeyJSON]
+        eventTriggerData: typing.List[AttributionReportingEventTriggerDataJSON]
+        aggregatableTriggerData: typing.List[AttributionReportingAggregatableTriggerDataJSON]
+        aggregatableValues: typing.List[AttributionReportingAggregatableValueEntryJSON]
+        aggregatableFilteringIdMaxBytes: int
+        debugReporting: bool
+        sourceRegistrationTimeConfig: str
+        aggregatableDebugReportingConfig: AttributionReportingAggregatableDebugReportingConfigJSON
+        scopes: typing.List[str]
+
+
+    class AttributionReportingTriggerRegistrationJSON(_AttributionReportingTriggerRegistrationJSON, total=False):
+        debugKey: str
+        aggregationCoordinatorOrigin: str
+        triggerContextId: str
+
+
+    class RelatedWebsiteSetJSON(typing.TypedDict):
+        primarySites: typing.List[str]
+        associatedSites: typing.List[str]
+        serviceSites: typing.List[str]
+
+
+    class GetStorageKeyForFrameReturnsJSON(typing.TypedDict):
+        storageKey: str
+
+
+    class GetCookiesReturnsJSON(typing.TypedDict):
+        cookies: typing.List[network.CookieJSON]
+
+
+    class GetUsageAndQuotaReturnsJSON(typing.TypedDict):
+        usage: float
+        quota: float
+        overrideActive: bool
+        usageBreakdown: typing.List[UsageForTypeJSON]
+
+
+    class GetTrustTokensReturnsJSON(typing.TypedDict):
+        tokens: typing.List[TrustTokensJSON]
+
+
+    class ClearTrustTokensReturnsJSON(typing.TypedDict):
+        didDeleteTokens: bool
+
+
+    class GetInterestGroupDetailsReturnsJSON(typing.TypedDict):
+        details: dict
+
+
+    class GetSharedStorageMetadataReturnsJSON(typing.TypedDict):
+        metadata: SharedStorageMetadataJSON
+
+
+    class GetSharedStorageEntriesReturnsJSON(typing.TypedDict):
+        entries: typing.List[SharedStorageEntryJSON]
+
+
+    class RunBounceTrackingMitigationsReturnsJSON(typing.TypedDict):
+        deletedSites: typing.List[str]
+
+
+    class SendPendingAttributionReportsReturnsJSON(typing.TypedDict):
+        numSent: int
+
+
+    class GetRelatedWebsiteSetsReturnsJSON(typing.TypedDict):
+        sets: typing.List[RelatedWebsiteSetJSON]
+
+
+    class GetAffectedUrlsForThirdPartyCookieMetadataReturnsJSON(typing.TypedDict):
+        matchedUrls: typing.List[str]
+
+
+    class CacheStorageContentUpdatedJSON(typing.TypedDict):
+        origin: str
+        storageKey: str
+        bucketId: str
+        cacheName: str
+
+
+    class CacheStorageListUpdatedJSON(typing.TypedDict):
+        origin: str
+        storageKey: str
+        bucketId: str
+
+
+    class IndexedDBContentUpdatedJSON(typing.TypedDict):
+        origin: str
+        storageKey: str
+        bucketId: str
+        databaseName: str
+        objectStoreName: str
+
+
+    class IndexedDBListUpdatedJSON(typing.TypedDict):
+        origin: str
+        storageKey: str
+        bucketId: str
+
+
+    class _InterestGroupAccessedJSON(typing.TypedDict):
+        accessTime: float
+        type: str
+        ownerOrigin: str
+        name: str
+
+
+    class InterestGroupAccessedJSON(_InterestGroupAccessedJSON, total=False):
+        componentSellerOrigin: str
+        bid: float
+        bidCurrency: str
+        uniqueAuctionId: str
+
+
+    class _InterestGroupAuctionEventOccurredJSON(typing.TypedDict):
+        eventTime: float
+        type: str
+        uniqueAuctionId: str
+
+
+    class InterestGroupAuctionEventOccurredJSON(_InterestGroupAuctionEventOccurredJSON, total=False):
+        parentAuctionId: str
+        auctionConfig: dict
+
+
+    class InterestGroupAuctionNetworkRequestCreatedJSON(typing.TypedDict):
+        type: str
+        requestId: str
+        auctions: typing.List[str]
+
+
+    class SharedStorageAccessedJSON(typing.TypedDict):
+        accessTime: float
+        type: str
+        mainFrameId: str
+        ownerOrigin: str
+        params: SharedStorageAccessParamsJSON
+
+
+    class StorageBucketCreatedOrUpdatedJSON(typing.TypedDict):
+        bucketInfo: StorageBucketInfoJSON
+
+
+    class StorageBucketDeletedJSON(typing.TypedDict):
+        bucketId: str
+
+
+    class AttributionReportingSourceRegisteredJSON(typing.TypedDict):
+        registration: AttributionReportingSourceRegistrationJSON
+        result: str
+
+
+    class AttributionReportingTriggerRegisteredJSON(typing.TypedDict):
+        registration: AttributionReportingTriggerRegistrationJSON
+        eventLevel: str
+        aggregatable: str
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -56,16 +55,16 @@ class GPUDevice:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> GPUDevice:
+    def from_json(cls, json: GPUDeviceJSON) -> GPUDevice:
         return cls(
             vendor_id=float(json['vendorId']),
             device_id=float(json['deviceId']),
-            vendor_string=str(json['vendorString']),
-            device_string=str(json['deviceString']),
-            driver_vendor=str(json['driverVendor']),
-            driver_version=str(json['driverVersion']),
-            sub_sys_id=float(json['subSysId']) if json.get('subSysId', None) is not None else None,
-            revision=float(json['revision']) if json.get('revision', None) is not None else None,
+            vendor_string=json['vendorString'],
+            device_string=json['deviceString'],
+            driver_vendor=json['driverVendor'],
+            driver_version=json['driverVersion'],
+            sub_sys_id=float(_sub_sys_id) if (_sub_sys_id := json.get('subSysId')) is not None else None,
+            revision=float(_revision) if (_revision := json.get('revision')) is not None else None,
         )
 
 
@@ -87,10 +86,10 @@ class Size:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Size:
+    def from_json(cls, json: SizeJSON) -> Size:
         return cls(
-            width=int(json['width']),
-            height=int(json['height']),
+            width=json['width'],
+            height=json['height'],
         )
 
 
@@ -117,9 +116,9 @@ class VideoDecodeAcceleratorCapability:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VideoDecodeAcceleratorCapability:
+    def from_json(cls, json: VideoDecodeAcceleratorCapabilityJSON) -> VideoDecodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
+            profile=json['profile'],
             max_resolution=Size.from_json(json['maxResolution']),
             min_resolution=Size.from_json(json['minResolution']),
         )
@@ -153,12 +152,12 @@ class VideoEncodeAcceleratorCapability:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VideoEncodeAcceleratorCapability:
+    def from_json(cls, json: VideoEncodeAcceleratorCapabilityJSON) -> VideoEncodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
+            profile=json['profile'],
             max_resolution=Size.from_json(json['maxResolution']),
-            max_framerate_numerator=int(json['maxFramerateNumerator']),
-            max_framerate_denominator=int(json['maxFramerateDenominator']),
+            max_framerate_numerator=json['maxFramerateNumerator'],
+            max_framerate_denominator=json['maxFramerateDenominator'],
         )
 
 
@@ -175,7 +174,10 @@ class SubsamplingFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SubsamplingFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ImageType(enum.Enum):
@@ -191,7 +193,10 @@ class ImageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ImageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -214,14 +219,14 @@ class ImageDecodeAcceleratorCapability:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['imageType'] = self.image_type.to_json()
+        json['imageType'] = self.image_type.value
         json['maxDimensions'] = self.max_dimensions.to_json()
         json['minDimensions'] = self.min_dimensions.to_json()
-        json['subsamplings'] = [i.to_json() for i in self.subsamplings]
+        json['subsamplings'] = [i.value for i in self.subsamplings]
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ImageDecodeAcceleratorCapability:
+    def from_json(cls, json: ImageDecodeAcceleratorCapabilityJSON) -> ImageDecodeAcceleratorCapability:
         return cls(
             image_type=ImageType.from_json(json['imageType']),
             max_dimensions=Size.from_json(json['maxDimensions']),
@@ -259,7 +264,7 @@ class GPUInfo:
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
         json['devices'] = [i.to_json() for i in self.devices]
-        json['driverBugWorkarounds'] = [i for i in self.driver_bug_workarounds]
+        json['driverBugWorkarounds'] = list(self.driver_bug_workarounds)
         json['videoDecoding'] = [i.to_json() for i in self.video_decoding]
         json['videoEncoding'] = [i.to_json() for i in self.video_encoding]
         json['imageDecoding'] = [i.to_json() for i in self.image_decoding]
@@ -270,15 +275,15 @@ class GPUInfo:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> GPUInfo:
+    def from_json(cls, json: GPUInfoJSON) -> GPUInfo:
         return cls(
             devices=[GPUDevice.from_json(i) for i in json['devices']],
-            driver_bug_workarounds=[str(i) for i in json['driverBugWorkarounds']],
+            driver_bug_workarounds=json['driverBugWorkarounds'],
             video_decoding=[VideoDecodeAcceleratorCapability.from_json(i) for i in json['videoDecoding']],
             video_encoding=[VideoEncodeAcceleratorCapability.from_json(i) for i in json['videoEncoding']],
             image_decoding=[ImageDecodeAcceleratorCapability.from_json(i) for i in json['imageDecoding']],
-            aux_attributes=dict(json['auxAttributes']) if json.get('auxAttributes', None) is not None else None,
-            feature_status=dict(json['featureStatus']) if json.get('featureStatus', None) is not None else None,
+            aux_attributes=json.get('auxAttributes'),
+            feature_status=json.get('featureStatus'),
         )
 
 
@@ -305,15 +310,24 @@ class ProcessInfo:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ProcessInfo:
+    def from_json(cls, json: ProcessInfoJSON) -> ProcessInfo:
         return cls(
-            type_=str(json['type']),
-            id_=int(json['id']),
+            type_=json['type'],
+            id_=json['id'],
             cpu_time=float(json['cpuTime']),
         )
 
 
-def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo, str, str, str]]:
+def _parse_get_info(json: GetInfoReturnsJSON) -> typing.Tuple[GPUInfo, str, str, str]:
+    return (
+        GPUInfo.from_json(json['gpu']),
+        json['modelName'],
+        json['modelVersion'],
+        json['commandLine']
+    )
+
+
+def get_info() -> Command[GetInfoReturnsJSON, typing.Tuple[GPUInfo, str, str, str]]:
     '''
     Returns information about the system.
 
@@ -324,21 +338,16 @@ def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo,
         2. **modelVersion** - A platform-dependent description of the version of the machine. On Mac OS, this is, for example, '10.1'. Will be the empty string if not supported.
         3. **commandLine** - The command line string used to launch the browser. Will be the empty string if not supported.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'SystemInfo.getInfo',
-    }
-    json = yield cmd_dict
-    return (
-        GPUInfo.from_json(json['gpu']),
-        str(json['modelName']),
-        str(json['modelVersion']),
-        str(json['commandLine'])
-    )
+    return Command('SystemInfo.getInfo', None, _parse_get_info)
+
+
+def _parse_get_feature_state(json: GetFeatureStateReturnsJSON) -> bool:
+    return json['featureEnabled']
 
 
 def get_feature_state(
         feature_state: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+    ) -> Command[GetFeatureStateReturnsJSON, bool]:
     '''
     Returns information about the feature state.
 
@@ -347,22 +356,91 @@ def get_feature_state(
     '''
     params: T_JSON_DICT = dict()
     params['featureState'] = feature_state
-    cmd_dict: T_JSON_DICT = {
-        'method': 'SystemInfo.getFeatureState',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return bool(json['featureEnabled'])
+    return Command('SystemInfo.getFeatureState', params, _parse_get_feature_state)
 
 
-def get_process_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ProcessInfo]]:
+def _parse_get_process_info(json: GetProcessInfoReturnsJSON) -> typing.List[ProcessInfo]:
+    return [ProcessInfo.from_json(i) for i in json['processInfo']]
+
+
+def get_process_info() -> Command[GetProcessInfoReturnsJSON, typing.List[ProcessInfo]]:
     '''
     Returns information about all running processes.
 
     :returns: An array of process info blocks.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'SystemInfo.getProcessInfo',
-    }
-    json = yield cmd_dict
-    return [ProcessInfo.from_json(i) for i in json['processInfo']]
+    return Command('SystemInfo.getProcessInfo', None, _parse_get_process_info)
+
+
+if typing.TYPE_CHECKING:
+    class _GPUDeviceJSON(typing.TypedDict):
+        vendorId: float
+        deviceId: float
+        vendorString: str
+        deviceString: str
+        driverVendor: str
+        driverVersion: str
+
+
+    class GPUDeviceJSON(_GPUDeviceJSON, total=False):
+        subSysId: float
+        revision: float
+
+
+    class SizeJSON(typing.TypedDict):
+        width: int
+        height: int
+
+
+    class VideoDecodeAcceleratorCapabilityJSON(typing.TypedDict):
+        profile: str
+        maxResolution: SizeJSON
+        minResolution: SizeJSON
+
+
+    class VideoEncodeAcceleratorCapabilityJSON(typing.TypedDict):
+        profile: str
+        maxResolution: SizeJSON
+        maxFramerateNumerator: int
+        maxFramerateDenominator: int
+
+
+    class ImageDecodeAcceleratorCapabilityJSON(typing.TypedDict):
+        imageType: str
+        maxDimensions: SizeJSON
+        minDimensions: SizeJSON
+        subsamplings: typing.List[str]
+
+
+    class _GPUInfoJSON(typing.TypedDict):
+        devices: typing.List[GPUDeviceJSON]
+        driverBugWorkarounds: typing.List[str]
+        videoDecoding: typing.List[VideoDecodeAcceleratorCapabilityJSON]
+        videoEncoding: typing.List[VideoEncodeAcceleratorCapabilityJSON]
+        imageDecoding: typing.List[ImageDecodeAcceleratorCapabilityJSON]
+
+
+    class GPUInfoJSON(_GPUInfoJSON, total=False):
+        auxAttributes: dict
+        featureStatus: dict
+
+
+    class ProcessInfoJSON(typing.TypedDict):
+        type: str
+        id: int
+        cpuTime: float
+
+
+    class GetInfoReturnsJSON(typing.TypedDict):
+        gpu: GPUInfoJSON
+        modelName: str
+        modelVersion: str
+        commandLine: str
+
+
+    class GetFeatureStateReturnsJSON(typing.TypedDict):
+        featureEnabled: bool
+
+
+    class GetProcessInfoReturnsJSON(typing.TypedDict):
+        processInfo: typing.List[ProcessInfoJSON]
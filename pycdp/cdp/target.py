@@ -8,11 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
-from . import browser
-from . import page
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from . import browser
+    from . import page
+else:
+    browser = lazy_import('browser', globals())
+    page = lazy_import('page', globals())
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -74,35 +77,35 @@ class TargetInfo:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['targetId'] = self.target_id.to_json()
+        json['targetId'] = self.target_id
         json['type'] = self.type_
         json['title'] = self.title
         json['url'] = self.url
         json['attached'] = self.attached
         json['canAccessOpener'] = self.can_access_opener
         if self.opener_id is not None:
-            json['openerId'] = self.opener_id.to_json()
+            json['openerId'] = self.opener_id
         if self.opener_frame_id is not None:
-            json['openerFrameId'] = self.opener_frame_id.to_json()
+            json['openerFrameId'] = self.opener_frame_id
         if self.browser_context_id is not None:
-            json['browserContextId'] = self.browser_context_id.to_json()
+            json['browserContextId'] = self.browser_context_id
         if self.subtype is not None:
             json['subtype'] = self.subtype
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TargetInfo:
+    def from_json(cls, json: TargetInfoJSON) -> TargetInfo:
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            type_=str(json['type']),
-            title=str(json['title']),
-            url=str(json['url']),
-            attached=bool(json['attached']),
-            can_access_opener=bool(json['canAccessOpener']),
-            opener_id=TargetID.from_json(json['openerId']) if json.get('openerId', None) is not None else None,
-            opener_frame_id=page.FrameId.from_json(json['openerFrameId']) if json.get('openerFrameId', None) is not None else None,
-            browser_context_id=browser.BrowserContextID.from_json(json['browserContextId']) if json.get('browserContextId', None) is not None else None,
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
+            target_id=TargetID(json['targetId']),
+            type_=json['type'],
+            title=json['title'],
+            url=json['url'],
+            attached=json['attached'],
+            can_access_opener=json['canAccessOpener'],
+            opener_id=TargetID(_opener_id) if (_opener_id := json.get('openerId')) is not None else None,
+            opener_frame_id=page.FrameId(_opener_frame_id) if (_opener_frame_id := json.get('openerFrameId')) is not None else None,
+            browser_context_id=browser.BrowserContextID(_browser_context_id) if (_browser_context_id := json.get('browserContextId')) is not None else None,
+            subtype=json.get('subtype'),
         )
 
 
@@ -126,10 +129,10 @@ class FilterEntry:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> FilterEntry:
+    def from_json(cls, json: FilterEntryJSON) -> FilterEntry:
         return cls(
-            exclude=bool(json['exclude']) if json.get('exclude', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            exclude=json.get('exclude'),
+            type_=json.get('type'),
         )
 
 
@@ -166,10 +169,10 @@ class RemoteLocation:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> RemoteLocation:
+    def from_json(cls, json: RemoteLocationJSON) -> RemoteLocation:
         return cls(
-            host=str(json['host']),
-            port=int(json['port']),
+            host=json['host'],
+            port=json['port'],
         )
 
 
@@ -187,30 +190,33 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 def activate_target(
         target_id: TargetID
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Activates (focuses) the target.
 
     :param target_id:
     '''
     params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.activateTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['targetId'] = target_id
+    return Command('Target.activateTarget', params)
+
+
+def _parse_attach_to_target(json: AttachToTargetReturnsJSON) -> SessionID:
+    return SessionID(json['sessionId'])
 
 
 def attach_to_target(
         target_id: TargetID,
         flatten: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SessionID]:
+    ) -> Command[AttachToTargetReturnsJSON, SessionID]:
     '''
     Attaches to the target with given id.
 
@@ -219,18 +225,17 @@ def attach_to_target(
     :returns: Id assigned to the session.
     '''
     params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
+    params['targetId'] = target_id
     if flatten is not None:
         params['flatten'] = flatten
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.attachToTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return SessionID.from_json(json['sessionId'])
+    return Command('Target.attachToTarget', params, _parse_attach_to_target)
 
 
-def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SessionID]:
+def _parse_attach_to_browser_target(json: AttachToBrowserTargetReturnsJSON) -> SessionID:
+    return SessionID(json['sessionId'])
+
+
+def attach_to_browser_target() -> Command[AttachToBrowserTargetReturnsJSON, SessionID]:
     '''
     Attaches to the browser target, only uses flat sessionId mode.
 
@@ -238,16 +243,16 @@ def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Sessi
 
     :returns: Id assigned to the session.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.attachToBrowserTarget',
-    }
-    json = yield cmd_dict
-    return SessionID.from_json(json['sessionId'])
+    return Command('Target.attachToBrowserTarget', None, _parse_attach_to_browser_target)
+
+
+def _parse_close_target(json: CloseTargetReturnsJSON) -> bool:
+    return json['success']
 
 
 def close_target(
         target_id: TargetID
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+    ) -> Command[CloseTargetReturnsJSON, bool]:
     '''
     Closes the target. If the target is a page that gets closed too.
 
@@ -255,20 +260,15 @@ def close_target(
     :returns: Always set to true. If an error occurs, the response indicates protocol error.
     '''
     params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.closeTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return bool(json['success'])
+    params['targetId'] = target_id
+    return Command('Target.closeTarget', params, _parse_close_target)
 
 
 def expose_dev_tools_protocol(
         target_id: TargetID,
         binding_name: typing.Optional[str] = None,
         inherit_permissions: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Inject object to the target's main frame that provides a communication
     channel with browser target.
@@ -286,16 +286,16 @@ def expose_dev_tools_protocol(
     :param inherit_permissions: *(Optional)* If true, inherits the current root session's permissions (default: false).
     '''
     params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
+    params['targetId'] = target_id
     if binding_name is not None:
         params['bindingName'] = binding_name
     if inherit_permissions is not None:
         params['inheritPermissions'] = inherit_permissions
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.exposeDevToolsProtocol',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Target.exposeDevToolsProtocol', params)
+
+
+def _parse_create_browser_context(json: CreateBrowserContextReturnsJSON) -> browser.BrowserContextID:
+    return browser.BrowserContextID(json['browserContextId'])
 
 
 def create_browser_context(
@@ -303,7 +303,7 @@ def create_browser_context(
         proxy_server: typing.Optional[str] = None,
         proxy_bypass_list: typing.Optional[str] = None,
         origins_with_universal_network_access: typing.Optional[typing.List[str]] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,browser.BrowserContextID]:
+    ) -> Command[CreateBrowserContextReturnsJSON, browser.BrowserContextID]:
     '''
     Creates a new empty BrowserContext. Similar to an incognito profile but you can have more than
     one.
@@ -322,26 +322,25 @@ def create_browser_context(
     if proxy_bypass_list is not None:
         params['proxyBypassList'] = proxy_bypass_list
     if origins_with_universal_network_access is not None:
-        params['originsWithUniversalNetworkAccess'] = [i for i in origins_with_universal_network_access]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.createBrowserContext',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return browser.BrowserContextID.from_json(json['browserContextId'])
+        params['originsWithUniversalNetworkAccess'] = list(origins_with_universal_network_access)
+    return Command('Target.createBrowserContext', params, _parse_create_browser_context)
+
+
+def _parse_get_browser_contexts(json: GetBrowserContextsReturnsJSON) -> typing.List[browser.BrowserContextID]:
+    return [browser.BrowserContextID(i) for i in json['browserContextIds']]
 
 
-def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[browser.BrowserContextID]]:
+def get_browser_contexts() -> Command[GetBrowserContextsReturnsJSON, typing.List[browser.BrowserContextID]]:
     '''
     Returns all browser contexts created with ``Target.createBrowserContext`` method.
 
     :returns: An array of browser context ids.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.getBrowserContexts',
-    }
-    json = yield cmd_dict
-    return [browser.BrowserContextID.from_json(i) for i in json['browserContextIds']]
+    return Command('Target.getBrowserContexts', None, _parse_get_browser_contexts)
+
+
+def _parse_create_target(json: CreateTargetReturnsJSON) -> TargetID:
+    return TargetID(json['targetId'])
 
 
 def create_target(
@@ -356,7 +355,7 @@ def create_target(
         new_window: typing.Optional[bool] = None,
         background: typing.Optional[bool] = None,
         for_tab: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetID]:
+    ) -> Command[CreateTargetReturnsJSON, TargetID]:
     '''
     Creates a new page.
 
@@ -384,9 +383,9 @@ def create_target(
     if height is not None:
         params['height'] = height
     if window_state is not None:
-        params['windowState'] = window_state.to_json()
+        params['windowState'] = window_state.value
     if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
+        params['browserContextId'] = browser_context_id
     if enable_begin_frame_control is not None:
         params['enableBeginFrameControl'] = enable_begin_frame_control
     if new_window is not None:
@@ -395,18 +394,13 @@ def create_target(
         params['background'] = background
     if for_tab is not None:
         params['forTab'] = for_tab
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.createTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return TargetID.from_json(json['targetId'])
+    return Command('Target.createTarget', params, _parse_create_target)
 
 
 def detach_from_target(
         session_id: typing.Optional[SessionID] = None,
         target_id: typing.Optional[TargetID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Detaches session with given id.
 
@@ -415,19 +409,15 @@ def detach_from_target(
     '''
     params: T_JSON_DICT = dict()
     if session_id is not None:
-        params['sessionId'] = session_id.to_json()
+        params['sessionId'] = session_id
     if target_id is not None:
-        params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.detachFromTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['targetId'] = target_id
+    return Command('Target.detachFromTarget', params)
 
 
 def dispose_browser_context(
         browser_context_id: browser.BrowserContextID
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Deletes a BrowserContext. All the belonging pages will be closed without calling their
     beforeunload hooks.
@@ -435,17 +425,17 @@ def dispose_browser_context(
     :param browser_context_id:
     '''
     params: T_JSON_DICT = dict()
-    params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.disposeBrowserContext',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['browserContextId'] = browser_context_id
+    return Command('Target.disposeBrowserContext', params)
+
+
+def _parse_get_target_info(json: GetTargetInfoReturnsJSON) -> TargetInfo:
+    return TargetInfo.from_json(json['targetInfo'])
 
 
 def get_target_info(
         target_id: typing.Optional[TargetID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetInfo]:
+    ) -> Command[GetTargetInfoReturnsJSON, TargetInfo]:
     '''
     Returns information about a target.
 
@@ -456,18 +446,17 @@ def get_target_info(
     '''
     params: T_JSON_DICT = dict()
     if target_id is not None:
-        params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.getTargetInfo',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return TargetInfo.from_json(json['targetInfo'])
+        params['targetId'] = target_id
+    return Command('Target.getTargetInfo', params, _parse_get_target_info)
+
+
+def _parse_get_targets(json: GetTargetsReturnsJSON) -> typing.List[TargetInfo]:
+    return [TargetInfo.from_json(i) for i in json['targetInfos']]
 
 
 def get_targets(
         filter_: typing.Optional[TargetFilter] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[TargetInfo]]:
+    ) -> Command[GetTargetsReturnsJSON, typing.List[TargetInfo]]:
     '''
     Retrieves a list of available targets.
 
@@ -476,13 +465,8 @@ def get_targets(
     '''
     params: T_JSON_DICT = dict()
     if filter_ is not None:
-        params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.getTargets',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [TargetInfo.from_json(i) for i in json['targetInfos']]
+        params['filter'] = filter_
+    return Command('Target.getTargets', params, _parse_get_targets)
 
 
 @deprecated(version="1.3")
@@ -490,7 +474,7 @@ def send_message_to_target(
         message: str,
         session_id: typing.Optional[SessionID] = None,
         target_id: typing.Optional[TargetID] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sends protocol message over session with given id.
     Consider using flat mode instead; see commands attachToTarget, setAutoAttach,
@@ -505,14 +489,10 @@ def send_message_to_target(
     params: T_JSON_DICT = dict()
     params['message'] = message
     if session_id is not None:
-        params['sessionId'] = session_id.to_json()
+        params['sessionId'] = session_id
     if target_id is not None:
-        params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.sendMessageToTarget',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['targetId'] = target_id
+    return Command('Target.sendMessageToTarget', params)
 
 
 def set_auto_attach(
@@ -520,7 +500,7 @@ def set_auto_attach(
         wait_for_debugger_on_start: bool,
         flatten: typing.Optional[bool] = None,
         filter_: typing.Optional[TargetFilter] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Controls whether to automatically attach to new targets which are considered to be related to
     this one. When turned on, attaches to all existing related targets as well. When turned off,
@@ -539,19 +519,15 @@ def set_auto_attach(
     if flatten is not None:
         params['flatten'] = flatten
     if filter_ is not None:
-        params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.setAutoAttach',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['filter'] = filter_
+    return Command('Target.setAutoAttach', params)
 
 
 def auto_attach_related(
         target_id: TargetID,
         wait_for_debugger_on_start: bool,
         filter_: typing.Optional[TargetFilter] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Adds the specified target to the list of targets that will be monitored for any related target
     creation (such as child frames, child workers and new versions of service worker) and reported
@@ -566,21 +542,17 @@ def auto_attach_related(
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached.
     '''
     params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
+    params['targetId'] = target_id
     params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
     if filter_ is not None:
-        params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.autoAttachRelated',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['filter'] = filter_
+    return Command('Target.autoAttachRelated', params)
 
 
 def set_discover_targets(
         discover: bool,
         filter_: typing.Optional[TargetFilter] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Controls whether to discover available targets and notify via
     ``targetCreated/targetInfoChanged/targetDestroyed`` events.
@@ -591,17 +563,13 @@ def set_discover_targets(
     params: T_JSON_DICT = dict()
     params['discover'] = discover
     if filter_ is not None:
-        params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.setDiscoverTargets',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['filter'] = filter_
+    return Command('Target.setDiscoverTargets', params)
 
 
 def set_remote_locations(
         locations: typing.List[RemoteLocation]
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enables target discovery for the specified locations, when ``setDiscoverTargets`` was set to
     ``true``.
@@ -612,11 +580,7 @@ def set_remote_locations(
     '''
     params: T_JSON_DICT = dict()
     params['locations'] = [i.to_json() for i in locations]
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Target.setRemoteLocations',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Target.setRemoteLocations', params)
 
 
 @event_class('Target.attachedToTarget')
@@ -633,11 +597,11 @@ class AttachedToTarget:
     waiting_for_debugger: bool
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AttachedToTarget:
+    def from_json(cls, json: AttachedToTargetJSON) -> AttachedToTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
+            session_id=SessionID(json['sessionId']),
             target_info=TargetInfo.from_json(json['targetInfo']),
-            waiting_for_debugger=bool(json['waitingForDebugger'])
+            waiting_for_debugger=json['waitingForDebugger']
         )
 
 
@@ -656,10 +620,10 @@ class DetachedFromTarget:
     target_id: typing.Optional[TargetID]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DetachedFromTarget:
+    def from_json(cls, json: DetachedFromTargetJSON) -> DetachedFromTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            target_id=TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None
+            session_id=SessionID(json['sessionId']),
+            target_id=TargetID(_target_id) if (_target_id := json.get('targetId')) is not None else None
         )
 
 
@@ -677,11 +641,11 @@ class ReceivedMessageFromTarget:
     target_id: typing.Optional[TargetID]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ReceivedMessageFromTarget:
+    def from_json(cls, json: ReceivedMessageFromTargetJSON) -> ReceivedMessageFromTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            message=str(json['message']),
-            target_id=TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None
+            session_id=SessionID(json['sessionId']),
+            message=json['message'],
+            target_id=TargetID(_target_id) if (_target_id := json.get('targetId')) is not None else None
         )
 
 
@@ -694,7 +658,7 @@ class TargetCreated:
     target_info: TargetInfo
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TargetCreated:
+    def from_json(cls, json: TargetCreatedJSON) -> TargetCreated:
         return cls(
             target_info=TargetInfo.from_json(json['targetInfo'])
         )
@@ -709,9 +673,9 @@ class TargetDestroyed:
     target_id: TargetID
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TargetDestroyed:
+    def from_json(cls, json: TargetDestroyedJSON) -> TargetDestroyed:
         return cls(
-            target_id=TargetID.from_json(json['targetId'])
+            target_id=TargetID(json['targetId'])
         )
 
 
@@ -728,11 +692,11 @@ class TargetCrashed:
     error_code: int
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
+    def from_json(cls, json: TargetCrashedJSON) -> TargetCrashed:
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            status=str(json['status']),
-            error_code=int(json['errorCode'])
+            target_id=TargetID(json['targetId']),
+            status=json['status'],
+            error_code=json['errorCode']
         )
 
 
@@ -746,7 +710,107 @@ class TargetInfoChanged:
     target_info: TargetInfo
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TargetInfoChanged:
+    def from_json(cls, json: TargetInfoChangedJSON) -> TargetInfoChanged:
         return cls(
             target_info=TargetInfo.from_json(json['targetInfo'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _TargetInfoJSON(typing.TypedDict):
+        targetId: str
+        type: str
+        title: str
+        url: str
+        attached: bool
+        canAccessOpener: bool
+
+
+    class TargetInfoJSON(_TargetInfoJSON, total=False):
+        openerId: str
+        openerFrameId: str
+        browserContextId: str
+        subtype: str
+
+
+    class FilterEntryJSON(typing.TypedDict, total=False):
+        exclude: bool
+        type: str
+
+
+    class RemoteLocationJSON(typing.TypedDict):
+        host: str
+        port: int
+
+
+    class AttachToTargetReturnsJSON(typing.TypedDict):
+        sessionId: str
+
+
+    class AttachToBrowserTargetReturnsJSON(typing.TypedDict):
+        sessionId: str
+
+
+    class CloseTargetReturnsJSON(typing.TypedDict):
+        success: bool
+
+
+    class CreateBrowserContextReturnsJSON(typing.TypedDict):
+        browserContextId: str
+
+
+    class GetBrowserContextsReturnsJSON(typing.TypedDict):
+        browserContextIds: typing.List[str]
+
+
+    class CreateTargetReturnsJSON(typing.TypedDict):
+        targetId: str
+
+
+    class GetTargetInfoReturnsJSON(typing.TypedDict):
+        targetInfo: TargetInfoJSON
+
+
+    class GetTargetsReturnsJSON(typing.TypedDict):
+        targetInfos: typing.List[TargetInfoJSON]
+
+
+    class AttachedToTargetJSON(typing.TypedDict):
+        sessionId: str
+        targetInfo: TargetInfoJSON
+        waitingForDebugger: bool
+
+
+    class _DetachedFromTargetJSON(typing.TypedDict):
+        sessionId: str
+
+
+    class DetachedFromTargetJSON(_DetachedFromTargetJSON, total=False):
+        targetId: str
+
+
+    class _ReceivedMessageFromTargetJSON(typing.TypedDict):
+        sessionId: str
+        message: str
+
+
+    class ReceivedMessageFromTargetJSON(_ReceivedMessageFromTargetJSON, total=False):
+        targetId: str
+
+
+    class TargetCreatedJSON(typing.TypedDict):
+        targetInfo: TargetInfoJSON
+
+
+    class TargetDestroyedJSON(typing.TypedDict):
+        targetId: str
+
+
+    class TargetCrashedJSON(typing.TypedDict):
+        targetId: str
+        status: str
+        errorCode: int
+
+
+    class TargetInfoChangedJSON(typing.TypedDict):
+        targetInfo: TargetInfoJSON
@@ -8,13 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 def bind(
         port: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Request browser port binding.
 
@@ -22,16 +21,12 @@ def bind(
     '''
     params: T_JSON_DICT = dict()
     params['port'] = port
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tethering.bind',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Tethering.bind', params)
 
 
 def unbind(
         port: int
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Request browser port unbinding.
 
@@ -39,11 +34,7 @@ def unbind(
     '''
     params: T_JSON_DICT = dict()
     params['port'] = port
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tethering.unbind',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Tethering.unbind', params)
 
 
 @event_class('Tethering.accepted')
@@ -58,8 +49,14 @@ class Accepted:
     connection_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Accepted:
+    def from_json(cls, json: AcceptedJSON) -> Accepted:
         return cls(
-            port=int(json['port']),
-            connection_id=str(json['connectionId'])
+            port=json['port'],
+            connection_id=json['connectionId']
         )
+
+
+if typing.TYPE_CHECKING:
+    class AcceptedJSON(typing.TypedDict):
+        port: int
+        connectionId: str
@@ -8,10 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, lazy_import, T_JSON_DICT
 
-from . import io
+if typing.TYPE_CHECKING:
+    from . import io
+else:
+    io = lazy_import('io', globals())
 
 
 class MemoryDumpConfig(dict):
@@ -72,27 +74,27 @@ class TraceConfig:
         if self.enable_argument_filter is not None:
             json['enableArgumentFilter'] = self.enable_argument_filter
         if self.included_categories is not None:
-            json['includedCategories'] = [i for i in self.included_categories]
+            json['includedCategories'] = list(self.included_categories)
         if self.excluded_categories is not None:
-            json['excludedCategories'] = [i for i in self.excluded_categories]
+            json['excludedCategories'] = list(self.excluded_categories)
         if self.synthetic_delays is not None:
-            json['syntheticDelays'] = [i for i in self.synthetic_delays]
+            json['syntheticDelays'] = list(self.synthetic_delays)
         if self.memory_dump_config is not None:
-            json['memoryDumpConfig'] = self.memory_dump_config.to_json()
+            json['memoryDumpConfig'] = self.memory_dump_config
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TraceConfig:
+    def from_json(cls, json: TraceConfigJSON) -> TraceConfig:
         return cls(
-            record_mode=str(json['recordMode']) if json.get('recordMode', None) is not None else None,
-            trace_buffer_size_in_kb=float(json['traceBufferSizeInKb']) if json.get('traceBufferSizeInKb', None) is not None else None,
-            enable_sampling=bool(json['enableSampling']) if json.get('enableSampling', None) is not None else None,
-            enable_systrace=bool(json['enableSystrace']) if json.get('enableSystrace', None) is not None else None,
-            enable_argument_filter=bool(json['enableArgumentFilter']) if json.get('enableArgumentFilter', None) is not None else None,
-            included_categories=[str(i) for i in json['includedCategories']] if json.get('includedCategories', None) is not None else None,
-            excluded_categories=[str(i) for i in json['excludedCategories']] if json.get('excludedCategories', None) is not None else None,
-            synthetic_delays=[str(i) for i in json['syntheticDelays']] if json.get('syntheticDelays', None) is not None else None,
-            memory_dump_config=MemoryDumpConfig.from_json(json['memoryDumpConfig']) if json.get('memoryDumpConfig', None) is not None else None,
+            record_mode=json.get('recordMode'),
+            trace_buffer_size_in_kb=float(_trace_buffer_size_in_kb) if (_trace_buffer_size_in_kb := json.get('traceBufferSizeInKb')) is not None else None,
+            enable_sampling=json.get('enableSampling'),
+            enable_systrace=json.get('enableSystrace'),
+            enable_argument_filter=json.get('enableArgumentFilter'),
+            included_categories=json.get('includedCategories'),
+            excluded_categories=json.get('excludedCategories'),
+            synthetic_delays=json.get('syntheticDelays'),
+            memory_dump_config=MemoryDumpConfig(_memory_dump_config) if (_memory_dump_config := json.get('memoryDumpConfig')) is not None else None,
         )
 
 
@@ -109,7 +111,10 @@ class StreamFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class StreamCompression(enum.Enum):
@@ -124,7 +129,10 @@ class StreamCompression(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamCompression:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class MemoryDumpLevelOfDetail(enum.Enum):
@@ -142,7 +150,10 @@ class MemoryDumpLevelOfDetail(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MemoryDumpLevelOfDetail:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class TracingBackend(enum.Enum):
@@ -162,20 +173,24 @@ class TracingBackend(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TracingBackend:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
-def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def end() -> Command[T_JSON_DICT, None]:
     '''
     Stop trace events collection.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tracing.end',
-    }
-    json = yield cmd_dict
+    return Command('Tracing.end')
 
 
-def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+def _parse_get_categories(json: GetCategoriesReturnsJSON) -> typing.List[str]:
+    return json['categories']
+
+
+def get_categories() -> Command[GetCategoriesReturnsJSON, typing.List[str]]:
     '''
     Gets supported tracing categories.
 
@@ -183,16 +198,12 @@ def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str
 
     :returns: A list of supported tracing categories.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tracing.getCategories',
-    }
-    json = yield cmd_dict
-    return [str(i) for i in json['categories']]
+    return Command('Tracing.getCategories', None, _parse_get_categories)
 
 
 def record_clock_sync_marker(
         sync_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Record a clock sync marker in the trace.
 
@@ -202,17 +213,20 @@ def record_clock_sync_marker(
     '''
     params: T_JSON_DICT = dict()
     params['syncId'] = sync_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tracing.recordClockSyncMarker',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('Tracing.recordClockSyncMarker', params)
+
+
+def _parse_request_memory_dump(json: RequestMemoryDumpReturnsJSON) -> typing.Tuple[str, bool]:
+    return (
+        json['dumpGuid'],
+        json['success']
+    )
 
 
 def request_memory_dump(
         deterministic: typing.Optional[bool] = None,
         level_of_detail: typing.Optional[MemoryDumpLevelOfDetail] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
+    ) -> Command[RequestMemoryDumpReturnsJSON, typing.Tuple[str, bool]]:
     '''
     Request a global memory dump.
 
@@ -229,16 +243,8 @@ def request_memory_dump(
     if deterministic is not None:
         params['deterministic'] = deterministic
     if level_of_detail is not None:
-        params['levelOfDetail'] = level_of_detail.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tracing.requestMemoryDump',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return (
-        str(json['dumpGuid']),
-        bool(json['success'])
-    )
+        params['levelOfDetail'] = level_of_detail.value
+    return Command('Tracing.requestMemoryDump', params, _parse_request_memory_dump)
 
 
 def start(
@@ -251,7 +257,7 @@ def start(
         trace_config: typing.Optional[TraceConfig] = None,
         perfetto_config: typing.Optional[str] = None,
         tracing_backend: typing.Optional[TracingBackend] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Start trace events collection.
 
@@ -275,20 +281,16 @@ def start(
     if transfer_mode is not None:
         params['transferMode'] = transfer_mode
     if stream_format is not None:
-        params['streamFormat'] = stream_format.to_json()
+        params['streamFormat'] = stream_format.value
     if stream_compression is not None:
-        params['streamCompression'] = stream_compression.to_json()
+        params['streamCompression'] = stream_compression.value
     if trace_config is not None:
         params['traceConfig'] = trace_config.to_json()
     if perfetto_config is not None:
         params['perfettoConfig'] = perfetto_config
     if tracing_backend is not None:
-        params['tracingBackend'] = tracing_backend.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Tracing.start',
-        'params': params,
-    }
-    json = yield cmd_dict
+        params['tracingBackend'] = tracing_backend.value
+    return Command('Tracing.start', params)
 
 
 @event_class('Tracing.bufferUsage')
@@ -309,11 +311,11 @@ class BufferUsage:
     value: typing.Optional[float]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BufferUsage:
+    def from_json(cls, json: BufferUsageJSON) -> BufferUsage:
         return cls(
-            percent_full=float(json['percentFull']) if json.get('percentFull', None) is not None else None,
-            event_count=float(json['eventCount']) if json.get('eventCount', None) is not None else None,
-            value=float(json['value']) if json.get('value', None) is not None else None
+            percent_full=float(_percent_full) if (_percent_full := json.get('percentFull')) is not None else None,
+            event_count=float(_event_count) if (_event_count := json.get('eventCount')) is not None else None,
+            value=float(_value) if (_value := json.get('value')) is not None else None
         )
 
 
@@ -329,9 +331,9 @@ class DataCollected:
     value: typing.List[dict]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> DataCollected:
+    def from_json(cls, json: DataCollectedJSON) -> DataCollected:
         return cls(
-            value=[dict(i) for i in json['value']]
+            value=json['value']
         )
 
 
@@ -353,10 +355,52 @@ class TracingComplete:
     stream_compression: typing.Optional[StreamCompression]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> TracingComplete:
+    def from_json(cls, json: TracingCompleteJSON) -> TracingComplete:
         return cls(
-            data_loss_occurred=bool(json['dataLossOccurred']),
-            stream=io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None,
-            trace_format=StreamFormat.from_json(json['traceFormat']) if json.get('traceFormat', None) is not None else None,
-            stream_compression=StreamCompression.from_json(json['streamCompression']) if json.get('streamCompression', None) is not None else None
+            data_loss_occurred=json['dataLossOccurred'],
+            stream=io.StreamHandle(_stream) if (_stream := json.get('stream')) is not None else None,
+            trace_format=StreamFormat.from_json(_trace_format) if (_trace_format := json.get('traceFormat')) is not None else None,
+            stream_compression=StreamCompression.from_json(_stream_compression) if (_stream_compression := json.get('streamCompression')) is not None else None
         )
+
+
+if typing.TYPE_CHECKING:
+    class TraceConfigJSON(typing.TypedDict, total=False):
+        recordMode: str
+        traceBufferSizeInKb: float
+        enableSampling: bool
+        enableSystrace: bool
+        enableArgumentFilter: bool
+        includedCategories: typing.List[str]
+        excludedCategories: typing.List[str]
+        syntheticDelays: typing.List[str]
+        memoryDumpConfig: dict
+
+
+    class GetCategoriesReturnsJSON(typing.TypedDict):
+        categories: typing.List[str]
+
+
+    class RequestMemoryDumpReturnsJSON(typing.TypedDict):
+        dumpGuid: str
+        success: bool
+
+
+    class BufferUsageJSON(typing.TypedDict, total=False):
+        percentFull: float
+        eventCount: float
+        value: float
+
+
+    class DataCollectedJSON(typing.TypedDict):
+        value: typing.List[dict]
+
+
+    class _TracingCompleteJSON(typing.TypedDict):
+        dataLossOccurred: bool
+
+
+    class TracingCompleteJSON(_TracingCompleteJSON, total=False):
+        stream: str
+        traceFormat: str
+        streamCompression: str
@@ -1,64 +1,485 @@
+import re
+import sys
+import json
+import math
 import typing
+import importlib
+import collections
+import dataclasses
 
 
 T_JSON_DICT = typing.Dict[str, typing.Any]
-_event_parsers = dict()
+_event_parsers: typing.Dict[str, typing.Any] = dict()
+_event_methods: typing.Dict[type, str] = dict()
+_domain_modules: typing.Dict[str, str] = dict()
+_loaded_domains: typing.Set[str] = set()
+
+
+def _add_slots(cls):
+    ''' Recreate a dataclass with a ``__slots__`` entry for each of its fields, this is
+    what ``dataclass(slots=True)`` does on Python 3.10+. '''
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # the default values are already bound to the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+if typing.TYPE_CHECKING:
+    from dataclasses import dataclass
+elif sys.version_info >= (3, 10):
+    def dataclass(cls):
+        ''' A dataclass without ``__dict__``, its instances store fields in slots. '''
+        return dataclasses.dataclass(cls, slots=True)
+else:
+    def dataclass(cls):
+        ''' A dataclass without ``__dict__``, its instances store fields in slots. '''
+        return _add_slots(dataclasses.dataclass(cls))
+
+
+_S = typing.TypeVar('_S')
+_R = typing.TypeVar('_R')
+
+
+def _encode_default(obj: typing.Any) -> typing.Any:
+    # CDP objects given as values of template holes
+    return obj.to_json()
+
+
+# json.dumps creates a new encoder when given any option, reuse one instead
+_encode = json.JSONEncoder(default=_encode_default).encode
+_encode_scalar = {
+    str: json.encoder.encode_basestring_ascii,  # type: ignore
+    int: int.__repr__,
+    bool: lambda v: 'true' if v else 'false',
+}
+
+
+def _encode_value(value: typing.Any) -> str:
+    # the encoder takes its slow path for anything but strings, the values of
+    # template holes are mostly scalars
+    encode = _encode_scalar.get(type(value))
+    if encode is not None:
+        return encode(value)
+    if type(value) is float and math.isfinite(value):
+        return float.__repr__(value)
+    return _encode(value)
+
+
+class Command(typing.Generator[T_JSON_DICT, _S, _R]):
+    '''
+    A CDP command: its method, params and the function that parses its result. The
+    command functions of the domain modules return these and clients execute them.
+
+    A command is also a generator, as command functions used to return: it yields the
+    request and ``send()`` raises ``StopIteration`` with the parsed result. Unlike a
+    generator it can be executed any number of times.
+    '''
+    __slots__ = ('method', 'params', 'parse', '_body')
+
+    def __init__(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT] = None,
+        parse: typing.Optional[typing.Callable[[_S], _R]] = None
+    ):
+        self.method = method
+        self.params = params
+        self.parse = parse
+        #: the serialized request without the opening brace, set by templates
+        self._body: typing.Optional[str] = None
+
+    def to_json(self) -> T_JSON_DICT:
+        ''' Return a new request dict for this command, without id and session. '''
+        if self._body is not None:
+            return json.loads('{' + self._body)
+        request: T_JSON_DICT = {'method': self.method}
+        if self.params is not None:
+            request['params'] = dict(self.params)
+        return request
+
+    def serialize(self, cmd_id: int, session_id: typing.Optional[str] = None) -> str:
+        ''' Return the JSON message that sends this command with the given id and
+        session. '''
+        body = self._body
+        if body is None:
+            if self.params is None:
+                body = _encode({'method': self.method})[1:]
+            else:
+                body = _encode({'method': self.method, 'params': self.params})[1:]
+        if session_id:
+            return '{"id": %d, "sessionId": %s, %s' % (cmd_id, _encode(session_id), body)
+        return '{"id": %d, %s' % (cmd_id, body)
+
+    def parse_result(self, result: _S) -> _R:
+        return self.parse(result) if self.parse is not None else None  # type: ignore
+
+    def template(self, *keys: str) -> 'CommandTemplate[_S, _R]':
+        '''
+        Serialize this command ahead of time, leaving holes for the params named by
+        ``keys``, e.g. ``input_.dispatch_mouse_event('mouseMoved', 0, 0).template('x', 'y')``.
+        Calling the template with a value for each hole returns a command whose request
+        is the template with the values spliced in.
+        '''
+        return CommandTemplate(self, keys)
+
+    def send(self, value: typing.Any) -> T_JSON_DICT:
+        if value is None:
+            return self.to_json()
+        raise StopIteration(self.parse_result(value))
+
+    def throw(self, typ, val=None, tb=None):  # type: ignore
+        raise typ if val is None else val
+
+    def __repr__(self):
+        return f'Command({self.method!r}, {self.params!r})'
+
+
+class CommandTemplate(typing.Generic[_S, _R]):
+    '''
+    A command serialized ahead of time, for commands that are sent repeatedly with only a
+    few params changing. See :meth:`Command.template`.
+    '''
+    __slots__ = ('method', 'keys', 'parse', '_parts')
+    _HOLE_RE = re.compile(r'"\\u0000(\d+)\\u0000"')
+
+    def __init__(self, command: Command[_S, _R], keys: typing.Sequence[str]):
+        self.method = command.method
+        self.keys = tuple(keys)
+        self.parse = command.parse
+        request = command.to_json()
+        params = request.setdefault('params', {})
+        for i, key in enumerate(self.keys):
+            params[key] = f'\0{i}\0'
+        # static text and hole indexes alternate, e.g. ['{"x": ', 0, ', "y": ', 1, '}}']
+        parts: typing.List[typing.Any] = self._HOLE_RE.split(json.dumps(request)[1:])
+        parts[1::2] = [int(i) for i in parts[1::2]]
+        self._parts = parts
+
+    def __call__(self, *values: typing.Any) -> Command[_S, _R]:
+        ''' Return the command with the given values, in the order of the template keys. '''
+        if len(values) != len(self.keys):
+            raise TypeError(f'expected {len(self.keys)} values for {self.keys}, got {len(values)}')
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = _encode_value(values[parts[i]])
+        command: Command[_S, _R] = Command(self.method, None, self.parse)
+        command._body = ''.join(parts)
+        return command
+
+
+_T_LAZY = typing.TypeVar('_T_LAZY', bound='LazyObject')
+
+
+class LazyObject:
+    '''
+    Base of the generated classes that decode their fields on first access.
+
+    ``from_json`` only keeps a reference to the JSON dict, a field is decoded and stored
+    in its slot the first time it is read. ``_lazy_fields`` maps each field name to its
+    JSON key, a decoder (``None`` if the JSON value is used as is) and whether the field
+    is optional.
+    '''
+    __slots__ = ('_json',)
+    _json: typing.Mapping[str, typing.Any]
+    _lazy_fields: typing.ClassVar[typing.Dict[str, typing.Tuple[
+        str, typing.Optional[typing.Callable[[typing.Any], typing.Any]], bool
+    ]]] = {}
+
+    def __getattr__(self, name):
+        # only called for unset slots, i.e. fields that were not decoded yet
+        try:
+            key, decode, optional = self._lazy_fields[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+        if optional:
+            value = self._json.get(key)
+            if value is not None and decode is not None:
+                value = decode(value)
+        else:
+            value = self._json[key]
+            if decode is not None:
+                value = decode(value)
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def from_json(cls: typing.Type[_T_LAZY], json: typing.Mapping[str, typing.Any]) -> _T_LAZY:
+        obj = cls.__new__(cls)
+        obj._json = json
+        return obj
+
+
+_T = typing.TypeVar('_T')
+_SKIP, _STRING, _LIST, _DICT = range(4)
+
+
+class Interner:
+    '''
+    Makes parsed CDP objects share one instance of each distinct identifier and string.
+
+    :meth:`intern` replaces the strings held by an object, including the values of
+    primitive types like ``page.FrameId`` and the keys and values of dicts like
+    ``network.Headers``, with the first equal value it has seen, walking nested objects
+    and lists. Objects kept for a long time, e.g. stored events, then share a single
+    copy of the frame ids, URLs and header names they repeat.
+
+    At most ``max_size`` values of each type are kept, the oldest are dropped first.
+    Strings longer than ``max_length`` seldom repeat and are left alone. Lazy objects
+    are not walked, that would decode them.
+    '''
+    __slots__ = ('max_size', 'max_length', 'hits', 'misses', '_tables', '_kinds')
+
+    def __init__(self, max_size: int = 10000, max_length: int = 1024):
+        self.max_size = max_size
+        self.max_length = max_length
+        #: lookups that returned a value seen before
+        self.hits = 0
+        #: values added to the tables
+        self.misses = 0
+        self._tables: typing.Dict[type, typing.Dict[str, str]] = {}
+        # how each type is walked: one of the constants above, or field names
+        self._kinds: typing.Dict[type, typing.Any] = {}
+
+    def intern(self, obj: _T) -> _T:
+        ''' Intern the values held by ``obj`` in place and return it, or return the
+        interned value if ``obj`` is a string. '''
+        return self._value(obj)
+
+    def clear(self):
+        self._tables.clear()
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def _value(self, value: typing.Any) -> typing.Any:
+        kind = self._kinds.get(type(value))
+        if kind is None:
+            kind = self._kinds[type(value)] = self._kind(type(value))
+        if kind is _SKIP:
+            return value
+        if kind is _STRING:
+            return self._string(type(value), value)
+        if kind is _LIST:
+            for i, item in enumerate(value):
+                interned = self._value(item)
+                if interned is not item:
+                    value[i] = interned
+        elif kind is _DICT:
+            items = [(self._value(k), self._value(v)) for k, v in value.items()]
+            value.clear()
+            value.update(items)
+        else:
+            kinds = self._kinds
+            for name in kind:
+                item = getattr(value, name)
+                # most fields are numbers, enums or unset, skip them without a call
+                if kinds.get(type(item)) is _SKIP:
+                    continue
+                interned = self._value(item)
+                if interned is not item:
+                    setattr(value, name, interned)
+        return value
+
+    def _string(self, cls: type, value: str) -> str:
+        table = self._tables.get(cls)
+        if table is None:
+            table = self._tables[cls] = {}
+        interned = table.get(value)
+        if interned is not None:
+            self.hits += 1
+            return interned
+        if len(value) > self.max_length:
+            return value
+        self.misses += 1
+        if len(table) >= self.max_size:
+            del table[next(iter(table))]
+        table[value] = value
+        return value
+
+    @staticmethod
+    def _kind(cls: type) -> typing.Any:
+        if issubclass(cls, str):
+            return _STRING
+        if issubclass(cls, list):
+            return _LIST
+        if issubclass(cls, dict):
+            return _DICT
+        if dataclasses.is_dataclass(cls) and not issubclass(cls, LazyObject):
+            return tuple(f.name for f in dataclasses.fields(cls))
+        return _SKIP
+
+
+def _camel_case(name: str) -> str:
+    head, *rest = name.split('_')
+    return head + ''.join(word[:1].upper() + word[1:] for word in rest)
+
+
+def _frozen_json(value: typing.Any) -> typing.Any:
+    ''' Return a hashable copy of a JSON value, equal values give equal copies. '''
+    if type(value) is dict:
+        return frozenset((key, _frozen_json(item)) for key, item in value.items())
+    if type(value) is list:
+        return tuple(_frozen_json(item) for item in value)
+    return value
 
 
 class UnknownObject:
-    def __init__(self, elements: dict):
+    '''
+    A JSON object of a type that isn't in the generated protocol, e.g. the params of an
+    event added to the browser after this package was generated.
+
+    The JSON dict is kept as is and nested objects and lists are wrapped when they're
+    read. Attributes are looked up by their JSON name, or by the snake case name the
+    generated classes would use: ``obj.frame_id`` reads ``frameId``, and names with a
+    ``_`` suffix like ``obj.type_`` read ``type``.
+    '''
+    __slots__ = ('_elements',)
+
+    def __init__(self, elements: T_JSON_DICT):
         self._elements = elements
 
     def __getattr__(self, name):
+        elements = self._elements
+        if name in elements:
+            return UnknownObject.from_json(elements[name])
         # some names are appended a `_` so they don't collide with the python namespace
         # example: id_ and type_
-        name = name.removesuffix('_')
+        key = _camel_case(name[:-1] if name.endswith('_') else name)
+        if key in elements:
+            return UnknownObject.from_json(elements[key])
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._elements == other._elements
 
-        if name not in self._elements:
-            raise AttributeError
+    def __hash__(self):
+        # hashed by value like they compare, the JSON shouldn't change once it's a key
+        return hash(_frozen_json(self._elements))
 
-        return self._elements[name]
+    def __repr__(self):
+        return f'{type(self).__name__}({self._elements!r})'
+
+    def to_json(self) -> T_JSON_DICT:
+        return self._elements
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT):
-        if isinstance(json, dict):
-            value = {key: cls.from_json(val) for key, val in json.items()}
-            obj = cls(value)
-        elif isinstance(json, list):
-            obj = [cls.from_json(val) for val in json]
-        else:
-            obj = json
+    def from_json(cls, json: typing.Any) -> typing.Any:
+        ''' Wrap a JSON dict, lists are returned with their items wrapped. '''
+        if type(json) is dict:
+            return UnknownObject(json)
+        if type(json) is list:
+            return [UnknownObject.from_json(item) for item in json]
+        return json
 
-        return obj
+
+#: how many events of each method without a generated class were received, if it
+#: grows the browser is newer than the generated protocol
+unknown_methods: typing.Counter[str] = collections.Counter()
 
 
 class UnknownEvent(UnknownObject):
-    def __init__(self, name, elements):
+    ''' An event of a method that isn't in the generated protocol, see
+    :class:`UnknownObject`. '''
+    __slots__ = ('name',)
+
+    def __init__(self, name: str, elements: T_JSON_DICT):
         super().__init__(elements)
         self.name = name
 
-    @classmethod
-    def from_json(cls, json: T_JSON_DICT):
-        name = json['method']
-        obj = UnknownObject.from_json(json['params'])
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.name == other.name and self._elements == other._elements
 
-        if isinstance(obj, UnknownObject):
-            return cls(name, obj._elements)
+    def __hash__(self):
+        return hash((self.name, _frozen_json(self._elements)))
 
-        return obj
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r}, {self._elements!r})'
+
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> 'UnknownEvent':
+        return cls(json['method'], json.get('params', {}))
 
 
 def event_class(method):
     ''' A decorator that registers a class as an event class. '''
     def decorate(cls):
         _event_parsers[method] = cls
+        _event_methods[cls] = method
         return cls
     return decorate
 
 
+def register_domains(modules: typing.Mapping[str, str]):
+    ''' Register the module of each CDP domain, so the module can be imported when an
+    event of its domain is first received. '''
+    _domain_modules.update(modules)
+
+
+def event_type(method: str) -> typing.Type[typing.Any]:
+    ''' Return the class of the events of a CDP method, ``UnknownEvent`` if there is
+    none. The module of the event's domain is imported if it wasn't yet. '''
+    try:
+        return _event_parsers[method]
+    except KeyError:
+        pass
+    domain = method.partition('.')[0]
+    module = _domain_modules.get(domain)
+    if module is not None and domain not in _loaded_domains:
+        _loaded_domains.add(domain)
+        importlib.import_module(f'.{module}', __package__)
+        if method in _event_parsers:
+            return _event_parsers[method]
+    unknown_methods[method] += 1
+    return UnknownEvent
+
+
+def event_method(cls: type) -> str:
+    ''' Return the CDP method of an event class. '''
+    try:
+        return _event_methods[cls]
+    except KeyError:
+        raise ValueError(f"{cls!r} is not an event class") from None
+
+
 def parse_json_event(json: T_JSON_DICT) -> typing.Any:
     ''' Parse a JSON dictionary into a CDP event. '''
-    if json['method'] not in _event_parsers:
+    cls: typing.Any = event_type(json['method'])
+    if cls is UnknownEvent:
         return UnknownEvent.from_json(json)
 
-    return _event_parsers[json['method']].from_json(json['params'])
+    return cls.from_json(json['params'])
+
+
+class _LazyModule:
+    ''' Stands in for a domain module imported by another one, until it's first used. '''
+    __slots__ = ('_name', '_namespace')
+
+    def __init__(self, name: str, namespace: typing.Dict[str, typing.Any]):
+        self._name = name
+        self._namespace = namespace
+
+    def __getattr__(self, attr: str) -> typing.Any:
+        module = importlib.import_module(f'.{self._name}', __package__)
+        # later lookups in the importing module get the real module
+        self._namespace[self._name] = module
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f'<lazy module {__package__}.{self._name}>'
+
+
+def lazy_import(name: str, namespace: typing.Dict[str, typing.Any]) -> typing.Any:
+    ''' Return a placeholder for the domain module ``name`` that imports it and replaces
+    itself in ``namespace``, the globals of the importing module, on first use. '''
+    return _LazyModule(name, namespace)
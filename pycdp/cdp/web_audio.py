@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class GraphObjectId(str):
@@ -39,7 +38,10 @@ class ContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ContextState(enum.Enum):
@@ -56,7 +58,10 @@ class ContextState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class NodeType(str):
@@ -87,7 +92,10 @@ class ChannelCountMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ChannelCountMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ChannelInterpretation(enum.Enum):
@@ -102,7 +110,10 @@ class ChannelInterpretation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ChannelInterpretation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class ParamType(str):
@@ -132,7 +143,10 @@ class AutomationRate(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AutomationRate:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -163,7 +177,7 @@ class ContextRealtimeData:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContextRealtimeData:
+    def from_json(cls, json: ContextRealtimeDataJSON) -> ContextRealtimeData:
         return cls(
             current_time=float(json['currentTime']),
             render_capacity=float(json['renderCapacity']),
@@ -196,9 +210,9 @@ class BaseAudioContext:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['contextId'] = self.context_id.to_json()
-        json['contextType'] = self.context_type.to_json()
-        json['contextState'] = self.context_state.to_json()
+        json['contextId'] = self.context_id
+        json['contextType'] = self.context_type.value
+        json['contextState'] = self.context_state.value
         json['callbackBufferSize'] = self.callback_buffer_size
         json['maxOutputChannelCount'] = self.max_output_channel_count
         json['sampleRate'] = self.sample_rate
@@ -207,15 +221,15 @@ class BaseAudioContext:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> BaseAudioContext:
+    def from_json(cls, json: BaseAudioContextJSON) -> BaseAudioContext:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
+            context_id=GraphObjectId(json['contextId']),
             context_type=ContextType.from_json(json['contextType']),
             context_state=ContextState.from_json(json['contextState']),
             callback_buffer_size=float(json['callbackBufferSize']),
             max_output_channel_count=float(json['maxOutputChannelCount']),
             sample_rate=float(json['sampleRate']),
-            realtime_data=ContextRealtimeData.from_json(json['realtimeData']) if json.get('realtimeData', None) is not None else None,
+            realtime_data=ContextRealtimeData.from_json(_realtime_data) if (_realtime_data := json.get('realtimeData')) is not None else None,
         )
 
 
@@ -230,15 +244,15 @@ class AudioListener:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['listenerId'] = self.listener_id.to_json()
-        json['contextId'] = self.context_id.to_json()
+        json['listenerId'] = self.listener_id
+        json['contextId'] = self.context_id
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioListener:
+    def from_json(cls, json: AudioListenerJSON) -> AudioListener:
         return cls(
-            listener_id=GraphObjectId.from_json(json['listenerId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
+            listener_id=GraphObjectId(json['listenerId']),
+            context_id=GraphObjectId(json['contextId']),
         )
 
 
@@ -265,22 +279,22 @@ class AudioNode:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['nodeId'] = self.node_id.to_json()
-        json['contextId'] = self.context_id.to_json()
-        json['nodeType'] = self.node_type.to_json()
+        json['nodeId'] = self.node_id
+        json['contextId'] = self.context_id
+        json['nodeType'] = self.node_type
         json['numberOfInputs'] = self.number_of_inputs
         json['numberOfOutputs'] = self.number_of_outputs
         json['channelCount'] = self.channel_count
-        json['channelCountMode'] = self.channel_count_mode.to_json()
-        json['channelInterpretation'] = self.channel_interpretation.to_json()
+        json['channelCountMode'] = self.channel_count_mode.value
+        json['channelInterpretation'] = self.channel_interpretation.value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioNode:
+    def from_json(cls, json: AudioNodeJSON) -> AudioNode:
         return cls(
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_type=NodeType.from_json(json['nodeType']),
+            node_id=GraphObjectId(json['nodeId']),
+            context_id=GraphObjectId(json['contextId']),
+            node_type=NodeType(json['nodeType']),
             number_of_inputs=float(json['numberOfInputs']),
             number_of_outputs=float(json['numberOfOutputs']),
             channel_count=float(json['channelCount']),
@@ -312,23 +326,23 @@ class AudioParam:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['paramId'] = self.param_id.to_json()
-        json['nodeId'] = self.node_id.to_json()
-        json['contextId'] = self.context_id.to_json()
-        json['paramType'] = self.param_type.to_json()
-        json['rate'] = self.rate.to_json()
+        json['paramId'] = self.param_id
+        json['nodeId'] = self.node_id
+        json['contextId'] = self.context_id
+        json['paramType'] = self.param_type
+        json['rate'] = self.rate.value
         json['defaultValue'] = self.default_value
         json['minValue'] = self.min_value
         json['maxValue'] = self.max_value
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioParam:
+    def from_json(cls, json: AudioParamJSON) -> AudioParam:
         return cls(
-            param_id=GraphObjectId.from_json(json['paramId']),
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
-            param_type=ParamType.from_json(json['paramType']),
+            param_id=GraphObjectId(json['paramId']),
+            node_id=GraphObjectId(json['nodeId']),
+            context_id=GraphObjectId(json['contextId']),
+            param_type=ParamType(json['paramType']),
             rate=AutomationRate.from_json(json['rate']),
             default_value=float(json['defaultValue']),
             min_value=float(json['minValue']),
@@ -336,29 +350,27 @@ class AudioParam:
         )
 
 
-def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def enable() -> Command[T_JSON_DICT, None]:
     '''
     Enables the WebAudio domain and starts sending context lifetime events.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAudio.enable',
-    }
-    json = yield cmd_dict
+    return Command('WebAudio.enable')
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disables the WebAudio domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAudio.disable',
-    }
-    json = yield cmd_dict
+    return Command('WebAudio.disable')
+
+
+def _parse_get_realtime_data(json: GetRealtimeDataReturnsJSON) -> ContextRealtimeData:
+    return ContextRealtimeData.from_json(json['realtimeData'])
 
 
 def get_realtime_data(
         context_id: GraphObjectId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ContextRealtimeData]:
+    ) -> Command[GetRealtimeDataReturnsJSON, ContextRealtimeData]:
     '''
     Fetch the realtime data from the registered contexts.
 
@@ -366,13 +378,8 @@ def get_realtime_data(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['contextId'] = context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAudio.getRealtimeData',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return ContextRealtimeData.from_json(json['realtimeData'])
+    params['contextId'] = context_id
+    return Command('WebAudio.getRealtimeData', params, _parse_get_realtime_data)
 
 
 @event_class('WebAudio.contextCreated')
@@ -384,7 +391,7 @@ class ContextCreated:
     context: BaseAudioContext
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContextCreated:
+    def from_json(cls, json: ContextCreatedJSON) -> ContextCreated:
         return cls(
             context=BaseAudioContext.from_json(json['context'])
         )
@@ -399,9 +406,9 @@ class ContextWillBeDestroyed:
     context_id: GraphObjectId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContextWillBeDestroyed:
+    def from_json(cls, json: ContextWillBeDestroyedJSON) -> ContextWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId'])
+            context_id=GraphObjectId(json['contextId'])
         )
 
 
@@ -414,7 +421,7 @@ class ContextChanged:
     context: BaseAudioContext
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> ContextChanged:
+    def from_json(cls, json: ContextChangedJSON) -> ContextChanged:
         return cls(
             context=BaseAudioContext.from_json(json['context'])
         )
@@ -429,7 +436,7 @@ class AudioListenerCreated:
     listener: AudioListener
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioListenerCreated:
+    def from_json(cls, json: AudioListenerCreatedJSON) -> AudioListenerCreated:
         return cls(
             listener=AudioListener.from_json(json['listener'])
         )
@@ -445,10 +452,10 @@ class AudioListenerWillBeDestroyed:
     listener_id: GraphObjectId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioListenerWillBeDestroyed:
+    def from_json(cls, json: AudioListenerWillBeDestroyedJSON) -> AudioListenerWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            listener_id=GraphObjectId.from_json(json['listenerId'])
+            context_id=GraphObjectId(json['contextId']),
+            listener_id=GraphObjectId(json['listenerId'])
         )
 
 
@@ -461,7 +468,7 @@ class AudioNodeCreated:
     node: AudioNode
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioNodeCreated:
+    def from_json(cls, json: AudioNodeCreatedJSON) -> AudioNodeCreated:
         return cls(
             node=AudioNode.from_json(json['node'])
         )
@@ -477,10 +484,10 @@ class AudioNodeWillBeDestroyed:
     node_id: GraphObjectId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioNodeWillBeDestroyed:
+    def from_json(cls, json: AudioNodeWillBeDestroyedJSON) -> AudioNodeWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_id=GraphObjectId.from_json(json['nodeId'])
+            context_id=GraphObjectId(json['contextId']),
+            node_id=GraphObjectId(json['nodeId'])
         )
 
 
@@ -493,7 +500,7 @@ class AudioParamCreated:
     param: AudioParam
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioParamCreated:
+    def from_json(cls, json: AudioParamCreatedJSON) -> AudioParamCreated:
         return cls(
             param=AudioParam.from_json(json['param'])
         )
@@ -510,11 +517,11 @@ class AudioParamWillBeDestroyed:
     param_id: GraphObjectId
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> AudioParamWillBeDestroyed:
+    def from_json(cls, json: AudioParamWillBeDestroyedJSON) -> AudioParamWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            param_id=GraphObjectId.from_json(json['paramId'])
+            context_id=GraphObjectId(json['contextId']),
+            node_id=GraphObjectId(json['nodeId']),
+            param_id=GraphObjectId(json['paramId'])
         )
 
 
@@ -531,13 +538,13 @@ class NodesConnected:
     destination_input_index: typing.Optional[float]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodesConnected:
+    def from_json(cls, json: NodesConnectedJSON) -> NodesConnected:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None,
-            destination_input_index=float(json['destinationInputIndex']) if json.get('destinationInputIndex', None) is not None else None
+            context_id=GraphObjectId(json['contextId']),
+            source_id=GraphObjectId(json['sourceId']),
+            destination_id=GraphObjectId(json['destinationId']),
+            source_output_index=float(_source_output_index) if (_source_output_index := json.get('sourceOutputIndex')) is not None else None,
+            destination_input_index=float(_destination_input_index) if (_destination_input_index := json.get('destinationInputIndex')) is not None else None
         )
 
 
@@ -554,13 +561,13 @@ class NodesDisconnected:
     destination_input_index: typing.Optional[float]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodesDisconnected:
+    def from_json(cls, json: NodesDisconnectedJSON) -> NodesDisconnected:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None,
-            destination_input_index=float(json['destinationInputIndex']) if json.get('destinationInputIndex', None) is not None else None
+            context_id=GraphObjectId(json['contextId']),
+            source_id=GraphObjectId(json['sourceId']),
+            destination_id=GraphObjectId(json['destinationId']),
+            source_output_index=float(_source_output_index) if (_source_output_index := json.get('sourceOutputIndex')) is not None else None,
+            destination_input_index=float(_destination_input_index) if (_destination_input_index := json.get('destinationInputIndex')) is not None else None
         )
 
 
@@ -576,12 +583,12 @@ class NodeParamConnected:
     source_output_index: typing.Optional[float]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodeParamConnected:
+    def from_json(cls, json: NodeParamConnectedJSON) -> NodeParamConnected:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None
+            context_id=GraphObjectId(json['contextId']),
+            source_id=GraphObjectId(json['sourceId']),
+            destination_id=GraphObjectId(json['destinationId']),
+            source_output_index=float(_source_output_index) if (_source_output_index := json.get('sourceOutputIndex')) is not None else None
         )
 
 
@@ -597,10 +604,144 @@ class NodeParamDisconnected:
     source_output_index: typing.Optional[float]
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> NodeParamDisconnected:
+    def from_json(cls, json: NodeParamDisconnectedJSON) -> NodeParamDisconnected:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None
+            context_id=GraphObjectId(json['contextId']),
+            source_id=GraphObjectId(json['sourceId']),
+            destination_id=GraphObjectId(json['destinationId']),
+            source_output_index=float(_source_output_index) if (_source_output_index := json.get('sourceOutputIndex')) is not None else None
         )
+
+
+if typing.TYPE_CHECKING:
+    class ContextRealtimeDataJSON(typing.TypedDict):
+        currentTime: float
+        renderCapacity: float
+        callbackIntervalMean: float
+        callbackIntervalVariance: float
+
+
+    class _BaseAudioContextJSON(typing.TypedDict):
+        contextId: str
+        contextType: str
+        contextState: str
+        callbackBufferSize: float
+        maxOutputChannelCount: float
+        sampleRate: float
+
+
+    class BaseAudioContextJSON(_BaseAudioContextJSON, total=False):
+        realtimeData: ContextRealtimeDataJSON
+
+
+    class AudioListenerJSON(typing.TypedDict):
+        listenerId: str
+        contextId: str
+
+
+    class AudioNodeJSON(typing.TypedDict):
+        nodeId: str
+        contextId: str
+        nodeType: str
+        numberOfInputs: float
+        numberOfOutputs: float
+        channelCount: float
+        channelCountMode: str
+        channelInterpretation: str
+
+
+    class AudioParamJSON(typing.TypedDict):
+        paramId: str
+        nodeId: str
+        contextId: str
+        paramType: str
+        rate: str
+        defaultValue: float
+        minValue: float
+        maxValue: float
+
+
+    class GetRealtimeDataReturnsJSON(typing.TypedDict):
+        realtimeData: ContextRealtimeDataJSON
+
+
+    class ContextCreatedJSON(typing.TypedDict):
+        context: BaseAudioContextJSON
+
+
+    class ContextWillBeDestroyedJSON(typing.TypedDict):
+        contextId: str
+
+
+    class ContextChangedJSON(typing.TypedDict):
+        context: BaseAudioContextJSON
+
+
+    class AudioListenerCreatedJSON(typing.TypedDict):
+        listener: AudioListenerJSON
+
+
+    class AudioListenerWillBeDestroyedJSON(typing.TypedDict):
+        contextId: str
+        listenerId: str
+
+
+    class AudioNodeCreatedJSON(typing.TypedDict):
+        node: AudioNodeJSON
+
+
+    class AudioNodeWillBeDestroyedJSON(typing.TypedDict):
+        contextId: str
+        nodeId: str
+
+
+    class AudioParamCreatedJSON(typing.TypedDict):
+        param: AudioParamJSON
+
+
+    class AudioParamWillBeDestroyedJSON(typing.TypedDict):
+        contextId: str
+        nodeId: str
+        paramId: str
+
+
+    class _NodesConnectedJSON(typing.TypedDict):
+        contextId: str
+        sourceId: str
+        destinationId: str
+
+
+    class NodesConnectedJSON(_NodesConnectedJSON, total=False):
+        sourceOutputIndex: float
+        destinationInputIndex: float
+
+
+    class _NodesDisconnectedJSON(typing.TypedDict):
+        contextId: str
+        sourceId: str
+        destinationId: str
+
+
+    class NodesDisconnectedJSON(_NodesDisconnectedJSON, total=False):
+        sourceOutputIndex: float
+        destinationInputIndex: float
+
+
+    class _NodeParamConnectedJSON(typing.TypedDict):
+        contextId: str
+        sourceId: str
+        destinationId: str
+
+
+    class NodeParamConnectedJSON(_NodeParamConnectedJSON, total=False):
+        sourceOutputIndex: float
+
+
+    class _NodeParamDisconnectedJSON(typing.TypedDict):
+        contextId: str
+        sourceId: str
+        destinationId: str
+
+
+    class NodeParamDisconnectedJSON(_NodeParamDisconnectedJSON, total=False):
+        sourceOutputIndex: float
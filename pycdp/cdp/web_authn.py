@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import Command, dataclass, event_class, T_JSON_DICT
 
 
 class AuthenticatorId(str):
@@ -33,7 +32,10 @@ class AuthenticatorProtocol(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorProtocol:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class Ctap2Version(enum.Enum):
@@ -45,7 +47,10 @@ class Ctap2Version(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> Ctap2Version:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 class AuthenticatorTransport(enum.Enum):
@@ -60,7 +65,10 @@ class AuthenticatorTransport(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorTransport:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]  # type: ignore
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -118,10 +126,10 @@ class VirtualAuthenticatorOptions:
 
     def to_json(self) -> T_JSON_DICT:
         json: T_JSON_DICT = dict()
-        json['protocol'] = self.protocol.to_json()
-        json['transport'] = self.transport.to_json()
+        json['protocol'] = self.protocol.value
+        json['transport'] = self.transport.value
         if self.ctap2_version is not None:
-            json['ctap2Version'] = self.ctap2_version.to_json()
+            json['ctap2Version'] = self.ctap2_version.value
         if self.has_resident_key is not None:
             json['hasResidentKey'] = self.has_resident_key
         if self.has_user_verification is not None:
@@ -145,21 +153,21 @@ class VirtualAuthenticatorOptions:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> VirtualAuthenticatorOptions:
+    def from_json(cls, json: VirtualAuthenticatorOptionsJSON) -> VirtualAuthenticatorOptions:
         return cls(
             protocol=AuthenticatorProtocol.from_json(json['protocol']),
             transport=AuthenticatorTransport.from_json(json['transport']),
-            ctap2_version=Ctap2Version.from_json(json['ctap2Version']) if json.get('ctap2Version', None) is not None else None,
-            has_resident_key=bool(json['hasResidentKey']) if json.get('hasResidentKey', None) is not None else None,
-            has_user_verification=bool(json['hasUserVerification']) if json.get('hasUserVerification', None) is not None else None,
-            has_large_blob=bool(json['hasLargeBlob']) if json.get('hasLargeBlob', None) is not None else None,
-            has_cred_blob=bool(json['hasCredBlob']) if json.get('hasCredBlob', None) is not None else None,
-            has_min_pin_length=bool(json['hasMinPinLength']) if json.get('hasMinPinLength', None) is not None else None,
-            has_prf=bool(json['hasPrf']) if json.get('hasPrf', None) is not None else None,
-            automatic_presence_simulation=bool(json['automaticPresenceSimulation']) if json.get('automaticPresenceSimulation', None) is not None else None,
-            is_user_verified=bool(json['isUserVerified']) if json.get('isUserVerified', None) is not None else None,
-            default_backup_eligibility=bool(json['defaultBackupEligibility']) if json.get('defaultBackupEligibility', None) is not None else None,
-            default_backup_state=bool(json['defaultBackupState']) if json.get('defaultBackupState', None) is not None else None,
+            ctap2_version=Ctap2Version.from_json(_ctap2_version) if (_ctap2_version := json.get('ctap2Version')) is not None else None,
+            has_resident_key=json.get('hasResidentKey'),
+            has_user_verification=json.get('hasUserVerification'),
+            has_large_blob=json.get('hasLargeBlob'),
+            has_cred_blob=json.get('hasCredBlob'),
+            has_min_pin_length=json.get('hasMinPinLength'),
+            has_prf=json.get('hasPrf'),
+            automatic_presence_simulation=json.get('automaticPresenceSimulation'),
+            is_user_verified=json.get('isUserVerified'),
+            default_backup_eligibility=json.get('defaultBackupEligibility'),
+            default_backup_state=json.get('defaultBackupState'),
         )
 
 
@@ -231,25 +239,25 @@ class Credential:
         return json
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> Credential:
+    def from_json(cls, json: CredentialJSON) -> Credential:
         return cls(
-            credential_id=str(json['credentialId']),
-            is_resident_credential=bool(json['isResidentCredential']),
-            private_key=str(json['privateKey']),
-            sign_count=int(json['signCount']),
-            rp_id=str(json['rpId']) if json.get('rpId', None) is not None else None,
-            user_handle=str(json['userHandle']) if json.get('userHandle', None) is not None else None,
-            large_blob=str(json['largeBlob']) if json.get('largeBlob', None) is not None else None,
-            backup_eligibility=bool(json['backupEligibility']) if json.get('backupEligibility', None) is not None else None,
-            backup_state=bool(json['backupState']) if json.get('backupState', None) is not None else None,
-            user_name=str(json['userName']) if json.get('userName', None) is not None else None,
-            user_display_name=str(json['userDisplayName']) if json.get('userDisplayName', None) is not None else None,
+            credential_id=json['credentialId'],
+            is_resident_credential=json['isResidentCredential'],
+            private_key=json['privateKey'],
+            sign_count=json['signCount'],
+            rp_id=json.get('rpId'),
+            user_handle=json.get('userHandle'),
+            large_blob=json.get('largeBlob'),
+            backup_eligibility=json.get('backupEligibility'),
+            backup_state=json.get('backupState'),
+            user_name=json.get('userName'),
+            user_display_name=json.get('userDisplayName'),
         )
 
 
 def enable(
         enable_ui: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Enable the WebAuthn domain and start intercepting credential storage and
     retrieval with a virtual authenticator.
@@ -259,26 +267,23 @@ def enable(
     params: T_JSON_DICT = dict()
     if enable_ui is not None:
         params['enableUI'] = enable_ui
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.enable',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.enable', params)
 
 
-def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+def disable() -> Command[T_JSON_DICT, None]:
     '''
     Disable the WebAuthn domain.
     '''
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.disable',
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.disable')
+
+
+def _parse_add_virtual_authenticator(json: AddVirtualAuthenticatorReturnsJSON) -> AuthenticatorId:
+    return AuthenticatorId(json['authenticatorId'])
 
 
 def add_virtual_authenticator(
         options: VirtualAuthenticatorOptions
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,AuthenticatorId]:
+    ) -> Command[AddVirtualAuthenticatorReturnsJSON, AuthenticatorId]:
     '''
     Creates and adds a virtual authenticator.
 
@@ -287,12 +292,7 @@ def add_virtual_authenticator(
     '''
     params: T_JSON_DICT = dict()
     params['options'] = options.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.addVirtualAuthenticator',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return AuthenticatorId.from_json(json['authenticatorId'])
+    return Command('WebAuthn.addVirtualAuthenticator', params, _parse_add_virtual_authenticator)
 
 
 def set_response_override_bits(
@@ -300,7 +300,7 @@ def set_response_override_bits(
         is_bogus_signature: typing.Optional[bool] = None,
         is_bad_uv: typing.Optional[bool] = None,
         is_bad_up: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Resets parameters isBogusSignature, isBadUV, isBadUP to false if they are not present.
 
@@ -310,41 +310,33 @@ def set_response_override_bits(
     :param is_bad_up: *(Optional)* If isBadUP is set, overrides the UP bit in the flags in the authenticator response to be zero. Defaults to false.
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     if is_bogus_signature is not None:
         params['isBogusSignature'] = is_bogus_signature
     if is_bad_uv is not None:
         params['isBadUV'] = is_bad_uv
     if is_bad_up is not None:
         params['isBadUP'] = is_bad_up
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.setResponseOverrideBits',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.setResponseOverrideBits', params)
 
 
 def remove_virtual_authenticator(
         authenticator_id: AuthenticatorId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes the given authenticator.
 
     :param authenticator_id:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.removeVirtualAuthenticator',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['authenticatorId'] = authenticator_id
+    return Command('WebAuthn.removeVirtualAuthenticator', params)
 
 
 def add_credential(
         authenticator_id: AuthenticatorId,
         credential: Credential
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Adds the credential to the specified authenticator.
 
@@ -352,19 +344,19 @@ def add_credential(
     :param credential:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['credential'] = credential.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.addCredential',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.addCredential', params)
+
+
+def _parse_get_credential(json: GetCredentialReturnsJSON) -> Credential:
+    return Credential.from_json(json['credential'])
 
 
 def get_credential(
         authenticator_id: AuthenticatorId,
         credential_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Credential]:
+    ) -> Command[GetCredentialReturnsJSON, Credential]:
     '''
     Returns a single credential stored in the given virtual authenticator that
     matches the credential ID.
@@ -374,19 +366,18 @@ def get_credential(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['credentialId'] = credential_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.getCredential',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Credential.from_json(json['credential'])
+    return Command('WebAuthn.getCredential', params, _parse_get_credential)
+
+
+def _parse_get_credentials(json: GetCredentialsReturnsJSON) -> typing.List[Credential]:
+    return [Credential.from_json(i) for i in json['credentials']]
 
 
 def get_credentials(
         authenticator_id: AuthenticatorId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Credential]]:
+    ) -> Command[GetCredentialsReturnsJSON, typing.List[Credential]]:
     '''
     Returns all the credentials stored in the given virtual authenticator.
 
@@ -394,19 +385,14 @@ def get_credentials(
     :returns: 
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.getCredentials',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return [Credential.from_json(i) for i in json['credentials']]
+    params['authenticatorId'] = authenticator_id
+    return Command('WebAuthn.getCredentials', params, _parse_get_credentials)
 
 
 def remove_credential(
         authenticator_id: AuthenticatorId,
         credential_id: str
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Removes a credential from the authenticator.
 
@@ -414,36 +400,28 @@ def remove_credential(
     :param credential_id:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['credentialId'] = credential_id
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.removeCredential',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.removeCredential', params)
 
 
 def clear_credentials(
         authenticator_id: AuthenticatorId
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Clears all the credentials from the specified device.
 
     :param authenticator_id:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.clearCredentials',
-        'params': params,
-    }
-    json = yield cmd_dict
+    params['authenticatorId'] = authenticator_id
+    return Command('WebAuthn.clearCredentials', params)
 
 
 def set_user_verified(
         authenticator_id: AuthenticatorId,
         is_user_verified: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets whether User Verification succeeds or fails for an authenticator.
     The default is true.
@@ -452,19 +430,15 @@ def set_user_verified(
     :param is_user_verified:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['isUserVerified'] = is_user_verified
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.setUserVerified',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.setUserVerified', params)
 
 
 def set_automatic_presence_simulation(
         authenticator_id: AuthenticatorId,
         enabled: bool
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Sets whether tests of user presence will succeed immediately (if true) or fail to resolve (if false) for an authenticator.
     The default is true.
@@ -473,13 +447,9 @@ def set_automatic_presence_simulation(
     :param enabled:
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.setAutomaticPresenceSimulation',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.setAutomaticPresenceSimulation', params)
 
 
 def set_credential_properties(
@@ -487,7 +457,7 @@ def set_credential_properties(
         credential_id: str,
         backup_eligibility: typing.Optional[bool] = None,
         backup_state: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    ) -> Command[T_JSON_DICT, None]:
     '''
     Allows setting credential properties.
     https://w3c.github.io/webauthn/#sctn-automation-set-credential-properties
@@ -498,17 +468,13 @@ def set_credential_properties(
     :param backup_state: *(Optional)*
     '''
     params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params['authenticatorId'] = authenticator_id
     params['credentialId'] = credential_id
     if backup_eligibility is not None:
         params['backupEligibility'] = backup_eligibility
     if backup_state is not None:
         params['backupState'] = backup_state
-    cmd_dict: T_JSON_DICT = {
-        'method': 'WebAuthn.setCredentialProperties',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return Command('WebAuthn.setCredentialProperties', params)
 
 
 @event_class('WebAuthn.credentialAdded')
@@ -521,9 +487,9 @@ class CredentialAdded:
     credential: Credential
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CredentialAdded:
+    def from_json(cls, json: CredentialAddedJSON) -> CredentialAdded:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
+            authenticator_id=AuthenticatorId(json['authenticatorId']),
             credential=Credential.from_json(json['credential'])
         )
 
@@ -539,10 +505,10 @@ class CredentialDeleted:
     credential_id: str
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CredentialDeleted:
+    def from_json(cls, json: CredentialDeletedJSON) -> CredentialDeleted:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
-            credential_id=str(json['credentialId'])
+            authenticator_id=AuthenticatorId(json['authenticatorId']),
+            credential_id=json['credentialId']
         )
 
 
@@ -557,9 +523,9 @@ class CredentialUpdated:
     credential: Credential
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CredentialUpdated:
+    def from_json(cls, json: CredentialUpdatedJSON) -> CredentialUpdated:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
+            authenticator_id=AuthenticatorId(json['authenticatorId']),
             credential=Credential.from_json(json['credential'])
         )
 
@@ -574,8 +540,77 @@ class CredentialAsserted:
     credential: Credential
 
     @classmethod
-    def from_json(cls, json: T_JSON_DICT) -> CredentialAsserted:
+    def from_json(cls, json: CredentialAssertedJSON) -> CredentialAsserted:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
+            authenticator_id=AuthenticatorId(json['authenticatorId']),
             credential=Credential.from_json(json['credential'])
         )
+
+
+if typing.TYPE_CHECKING:
+    class _VirtualAuthenticatorOptionsJSON(typing.TypedDict):
+        protocol: str
+        transport: str
+
+
+    class VirtualAuthenticatorOptionsJSON(_VirtualAuthenticatorOptionsJSON, total=False):
+        ctap2Version: str
+        hasResidentKey: bool
+        hasUserVerification: bool
+        hasLargeBlob: bool
+        hasCredBlob: bool
+        hasMinPinLength: bool
+        hasPrf: bool
+        automaticPresenceSimulation: bool
+        isUserVerified: bool
+        defaultBackupEligibility: bool
+        defaultBackupState: bool
+
+
+    class _CredentialJSON(typing.TypedDict):
+        credentialId: str
+        isResidentCredential: bool
+        privateKey: str
+        signCount: int
+
+
+    class CredentialJSON(_CredentialJSON, total=False):
+        rpId: str
+        userHandle: str
+        largeBlob: str
+        backupEligibility: bool
+        backupState: bool
+        userName: str
+        userDisplayName: str
+
+
+    class AddVirtualAuthenticatorReturnsJSON(typing.TypedDict):
+        authenticatorId: str
+
+
+    class GetCredentialReturnsJSON(typing.TypedDict):
+        credential: CredentialJSON
+
+
+    class GetCredentialsReturnsJSON(typing.TypedDict):
+        credentials: typing.List[CredentialJSON]
+
+
+    class CredentialAddedJSON(typing.TypedDict):
+        authenticatorId: str
+        credential: CredentialJSON
+
+
+    class CredentialDeletedJSON(typing.TypedDict):
+        authenticatorId: str
+        credentialId: str
+
+
+    class CredentialUpdatedJSON(typing.TypedDict):
+        authenticatorId: str
+        credential: CredentialJSON
+
+
+    class CredentialAssertedJSON(typing.TypedDict):
+        authenticatorId: str
+        credential: CredentialJSON
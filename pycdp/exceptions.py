@@ -36,6 +36,14 @@ class CDPSessionClosed(CDPError):
     pass
 
 
+class CDPTargetRecycled(CDPSessionClosed):
+    ''' Raised on the in-flight commands of a session whose target was closed and
+    replaced by a watchdog because it was unhealthy. '''
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
 class CDPInternalError(CDPError):
     ''' This exception is only raised when there is faulty logic in TrioCDP or
     the integration with PyCDP. '''
@@ -36,6 +36,31 @@ INIT_HEADER = """{}
 
 """.format(SHARED_HEADER)
 
+INIT_LOADER = """import typing
+import importlib
+from . import util
+from .util import UnknownEvent, UnknownObject
+
+if typing.TYPE_CHECKING:
+    from . import ({modules})
+
+# The domain modules are imported on first access, either as attributes of this
+# package or when an event of their domain is parsed.
+util.register_domains({{
+{domain_modules}
+}})
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in util._domain_modules.values():
+        return importlib.import_module(f'.{{name}}', __name__)
+    raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(util._domain_modules.values()))
+"""
+
 MODULE_HEADER = """{}
 #
 # CDP domain: {{}}{{}}
@@ -43,13 +68,29 @@ MODULE_HEADER = """{}
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import {{}}
 
 """.format(SHARED_HEADER)
 
+
+@dataclass
+class GeneratorOptions:
+    ''' Options that change the generated code. '''
+    #: Generate class types and events that decode their fields on first access.
+    lazy: bool = False
+    #: Generate docstrings and ``#:`` comments from the descriptions in the spec.
+    docstrings: bool = True
+    #: Generate ``TypedDict``s for the raw JSON of types, command results and events.
+    typed_dicts: bool = True
+
+
+options = GeneratorOptions()
+
 current_version = ''
 
+#: All parsed CDP types by their fully qualified ref, e.g. ``Page.FrameId``.
+type_registry: typing.Dict[str, 'CdpType'] = {}
+
 BACKTICK_RE = re.compile(r'`([^`]+)`(\w+)?')
 
 
@@ -84,7 +125,7 @@ def escape_backticks(docstr: str) -> str:
 
 def inline_doc(description) -> str:
     ''' Generate an inline doc, e.g. ``#: This type is a ...`` '''
-    if not description:
+    if not description or not options.docstrings:
         return ''
 
     description = escape_backticks(description)
@@ -94,7 +135,7 @@ def inline_doc(description) -> str:
 
 def docstring(description: typing.Optional[str]) -> str:
     ''' Generate a docstring from a description. '''
-    if not description:
+    if not description or not options.docstrings:
         return ''
     # if original description uses escape sequences it should be generated as a raw docstring
     description = escape_backticks(description)
@@ -140,6 +181,72 @@ def ref_to_python_domain(ref: str, domain: str) -> str:
     return ref_to_python(ref)
 
 
+def generate_lazy_fields(props: typing.Iterable['CdpProperty']) -> str:
+    ''' Generate the ``_lazy_fields`` table of a lazy class. '''
+    fields = '\n'.join(p.generate_lazy_field() for p in props)
+    if not fields:
+        return '_lazy_fields = {}'
+    return '_lazy_fields = {\n' + indent(fields, 4) + '\n}'
+
+
+
+def json_annotation(type_: typing.Optional[str], ref: typing.Optional[str],
+        items: typing.Optional['CdpItems'], domain: str) -> str:
+    ''' Return the type annotation of a raw JSON value, as used in ``TypedDict``s. '''
+    if ref:
+        target = resolve_ref(ref, domain)
+        if target is None:
+            return 'typing.Any'
+        elif target.enum:
+            return 'str'
+        elif target.properties:
+            return ref_to_python_domain(ref, domain) + 'JSON'
+        ref_domain = ref.split('.')[0] if '.' in ref else domain
+        return json_annotation(target.type, None, target.items, ref_domain)
+    elif items:
+        return f'typing.List[{json_annotation(items.type, items.ref, None, domain)}]'
+    return CdpPrimitiveType.get_annotation(type_)
+
+
+def generate_typed_dict(name: str, props: typing.Iterable['CdpProperty']) -> str:
+    '''
+    Generate a ``TypedDict`` named ``name`` for the raw JSON of an object with the
+    given properties. Optional properties are declared in a ``total=False`` subclass.
+    '''
+    def body(props):
+        return indent('\n'.join(f'{p.name}: {p.json_annotation}' for p in props), 4)
+    required = [p for p in props if not p.optional]
+    optional = [p for p in props if p.optional]
+    if required and optional:
+        code = f'class _{name}(typing.TypedDict):\n{body(required)}\n\n\n'
+        code += f'class {name}(_{name}, total=False):\n{body(optional)}'
+    elif optional:
+        code = f'class {name}(typing.TypedDict, total=False):\n{body(optional)}'
+    else:
+        code = f'class {name}(typing.TypedDict):\n{body(required)}'
+    return code
+
+
+def resolve_ref(ref: str, domain: str) -> typing.Optional['CdpType']:
+    ''' Return the CDP type a ``$ref`` from ``domain`` points to, if it was parsed. '''
+    return type_registry.get(ref if '.' in ref else f'{domain}.{ref}')
+
+
+def ref_kind(ref: str, domain: str) -> typing.Optional[str]:
+    '''
+    Return how the type a ``$ref`` points to is represented: ``enum``, ``class`` or
+    ``primitive`` (a subclass of a builtin type). Returns ``None`` for unknown types.
+    '''
+    type_ = resolve_ref(ref, domain)
+    if type_ is None:
+        return None
+    elif type_.enum:
+        return 'enum'
+    elif type_.properties:
+        return 'class'
+    return 'primitive'
+
+
 class CdpPrimitiveType(Enum):
     ''' All of the CDP types that map directly to a Python type. '''
     boolean = 'bool'
@@ -157,13 +264,13 @@ class CdpPrimitiveType(Enum):
             return cls[cdp_type].value
 
     @classmethod
-    def get_constructor(cls, cdp_type, val):
-        ''' Return the code to construct a value for a given CDP type. '''
-        if cdp_type == 'any':
-            return val
-        else:
-            cons = cls[cdp_type].value
-            return f'{cons}({val})'
+    def get_constructor(cls, cdp_type, val) -> typing.Optional[str]:
+        ''' Return the code to construct a value for a given CDP type, or ``None`` if
+        the decoded JSON value already has the right Python type. '''
+        if cdp_type == 'number':
+            # JSON numbers without a fractional part are decoded as int
+            return f'float({val})'
+        return None
 
 
 @dataclass
@@ -218,6 +325,11 @@ class CdpProperty:
             ann = f'typing.Optional[{ann}]'
         return ann
 
+    @property
+    def json_annotation(self) -> str:
+        ''' The type annotation of this property's raw JSON value. '''
+        return json_annotation(self.type, self.ref, self.items, self.domain)
+
     @classmethod
     def from_json(cls, prop, domain: str) -> 'CdpProperty':
         ''' Instantiate a CDP property from a JSON object. '''
@@ -244,21 +356,32 @@ class CdpProperty:
             code += ' = None'
         return code
 
+    def generate_encode(self, value: str) -> str:
+        ''' Generate the expression that converts ``value`` of this property to JSON. '''
+        if self.items:
+            if not self.items.ref:
+                return f'list({value})'
+            kind = ref_kind(self.items.ref, self.domain)
+            if kind == 'primitive':
+                return f'list({value})'
+            elif kind == 'enum':
+                return f'[i.value for i in {value}]'
+            return f'[i.to_json() for i in {value}]'
+        elif self.ref:
+            kind = ref_kind(self.ref, self.domain)
+            if kind == 'primitive':
+                # subclasses of builtin types are already valid JSON values
+                return value
+            elif kind == 'enum':
+                return f'{value}.value'
+            return f'{value}.to_json()'
+        return value
+
     def generate_to_json(self, dict_: str, use_self: bool=True) -> str:
         ''' Generate the code that exports this property to the specified JSON
         dict. '''
         self_ref = 'self.' if use_self else ''
-        assign = f"{dict_}['{self.name}'] = "
-        if self.items:
-            if self.items.ref:
-                assign += f"[i.to_json() for i in {self_ref}{self.py_name}]"
-            else:
-                assign += f"[i for i in {self_ref}{self.py_name}]"
-        else:
-            if self.ref:
-                assign += f"{self_ref}{self.py_name}.to_json()"
-            else:
-                assign += f"{self_ref}{self.py_name}"
+        assign = f"{dict_}['{self.name}'] = " + self.generate_encode(f'{self_ref}{self.py_name}')
         if self.optional:
             code = dedent(f'''\
                 if {self_ref}{self.py_name} is not None:
@@ -267,26 +390,46 @@ class CdpProperty:
             code = assign
         return code
 
-    def generate_from_json(self, dict_) -> str:
-        ''' Generate the code that creates an instance from a JSON dict named
-        ``dict_``. '''
+    def generate_decode(self, value: str) -> typing.Optional[str]:
+        ''' Generate the expression that converts the JSON ``value`` of this property,
+        or return ``None`` if the JSON value can be used as is. '''
         if self.items:
             if self.items.ref:
                 py_ref = ref_to_python_domain(self.items.ref, self.domain)
-                expr = f"[{py_ref}.from_json(i) for i in {dict_}['{self.name}']]"
-            else:
-                cons = CdpPrimitiveType.get_constructor(self.items.type, 'i')
-                expr = f"[{cons} for i in {dict_}['{self.name}']]"
-        else:
-            if self.ref:
-                py_ref = ref_to_python_domain(self.ref, self.domain)
-                expr = f"{py_ref}.from_json({dict_}['{self.name}'])"
-            else:
-                expr = CdpPrimitiveType.get_constructor(self.type,
-                    f"{dict_}['{self.name}']")
+                if ref_kind(self.items.ref, self.domain) == 'primitive':
+                    return f"[{py_ref}(i) for i in {value}]"
+                return f"[{py_ref}.from_json(i) for i in {value}]"
+            cons = CdpPrimitiveType.get_constructor(self.items.type, 'i')
+            if cons is None:
+                return None
+            return f"[{cons} for i in {value}]"
+        elif self.ref:
+            py_ref = ref_to_python_domain(self.ref, self.domain)
+            if ref_kind(self.ref, self.domain) == 'primitive':
+                return f"{py_ref}({value})"
+            return f"{py_ref}.from_json({value})"
+        return CdpPrimitiveType.get_constructor(self.type, value)
+
+    def generate_from_json(self, dict_) -> str:
+        ''' Generate the code that creates an instance from a JSON dict named
+        ``dict_``. '''
         if self.optional:
-            expr = f"{expr} if {dict_}.get('{self.name}', None) is not None else None"
-        return expr
+            # look the key up once, binding the value to a local for conversion. Each
+            # property has its own local so type checkers can infer its JSON type.
+            local = f'_{self.py_name}'
+            expr = self.generate_decode(local)
+            if expr is None:
+                return f"{dict_}.get('{self.name}')"
+            return f"{expr} if ({local} := {dict_}.get('{self.name}')) is not None else None"
+        value = f"{dict_}['{self.name}']"
+        return self.generate_decode(value) or value
+
+    def generate_lazy_field(self) -> str:
+        ''' Generate the entry of this property in ``LazyObject._lazy_fields``. '''
+        expr = self.generate_decode('v')
+        # the decoders run after the module is loaded, so they may refer to any class
+        decode = 'None' if expr is None else f'lambda v: {expr}'
+        return f"'{self.py_name}': ('{self.name}', {decode}, {self.optional}),"
 
 
 @dataclass
@@ -311,6 +454,17 @@ class CdpType:
             [CdpProperty.from_json(p, domain) for p in type_.get('properties', list())],
         )
 
+    @property
+    def json_name(self) -> str:
+        ''' The name of the ``TypedDict`` for the raw JSON of this type. '''
+        return f'{self.id}JSON'
+
+    def generate_typed_dict(self) -> typing.Optional[str]:
+        ''' Generate the ``TypedDict`` for a class type, or ``None`` for other types. '''
+        if self.enum or not self.properties:
+            return None
+        return generate_typed_dict(self.json_name, self.properties)
+
     def generate_code(self) -> str:
         ''' Generate Python code for this type. '''
         logger.debug('Generating type %s: %s', self.id, self.type)
@@ -371,10 +525,14 @@ class CdpType:
             def to_json(self) -> str:
                 return self.value''')
 
+        # Enum.__call__ is slow, look the member up in the value -> member map first
         def_from_json = dedent(f'''\
             @classmethod
             def from_json(cls, json: str) -> {self.id}:
-                return cls(json)''')
+                try:
+                    return cls._value2member_map_[json]  # type: ignore
+                except KeyError:
+                    return cls(json)''')
 
         code = f'class {self.id}(enum.Enum):\n'
         doc = docstring(self.description)
@@ -396,10 +554,10 @@ class CdpType:
         Top-level types that are defined as a CDP ``object`` are turned into Python
         dataclasses.
         '''
-        # children = set()
+        base = '(LazyObject)' if options.lazy else ''
         code = dedent(f'''\
             @dataclass
-            class {self.id}:\n''')
+            class {self.id}{base}:\n''')
         doc = docstring(self.description)
         if doc:
             code += indent(doc, 4) + '\n'
@@ -424,11 +582,17 @@ class CdpType:
         def_to_json += indent('return json', 4)
         code += indent(def_to_json, 4) + '\n\n'
 
+        if options.lazy:
+            # from_json() is inherited from LazyObject
+            code += indent(generate_lazy_fields(props), 4)
+            return code
+
         # Emit from_json() method. The properties are sorted in the same order
         # as above for readability.
+        json_type = self.json_name if options.typed_dicts else 'T_JSON_DICT'
         def_from_json = dedent(f'''\
             @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.id}:
+            def from_json(cls, json: {json_type}) -> {self.id}:
                 return cls(
         ''')
         from_jsons = list()
@@ -576,6 +740,18 @@ class CdpCommand:
         ''' Get a Python name for this command. '''
         return snake_case(self.name)
 
+    @property
+    def json_name(self) -> str:
+        ''' The name of the ``TypedDict`` for the raw JSON result of this command. '''
+        return f'{self.name[0].upper()}{self.name[1:]}ReturnsJSON'
+
+    def generate_typed_dict(self) -> typing.Optional[str]:
+        ''' Generate the ``TypedDict`` for the result, or ``None`` if there are no
+        return values. '''
+        if not self.returns:
+            return None
+        return generate_typed_dict(self.json_name, self.returns)
+
     @classmethod
     def from_json(cls, command, domain) -> 'CdpCommand':
         ''' Instantiate a CDP command from a JSON object. '''
@@ -592,20 +768,46 @@ class CdpCommand:
             domain
         )
 
+    @property
+    def py_result_annotation(self) -> str:
+        ''' The Python type annotation of the parsed result of this command. '''
+        if len(self.returns) == 0:
+            return 'None'
+        elif len(self.returns) == 1:
+            return self.returns[0].py_annotation
+        nested_types = ', '.join(r.py_annotation for r in self.returns)
+        return f'typing.Tuple[{nested_types}]'
+
+    @property
+    def parser_name(self) -> str:
+        ''' The name of the function that parses the result of this command. '''
+        return f'_parse_{self.py_name}'
+
+    def generate_parser(self) -> str:
+        ''' Generate the function that parses the JSON result of this command. '''
+        json_type = self.json_name if options.typed_dicts else 'T_JSON_DICT'
+        code = f'def {self.parser_name}(json: {json_type}) -> {self.py_result_annotation}:\n'
+        if len(self.returns) == 1:
+            ret = self.returns[0].generate_return(dict_='json')
+            code += indent(f'return {ret}', 4)
+        else:
+            ret = 'return (\n'
+            expr = ',\n'.join(r.generate_return(dict_='json') for r in self.returns)
+            ret += indent(expr, 4)
+            ret += '\n)'
+            code += indent(ret, 4)
+        return code
+
     def generate_code(self) -> str:
         ''' Generate code for a CDP command. '''
         global current_version
         # Generate the function header
-        if len(self.returns) == 0:
-            ret_type = 'None'
-        elif len(self.returns) == 1:
-            ret_type = self.returns[0].py_annotation
-        else:
-            nested_types = ', '.join(r.py_annotation for r in self.returns)
-            ret_type = f'typing.Tuple[{nested_types}]'
-        ret_type = f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]"
+        send_type = self.json_name if self.returns and options.typed_dicts else 'T_JSON_DICT'
+        ret_type = f"Command[{send_type}, {self.py_result_annotation}]"
 
         code = ''
+        if self.returns:
+            code += self.generate_parser() + '\n\n\n'
 
         if self.deprecated:
             code += f'@deprecated(version="{current_version}")\n'
@@ -657,23 +859,12 @@ class CdpCommand:
             for p in self.parameters)
         code += indent('\n'.join(assigns), 4)
         code += '\n'
-        code += indent('cmd_dict: T_JSON_DICT = {\n', 4)
-        code += indent(f"'method': '{self.domain}.{self.name}',\n", 8)
-        if self.parameters:
-            code += indent("'params': params,\n", 8)
-        code += indent('}\n', 4)
-        code += indent('json = yield cmd_dict', 4)
-        if len(self.returns) == 0:
-            pass
-        elif len(self.returns) == 1:
-            ret = self.returns[0].generate_return(dict_='json')
-            code += indent(f'\nreturn {ret}', 4)
-        else:
-            ret = '\nreturn (\n'
-            expr = ',\n'.join(r.generate_return(dict_='json') for r in self.returns)
-            ret += indent(expr, 4)
-            ret += '\n)'
-            code += indent(ret, 4)
+        args = [f"'{self.domain}.{self.name}'"]
+        if self.parameters or self.returns:
+            args.append('params' if self.parameters else 'None')
+        if self.returns:
+            args.append(self.parser_name)
+        code += indent(f"return Command({', '.join(args)})", 4)
         return code
 
     def get_refs(self):
@@ -702,6 +893,18 @@ class CdpEvent:
         ''' Return the Python class name for this event. '''
         return inflection.camelize(self.name, uppercase_first_letter=True)
 
+    @property
+    def json_name(self) -> str:
+        ''' The name of the ``TypedDict`` for the raw JSON params of this event. '''
+        return f'{self.py_name}JSON'
+
+    def generate_typed_dict(self) -> typing.Optional[str]:
+        ''' Generate the ``TypedDict`` for the params, or ``None`` if there are no
+        parameters. '''
+        if not self.parameters:
+            return None
+        return generate_typed_dict(self.json_name, self.parameters)
+
     @classmethod
     def from_json(cls, json: dict, domain: str):
         ''' Create a new CDP event instance from a JSON dict. '''
@@ -718,10 +921,11 @@ class CdpEvent:
     def generate_code(self) -> str:
         ''' Generate code for a CDP event. '''
         global current_version
+        base = '(LazyObject)' if options.lazy else ''
         code = dedent(f'''\
             @event_class('{self.domain}.{self.name}')
             @dataclass
-            class {self.py_name}:''')
+            class {self.py_name}{base}:''')
 
         if self.deprecated:
             code = f'@deprecated(version="{current_version}")\n' + code
@@ -740,9 +944,13 @@ class CdpEvent:
         code += indent(
             '\n'.join(p.generate_decl() for p in self.parameters), 4)
         code += '\n\n'
+        if options.lazy:
+            code += indent(generate_lazy_fields(self.parameters), 4)
+            return code
+        json_type = self.json_name if self.parameters and options.typed_dicts else 'T_JSON_DICT'
         def_from_json = dedent(f'''\
             @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.py_name}:
+            def from_json(cls, json: {json_type}) -> {self.py_name}:
                 return cls(
         ''')
         code += indent(def_from_json, 4)
@@ -802,8 +1010,15 @@ class CdpDomain:
     def generate_code(self) -> str:
         ''' Generate the Python module code for a given CDP domain. '''
         exp = ' (experimental)' if self.experimental else ''
-        code = MODULE_HEADER.format(self.domain, exp)
         import_code = self.generate_imports()
+        imports = ['dataclass', 'event_class', 'T_JSON_DICT']
+        if self.commands:
+            imports.insert(0, 'Command')
+        if options.lazy:
+            imports.insert(0, 'LazyObject')
+        if 'lazy_import(' in import_code:
+            imports.insert(-1, 'lazy_import')
+        code = MODULE_HEADER.format(self.domain, exp, ', '.join(imports))
         if import_code:
             code += import_code
             code += '\n\n'
@@ -816,30 +1031,36 @@ class CdpDomain:
         )
         code += '\n\n\n'.join(item.generate_code() for item in item_iter)
         code += '\n'
+        typed_dicts = self.generate_typed_dicts() if options.typed_dicts else ''
+        if typed_dicts:
+            code += '\n\n' + typed_dicts
         return code
 
-    def generate_imports(self):
+    def generate_typed_dicts(self) -> str:
         '''
-        Determine which modules this module depends on and emit the code to
-        import those modules.
-
-        Notice that CDP defines a ``dependencies`` field for each domain, but
-        these dependencies are a subset of the modules that we actually need to
-        import to make our Python code work correctly and type safe. So we
-        ignore the CDP's declared dependencies and compute them ourselves.
+        Generate the ``TypedDict``s for the raw JSON of the class types, command results
+        and events of this domain. They only exist for type checkers, so they don't add
+        to the import time of the module.
         '''
+        items: typing.Iterator[typing.Union[CdpType, CdpCommand, CdpEvent]] = itertools.chain(
+            self.types, self.commands, self.events
+        )
+        typed_dicts = [code for item in items if (code := item.generate_typed_dict())]
+        if not typed_dicts:
+            return ''
+        code = 'if typing.TYPE_CHECKING:\n'
+        code += indent('\n\n\n'.join(typed_dicts), 4)
+        code += '\n'
+        return code
+
+    def get_dependencies(self) -> typing.Set[str]:
+        ''' Return the names of the other domains this domain refers to. '''
         refs = set()
-        needs_deprecation = False
-        for type_ in self.types:
-            refs |= type_.get_refs()
-        for command in self.commands:
-            refs |= command.get_refs()
-            if command.deprecated:
-                needs_deprecation = True
-        for event in self.events:
-            refs |= event.get_refs()
-            if event.deprecated:
-                needs_deprecation = True
+        items: typing.Iterator[typing.Union[CdpType, CdpCommand, CdpEvent]] = itertools.chain(
+            self.types, self.commands, self.events
+        )
+        for item in items:
+            refs |= item.get_refs()
         dependencies = set()
         for ref in refs:
             try:
@@ -847,8 +1068,48 @@ class CdpDomain:
             except ValueError:
                 continue
             if domain != self.domain:
-                dependencies.add(snake_case(domain))
-        code = '\n'.join(f'from . import {d}' for d in sorted(dependencies))
+                dependencies.add(domain)
+        return dependencies
+
+    def prune(self, drop_deprecated: bool=False, drop_experimental: bool=False):
+        '''
+        Remove the deprecated and/or experimental commands and events, and such optional
+        properties, parameters and return values. Required members are kept because the
+        protocol can't work without them.
+        '''
+        def keep(item) -> bool:
+            return not ((drop_deprecated and item.deprecated) or (drop_experimental and item.experimental))
+        def keep_member(prop: CdpProperty) -> bool:
+            return not prop.optional or keep(prop)
+        self.commands = [c for c in self.commands if keep(c)]
+        self.events = [e for e in self.events if keep(e)]
+        for type_ in self.types:
+            type_.properties = [p for p in type_.properties if keep_member(p)]
+        for command in self.commands:
+            command.parameters = [p for p in command.parameters if keep_member(p)]
+            command.returns = [r for r in command.returns if keep_member(r)]
+        for event in self.events:
+            event.parameters = [p for p in event.parameters if keep_member(p)]
+
+    def generate_imports(self):
+        '''
+        Determine which modules this module depends on and emit the code to
+        import those modules.
+
+        Notice that CDP defines a ``dependencies`` field for each domain, but
+        these dependencies are a subset of the modules that we actually need to
+        import to make our Python code work correctly and type safe. So we
+        ignore the CDP's declared dependencies and compute them ourselves.
+        '''
+        needs_deprecation = any(item.deprecated for item in itertools.chain(self.commands, self.events))
+        dependencies = set(snake_case(domain) for domain in self.get_dependencies())
+        code = ''
+        if dependencies:
+            # the modules of other domains are imported when first used
+            code = 'if typing.TYPE_CHECKING:\n'
+            code += indent('\n'.join(f'from . import {d}' for d in sorted(dependencies)), 4)
+            code += '\nelse:\n'
+            code += indent('\n'.join(f'{d} = lazy_import({d!r}, globals())' for d in sorted(dependencies)), 4)
 
         if needs_deprecation:
             code += '\nfrom deprecated.sphinx import deprecated # type: ignore'
@@ -936,9 +1197,42 @@ def parse(json_path, output_path):
     domains = list()
     for domain in schema['domains']:
         domains.append(CdpDomain.from_json(domain))
+    for domain in domains:
+        for type_ in domain.types:
+            type_registry[f'{domain.domain}.{type_.id}'] = type_
     return domains
 
 
+def select_domains(domains: typing.List[CdpDomain], names: typing.Optional[typing.Iterable[str]]=None,
+        drop_deprecated: bool=False, drop_experimental: bool=False) -> typing.List[CdpDomain]:
+    '''
+    Return the domains to generate: the domains named in ``names`` (all of them if
+    ``None``) and the domains they refer to, transitively. Deprecated and/or experimental
+    members are pruned first, so they don't pull in other domains. Experimental domains
+    are dropped unless they are named or another domain refers to them.
+
+    :raises ValueError: if a name is not a domain of the spec
+    '''
+    by_name = {domain.domain: domain for domain in domains}
+    for domain in domains:
+        domain.prune(drop_deprecated, drop_experimental)
+    if names is None:
+        pending = [d.domain for d in domains if not (drop_experimental and d.experimental)]
+    else:
+        pending = list(names)
+        unknown = [name for name in pending if name not in by_name]
+        if unknown:
+            raise ValueError(f'unknown domains: {", ".join(unknown)}')
+    selected = set()
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        selected.add(name)
+        pending.extend(by_name[name].get_dependencies())
+    return [domain for domain in domains if domain.domain in selected]
+
+
 def generate_init(init_path, domains):
     '''
     Generate an ``__init__.py`` that exports the specified modules.
@@ -947,10 +1241,11 @@ def generate_init(init_path, domains):
     :param list[tuple] modules: a list of modules each represented as tuples
         of (name, list_of_exported_symbols)
     '''
+    modules = ', '.join(domain.module for domain in domains)
+    domain_modules = '\n'.join(f'{domain.domain!r}: {domain.module!r},' for domain in domains)
     with init_path.open('w') as init_file:
         init_file.write(INIT_HEADER)
-        init_file.write('from . import ({})\n'.format(', '.join(domain.module for domain in domains)))
-        init_file.write('from .util import UnknownEvent, UnknownObject')
+        init_file.write(INIT_LOADER.format(modules=modules, domain_modules=indent(domain_modules, 4)))
 
 
 def generate_docs(docs_path, domains):
@@ -1055,7 +1350,41 @@ def cdpgen():
         required=True,
         help='output path for the generated Python modules'
     )
+    parser.add_argument(
+        '--lazy',
+        action='store_true',
+        help='generate types and events that decode their fields on first access'
+    )
+    parser.add_argument(
+        '--domains',
+        nargs='+',
+        metavar='DOMAIN',
+        help='generate only these domains and the domains they depend on, e.g. Page Runtime'
+    )
+    parser.add_argument(
+        '--drop-deprecated',
+        action='store_true',
+        help='leave out deprecated commands, events and optional members'
+    )
+    parser.add_argument(
+        '--drop-experimental',
+        action='store_true',
+        help='leave out experimental domains, commands, events and optional members'
+    )
+    parser.add_argument(
+        '--no-docstrings',
+        action='store_true',
+        help='leave out docstrings and comments'
+    )
+    parser.add_argument(
+        '--no-typeddicts',
+        action='store_true',
+        help='leave out the TypedDicts of the raw JSON'
+    )
     args = parser.parse_args()
+    options.lazy = args.lazy
+    options.docstrings = not args.no_docstrings
+    options.typed_dicts = not args.no_typeddicts
     browser_proto = Path(args.browser_protocol)
     js_proto = Path(args.js_protocol)
     output = Path(args.output)
@@ -1068,6 +1397,10 @@ def cdpgen():
         domains.extend(parse(json_path, output))
     domains.sort(key=operator.attrgetter('domain'))
     fix_protocol_spec(domains)
+    try:
+        domains = select_domains(domains, args.domains, args.drop_deprecated, args.drop_experimental)
+    except ValueError as e:
+        parser.error(str(e))
     # generate python code
     for domain in domains:
         logger.info('Generating module: %s → %s/%s.py', domain.domain, output, domain.module)
@@ -0,0 +1,190 @@
+'''
+Synthesize JSON payloads for the types, events and command results of the CDP
+specification, to test and benchmark the generated modules.
+
+Usage::
+
+    python -m pycdp.gen.synth Network.Response Network.responseReceived [--array-size N] ...
+'''
+import sys
+import json
+import string
+import random
+import argparse
+import typing as t
+from pathlib import Path
+
+SCHEMAS = [
+    Path(__file__).parent / 'browser_protocol.json',
+    Path(__file__).parent / 'js_protocol.json',
+]
+
+
+def load_domains(paths: t.Iterable[Path] = SCHEMAS) -> t.List[dict]:
+    ''' Return the domains of the given protocol files. '''
+    domains: t.List[dict] = []
+    for path in paths:
+        domains.extend(json.loads(Path(path).read_text())['domains'])
+    return domains
+
+
+class Synthesizer:
+    '''
+    Builds JSON payloads from the protocol schema.
+
+    Arrays have ``array_size`` items and strings are ``string_size`` characters long.
+    Objects nested deeper than ``max_depth`` only get their required properties and
+    empty arrays, so recursive types like ``DOM.Node`` end. Each optional property is
+    present with probability ``optional``. Strings are shaped after the name of their
+    property or type, e.g. ids and URLs. With ``distinct`` the strings of each name are
+    drawn from that many values, like the ids and URLs that repeat in an event stream.
+    The same seed gives the same payloads.
+    '''
+
+    def __init__(
+        self,
+        domains: t.List[dict],
+        *,
+        array_size: int = 2,
+        string_size: int = 16,
+        max_depth: int = 3,
+        optional: float = 1.0,
+        distinct: t.Optional[int] = None,
+        seed: int = 0
+    ):
+        self.array_size = array_size
+        self.string_size = string_size
+        self.max_depth = max_depth
+        self.optional = optional
+        self.distinct = distinct
+        self.random = random.Random(seed)
+        self._pools: t.Dict[str, t.List[str]] = {}
+        self.domains = domains
+        self.types = {
+            f"{domain['domain']}.{type_['id']}": type_
+            for domain in domains
+            for type_ in domain.get('types', ())
+        }
+        self.events = {
+            f"{domain['domain']}.{event['name']}": event
+            for domain in domains
+            for event in domain.get('events', ())
+        }
+        self.commands = {
+            f"{domain['domain']}.{command['name']}": command
+            for domain in domains
+            for command in domain.get('commands', ())
+        }
+
+    @classmethod
+    def from_files(cls, paths: t.Iterable[Path] = SCHEMAS, **kwargs) -> 'Synthesizer':
+        return cls(load_domains(paths), **kwargs)
+
+    def type_payload(self, ref: str) -> t.Any:
+        ''' Return a payload for a type, e.g. ``Network.Response``. '''
+        return self.value({'$ref': ref}, ref.split('.')[0], 0, '')
+
+    def event_payload(self, method: str) -> dict:
+        ''' Return the params of an event, e.g. ``Network.responseReceived``. '''
+        return self.object(self.events[method].get('parameters', ()), method.split('.')[0], 0)
+
+    def returns_payload(self, method: str) -> dict:
+        ''' Return the result of a command, e.g. ``DOM.getDocument``. '''
+        return self.object(self.commands[method].get('returns', ()), method.split('.')[0], 0)
+
+    def iter_payloads(self) -> t.Iterator[t.Tuple[str, str, dict]]:
+        '''
+        Yield ``(kind, name, payload)`` for every object type and event, ``kind`` is
+        ``'type'`` or ``'event'``.
+        '''
+        for ref, type_ in self.types.items():
+            if type_['type'] == 'object' and type_.get('properties'):
+                yield 'type', ref, self.type_payload(ref)
+        for method in self.events:
+            yield 'event', method, self.event_payload(method)
+
+    def value(self, spec: dict, domain: str, depth: int, name: str) -> t.Any:
+        if '$ref' in spec:
+            ref = spec['$ref']
+            ref = ref if '.' in ref else f'{domain}.{ref}'
+            type_ = self.types[ref]
+            # primitive types are named after what they hold, e.g. FrameId
+            return self.value(type_, ref.split('.')[0], depth + 1, name or type_['id'])
+        if 'enum' in spec:
+            return self.random.choice(spec['enum'])
+        type_ = spec['type']
+        if type_ == 'object':
+            if 'properties' not in spec:
+                return {self.string(''): self.string('')}
+            return self.object(spec['properties'], domain, depth)
+        elif type_ == 'array':
+            if depth >= self.max_depth:
+                return []
+            return [self.value(spec['items'], domain, depth, name) for _ in range(self.array_size)]
+        elif type_ == 'integer':
+            return self.random.randrange(1000)
+        elif type_ == 'number':
+            return round(self.random.uniform(0, 1000), 3)
+        elif type_ == 'boolean':
+            return self.random.random() < 0.5
+        return self.string(name)
+
+    def object(self, properties: t.Iterable[dict], domain: str, depth: int) -> dict:
+        return {
+            prop['name']: self.value(prop, domain, depth, prop['name'])
+            for prop in properties
+            if not prop.get('optional', False)
+                or (depth < self.max_depth and self.random.random() < self.optional)
+        }
+
+    def string(self, name: str) -> str:
+        if self.distinct:
+            pool = self._pools.get(name)
+            if pool is None:
+                pool = self._pools[name] = [self.new_string(name) for _ in range(self.distinct)]
+            return self.random.choice(pool)
+        return self.new_string(name)
+
+    def new_string(self, name: str) -> str:
+        name = name.lower()
+        if name.endswith('id'):
+            return ''.join(self.random.choices('0123456789ABCDEF', k=self.string_size))
+        text = ''.join(self.random.choices(string.ascii_lowercase, k=self.string_size))
+        if name.endswith('url'):
+            return f'https://example.com/{text}'
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('names', nargs='+',
+        help='types (Domain.Type), events or commands (Domain.name) to print payloads for, '
+             'the payload of a command is its result')
+    parser.add_argument('--array-size', type=int, default=2)
+    parser.add_argument('--string-size', type=int, default=16)
+    parser.add_argument('--max-depth', type=int, default=3)
+    parser.add_argument('--optional', type=float, default=1.0,
+        help='probability that an optional property is present (default: %(default)s)')
+    parser.add_argument('--distinct', type=int,
+        help='number of distinct strings of each property or type (default: unlimited)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    synth = Synthesizer.from_files(
+        array_size=args.array_size, string_size=args.string_size, max_depth=args.max_depth,
+        optional=args.optional, distinct=args.distinct, seed=args.seed
+    )
+    for name in args.names:
+        if name in synth.types:
+            payload = synth.type_payload(name)
+        elif name in synth.events:
+            payload = synth.event_payload(name)
+        elif name in synth.commands:
+            payload = synth.returns_payload(name)
+        else:
+            sys.exit(f'unknown type, event or command: {name}')
+        print(json.dumps(payload, indent=2))
+
+
+if __name__ == '__main__':
+    main()
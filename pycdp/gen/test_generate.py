@@ -10,8 +10,9 @@ Pytest doesn't display stdout by default unless a test fails, and debugging
 codegen tests is almost always easier with the values displayed on stdout.
 '''
 
-from textwrap import dedent
+from textwrap import dedent, indent
 
+from . import generate
 from .generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring
 
 
@@ -133,7 +134,10 @@ def test_cdp_enum_type():
 
             @classmethod
             def from_json(cls, json: str) -> AXValueSourceType:
-                return cls(json)""")
+                try:
+                    return cls._value2member_map_[json]  # type: ignore
+                except KeyError:
+                    return cls(json)""")
 
     type = CdpType.from_json(json_type, '')
     actual = type.generate_code()
@@ -207,12 +211,12 @@ def test_cdp_class_type():
                 return json
 
             @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> AXValue:
+            def from_json(cls, json: AXValueJSON) -> AXValue:
                 return cls(
                     type_=AXValueType.from_json(json['type']),
-                    value=json['value'] if 'value' in json else None,
-                    related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if 'relatedNodes' in json else None,
-                    sources=[AXValueSource.from_json(i) for i in json['sources']] if 'sources' in json else None,
+                    value=json.get('value'),
+                    related_nodes=[AXRelatedNode.from_json(i) for i in _related_nodes] if (_related_nodes := json.get('relatedNodes')) is not None else None,
+                    sources=[AXValueSource.from_json(i) for i in _sources] if (_sources := json.get('sources')) is not None else None,
                 )""")
 
     type = CdpType.from_json(json_type, '')
@@ -263,12 +267,16 @@ def test_cdp_command():
         ]
     }
     expected = dedent("""\
+        def _parse_get_partial_ax_tree(json: GetPartialAXTreeReturnsJSON) -> typing.List[AXNode]:
+            return [AXNode.from_json(i) for i in json['nodes']]
+
+
         def get_partial_ax_tree(
                 node_id: typing.Optional[dom.NodeId] = None,
                 backend_node_id: typing.Optional[dom.BackendNodeId] = None,
                 object_id: typing.Optional[runtime.RemoteObjectId] = None,
                 fetch_relatives: typing.Optional[bool] = None
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[AXNode]]:
+            ) -> Command[GetPartialAXTreeReturnsJSON, typing.List[AXNode]]:
             '''
             Fetches the accessibility node and partial accessibility tree for this DOM node, if it exists.
 
@@ -289,12 +297,7 @@ def test_cdp_command():
                 params['objectId'] = object_id.to_json()
             if fetch_relatives is not None:
                 params['fetchRelatives'] = fetch_relatives
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Accessibility.getPartialAXTree',
-                'params': params,
-            }
-            json = yield cmd_dict
-            return [AXNode.from_json(i) for i in json['nodes']]""")
+            return Command('Accessibility.getPartialAXTree', params, _parse_get_partial_ax_tree)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
@@ -307,14 +310,11 @@ def test_cdp_command_no_params_or_returns():
         "description": "Disables the accessibility domain."
     }
     expected = dedent("""\
-        def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+        def disable() -> Command[T_JSON_DICT, None]:
             '''
             Disables the accessibility domain.
             '''
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Accessibility.disable',
-            }
-            json = yield cmd_dict""")
+            return Command('Accessibility.disable')""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
@@ -341,9 +341,13 @@ def test_cdp_command_return_primitive():
         ]
     }
     expected = dedent("""\
+        def _parse_get_current_time(json: GetCurrentTimeReturnsJSON) -> float:
+            return float(json['currentTime'])
+
+
         def get_current_time(
                 id_: str
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+            ) -> Command[GetCurrentTimeReturnsJSON, float]:
             '''
             Returns the current time of the an animation.
 
@@ -352,12 +356,7 @@ def test_cdp_command_return_primitive():
             '''
             params: T_JSON_DICT = dict()
             params['id'] = id_
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Animation.getCurrentTime',
-                'params': params,
-            }
-            json = yield cmd_dict
-            return float(json['currentTime'])""")
+            return Command('Animation.getCurrentTime', params, _parse_get_current_time)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -381,7 +380,11 @@ def test_cdp_command_return_array_of_primitive():
         ]
     }
     expected = dedent("""\
-        def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
+        def _parse_get_browser_command_line(json: GetBrowserCommandLineReturnsJSON) -> typing.List[str]:
+            return json['arguments']
+
+
+        def get_browser_command_line() -> Command[GetBrowserCommandLineReturnsJSON, typing.List[str]]:
             '''
             Returns the command line switches for the browser process if, and only if
             --enable-automation is on the commandline.
@@ -390,11 +393,7 @@ def test_cdp_command_return_array_of_primitive():
 
             :returns: Commandline parameters
             '''
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Browser.getBrowserCommandLine',
-            }
-            json = yield cmd_dict
-            return [str(i) for i in json['arguments']]""")
+            return Command('Browser.getBrowserCommandLine', None, _parse_get_browser_command_line)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -419,19 +418,15 @@ def test_cdp_command_array_of_primitive_parameter():
     expected = dedent("""\
         def release_animations(
                 animations: typing.List[str]
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+            ) -> Command[T_JSON_DICT, None]:
             '''
             Releases a set of animations to no longer be manipulated.
 
             :param animations: List of animation ids to seek.
             '''
             params: T_JSON_DICT = dict()
-            params['animations'] = [i for i in animations]
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Animation.releaseAnimations',
-                'params': params,
-            }
-            json = yield cmd_dict""")
+            params['animations'] = list(animations)
+            return Command('Animation.releaseAnimations', params)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -458,9 +453,13 @@ def test_cdp_command_ref_parameter():
         ]
     }
     expected = dedent("""\
+        def _parse_resolve_animation(json: ResolveAnimationReturnsJSON) -> runtime.RemoteObject:
+            return runtime.RemoteObject.from_json(json['remoteObject'])
+
+
         def resolve_animation(
                 animation_id: str
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
+            ) -> Command[ResolveAnimationReturnsJSON, runtime.RemoteObject]:
             '''
             Gets the remote object of the Animation.
 
@@ -469,12 +468,7 @@ def test_cdp_command_ref_parameter():
             '''
             params: T_JSON_DICT = dict()
             params['animationId'] = animation_id
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Animation.resolveAnimation',
-                'params': params,
-            }
-            json = yield cmd_dict
-            return runtime.RemoteObject.from_json(json['remoteObject'])""")
+            return Command('Animation.resolveAnimation', params, _parse_resolve_animation)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -534,12 +528,20 @@ def test_cdp_command_multiple_return():
         ]
     }
     expected = dedent("""\
+        def _parse_get_encoded_response(json: GetEncodedResponseReturnsJSON) -> typing.Tuple[typing.Optional[str], int, int]:
+            return (
+                json.get('body'),
+                json['originalSize'],
+                json['encodedSize']
+            )
+
+
         def get_encoded_response(
                 request_id: network.RequestId,
                 encoding: str,
                 quality: typing.Optional[float] = None,
                 size_only: typing.Optional[bool] = None
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], int, int]]:
+            ) -> Command[GetEncodedResponseReturnsJSON, typing.Tuple[typing.Optional[str], int, int]]:
             '''
             Returns the response body and size if it were re-encoded with the specified settings. Only
             applies to images.
@@ -561,16 +563,7 @@ def test_cdp_command_multiple_return():
                 params['quality'] = quality
             if size_only is not None:
                 params['sizeOnly'] = size_only
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Audits.getEncodedResponse',
-                'params': params,
-            }
-            json = yield cmd_dict
-            return (
-                str(json['body']) if 'body' in json else None,
-                int(json['originalSize']),
-                int(json['encodedSize'])
-            )""")
+            return Command('Audits.getEncodedResponse', params, _parse_get_encoded_response)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Audits')
     actual = cmd.generate_code()
@@ -607,7 +600,7 @@ def test_cdp_command_array_of_ref_parameter():
                 origin: str,
                 permissions: typing.List[PermissionType],
                 browser_context_id: typing.Optional[target.BrowserContextID] = None
-            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+            ) -> Command[T_JSON_DICT, None]:
             '''
             Grant specific permissions to the given origin and reject all others.
 
@@ -622,11 +615,7 @@ def test_cdp_command_array_of_ref_parameter():
             params['permissions'] = [i.to_json() for i in permissions]
             if browser_context_id is not None:
                 params['browserContextId'] = browser_context_id.to_json()
-            cmd_dict: T_JSON_DICT = {
-                'method': 'Browser.grantPermissions',
-                'params': params,
-            }
-            json = yield cmd_dict""")
+            return Command('Browser.grantPermissions', params)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -659,9 +648,9 @@ def test_cdp_event():
             service: ServiceName
 
             @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
+            def from_json(cls, json: RecordingStateChangedJSON) -> RecordingStateChanged:
                 return cls(
-                    is_recording=bool(json['isRecording']),
+                    is_recording=json['isRecording'],
                     service=ServiceName.from_json(json['service'])
                 )""")
 
@@ -718,12 +707,12 @@ def test_cdp_event_parameter_docs():
             user_gesture: bool
 
             @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
+            def from_json(cls, json: WindowOpenJSON) -> WindowOpen:
                 return cls(
-                    url=str(json['url']),
-                    window_name=str(json['windowName']),
-                    window_features=[str(i) for i in json['windowFeatures']],
-                    user_gesture=bool(json['userGesture'])
+                    url=json['url'],
+                    window_name=json['windowName'],
+                    window_features=json['windowFeatures'],
+                    user_gesture=json['userGesture']
                 )""")
 
     cmd = CdpEvent.from_json(json_event, 'Page')
@@ -820,15 +809,26 @@ def test_cdp_domain_imports():
         ]
     }
     expected = dedent("""\
-        from . import door
-        from . import driver
-        from . import engine
-        from . import engine_parts
-        from . import lock
-        from . import passenger
-        from . import vehicle
-        from . import window
-        from . import window_state""") # A domain should have a new line at the end.
+        if typing.TYPE_CHECKING:
+            from . import door
+            from . import driver
+            from . import engine
+            from . import engine_parts
+            from . import lock
+            from . import passenger
+            from . import vehicle
+            from . import window
+            from . import window_state
+        else:
+            door = lazy_import('door', globals())
+            driver = lazy_import('driver', globals())
+            engine = lazy_import('engine', globals())
+            engine_parts = lazy_import('engine_parts', globals())
+            lock = lazy_import('lock', globals())
+            passenger = lazy_import('passenger', globals())
+            vehicle = lazy_import('vehicle', globals())
+            window = lazy_import('window', globals())
+            window_state = lazy_import('window_state', globals())""") # A domain should have a new line at the end.
 
     domain = CdpDomain.from_json(json_domain)
     actual = domain.generate_imports()
@@ -967,3 +967,170 @@ def test_cdp_domain_sphinx():
     domain = CdpDomain.from_json(json_domain)
     actual = domain.generate_sphinx()
     assert expected == actual
+
+
+def test_cdp_class_type_known_refs(monkeypatch):
+    for json_type in (
+        {"id": "ResourcePriority", "type": "string", "enum": ["Low", "High"]},
+        {"id": "Headers", "type": "object"},
+        {"id": "RequestId", "type": "string"},
+        {"id": "Initiator", "type": "object", "properties": [{"name": "type", "type": "string"}]},
+    ):
+        monkeypatch.setitem(generate.type_registry, f'Network.{json_type["id"]}',
+            CdpType.from_json(json_type, 'Network'))
+    json_type = {
+        "id": "Request",
+        "type": "object",
+        "properties": [
+            {"name": "headers", "$ref": "Headers"},
+            {"name": "initialPriority", "$ref": "ResourcePriority"},
+            {"name": "initiator", "optional": True, "$ref": "Initiator"},
+            {"name": "redirects", "optional": True, "type": "array", "items": {"$ref": "RequestId"}},
+            {"name": "priorities", "type": "array", "items": {"$ref": "ResourcePriority"}},
+            {"name": "timestamp", "optional": True, "type": "number"}
+        ]
+    }
+    expected = dedent("""\
+        def to_json(self) -> T_JSON_DICT:
+            json: T_JSON_DICT = dict()
+            json['headers'] = self.headers
+            json['initialPriority'] = self.initial_priority.value
+            json['priorities'] = [i.value for i in self.priorities]
+            if self.initiator is not None:
+                json['initiator'] = self.initiator.to_json()
+            if self.redirects is not None:
+                json['redirects'] = list(self.redirects)
+            if self.timestamp is not None:
+                json['timestamp'] = self.timestamp
+            return json
+
+        @classmethod
+        def from_json(cls, json: RequestJSON) -> Request:
+            return cls(
+                headers=Headers(json['headers']),
+                initial_priority=ResourcePriority.from_json(json['initialPriority']),
+                priorities=[ResourcePriority.from_json(i) for i in json['priorities']],
+                initiator=Initiator.from_json(_initiator) if (_initiator := json.get('initiator')) is not None else None,
+                redirects=[RequestId(i) for i in _redirects] if (_redirects := json.get('redirects')) is not None else None,
+                timestamp=float(_timestamp) if (_timestamp := json.get('timestamp')) is not None else None,
+            )""")
+
+    type = CdpType.from_json(json_type, 'Network')
+    actual = type.generate_code()
+    assert actual.endswith(indent(expected, '    '))
+
+
+def test_cdp_lazy_event(monkeypatch):
+    monkeypatch.setattr(generate, 'options', generate.GeneratorOptions(lazy=True))
+    json_event = {
+        "name": "recordingStateChanged",
+        "description": "Called when the recording state for the service has been updated.",
+        "parameters": [
+            {"name": "isRecording", "type": "boolean"},
+            {"name": "service", "$ref": "ServiceName"},
+            {"name": "timestamp", "optional": True, "type": "number"}
+        ]
+    }
+    expected = dedent("""\
+        @event_class('BackgroundService.recordingStateChanged')
+        @dataclass
+        class RecordingStateChanged(LazyObject):
+            '''
+            Called when the recording state for the service has been updated.
+            '''
+            is_recording: bool
+            service: ServiceName
+            timestamp: typing.Optional[float]
+
+            _lazy_fields = {
+                'is_recording': ('isRecording', None, False),
+                'service': ('service', lambda v: ServiceName.from_json(v), False),
+                'timestamp': ('timestamp', lambda v: float(v), True),
+            }""")
+
+    event = CdpEvent.from_json(json_event, 'BackgroundService')
+    actual = event.generate_code()
+    assert expected == actual
+
+
+def test_cdp_domain_typed_dicts(monkeypatch):
+    json_domain = {
+        "domain": "IO",
+        "types": [
+            {"id": "StreamHandle", "type": "string"},
+            {
+                "id": "Chunk",
+                "type": "object",
+                "properties": [
+                    {"name": "handle", "$ref": "StreamHandle"},
+                    {"name": "data", "type": "array", "items": {"type": "string"}},
+                    {"name": "eof", "optional": True, "type": "boolean"}
+                ]
+            }
+        ],
+        "commands": [
+            {
+                "name": "read",
+                "parameters": [{"name": "handle", "$ref": "StreamHandle"}],
+                "returns": [
+                    {"name": "chunk", "$ref": "Chunk"},
+                    {"name": "context", "$ref": "Runtime.RemoteObjectId"}
+                ]
+            },
+            {"name": "close", "parameters": [{"name": "handle", "$ref": "StreamHandle"}]}
+        ],
+        "events": [{"name": "closed"}]
+    }
+    domain = CdpDomain.from_json(json_domain)
+    for type_ in domain.types:
+        monkeypatch.setitem(generate.type_registry, f'IO.{type_.id}', type_)
+    monkeypatch.setitem(generate.type_registry, 'Runtime.RemoteObjectId',
+        CdpType.from_json({"id": "RemoteObjectId", "type": "string"}, 'Runtime'))
+    expected = dedent("""\
+        if typing.TYPE_CHECKING:
+            class _ChunkJSON(typing.TypedDict):
+                handle: str
+                data: typing.List[str]
+
+
+            class ChunkJSON(_ChunkJSON, total=False):
+                eof: bool
+
+
+            class ReadReturnsJSON(typing.TypedDict):
+                chunk: ChunkJSON
+                context: str
+        """)
+
+    actual = domain.generate_typed_dicts()
+    assert expected == actual
+    assert 'def read(\n        handle: StreamHandle\n    ) -> Command[ReadReturnsJSON, ' \
+        in domain.generate_code()
+
+
+def test_select_domains():
+    def domain(name, experimental=False, **kwargs):
+        return CdpDomain.from_json(dict(domain=name, experimental=experimental, **kwargs))
+    domains = [
+        domain('Page', commands=[
+            {"name": "navigate", "parameters": [
+                {"name": "url", "type": "string"},
+                {"name": "frameId", "optional": True, "$ref": "Frame.FrameId"},
+                {"name": "referrer", "optional": True, "experimental": True, "$ref": "Network.Referrer"}
+            ]},
+            {"name": "crash", "experimental": True, "parameters": [{"name": "id", "$ref": "Debug.CrashId"}]}
+        ]),
+        domain('Frame', types=[{"id": "FrameId", "type": "string"}]),
+        domain('Network', types=[{"id": "Referrer", "type": "string"}]),
+        domain('Debug', types=[{"id": "CrashId", "type": "string"}]),
+        domain('Animation', experimental=True),
+        domain('Unrelated'),
+    ]
+    selected = generate.select_domains(domains, ['Page'], drop_experimental=True)
+    assert [d.domain for d in selected] == ['Page', 'Frame']
+    page = selected[0]
+    assert [c.name for c in page.commands] == ['navigate']
+    assert [p.name for p in page.commands[0].parameters] == ['url', 'frameId']
+
+    selected = generate.select_domains(domains, drop_experimental=True)
+    assert [d.domain for d in selected] == ['Page', 'Frame', 'Network', 'Debug', 'Unrelated']
@@ -0,0 +1,24 @@
+'''
+Tests for the payload synthesizer.
+'''
+
+from .synth import Synthesizer
+
+
+def test_payload_size():
+    small = Synthesizer.from_files(array_size=1, string_size=4, optional=0.0)
+    large = Synthesizer.from_files(array_size=5, string_size=32)
+    request = small.type_payload('Network.Request')
+    assert set(request) == {'url', 'method', 'headers', 'initialPriority', 'referrerPolicy'}
+    assert request['url'].startswith('https://example.com/')
+    node = large.type_payload('DOM.Node')
+    assert len(node['children']) == 5
+    assert len(node['nodeName']) == 32
+    assert len(large.event_payload('Page.frameNavigated')['frame']['loaderId']) == 32
+
+
+def test_payloads_are_reproducible():
+    first = Synthesizer.from_files(seed=1, optional=0.5)
+    second = Synthesizer.from_files(seed=1, optional=0.5)
+    assert list(first.iter_payloads()) == list(second.iter_payloads())
+    assert first.returns_payload('DOM.getDocument') != Synthesizer.from_files(seed=2).returns_payload('DOM.getDocument')
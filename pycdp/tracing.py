@@ -0,0 +1,117 @@
+'''
+Hooks into the protocol traffic of a client, and an exporter of the traffic in the
+Chrome trace event format.
+'''
+import os
+import json
+import typing as t
+from pathlib import Path
+
+
+class ProtocolHooks:
+    '''
+    Called at the hot points of a client, see :attr:`pycdp.asyncio.CDPConnection.hooks`.
+    The default methods do nothing, override the ones you need. A client without hooks
+    skips them entirely.
+
+    ``session_id`` is ``None`` for the browser session, ``size`` is the length of the
+    JSON message and ``time`` is a :func:`time.monotonic` timestamp in seconds, the
+    clock Chrome's own traces use on Linux and macOS.
+    '''
+
+    def on_send(self, method: str, session_id: t.Optional[str], cmd_id: int, size: int, time: float):
+        ''' A command is about to be sent. '''
+
+    def on_receive(self, method: t.Optional[str], session_id: t.Optional[str], size: int, time: float):
+        ''' A message was received, ``method`` is ``None`` for command responses. '''
+
+    def on_event(self, method: str, session_id: t.Optional[str], size: int, time: float):
+        ''' An event was parsed, events nobody listens to are not parsed. '''
+
+    def on_response(self, method: str, session_id: t.Optional[str], cmd_id: int, size: int, time: float):
+        ''' The response of a command was handled. '''
+
+    def on_fail(self, method: str, session_id: t.Optional[str], cmd_id: int, time: float):
+        ''' A command was cancelled, e.g. timed out, or its session or connection closed
+        before the response. '''
+
+
+class ChromeTraceExporter(ProtocolHooks):
+    '''
+    Records commands, from send to response or failure, and events, from receive to
+    parse, as the spans of a Chrome trace. Each session is shown as a thread of this process::
+
+        exporter = ChromeTraceExporter()
+        conn.hooks = exporter
+        ...
+        exporter.write('client.json')
+
+    The trace can be opened in ``chrome://tracing`` or Perfetto, or merged with a trace
+    of the browser recorded at the same time, as both use the monotonic clock.
+    '''
+
+    def __init__(self, pid: t.Optional[int] = None):
+        self.pid = os.getpid() if pid is None else pid
+        self.events: t.List[dict] = []
+        self._threads: t.Dict[t.Optional[str], int] = {}
+        # (session, command id) -> (method, time sent, request size)
+        self._pending: t.Dict[t.Tuple[t.Optional[str], int], t.Tuple[str, float, int]] = {}
+        self._received = 0.0
+
+    def _tid(self, session_id: t.Optional[str]) -> int:
+        tid = self._threads.get(session_id)
+        if tid is None:
+            tid = self._threads[session_id] = len(self._threads) + 1
+            self.events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                'args': {'name': f'session {session_id}' if session_id else 'browser'}
+            })
+        return tid
+
+    def on_send(self, method, session_id, cmd_id, size, time):
+        self._pending[(session_id, cmd_id)] = (method, time, size)
+
+    def on_receive(self, method, session_id, size, time):
+        self._received = time
+
+    def on_event(self, method, session_id, size, time):
+        self.events.append({
+            'name': method, 'cat': 'cdp.event', 'ph': 'X', 'pid': self.pid, 'tid': self._tid(session_id),
+            'ts': self._received * 1e6, 'dur': (time - self._received) * 1e6, 'args': {'size': size}
+        })
+
+    def on_response(self, method, session_id, cmd_id, size, time):
+        pending = self._pending.pop((session_id, cmd_id), None)
+        if pending is None:
+            return
+        _, sent, request_size = pending
+        self.events.append({
+            'name': method, 'cat': 'cdp.command', 'ph': 'X', 'pid': self.pid, 'tid': self._tid(session_id),
+            'ts': sent * 1e6, 'dur': (time - sent) * 1e6,
+            'args': {'id': cmd_id, 'request_size': request_size, 'response_size': size}
+        })
+
+    def on_fail(self, method, session_id, cmd_id, time):
+        pending = self._pending.pop((session_id, cmd_id), None)
+        if pending is None:
+            return
+        _, sent, request_size = pending
+        self.events.append({
+            'name': method, 'cat': 'cdp.command', 'ph': 'X', 'pid': self.pid, 'tid': self._tid(session_id),
+            'ts': sent * 1e6, 'dur': (time - sent) * 1e6,
+            'args': {'id': cmd_id, 'request_size': request_size, 'failed': True}
+        })
+
+    def clear(self):
+        ''' Drop the recorded spans and the commands in flight. '''
+        self.events.clear()
+        self._threads.clear()
+        self._pending.clear()
+        self._received = 0.0
+
+    def to_json(self) -> dict:
+        return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def write(self, path: t.Union[str, Path]):
+        ''' Write the trace to a JSON file. '''
+        Path(path).write_text(json.dumps(self.to_json()))
@@ -100,7 +100,7 @@ class CDPBase(LoggerMixin):
         super().__init__()
         self._listeners: t.Dict[type, t.Set[CDPEventListener]] = defaultdict(set)
         self._id_iter = itertools.count()
-        self._inflight_cmd: t.Dict[int, t.Tuple[t.Generator[dict, dict , t.Any], Deferred]] = {}
+        self._inflight_cmd: t.Dict[int, t.Tuple[t.Generator[dict, t.Any, t.Any], Deferred]] = {}
         self._session_id = session_id
         self._target_id = target_id
         self._ws: CDPSocket = ws
@@ -109,7 +109,7 @@ class CDPBase(LoggerMixin):
     def session_id(self) -> cdp.target.SessionID:
         return self._session_id
 
-    async def execute(self, cmd: t.Generator[dict, dict , T]) -> T:
+    async def execute(self, cmd: t.Generator[dict, t.Any, T]) -> T:
         '''
         Execute a command on the server and wait for the result.
 
@@ -272,14 +272,32 @@ class WorkerBase(Closable):
 
 
 class SubtaskSpawner(Closable):
-    """Keeps track of spanwed async tasks."""
+    """Keeps track of spanwed async tasks.
 
-    def __init__(self, *args,  **kwargs):
+    Finished tasks are dropped, only their outcome is counted in :attr:`subtask_counts`.
+    If ``max_subtasks`` is given, at most that many bounded subtasks run at once, the
+    others wait for their turn before starting.
+    """
+
+    def __init__(self, *args, max_subtasks: t.Optional[int] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        self._subtasks: t.List[asyncio.Task] = []
+        self._max_subtasks = max_subtasks
+        self._subtasks: t.Set[asyncio.Future] = set()
+        self._subtask_slots = None if max_subtasks is None else asyncio.Semaphore(max_subtasks)
+        self._subtask_counts = {'completed': 0, 'failed': 0, 'cancelled': 0}
         self._exception_waiter = asyncio.get_running_loop().create_future()
         self._exception_handlers = 0
 
+    @property
+    def max_subtasks(self) -> t.Optional[int]:
+        """The number of bounded subtasks that run at once, set when it's created."""
+        return self._max_subtasks
+
+    @property
+    def subtask_counts(self) -> t.Dict[str, int]:
+        """The number of active subtasks and of the finished ones by outcome."""
+        return dict(self._subtask_counts, active=len(self._subtasks))
+
     async def wait_exception(self):
         """Catch first exception raised from any subtask of this spawner."""
         try:
@@ -290,7 +308,7 @@ class SubtaskSpawner(Closable):
 
     async def wait_subtasks(self):
         """Wait all *current* subtasks to finish and return their result even if it's an exception."""
-        return await asyncio.gather(*(asyncio.shield(task) for task in self._subtasks), return_exceptions=True)
+        return await asyncio.gather(*(asyncio.shield(task) for task in list(self._subtasks)), return_exceptions=True)
 
     async def _close(self):
         await super()._close()
@@ -299,26 +317,48 @@ class SubtaskSpawner(Closable):
         self._subtasks.clear()
 
     def _cancel_subtasks(self):
-        for task in self._subtasks:
+        for task in list(self._subtasks):
             task.cancel()
 
-    def _create_subtask(self, coro: t.Union[t.Coroutine[t.Any, t.Any, _T], 'asyncio.Future[_T]'], name=None) -> 'asyncio.Future[_T]':
+    def _create_subtask(
+        self,
+        coro: t.Union[t.Coroutine[t.Any, t.Any, _T], 'asyncio.Future[_T]'],
+        name=None,
+        *,
+        bounded: bool = True
+    ) -> 'asyncio.Future[_T]':
+        """Spawn a subtask. Unless ``bounded`` is false, a coroutine waits for a slot when
+        :attr:`max_subtasks` are running."""
         if not self.is_open:
             raise RuntimeError(f'{type(self).__name__} is not open')
-        if inspect.iscoroutine(coro):
-            task = asyncio.create_task(coro, name=name)
-        else:
+        task: asyncio.Future
+        if isinstance(coro, asyncio.Future):
             task = coro
+        elif bounded and self._subtask_slots is not None:
+            task = asyncio.create_task(self._run_bounded(coro, self._subtask_slots), name=name)
+            # closes the coroutine if the task was cancelled before it got a slot
+            def close_coro(_: asyncio.Future, coro: t.Coroutine = coro):
+                coro.close()
+            task.add_done_callback(close_coro)
+        else:
+            task = asyncio.create_task(coro, name=name)
         task.add_done_callback(self._check_subtask_result)
-        self._subtasks.append(task)
+        self._subtasks.add(task)
         return task
 
-    def _check_subtask_result(self, task: asyncio.Task):
+    async def _run_bounded(self, coro: t.Coroutine[t.Any, t.Any, _T], slots: asyncio.Semaphore) -> _T:
+        async with slots:
+            return await coro
+
+    def _check_subtask_result(self, task: asyncio.Future):
+        self._subtasks.discard(task)
         try:
             task.result()
         except asyncio.CancelledError as exc:
+            self._subtask_counts['cancelled'] += 1
             self._logger.debug('the subtask %s was cancelled', repr(task))
         except BaseException as exc:
+            self._subtask_counts['failed'] += 1
             if self._exception_handlers > 0:
                 if not self._exception_waiter.done():
                     self._logger.debug(
@@ -333,6 +373,8 @@ class SubtaskSpawner(Closable):
                     )
             else:
                 self._logger.exception('an error happened in the subtask %s:', repr(task))
+        else:
+            self._subtask_counts['completed'] += 1
 
 
 class Worker(SubtaskSpawner, WorkerBase):
@@ -351,7 +393,7 @@ class Worker(SubtaskSpawner, WorkerBase):
         await self.close()
 
     def _start_subworker(self, worker: 'Worker'):
-        self._create_subtask(self._watch_subworker(worker))
+        self._create_subtask(self._watch_subworker(worker), bounded=False)
         worker.start()
 
     async def _watch_subworker(self, worker: 'Worker'):
@@ -373,7 +415,7 @@ class SingleTaskWorker(Worker):
         self._start_run_task()
 
     def _start_run_task(self):
-        self._create_subtask(self._run())
+        self._create_subtask(self._run(), bounded=False)
 
     async def _run(self):
         raise NotImplementedError
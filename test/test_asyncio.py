@@ -0,0 +1,926 @@
+'''
+Tests for the asyncio client against a fake browser.
+'''
+import json
+import asyncio
+import itertools
+import typing as t
+import pytest
+from aiohttp import ClientConnectionError, WSMsgType
+from aiohttp.http_websocket import WSCloseCode
+from pycdp import cdp
+from pycdp.asyncio import (
+    CDPConnection, CDPConnectionFactory, CDPSessionWatchdog, ResilientCDPConnection,
+    AdaptiveLimiter, PRIORITY_BULK, SendScheduler
+)
+from pycdp.exceptions import CDPBrowserError, CDPConnectionClosed, CDPSessionClosed, CDPTargetRecycled
+from pycdp.tracing import ChromeTraceExporter
+
+
+class FakeMessage(t.NamedTuple):
+    type: WSMsgType
+    data: t.Any = None
+
+
+class FakeResponse:
+
+    def __init__(self, data: t.Any):
+        self.status = 200
+        self._data = data
+
+    async def __aenter__(self):
+        return self._data if isinstance(self._data, FakeBrowser) else self
+
+    async def json(self):
+        return self._data
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FakeHttpClient:
+
+    def __init__(self, browser: t.Optional['FakeBrowser'] = None):
+        self.browser = browser
+        self.requests: t.List[str] = []
+        self.closed = False
+
+    def get(self, url: str):
+        self.requests.append(url)
+        return FakeResponse({'webSocketDebuggerUrl': 'ws://localhost:9222/devtools/browser/1'})
+
+    def ws_connect(self, url: str, **kwargs):
+        self.requests.append(url)
+        return FakeResponse(self.browser)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    '''
+    Stands in for the browser's websocket. Commands are answered by the handlers
+    registered in ``handlers`` (method -> callable returning the result), a handler
+    returning ``None`` leaves the command unanswered and one raising
+    :class:`CDPBrowserError` answers with its error.
+    '''
+    def __init__(self):
+        self.sent: t.List[dict] = []
+        self.handlers: t.Dict[str, t.Callable[[dict], t.Optional[dict]]] = {}
+        self.closed = False
+        self.close_code = None
+        self._incoming: asyncio.Queue = asyncio.Queue()
+        self._ids = itertools.count(1)
+
+    async def send_str(self, data: str):
+        request = json.loads(data)
+        self.sent.append(request)
+        handler = self.handlers.get(request['method'], lambda params: {})
+        try:
+            result = handler(request.get('params', {}))
+        except CDPBrowserError as e:
+            result = {'error': {'code': e.code, 'message': e.message}}
+        else:
+            result = None if result is None else {'result': result}
+        if result is not None:
+            response = {'id': request['id'], **result}
+            if 'sessionId' in request:
+                response['sessionId'] = request['sessionId']
+            self._incoming.put_nowait(FakeMessage(WSMsgType.TEXT, json.dumps(response)))
+
+    def emit(self, method: str, params: dict, session_id: t.Optional[str] = None):
+        event = {'method': method, 'params': params}
+        if session_id is not None:
+            event['sessionId'] = session_id
+        self._incoming.put_nowait(FakeMessage(WSMsgType.TEXT, json.dumps(event)))
+
+    def sent_methods(self) -> t.List[str]:
+        return [request['method'] for request in self.sent]
+
+    def attach_targets(self):
+        '''Answer target creation and attachment with fresh ids.'''
+        self.handlers['Target.createTarget'] = lambda params: {'targetId': f'target-{next(self._ids)}'}
+        self.handlers['Target.attachToTarget'] = lambda params: {'sessionId': f'session-{params["targetId"]}'}
+        self.handlers['Target.closeTarget'] = lambda params: {'success': True}
+
+    async def receive(self):
+        return await self._incoming.get()
+
+    async def close(self, code=WSCloseCode.OK):
+        self.closed = True
+        self.close_code = code
+        self._incoming.put_nowait(FakeMessage(WSMsgType.CLOSED))
+
+
+async def open_connection(browser: FakeBrowser) -> CDPConnection:
+    conn = CDPConnection('ws://localhost:9222/devtools/browser', FakeHttpClient())
+    conn._ws = browser
+    conn.start()
+    return conn
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+def test_watchdog_recycles_hung_target():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': {
+            'targetId': params['targetId'], 'type': 'page', 'title': '', 'url': 'about:blank',
+            'attached': True, 'canAccessOpener': False, 'browserContextId': 'context-1'
+        }}
+        browser.handlers['Runtime.evaluate'] = lambda params: None
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        recycled = asyncio.get_running_loop().create_future()
+        async def on_recycle(old, new):
+            recycled.set_result((old, new))
+        watchdog = CDPSessionWatchdog(
+            conn, session, probe_interval=0.01, probe_timeout=0.05, on_recycle=on_recycle
+        )
+        watchdog.start()
+        inflight = asyncio.ensure_future(session.execute(cdp.runtime.evaluate('while(true);')))
+        old, new = await recycled
+        assert old is session
+        assert new is watchdog.session
+        assert new.target_id == 'target-1'
+        assert watchdog.recycle_count == 1
+        with pytest.raises(CDPTargetRecycled):
+            await inflight
+        create = next(r for r in browser.sent if r['method'] == 'Target.createTarget')
+        assert create['params']['browserContextId'] == 'context-1'
+        assert 'Target.closeTarget' in browser.sent_methods()
+        assert session.session_id not in conn._sessions
+        await watchdog.close()
+        await conn.close()
+    run(main())
+
+
+def test_watchdog_recycles_crashed_target():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': {
+            'targetId': params['targetId'], 'type': 'page', 'title': '', 'url': 'about:blank',
+            'attached': True, 'canAccessOpener': False
+        }}
+        browser.handlers['Runtime.evaluate'] = lambda params: {'result': {'type': 'number', 'value': 1}}
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        watchdog = CDPSessionWatchdog(conn, session, probe_interval=0.01, probe_timeout=1)
+        watchdog.start()
+        while watchdog.latency is None:
+            await asyncio.sleep(0.01)
+        assert watchdog.recycle_count == 0
+        browser.emit('Inspector.targetCrashed', {}, session.session_id)
+        while watchdog.recycle_count == 0:
+            await asyncio.sleep(0.01)
+        assert watchdog.session.target_id == 'target-1'
+        await watchdog.close()
+        await conn.close()
+    run(main())
+
+
+def test_watchdog_retries_failed_recycling():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        def target_info_of_live_targets(params):
+            if params['targetId'] == 'target-0':
+                raise CDPBrowserError({'code': -32602, 'message': 'No target with given id found'})
+            return {'targetInfo': target_info(params['targetId'])}
+        browser.handlers['Target.getTargetInfo'] = target_info_of_live_targets
+        create_target = browser.handlers['Target.createTarget']
+        failures = iter([True])
+        def create_target_once_failing(params):
+            if next(failures, False):
+                raise CDPBrowserError({'code': -32000, 'message': 'Failed to create target'})
+            return create_target(params)
+        browser.handlers['Target.createTarget'] = create_target_once_failing
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        calls = []
+        async def on_recycle(old, new):
+            calls.append(new.target_id)
+            raise CDPBrowserError({'code': -32000, 'message': 'setup failed'})
+        watchdog = CDPSessionWatchdog(conn, session, probe_interval=0.01, probe_timeout=1, on_recycle=on_recycle)
+        watchdog.start()
+        while watchdog.recycle_count == 0:
+            await asyncio.sleep(0.01)
+        # a failing callback doesn't recycle the new target again
+        await asyncio.sleep(0.05)
+        assert calls == ['target-1']
+        assert watchdog.recycle_count == 1
+        assert browser.sent_methods().count('Target.createTarget') == 2
+        assert watchdog.session.target_id == 'target-1'
+        await watchdog.close()
+        await conn.close()
+    run(main())
+
+
+def test_session_reaped_on_detach():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        browser.handlers['Runtime.evaluate'] = lambda params: None
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        listener = session.listen(cdp.page.FrameNavigated)
+        inflight = asyncio.ensure_future(session.execute(cdp.runtime.evaluate('1')))
+        await asyncio.sleep(0)
+        browser.emit('Target.detachedFromTarget', {'sessionId': session.session_id, 'targetId': 'target-0'})
+        with pytest.raises(CDPSessionClosed):
+            await inflight
+        assert conn._sessions == {}
+        assert conn._target_sessions == {}
+        assert session._listeners == {}
+        assert [event async for event in listener] == []
+        # later commands fail right away instead of waiting for an answer
+        assert session.closed
+        sent = len(browser.sent)
+        with pytest.raises(CDPSessionClosed):
+            await session.execute(cdp.runtime.evaluate('1'))
+        assert len(browser.sent) == sent
+        await conn.close()
+    run(main())
+
+
+def test_child_session_reaped_on_detach_from_parent():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        parent = await conn.connect_session(cdp.target.TargetID('target-0'))
+        # an iframe auto-attached to the page, its events come on the page's session
+        child = conn.add_session('child', 'iframe-0')
+        detached = parent.listen(cdp.target.DetachedFromTarget)
+        browser.emit('Target.detachedFromTarget', {'sessionId': 'child', 'targetId': 'iframe-0'}, parent.session_id)
+        event = await detached.__anext__()
+        assert event.session_id == 'child'
+        assert child.closed
+        assert list(conn._sessions) == [parent.session_id]
+        assert not parent.closed
+        await conn.close()
+    run(main())
+
+
+def test_sessions_reaped_on_target_crash():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        first = await conn.connect_session(cdp.target.TargetID('target-0'))
+        browser.handlers['Target.attachToTarget'] = lambda params: {'sessionId': 'second'}
+        second = await conn.connect_session(cdp.target.TargetID('target-0'))
+        browser.attach_targets()
+        other = await conn.connect_session(cdp.target.TargetID('target-1'))
+        crashed = conn.listen(cdp.target.TargetCrashed)
+        browser.emit('Target.targetCrashed', {'targetId': 'target-0', 'status': 'crashed', 'errorCode': 1})
+        event = await crashed.__anext__()
+        assert event.target_id == 'target-0'
+        assert first.session_id not in conn._sessions
+        assert second.session_id not in conn._sessions
+        assert conn._sessions == {other.session_id: other}
+        await conn.close()
+    run(main())
+
+
+def target_info(target_id, type_='page', opener_id=None, url='about:blank'):
+    info = {
+        'targetId': target_id, 'type': type_, 'title': '', 'url': url,
+        'attached': False, 'canAccessOpener': False, 'browserContextId': 'context-1'
+    }
+    if opener_id is not None:
+        info['openerId'] = opener_id
+    return info
+
+
+def test_target_registry():
+    async def main():
+        browser = FakeBrowser()
+        conn = await open_connection(browser)
+        def refuse(params):
+            raise CDPBrowserError({'code': -32000, 'message': 'Not allowed'})
+        browser.handlers['Target.setDiscoverTargets'] = refuse
+        with pytest.raises(CDPBrowserError):
+            await conn.discover_targets()
+        assert conn.targets is None
+        del browser.handlers['Target.setDiscoverTargets']
+        targets = await conn.discover_targets()
+        assert browser.sent_methods() == ['Target.setDiscoverTargets'] * 2
+        # cancelled waiters are dropped right away
+        targets.wait_for(type_='iframe').cancel()
+        await asyncio.sleep(0)
+        assert targets._waiters == []
+        browser.emit('Target.targetCreated', {'targetInfo': target_info('tab')})
+        browser.emit('Target.targetCreated', {'targetInfo': target_info('worker', type_='worker')})
+        popup = targets.wait_for(type_='page', opener_id='tab')
+        browser.emit('Target.targetCreated', {'targetInfo': target_info('other', opener_id='another-tab')})
+        browser.emit('Target.targetCreated', {'targetInfo': target_info('popup', opener_id='tab')})
+        info = await popup
+        assert info.target_id == 'popup'
+        assert len(targets) == 4
+        assert [i.target_id for i in targets.of_type('worker')] == ['worker']
+        assert [i.target_id for i in targets.opened_by('tab')] == ['popup']
+        assert len(targets.in_context('context-1')) == 4
+        browser.emit('Target.targetInfoChanged', {'targetInfo': target_info('popup', url='https://example.com')})
+        browser.emit('Target.targetDestroyed', {'targetId': 'worker'})
+        existing = await targets.wait_for(lambda i: i.url == 'https://example.com', include_existing=True)
+        assert existing.target_id == 'popup'
+        assert targets.opened_by('tab') == []
+        assert 'worker' not in targets
+        assert targets.of_type('worker') == []
+        await conn.close()
+    run(main())
+
+
+def test_factory_shares_http_client_and_discovery():
+    async def main():
+        http = FakeHttpClient(FakeBrowser())
+        factory = CDPConnectionFactory(http)
+        first = await factory.connect('http://localhost:9222')
+        second = await factory.connect('http://localhost:9222/')
+        assert http.requests == [
+            'http://localhost:9222/json/version',
+            'ws://localhost:9222/devtools/browser/1',
+            'ws://localhost:9222/devtools/browser/1'
+        ]
+        await first.close()
+        await second.close()
+        assert not http.closed
+        await factory.close()
+        assert http.closed
+    run(main())
+
+
+def test_resilient_connection_restores_sessions():
+    async def main():
+        first_browser = FakeBrowser()
+        first_browser.attach_targets()
+        first_browser.handlers['Page.addScriptToEvaluateOnNewDocument'] = lambda params: {'identifier': '1'}
+        http = FakeHttpClient(first_browser)
+        conn = ResilientCDPConnection('http://localhost:9222', http, reconnect_delay=0.01)
+        await conn.connect()
+        conn.start()
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        gone = await conn.connect_session(cdp.target.TargetID('target-1'))
+        await session.execute(cdp.page.enable())
+        await session.execute(cdp.network.enable())
+        script_id = await session.execute(cdp.page.add_script_to_evaluate_on_new_document('1 + 1'))
+        await session.execute(cdp.emulation.set_device_metrics_override(800, 600, 1, False))
+        await session.execute(cdp.network.disable())
+        navigations = session.listen(cdp.page.FrameNavigated)
+
+        second_browser = FakeBrowser()
+        second_browser.handlers['Target.getTargets'] = lambda params: {'targetInfos': [target_info('target-0')]}
+        second_browser.handlers['Target.attachToTarget'] = lambda params: {'sessionId': 'restored'}
+        second_browser.handlers['Page.addScriptToEvaluateOnNewDocument'] = lambda params: {'identifier': '7'}
+        http.browser = second_browser
+        await first_browser.close()
+        await asyncio.sleep(0)
+        await session.execute(cdp.page.remove_script_to_evaluate_on_new_document(script_id))
+
+        assert conn.reconnect_count == 1
+        assert session.session_id == 'restored'
+        assert list(conn._sessions) == ['restored']
+        assert gone.session_id not in conn._sessions
+        assert second_browser.sent_methods() == [
+            'Target.getTargets',
+            'Target.attachToTarget',
+            'Page.enable',
+            'Page.addScriptToEvaluateOnNewDocument',
+            'Emulation.setDeviceMetricsOverride',
+            'Page.removeScriptToEvaluateOnNewDocument'
+        ]
+        assert second_browser.sent[-1]['params'] == {'identifier': '7'}
+        assert second_browser.sent[-1]['sessionId'] == 'restored'
+        second_browser.emit('Page.frameNavigated', {
+            'frame': {
+                'id': 'frame', 'loaderId': 'loader', 'url': 'about:blank', 'domainAndRegistry': '',
+                'securityOrigin': '', 'mimeType': 'text/html', 'secureContextType': 'Secure',
+                'crossOriginIsolatedContextType': 'NotIsolated', 'gatedAPIFeatures': []
+            },
+            'type': 'Navigation'
+        }, 'restored')
+        event = await navigations.__anext__()
+        assert event.frame.id_ == 'frame'
+        await conn.close()
+    run(main())
+
+
+
+def test_resilient_connection_drops_sessions_failing_to_restore():
+    async def main():
+        first_browser = FakeBrowser()
+        first_browser.attach_targets()
+        http = FakeHttpClient(first_browser)
+        conn = ResilientCDPConnection('http://localhost:9222', http, reconnect_delay=0.01)
+        await conn.connect()
+        conn.start()
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        kept = await conn.connect_session(cdp.target.TargetID('target-1'))
+
+        def attach(params):
+            # target-0 is listed but dies before it's attached again
+            if params['targetId'] == 'target-0':
+                raise CDPBrowserError({'code': -32602, 'message': 'No target with given id found'})
+            return {'sessionId': 'restored'}
+        second_browser = FakeBrowser()
+        second_browser.handlers['Target.getTargets'] = lambda params: {
+            'targetInfos': [target_info('target-0'), target_info('target-1')]
+        }
+        second_browser.handlers['Target.attachToTarget'] = attach
+        http.browser = second_browser
+        await first_browser.close()
+        await asyncio.sleep(0)
+        await kept.execute(cdp.page.reload())
+
+        assert kept.session_id == 'restored'
+        assert list(conn._sessions) == ['restored']
+        assert session.closed
+        with pytest.raises(CDPSessionClosed):
+            await session.execute(cdp.page.reload())
+        await conn.close()
+    run(main())
+
+
+def test_resilient_connection_gives_up_reconnecting():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        http = FakeHttpClient(browser)
+        conn = ResilientCDPConnection('http://localhost:9222', http, reconnect_delay=0.01, max_reconnect_attempts=2)
+        await conn.connect()
+        conn.start()
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+
+        def ws_connect(url, **kwargs):
+            raise ClientConnectionError('connection refused')
+        http.ws_connect = ws_connect
+        await browser.close()
+        await asyncio.sleep(0)
+        with pytest.raises(CDPConnectionClosed):
+            await conn.execute(cdp.target.get_targets())
+        with pytest.raises(CDPSessionClosed):
+            await session.execute(cdp.page.reload())
+        assert conn.reconnect_count == 0
+        await conn.close()
+    run(main())
+
+
+def test_raw_results_and_events():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        body = {'body': 'aGk=', 'base64Encoded': True}
+        browser.handlers['Network.getResponseBody'] = lambda params: body
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        result = await session.execute(cdp.network.get_response_body(cdp.network.RequestId('1')), raw=True)
+        assert result == body
+        assert await session.execute(cdp.network.get_response_body(cdp.network.RequestId('1'))) == ('aGk=', True)
+
+        raw_events = session.listen(cdp.page.LoadEventFired, raw=True)
+        events = session.listen(cdp.page.LoadEventFired)
+        browser.emit('Page.loadEventFired', {'timestamp': 1}, session.session_id)
+        assert await raw_events.__anext__() == {'timestamp': 1}
+        event = await events.__anext__()
+        assert isinstance(event, cdp.page.LoadEventFired) and event.timestamp == 1.0
+        await conn.close()
+    run(main())
+
+
+def test_command_template():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        move = cdp.input_.dispatch_mouse_event('mouseMoved', 0, 0).template('x', 'y')
+        for x in range(3):
+            assert await session.execute(move(x, 2 * x)) is None
+        assert [r['params'] for r in browser.sent[-3:]] == [
+            {'type': 'mouseMoved', 'x': x, 'y': 2 * x} for x in range(3)
+        ]
+        assert all(r['sessionId'] == session.session_id for r in browser.sent[-3:])
+        await conn.close()
+    run(main())
+
+
+def test_interned_events():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = CDPConnection('ws://localhost:9222/devtools/browser', FakeHttpClient(), interner=cdp.util.Interner())
+        conn._ws = browser
+        conn.start()
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        events = session.listen(cdp.page.FrameStartedLoading)
+        for _ in range(2):
+            browser.emit('Page.frameStartedLoading', {'frameId': 'frame-1'}, session.session_id)
+        first, second = await events.__anext__(), await events.__anext__()
+        assert first.frame_id == 'frame-1' and second.frame_id is first.frame_id
+        assert conn.interner.hits == 1
+        await conn.close()
+    run(main())
+
+
+def test_expect():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        finished = {i: session.expect(cdp.network.LoadingFinished, str(i)) for i in range(100)}
+        large = session.expect(cdp.network.LoadingFinished, predicate=lambda e: e.encoded_data_length > 1000)
+        late = session.expect(cdp.network.LoadingFinished, 'never', timeout=0.01)
+        registry = session._expectations[cdp.network.LoadingFinished]
+        assert len(registry) == 102
+        for i in (42, 7):
+            browser.emit('Network.loadingFinished', {
+                'requestId': str(i), 'timestamp': 1, 'encodedDataLength': 100 * i
+            }, session.session_id)
+        assert (await finished[42]).request_id == '42'
+        assert (await finished[7]).request_id == '7'
+        assert (await large).request_id == '42'
+        assert sum(future.done() for future in finished.values()) == 2
+        with pytest.raises(asyncio.TimeoutError):
+            await late
+        finished[0].cancel()
+        await asyncio.sleep(0)
+        assert len(registry) == 97
+        # expectations of other fields and event types
+        with pytest.raises(ValueError):
+            session.expect(cdp.page.LoadEventFired, 'key')
+        navigated = session.expect(cdp.page.FrameStartedLoading, 'frame-1')
+        browser.emit('Page.frameStartedLoading', {'frameId': 'frame-1'}, session.session_id)
+        assert (await navigated).frame_id == 'frame-1'
+        # pending expectations fail when the session is closed
+        browser.emit('Target.detachedFromTarget', {'sessionId': session.session_id}, None)
+        with pytest.raises(CDPSessionClosed):
+            await finished[1]
+        await conn.close()
+    run(main())
+
+
+def test_listeners_unregister_themselves():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        kept = session.listen(cdp.page.LoadEventFired, buffer_size=1)
+        # dropped without being iterated
+        for _ in range(100):
+            session.listen(cdp.page.LoadEventFired)
+        # left by breaking out of the loop
+        for timestamp in (1, 2):
+            browser.emit('Page.loadEventFired', {'timestamp': timestamp}, session.session_id)
+            async for event in session.listen(cdp.page.LoadEventFired, cdp.page.DomContentEventFired):
+                break
+        assert event.timestamp == 2
+        closed = session.listen(cdp.page.LoadEventFired, raw=True)
+        await closed.aclose()
+        assert [ref() for ref in session._listeners[cdp.page.LoadEventFired]] == [kept]
+        assert cdp.page.DomContentEventFired not in session._listeners
+        assert session._raw_listeners == {}
+        # the buffer of the kept listener is full, the second event was dropped
+        assert (await kept.__anext__()).timestamp == 1
+        browser.emit('Page.loadEventFired', {'timestamp': 3}, session.session_id)
+        assert (await kept.__anext__()).timestamp == 3
+        await conn.close()
+        assert kept.closed
+        assert [event async for event in kept] == []
+    run(main())
+
+
+def test_history():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        history = session.record_history(cdp.network.LoadingFinished, cdp.page.LoadEventFired, max_events=3)
+        since = asyncio.get_running_loop().time()
+        for i in range(5):
+            browser.emit('Network.loadingFinished', {
+                'requestId': str(i), 'timestamp': i, 'encodedDataLength': 100
+            }, session.session_id)
+        browser.emit('Page.loadEventFired', {'timestamp': 5}, session.session_id)
+        await session.expect(cdp.page.LoadEventFired)
+        assert len(history) == 4
+        # the oldest events were dropped
+        assert (await session.expect(cdp.network.LoadingFinished, '3', since=since)).request_id == '3'
+        late = session.expect(cdp.network.LoadingFinished, '0', since=since)
+        assert not late.done()
+        late.cancel()
+        listener = session.listen(cdp.network.LoadingFinished, cdp.page.LoadEventFired, since=since)
+        assert [(await listener.__anext__()).timestamp for _ in range(4)] == [2, 3, 4, 5]
+        # events older than since are not replayed
+        assert not session.expect(cdp.page.LoadEventFired, since=asyncio.get_running_loop().time() + 1).done()
+        with pytest.raises(ValueError):
+            session.listen(cdp.page.LoadEventFired, raw=True, since=since)
+        # bounded by bytes, the latest event is kept even if it is larger
+        history.max_bytes = 1
+        browser.emit('Page.loadEventFired', {'timestamp': 6}, session.session_id)
+        await session.expect(cdp.page.LoadEventFired)
+        assert [event.timestamp for _, event in history.since([cdp.page.LoadEventFired], since)] == [6]
+        await conn.close()
+    run(main())
+
+
+def test_enable():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        def sent():
+            requests = [(r['method'], r.get('params', {})) for r in browser.sent if 'sessionId' in r]
+            browser.sent.clear()
+            return requests
+        sent()
+        async with session.enable(cdp.network.enable(max_post_data_size=100)):
+            async with session.enable(cdp.network.enable(max_post_data_size=1000, max_total_buffer_size=10)):
+                async with session.page_enable():
+                    assert session.enables.count('Network') == 2
+            # the params of the remaining holder are enabled again
+            assert session.enables.enabled('Network') == {'maxPostDataSize': 100}
+            with pytest.raises(ValueError):
+                await session.enables.acquire(cdp.dom.enable(include_whitespace='all'))
+                await session.enables.acquire(cdp.dom.enable(include_whitespace='none'))
+        assert sent() == [
+            ('Network.enable', {'maxPostDataSize': 100}),
+            ('Network.enable', {'maxPostDataSize': 1000, 'maxTotalBufferSize': 10}),
+            ('Page.enable', {}),
+            ('Page.disable', {}),
+            ('Network.enable', {'maxPostDataSize': 100}),
+            ('DOM.enable', {'includeWhitespace': 'all'}),
+            ('Network.disable', {}),
+        ]
+        # listeners hold the domains of their events until they are closed or dropped
+        kept = session.listen(cdp.network.LoadingFinished, cdp.page.LoadEventFired, enable=True)
+        session.listen(cdp.network.ResponseReceived, enable=True)
+        await asyncio.sleep(0.01)
+        assert session.enables.count('Network') == 1
+        await kept.aclose()
+        await asyncio.sleep(0.01)
+        assert session.enables.enabled('Network') is None
+        assert not session.enables._releasing
+        assert sent() == [('Network.enable', {}), ('Page.enable', {}), ('Network.disable', {}), ('Page.disable', {})]
+        # only held domains can be released
+        with pytest.raises(ValueError):
+            await session.enables.release(cdp.css.enable())
+        async with session.enable(cdp.network.enable()):
+            with pytest.raises(ValueError):
+                await session.enables.release(cdp.network.enable(max_post_data_size=100))
+            assert session.enables.count('Network') == 1
+        sent()
+
+        # the domains of a detached session are dropped without disabling them
+        async with session.enable(cdp.network.enable()):
+            browser.emit('Target.detachedFromTarget', {'sessionId': session.session_id, 'targetId': 'target-0'})
+            await asyncio.sleep(0.01)
+        assert session.enables.count('Network') == 0
+        assert session.enables.enabled('Network') is None
+        assert sent() == [('Network.enable', {})]
+        await conn.close()
+    run(main())
+
+
+def test_command_cache():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        urls = iter(['https://a.com', 'https://b.com'])
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': target_info('target-0', url=next(urls))}
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        cache = session.cache_commands()
+        infos = await asyncio.gather(*(session.execute(cdp.target.get_target_info()) for _ in range(10)))
+        assert {info.url for info in infos} == {'https://a.com'}
+        assert infos[0] is not infos[1]
+        assert (await session.execute(cdp.target.get_target_info(), raw=True))['targetInfo']['url'] == 'https://a.com'
+        assert browser.sent_methods().count('Target.getTargetInfo') == 1
+        assert (cache.hits, cache.misses) == (10, 1)
+        # target events are received by the connection and invalidate the sessions' caches
+        browser.emit('Target.targetInfoChanged', {'targetInfo': target_info('target-0', url='https://b.com')})
+        await conn.expect(cdp.target.TargetInfoChanged)
+        assert (await session.execute(cdp.target.get_target_info())).url == 'https://b.com'
+        # commands made from a template are cached by the params they send
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': target_info(params['targetId'])}
+        info_of = cdp.target.get_target_info(cdp.target.TargetID('')).template('targetId')
+        first, second, again = await asyncio.gather(
+            session.execute(info_of('target-1')),
+            session.execute(info_of('target-2')),
+            session.execute(info_of('target-1'))
+        )
+        assert (first.target_id, second.target_id, again.target_id) == ('target-1', 'target-2', 'target-1')
+        assert [r['params'] for r in browser.sent[-2:]] == [{'targetId': 'target-1'}, {'targetId': 'target-2'}]
+        # rules of other commands and session events
+        ids = iter(['isolate-1', 'isolate-2'])
+        browser.handlers['Runtime.getIsolateId'] = lambda params: {'id': next(ids)}
+        cache.rule('Runtime.getIsolateId', 'Runtime.executionContextsCleared')
+        assert await session.execute(cdp.runtime.get_isolate_id()) == 'isolate-1'
+        assert await session.execute(cdp.runtime.get_isolate_id()) == 'isolate-1'
+        browser.emit('Runtime.executionContextsCleared', {}, session.session_id)
+        await session.expect(cdp.runtime.ExecutionContextsCleared)
+        assert await session.execute(cdp.runtime.get_isolate_id()) == 'isolate-2'
+        # a request in flight when its result is invalidated resolves its callers but is not cached
+        browser.handlers['Target.getTargetInfo'] = lambda params: None
+        pending = asyncio.ensure_future(session.execute(cdp.target.get_target_info()))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        assert len(cache) == 0
+        pending.cancel()
+        await conn.close()
+    run(main())
+
+
+def test_broadcast():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        browser.handlers['Page.addScriptToEvaluateOnNewDocument'] = lambda params: {'identifier': params['source']}
+        conn = await open_connection(browser)
+        sessions = [await conn.connect_session(cdp.target.TargetID(f'target-{i}')) for i in range(5)]
+        browser.sent.clear()
+        results, errors = await conn.broadcast(cdp.network.set_extra_http_headers(cdp.network.Headers({'a': 'b'})), concurrency=2)
+        assert set(results) == set(sessions) and errors == {}
+        assert {request['sessionId'] for request in browser.sent} == {session.session_id for session in sessions}
+        assert all(request['params'] == {'headers': {'a': 'b'}} for request in browser.sent)
+        def script(session):
+            if session is sessions[0]:
+                raise ValueError('no script')
+            return cdp.page.add_script_to_evaluate_on_new_document(session.target_id)
+        results, errors = await conn.broadcast(script, sessions[:3])
+        assert results == {session: cdp.page.ScriptIdentifier(session.target_id) for session in sessions[1:3]}
+        assert isinstance(errors[sessions[0]], ValueError)
+        # the shared request keeps its params for the sessions that cache its results
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': target_info(params['targetId'])}
+        for session in sessions:
+            session.cache_commands()
+        browser.sent.clear()
+        results, errors = await conn.broadcast(cdp.target.get_target_info(cdp.target.TargetID('target-3')))
+        assert errors == {} and {info.target_id for info in results.values()} == {'target-3'}
+        assert all(request['params'] == {'targetId': 'target-3'} for request in browser.sent)
+        results, errors = await conn.broadcast(cdp.target.get_target_info(cdp.target.TargetID('target-4')), raw=True)
+        assert {info['targetInfo']['targetId'] for info in results.values()} == {'target-4'}
+        assert len(browser.sent) == 10
+        await conn.close()
+    run(main())
+
+
+def test_send_scheduler():
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = CDPConnection('ws://localhost:9222/devtools/browser', FakeHttpClient(), scheduler=SendScheduler(quantum=1))
+        conn._ws = browser
+        conn.start()
+        bulk, interactive, other = [await conn.connect_session(cdp.target.TargetID(f'target-{i}')) for i in range(3)]
+        bulk.priority = PRIORITY_BULK
+        # hold the websocket while the commands are queued
+        send_str = browser.send_str
+        writable = asyncio.Event()
+        async def blocking_send_str(data):
+            await writable.wait()
+            await send_str(data)
+        browser.send_str = blocking_send_str
+        browser.sent.clear()
+        conn.scheduler.reset_stats()
+        commands = [bulk.execute(cdp.util.Command('DOM.describeNode', {'nodeId': i}), raw=True) for i in range(5)]
+        commands += [other.execute(cdp.util.Command('Runtime.evaluate', {'expression': str(i)}), raw=True) for i in range(3)]
+        commands += [interactive.execute(cdp.util.Command('Runtime.evaluate', {'expression': str(i)}), raw=True) for i in range(3)]
+        commands.append(interactive.execute(cdp.input_.dispatch_key_event('keyDown')))
+        tasks = [asyncio.ensure_future(command) for command in commands]
+        await asyncio.sleep(0)
+        # the first command is written right away, the others wait for it
+        assert len(conn.scheduler) == 11
+        writable.set()
+        await asyncio.gather(*tasks)
+        order = [(request['sessionId'], request['method']) for request in browser.sent]
+        assert order[0] == (bulk.session_id, 'DOM.describeNode')
+        # the key event promotes the commands its session queued before it
+        assert order[1:5] == [(interactive.session_id, 'Runtime.evaluate')] * 3 + [(interactive.session_id, 'Input.dispatchKeyEvent')]
+        # then the normal session, then the bulk one
+        assert order[5:8] == [(other.session_id, 'Runtime.evaluate')] * 3
+        assert order[8:] == [(bulk.session_id, 'DOM.describeNode')] * 4
+        assert [r['params']['nodeId'] for r in browser.sent if r['method'] == 'DOM.describeNode'] == list(range(5))
+        stats = conn.scheduler.stats()
+        assert (stats['high']['sent'], stats['normal']['sent'], stats['bulk']['sent']) == (4, 3, 5)
+        assert stats['bulk']['max_delay'] >= stats['high']['max_delay']
+        # the sessions of a class take turns
+        writable.clear()
+        browser.sent.clear()
+        evaluate = cdp.util.Command('Runtime.evaluate', {'expression': '1'})
+        tasks = [asyncio.ensure_future(session.execute(evaluate, raw=True)) for session in (bulk, other, other, interactive, interactive)]
+        await asyncio.sleep(0)
+        writable.set()
+        await asyncio.gather(*tasks)
+        assert [request['sessionId'] for request in browser.sent] == [
+            bulk.session_id, other.session_id, interactive.session_id, other.session_id, interactive.session_id
+        ]
+        await conn.close()
+    run(main())
+
+
+def test_adaptive_limiter():
+    async def main():
+        limiter = AdaptiveLimiter(4, max_limit=8)
+        for _ in range(4):
+            await limiter.acquire()
+        waiters = [asyncio.ensure_future(limiter.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert (limiter.inflight, limiter.queued) == (4, 3)
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        assert limiter.queued == 2
+        # released slots wake the queue in order
+        limiter.release('DOM.describeNode', 0.01)
+        await asyncio.sleep(0)
+        assert waiters[1].done() and not waiters[2].done()
+        limiter.release('DOM.describeNode', 0.01)
+        await waiters[2]
+        # fast commands raise the limit while it's in use
+        for _ in range(30):
+            limiter.release('DOM.describeNode', 0.01)
+            await limiter.acquire()
+        assert limiter.limit == 8
+        # a slow command backs off once per round trip
+        limiter.release('DOM.describeNode', 0.1)
+        limiter.release('DOM.describeNode', 0.1)
+        assert limiter.limit == 7
+        # other methods have their own baseline
+        limiter.release('Page.captureScreenshot', 0.1)
+        assert limiter.limit == 7
+
+        browser = FakeBrowser()
+        browser.attach_targets()
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        conn.limit_concurrency(AdaptiveLimiter(2), lambda: AdaptiveLimiter(1))
+        browser.handlers['Runtime.evaluate'] = lambda params: None
+        commands = [asyncio.ensure_future(session.execute(cdp.runtime.evaluate(str(i)))) for i in range(3)]
+        await asyncio.sleep(0)
+        assert (session.limiter.inflight, session.limiter.queued, conn.limiter.inflight) == (1, 2, 1)
+        assert browser.sent_methods().count('Runtime.evaluate') == 1
+        for command in commands:
+            command.cancel()
+        await asyncio.sleep(0)
+        assert (session.limiter.inflight, session.limiter.queued, conn.limiter.inflight) == (0, 0, 0)
+        # a cache miss waits for a slot too
+        session.cache_commands()
+        browser.handlers['Target.getTargetInfo'] = lambda params: {'targetInfo': target_info('target-0')}
+        evaluate = asyncio.ensure_future(session.execute(cdp.runtime.evaluate('1')))
+        info = asyncio.ensure_future(session.execute(cdp.target.get_target_info()))
+        await asyncio.sleep(0.01)
+        assert (session.limiter.inflight, session.limiter.queued) == (1, 1)
+        assert 'Target.getTargetInfo' not in browser.sent_methods()
+        evaluate.cancel()
+        assert (await info).target_id == 'target-0'
+        assert (session.limiter.inflight, session.limiter.queued) == (0, 0)
+        await conn.close()
+    run(main())
+
+
+def test_chrome_trace_exporter(tmp_path):
+    async def main():
+        browser = FakeBrowser()
+        browser.attach_targets()
+        browser.handlers['Runtime.evaluate'] = lambda params: {'result': {'type': 'number', 'value': 2}}
+        conn = await open_connection(browser)
+        session = await conn.connect_session(cdp.target.TargetID('target-0'))
+        exporter = ChromeTraceExporter(pid=1)
+        conn.hooks = exporter
+        await session.execute(cdp.runtime.evaluate('1 + 1'))
+        browser.emit('Page.loadEventFired', {'timestamp': 1}, session.session_id)
+        await session.expect(cdp.page.LoadEventFired)
+        await conn.execute(cdp.target.get_targets(), raw=True)
+        # commands without a response are recorded when they time out
+        browser.handlers['Page.reload'] = lambda params: None
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(session.execute(cdp.page.reload()), 0.01)
+        assert exporter._pending == {}
+        conn.hooks = None
+        await session.execute(cdp.runtime.evaluate('1 + 1'))
+        await conn.close()
+        return exporter
+    exporter = run(main())
+    exporter.write(tmp_path / 'trace.json')
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    spans = [(event['cat'], event['name'], event['tid']) for event in events if event['ph'] == 'X']
+    assert spans == [
+        ('cdp.command', 'Runtime.evaluate', 1),
+        ('cdp.event', 'Page.loadEventFired', 1),
+        ('cdp.command', 'Target.getTargets', 2),
+        ('cdp.command', 'Page.reload', 1),
+    ]
+    assert events[-1]['args']['failed']
+    assert [event['args']['name'] for event in events if event['ph'] == 'M'] == ['session session-target-0', 'browser']
+    assert all(event['dur'] >= 0 for event in events if event['ph'] == 'X')
+    exporter.on_send('Page.reload', None, 1, 10, 1.0)
+    exporter.clear()
+    assert exporter.events == [] and exporter._pending == {} and exporter._received == 0.0
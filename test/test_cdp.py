@@ -1,7 +1,15 @@
 '''
 Some basic tests for the generated CDP modules.
 '''
-from pycdp.cdp import dom, io, page, tracing, util
+import sys
+import json
+import typing
+import importlib
+import subprocess
+import pytest
+from pycdp.cdp import dom, input_, io, network, page, tracing, util
+from pycdp.gen.generate import snake_case
+from pycdp.gen.synth import Synthesizer
 
 
 def test_primitive_type():
@@ -71,3 +79,171 @@ def test_event_dispatch():
     assert event.window_name == 'Window 1'
     assert event.window_features == ['feature1', 'feature2']
     assert not event.user_gesture
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+@pytest.mark.parametrize('optional', [0.0, 1.0])
+def test_round_trip_every_type(optional):
+    synth = Synthesizer.from_files(optional=optional)
+    for kind, name, payload in synth.iter_payloads():
+        domain, item = name.split('.')
+        if kind == 'type':
+            cls = getattr(importlib.import_module(f'pycdp.cdp.{snake_case(domain)}'), item)
+            assert cls.from_json(payload).to_json() == payload, name
+        else:
+            event = util.parse_json_event({'method': name, 'params': payload})
+            assert util.event_method(type(event)) == name
+
+
+def test_class_type_has_slots():
+    blue = dom.RGBA(51, 153, 255)
+    assert not hasattr(blue, '__dict__')
+    event = page.WindowOpen('https://foo.com', 'Window 1', [], False)
+    assert not hasattr(event, '__dict__')
+    assert util.parse_json_event({
+        'method': 'Page.windowOpen',
+        'params': {'url': 'https://foo.com', 'windowName': 'Window 1', 'windowFeatures': [], 'userGesture': False}
+    }) == event
+
+
+def test_command():
+    cmd = dom.get_box_model(node_id=dom.NodeId(1))
+    assert cmd.to_json() == {'method': 'DOM.getBoxModel', 'params': {'nodeId': 1}}
+    assert json.loads(cmd.serialize(7, 'session')) == {
+        'id': 7, 'sessionId': 'session', 'method': 'DOM.getBoxModel', 'params': {'nodeId': 1}
+    }
+    # commands still implement the generator protocol and can be sent more than once
+    for _ in range(2):
+        assert next(cmd) == cmd.to_json()
+        with pytest.raises(StopIteration) as exc:
+            cmd.send({'model': {
+                'content': [0] * 8, 'padding': [0] * 8, 'border': [0] * 8, 'margin': [0] * 8,
+                'width': 10, 'height': 20
+            }})
+        assert exc.value.value.width == 10
+
+
+def test_command_template():
+    move = input_.dispatch_mouse_event('mouseMoved', 0, 0).template('x', 'y')
+    cmd = move(10.5, 20)
+    assert json.loads(cmd.serialize(1)) == {
+        'id': 1, 'method': 'Input.dispatchMouseEvent', 'params': {'type': 'mouseMoved', 'x': 10.5, 'y': 20}
+    }
+    assert cmd.to_json()['params'] == {'type': 'mouseMoved', 'x': 10.5, 'y': 20}
+    button = input_.dispatch_mouse_event('mousePressed', 0, 0).template('button')
+    assert button(input_.MouseButton.LEFT).to_json()['params']['button'] == 'left'
+    key = input_.dispatch_key_event('char').template('text', 'autoRepeat')
+    assert key('"\u00e9', False).to_json()['params'] == {'type': 'char', 'text': '"\u00e9', 'autoRepeat': False}
+    with pytest.raises(TypeError):
+        move(1)
+
+
+def test_interner():
+    interner = util.Interner(max_length=20)
+    payload = {
+        'requestId': '1', 'loaderId': 'loader', 'documentURL': 'https://a.com', 'request': {
+            'url': 'https://example.com/index.html', 'method': 'GET', 'headers': {'Accept': '*/*'},
+            'initialPriority': 'High', 'referrerPolicy': 'origin'
+        },
+        'timestamp': 1.0, 'wallTime': 1.0, 'initiator': {'type': 'other'}, 'redirectHasExtraInfo': False,
+        'frameId': 'loader'
+    }
+    # fresh copies of the strings, as if parsed from separate messages
+    copy = lambda: network.RequestWillBeSent.from_json(json.loads(json.dumps(payload)))
+    first = interner.intern(copy())
+    second = interner.intern(copy())
+    assert second.request_id is first.request_id
+    assert second.frame_id is first.frame_id and type(second.frame_id) is page.FrameId
+    # equal values of different types are kept apart
+    assert type(second.loader_id) is network.LoaderId
+    assert list(second.request.headers)[0] is list(first.request.headers)[0]
+    assert second.request.headers['Accept'] is first.request.headers['Accept']
+    assert second.document_url is first.document_url
+    assert second == first
+    # longer than max_length
+    assert second.request.url is not first.request.url
+    assert interner.hits > 0 and len(interner) == interner.misses
+    # lazy objects are not decoded
+    lazy = LazyRGBA.from_json({'r': 1, 'g': 2, 'b': 3})
+    assert interner.intern(lazy) is lazy
+    with pytest.raises(AttributeError):
+        LazyRGBA.__dict__['r'].__get__(lazy)
+
+
+def test_interner_is_bounded():
+    interner = util.Interner(max_size=2)
+    first = interner.intern(''.join(['a', 'b']))
+    assert interner.intern(''.join(['a', 'b'])) is first
+    # the oldest value is dropped when the table is full
+    interner.intern('c')
+    interner.intern('d')
+    assert len(interner) == 2
+    assert interner.intern(''.join(['a', 'b'])) is not first
+
+
+def test_unknown_event():
+    params = {'frameId': 'frame', 'type': 'a', 'child': {'nodeIds': [1, 2]}, 'items': [{'loaderId': 'l'}, 3]}
+    count = util.unknown_methods['Page.someNewEvent']
+    event = util.parse_json_event({'method': 'Page.someNewEvent', 'params': params})
+    assert isinstance(event, util.UnknownEvent) and event.name == 'Page.someNewEvent'
+    assert util.unknown_methods['Page.someNewEvent'] == count + 1
+    # the params are wrapped as they are, nested values when they're read
+    assert event.to_json() is params
+    assert event.frame_id == event.frameId == 'frame'
+    assert event.type_ == 'a'
+    assert event.child.node_ids == [1, 2]
+    assert event.items[0].loader_id == 'l' and event.items[1] == 3
+    with pytest.raises(AttributeError, match="'missing_'"):
+        event.missing_
+    # hashable by value, like they compare
+    same = util.parse_json_event({'method': 'Page.someNewEvent', 'params': dict(params)})
+    assert event == same and hash(event) == hash(same)
+    assert len({event, same, event.child}) == 2
+
+
+@util.dataclass
+class LazyRGBA(util.LazyObject):
+    r: int
+    g: int
+    b: int
+    a: typing.Optional[float] = None
+
+    _lazy_fields = {
+        'r': ('r', None, False),
+        'g': ('g', None, False),
+        'b': ('b', None, False),
+        'a': ('a', lambda v: float(v), True),
+    }
+
+
+def test_lazy_class_type():
+    json = {'r': 51, 'g': 153, 'b': 255, 'a': 1}
+    color = LazyRGBA.from_json(json)
+    assert color._json is json
+    assert color.a == 1.0 and isinstance(color.a, float)
+    assert color == LazyRGBA(51, 153, 255, 1.0)
+    assert LazyRGBA.from_json({'r': 0, 'g': 0, 'b': 0}).a is None
+    assert LazyRGBA(1, 2, 3).r == 1
+    assert not hasattr(color, 'foo')
+
+
+def test_domains_are_imported_on_demand():
+    # run in a fresh interpreter, the modules are already imported in this one
+    script = '''if True:
+        import sys
+        from pycdp import cdp
+        loaded = lambda: sorted(m for m in sys.modules if m.startswith('pycdp.cdp.'))
+        assert loaded() == ['pycdp.cdp.util'], loaded()
+        event = cdp.util.parse_json_event({'method': 'Tracing.dataCollected', 'params': {'value': []}})
+        assert type(event).__module__ == 'pycdp.cdp.tracing'
+        assert loaded() == ['pycdp.cdp.tracing', 'pycdp.cdp.util'], loaded()
+        event = cdp.util.parse_json_event({'method': 'Tracing.tracingComplete', 'params': {
+            'dataLossOccurred': False, 'stream': 'stream', 'traceFormat': 'json'
+        }})
+        assert type(event.stream).__module__ == 'pycdp.cdp.io'
+        node = cdp.dom.BackendNode.from_json({'nodeType': 1, 'nodeName': 'A', 'backendNodeId': 1})
+        assert node.backend_node_id == 1
+        assert 'pycdp.cdp.dom' in sys.modules and 'pycdp.cdp.page' not in sys.modules
+        assert 'network' in dir(cdp)
+    '''
+    subprocess.run([sys.executable, '-c', script], check=True)
@@ -0,0 +1,58 @@
+import asyncio
+import pytest
+from pycdp.utils import Worker
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+def test_subtasks_are_dropped_when_done():
+    async def main():
+        worker = Worker()
+        worker.start()
+        async def fail():
+            raise ValueError('failed')
+        for _ in range(100):
+            worker._create_subtask(asyncio.sleep(0))
+        cancelled = worker._create_subtask(asyncio.sleep(10))
+        worker._create_subtask(fail())
+        assert worker.subtask_counts['active'] == 102
+        cancelled.cancel()
+        await worker.wait_subtasks()
+        assert worker.subtask_counts == {'active': 0, 'completed': 100, 'failed': 1, 'cancelled': 1}
+        # exceptions still reach the callers of wait_exception
+        waiter = asyncio.ensure_future(worker.wait_exception())
+        await asyncio.sleep(0)
+        worker._create_subtask(fail())
+        with pytest.raises(ValueError):
+            await waiter
+        await worker.close()
+    run(main())
+
+
+def test_max_subtasks():
+    async def main():
+        worker = Worker(max_subtasks=2)
+        with pytest.raises(AttributeError):
+            worker.max_subtasks = 3
+        worker.start()
+        running = 0
+        peak = 0
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+        for _ in range(10):
+            worker._create_subtask(job())
+        await worker.wait_subtasks()
+        assert peak == 2
+        assert worker.subtask_counts['completed'] == 10
+        # subtasks waiting for a slot are cancelled on close
+        for _ in range(5):
+            worker._create_subtask(job())
+        await worker.close()
+        assert worker.subtask_counts['active'] == 0
+    run(main())